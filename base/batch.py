@@ -0,0 +1,404 @@
+"""Vectorized engine for the rule-based baseline strategies.
+
+Plays thousands of games in lockstep with NumPy. Hands are card type count
+matrices, so only strategies whose decisions can be written as array masks are
+supported: FirstStrategy and RandomStrategy.
+
+Equivalences with base.sim.run_simulation that make this possible:
+- The main pile is always a uniformly shuffled pile nobody looks at, so drawing its
+  top card is the same as drawing a random card from its counts.
+- Hands keep the arrival time of every copy, so "first card of the hand" (FirstStrategy)
+  is the oldest one, and Deck.remove_card always removes the oldest equal copy.
+"""
+
+import math
+import time
+from typing import Callable
+
+import numpy as np
+
+from base.classes import NUM_CARD_TYPES, SUITS, CountedDeck, Deck, FirstStrategy, RandomStrategy, Strategy
+from base.logger import get_elapsed_logger
+from base.rng import Seed, describe_seed, seed_sequence
+from base.sim import STOP_CHECK_EVERY, _load_state, _print_final_stats, _run_filename, _save_state
+from base.stats import GAME_TURNS_BUCKETS, CardsProb, Distribution, PauseStats, SimulationResult
+
+BATCH_STRATEGIES: dict[type[Strategy], int] = {FirstStrategy: 0, RandomStrategy: 1}
+_FIRST = BATCH_STRATEGIES[FirstStrategy]
+
+BATCH_SIZE: int = 4096
+_WARMUP_GAMES: int = 64 # Partides a l'inici, fins que sapiguem quant dura una partida
+_MAX_HAND_AFTER_PAUSE: int = 5
+
+_EMPTY = np.iinfo(np.int64).max
+_TYPE_VALUE = np.arange(NUM_CARD_TYPES) // len(SUITS) + 1
+_TYPE_SUIT = np.arange(NUM_CARD_TYPES) % len(SUITS)
+# _PLAYABLE[top, card]
+_PLAYABLE = (_TYPE_VALUE[:, None] == _TYPE_VALUE[None, :]) | (_TYPE_SUIT[:, None] == _TYPE_SUIT[None, :])
+
+
+def can_run_batch(strategies_to_call: list[type[Strategy]]) -> bool:
+    return all(strategy in BATCH_STRATEGIES for strategy in strategies_to_call)
+
+
+class _BatchGames:
+    """State of `slots` games played in lockstep. Every method works on an array of slot indexes."""
+
+    def __init__(
+        self,
+        n: int,
+        slots: int,
+        deck_counts: np.ndarray,
+        kinds: np.ndarray,
+        rng: np.random.Generator,
+        random_first_player: bool,
+        random_position_players: bool,
+    ) -> None:
+        self.n = n
+        self.rng = rng
+        self.kinds = kinds
+        self.random_first_player = random_first_player
+        self.random_position_players = random_position_players
+        self.deck_counts = deck_counts
+        self.copies = int(deck_counts.max())
+
+        self.seat_kind = np.tile(kinds, (slots, 1))
+        self.seat_player = np.tile(np.arange(n), (slots, 1))
+        self.hand_time = np.full((slots, n, NUM_CARD_TYPES, self.copies), _EMPTY, dtype=np.int64)
+        self.hand_count = np.zeros((slots, n, NUM_CARD_TYPES), dtype=np.int64)
+        self.hand_size = np.zeros((slots, n), dtype=np.int64)
+        self.main = np.zeros((slots, NUM_CARD_TYPES), dtype=np.int64)
+        self.main_size = np.zeros(slots, dtype=np.int64)
+        self.discard = np.zeros((slots, NUM_CARD_TYPES), dtype=np.int64)
+        self.top = np.zeros(slots, dtype=np.int64)
+        self.direction = np.ones(slots, dtype=np.int64)
+        self.value_7 = np.zeros(slots, dtype=np.int64)
+        self.current = np.zeros(slots, dtype=np.int64)
+        self.turns = np.zeros(slots, dtype=np.int64)
+        self.clock = np.zeros(slots, dtype=np.int64)
+        self.started = np.zeros(slots, dtype=np.int64)
+        self.active = np.zeros(slots, dtype=bool)
+        self.steps = 0
+
+        self.iter_number = 0
+        self.cards_prob = np.zeros((int(deck_counts.sum()) + 1, 3), dtype=np.int64)
+        self.maos = np.zeros(n, dtype=np.int64)
+        self.game_turns = Distribution(GAME_TURNS_BUCKETS)
+        # Partides acabades per pas en que van comencar: {pas: [partides, torns]}
+        self._cohorts: dict[int, list[int]] = {}
+        self._complete_games = 0
+        self._complete_turns = 0
+        self.pauses = PauseStats(n)
+
+    def _sample(self, counts: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """Pick one card type per row with probability proportional to counts."""
+        r = self.rng.integers(0, totals)
+        return (counts.cumsum(axis=1) <= r[:, None]).sum(axis=1)
+
+    def _add(self, g: np.ndarray, seat: np.ndarray, t: np.ndarray) -> None:
+        self.hand_time[g, seat, t, self.hand_count[g, seat, t]] = self.clock[g]
+        self.clock[g] += 1
+        self.hand_count[g, seat, t] += 1
+        self.hand_size[g, seat] += 1
+
+    def _remove_oldest(self, g: np.ndarray, seat: np.ndarray, t: np.ndarray) -> None:
+        times = self.hand_time
+        times[g, seat, t, :-1] = times[g, seat, t, 1:]
+        times[g, seat, t, -1] = _EMPTY
+        self.hand_count[g, seat, t] -= 1
+        self.hand_size[g, seat] -= 1
+
+    def _draw(self, g: np.ndarray, seat: np.ndarray) -> None:
+        has_cards = self.main_size[g] > 0
+        g, seat = g[has_cards], seat[has_cards]
+        if not len(g):
+            return
+        t = self._sample(self.main[g], self.main_size[g])
+        self.main[g, t] -= 1
+        self.main_size[g] -= 1
+        self._add(g, seat, t)
+
+    def _random_card(self, g: np.ndarray, seat: np.ndarray) -> np.ndarray:
+        return self._sample(self.hand_count[g, seat], self.hand_size[g, seat])
+
+    def _pausa(self, g: np.ndarray) -> None:
+        sizes = np.zeros((len(g), self.n), dtype=np.int64)
+        sizes[np.arange(len(g))[:, None], self.seat_player[g]] = self.hand_size[g]
+        for hand_sizes in sizes.tolist():
+            self.pauses.add(hand_sizes)
+        # Cada jugador descarta fins a quedar-se amb 5 cartes, totes de cop:
+        # FirstStrategy les mes antigues, RandomStrategy unes qualssevol.
+        excess = np.maximum(self.hand_size[g] - _MAX_HAND_AFTER_PAUSE, 0)
+        rows, seats = np.nonzero(excess)
+        if len(rows):
+            over = g[rows]
+            times = self.hand_time[over, seats].reshape(len(rows), -1)
+            keys = np.where(times == _EMPTY, np.inf, self.rng.random(times.shape))
+            first = self.seat_kind[over, seats] == _FIRST
+            keys[first] = times[first]
+            rank = keys.argsort(axis=1).argsort(axis=1)
+            dropped = (rank < excess[rows, seats][:, None]).reshape(len(rows), NUM_CARD_TYPES, self.copies)
+            times = np.where(dropped, _EMPTY, times.reshape(dropped.shape))
+            self.hand_time[over, seats] = np.sort(times, axis=-1)
+            dropped_counts = dropped.sum(axis=-1)
+            self.hand_count[over, seats] -= dropped_counts
+            self.hand_size[over, seats] -= excess[rows, seats]
+            np.add.at(self.main, over, dropped_counts)
+            np.add.at(self.main_size, over, excess[rows, seats])
+        self.main[g] += self.discard[g]
+        self.main_size[g] += self.discard[g].sum(axis=1)
+        self.discard[g] = 0
+
+    def _pause_if_empty(self, g: np.ndarray) -> None:
+        empty = g[self.main_size[g] == 0]
+        if len(empty):
+            self._pausa(empty)
+
+    def _finish(self, g: np.ndarray, seat: np.ndarray) -> None:
+        np.add.at(self.maos, self.seat_player[g, seat], 1)
+        lengths = self.turns[g].tolist()
+        for length in lengths:
+            self.game_turns.add(length)
+        for started, length in zip(self.started[g].tolist(), lengths):
+            cohort = self._cohorts.setdefault(started, [0, 0])
+            cohort[0] += 1
+            cohort[1] += length
+        self.active[g] = False
+
+    def abandon(self) -> None:
+        """Stop every running game without a winner. Their turns stay in cards_prob, but not in maos or game_turns."""
+        self.active[:] = False
+
+    def start(self, g: np.ndarray) -> None:
+        self.hand_time[g] = _EMPTY
+        self.hand_count[g] = 0
+        self.hand_size[g] = 0
+        self.main[g] = self.deck_counts
+        self.main_size[g] = self.deck_counts.sum()
+        self.discard[g] = 0
+        self.clock[g] = 0
+        self.turns[g] = 0
+        self.direction[g] = 1
+        self.value_7[g] = 0
+        self.started[g] = self.steps
+        if self.random_position_players:
+            order = self.rng.permuted(np.tile(np.arange(self.n), (len(g), 1)), axis=1)
+            self.seat_player[g] = order
+            self.seat_kind[g] = self.kinds[order]
+        for _ in range(3):
+            for seat in range(self.n):
+                self._draw(g, np.full(len(g), seat))
+        self.top[g] = self._sample(self.main[g], self.main_size[g])
+        self.main[g, self.top[g]] -= 1
+        self.main_size[g] -= 1
+        self.current[g] = self.rng.integers(0, self.n, len(g)) if self.random_first_player else 0
+        self.active[g] = True
+
+    def step(self) -> None:
+        """Play one turn (and its jump poll) of every active game."""
+        g = np.flatnonzero(self.active)
+        self.steps += 1
+        self.iter_number += len(g)
+        self.turns[g] += 1
+        cur = self.current[g]
+        size = self.hand_size[g, cur]
+        np.add.at(self.cards_prob[:, 1], size, 1)
+        top = self.top[g]
+
+        card = np.full(len(g), -1, dtype=np.int64)
+        wrong = np.zeros(len(g), dtype=bool)
+        first = self.seat_kind[g, cur] == _FIRST
+        if first.any():
+            times = np.where(_PLAYABLE[top[first]], self.hand_time[g[first], cur[first], :, 0], _EMPTY)
+            oldest = times.argmin(axis=1)
+            card[first] = np.where(times[np.arange(len(oldest)), oldest] != _EMPTY, oldest, -1)
+        if not first.all():
+            t = self._random_card(g[~first], cur[~first])
+            card[~first] = t
+            wrong[~first] = ~_PLAYABLE[top[~first], t]
+
+        if wrong.any():
+            # Carta incorrecta: roba, i el mateix jugador torna a jugar sense salts
+            self._draw(g[wrong], cur[wrong])
+            self._pause_if_empty(g[wrong])
+
+        drew = card < 0
+        if drew.any():
+            self._draw(g[drew], cur[drew])
+
+        play = (card >= 0) & ~wrong
+        if play.any():
+            gp, cp, tp = g[play], cur[play], card[play]
+            np.add.at(self.cards_prob[:, 0], size[play], 1)
+            self._remove_oldest(gp, cp, tp)
+            self.discard[gp, self.top[gp]] += 1
+            self.top[gp] = tp
+            value = _TYPE_VALUE[tp]
+            self.direction[gp[value == 10]] *= -1
+            seven = value == 7
+            self.value_7[gp[~seven]] = 0
+            if seven.any():
+                gs, cs = gp[seven], cp[seven]
+                self.value_7[gs] += 1
+                owed = self.value_7[gs].copy()
+                while True:
+                    drawing = (owed > 0) & (self.main_size[gs] > 0)
+                    if not drawing.any():
+                        break
+                    self._draw(gs[drawing], cs[drawing])
+                    owed[drawing] -= 1
+
+        moved = ~wrong
+        won = moved & (self.hand_size[g, cur] == 0)
+        if won.any():
+            self._finish(g[won], cur[won])
+        moved &= ~won
+        g, cur = g[moved], cur[moved]
+        self.current[g] = (cur + self.direction[g]) % self.n
+        self._pause_if_empty(g)
+        self._poll_jumps(g)
+
+    def _poll_jumps(self, g: np.ndarray) -> None:
+        order = self.rng.permuted(np.tile(np.arange(self.n), (len(g), 1)), axis=1)
+        polling = np.ones(len(g), dtype=bool)
+        for k in range(self.n):
+            idx = np.flatnonzero(polling)
+            if not len(idx):
+                break
+            gk, seat = g[idx], order[idx, k]
+            top = self.top[gk]
+            jump = np.zeros(len(idx), dtype=bool)
+            first = self.seat_kind[gk, seat] == _FIRST
+            jump[first] = self.hand_count[gk[first], seat[first], top[first]] > 0
+            if not first.all():
+                rnd = ~first
+                t = self._random_card(gk[rnd], seat[rnd])
+                jump[rnd] = t == top[rnd]
+                bad = rnd.copy()
+                bad[rnd] = t != top[rnd]
+                if bad.any():
+                    self._draw(gk[bad], seat[bad])
+                    self._pause_if_empty(gk[bad])
+            if not jump.any():
+                continue
+            gj, sj = gk[jump], seat[jump]
+            np.add.at(self.cards_prob[:, 2], self.hand_size[gj, sj], 1)
+            tj = self.top[gj]
+            self._remove_oldest(gj, sj, tj)
+            self.discard[gj, tj] += 1 # La carta saltada es identica a la de dalt
+            self.current[gj] = sj
+            won = self.hand_size[gj, sj] == 0
+            if won.any():
+                self._finish(gj[won], sj[won])
+            polling[idx[jump]] = False
+
+    def games_to_start(self, iter_max: int) -> int:
+        """How many new games fit in the remaining turn budget, estimated from the finished ones."""
+        free = int((~self.active).sum())
+        if self.iter_number >= iter_max or not free:
+            return 0
+        # Les primeres partides en acabar son les curtes. Nomes es fan servir per estimar
+        # les partides que van comencar abans que la mes antiga que segueix jugant.
+        oldest_running = self.started[self.active].min() if self.active.any() else self.steps + 1
+        while self._cohorts and next(iter(self._cohorts)) < oldest_running:
+            games, turns = self._cohorts.pop(next(iter(self._cohorts)))
+            self._complete_games += games
+            self._complete_turns += turns
+        if self._complete_games < _WARMUP_GAMES:
+            if self.game_turns.count or self.active.any():
+                return 0
+            return min(free, _WARMUP_GAMES)
+        expected = self._complete_turns / self._complete_games
+        pending = expected * int(self.active.sum()) # Una partida llarga no te pas menys torns per davant
+        to_start = math.ceil((iter_max - self.iter_number - pending) / expected)
+        if to_start <= 0 and not self.active.any():
+            to_start = 1
+        return max(0, min(free, to_start))
+
+
+def run_batch_simulation(
+    *,
+    n: int,
+    iter_max: int,
+    num_decks: int,
+    build_deck: Callable[[Deck, int], None],
+    strategies_to_call: list[type[Strategy]],
+    random_first_player: bool = False,
+    random_position_players: bool = False,
+    batch_size: int = BATCH_SIZE,
+    persist: bool = False,
+    stop_condition: Callable[[list[int]], bool] | None = None,
+    stop_check_every: int = STOP_CHECK_EVERY,
+    seed: Seed = None,
+) -> SimulationResult:
+    """Same as run_simulation, but vectorized. Only FirstStrategy and RandomStrategy can play.
+
+    Games are started until at least iter_max turns have been played; the games
+    already running then finish. Statistics are printed, returned and (with persist=True)
+    merged and saved like run_simulation does.
+
+    stop_condition is checked with the maos each time stop_check_every more games have
+    finished. Once it returns True the running games are abandoned (they don't count in maos
+    nor in the game lengths) and the simulation stops.
+
+    seed works like in run_simulation: the same seed and arguments play the same games.
+    """
+    if not can_run_batch(strategies_to_call):
+        raise ValueError(f"Batch engine only supports {', '.join(st.__name__ for st in BATCH_STRATEGIES)}")
+    t0 = time.perf_counter()
+    filename = _run_filename(n, num_decks, strategies_to_call)
+    log = get_elapsed_logger(t0, filename + ".log", debugging=False, name=__name__)
+    saved = _load_state(log, filename + ".json", n) if persist else None
+    seed = seed_sequence(seed)
+    log.info(f"Seed: {describe_seed(seed)}")
+
+    deck = CountedDeck()
+    build_deck(deck, num_decks)
+    games = _BatchGames(
+        n,
+        batch_size,
+        np.array(deck.type_counts, dtype=np.int64),
+        np.array([BATCH_STRATEGIES[strategy] for strategy in strategies_to_call]),
+        np.random.default_rng(seed),
+        random_first_player,
+        random_position_players,
+    )
+
+    num_avis = max(min(int(iter_max / 10), 1_000_000), 1)
+    next_avis = 0
+    next_stop_check = stop_check_every
+    stopping = False
+    while True:
+        if stop_condition is not None and not stopping and games.game_turns.count >= next_stop_check:
+            next_stop_check = games.game_turns.count + stop_check_every
+            if stop_condition([int(m) for m in games.maos]):
+                log.info(f"Iter {games.iter_number}: stop_condition complerta despres de {games.game_turns.count} partides")
+                stopping = True
+                games.abandon() # Si no, les fins a batch_size partides en joc s'haurien d'acabar
+        to_start = 0 if stopping else games.games_to_start(iter_max)
+        if to_start:
+            games.start(np.flatnonzero(~games.active)[:to_start])
+        if not games.active.any():
+            break
+        if games.iter_number >= next_avis:
+            elapsed = time.perf_counter() - t0
+            log.info(
+                f"Iter {games.iter_number}! Queden {max(iter_max - games.iter_number, 0)} iteracions! "
+                f"({games.iter_number / elapsed if elapsed else 0.0:.6e} iter/s)"
+            )
+            next_avis += num_avis
+        games.step()
+
+    cards_prob = CardsProb()
+    for hand_size in np.flatnonzero(games.cards_prob.any(axis=1)):
+        cards_prob.add_counts(int(hand_size), *(int(count) for count in games.cards_prob[hand_size]))
+    result = SimulationResult(
+        [int(m) for m in games.maos], cards_prob, games.game_turns, games.pauses, time.perf_counter() - t0
+    )
+    if saved is not None:
+        saved.merge(result)
+        result = saved
+    _print_final_stats(log, result, n)
+    if persist:
+        _save_state(filename + ".json", result)
+    return result
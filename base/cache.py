@@ -0,0 +1,104 @@
+"""Cache of tournament matchup results, keyed by what can change them.
+
+A strategy is fingerprinted by the source of the module that defines it, the files listed
+in that module's DATA_FILES (weights and other artifacts it loads) and its class name, and
+every fingerprint also includes the sources of the engine and of the statistics that
+decide when a matchup stops (ENGINE_FILES). A matchup result is stored under the sorted
+fingerprints of its strategies, the number of decks, RULES_VERSION and the stopping
+settings of the tournament, so it is only simulated again when one of its strategies, the
+engine, the rules or the stopping rule change.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+from base.checkpoint import atomic_write_json
+from base.sim import RULES_VERSION
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Els fitxers de base/ que decideixen com es juga una partida i quan es para un matchup
+ENGINE_FILES: tuple[str, ...] = ("classes.py", "sim.py", "batch.py", "rng.py", "view.py", "events.py", "sequential.py", "stats.py")
+_engine_version: str | None = None
+
+
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def engine_version() -> str:
+    """Hash of the ENGINE_FILES sources."""
+    global _engine_version
+    if _engine_version is None:
+        digest = hashlib.sha256()
+        for filename in ENGINE_FILES:
+            digest.update(filename.encode())
+            digest.update(_file_hash(os.path.join(_BASE_DIR, filename)).encode())
+        _engine_version = digest.hexdigest()
+    return _engine_version
+
+
+def strategy_fingerprint(strategy: type) -> str:
+    digest = hashlib.sha256()
+    digest.update(strategy.__qualname__.encode())
+    digest.update(_file_hash(inspect.getsourcefile(strategy)).encode())
+    for path in getattr(sys.modules[strategy.__module__], "DATA_FILES", ()):
+        digest.update(_file_hash(path).encode())
+    digest.update(engine_version().encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Directory with one JSON file per cached matchup result.
+
+    get and put take the maos in the order of strategies; they are stored in fingerprint
+    order, so the same players in another order hit the same entry. stopping holds the
+    settings that decide when a matchup stops (JSON serializable), and is part of the key.
+    """
+
+    def __init__(self, directory: str, num_decks: int, stopping: dict | None = None):
+        self.directory = directory
+        self.num_decks = num_decks
+        self.stopping = stopping or {}
+        os.makedirs(directory, exist_ok=True)
+
+    def _key(self, fingerprints: list[str]) -> str:
+        data = json.dumps({
+            "fingerprints": sorted(fingerprints),
+            "num_decks": self.num_decks,
+            "rules_version": RULES_VERSION,
+            "stopping": self.stopping,
+        }, sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def _path(self, fingerprints: list[str]) -> str:
+        return os.path.join(self.directory, self._key(fingerprints) + ".json")
+
+    def get(self, strategies: list[type]) -> dict | None:
+        """The cached {"maos", "extra_rounds", "total_iters"} of the strategies, or None."""
+        fingerprints = [strategy_fingerprint(strategy) for strategy in strategies]
+        path = self._path(fingerprints)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            entry = json.load(f)
+        maos_by_fingerprint = dict(zip(entry["fingerprints"], entry["maos"]))
+        return {**entry, "maos": [maos_by_fingerprint[fingerprint] for fingerprint in fingerprints]}
+
+    def put(self, strategies: list[type], maos: list[int], extra_rounds: int, total_iters: int) -> None:
+        fingerprints = [strategy_fingerprint(strategy) for strategy in strategies]
+        ordered = sorted(zip(fingerprints, maos))
+        atomic_write_json(self._path(fingerprints), {
+            "names": [strategy.__name__ for strategy in strategies],
+            "fingerprints": [fingerprint for fingerprint, _ in ordered],
+            "maos": [m for _, m in ordered],
+            "extra_rounds": extra_rounds,
+            "total_iters": total_iters,
+            "num_decks": self.num_decks,
+            "rules_version": RULES_VERSION,
+            "stopping": self.stopping,
+        })
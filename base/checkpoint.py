@@ -0,0 +1,73 @@
+"""Durable progress of a tournament, to resume it after it is killed.
+
+There is one JSON file per matchup, written by the worker that plays it, so workers never
+write the same file. Every write goes to a temporary file that is fsynced and then
+renamed over the old one: a crash leaves either the previous checkpoint or the new one,
+never half of it.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+
+META_FILE: str = "tournament.json"
+
+
+def atomic_write_json(path: str, data: dict) -> None:
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd) # Que el rename tambe sobrevisqui un reinici
+    finally:
+        os.close(dir_fd)
+
+
+class CheckpointStore:
+    """Directory with the tournament metadata and the state of every matchup, keyed by its strategy names."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, names: tuple[str, ...]) -> str:
+        return os.path.join(self.directory, "_".join(names) + ".json")
+
+    def save(self, names: tuple[str, ...], state: dict) -> None:
+        atomic_write_json(self._path(names), {**state, "names": list(names)})
+
+    def load_all(self) -> dict[tuple[str, ...], dict]:
+        states = {}
+        for filename in sorted(os.listdir(self.directory)):
+            if filename == META_FILE or filename.startswith(".") or not filename.endswith(".json"):
+                continue
+            with open(os.path.join(self.directory, filename)) as f:
+                state = json.load(f)
+            states[tuple(state["names"])] = state
+        return states
+
+    def save_meta(self, meta: dict) -> None:
+        atomic_write_json(os.path.join(self.directory, META_FILE), meta)
+
+    def load_meta(self) -> dict | None:
+        path = os.path.join(self.directory, META_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def clear(self) -> None:
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".json"):
+                os.unlink(os.path.join(self.directory, filename))
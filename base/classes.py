@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import random
 from abc import ABC, abstractmethod
-from random import choice, shuffle
-from typing import Callable
+from array import array
+from typing import TYPE_CHECKING, Callable
+
+from base.events import GameObserver
+
+if TYPE_CHECKING:
+    from base.view import GameView
+
+SUITS: tuple[str, ...] = ("hearts", "diamonds", "clubs", "spades")
+SUIT_TO_ID: dict[str, int] = {suit: i for i, suit in enumerate(SUITS)}
+NUM_VALUES: int = 13
+NUM_CARD_TYPES: int = NUM_VALUES * len(SUITS)
+
+
+def card_type_id(value: int, suit: str) -> int:
+    """Return the small integer identifying a card type: (value - 1) * 4 + suit index."""
+    return (value - 1) * len(SUITS) + SUIT_TO_ID[suit]
 
 
 class BaseCard(ABC):
+    __slots__ = ("value", "suit")
+
     def __init__(self, value: int, suit: str):
         self.value = value
         self.suit = suit
@@ -33,12 +51,82 @@ class BaseCard(ABC):
         """Return whether this card can jump (cut in) over other."""
 
 class NormalCard(BaseCard):
+    __slots__ = ()
+
+    @property
+    def type_id(self) -> int:
+        return card_type_id(self.value, self.suit)
+
     def can_be_played(self, other: NormalCard) -> bool:
         return self.value == other.value or self.suit == other.suit
 
     def can_be_jumped(self, other: NormalCard) -> bool:
         return self.value == other.value and self.suit == other.suit
 
+class InternedCard(NormalCard):
+    """Flyweight NormalCard: there is only one shared instance per card type.
+
+    Equality is identity, so `in`, `count` and `remove` over hands of interned cards
+    never reach Python-level `__eq__`. Comparing against a plain NormalCard still
+    works, Python falls back to the other operand's BaseCard.__eq__.
+    """
+    __slots__ = ("type_id", "_hash")
+    _instances: list[InternedCard | None] = [None] * NUM_CARD_TYPES
+
+    def __new__(cls, value: int, suit: str) -> InternedCard:
+        if not 1 <= value <= NUM_VALUES:
+            raise ValueError(f"Card value {value} out of range")
+        type_id = card_type_id(value, suit)
+        card = cls._instances[type_id]
+        if card is None:
+            card = object.__new__(cls)
+            card.value = value
+            card.suit = suit
+            card.type_id = type_id
+            card._hash = hash((value, suit))
+            cls._instances[type_id] = card
+        return card
+
+    def __init__(self, value: int, suit: str):
+        pass # Ja inicialitzada a __new__
+
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return InternedCard, (self.value, self.suit)
+
+    def __copy__(self) -> InternedCard:
+        return self
+
+    def __deepcopy__(self, memo) -> InternedCard:
+        return self
+
+    @classmethod
+    def from_type_id(cls, type_id: int) -> InternedCard:
+        return cls(type_id // len(SUITS) + 1, SUITS[type_id % len(SUITS)])
+
+
+def intern_card(card: BaseCard) -> BaseCard:
+    """Return the shared InternedCard for a NormalCard. Other card types are returned as they are."""
+    if type(card) is NormalCard:
+        return InternedCard(card.value, card.suit)
+    return card
+
+
+def interning_build_deck(build_deck: Callable[[Deck, int], None]) -> Callable[[Deck, int], None]:
+    """Wrap a deck builder so every NormalCard it creates is replaced by its InternedCard."""
+    def build(deck: Deck, num_decks: int) -> None:
+        built = Deck()
+        build_deck(built, num_decks)
+        for card in built.cards:
+            deck.add_card(intern_card(card))
+    return build
+
+
 class Deck:
     def __init__(self):
         self.cards: list[BaseCard] = []
@@ -65,10 +153,110 @@ class Deck:
     def __len__(self) -> int:
         return len(self.cards)
 
-    def shuffle(self) -> None:
-        shuffle(self.cards)
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        (rng or random).shuffle(self.cards)
+
+    def __contains__(self, card: BaseCard) -> bool:
+        return card in self.cards
+
+    def count(self, card: BaseCard) -> int:
+        """Return how many copies of card the deck holds."""
+        return self.cards.count(card)
+
+    def count_suit(self, suit: str) -> int:
+        return sum(1 for card in self.cards if card.suit == suit)
+
+    def count_value(self, value: int) -> int:
+        return sum(1 for card in self.cards if card.value == value)
+
+_TYPE_SUIT: list[int] = [type_id % len(SUITS) for type_id in range(NUM_CARD_TYPES)]
+_TYPE_VALUE: list[int] = [type_id // len(SUITS) + 1 for type_id in range(NUM_CARD_TYPES)]
+
+class CountedDeck(Deck):
+    """Deck that keeps card type, suit and value histograms updated on every add and remove.
+
+    Membership and the count methods are O(1). Cards need a type_id (NormalCard or
+    InternedCard), and self.cards must only be changed through the Deck methods.
+    remove_card still calls list.remove, O(len), on purpose: self.cards keeps the order
+    the cards came in, which strategies like FirstStrategy play by (and the batch engine
+    reproduces), so a swap-with-last O(1) removal would change how they play.
+    complement_counts and mirror_counts are external counters, indexed by type_id, that go
+    down and up respectively when a card enters the deck (and the other way when it leaves).
+    type_mask has the bit type_id set for every card type the deck holds.
+    """
+    def __init__(self):
+        super().__init__()
+        self.type_counts: list[int] = [0] * NUM_CARD_TYPES
+        self.suit_counts: list[int] = [0] * len(SUITS)
+        self.value_counts: list[int] = [0] * (NUM_VALUES + 1)
+        self.type_mask: int = 0 # Bit type_id ences si n'hi ha alguna copia
+        # Comptadors externs de cartes que NO son aqui (p.ex. les no vistes d'una Strategy)
+        self.complement_counts: list[array] = []
+        # Comptadors externs que segueixen type_counts (p.ex. una seccio de l'observacio d'AlphaMao)
+        self.mirror_counts: list = []
+
+    def add_card(self, card: BaseCard) -> None:
+        self.cards.append(card)
+        type_id = card.type_id
+        self.type_counts[type_id] += 1
+        self.type_mask |= 1 << type_id
+        self.suit_counts[_TYPE_SUIT[type_id]] += 1
+        self.value_counts[_TYPE_VALUE[type_id]] += 1
+        for counts in self.complement_counts:
+            counts[type_id] -= 1
+        for counts in self.mirror_counts:
+            counts[type_id] += 1
+
+    def remove_card(self, card: BaseCard) -> BaseCard:
+        type_id = card.type_id
+        if not self.type_counts[type_id]:
+            raise ValueError(f"Card {card} not found in deck")
+        self.cards.remove(card)
+        self.type_counts[type_id] -= 1
+        if not self.type_counts[type_id]:
+            self.type_mask &= ~(1 << type_id)
+        self.suit_counts[_TYPE_SUIT[type_id]] -= 1
+        self.value_counts[_TYPE_VALUE[type_id]] -= 1
+        for counts in self.complement_counts:
+            counts[type_id] += 1
+        for counts in self.mirror_counts:
+            counts[type_id] -= 1
+        return card
+
+    def remove_top_card(self) -> BaseCard:
+        card = self.cards.pop()
+        type_id = card.type_id
+        self.type_counts[type_id] -= 1
+        if not self.type_counts[type_id]:
+            self.type_mask &= ~(1 << type_id)
+        self.suit_counts[_TYPE_SUIT[type_id]] -= 1
+        self.value_counts[_TYPE_VALUE[type_id]] -= 1
+        for counts in self.complement_counts:
+            counts[type_id] += 1
+        for counts in self.mirror_counts:
+            counts[type_id] -= 1
+        return card
+
+    def __contains__(self, card: BaseCard) -> bool:
+        return self.type_counts[card.type_id] > 0
+
+    def count(self, card: BaseCard) -> int:
+        return self.type_counts[card.type_id]
+
+    def count_suit(self, suit: str) -> int:
+        return self.suit_counts[SUIT_TO_ID[suit]]
+
+    def count_value(self, value: int) -> int:
+        return self.value_counts[value]
+
+class Strategy(GameObserver, ABC):
+    # run_simulation nomes pregunta pick_jump_card a qui te una carta igual a la de dalt.
+    # Posa-ho a True si l'estrategia vol que li preguntin cada torn (p.ex. salta a l'atzar).
+    always_poll_jumps: bool = False
+    # Posa-ho a True per rebre self.game_view (base.view.GameView), amb les jugades legals de la teva ma
+    uses_game_view: bool = False
+    # Els esdeveniments de la partida (base.events) que sobreescriguis es criden, la resta no costen res
 
-class Strategy(ABC):
     def __init__(
         self,
         player: Deck,
@@ -89,6 +277,11 @@ class Strategy(ABC):
         self.build_deck: Callable[[Deck, int], None] = build_deck
         self.num_decks: int = num_decks
         self.build_deck(self.all_cards, self.num_decks)
+        self._unseen: array | None = None
+        self._unseen_view: memoryview | None = None
+        # run_simulation el substitueix per un de llavor propia per jugador, per poder repetir les partides
+        self.rng: random.Random = random.Random()
+        self.game_view: GameView | None = None
 
     def __str__(self) -> str:
         return self.__class__.__name__
@@ -96,16 +289,44 @@ class Strategy(ABC):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
     
+    def unseen_counts(self) -> memoryview:
+        """Return a live read-only view, indexed by type_id, of how many copies of each card the player has not seen.
+
+        The counts are built once and then kept up to date by the hand and discard pile
+        themselves (CountedDeck) every time a card enters or leaves them.
+        """
+        if self._unseen_view is not None:
+            return self._unseen_view
+        unseen = array("l", [0] * NUM_CARD_TYPES)
+        for card in self.all_cards.cards:
+            unseen[card.type_id] += 1
+        for deck in (self.player, self.discarded_pile):
+            for card in deck.cards:
+                unseen[card.type_id] -= 1
+        if not (isinstance(self.player, CountedDeck) and isinstance(self.discarded_pile, CountedDeck)):
+            return memoryview(unseen).toreadonly()
+        self.player.complement_counts.append(unseen)
+        self.discarded_pile.complement_counts.append(unseen)
+        self._unseen = unseen
+        self._unseen_view = memoryview(unseen).toreadonly()
+        return self._unseen_view
+
     def cards_not_viewed(self) -> Deck:
         """Return the cards that the player has not seen. Notice this means the player hand is also not viewed."""
+        unseen = self.unseen_counts()
+        # Es salten les primeres copies de cada carta vista, com si es tragues la carta del deck
+        to_skip = [0] * NUM_CARD_TYPES
+        for card in self.all_cards.cards:
+            to_skip[card.type_id] += 1
+        for type_id in range(NUM_CARD_TYPES):
+            to_skip[type_id] -= unseen[type_id]
         not_viewed = Deck()
-        cards_viewed = Deck()
-        cards_viewed.cards = self.player.cards + self.discarded_pile.cards
         for card in self.all_cards.cards:
-            if card not in cards_viewed.cards:
-                not_viewed.add_card(card)
+            type_id = card.type_id
+            if to_skip[type_id]:
+                to_skip[type_id] -= 1
             else:
-                cards_viewed.remove_card(card) # Es treu per que hi han repetits en cas de que sigui més d'un deck
+                not_viewed.add_card(card)
         return not_viewed
 
     @abstractmethod
@@ -135,7 +356,23 @@ class Strategy(ABC):
     ) -> BaseCard:
         """Return the card to discard."""
 
+    def discard_cards(
+        self,
+        k: int,
+        top_card: BaseCard,
+        current_player: int,
+        direction: int,
+        value_7: int,
+    ) -> list[BaseCard] | None:
+        """Return the k cards to discard in a pause at once, or None to be asked card by card with discard_card.
+
+        If fewer than k cards are returned, discard_card is asked for the rest.
+        """
+        return None
+
 class RandomStrategy(Strategy):
+    always_poll_jumps = True # Salta amb qualsevol carta, i l'erra
+
     def pick_jump_card(
         self,
         top_card: BaseCard,
@@ -143,10 +380,10 @@ class RandomStrategy(Strategy):
         direction: int,
         value_7: int,
     ) -> BaseCard | None:
-        return choice(self.player.cards)
+        return self.rng.choice(self.player.cards)
 
     def pick_play_card(self, top_card: BaseCard, direction: int, value_7: int) -> BaseCard | bool:
-        return choice(self.player.cards)
+        return self.rng.choice(self.player.cards)
 
     def discard_card(
         self,
@@ -155,7 +392,7 @@ class RandomStrategy(Strategy):
         direction: int,
         value_7: int,
     ) -> BaseCard:
-        return choice(self.player.cards)
+        return self.rng.choice(self.player.cards)
 
 class FirstStrategy(Strategy):
     def pick_jump_card(
@@ -0,0 +1,66 @@
+"""Events of a simulation, for the strategies (and other observers) that want them.
+
+Every Strategy is a GameObserver, and run_simulation also takes extra observers. Only the
+methods an observer overrides are called: the engine collects, once per simulation, the
+bound methods of the observers that override each event, and an event nobody listens to
+is a loop over an empty list, so strategies that don't subscribe pay nothing.
+
+Seats are the ones of the current game (Strategy.player_index). Like the rest of the
+table, observers only see public information: which cards were played or jumped, but
+only how many were drawn or discarded.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from base.classes import BaseCard
+
+EVENTS: tuple[str, ...] = (
+    "on_game_start",
+    "on_game_end",
+    "on_card_played",
+    "on_card_jumped",
+    "on_card_drawn",
+    "on_seven_penalty",
+    "on_reverse",
+    "on_pause",
+    "on_reshuffle",
+)
+
+
+class GameObserver:
+    """Base class of the event listeners of run_simulation. Every event does nothing by default."""
+
+    def on_game_start(self, top_card: BaseCard, first_player: int) -> None:
+        """The cards are dealt and first_player is about to play on top_card."""
+
+    def on_game_end(self, winner: int) -> None:
+        """The seat winner has run out of cards (called before the seats are shuffled for the next game)."""
+
+    def on_card_played(self, seat: int, card: BaseCard) -> None:
+        """seat has played card on its turn."""
+
+    def on_card_jumped(self, seat: int, card: BaseCard) -> None:
+        """seat has jumped with card, and it is now its turn."""
+
+    def on_card_drawn(self, seat: int, count: int) -> None:
+        """seat has drawn count cards, for not playing or for a wrong play or jump."""
+
+    def on_seven_penalty(self, seat: int, count: int) -> None:
+        """seat has drawn count cards for playing a 7 (fewer than value_7 if the main pile ran out)."""
+
+    def on_reverse(self, seat: int, direction: int) -> None:
+        """seat has played a 10 and the direction is now direction."""
+
+    def on_pause(self, discarded: list[int]) -> None:
+        """The main pile ran out and every seat has discarded discarded[seat] cards down to 5."""
+
+    def on_reshuffle(self) -> None:
+        """After a pause, the discards and the discard pile are shuffled into the new main pile, and the discard pile is empty."""
+
+
+def subscribers(observers: list[GameObserver], event: str) -> list[Callable[..., None]]:
+    """The bound event methods of the observers that override it."""
+    default = getattr(GameObserver, event)
+    return [getattr(observer, event) for observer in observers if getattr(type(observer), event) is not default]
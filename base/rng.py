@@ -0,0 +1,32 @@
+"""Seeded random streams for the engines and the strategies.
+
+Every simulation gets a numpy SeedSequence (from a seed, or from OS entropy) and spawns
+independent children from it: one per shard, one for the engine, one per player and one
+for the random module. Forked workers then never share a random state, and passing the
+same seed again replays a matchup or a shard exactly.
+"""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+Seed = int | np.random.SeedSequence | None
+
+
+def seed_sequence(seed: Seed) -> np.random.SeedSequence:
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def python_rng(seed: np.random.SeedSequence) -> random.Random:
+    """A random.Random seeded with 128 bits of the sequence."""
+    return random.Random(int.from_bytes(seed.generate_state(4, np.uint32).tobytes(), "little"))
+
+
+def describe_seed(seed: np.random.SeedSequence) -> str:
+    """How to pass the same seed again: the entropy, plus the spawn key of a child."""
+    if seed.spawn_key:
+        return f"SeedSequence({seed.entropy}, spawn_key={seed.spawn_key})"
+    return str(seed.entropy)
@@ -0,0 +1,107 @@
+"""Longest job first scheduling of the tournament matchups.
+
+The cost of a matchup is estimated as (seconds per turn) * (expected turns). Seconds per
+turn is the sum of the per turn cost of every strategy at the table plus the engine cost
+of every seat, or a single batch engine cost when only batchable strategies play. The
+per turn costs are a ridge regression of the finished matchups towards the prior ones, so
+they start from the probes (or a flat guess) and get better as results arrive. Expected
+turns is the mean of the finished matchups with the same number of players.
+"""
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+
+import numpy as np
+
+DEFAULT_TURN_COST: float = 1e-5 # Segons per torn d'una estrategia que no s'ha mesurat
+PRIOR_WEIGHT: float = 1.0
+
+
+class MatchupScheduler:
+    """Keeps the matchups still to run and hands out the most expensive one first.
+
+    start() gives the next matchup to submit, finish() records a finished one and
+    eta() estimates the seconds left with `workers` processes.
+    """
+
+    def __init__(
+        self,
+        matchups: list[tuple[str, ...]],
+        batchable: set[tuple[str, ...]],
+        default_iters: int,
+        workers: int,
+        turn_costs: dict[str, float] | None = None,
+    ):
+        self.pending = list(matchups)
+        self.batchable = batchable
+        self.default_iters = default_iters
+        self.workers = workers
+        self.names = sorted({name for matchup in matchups for name in matchup})
+        # Columnes: una per estrategia, el cost del motor per seient i el del motor vectoritzat
+        self._column = {name: i for i, name in enumerate(self.names)}
+        self._engine = len(self.names)
+        self._batch = len(self.names) + 1
+        turn_costs = turn_costs or {}
+        self._prior = np.array(
+            [turn_costs.get(name, DEFAULT_TURN_COST) for name in self.names] + [0.0, DEFAULT_TURN_COST]
+        )
+        self.costs = self._prior.copy()
+        self._rows: list[np.ndarray] = []
+        self._turn_times: list[float] = []
+        self._iters: dict[int, list[int]] = defaultdict(list)
+        self.running: dict[tuple[str, ...], float] = {}
+
+    def _features(self, matchup: tuple[str, ...]) -> np.ndarray:
+        x = np.zeros(len(self._prior))
+        if matchup in self.batchable:
+            x[self._batch] = 1.0
+            return x
+        for name in matchup:
+            x[self._column[name]] += 1.0
+        x[self._engine] = len(matchup)
+        return x
+
+    def expected_iters(self, matchup: tuple[str, ...]) -> float:
+        same_size = self._iters.get(len(matchup))
+        if same_size:
+            return sum(same_size) / len(same_size)
+        every = [iters for sizes in self._iters.values() for iters in sizes]
+        return sum(every) / len(every) if every else self.default_iters
+
+    def estimate(self, matchup: tuple[str, ...]) -> float:
+        """Expected seconds to simulate the matchup."""
+        return float(self._features(matchup) @ self.costs) * self.expected_iters(matchup)
+
+    def start(self) -> tuple[str, ...] | None:
+        """Take the pending matchup with the biggest estimated cost, or None if there are none."""
+        if not self.pending:
+            return None
+        matchup = max(self.pending, key=self.estimate)
+        self.pending.remove(matchup)
+        self.running[matchup] = time.perf_counter()
+        return matchup
+
+    def finish(self, matchup: tuple[str, ...], total_iters: int, elapsed: float) -> None:
+        """Record a finished matchup and refit the per turn costs."""
+        self.running.pop(matchup, None)
+        if not total_iters:
+            return
+        self._iters[len(matchup)].append(total_iters)
+        self._rows.append(self._features(matchup))
+        self._turn_times.append(elapsed / total_iters)
+        # Ridge cap a la prior, amb errors relatius i en unitats de la prior (u = c / scale):
+        # minimitza sum((x_i . c) / y_i - 1)^2 + w * sum((u - prior / scale)^2)
+        scale = np.maximum(self._prior, DEFAULT_TURN_COST)
+        z = np.array(self._rows) * scale / np.array(self._turn_times)[:, None]
+        a = z.T @ z + PRIOR_WEIGHT * np.eye(len(scale))
+        b = z.sum(axis=0) + PRIOR_WEIGHT * self._prior / scale
+        self.costs = np.maximum(np.linalg.solve(a, b), 0.0) * scale
+
+    def eta(self) -> float:
+        """Estimated seconds until every matchup has finished."""
+        now = time.perf_counter()
+        running_left = [max(self.estimate(m) - (now - started), 0.0) for m, started in self.running.items()]
+        pending = [self.estimate(m) for m in self.pending]
+        total = sum(running_left) + sum(pending)
+        return max(total / self.workers, max(running_left + pending, default=0.0))
@@ -0,0 +1,68 @@
+"""Sequential significance testing of the maos of a matchup.
+
+The tests are mixture sequential probability ratio tests: the likelihood of the maos
+under "every player wins as often" is compared with its average under all the other
+win probabilities (uniform Dirichlet prior). For a fixed set of players, by Ville's
+inequality the ratio ever reaching 1 / alpha has probability at most alpha when none of
+them is better, no matter how often it is looked at, so a simulation can check it every
+few games and stop as soon as it passes without inflating the error rate.
+
+SequentialTest also tests sets of players picked from the maos (the best ones). Those
+p-values are multiplied by the number of sets of that size it could have picked
+(Bonferroni), so the guarantee holds for all of them at once and the pick can't inflate it.
+"""
+from __future__ import annotations
+
+import math
+
+
+def mixture_log_lr(counts: list[int]) -> float:
+    """Log likelihood ratio of a Dirichlet(1, ..., 1) mixture against equal probabilities for all the counts."""
+    k = len(counts)
+    total = sum(counts)
+    return (
+        total * math.log(k)
+        + math.lgamma(k)
+        + sum(math.lgamma(count + 1) for count in counts)
+        - math.lgamma(total + k)
+    )
+
+
+def mixture_p_value(counts: list[int]) -> float:
+    """Always valid p-value of the counts coming from equal probabilities."""
+    return min(1.0, math.exp(-mixture_log_lr(counts)))
+
+
+class SequentialTest:
+    """Stopping rule for run_simulation(stop_condition=...) with the tests of the tournament.
+
+    Like the fixed sample check of the tournament it tests that all the players don't win
+    as often (bond_all), the same without the k worst ones (k = 1..n-3) and that the best
+    player wins more than the second one (binomial). The players of the last two are chosen
+    by their maos, so their p-values are corrected for every set of that size. It says stop
+    once every p-value is <= alpha. p_values and looks keep the last check.
+    """
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.looks = 0
+        self.p_values: dict[str, float] = {}
+
+    def check(self, maos: list[int]) -> dict[str, float]:
+        ranked = sorted(maos)
+        n = len(maos)
+        p_values = {}
+        for k in range(n - 2):
+            label = "bond_all" if k == 0 else f"bond_without_{k}_worst"
+            p_values[label] = min(1.0, math.comb(n, n - k) * mixture_p_value(ranked[k:]))
+        p_values["binomial"] = min(1.0, math.comb(n, 2) * mixture_p_value(ranked[-2:]))
+        return p_values
+
+    def __call__(self, maos: list[int]) -> bool:
+        self.looks += 1
+        self.p_values = self.check(maos)
+        return self.is_significant
+
+    @property
+    def is_significant(self) -> bool:
+        return bool(self.p_values) and all(p <= self.alpha for p in self.p_values.values())
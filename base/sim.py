@@ -1,59 +1,66 @@
 import __main__
 import json
+import math
+import multiprocessing
 import os
 import random
 import signal
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from typing import Callable
 
-from base.classes import BaseCard, Deck, Strategy
+from base.classes import BaseCard, CountedDeck, Deck, NormalCard, Strategy, interning_build_deck
+from base.events import EVENTS, GameObserver, subscribers
 from base.logger import get_elapsed_logger
+from base.rng import Seed, describe_seed, python_rng, seed_sequence
+from base.stats import CardsProb, PauseStats, SimulationResult
+from base.view import GameView, PublicState
 
+# Canvia-ho quan canviin les normes del joc: invalida els resultats guardats a la cache del torneig
+RULES_VERSION: int = 1
 ENSURE_PILE_LENGTH: bool = True
+# Quan es comprova que no s'ha creat ni borrat cap carta (si ENSURE_PILE_LENGTH):
+# "turn" a cada torn, "game" al final de cada partida o un enter N cada N partides.
+PILE_CHECK: str | int = "turn"
+# Cada quantes partides es crida stop_condition
+STOP_CHECK_EVERY: int = 100
 
 
-def _load_state(log, filepath: str, num_players: int) -> tuple[dict[int, list[int]], list[list[int]], list[int], list[int]]:
+def _pile_check_turns(pile_check: str | int) -> tuple[bool, int]:
+    """Return (check every turn, check the hands every N games) for a pile_check policy."""
+    if pile_check == "turn":
+        return True, 1
+    if pile_check == "game":
+        return False, 1
+    if type(pile_check) is int and pile_check > 0:
+        return False, pile_check
+    raise ValueError(f"pile_check ha de ser 'turn', 'game' o un enter positiu, no {pile_check!r}")
+
+
+def _run_filename(n: int, num_decks: int, strategies_to_call: list[type[Strategy]]) -> str:
+    if strategies_to_call and all(st is strategies_to_call[0] for st in strategies_to_call):
+        strategy_name = strategies_to_call[0].__name__
+    else:
+        strategy_name = "_".join(st.__name__ for st in strategies_to_call)
+    return f"{__main__.__file__.split('.')[0].split('/')[-1]}_{n}_{num_decks}_{strategy_name}"
+
+
+def _load_state(log, filepath: str, num_players: int) -> SimulationResult:
     if not os.path.exists(filepath):
         log.warning(f"File {filepath} does not exist")
-        return {}, [], [0 for _ in range(num_players)], []
+        return SimulationResult([0 for _ in range(num_players)])
     with open(filepath, "r") as f:
         data = json.load(f)
-
-    cards_prob_raw = data.get("dict_cartes_prob", {})
-    cards_prob: dict[int, list[int]] = {int(k): v for k, v in cards_prob_raw.items()}
-    pauses = data.get("pauses", [])
-    maos = data.get("maos", [0 for _ in range(num_players)])
-    iter_partides = data.get("iter_partides", [])
-    return cards_prob, pauses, maos, iter_partides
+    return SimulationResult.from_dict(data, num_players)
 
 
-def _save_state(
-    filepath: str,
-    cards_prob: dict[int, list[int]],
-    pauses: list[list[int]],
-    maos: list[int],
-    iter_partides: list[int],
-) -> None:
+def _save_state(filepath: str, result: SimulationResult) -> None:
     with open(filepath, "w") as f:
-        json.dump(
-            {
-                "dict_cartes_prob": cards_prob,
-                "pauses": pauses,
-                "maos": maos,
-                "iter_partides": iter_partides,
-            },
-            f,
-        )
+        json.dump(result.to_dict(), f)
 
 
-def _print_final_stats(
-    log,
-    cards_prob: dict[int, list[int]],
-    pauses: list[list[int]],
-    maos: list[int],
-    iter_partides: list[int],
-    num_players: int,
-) -> None:
+def _print_final_stats(log, result: SimulationResult, num_players: int) -> None:
+    cards_prob = result.cards_prob.to_dict()
     string_prob = "Final probabilities:\n"
     _, maximo_mostra, _ = max(cards_prob.values(), key=lambda x: x[1])
     _, _, maximo_picades = max(cards_prob.values(), key=lambda x: x[2])
@@ -71,19 +78,87 @@ def _print_final_stats(
     log.info(string_prob)
     log.info(f"Mitjana de cartes: {cartes_mostrades / all_mostres}")
 
-    if pauses:
-        sum_pauses = [0 for _ in range(num_players)]
-        for pause in pauses:
-            for i in range(num_players):
-                sum_pauses[i] += pause[i]
-        for i in range(num_players):
-            sum_pauses[i] /= len(pauses)
+    if result.pauses.count:
+        sum_pauses = result.mean_pause_cards
         log.info(f"Mitjanes de cartes per jugadors en pauses: {sum_pauses}")
         log.info(f"Mitjanes de cartes en pausa: {sum(sum_pauses) / num_players}")
-        log.info(f"Mitjana de pauses per partida: {len(pauses)/sum(maos)}")
+        log.info(f"Mitjana de pauses per partida: {result.pauses_per_game}")
+
+    log.info(f"MAOS per jugadors: {result.maos}")
+    log.info(
+        f"Mitjanes de iteracions per partida: {result.mean_turns_per_game} "
+        f"(desviacio {result.game_turns.std:.2f}, mediana {result.game_turns.quantile(0.5)})"
+    )
+
+def _report_and_save(log, result: SimulationResult, saved: SimulationResult | None, num_players: int, filepath: str, persist: bool) -> SimulationResult:
+    if saved is not None:
+        saved.merge(result)
+        result = saved
+    _print_final_stats(log, result, num_players)
+    if persist:
+        _save_state(filepath, result)
+    return result
+
+
+def _run_shards(log, workers: int, shard_iters: int, stop_condition, stop_check_every: int, seed, kwargs: dict) -> SimulationResult:
+    iter_max = kwargs["iter_max"]
+    shards = [shard_iters] * (iter_max // shard_iters)
+    if iter_max % shard_iters:
+        shards.append(iter_max % shard_iters)
+    log.info(f"Running {iter_max} iterations in {len(shards)} shards with {workers} workers")
+    shard_seeds = seed.spawn(len(shards))
+    # Es fusionen en ordre de shard al final, perque el resultat no depengui de qui acaba abans
+    results: dict[int, SimulationResult] = {}
+    maos = [0] * kwargs["n"]
+    stop = interrupted = False
 
-    log.info(f"MAOS per jugadors: {maos}")
-    log.info(f"Mitjanes de iteracions per partida: {sum(iter_partides) / len(iter_partides)}")
+    def _handle_sigint(_signum, _frame):
+        # Els shards reben el mateix Ctrl+C i acaben la seva partida
+        nonlocal stop, interrupted
+        stop = interrupted = True
+        log.warning("Ctrl+C received. Waiting for the running shards to finish their current game...")
+
+    previous_sigint_handler = signal.signal(signal.SIGINT, _handle_sigint)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            futures = {
+                executor.submit(run_simulation, **{**kwargs, "iter_max": iters, "seed": shard_seed}): i
+                for i, (iters, shard_seed) in enumerate(zip(shards, shard_seeds))
+            }
+            pending = list(futures)
+            while pending:
+                done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+                pending = list(not_done)
+                for future in done:
+                    shard = future.result()
+                    results[futures[future]] = shard
+                    maos = [a + b for a, b in zip(maos, shard.maos)]
+                    stop = stop or shard.aborted
+                num_games = sum(shard.num_games for shard in results.values())
+                if not stop and stop_condition is not None and num_games >= stop_check_every and stop_condition(maos):
+                    log.info(f"stop_condition complerta despres de {num_games} partides")
+                    stop = True
+                if stop:
+                    # Els que ja juguen acaben, la resta es descarten
+                    pending = [future for future in pending if not future.cancel()]
+    finally:
+        signal.signal(signal.SIGINT, previous_sigint_handler)
+    result = None
+    for i in sorted(results):
+        if result is None:
+            result = results[i]
+        else:
+            result.merge(results[i])
+    result.interrupted = result.interrupted or interrupted
+    return result
+
+
+def _discard(log, i: int, card: BaseCard, players: list[Deck], main_pile: Deck, num_cards_per_player: list[int], narrate: bool) -> None:
+    main_pile.add_card(card) # canvi de discard_pile a main_pile per fer que no tinguin extra info de descartar la resta.
+    players[i].remove_card(card)
+    num_cards_per_player[i] -= 1
+    if narrate:
+        log.debug(f"Player {i} ha descartat {str(card)}")
 
 def pausa(
     log,
@@ -96,28 +171,62 @@ def pausa(
     main_pile: Deck,
     current_player: int,
     direction: int,
-    pauses: list[list[int]],
+    pauses: PauseStats,
     num_cards_per_player: list[int],
     value_7: int,
     seat_to_player_id: list[int],
+    narrate: bool = True,
+    rng: random.Random | None = None,
+    on_pause: list[Callable[[list[int]], None]] = (),
+    on_reshuffle: list[Callable[[], None]] = (),
 ) -> tuple[Deck, Deck]:
-    log.debug(f"Iter {iter_number}: Entrem a la pausa!")
+    if narrate:
+        log.debug(f"Iter {iter_number}: Entrem a la pausa!")
     to_append = [0] * n
     for seat in range(n):
         to_append[seat_to_player_id[seat]] = num_cards_per_player[seat]
+    discarded = [max(num_cards_per_player[i] - 5, 0) for i in range(n)] if on_pause else None
     for i in range(n):
+        excess = num_cards_per_player[i] - 5
+        batch = strategies[i].discard_cards(excess, top_card, current_player, direction, value_7) if excess > 0 else None
+        for card_to_discard in (batch or [])[:excess]:
+            _discard(log, i, card_to_discard, players, main_pile, num_cards_per_player, narrate)
         while num_cards_per_player[i] > 5:
             card_to_discard = strategies[i].discard_card(top_card, current_player, direction, value_7)
-            main_pile.add_card(card_to_discard) # canvi de discard_pile a main_pile per fer que no tinguin extra info de descartar la resta.
-            players[i].remove_card(card_to_discard)
-            num_cards_per_player[i] -= 1
-            log.debug(f"Player {i} ha descartat {str(card_to_discard)}")
+            _discard(log, i, card_to_discard, players, main_pile, num_cards_per_player, narrate)
+    for handler in on_pause:
+        handler(discarded)
     while len(main_pile) > 0:
         discard_pile.add_card(main_pile.remove_top_card())
-    discard_pile.shuffle()
-    pauses.append(to_append)
+    discard_pile.shuffle(rng)
+    for handler in on_reshuffle:
+        handler()
+    pauses.add(to_append)
     return main_pile, discard_pile
 
+def _report_lost_cards(
+    log,
+    iter_number: int,
+    transfer: str,
+    transfer_seat: int,
+    main_pile: Deck,
+    discard_pile: Deck,
+    players: list[Deck],
+    num_cards_per_player: list[int],
+    original_pile_length: int,
+) -> None:
+    total = len(main_pile) + len(discard_pile) + sum(len(player) for player in players) + 1
+    wrong_hands = {
+        i: (len(player), num_cards_per_player[i])
+        for i, player in enumerate(players)
+        if len(player) != num_cards_per_player[i]
+    }
+    log.critical(
+        f"Iter {iter_number} S'ha creat o borrat materia? {total} vs og {original_pile_length}. "
+        f"Ultim moviment: {transfer} (player {transfer_seat}). "
+        f"Mans diferents (cartes, esperades): {wrong_hands}"
+    )
+
 def run_simulation(
     *,
     n: int,
@@ -128,42 +237,195 @@ def run_simulation(
     log_ignores_wrong_cards: bool = False,
     random_first_player: bool = False,
     random_position_players: bool = False,
-) -> None:
+    intern_cards: bool = False,
+    pile_check: str | int | None = None,
+    persist: bool = False,
+    stop_condition: Callable[[list[int]], bool] | None = None,
+    stop_check_every: int = STOP_CHECK_EVERY,
+    workers: int = 1,
+    shard_iters: int | None = None,
+    seed: Seed = None,
+    poll_all_jumps: bool = False,
+    observers: list[GameObserver] | None = None,
+) -> SimulationResult | None:
+    """Simulate games until at least iter_max turns have been played and return their statistics.
+
+    With persist=True the statistics saved by a previous run with the same players are
+    loaded and merged, and the merged ones are saved back to the run JSON file. By default
+    nothing is read from or written to disk apart from the log.
+
+    Turn by turn narration (log.debug) is only produced when iter_max == 1. Any other
+    run uses the same loop with every narration call switched off, so no log messages
+    are formatted while playing. Wrong cards are still reported with log.error unless
+    log_ignores_wrong_cards is set.
+
+    With intern_cards=True every NormalCard built by build_deck (also the ones the
+    strategies build for themselves) is swapped by its shared InternedCard, so card
+    equality, hashing and hand removals become identity operations.
+
+    The engine keeps the number of cards in the hands updated on every transfer, so the
+    conservation of cards check (ENSURE_PILE_LENGTH) costs O(1). pile_check chooses when it
+    runs: "turn", "game" (hands are recounted at the end of every game) or an int N (every
+    N games). None uses PILE_CHECK. A violation is reported with its iteration and the
+    last transfer done, and stops the simulation with result.aborted set. A Ctrl+C lets
+    the current game finish and sets result.interrupted.
+
+    stop_condition is called with the maos every stop_check_every games, and the
+    simulation stops as soon as it returns True (iter_max is then only a cap), e.g. a
+    base.sequential.SequentialTest.
+
+    With workers > 1 iter_max is split in shards of shard_iters iterations (by default one
+    shard per worker) that are simulated in a process pool, each with its own random
+    seed, and merged into one result. stop_condition is then checked with the merged
+    maos each time a shard finishes, and the shards not started yet are dropped once
+    it returns True.
+
+    All the randomness comes from seed (an int, a numpy SeedSequence or None for a fresh
+    one, see base.rng): every shard, the engine (shuffles, first player, seats, jump
+    order) and every strategy (Strategy.rng) get an independent stream spawned from it,
+    and the random module is reseeded for strategies that still use it (its previous
+    state is restored when the run ends). The seed is logged, and running again with it
+    and the same arguments plays the same games.
+
+    After every turn the seats are asked for a jump in a random order, but only the ones
+    holding a copy of the top card (looked up in the type histogram of their hand) or whose
+    strategy sets always_poll_jumps get the pick_jump_card call. poll_all_jumps=True asks
+    every seat, as it was done before. Cards whose can_be_jumped is not the NormalCard one
+    always make every seat be asked.
+
+    The piles and hands are CountedDecks when every card of build_deck is a NormalCard (or
+    InternedCard). Decks with other BaseCards, which have no type_id, fall back to plain
+    Decks, without the O(1) histograms.
+
+    Strategies with uses_game_view = True get a base.view.GameView of their own hand as
+    self.game_view, updated before every decision (also the pause discards), with the
+    public state and the bitmasks of the cards they can play or jump. It is not built when
+    no strategy asks for it, or when the cards are not NormalCards.
+
+    The strategies, and the extra observers, get the events of base.events (game start and
+    end, cards played, jumped and drawn, 7 penalties, reverses, pauses and reshuffles) in
+    the GameObserver methods they override; the rest are never called. observers live in
+    this process, so they need workers=1.
+    """
     debug_mode = iter_max == 1
+    narrate = debug_mode
     t0 = time.perf_counter()
     if n == 1:
         log = get_elapsed_logger(t0, "stupid.log", debugging=debug_mode, name=__name__)
         log.critical(f"Only one player. Maybe you are stupid.")
         return
-    if strategies_to_call and all(st is strategies_to_call[0] for st in strategies_to_call):
-        strategy_name = strategies_to_call[0].__name__
-    else:
-        strategy_name = "_".join(st.__name__ for st in strategies_to_call)
-    filename = f"{__main__.__file__.split('.')[0].split('/')[-1]}_{n}_{num_decks}_{strategy_name}"
+    filename = _run_filename(n, num_decks, strategies_to_call)
     log = get_elapsed_logger(t0, filename + ".log", debugging=debug_mode, name=__name__)
-    cards_prob, pauses, maos, iter_partides = _load_state(log, filename + ".json", n)
-
+    saved = _load_state(log, filename + ".json", n) if persist else None
+    seed = seed_sequence(seed)
+    log.info(f"Seed: {describe_seed(seed)}")
+
+    if workers > 1:
+        if observers:
+            raise ValueError("observers nomes es poden fer servir amb workers=1")
+        kwargs = dict(
+            n=n,
+            iter_max=iter_max,
+            num_decks=num_decks,
+            build_deck=build_deck,
+            strategies_to_call=strategies_to_call,
+            log_ignores_wrong_cards=log_ignores_wrong_cards,
+            random_first_player=random_first_player,
+            random_position_players=random_position_players,
+            intern_cards=intern_cards,
+            pile_check=pile_check,
+            poll_all_jumps=poll_all_jumps,
+        )
+        result = _run_shards(log, workers, shard_iters or math.ceil(iter_max / workers), stop_condition, stop_check_every, seed, kwargs)
+        result.elapsed = time.perf_counter() - t0
+        return _report_and_save(log, result, saved, n, filename + ".json", persist)
+
+    check_turns, check_every_games = _pile_check_turns(PILE_CHECK if pile_check is None else pile_check)
+    check_turns = check_turns and ENSURE_PILE_LENGTH
+    check_games = ENSURE_PILE_LENGTH
+
+    if intern_cards:
+        build_deck = interning_build_deck(build_deck)
+
+    engine_seed, module_seed, *strategy_seeds = seed.spawn(n + 2)
+    rng = python_rng(engine_seed)
+    # Les estrategies que encara fan servir el modul random tambe es poden repetir; l'estat de qui crida es restaura al final
+    caller_random_state = random.getstate()
+    random.seed(python_rng(module_seed).getrandbits(128))
+
+    deck = Deck()
+    build_deck(deck, num_decks)
+    # Els histogrames de CountedDeck necessiten type_id: les cartes que no en tenen van amb Deck
+    counted = all(isinstance(card, NormalCard) for card in deck.cards)
+    deck_class = CountedDeck if counted else Deck
     num_cards_per_player = [0 for _ in range(n)]
-    main_pile = Deck()
-    discard_pile = Deck()
-    players: list[Deck] = [Deck() for _ in range(n)]
+    main_pile = deck_class()
+    for card in deck.cards:
+        main_pile.add_card(card)
+    discard_pile = deck_class()
+    players: list[Deck] = [deck_class() for _ in range(n)]
     strategies: list[Strategy] = [
         strategy(player, discard_pile, i, n, build_deck, num_decks, num_cards_per_player)
         for i, (player, strategy) in enumerate(zip(players, strategies_to_call))
     ]
+    for strategy, strategy_seed in zip(strategies, strategy_seeds):
+        strategy.rng = python_rng(strategy_seed)
+    # Nomes es criden els esdeveniments que algu escolta (base.events)
+    listeners = [*strategies, *(observers or ())]
+    on_game_start = subscribers(listeners, "on_game_start")
+    on_game_end = subscribers(listeners, "on_game_end")
+    on_card_played = subscribers(listeners, "on_card_played")
+    on_card_jumped = subscribers(listeners, "on_card_jumped")
+    on_card_drawn = subscribers(listeners, "on_card_drawn")
+    on_seven_penalty = subscribers(listeners, "on_seven_penalty")
+    on_reverse = subscribers(listeners, "on_reverse")
+    on_pause = subscribers(listeners, "on_pause")
+    on_reshuffle = subscribers(listeners, "on_reshuffle")
+
+    if log_ignores_wrong_cards:
+        log_wrong_card = log.debug if narrate else None
+    else:
+        log_wrong_card = log.error
 
-    build_deck(main_pile, num_decks)
     original_pile_length = len(main_pile)
+    # Nomes es pot saltar amb una carta identica, i aixo es mira amb type_counts de la ma
+    normal_cards = counted and all(
+        type(card).can_be_jumped is NormalCard.can_be_jumped and type(card).can_be_played is NormalCard.can_be_played
+        for card in main_pile.cards
+    )
+    skip_non_holders = not poll_all_jumps and normal_cards
+    # Les jugades legals de GameView segueixen les regles de NormalCard
+    public = PublicState(num_cards_per_player) if normal_cards and any(s.uses_game_view for s in strategies) else None
+    if public is not None:
+        for strategy in strategies:
+            if strategy.uses_game_view:
+                strategy.game_view = GameView(strategy.player, public)
+
+    result = SimulationResult([0] * n, CardsProb(original_pile_length))
+    maos = result.maos
+    pauses = result.pauses
+    game_turns = result.game_turns
+    played_by_size = result.cards_prob.playable
+    turns_by_size = result.cards_prob.samples
+    jumps_by_size = result.cards_prob.jumps
 
     iter_number = 0
     num_avis = min(int(iter_max / 10), 1_000_000) if not debug_mode else 1
     won_last_time = 0
     player_indexes = list(range(n))
+    all_seats = range(n)
+    called_seats = [0]
+    # Qui escolta esdeveniments executa codi a qualsevol moment: llavors es miren totes les mans
+    check_all_seats = any(subscribers(strategies, event) for event in EVENTS)
     seat_to_player_id = list(range(n))
     stop_after_current_game = False
+    num_games = 0
+    cards_in_hands = 0
+    transfer, transfer_seat = "repartir", 0
 
     def _handle_sigint(_signum, _frame):
         nonlocal stop_after_current_game
+        result.interrupted = True
         if not stop_after_current_game:
             stop_after_current_game = True
             log.warning("Ctrl+C received. Finishing current game before stopping...")
@@ -175,21 +437,27 @@ def run_simulation(
 
     try:
         while iter_number < iter_max:
-            main_pile.shuffle()
+            main_pile.shuffle(rng)
+            always_polled = [strategy.always_poll_jumps for strategy in strategies]
 
             for _ in range(3):
                 for i in range(n):
                     players[i].add_card(main_pile.remove_top_card())
                     num_cards_per_player[i] += 1
+            cards_in_hands += 3 * n
+            transfer, transfer_seat = "repartir", 0
             top_card = main_pile.remove_top_card()
             has_winner = False
             if random_first_player:
-                current_player = random.randint(0, n-1) # Could have some "first player" advantage.
+                current_player = rng.randint(0, n-1) # Could have some "first player" advantage.
             else:
                 current_player = 0
             direction = 1
             value_7 = 0
-            log.debug(f"Top card: {top_card}")
+            if narrate:
+                log.debug(f"Top card: {top_card}")
+            for handler in on_game_start:
+                handler(top_card, current_player)
 
             while not has_winner:
                 if iter_number % num_avis == 0 and not debug_mode:
@@ -201,124 +469,188 @@ def run_simulation(
                         f"({time_per_iter:.6e} iter/s)",
                     )
 
-                iter_number += 1
-                if (
-                    ENSURE_PILE_LENGTH
-                    and len(main_pile)
-                    + len(discard_pile)
-                    + sum(len(player) for player in players)
-                    + 1
-                    != original_pile_length
+                # Es miren les mans de tots els seients que han cridat la seva estrategia aquest torn
+                if check_turns and (
+                    len(main_pile) + len(discard_pile) + cards_in_hands + 1 != original_pile_length
+                    or any(len(players[i]) != num_cards_per_player[i] for i in (all_seats if check_all_seats else called_seats))
                 ):
-                    log.critical(
-                        f"Iter {iter_number} S'ha creat o borrat materia? "
-                        f"{len(main_pile) + len(discard_pile) + sum(len(player) for player in players) + 1} "
-                        f"vs og {original_pile_length}"
-                    )
+                    _report_lost_cards(log, iter_number, transfer, transfer_seat, main_pile, discard_pile, players, num_cards_per_player, original_pile_length)
+                    result.aborted = True
                     iter_number = iter_max
                     break
+                iter_number += 1
+                called_seats = [current_player]
 
                 current_hand_size = num_cards_per_player[current_player]
-                current_prob = cards_prob.setdefault(current_hand_size, [0, 0, 0])
-                current_prob[1] += 1
+                turns_by_size[current_hand_size] += 1
 
                 strategy = strategies[current_player]
+                if public is not None:
+                    public.update(top_card, current_player, direction, value_7, discard_pile)
                 played_card = strategy.pick_play_card(top_card, direction, value_7)
                 if type(played_card) is not bool:
                     if not played_card.can_be_played(top_card):
-                        (log.debug if log_ignores_wrong_cards else log.error)(
-                            f"Iter {iter_number}: Player {current_player} ha jugat malament! "
-                            f"{str(played_card)} no pot jugar! "
-                            f"({current_hand_size} -> {current_hand_size + 1})",
-                        )
+                        if log_wrong_card is not None:
+                            log_wrong_card(
+                                f"Iter {iter_number}: Player {current_player} ha jugat malament! "
+                                f"{str(played_card)} no pot jugar! "
+                                f"({current_hand_size} -> {current_hand_size + 1})",
+                            )
                         players[current_player].add_card(main_pile.remove_top_card())
                         num_cards_per_player[current_player] += 1
+                        cards_in_hands += 1
+                        transfer, transfer_seat = "jugada erronia", current_player
+                        for handler in on_card_drawn:
+                            handler(current_player, 1)
                         if len(main_pile) == 0:
-                            discard_pile, main_pile = pausa(log, iter_number, n, players, strategies, top_card, discard_pile, main_pile, current_player, direction, pauses, num_cards_per_player, value_7, seat_to_player_id)
+                            discard_pile, main_pile = pausa(log, iter_number, n, players, strategies, top_card, discard_pile, main_pile, current_player, direction, pauses, num_cards_per_player, value_7, seat_to_player_id, narrate, rng, on_pause, on_reshuffle)
+                            cards_in_hands = sum(num_cards_per_player)
+                            transfer, transfer_seat = "pausa", current_player
+                            called_seats = list(all_seats) # Tothom ha descartat
                         continue
                         
-                    current_prob[0] += 1
+                    played_by_size[current_hand_size] += 1
                     players[current_player].remove_card(played_card)
                     num_cards_per_player[current_player] -= 1
-                    log.debug(f"Iter {iter_number}: Player {current_player} ha jugat {str(played_card)} ({current_hand_size} -> {current_hand_size - 1})")
+                    cards_in_hands -= 1
+                    if narrate:
+                        log.debug(f"Iter {iter_number}: Player {current_player} ha jugat {str(played_card)} ({current_hand_size} -> {current_hand_size - 1})")
                     discard_pile.add_card(top_card)
                     top_card = played_card
+                    transfer, transfer_seat = "jugar", current_player
+                    for handler in on_card_played:
+                        handler(current_player, played_card)
                     if top_card.value == 10:
                         direction *= -1
+                        for handler in on_reverse:
+                            handler(current_player, direction)
                     if top_card.value == 7:
                         value_7 += 1
                         for _ in range(value_7):
                             players[current_player].add_card(main_pile.remove_top_card())
                             num_cards_per_player[current_player] += 1
+                            cards_in_hands += 1
+                            transfer = "robar pel 7"
                             if len(main_pile) == 0:
                                 break  # entrara en pausa automaticament
-                        log.debug(
-                            f"Iter {iter_number}: Player {current_player} ha robat per tirar el 7 "
-                            f"({current_hand_size - 1} -> {current_hand_size - 1 + value_7})",
-                        )
+                        if narrate:
+                            log.debug(
+                                f"Iter {iter_number}: Player {current_player} ha robat per tirar el 7 "
+                                f"({current_hand_size - 1} -> {current_hand_size - 1 + value_7})",
+                            )
+                        for handler in on_seven_penalty:
+                            handler(current_player, num_cards_per_player[current_player] - current_hand_size + 1)
                     else:
                         value_7 = 0
                 else:
                     players[current_player].add_card(main_pile.remove_top_card())
                     num_cards_per_player[current_player] += 1
+                    cards_in_hands += 1
+                    transfer, transfer_seat = "robar", current_player
+                    for handler in on_card_drawn:
+                        handler(current_player, 1)
                     if played_card is True:
-                        current_prob[0] += 1
-                    log.debug(f"Iter {iter_number}: Player {current_player} ha robat ({current_hand_size} -> {current_hand_size + 1})")
+                        played_by_size[current_hand_size] += 1
+                    if narrate:
+                        log.debug(f"Iter {iter_number}: Player {current_player} ha robat ({current_hand_size} -> {current_hand_size + 1})")
 
                 if num_cards_per_player[current_player] == 0:
                     has_winner = True
-                    log.debug(f"Iter {iter_number}: Player {current_player} diu mao!")
+                    if narrate:
+                        log.debug(f"Iter {iter_number}: Player {current_player} diu mao!")
                     break
 
                 current_player = (current_player + direction) % n
+                if public is not None:
+                    public.update(top_card, current_player, direction, value_7, discard_pile)
 
                 if len(main_pile) == 0:
-                    discard_pile, main_pile = pausa(log, iter_number, n, players, strategies, top_card, discard_pile, main_pile, current_player, direction, pauses, num_cards_per_player, value_7, seat_to_player_id)
-
-                random.shuffle(player_indexes)
+                    discard_pile, main_pile = pausa(log, iter_number, n, players, strategies, top_card, discard_pile, main_pile, current_player, direction, pauses, num_cards_per_player, value_7, seat_to_player_id, narrate, rng, on_pause, on_reshuffle)
+                    cards_in_hands = sum(num_cards_per_player)
+                    transfer, transfer_seat = "pausa", current_player
+                    called_seats = list(all_seats) # Tothom ha descartat
+                    if public is not None:
+                        public.update(top_card, current_player, direction, value_7, discard_pile)
+
+                rng.shuffle(player_indexes)
+                top_type_id = top_card.type_id if skip_non_holders else None
                 for i in player_indexes:
+                    if skip_non_holders and not always_polled[i] and not players[i].type_counts[top_type_id]:
+                        continue
+                    called_seats.append(i)
                     jump_card = strategies[i].pick_jump_card(top_card, current_player, direction, value_7)
                     if jump_card is not None:
                         jump_hand_size = num_cards_per_player[i]
                         if not jump_card.can_be_jumped(top_card):
-                            (log.debug if log_ignores_wrong_cards else log.error)(
-                                f"Iter {iter_number}: Player {i} ha saltat malament! "
-                                f"{str(jump_card)} no pot saltar! "
-                                f"({jump_hand_size} -> {jump_hand_size + 1})",
-                            )
+                            if log_wrong_card is not None:
+                                log_wrong_card(
+                                    f"Iter {iter_number}: Player {i} ha saltat malament! "
+                                    f"{str(jump_card)} no pot saltar! "
+                                    f"({jump_hand_size} -> {jump_hand_size + 1})",
+                                )
                             players[i].add_card(main_pile.remove_top_card())
                             num_cards_per_player[i] += 1
+                            cards_in_hands += 1
+                            transfer, transfer_seat = "salt erroni", i
+                            for handler in on_card_drawn:
+                                handler(i, 1)
                             if len(main_pile) == 0:
-                                discard_pile, main_pile = pausa(log, iter_number, n, players, strategies, top_card, discard_pile, main_pile, current_player, direction, pauses, num_cards_per_player, value_7, seat_to_player_id)
+                                discard_pile, main_pile = pausa(log, iter_number, n, players, strategies, top_card, discard_pile, main_pile, current_player, direction, pauses, num_cards_per_player, value_7, seat_to_player_id, narrate, rng, on_pause, on_reshuffle)
+                                cards_in_hands = sum(num_cards_per_player)
+                                transfer, transfer_seat = "pausa", current_player
+                                called_seats = list(all_seats) # Tothom ha descartat
+                                if public is not None:
+                                    public.update(top_card, current_player, direction, value_7, discard_pile)
                             continue
                         num_cards_per_player[i] -= 1
-                        log.debug(f"Iter {iter_number}: Player {i} ha saltat amb {str(jump_card)} ({jump_hand_size} -> {jump_hand_size - 1})")
-                        jump_prob = cards_prob.setdefault(jump_hand_size, [0, 0, 0])
-                        jump_prob[2] += 1
+                        if narrate:
+                            log.debug(f"Iter {iter_number}: Player {i} ha saltat amb {str(jump_card)} ({jump_hand_size} -> {jump_hand_size - 1})")
+                        jumps_by_size[jump_hand_size] += 1
                         players[i].remove_card(jump_card)
                         discard_pile.add_card(top_card)
                         top_card = jump_card
+                        cards_in_hands -= 1
+                        transfer, transfer_seat = "saltar", i
                         current_player = i
+                        for handler in on_card_jumped:
+                            handler(i, jump_card)
                         if len(players[i]) == 0:
                             has_winner = True
-                            log.debug(f"Iter {iter_number}: Player {i} diu mao!")
+                            if narrate:
+                                log.debug(f"Iter {iter_number}: Player {i} diu mao!")
                         break
 
+            if not has_winner:
+                break # Partida interrompuda per perdua de cartes
+            for handler in on_game_end:
+                handler(current_player)
             winner_player_id = seat_to_player_id[current_player]
             maos[winner_player_id] += 1
-            iter_partides.append(iter_number - won_last_time)
+            game_turns.add(iter_number - won_last_time)
             won_last_time = iter_number
+            num_games += 1
+            if check_games and num_games % check_every_games == 0 and (
+                any(len(players[i]) != num_cards_per_player[i] for i in range(n))
+                or len(main_pile) + len(discard_pile) + cards_in_hands + 1 != original_pile_length
+            ):
+                _report_lost_cards(log, iter_number, transfer, transfer_seat, main_pile, discard_pile, players, num_cards_per_player, original_pile_length)
+                result.aborted = True
+                break
+            if stop_condition is not None and num_games % stop_check_every == 0 and stop_condition(maos):
+                log.info(f"Iter {iter_number}: stop_condition complerta despres de {num_games} partides")
+                stop_after_current_game = True
             for i in range(n):
-                while num_cards_per_player[i] > 0:
-                    num_cards_per_player[i] -= 1
+                while len(players[i]):
                     main_pile.add_card(players[i].remove_top_card())
+                num_cards_per_player[i] = 0
             while len(discard_pile):
                 main_pile.add_card(discard_pile.remove_top_card())
             main_pile.add_card(top_card)
+            cards_in_hands = 0
 
             if random_position_players:
                 shuffled_positions = list(zip(players, strategies, seat_to_player_id))
-                random.shuffle(shuffled_positions)
+                rng.shuffle(shuffled_positions)
                 players, strategies, seat_to_player_id = map(list, zip(*shuffled_positions))
                 for i, strategy in enumerate(strategies):
                     strategy.player_index = i
@@ -327,6 +659,7 @@ def run_simulation(
                 break
     finally:
         signal.signal(signal.SIGINT, previous_sigint_handler)
+        random.setstate(caller_random_state)
 
-    _print_final_stats(log, cards_prob, pauses, maos, iter_partides, n)
-    _save_state(filename + ".json", cards_prob, pauses, maos, iter_partides)
+    result.elapsed = time.perf_counter() - t0
+    return _report_and_save(log, result, saved, n, filename + ".json", persist)
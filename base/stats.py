@@ -0,0 +1,249 @@
+"""Constant memory statistics of a simulation.
+
+Every accumulator can be merged with another one of the same kind, so results of
+different runs (or saved in a JSON file) add up exactly like playing all the games
+in a single run.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+
+GAME_TURNS_BUCKETS: int = 1024
+PAUSE_CARDS_BUCKETS: int = 128
+
+
+class Distribution:
+    """Count, exact sum, Welford mean and variance and a fixed bucket histogram of integer samples.
+
+    Bucket i counts the samples in [i * width, (i + 1) * width); the last bucket also
+    keeps everything bigger.
+    """
+    __slots__ = ("count", "total", "mean", "m2", "width", "buckets")
+
+    def __init__(self, num_buckets: int, width: int = 1):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.width = width
+        self.buckets = array("q", [0]) * num_buckets
+
+    def add(self, x: int) -> None:
+        self.count += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.buckets[min(x // self.width, len(self.buckets) - 1)] += 1
+
+    def merge(self, other: Distribution) -> None:
+        if (self.width, len(self.buckets)) != (other.width, len(other.buckets)):
+            raise ValueError("Cannot merge distributions with different buckets")
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        for i, value in enumerate(other.buckets):
+            self.buckets[i] += value
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> int:
+        """Lower bound of the bucket holding the q-quantile."""
+        target = q * self.count
+        seen = 0
+        for i, value in enumerate(self.buckets):
+            seen += value
+            if value and seen >= target:
+                return i * self.width
+        return 0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "m2": self.m2,
+            "width": self.width,
+            "buckets": self.buckets.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Distribution:
+        dist = cls(len(data["buckets"]), data["width"])
+        dist.count = data["count"]
+        dist.total = data["total"]
+        dist.mean = data["mean"]
+        dist.m2 = data["m2"]
+        dist.buckets = array("q", data["buckets"])
+        return dist
+
+
+class CardsProb:
+    """Per hand size counters: turns where a card was played, turns sampled and jumps done."""
+    __slots__ = ("playable", "samples", "jumps")
+
+    def __init__(self, max_hand_size: int = 0):
+        self.playable = array("q", [0]) * (max_hand_size + 1)
+        self.samples = array("q", [0]) * (max_hand_size + 1)
+        self.jumps = array("q", [0]) * (max_hand_size + 1)
+
+    def _grow(self, max_hand_size: int) -> None:
+        missing = max_hand_size + 1 - len(self.samples)
+        if missing > 0:
+            for counts in (self.playable, self.samples, self.jumps):
+                counts.extend([0] * missing)
+
+    def merge(self, other: CardsProb) -> None:
+        self._grow(len(other.samples) - 1)
+        for mine, theirs in ((self.playable, other.playable), (self.samples, other.samples), (self.jumps, other.jumps)):
+            for i, value in enumerate(theirs):
+                mine[i] += value
+
+    def add_counts(self, hand_size: int, playable: int, samples: int, jumps: int) -> None:
+        self._grow(hand_size)
+        self.playable[hand_size] += playable
+        self.samples[hand_size] += samples
+        self.jumps[hand_size] += jumps
+
+    def items(self) -> list[tuple[int, list[int]]]:
+        """(hand size, [playable, samples, jumps]) of every hand size seen."""
+        return [
+            (i, [self.playable[i], self.samples[i], self.jumps[i]])
+            for i in range(len(self.samples))
+            if self.samples[i] or self.jumps[i]
+        ]
+
+    def to_dict(self) -> dict[int, list[int]]:
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CardsProb:
+        cards_prob = cls()
+        for hand_size, (playable, samples, jumps) in data.items():
+            cards_prob.add_counts(int(hand_size), playable, samples, jumps)
+        return cards_prob
+
+
+class PauseStats:
+    """Number of pauses and the distribution of the hand size of each player (by player id) when they start."""
+    __slots__ = ("count", "players")
+
+    def __init__(self, num_players: int):
+        self.count = 0
+        self.players = [Distribution(PAUSE_CARDS_BUCKETS) for _ in range(num_players)]
+
+    def add(self, hand_sizes: list[int]) -> None:
+        self.count += 1
+        for dist, size in zip(self.players, hand_sizes):
+            dist.add(size)
+
+    def merge(self, other: PauseStats) -> None:
+        self.count += other.count
+        for mine, theirs in zip(self.players, other.players):
+            mine.merge(theirs)
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "players": [dist.to_dict() for dist in self.players]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PauseStats:
+        pauses = cls(0)
+        pauses.count = data["count"]
+        pauses.players = [Distribution.from_dict(dist) for dist in data["players"]]
+        return pauses
+
+
+@dataclass
+class SimulationResult:
+    """Statistics of a simulation, merged with the saved ones when persist=True.
+
+    Memory does not depend on how many games are played: game lengths and pauses are
+    kept as distributions instead of one entry per game or pause.
+
+    interrupted is set when the run stopped early because of a Ctrl+C, and aborted when it
+    stopped because a card was lost or created (pile_check). Neither is saved to disk.
+    """
+    maos: list[int]
+    cards_prob: CardsProb = field(default_factory=CardsProb)
+    game_turns: Distribution = field(default_factory=lambda: Distribution(GAME_TURNS_BUCKETS))
+    pauses: PauseStats | None = None
+    elapsed: float = 0.0
+    interrupted: bool = False
+    aborted: bool = False
+
+    def __post_init__(self):
+        if self.pauses is None:
+            self.pauses = PauseStats(len(self.maos))
+
+    @property
+    def num_games(self) -> int:
+        return self.game_turns.count
+
+    @property
+    def num_turns(self) -> int:
+        return self.game_turns.total
+
+    @property
+    def mean_turns_per_game(self) -> float:
+        return self.num_turns / self.num_games if self.num_games else 0.0
+
+    @property
+    def mean_pause_cards(self) -> list[float]:
+        """Mean hand size of every player when a pause starts."""
+        return [dist.mean for dist in self.pauses.players]
+
+    @property
+    def pauses_per_game(self) -> float:
+        return self.pauses.count / self.num_games if self.num_games else 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.num_turns / self.elapsed if self.elapsed else 0.0
+
+    def merge(self, other: SimulationResult) -> None:
+        self.maos = [a + b for a, b in zip(self.maos, other.maos)]
+        self.cards_prob.merge(other.cards_prob)
+        self.game_turns.merge(other.game_turns)
+        self.pauses.merge(other.pauses)
+        self.elapsed += other.elapsed
+        self.interrupted = self.interrupted or other.interrupted
+        self.aborted = self.aborted or other.aborted
+
+    def to_dict(self) -> dict:
+        return {
+            "dict_cartes_prob": self.cards_prob.to_dict(),
+            "maos": self.maos,
+            "partides": self.game_turns.to_dict(),
+            "pauses": self.pauses.to_dict(),
+            "temps": self.elapsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, num_players: int) -> SimulationResult:
+        """Build a result from to_dict output, or from the old format with one entry per game and pause."""
+        result = cls(data.get("maos", [0] * num_players), CardsProb.from_dict(data.get("dict_cartes_prob", {})))
+        result.elapsed = data.get("temps", 0.0)
+        if "partides" in data:
+            result.game_turns = Distribution.from_dict(data["partides"])
+        for turns in data.get("iter_partides", []):
+            result.game_turns.add(turns)
+        pauses = data.get("pauses", [])
+        if isinstance(pauses, dict):
+            result.pauses = PauseStats.from_dict(pauses)
+        else:
+            for hand_sizes in pauses:
+                result.pauses.add(hand_sizes)
+        return result
@@ -0,0 +1,123 @@
+"""Read-only view of the game for the strategies that ask for it.
+
+run_simulation keeps one PublicState per simulation, with the public state of the current
+decision, and updates it before every decision (play, jump poll and pause). Every strategy
+with uses_game_view = True gets its own GameView as self.game_view: the public state plus
+the legal moves of its own hand only, so no strategy can look at another hand. The legal
+moves are bitmasks over the 52 card types (bit type_id set), computed from the type_mask
+that the CountedDeck hand keeps, so asking for them costs a couple of integer operations
+instead of a scan of the hand.
+"""
+from __future__ import annotations
+
+from base.classes import NUM_CARD_TYPES, SUITS, CountedDeck, InternedCard
+
+_VALUES = [type_id // len(SUITS) + 1 for type_id in range(NUM_CARD_TYPES)]
+_SUITS = [type_id % len(SUITS) for type_id in range(NUM_CARD_TYPES)]
+# PLAYABLE_MASK[top]: tipus que es poden tirar sobre top (mateix valor o mateix pal)
+PLAYABLE_MASK: list[int] = [
+    sum(1 << t for t in range(NUM_CARD_TYPES) if _VALUES[t] == _VALUES[top] or _SUITS[t] == _SUITS[top])
+    for top in range(NUM_CARD_TYPES)
+]
+
+
+def mask_types(mask: int) -> list[int]:
+    """The type_ids whose bit is set in mask, in increasing order."""
+    types = []
+    while mask:
+        low = mask & -mask
+        types.append(low.bit_length() - 1)
+        mask ^= low
+    return types
+
+
+def mask_cards(mask: int) -> list[InternedCard]:
+    """One InternedCard per type in mask. They compare equal to the cards of the hand."""
+    return [InternedCard.from_type_id(type_id) for type_id in mask_types(mask)]
+
+
+class PublicState:
+    """What every seat can see of the current decision, shared by all the GameViews.
+
+    top_card, current_player, direction and value_7 are the ones the strategies are called
+    with. num_cards_per_player and discard_counts (the discard pile histogram, by type_id)
+    are read-only copies (tuples) of the engine state, made when they are read.
+    """
+    __slots__ = ("_num_cards_per_player", "_discard_pile", "top_card", "current_player", "direction", "value_7", "top_type")
+
+    def __init__(self, num_cards_per_player: list[int]):
+        self._num_cards_per_player = num_cards_per_player
+        self._discard_pile: CountedDeck | None = None
+        self.top_card = None
+        self.current_player = 0
+        self.direction = 1
+        self.value_7 = 0
+        self.top_type = 0
+
+    def update(self, top_card, current_player: int, direction: int, value_7: int, discard_pile: CountedDeck) -> None:
+        """Called by the engine before every decision (discard_pile changes between games and in pauses)."""
+        self._discard_pile = discard_pile
+        self.top_card = top_card
+        self.top_type = top_card.type_id
+        self.current_player = current_player
+        self.direction = direction
+        self.value_7 = value_7
+
+    @property
+    def num_cards_per_player(self) -> tuple[int, ...]:
+        return tuple(self._num_cards_per_player)
+
+    @property
+    def discard_counts(self) -> tuple[int, ...]:
+        # Copia: la llista es la de l'engine, i tambe alimenta unseen_counts() de tots els seients
+        return tuple(self._discard_pile.type_counts) if self._discard_pile is not None else ()
+
+
+class GameView:
+    """The public state of the current decision and the legal moves of one hand."""
+    __slots__ = ("_hand", "public")
+
+    def __init__(self, hand: CountedDeck, public: PublicState):
+        self._hand = hand
+        self.public = public
+
+    @property
+    def top_card(self):
+        return self.public.top_card
+
+    @property
+    def current_player(self) -> int:
+        return self.public.current_player
+
+    @property
+    def direction(self) -> int:
+        return self.public.direction
+
+    @property
+    def value_7(self) -> int:
+        return self.public.value_7
+
+    @property
+    def num_cards_per_player(self) -> tuple[int, ...]:
+        return self.public.num_cards_per_player
+
+    @property
+    def discard_counts(self) -> tuple[int, ...]:
+        return self.public.discard_counts
+
+    def hand_mask(self) -> int:
+        return self._hand.type_mask
+
+    def playable(self) -> int:
+        """Bitmask of the card types in the hand that can be played on the top card."""
+        return self._hand.type_mask & PLAYABLE_MASK[self.public.top_type]
+
+    def jumpable(self) -> int:
+        """Bitmask of the card types in the hand that can jump the top card (only its own type)."""
+        return self._hand.type_mask & (1 << self.public.top_type)
+
+    def can_play(self, card) -> bool:
+        return bool(self.playable() >> card.type_id & 1)
+
+    def can_jump(self, card) -> bool:
+        return bool(self.jumpable() >> card.type_id & 1)
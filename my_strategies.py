@@ -10,6 +10,12 @@ class MyStrategy1(Strategy):
     # - self.num_decks: the number of decks
     # - self.num_cards_per_player: the number of cards each player have
     # - self.cards_not_viewed(): the cards that the player has not seen
+    # - self.unseen_counts(): how many copies of each card (by card.type_id) the player has not seen
+    # - self.rng: your own random.Random, seeded by the simulator (use it instead of `random` to be able to repeat games)
+    # pick_jump_card is only called when you hold a copy of the top card. Set always_poll_jumps = True in your class to be asked every turn.
+    # Set uses_game_view = True to get self.game_view (base/view.py), with the public state and bitmasks of the cards you can play or jump right now.
+    # Override the on_* methods of base/events.py (on_game_start, on_card_played, ...) to be told what happens in the game; the rest cost nothing.
+    # In a pause, you can implement discard_cards(k, ...) to choose all the cards to drop at once; otherwise discard_card is called once per card.
     def pick_jump_card(self, top_card: BaseCard, current_player: int, direction: int, value_7: int) -> BaseCard | None:
         return None
 
@@ -1,6 +1,7 @@
 #!/bin/bash
 rm *.log
 rm *.json
+rm -r tournament_checkpoint
 # Remove pycache recursively from the current directory
 find . -type d -name "__pycache__" -exec rm -fr {} +
 rm Results.txt
\ No newline at end of file
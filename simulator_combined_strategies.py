@@ -1,15 +1,23 @@
+from base.batch import can_run_batch, run_batch_simulation
+from base.cache import ResultCache
+from base.checkpoint import CheckpointStore
 from base.classes import NormalCard
 from base.logger import get_elapsed_logger
+from base.rng import describe_seed
+from base.sequential import SequentialTest
 from base.sim import run_simulation
+from base.stats import SimulationResult
 from all_strategies import strategies
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from base.schedule import MatchupScheduler
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from scipy.stats import chisquare, binomtest
 import numpy as np
 from itertools import combinations
-import json
+import argparse
 import multiprocessing
-import os
+import sys
 import time
+import zlib
 
 
 ITER_PER_SIM = int(1e4)
@@ -17,6 +25,25 @@ MAX_ITER_PER_SIM = int(1.024e7)
 MAX_EXTRA_ROUNDS = 100
 P_VALUE_THRESHOLD = 0.001
 NUM_DECKS = 2
+# Llavor del torneig: None en fa una de nova. Es logueja, i amb la mateixa es repeteix tot el torneig.
+TOURNAMENT_SEED: int | None = None
+# Amb SEQUENTIAL_TESTING cada matchup es una sola simulacio que es para quan el test sequencial
+# (base/sequential.py) ho decideix, mirant els maos cada SEQUENTIAL_CHECK_EVERY partides.
+# Sense, es fan rondes extra amb _check_significance com abans.
+SEQUENTIAL_TESTING = True
+SEQUENTIAL_CHECK_EVERY = 100
+# Les mateixes iteracions que ITER_PER_SIM mes les MAX_EXTRA_ROUNDS rondes extra
+MAX_ITER_PER_MATCHUP = ITER_PER_SIM + sum(min((2 ** r) * ITER_PER_SIM, MAX_ITER_PER_SIM) for r in range(MAX_EXTRA_ROUNDS))
+# Iteracions esperades d'un matchup fins que n'acabi algun (la mediana de Results.txt es ~1.28M)
+EXPECTED_ITERS_PER_MATCHUP = int(1.28e6)
+# On es guarda el progres del torneig per poder-lo continuar amb --resume
+CHECKPOINT_DIR = "tournament_checkpoint"
+# Resultats dels matchups ja jugats, per no tornar-los a jugar si no ha canviat cap de les seves estrategies
+CACHE_DIR = "results_cache"
+# Amb SEQUENTIAL_TESTING, cada quant es guarden els maos acumulats d'un matchup que encara juga
+CHECKPOINT_EVERY_SECONDS = 300
+# Torns per mesurar el cost de cada estrategia (contra FirstStrategy) abans de planificar
+COST_PROBE_ITERS = 200
 
 wins = {strategy.__name__: 0 for strategy in strategies}
 
@@ -54,6 +81,14 @@ def _check_significance(maos: list[int]) -> tuple[bool, dict[str, float]]:
     return is_significant, p_values
 
 
+def _matchup_significance(maos: list[int]) -> tuple[bool, dict[str, float]]:
+    """Same as _check_significance, with the sequential p-values when SEQUENTIAL_TESTING."""
+    if not SEQUENTIAL_TESTING:
+        return _check_significance(maos)
+    test = SequentialTest(P_VALUE_THRESHOLD)
+    return test(maos), test.p_values
+
+
 def build_deck(main_pile, num_decks: int):
     suits = ["hearts", "diamonds", "clubs", "spades"]
     for _ in range(num_decks):
@@ -62,57 +97,178 @@ def build_deck(main_pile, num_decks: int):
                 main_pile.add_card(NormalCard(value, suit))
 
 
+def _matchup_seed(root_seed: np.random.SeedSequence, combo_names: tuple[str, ...]) -> np.random.SeedSequence:
+    """Seed of a matchup: only depends on the tournament seed and the names, not on which other strategies play."""
+    return np.random.SeedSequence(root_seed.entropy, spawn_key=(zlib.crc32(" vs ".join(combo_names).encode()),))
+
+
+def _strategy_map() -> dict[str, type]:
+    from all_strategies import strategies as _all_strategies
+
+    return {s.__name__: s for s in _all_strategies}
+
+
+def _probe_turn_cost(name: str, num_decks: int, seed: np.random.SeedSequence) -> tuple[str, float]:
+    """Worker subprocess: seconds per turn of a short 2 player game of the strategy against FirstStrategy."""
+    strategy_map = _strategy_map()
+    result = run_simulation(
+        n=2,
+        iter_max=COST_PROBE_ITERS,
+        num_decks=num_decks,
+        build_deck=build_deck,
+        strategies_to_call=[strategy_map[name], strategy_map["FirstStrategy"]],
+        log_ignores_wrong_cards=True,
+        random_first_player=True,
+        intern_cards=True,
+        pile_check="game",
+        seed=seed,
+    )
+    return name, result.elapsed / result.num_turns if result.num_turns else 0.0
+
+
+def _new_matchup_state(n: int, num_decks: int) -> dict:
+    return {"num_decks": num_decks, "maos": [0] * n, "extra_rounds": 0, "total_iters": 0, "runs": 0, "done": False}
+
+
 def _run_matchup_worker(
     combo_names: tuple[str, ...],
     iters: int,
     num_decks: int,
-) -> tuple[tuple[str, ...], list[int], int]:
+    seed: np.random.SeedSequence,
+    state: dict | None = None,
+) -> tuple[tuple[str, ...], dict, float]:
     """Worker subprocess: runs one matchup simulation, retrying with extra iterations
     until the result is statistically significant or MAX_EXTRA_ROUNDS is reached.
-    Returns (combo_names, accumulated_maos, extra_rounds_run)."""
-    from all_strategies import strategies as _all_strategies
-
-    strategy_map = {s.__name__: s for s in _all_strategies}
+    With SEQUENTIAL_TESTING it is a simulation of up to MAX_ITER_PER_MATCHUP iterations
+    that stops as soon as the sequential test is significant, cut every
+    CHECKPOINT_EVERY_SECONDS to save the accumulated maos.
+    The state (maos, extra_rounds, total_iters, runs, done) is checkpointed in
+    CHECKPOINT_DIR after every simulation, and a partial state continues where it was.
+    Every simulation gets the next child of seed.
+    Returns (combo_names, state, elapsed); done is False if it was interrupted by a Ctrl+C,
+    or if a simulation was aborted by the pile check (then aborted is True)."""
+    t_start = time.perf_counter()
+    strategy_map = _strategy_map()
     combination = tuple(strategy_map[name] for name in combo_names)
     n = len(combination)
-    json_name = f"simulator_combined_strategies_{n}_{num_decks}_{'_'.join(combo_names)}.json"
-
-    def _run_and_read(iter_count: int) -> list[int]:
-        run_simulation(
-            n=n,
-            iter_max=iter_count,
-            num_decks=num_decks,
-            build_deck=build_deck,
-            strategies_to_call=combination,
-            log_ignores_wrong_cards=True,
-            random_first_player=True,
-            random_position_players=True,
-        )
-        try:
-            with open(json_name, "r") as f:
-                data = json.load(f)
-            return data["maos"]
-        finally:
-            if os.path.exists(json_name):
-                os.remove(json_name)
+    store = CheckpointStore(CHECKPOINT_DIR)
+    state = state or _new_matchup_state(n, num_decks)
+    seed.spawn(state["runs"]) # Les llavors de les simulacions ja fetes no es tornen a fer servir
+
+    def _run_and_read(iter_count: int, stop_condition=None) -> SimulationResult:
+        if can_run_batch(combination):
+            result = run_batch_simulation(
+                n=n,
+                iter_max=iter_count,
+                num_decks=num_decks,
+                build_deck=build_deck,
+                strategies_to_call=combination,
+                random_first_player=True,
+                random_position_players=True,
+                stop_condition=stop_condition,
+                stop_check_every=SEQUENTIAL_CHECK_EVERY,
+                seed=seed.spawn(1)[0],
+            )
+        else:
+            result = run_simulation(
+                n=n,
+                iter_max=iter_count,
+                num_decks=num_decks,
+                build_deck=build_deck,
+                strategies_to_call=combination,
+                log_ignores_wrong_cards=True,
+                random_first_player=True,
+                random_position_players=True,
+                intern_cards=True,
+                pile_check="game",
+                stop_condition=stop_condition,
+                stop_check_every=SEQUENTIAL_CHECK_EVERY,
+                seed=seed.spawn(1)[0],
+            )
+        state["maos"] = [a + e for a, e in zip(state["maos"], result.maos)]
+        state["total_iters"] += result.num_turns
+        state["runs"] += 1
+        return result
+
+    if SEQUENTIAL_TESTING:
+        test = SequentialTest(P_VALUE_THRESHOLD)
+        while not test(state["maos"]) and state["total_iters"] < MAX_ITER_PER_MATCHUP:
+            remaining = MAX_ITER_PER_MATCHUP - state["total_iters"]
+            previous_maos = state["maos"]
+            chunk_start = time.perf_counter()
 
-    accumulated_maos = _run_and_read(iters)
+            def _stop(maos: list[int]) -> bool:
+                if test([a + b for a, b in zip(previous_maos, maos)]):
+                    return True
+                return time.perf_counter() - chunk_start >= CHECKPOINT_EVERY_SECONDS
+
+            result = _run_and_read(remaining, _stop)
+            state["aborted"] = result.aborted
+            store.save(combo_names, state)
+            if result.interrupted or result.aborted:
+                return combo_names, state, time.perf_counter() - t_start
+    else:
+        while True:
+            if state["runs"]:
+                is_significant, p_values = _check_significance(state["maos"])
+                if is_significant or state["extra_rounds"] >= MAX_EXTRA_ROUNDS:
+                    break
+                proposed_iterations = min((2 ** state["extra_rounds"]) * ITER_PER_SIM, MAX_ITER_PER_SIM)
+                p_str = ", ".join(f"{k}: {v:.4f}" for k, v in p_values.items())
+                log.log(25, f"Extra round with {proposed_iterations:.4g} iterations for combination: {' vs '.join(combo_names)}. p-values: {p_str}. Maos: {state['maos']}")
+                state["extra_rounds"] += 1
+            else:
+                proposed_iterations = iters
+            result = _run_and_read(proposed_iterations)
+            state["aborted"] = result.aborted
+            store.save(combo_names, state)
+            if result.interrupted or result.aborted:
+                return combo_names, state, time.perf_counter() - t_start
+
+    state["done"] = True
+    store.save(combo_names, state)
+    return combo_names, state, time.perf_counter() - t_start
 
-    extra_rounds = 0
-    sig_result = _check_significance(accumulated_maos)
-    while not sig_result[0] and extra_rounds < MAX_EXTRA_ROUNDS:
-        proposed_iterations = min((2 ** extra_rounds) * ITER_PER_SIM, MAX_ITER_PER_SIM)
-        p_str = ", ".join(f"{k}: {v:.4f}" for k, v in sig_result[1].items())
-        log.log(25, f"Extra round with {proposed_iterations:.4g} iterations for combination: {' vs '.join(combo_names)}. p-values: {p_str}. Maos: {accumulated_maos}")
-        extra_maos = _run_and_read(proposed_iterations)
-        extra_rounds += 1
-        accumulated_maos = [a + e for a, e in zip(accumulated_maos, extra_maos)]
-        sig_result = _check_significance(accumulated_maos)
 
-    return combo_names, accumulated_maos, extra_rounds
+def _log_matchup(log, combo_names: tuple[str, ...], maos: list[int], extra_rounds: int, total_iters: int) -> None:
+    names = list(combo_names)
+    sorted_indices = np.argsort(maos)
+    max_maos = sorted_indices[-1]
+    worst_maos = sorted_indices[0]
+    wins[names[max_maos]] += 1
+
+    is_significant, p_values = _matchup_significance(maos)
+    p_str = ", ".join(f"{k}: {v:.4f}" for k, v in p_values.items())
+
+    log.log(25, f"Simulated combination: {' vs '.join(names)}")
+    log.log(25, f"Maos: {maos} (total iters: {total_iters:,}, extra rounds: {extra_rounds})")
+    if not is_significant:
+        log.warning(
+            f"Strategy {names[max_maos]} has won the most games with {maos[max_maos]} games "
+            f"after {extra_rounds} extra round(s), BUT IT'S STILL NOT SIGNIFICANTLY DIFFERENT "
+            f"(cap of {MAX_EXTRA_ROUNDS} extra rounds or {MAX_ITER_PER_MATCHUP:,} iters reached). "
+            f"P-values — {p_str}"
+        )
+    else:
+        extra_note = f" (needed {extra_rounds} extra round(s), {total_iters:,} iters total)" if extra_rounds > 0 else ""
+        log.log(25, f"Strategy {names[max_maos]} has won the most games with {maos[max_maos]} games, congratulations!{extra_note}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs every combination of the strategies in all_strategies.py")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"continue the tournament checkpointed in {CHECKPOINT_DIR}/: finished matchups are not run again "
+             "and the unfinished ones continue from their accumulated maos",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"simulate every matchup even if its result is in {CACHE_DIR}/ (the new results are still cached)",
+    )
+    args = parser.parse_args()
+
     t0 = time.perf_counter()
     log = get_elapsed_logger(t0, "Results.txt", results=True, debugging=False, name="simulator_combined_strategies")
 
@@ -122,46 +278,111 @@ if __name__ == "__main__":
             matchups.append(tuple(strategy.__name__ for strategy in combination))
 
     num_workers = multiprocessing.cpu_count() or 8
-    log.log(25, f"Running {len(matchups)} matchups with {num_workers} workers")
+    store = CheckpointStore(CHECKPOINT_DIR)
+    meta = store.load_meta() if args.resume else None
+    if args.resume and meta is None:
+        log.warning(f"Nothing to resume in {CHECKPOINT_DIR}/, starting a new tournament")
+    if meta is None:
+        store.clear()
+        root_seed = np.random.SeedSequence(TOURNAMENT_SEED)
+        store.save_meta({"seed": root_seed.entropy, "num_decks": NUM_DECKS})
+        states = {}
+    else:
+        root_seed = np.random.SeedSequence(meta["seed"])
+        states = {
+            names: state for names, state in store.load_all().items()
+            if names in matchups and state["num_decks"] == NUM_DECKS
+        }
+    log.log(25, f"Tournament seed: {describe_seed(root_seed)}")
+
+    for combo_names in matchups:
+        state = states.get(combo_names)
+        if state is not None and state["done"]:
+            _log_matchup(log, combo_names, state["maos"], state["extra_rounds"], state["total_iters"])
+    to_run = [m for m in matchups if not states.get(m, {}).get("done")]
+    if meta is not None:
+        log.log(25, f"Resuming: {len(matchups) - len(to_run)} matchups already done, {sum(m in states for m in to_run)} partial")
+
+    strategy_map = {s.__name__: s for s in strategies}
+    cache = ResultCache(CACHE_DIR, NUM_DECKS, {
+        "sequential_testing": SEQUENTIAL_TESTING,
+        "p_value_threshold": P_VALUE_THRESHOLD,
+        "sequential_check_every": SEQUENTIAL_CHECK_EVERY,
+        "iter_per_sim": ITER_PER_SIM,
+        "max_iter_per_sim": MAX_ITER_PER_SIM,
+        "max_extra_rounds": MAX_EXTRA_ROUNDS,
+        "max_iter_per_matchup": MAX_ITER_PER_MATCHUP,
+    })
+    if not args.no_cache:
+        cached = {}
+        for combo_names in to_run:
+            entry = cache.get([strategy_map[name] for name in combo_names])
+            if entry is not None:
+                cached[combo_names] = entry
+                _log_matchup(log, combo_names, entry["maos"], entry["extra_rounds"], entry["total_iters"])
+        to_run = [m for m in to_run if m not in cached]
+        log.log(25, f"{len(cached)} matchups reused from {CACHE_DIR}/ (none of their strategies changed)")
+    log.log(25, f"Running {len(to_run)} matchups with {num_workers} workers")
 
     with ProcessPoolExecutor(
         max_workers=num_workers,
         mp_context=multiprocessing.get_context("fork"),
     ) as executor:
-        future_to_names = {
-            executor.submit(
-                _run_matchup_worker,
-                combo_names,
-                ITER_PER_SIM,
-                NUM_DECKS,
-            ): combo_names
-            for combo_names in matchups
-        }
+        # El cost per torn de les estrategies que no van pel motor vectoritzat es mesura primer,
+        # perque els matchups mes cars (p.ex. amb DolfiStrategy) comencin abans que la resta.
+        probed = sorted({name for m in to_run for name in m if not can_run_batch([strategy_map[name]])})
+        probes = [executor.submit(_probe_turn_cost, name, NUM_DECKS, _matchup_seed(root_seed, (name,))) for name in probed]
+        turn_costs = dict(future.result() for future in probes)
+        log.log(25, "Turn costs: " + ", ".join(f"{name}: {cost:.3e}s" for name, cost in turn_costs.items()))
+        scheduler = MatchupScheduler(
+            to_run,
+            {m for m in to_run if can_run_batch([strategy_map[name] for name in m])},
+            EXPECTED_ITERS_PER_MATCHUP,
+            num_workers,
+            turn_costs,
+        )
+
+        running = set()
+
+        def _submit_next() -> None:
+            combo_names = scheduler.start()
+            if combo_names is not None:
+                seed = _matchup_seed(root_seed, combo_names)
+                running.add(executor.submit(
+                    _run_matchup_worker, combo_names, ITER_PER_SIM, NUM_DECKS, seed, states.get(combo_names)
+                ))
 
-        for future in as_completed(future_to_names):
-            combo_names, maos, extra_rounds = future.result()
-            names = list(combo_names)
-            sorted_indices = np.argsort(maos)
-            max_maos = sorted_indices[-1]
-            worst_maos = sorted_indices[0]
-            wins[names[max_maos]] += 1
-
-            is_significant, p_values = _check_significance(maos)
-            total_iters = ITER_PER_SIM + sum(min((2 ** r) * ITER_PER_SIM, MAX_ITER_PER_SIM) for r in range(extra_rounds))
-            p_str = ", ".join(f"{k}: {v:.4f}" for k, v in p_values.items())
-
-            log.log(25, f"Simulated combination: {' vs '.join(names)}")
-            log.log(25, f"Maos: {maos} (total iters: {total_iters:,}, extra rounds: {extra_rounds})")
-            if not is_significant:
-                log.warning(
-                    f"Strategy {names[max_maos]} has won the most games with {maos[max_maos]} games "
-                    f"after {extra_rounds} extra round(s), BUT IT'S STILL NOT SIGNIFICANTLY DIFFERENT "
-                    f"(cap of {MAX_EXTRA_ROUNDS} extra rounds reached). "
-                    f"P-values — {p_str}"
+        for _ in range(num_workers):
+            _submit_next()
+
+        try:
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    combo_names, state, elapsed = future.result()
+                    if state.get("aborted"):
+                        # Algu ha perdut o creat cartes: no es guarda a la cache i es torna a jugar amb --resume
+                        log.error(f"Matchup {' vs '.join(combo_names)} aborted by the pile check after {state['total_iters']:,} iters")
+                        scheduler.finish(combo_names, 0, elapsed)
+                        _submit_next()
+                        continue
+                    if not state["done"]:
+                        raise KeyboardInterrupt # El worker ha rebut el Ctrl+C
+                    scheduler.finish(combo_names, state["total_iters"], elapsed)
+                    cache.put([strategy_map[name] for name in combo_names], state["maos"], state["extra_rounds"], state["total_iters"])
+                    _submit_next()
+                    _log_matchup(log, combo_names, state["maos"], state["extra_rounds"], state["total_iters"])
+                log.log(
+                    25,
+                    f"{len(scheduler.pending) + len(scheduler.running)} matchups left, "
+                    f"ETA {scheduler.eta() / 3600:.2f} h",
                 )
-            else:
-                extra_note = f" (needed {extra_rounds} extra round(s), {total_iters:,} iters total)" if extra_rounds > 0 else ""
-                log.log(25, f"Strategy {names[max_maos]} has won the most games with {maos[max_maos]} games, congratulations!{extra_note}")
+        except KeyboardInterrupt:
+            log.warning("Interrupted. Waiting for the running matchups to checkpoint their current game...")
+            executor.shutdown(wait=True, cancel_futures=True)
+            log.warning(f"Tournament checkpointed in {CHECKPOINT_DIR}/, run again with --resume to continue it")
+            sys.exit(130)
+
     log.log(25, "FINAL RESULTS:")
     for strategy, win_count in sorted(wins.items(), key=lambda x: x[1], reverse=True):
         log.log(25, f"{strategy}: {win_count}")
\ No newline at end of file
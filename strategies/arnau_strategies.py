@@ -1,6 +1,6 @@
 from collections import Counter
 
-from base.classes import BaseCard, Strategy
+from base.classes import NUM_VALUES, SUITS, BaseCard, Strategy
 
 class ArnauStrategy(Strategy):
     """
@@ -14,9 +14,9 @@ class ArnauStrategy(Strategy):
 
     def _get_unseen_counts(self):
         """Helper to count suits and values of cards not seen by the player."""
-        unseen_cards = self.cards_not_viewed()
-        unseen_suit_counts = Counter(c.suit for c in unseen_cards.cards)
-        unseen_value_counts = Counter(c.value for c in unseen_cards.cards)
+        unseen = self.unseen_counts()
+        unseen_suit_counts = Counter({suit: sum(unseen[i::len(SUITS)]) for i, suit in enumerate(SUITS)})
+        unseen_value_counts = Counter({value: sum(unseen[(value - 1) * len(SUITS):value * len(SUITS)]) for value in range(1, NUM_VALUES + 1)})
         return unseen_suit_counts, unseen_value_counts
 
     def pick_play_card(
@@ -45,9 +45,8 @@ class ArnauStrategy(Strategy):
             ]
 
             if value_matches:
-                hand_suit_counts = Counter(c.suit for c in self.player.cards)
                 best_card = max(
-                    value_matches, key=lambda card: hand_suit_counts[card.suit]
+                    value_matches, key=lambda card: self.player.count_suit(card.suit)
                 )
                 return best_card
 
@@ -104,14 +103,11 @@ class ArnauStrategy(Strategy):
         if sevens:
             return sevens[0]
 
-        hand_suit_counts = Counter(c.suit for c in self.player.cards)
-        hand_value_counts = Counter(c.value for c in self.player.cards)
-
         least_flexible_card = None
         min_score = float("inf")
 
         for card in self.player.cards:
-            score = hand_suit_counts[card.suit] + hand_value_counts[card.value] - 2
+            score = self.player.count_suit(card.suit) + self.player.count_value(card.value) - 2
             if score < min_score:
                 min_score = score
                 least_flexible_card = card
@@ -59,14 +59,11 @@ class FElixSuper1(Strategy):
         return playable_cards[0][0]
 
     def discard_card(self, top_card: BaseCard, current_player: int, direction: int, value_7: int) -> BaseCard:
-        playable_cards: list[BaseCard] = [[card, 0, 0] for card in self.player.cards]
-        for i, cards in enumerate(playable_cards):
-            card1, _, _ = cards
-            for card2 in self.player.cards:
-                if card1 == card2:
-                    playable_cards[i][2] += 1
-                if card1.can_be_played(card2):
-                    playable_cards[i][1] += 1
+        # [card, cartes de la ma on es pot jugar (mateix pal o valor), copies de la carta]
+        playable_cards: list[BaseCard] = []
+        for card in self.player.cards:
+            copies = self.player.count(card)
+            playable_cards.append([card, self.player.count_suit(card.suit) + self.player.count_value(card.value) - copies, copies])
         
         playable_cards.sort(key = lambda x: (x[2], x[1]), reverse=True)
         return playable_cards.pop()[0]
@@ -1,94 +1,121 @@
 from __future__ import annotations
-from random import choice, shuffle
-from collections import defaultdict
+import os
+from collections import OrderedDict
 import numpy as np
-from base.classes import BaseCard, Strategy
-
-_NO_ACTION = object()
+from base.classes import BaseCard, CountedDeck, Strategy
+from base.view import mask_types
 
 
 def _card_key(card):
-    return (card.value, card.suit) if card is not None else None
+    return (card.value, card.suit)
 
 
 def _unique_cards(cards):
     seen = set()
     result = []
     for c in cards:
-        k = (c.value, c.suit)
+        k = _card_key(c)
         if k not in seen:
             seen.add(k)
             result.append(c)
     return result
 
 
-def _simulate_game(start_player, my_index, num_players, hands, deck, top_card, direction, value_7, first_card=_NO_ACTION, max_turns=130):
-    """Simulate a game with random rollout policy. Returns True if my_index wins.
-
-    first_card controls the opening action before the random loop:
-      _NO_ACTION: start directly from start_player (no pre-action)
-      None:       draw a card for my_index, then advance
-      <card>:     play that card for my_index, then advance
+NUM_CARD_TYPES = 52
+FIRST_NONE = -1 # Cap accio abans del bucle aleatori
+FIRST_DRAW = NUM_CARD_TYPES # Robar com a primera accio
+_TYPE_VALUE = np.arange(NUM_CARD_TYPES) // 4 + 1
+_TYPE_SUIT = np.arange(NUM_CARD_TYPES) % 4
+# _PLAYABLE[top]: els 16 tipus de carta que es poden tirar sobre top (13 del pal i 3 del valor)
+_PLAYABLE = np.array([
+    np.flatnonzero((_TYPE_VALUE == _TYPE_VALUE[top]) | (_TYPE_SUIT == _TYPE_SUIT[top]))
+    for top in range(NUM_CARD_TYPES)
+])
+
+
+def _simulate_games(hands, decks, deck_len, top, direction, value_7, current, my_index, first, rng, max_turns=130):
+    """Simulate many games at once with the random rollout policy, in lockstep. Returns which ones my_index wins.
+
+    Every array has one row per rollout and is modified in place: hands holds the card
+    counts (players x 52 card types), the deck of a rollout is drawn in order from
+    decks[r, :deck_len[r]], and top, direction, value_7 and current are the game state.
+    The playout policy and the 7 and 10 rules are the ones of the real game without jumps
+    or pauses: a random playable card (every copy equally likely), or draw if there is
+    none. rng is a numpy Generator. A game that is not won in max_turns is lost, and so is
+    one where a whole round goes by without anyone playing or drawing (it never ends).
+
+    first controls the opening action of my_index before the random loop:
+      FIRST_NONE: start directly from current (no pre-action)
+      FIRST_DRAW: draw a card for my_index, then advance
+      <type id>:  play that card for my_index, then advance
     """
-    current_player = start_player
-    current_top = top_card
-    cur_dir = direction
-    cur_v7 = value_7
-
-    if first_card is not _NO_ACTION:
-        if first_card is not None:
-            hands[my_index].remove(first_card)
-            if not hands[my_index]:
-                return True
-            if first_card.value == 10:
-                cur_dir *= -1
-            if first_card.value == 7:
-                cur_v7 += 1
-                for _ in range(cur_v7):
-                    if deck:
-                        hands[my_index].append(deck.pop())
-            else:
-                cur_v7 = 0
-            current_top = first_card
-        else:
-            if deck:
-                hands[my_index].append(deck.pop())
-        current_player = (my_index + cur_dir) % num_players
-
+    num_rollouts, num_players = hands.shape[:2]
+    # Una fila per (rollout, jugador): fila = r * num_players + p
+    counts = hands.reshape(num_rollouts * num_players, NUM_CARD_TYPES)
+    sizes = counts.sum(axis=1)
+    drawn = np.zeros(num_rollouts, dtype=np.int64)
+    winner = np.full(num_rollouts, -1)
+
+    def draw(r, row):
+        left = drawn[r] < deck_len[r]
+        r, row = r[left], row[left]
+        counts[row, decks[r, drawn[r]]] += 1
+        sizes[row] += 1
+        drawn[r] += 1
+        return left
+
+    def play(r, row, cards):
+        counts[row, cards] -= 1
+        sizes[row] -= 1
+        won = sizes[row] == 0
+        winner[r[won]] = row[won] % num_players
+        values = _TYPE_VALUE[cards]
+        direction[r[values == 10]] *= -1
+        seven = values == 7
+        value_7[r[~seven]] = 0
+        if seven.any():
+            value_7[r[seven]] += 1
+            seven &= ~won
+            r7, row7 = r[seven], row[seven]
+            for k in range(int(value_7[r7].max(initial=0))):
+                more = value_7[r7] > k
+                draw(r7[more], row7[more])
+        top[r] = cards
+
+    opening = np.flatnonzero(first != FIRST_NONE)
+    my_rows = opening * num_players + my_index
+    drawing = first[opening] == FIRST_DRAW
+    draw(opening[drawing], my_rows[drawing])
+    play(opening[~drawing], my_rows[~drawing], first[opening[~drawing]])
+    current[opening] = (my_index + direction[opening]) % num_players
+    # Algu pot començar sense cartes: guanya el primer
+    empty = sizes.reshape(num_rollouts, num_players) == 0
+    starts_empty = (winner < 0) & empty.any(axis=1)
+    winner[starts_empty] = np.argmax(empty[starts_empty], axis=1)
+
+    # Torns seguits sense cap canvi (ningu tira ni roba): a la volta sencera ja no acabara mai
+    passes = np.zeros(num_rollouts, dtype=np.int64)
+    active = np.flatnonzero(winner < 0)
     for _ in range(max_turns):
-        for p in range(num_players):
-            if not hands[p]:
-                return p == my_index
-
-        hand = hands[current_player]
-        playable = [c for c in hand
-                     if c.value == current_top.value or c.suit == current_top.suit]
-
-        if not playable:
-            if deck:
-                hands[current_player].append(deck.pop())
-            current_player = (current_player + cur_dir) % num_players
-            continue
-
-        card = choice(playable)
-        hand.remove(card)
-
-        if not hand:
-            return current_player == my_index
-
-        if card.value == 10:
-            cur_dir *= -1
-        if card.value == 7:
-            cur_v7 += 1
-            for _ in range(cur_v7):
-                if deck:
-                    hands[current_player].append(deck.pop())
-        else:
-            cur_v7 = 0
-        current_top = card
-
-        current_player = (current_player + cur_dir) % num_players
-    return False
+        if not len(active):
+            break
+        rows = active * num_players + current[active]
+        playable = _PLAYABLE[top[active]]
+        cumulative = np.cumsum(counts[rows[:, None], playable], axis=1)
+        total = cumulative[:, -1]
+        stuck = total == 0
+        stuck_active = active[stuck]
+        drew = draw(stuck_active, rows[stuck])
+        passes[stuck_active[~drew]] += 1
+        passes[stuck_active[drew]] = 0
+        playing = ~stuck
+        passes[active[playing]] = 0
+        pick = rng.integers(total[playing])
+        chosen = (cumulative[playing] <= pick[:, None]).sum(axis=1)
+        play(active[playing], rows[playing], playable[playing, chosen])
+        current[active] = (current[active] + direction[active]) % num_players
+        active = active[(winner[active] < 0) & (passes[active] < num_players)]
+    return winner == my_index
 
 
 MAX_PLAYERS = 15 # Hoping que no hi hagui més, si no em mato lol 
@@ -99,568 +126,43 @@ ACTION_NO_JUMP = 52
 
 SUIT_TO_ID = {"hearts": 0, "diamonds": 1, "clubs": 2, "spades": 3}
 ID_TO_SUIT = {v: k for k, v in SUIT_TO_ID.items()}
-
-MODEL = {
-    "trunk.0.weight": [
-        [-0.894522, -0.021298, -0.223286, -0.704297, 0.415905, -0.353229, -0.344060, 0.611336, 0.328819, -0.056299, 0.528203, -0.620100, -0.457506, 0.098871, -0.115370, 0.347034, -0.589044, -0.001631, -1.109821, -0.086028, -1.154174, -0.244826, -1.520883, 0.114222, -1.198695, -0.912678, -0.194571, 0.139469, -0.499659, 0.232844, 0.323959, 0.244828, -0.938546, -1.060808, 0.506609, -0.480515, -0.137243, -1.272684, -0.882145, -0.438174, -0.081354, 0.130494, -0.657688, -0.541129, 0.458393, 0.644794, -0.274950, 0.442522, -0.351415, 0.070783, 0.071923, 0.583577, -0.007110, 0.397774, -0.726694, 0.561743, -0.415670, 0.042904, 0.218932, 0.599856, -0.234319, -0.023206, 0.114100, -0.569271, 0.479020, -0.391701, -0.696809, 0.327317, -0.338683, 0.160305, -0.171343, -0.002156, -0.113461, -0.658540, -0.683746, -0.456322, -1.059812, -0.260609, 0.568066, 0.162902, 0.090430, -0.168092, -0.632605, -0.578077, 0.281274, -0.151963, 0.471258, -1.229324, 0.664135, -0.907157, 0.569385, -0.112697, -0.144544, -0.116931, 0.597471, -0.004537, -0.468524, -0.856942, 0.070222, -0.883032, 0.164245, -0.680136, -0.604364, -0.566369, -0.735270, -0.083611, 0.906163, -0.618244, -0.240356, -0.978976, 0.206541, -0.183111, -0.055778, -0.501631, -0.008452, -0.601530, -0.188563, -0.595747, -0.296022, 0.482798, -1.251248, -0.199223, -0.144243, -0.091218, -0.552460, -0.314507, 0.160184, 0.313101, -0.058548, -0.233036, -0.615496, -0.078129, -0.426283, -0.582050, -0.468975, 0.229779, -0.423556, -0.540252, -1.176143, -0.137235]
-,        [-0.128243, 0.467168, 0.274519, -0.620378, -0.554842, -0.272898, 0.940398, 0.031766, -0.184532, -0.314488, 0.072989, -0.339814, -0.362213, -5.639484, 1.571548, -5.214928, -4.972005, -0.286582, 0.226283, -0.926816, -1.071186, -0.436536, 0.960679, -0.866705, -0.370198, -0.688172, -0.173957, -0.421183, -0.963476, -1.195346, -0.153645, -0.991696, -1.476296, -1.207893, 0.798535, -0.943169, -0.676350, -1.382812, 0.061830, -1.200665, -0.501324, -3.757445, 2.462821, -4.591501, -4.051224, -1.092806, -0.190453, -1.502413, -0.656677, -0.637322, 0.630173, -1.016220, -0.291716, -0.583159, 0.058851, -0.429688, -0.284407, -0.868889, 0.388356, -1.574939, -1.195208, -0.376355, -0.163398, -0.423844, -0.551531, -1.099961, -0.558551, -2.028230, -1.150753, -0.157333, 0.571944, -0.065546, 0.054093, -0.107704, 0.307473, -0.040179, -0.211905, -0.446380, 0.560907, -0.190404, -0.078670, -0.280247, 0.345023, -0.531950, 0.118038, -0.028915, 0.251392, 0.095290, 0.243301, 0.134190, 0.308851, -0.089607, -0.125434, -0.005239, 0.770912, 0.032648, 0.050010, 0.010986, 0.208623, -0.082762, 0.073288, 0.116748, 0.224326, -0.306086, -0.015589, -0.144638, 0.617810, 0.001042, -0.148449, 0.174980, 0.332289, -0.212502, -0.368936, -0.023099, 0.611497, -0.040138, -0.140878, -0.176312, 0.517329, -0.082141, -0.197996, 0.285579, 0.095824, 0.126994, -0.055192, 0.080274, 0.024781, -0.232260, -0.193007, -0.422639, -0.134279, -0.054248, -0.189783, 0.225352, 0.073753, -0.040048, -0.381837, 0.985844, 0.471317, -0.507692]
-,        [0.225797, 0.385108, -0.141991, 0.216483, -0.014852, -0.198155, -0.031498, -0.124028, 0.471565, 0.088793, 0.116738, -0.252149, 0.079547, 0.624926, -0.114796, 0.120966, 0.254430, -0.223894, -1.159697, -1.737995, -0.319860, -0.204814, -1.382846, -0.682688, -0.465399, -0.179072, -0.364213, -1.065117, -0.036828, -0.295795, -0.354929, -0.279432, -0.371768, 0.326722, -0.078729, -0.994445, -0.466558, -0.416444, -0.483601, -0.600163, -0.653465, -0.182745, -1.404337, -0.734787, -0.816289, -0.278206, 0.209756, -0.256732, -0.092887, -0.393881, 0.054025, -0.672873, -0.448252, -0.020005, -0.045003, -0.343489, -0.157479, -0.239480, -1.064680, -0.238802, 0.073725, 0.200435, -0.559383, -0.786498, -0.134773, -0.058753, -0.647304, 0.029772, -0.173020, 0.066999, 0.192055, 0.095012, -0.047491, 0.373096, -0.042108, -0.377825, 0.131617, 0.085703, 0.031328, -0.247074, 0.655343, 0.550045, 0.217837, -0.134548, -0.010771, -0.010752, -0.054795, -0.189601, 0.029680, 0.365735, 0.129597, 0.218256, 0.057304, -0.057098, -0.057915, 0.160765, -0.243990, 0.218547, -0.134496, 0.041815, 0.387980, 0.141784, -0.487963, 0.154231, 0.877703, 0.153151, -0.126699, -0.161901, 0.080443, 0.085226, -0.287802, -0.327637, -0.443029, -0.087970, 0.320905, -0.172891, 0.110299, -0.148335, -0.026737, -0.334490, 0.223292, 0.353974, 0.255960, 0.236911, 0.840674, -7.393668, -3.664218, -1.463386, -0.437035, -0.458624, -0.313905, -0.206217, -0.164344, -0.198578, 0.004684, 0.106923, 0.248030, 0.080846, -0.775581, 0.241927]
-,        [-0.938844, 0.121800, -0.616020, -0.027924, 0.392658, -0.134681, 0.451024, 0.612995, -0.167693, 0.295188, -0.507926, 0.192053, -0.482000, -0.365198, -0.540820, -0.413570, 0.356198, -0.212508, 0.500528, 0.884636, -0.131304, 0.098653, 0.419379, 0.103230, -0.529433, -0.598799, -0.280293, -0.140622, 0.179370, -1.000860, 0.333397, 0.252032, 0.240708, 0.442579, -0.665551, 0.878561, -0.476861, 0.259816, 0.036955, 0.030176, -0.699439, -0.356884, -0.424044, 0.357345, -1.664086, 0.427840, 0.208262, 0.286474, 0.385751, 0.071968, 0.456803, -0.112686, 0.685206, -0.564301, 0.390588, -0.345523, -1.076114, 0.225139, 0.769299, 1.033080, -0.403060, -0.299663, -0.328273, -0.309822, -0.391609, -0.598991, 0.346814, -0.251136, 0.413783, 0.101407, -0.742059, -0.998751, 0.355530, 0.222403, -0.499219, -0.469755, -0.545050, 0.631188, -0.169760, -0.326791, -0.514793, -0.307029, -0.755789, -0.056208, -0.705987, 0.322174, -0.512209, -0.528808, -0.897318, 0.632521, 0.213892, -0.223816, 0.147032, 0.387118, -0.413227, -0.329604, 0.106164, -0.282612, 0.194175, 0.035403, -0.432016, -0.662314, -1.924928, -0.934003, -0.615690, -0.339351, -0.672440, -0.435266, 0.125550, -0.082854, 0.116836, -0.964175, -0.436399, -0.174265, -0.175718, -0.103893, -0.112130, -0.272729, -0.934700, 0.072831, -0.327741, -0.467732, -0.236223, -0.944008, -0.297442, -0.039307, 0.143170, -0.120424, -0.093682, -0.581194, 0.188487, 0.162220, 0.155432, -0.179313, -0.892943, -0.190190, -0.773778, 0.600944, -1.122862, -0.279567]
-,        [-0.892366, 0.085555, -0.435185, -0.768601, -0.507303, 0.706244, -0.128319, 0.438354, -0.548802, -0.650536, 1.667652, -0.179952, -0.820916, 0.532758, -0.733043, -0.343190, -0.430501, 0.482264, -0.446963, 0.190348, -0.266882, -0.664379, 0.178593, 0.547722, -0.343433, -1.141376, -0.370642, 0.729179, 0.015692, 0.959708, 0.312301, 0.307756, 0.238092, 0.557372, -0.051303, -0.208753, -0.633593, 0.700520, -0.833107, -0.082163, 0.424184, -1.266153, -0.333767, 0.311227, -0.216652, -0.464363, -0.749920, -0.291572, -0.643325, -1.398145, -0.276914, -0.437430, -0.408119, -0.596258, 0.052851, 0.120364, 0.247738, -0.270829, -0.055957, 1.240309, 0.706698, -0.862107, -0.580079, 0.318812, -0.891652, 0.529458, 0.781557, -0.079225, 0.142923, 0.400121, 0.559208, -0.235820, -0.148516, 0.112514, -0.077560, -0.728516, 0.275156, -0.347647, -0.145776, -0.016479, 0.352206, -0.316069, -1.258548, -0.304453, 0.116865, -0.266644, -0.345773, -0.481531, -0.164894, -0.371524, 0.109711, -0.324623, -0.143337, -0.670496, 0.318872, -1.189359, 0.457229, -0.039286, 0.173480, 0.254959, 0.552950, 0.053318, -0.944165, -0.081367, -0.277307, 0.112971, 0.049863, -0.545980, 0.963620, -0.143957, -0.572805, -0.799402, -0.702631, 0.100742, 0.332642, -0.489493, 0.028943, -0.165033, -0.769683, -0.554253, 0.225297, 0.231820, -0.161505, 0.236347, -0.051567, -0.239747, -0.117254, -0.014114, 0.557778, 0.072379, 0.300358, 0.320056, 0.241694, 0.051728, 0.040145, 0.957400, -0.187642, 0.174026, -1.182580, -0.392965]
-,        [-0.088320, 0.092531, 0.248720, 0.357784, 0.452774, 0.285404, 0.084878, 0.523635, 0.920941, 0.110979, 0.565994, 1.023174, 0.357965, 0.925411, 1.057510, 0.850144, 0.310780, -4.309641, -3.884177, -1.578418, -1.702899, -3.526584, -2.979915, -0.626385, 0.156435, -3.313211, -2.118168, -0.983777, -0.710368, -2.886066, -2.326020, -0.970322, -0.358159, -2.428549, -1.512897, 0.256272, 0.704465, -4.622022, -2.984571, -0.698791, -0.557426, -6.316422, -5.224970, -1.591299, -2.771438, -1.985086, -0.529794, 1.254844, 0.765231, 0.033273, 0.566422, 1.204422, 1.331002, -2.888670, -2.428551, -0.088790, 0.144559, -0.572450, 0.072662, 0.925907, 1.133358, -0.089713, 0.163589, 1.160861, 1.050072, -1.397775, -0.523157, 0.496571, 1.109076, 0.187284, 0.094118, 0.229858, -0.051238, 0.016250, 0.034430, -0.174551, -0.081353, 0.140704, -0.061908, 0.092600, 0.075175, 0.001777, -0.225517, -0.051316, -0.046626, -0.151490, -0.080680, -0.171033, -0.120074, 0.279367, 0.009250, -0.132744, 0.146468, 0.018498, -0.007826, 0.312723, 0.147489, -0.063626, 0.031795, -0.194407, -0.082164, 0.219911, -0.132425, -0.059044, -0.081583, -0.056467, 0.153129, -0.110831, -0.069708, 0.350191, -0.155032, 0.100929, -0.141494, -0.050746, -0.073502, -0.172119, -0.125644, 0.188362, -0.001031, 0.396090, -0.205040, -0.970249, 0.005128, 0.092178, 0.027985, -0.014342, 0.092625, 0.150226, 0.052325, 0.209486, 0.076965, -0.117823, 0.084243, -0.020207, 0.033958, -0.018834, -0.088828, -0.396218, -1.149773, 0.024919]
-,        [0.231335, -0.024644, -0.045788, 0.460025, 0.519423, -0.120857, 0.041933, -0.414455, -0.115238, 0.615669, 0.073097, 0.400990, -0.287481, -0.811812, -0.067842, 1.686511, -0.832673, -0.215392, 0.129329, 0.595427, -0.182044, 0.606838, 0.114248, 0.022266, -0.544924, 0.426643, -0.152645, 0.019210, -0.550010, 0.383288, 0.418187, 0.705348, -0.343953, 0.598657, -0.672150, -0.005053, -0.178760, -0.288150, -0.643496, 0.390859, -0.944446, -3.248104, -2.207785, 1.001994, -2.820284, 0.412710, -0.164942, -0.316840, -0.126006, -0.437835, -0.211229, 0.207359, -0.384074, 0.234224, -0.126997, -0.609146, 0.046216, -0.119004, -0.374142, -0.052669, -0.379764, 0.058806, 0.122314, -0.600713, -0.272101, -0.163926, -1.164170, -0.480774, -0.631815, 0.000900, 0.080397, 0.469971, 0.572070, -0.546564, -0.108702, 0.324925, 0.282284, -0.170036, 0.020660, -0.100997, -0.004572, -0.467686, -0.697746, 0.233278, -0.131742, -0.383265, 0.155536, -0.060361, -0.340594, -0.575291, -0.177599, 0.457030, -0.155192, -0.491446, -0.160000, 0.817810, -0.410136, -0.599747, -0.088879, 0.543288, -0.093757, 0.059142, 0.071885, 0.412247, 0.178706, -0.172774, 0.056539, 1.190134, -0.165959, 0.141398, 0.385202, 1.038561, 0.302678, 0.010405, -0.112599, 0.592171, -0.194341, -0.151896, 0.120575, 0.415357, 0.024815, -0.131918, -0.069572, -0.008122, 0.052101, -0.007967, 0.181247, 0.303602, -0.769670, -3.354973, -3.311194, -1.903713, -0.919450, -0.374438, -0.480301, -0.132239, 0.161678, -0.322266, -2.068217, -0.747168]
-,        [0.021730, 0.163249, 0.396944, 0.541090, 0.259030, 0.281954, 0.888177, 0.122122, -0.158617, 0.431374, 0.206982, 0.634791, -0.119654, 0.647580, -1.533912, 0.256787, 1.514339, 0.363674, -5.083477, -0.547829, 0.249916, -0.135351, -5.574805, -0.972302, -0.615503, 0.574061, -3.034841, 0.017574, 0.826935, -0.131731, -4.304608, 0.093499, 0.399778, 0.404856, -4.268610, -0.890806, 0.280629, 0.156243, -3.387865, -0.183479, 0.552679, -2.090735, -7.375618, -3.587656, -0.754723, 0.459698, -3.843336, -0.577497, 0.260730, 0.257002, -4.416172, 0.311856, 0.435810, 0.906712, -1.870846, 0.322674, 1.134528, 0.228372, -4.694106, -1.122448, 0.156554, 0.372806, -2.158206, 0.141677, 0.812799, 0.164079, -3.746855, -0.020772, 0.423305, -0.078990, -0.142055, -0.445255, 0.044270, 0.050240, 0.010336, -0.030257, 0.284972, 0.004186, 0.159055, -0.283357, 0.177347, 0.066846, 0.219411, -0.109716, -0.026952, 0.131412, 0.008496, -0.014860, 0.045518, 0.083262, 0.149882, -0.334483, 0.173160, 0.031122, 0.095899, -0.082255, -0.218613, 0.069156, 0.102665, -0.004086, -0.027885, 0.038967, -0.118482, -0.019560, 0.070973, 0.051391, -0.129022, -0.072757, 0.063075, -0.208366, 0.230386, -0.012342, 0.268030, 0.062057, -0.263855, -0.108123, 0.314886, 0.110694, 0.352020, 0.047928, 0.126989, -0.610493, -0.003519, 0.087928, -0.016457, 0.105552, 0.096361, 0.067926, 0.135399, 0.039346, -0.100873, 0.172949, 0.055385, 0.356316, 0.047889, 0.214129, -0.072281, 0.548892, 0.642957, -0.715267]
-,        [-0.386394, 0.210368, 0.650702, -0.122105, 0.004215, -0.751470, -0.267482, -0.319337, 0.667064, -0.910641, 0.457400, -0.468302, -0.414475, 0.995623, -0.954285, -0.781844, 0.109476, 0.879281, -1.105942, -0.791680, 0.621628, -0.555218, -0.755605, 0.059129, -0.319213, 0.082995, 0.127844, -0.385509, 0.479177, 1.093466, -0.041568, 0.571852, -0.052525, -0.597466, -0.190698, 0.567673, -0.781919, 0.221259, -0.161582, -0.898098, 0.238622, 0.775558, -0.353614, 0.269776, 0.653661, 0.561568, -0.431237, -0.785063, -0.171858, -0.167106, -0.520871, 0.294548, -0.069546, -0.254300, 0.403232, -0.693049, -0.108999, 0.216150, -0.211718, 0.073816, -0.169561, -0.620473, -0.651992, -0.163763, -0.669001, 0.215390, -0.110178, -0.443642, 0.528112, -0.141169, 0.190550, 0.203081, 0.724313, 0.140222, -0.591109, 0.253357, -0.635199, -0.059063, 0.276855, -0.336823, -0.377428, -0.250942, 0.426481, -0.352897, -0.265950, 0.932837, 0.342711, -0.842132, 0.451682, -0.604047, -1.142194, -1.705619, -0.713422, -0.678107, -0.462968, 0.099699, -0.259601, -0.423479, -0.152914, -0.368180, -0.630964, -0.038817, -0.345615, 0.210578, -0.005298, -0.513802, -0.257400, -0.472021, -0.810690, 0.489508, -0.435006, -0.457392, 0.085571, -0.324874, 0.784893, 0.544416, 0.057375, -0.274600, 0.540015, -1.109895, -0.896624, 0.074151, -0.186713, -0.492451, -0.237290, -0.568317, -0.336554, 0.129210, 0.581090, -0.284887, -0.006733, 0.331359, 0.123240, 0.438022, 0.213885, -0.104870, 0.629536, -0.299942, -1.646172, 0.138672]
-,        [-0.001824, 0.297656, -0.197800, -0.019912, -0.515276, 0.731374, -0.481561, -0.826244, 0.038779, 0.057919, 0.300090, -0.054139, 1.087554, 0.113010, -0.286829, -0.408648, 0.324772, 0.875581, -0.241146, 0.603379, 0.449836, -0.065336, -0.506822, -0.122037, -0.010782, 0.460096, 0.122702, -0.199062, -0.108728, -0.244057, -0.470782, -0.229368, -0.093827, -1.078604, -1.053572, -0.489326, -0.701764, -1.220889, 1.202828, 0.210243, 0.090938, 0.128874, -0.682744, -1.909893, 0.555760, -0.083711, -0.030327, -0.342344, -0.143484, 0.925801, -0.455691, -0.652950, 0.299332, 0.130378, -0.782339, -0.205459, -0.255940, 1.205533, 0.818203, 0.596597, 1.213892, 0.004577, -1.149315, -0.079700, -0.690387, -1.187998, -0.636337, -1.072793, -0.307538, -0.515442, -0.487141, -0.712211, -0.496934, -0.949545, 0.007060, -0.138493, -0.340522, -0.430316, -0.100294, -0.085856, -0.255042, -0.556991, -0.665671, -0.067137, -0.356621, -0.253757, -0.248363, 0.055022, 0.026799, -0.180144, -0.620642, 0.113177, -0.465240, -0.111256, 0.406685, -1.550313, -0.573731, -0.231796, -0.272883, -0.149187, 0.063875, 0.511774, -0.238499, 0.002459, -0.442815, -0.221107, -0.131392, -0.277701, -0.404892, -0.463813, 0.298567, -0.859285, 0.036286, -0.979340, 0.135080, -0.964828, 0.074044, 0.170328, -0.449138, -0.294745, -0.107435, -0.147985, 0.170997, 0.266368, 0.408052, -1.134980, -1.810740, -1.184210, -1.099030, -0.631182, -0.655543, -0.413665, -0.407454, -0.178982, -0.042195, -0.055804, 0.031073, 0.064351, -2.508752, -0.077693]
-,        [0.412539, -0.107867, 0.121498, -0.174800, -0.238126, 0.159761, 0.415173, 0.106692, -0.420122, -0.214214, 0.203877, -0.402331, 0.090828, -0.111367, 0.598196, 0.558573, -0.555148, 1.195902, -0.948498, -1.210837, -2.284320, 1.167015, -0.595199, -0.159823, -0.722581, 1.231441, -1.166359, -0.898456, -0.931548, 0.984737, -1.116149, -1.206325, -1.720770, 0.511280, -1.965775, -1.468255, -2.726220, 0.360910, -1.794079, -1.764616, -4.180921, 0.487879, -1.919152, -2.022156, -2.360121, 0.850556, -0.602278, -0.802241, -1.773197, -0.020281, -1.967232, -1.065760, -3.044658, -0.214189, -2.366104, -1.709020, -2.514189, 1.554104, -0.478302, -0.254134, -0.688772, 0.555013, -1.617675, -1.220264, -2.213018, 0.742486, -2.221808, -1.875759, -2.204046, -0.108936, -0.289563, -0.398966, 0.171944, -0.350879, -0.044670, -0.537771, -0.087053, -0.628660, -0.307944, -0.266003, 0.019704, -0.006222, 0.116043, -0.016698, -0.334475, -0.686032, -0.084582, -0.443619, -0.033332, 0.017071, -0.375827, 0.356082, -0.188576, -0.733215, -1.105282, -0.643358, 0.018998, -0.702078, -0.211218, -0.088983, -0.287028, 0.033179, 0.013264, -0.473372, -0.075049, -0.489877, 0.052535, -0.554593, -0.244093, -0.795700, -0.269233, -0.400371, 0.180199, 0.397807, -0.651103, 0.013090, -0.097063, 0.031727, -0.177763, -0.290365, -0.237131, -0.228042, 0.012782, -0.260092, -0.535222, -0.310883, -0.009141, 0.078629, 0.310770, 0.060279, 0.014880, 0.004698, 0.147126, -0.029745, -0.031720, 0.186729, 0.093092, 0.222356, 1.405539, -0.662158]
-,        [-0.399347, -0.169347, -0.426001, -0.245716, -0.168935, -0.245088, 2.918470, -0.295303, -0.218385, 0.070750, -0.095057, 0.083488, -0.687443, 0.258956, 0.027413, 0.138047, 0.200214, -0.048956, -0.225645, 0.456188, -0.449424, 0.015375, 0.107107, 0.409491, -0.054741, 0.323660, 0.340684, -0.030031, -0.388940, 0.209411, 0.082368, 0.261862, -0.029435, -0.051277, -0.116619, 0.248308, 0.306593, -0.118322, -0.171846, 0.030550, -0.288033, 0.434883, 0.227547, 0.536798, 0.449207, 0.162804, 0.523409, 0.181029, 0.315168, 0.244817, 0.426093, 0.512021, -0.159433, 0.295690, 0.255485, 0.232387, 0.131226, 0.176106, 0.178956, 0.144221, 0.263492, 0.458236, 0.313407, 0.320665, 0.431178, 0.527722, 0.429394, 0.364096, 0.330423, -0.120406, 0.024435, -0.232364, 0.028480, 0.172414, 0.038735, 0.138507, 0.003769, 0.014048, 0.072595, 0.011489, -0.069101, -0.064263, 0.042290, -0.002088, -0.037092, 0.030909, 0.006720, 0.020766, 0.110328, -0.039605, -0.116634, -0.014035, 0.111899, 0.014474, 0.194718, -0.029477, 0.172941, -0.109057, 0.151183, 0.015277, -0.021867, -0.098100, -0.059134, 0.049381, 0.089088, -0.041950, 0.053046, -0.088676, 0.059879, 0.069373, 0.115309, -0.011371, 0.061358, 0.002977, -0.023087, -0.278597, -0.218800, 0.011372, 0.155438, 0.140165, -0.009940, 0.739296, 0.101369, 0.158876, 0.162128, 0.035612, 0.002568, 0.135270, 0.016578, 0.053572, 0.015161, 0.043630, -0.093354, -0.173684, -0.002840, 0.013092, -0.004915, 3.215709, -47.796650, 1.357488]
-,        [-0.038889, 0.744098, -0.585748, 1.368167, -0.557933, -0.587106, -1.327941, 0.776122, -0.069390, -0.168366, 0.498501, -0.560784, -0.459851, -0.619669, 0.450706, -0.239723, -0.449664, 1.173686, 0.485259, -0.605268, 0.280458, 0.409469, 0.204540, 0.044962, 0.673403, -0.678471, 0.523457, 0.088949, 0.331579, -0.703154, 0.023614, -0.550983, 0.935678, -0.525839, 0.100421, 0.165793, 0.952035, -0.043329, -0.024940, 0.716519, 0.458124, -0.845250, 0.046953, 0.435569, -0.210168, 0.597004, -0.355000, -0.028236, 0.448533, -0.311384, -0.151893, 0.124113, 0.144468, 0.859348, 0.250571, 0.473458, -0.616568, 0.127357, -0.705297, 0.680542, -0.330549, 0.476665, 0.644006, 0.375966, 0.307781, -0.086430, -0.109526, 0.543790, -0.107340, -0.814120, -0.205103, -0.360845, 0.040869, -1.283255, -0.587100, 0.181260, -0.526465, -1.207523, -0.808688, -0.425376, -0.878294, 0.442895, 0.238420, 0.374409, 0.733796, -0.565329, -0.342508, -0.065726, -0.469492, -0.068372, -0.690358, -0.814699, -0.133575, 0.468611, 0.255734, -0.270031, -0.005567, -0.524510, 0.006183, -0.625439, -0.928667, 0.348844, 0.215717, 0.295589, 0.072510, -0.244891, -0.155102, -0.077579, -0.647407, -0.701780, -0.197857, -0.729191, -0.495742, -0.891491, 0.411210, -0.091226, -0.264699, -0.973484, -0.036763, -0.056168, -0.601298, 0.176299, -0.241897, -0.393583, -0.347945, -0.128465, 0.307209, 0.282690, 0.264349, -0.191232, 0.123302, 0.357907, -0.344949, -0.170223, 0.135425, 0.024109, 0.212515, -1.157147, 0.403927, -0.307165]
-,        [-0.682157, 0.165230, 0.103580, -0.340134, 0.323026, 0.567303, 0.585979, -0.807809, -0.061037, 0.875331, -0.651349, 0.258055, -0.812046, 0.445370, 0.709845, 0.576523, -0.230153, -0.956837, -0.443713, -1.770283, -0.878329, 0.060279, 0.501709, 0.388937, 0.662785, -0.860713, -0.396284, -0.201922, -0.717127, 0.094975, 0.783577, 0.139832, 0.596928, -0.697017, 0.339116, 0.865250, -0.144384, -0.278680, 0.101241, 0.109652, -0.632218, -3.622805, -3.237546, -0.981958, -3.624950, -1.826223, -0.817932, 0.106983, -1.409536, -1.266819, 0.171578, 0.361204, -0.414247, -0.328293, 0.438524, 0.898843, 0.507083, -1.446697, -0.387935, -1.297072, -0.835262, -0.613688, -0.162552, 0.247337, 0.280314, -0.483366, -0.864515, -1.209796, -1.290354, -0.052526, -0.557374, -0.491576, -0.242264, -0.550097, 0.364103, -0.784338, -1.254258, -0.118289, 0.498427, -0.513967, -0.596737, -1.214042, -0.776990, -0.372052, -0.780000, -0.292200, 0.007679, -0.646320, -0.756364, -0.323213, -1.105847, -0.319151, -1.835616, 0.250776, -0.560471, -0.771604, -0.909777, -0.463076, 0.105738, -0.509019, -0.702466, -0.729924, -0.253841, -0.461307, -0.133723, -1.110590, -0.692804, -1.576614, -0.556957, -0.988187, -0.497816, -0.956715, -0.344956, -0.060967, -0.666165, -0.941163, -1.163380, 0.415917, 0.308291, -0.242595, -0.889289, 0.079548, 0.166601, 0.175954, -0.171645, 0.311967, 0.566425, 0.059938, 0.259910, 0.053015, 0.123874, -0.548864, -1.812505, -1.151676, -0.811490, -0.723072, 0.129493, 0.877091, 1.808747, 0.418362]
-,        [-1.243588, 0.492098, 0.227392, 0.025203, 0.414675, 0.690831, 1.084775, -0.323687, -0.302157, 0.445705, 0.174154, -0.305981, -0.014651, -0.585634, 0.717284, -0.554070, 0.091948, -0.062584, 0.466600, 0.193561, 0.163510, -0.285460, 0.333368, 0.428799, -0.112509, 0.713565, 0.554633, 0.420691, 0.971759, -0.168949, 0.894420, 0.556828, -0.224361, 0.323868, 0.896102, 0.885955, 0.346110, 0.705458, 0.666859, -0.700700, 0.373014, 0.122321, 0.997294, 0.628202, -0.264953, 0.193962, 0.565908, 0.579320, 0.243690, 0.385597, 0.532517, 0.403823, 0.394140, 0.734519, 0.224634, -0.017576, 0.529012, 0.790935, 0.756977, 0.252427, -0.157432, 0.786877, 0.177803, 0.191477, 0.758670, 0.183771, 0.357395, 0.464753, -0.212982, 0.518658, -0.292127, 0.540340, 0.061014, 0.135588, -0.119667, -0.424048, 0.080090, 0.549113, 0.167320, 0.635906, -0.023380, 0.142256, -0.334738, 0.342096, -0.030907, -0.217707, 0.015917, 0.439220, -0.575572, -0.386876, -0.204620, 0.528346, 0.060271, 0.002633, -0.659719, -0.303579, -0.765750, -0.267225, -0.519862, 0.498635, -0.089536, 0.343714, 0.465356, -0.493509, 0.205541, -0.304596, -0.799923, 0.392255, 0.593666, 0.491493, -0.530185, 0.449880, -0.133512, -0.748496, -0.799337, -0.296306, -0.366928, -0.197875, -0.831172, 0.544513, 0.461200, -0.338581, -0.309512, -0.612616, -0.175684, 0.414391, -0.469293, -0.136577, -0.342611, 0.322518, 0.262809, 0.094765, -0.103026, -0.065174, 0.501267, 0.003213, 0.428597, 1.228819, -4.700106, -0.227808]
-,        [-0.234310, 0.207846, -0.316990, -0.074517, 0.522224, -0.405550, 0.903510, 0.684708, -0.016510, 0.132215, 0.492362, -0.252581, -0.378899, 0.924561, -0.012259, 0.193238, 0.780577, -0.443617, 0.913355, -2.326930, 0.228786, 0.367198, 0.920941, -1.215918, -0.115513, -0.842661, -0.027207, -5.049504, -1.302068, -0.347054, 0.473262, -3.369537, 0.125239, 0.415541, 0.715800, -1.869343, -0.075595, -1.828735, -0.077177, -4.976349, -0.602811, -2.114734, -0.619076, -4.300885, -1.769190, 0.942452, 0.892840, -0.153903, 1.370996, 0.348341, 0.831329, -2.228366, 0.210701, -0.429367, -0.166907, -4.721431, -0.874938, -0.263710, 1.161989, -2.035922, 0.119047, -2.694423, -0.882626, -5.265237, -1.769850, -1.427000, 0.506553, -3.931125, -0.337833, 0.016969, 0.098865, -0.023199, -0.161267, -0.620414, -0.291251, 0.070875, -0.033620, 0.494981, 0.026611, 0.180312, -0.325406, 0.393213, -0.091702, 0.087198, 0.276298, 0.023313, -0.186594, 0.139090, 0.133702, 0.024602, 0.278288, 0.171419, 0.268045, -0.044768, 0.102472, 0.143671, -0.130888, -0.286424, -0.367906, -0.501329, 0.110203, -0.204369, 0.502543, 0.136116, -0.123676, 0.097780, 0.243353, -0.081099, 0.076633, 0.184056, -0.071426, -0.089989, -0.068536, -0.477306, -0.068107, 0.175689, 0.183444, -0.076009, -0.437384, -0.129458, 0.154920, -0.510446, 0.081951, -0.015312, 0.066900, 0.013148, 0.226932, 0.051299, -0.023015, 0.037933, 0.158279, -0.076779, 0.110785, -0.044454, 0.181161, -0.357510, 0.479066, 0.482676, 0.606396, 0.095696]
-,        [-0.860503, -0.044825, 0.482057, 0.248334, -0.329063, 0.223305, -0.255524, 0.510295, 0.027033, -0.545248, -0.360557, 0.502450, -0.229019, -1.356214, 0.640449, 0.200676, -0.697059, -1.056113, 0.087617, 1.299567, -0.755814, 0.025166, -0.147556, 0.656227, 0.994355, 0.140868, -0.449089, -0.316473, 0.682535, -0.963692, 0.420930, 0.004648, -0.173679, -0.693747, -0.337678, 0.429962, -0.974887, -0.837136, -0.089261, -0.039956, -0.287328, -1.127397, -0.091745, -0.619801, -0.531397, -1.690439, 0.294663, 0.330628, -0.505602, 0.328696, -0.828560, 0.653095, -0.793579, -0.162354, 0.506378, 0.194902, -0.125286, -0.907710, 0.271897, -0.433235, 0.962581, -0.915110, -0.038487, -0.227513, -1.319239, -1.159230, 0.734686, -0.197322, 0.090904, -0.224214, -0.574217, -0.649884, -0.166741, 0.122583, -0.381890, 0.240710, 0.022184, -0.160961, 0.031250, -0.169911, -0.251121, -0.076054, 0.157610, 0.506331, -0.270928, -0.758892, -0.362574, -0.124395, 0.016396, -0.058770, -0.418230, -0.035954, -0.138699, 0.018854, -0.087054, -0.081136, -0.306838, -0.231533, -0.181257, 0.374894, -0.578022, -0.229427, 0.008241, -0.725844, -0.672125, -0.475888, -0.822149, -0.064149, -0.479737, -0.350145, -0.652707, 0.213372, -0.343732, -0.499384, -0.189710, 0.216652, -0.243708, -0.385002, -0.335264, -0.260498, -0.428943, -0.204058, -0.314094, 0.250304, -0.206194, 0.045817, -0.141735, 0.039214, 0.483958, 0.472352, 0.309717, 0.361101, 0.394553, 0.163384, -0.529223, -0.039879, 0.149841, -0.104987, -0.568155, 0.321896]
-,        [0.443229, 0.226054, 0.013245, -0.332715, 0.043305, -0.485043, -0.744331, 0.004000, 0.578268, -0.102466, -0.583397, -0.547353, 0.229843, 0.382839, 0.754260, -0.876958, -0.724153, -0.418574, 0.276225, -0.295037, 0.357035, 0.094586, -1.077290, 0.159294, -0.490531, 1.058392, -0.199908, -0.764673, -0.320043, 0.342733, -0.111441, 0.134610, 0.278023, -0.672271, -0.440072, -0.323942, 1.024437, -0.283382, -0.256684, -0.757605, -0.459706, -0.299456, -0.238906, -0.823672, -1.360966, -1.171308, 1.148563, -0.390023, -0.003121, -0.697948, -0.126606, -0.290603, -0.206924, -0.698256, -0.162933, -0.015071, -0.457879, 0.610854, 0.125982, 0.735493, -0.463078, 0.152321, -0.528499, -0.642408, 0.193300, -0.737731, 0.476605, 0.303557, -0.349938, -0.073520, -0.759427, -0.278256, -0.822539, 0.424989, -0.427880, 0.071996, -0.099771, 0.414791, 0.250337, 0.190873, -0.054376, 0.059041, 0.711968, -0.015652, -0.415074, 0.187400, -0.359681, -0.297417, -0.501001, 0.737323, 0.086108, 0.031568, -0.188787, 0.203031, -0.226619, 0.041910, -0.982449, -0.815280, -0.202660, 0.249468, -1.180306, -0.293011, -0.128829, -0.720486, -0.282015, -0.271887, -0.243487, -0.581569, -1.228191, -0.471004, -0.264282, -0.070853, -0.522630, -0.366126, 0.182040, -0.815962, -0.411699, 0.036407, -0.051215, -0.464760, -0.153633, -0.054948, -0.111237, -0.168370, 0.097378, 0.347545, 0.052507, 0.075810, -0.220140, -0.454377, -0.490729, -0.246628, -0.553110, -0.662469, -0.564973, -0.229014, 0.541290, -0.570205, -1.256198, 0.243544]
-,        [0.647672, 0.602291, 0.517358, 0.165825, 0.233976, -0.592100, -0.574272, -0.132971, -0.000724, -0.610512, -0.789530, -0.151442, -0.430965, 0.120577, -0.503756, 0.458861, -0.004150, 0.745050, 0.986412, 1.524044, 0.337180, -0.600189, 0.904676, 0.388661, 0.673767, 0.812643, -0.164216, 0.552205, -0.130243, -0.381316, 0.082404, -0.223179, -0.084471, -0.814911, -0.537718, 0.603545, 0.267518, -0.858021, 0.541157, -0.729868, -0.898284, -0.303282, -1.446176, -0.100844, -0.020054, -0.686928, -0.073219, -1.030601, -0.669793, 0.532008, -0.055965, 0.080450, -0.274044, -0.090982, 0.224369, 1.214915, -0.334836, 0.661223, 0.857798, -0.904605, -0.310204, -0.983408, 0.743470, -0.284195, 0.472285, -0.638646, -0.450650, -0.224934, 0.278604, 0.452112, -0.028429, 0.175809, 0.283263, -0.052462, -0.446723, 0.236979, 0.329041, 0.074041, -0.740366, 0.156462, -0.076459, -0.224034, -0.021565, -0.375238, -0.772076, 0.043918, -0.545267, -0.088967, -0.135296, 0.624048, -0.120107, -0.267778, -0.282704, -0.136955, 0.394595, 0.235868, -0.004008, 0.460526, -0.369583, 0.150901, 0.354756, -0.613196, 0.060626, 0.377610, -0.568230, -0.116478, -0.794366, 0.425790, 0.735941, -0.261541, -0.096486, 0.205049, -0.053228, -0.484413, 0.559576, -0.154098, -0.167417, 0.964242, -0.017204, 0.166627, 0.496371, -0.010226, -0.014944, 0.120829, 0.118037, -1.843162, -1.674709, -1.130658, -0.699381, -0.395644, -0.110723, 0.050480, -0.206678, -0.085168, -0.290937, -0.076390, 0.021356, -0.586234, -0.807115, -0.205454]
-,        [0.078044, 0.260472, -0.060988, 0.211032, 1.184353, 0.752894, 0.427277, 1.095588, -0.116278, 0.068570, -0.535878, 0.227582, -0.315752, 0.465578, -0.692273, -0.487660, 0.396997, 1.456254, 0.544669, 0.860264, 0.885567, 0.274544, 0.918264, 1.056076, 0.432712, 0.239197, 0.759658, 0.694155, -0.103049, 0.753894, 0.951417, 0.991259, 0.632150, 0.835804, -0.007119, 0.856473, 0.536768, 0.166085, 0.847478, 0.670494, 0.757672, -0.221356, 0.599554, 0.233091, 0.189198, 0.889232, 0.133399, 0.109076, 0.555874, 1.078543, 0.260716, 0.572750, 0.739019, 0.145733, 0.867495, 0.907879, -0.058763, 0.060916, 0.602836, 0.981201, 1.099936, 0.627896, 0.778203, -0.147154, 0.298669, 0.575829, 0.072647, 0.882864, 0.919704, -0.528978, -0.644086, -0.251402, -0.250737, 0.467179, -0.431920, -0.107564, -0.222120, -0.703489, 0.079533, -0.083287, -0.571199, 0.546417, -0.187814, 0.372481, -0.116360, -0.324635, -0.492225, 0.257995, -0.011596, 0.045708, 0.190405, 0.603024, 0.036144, -0.242476, -0.300435, -0.261563, -0.859023, 0.078624, -0.212223, 0.105826, -0.327314, -0.624691, -0.281698, 0.306444, 0.008456, 0.405242, -0.291460, -0.007171, 0.030670, -0.413332, 0.244824, 0.055245, -0.251487, -0.067066, -0.994695, -0.094886, -0.552033, -0.387660, 0.163951, -0.035887, -0.568616, -0.801963, -0.531142, -0.373630, 0.485665, -0.463986, -0.319591, 0.032429, 0.141023, -0.015623, -0.231106, 0.135311, 0.204934, -0.266548, 0.225919, 0.058710, -0.994982, 0.856763, -0.164726, -0.370979]
-,        [0.662460, 0.403872, 0.503324, 0.134964, 0.673740, 0.000197, -0.107224, -0.008141, 0.127022, 0.005946, 0.129563, -0.372018, 0.283248, -0.358349, 0.511256, -0.064379, -0.731214, -0.683878, -0.043350, 0.401255, 0.178719, 0.135664, 0.604537, 0.466977, -0.737140, -1.521381, 0.413405, -0.048897, -0.276272, 0.520301, 0.273195, -0.836546, -0.055371, 0.718038, -0.363003, -0.775132, -0.213167, 0.594136, 1.149647, 0.112489, 0.910952, -0.916531, 0.959417, 0.503170, -0.338028, 0.244974, 0.349402, 0.340581, -0.001277, -0.359784, 0.065262, 0.617398, -0.200385, 0.369411, 0.240749, 0.726991, 0.113684, 0.308033, 0.209993, 0.766019, 0.303248, 0.619908, 1.605739, 0.187646, 0.771966, -0.653657, -0.030306, 0.017681, 0.380594, -0.877117, -0.161722, -0.776752, 0.266154, -0.901689, 0.292923, 0.162308, -0.265698, 0.048202, -0.172715, -0.417024, -0.209048, -0.310262, -0.899062, 0.049931, 0.266057, -0.174602, -0.376771, -0.272492, -0.328691, -0.434026, -0.412789, 0.574351, -0.637016, 0.232287, -0.288984, 0.528234, -0.292325, -0.283479, -0.590215, -0.756034, -0.348384, 0.208264, 0.211207, 0.030788, 0.096693, -0.661856, -0.021810, 0.463922, -0.250389, -0.243211, 0.571115, 0.118543, -1.113790, -0.095508, -0.239554, 0.386932, -0.345127, 0.235028, -0.271790, 0.131143, 0.013711, -0.264782, 0.019957, -0.186202, -0.033953, 0.174753, -0.300670, -0.309762, -0.178994, -0.048794, 0.367658, 0.405837, -0.716323, -0.343369, -0.117183, -0.166429, 0.456539, 0.023953, -2.139647, -0.167887]
-,        [-0.182078, -0.236297, 0.012406, 0.137036, -0.083724, -0.236741, -0.154930, 0.044636, 0.036445, -0.178922, -0.199702, 0.007504, 0.047585, -0.213996, 0.048446, -0.435875, -0.032201, -0.128786, -0.135316, -0.206701, 0.105489, 0.079992, -0.029688, 0.010106, 0.045331, 0.157721, 0.145848, -0.167821, 0.100912, 0.277176, -0.083067, -0.186331, -0.050390, 0.119476, -0.080831, 0.025612, -0.086567, -0.159094, 0.041421, -0.005371, 0.160769, -0.302715, 0.071703, -0.215965, -0.612547, 0.398445, -0.059246, -0.134990, 0.093997, 0.100150, 0.209800, 0.176736, 0.112189, -0.086459, -0.067104, -0.133242, -0.072843, -0.046239, -0.247514, 0.025801, -0.097818, 0.245194, 0.384533, 0.044535, -0.234760, -0.367613, 0.270931, 0.123409, -0.056067, -0.135281, -0.316373, -0.090155, -0.241810, -0.123609, -0.205792, 0.043557, -0.115011, -0.163128, -0.186808, -0.084080, -0.037613, -0.098471, -0.235397, 0.178755, -0.207095, -0.115380, -0.328807, 0.194346, -0.025027, -0.130250, -0.136389, -0.114477, -0.163598, -0.043870, 0.063624, -0.219584, -0.023157, 0.157954, -0.049389, 0.111846, -0.126420, -0.121674, -0.437661, -0.349048, -0.020978, -0.056301, -0.159964, 0.095686, 0.042411, -0.208284, -0.353405, -0.164487, -0.167424, -0.262617, -0.150764, -0.263360, -0.000051, -0.045473, -0.054131, -0.129082, -0.110872, -0.204141, -0.111463, -0.233369, -0.225538, -0.189163, -0.039486, -0.007306, -0.030379, -0.070673, 0.310030, 0.007774, -0.035325, -0.181554, -0.056365, 0.113599, -0.076437, -0.274813, -0.487393, -0.525379]
-,        [0.881319, 0.508544, 0.560134, 0.661113, 1.155202, 0.894882, 1.074753, 1.110910, 0.772005, 0.390293, 0.399581, 0.408226, 0.687413, 1.098939, 0.963494, 1.231186, 0.610855, 0.367808, 0.453249, 0.504500, 0.869399, 0.508475, 0.531616, 0.139662, 0.512614, 0.366076, 0.809211, 0.662478, 0.698275, 0.392697, 0.364423, 0.333216, 0.711986, 0.277667, 0.433076, 0.563067, 0.320292, 0.378539, 0.580750, 0.410321, 0.350329, 0.000567, 0.395796, -0.119402, 0.668117, 0.263373, 0.701080, 0.580434, 0.624822, 0.448987, 0.138036, 0.375511, 0.774446, 0.580657, 0.452717, 0.162841, 0.586473, 0.135497, 0.495015, 0.796167, 0.350634, 0.258545, 0.623978, 0.267471, 0.650998, 0.130853, 0.526132, 0.324377, 0.709856, 0.096585, -0.046218, 0.057577, 0.194571, -0.101415, -0.134714, -0.058611, 0.077380, -0.090313, 0.069710, 0.280750, 0.190335, -0.040422, 0.062509, -0.114888, 0.062844, 0.087903, 0.018670, -0.181656, -0.000785, -0.237209, -0.135879, -0.205403, 0.074400, -0.244124, 0.023205, -0.140645, 0.104091, 0.077784, 0.092782, 0.332366, 0.238655, 0.144906, 0.030286, 0.039807, 0.008036, -0.373058, 0.063047, 0.075730, 0.152128, 0.032328, 0.122772, 0.047270, 0.093693, 0.148111, 0.202814, 0.256350, -0.073304, -0.146807, 0.111483, -0.198520, -0.188548, -0.144979, -2.711910, 0.019725, -0.216772, -0.045273, -0.286439, -0.024692, -0.323776, -0.116505, -0.369545, -0.024595, -0.057878, 0.165779, -0.331136, -0.040023, 0.242244, 1.147774, -1.893604, 1.179994]
-,        [-0.048753, 0.407905, 1.390762, 0.027644, -0.515483, -0.001558, -0.913756, 0.349305, 0.327242, 0.452689, -0.380604, -0.488286, -0.133876, -0.448880, -0.767904, 0.443540, -0.050816, 0.012355, 0.013743, -0.835774, 1.043085, -0.021648, -0.463663, -0.229756, 0.420704, 0.153023, -0.139446, 0.413899, 1.052564, -0.393496, -0.310340, -0.031806, -0.164153, 0.140274, -0.036595, 0.151680, -0.965401, -0.098113, 0.517736, 0.744964, -0.383826, 0.474090, -0.401677, -0.324810, -0.641745, -0.540012, -0.253792, 0.729103, 0.422196, -0.179804, 0.052154, -0.088064, 0.239195, -0.295118, -0.553458, -0.216139, 0.430897, 0.089317, 0.071747, -0.078076, -0.488500, -0.566436, -0.330944, -0.056538, -0.104503, -0.439001, 0.832729, 0.589139, 0.084817, -0.020155, -0.070828, -0.723000, -0.346224, 0.031569, 0.377919, -0.814748, -0.844866, -0.815236, 0.120965, -0.520188, 0.234248, 0.110304, 0.020562, -0.749342, -0.479804, 0.083662, -0.166645, 0.394333, -0.463013, -1.308583, 0.156043, -0.653197, -0.149370, -0.267411, -0.007420, -0.522328, -0.199969, -0.665428, -0.452808, -0.663153, 0.118222, 0.507630, 0.020766, 0.621668, -0.366571, 0.050158, 0.142968, -0.373060, -0.156036, -0.409424, -0.204406, -0.815263, -0.796797, 0.275541, -0.702857, -0.337184, 0.154921, -0.491565, -0.029856, -1.218412, -0.492981, -0.016457, -0.316919, -0.577292, -0.572008, -0.084565, -0.394586, 0.024944, 0.165723, 0.297991, 0.284125, 0.327953, 0.314851, -0.312314, -0.103349, 0.224343, 0.390384, -0.641609, -1.229448, -0.379918]
-,        [-0.752035, -0.713197, -0.399114, -0.813303, 0.078162, -0.157410, -1.100927, -0.246702, 0.927380, 0.132178, 0.860271, 0.452798, 0.856471, -0.617477, 0.654061, 0.534612, -1.271314, 0.059853, 0.546618, 0.688183, -0.601898, 0.487143, -0.271484, 0.340251, -0.503398, -0.119136, 0.706360, 0.964387, -0.290422, -0.361023, 1.677341, 0.707466, -0.484043, 0.251400, 0.037507, -0.277499, 0.321901, 0.778959, -0.225552, -0.497746, -0.211931, -0.230515, 0.221220, 0.011567, -0.423724, 0.208893, 0.335844, 0.120361, -0.876769, -0.573828, -0.642789, -0.212749, -0.169186, -1.070424, 0.626633, 0.095359, -0.564872, 0.178257, 0.522300, 0.216480, -0.003197, 0.553145, -0.062899, -0.400455, -0.448978, 0.042115, 0.282564, -0.097517, -1.422693, 0.358724, -0.091390, -0.070049, 0.336767, -1.043958, 0.056904, 0.339915, 0.514709, -0.781927, -0.012048, -0.655155, -0.094705, -1.178383, -0.451328, -0.119618, 0.032314, -0.876649, -0.335035, -0.189653, -0.311321, -0.775136, -0.682063, 0.036070, -0.595685, -0.248496, 0.534335, 0.672627, 0.408394, -0.449678, -0.697771, 0.081051, 0.234697, -0.483246, 0.775280, 0.755648, 0.169337, -0.148254, -1.048075, 0.145305, 0.005447, -1.028592, -0.160063, -0.296446, -1.236469, -0.964271, -0.892105, 0.022534, 0.303696, -0.887460, -0.575206, 0.343123, -0.237762, 0.058259, -0.302354, -0.123089, -0.773497, -0.565437, -0.745834, -0.663092, -0.598044, -0.427812, -0.149974, -0.172237, 0.094667, 0.061770, -0.084805, 0.108867, 0.261186, -1.272655, -3.041574, 0.469613]
-,        [1.015345, 0.313737, 0.953164, 0.269448, 0.965601, 0.540292, 0.551671, 0.310817, 0.704082, 0.555741, 0.694418, 0.370964, 0.941984, 0.887465, 0.628658, 0.226818, 0.906761, 0.252382, 0.584372, 0.505915, -0.175600, -0.132801, 0.122138, 0.566442, 0.316883, 0.571365, 0.643424, 0.391093, 0.278583, -0.528301, 0.257053, -0.129044, 1.390458, 0.505953, 0.359912, 0.266154, 0.071672, 0.263273, 0.563577, 0.925210, 0.749323, 0.611086, 0.708489, 0.001191, 0.459582, 1.140000, 0.220634, 0.234007, 0.302641, 0.537480, 0.400552, 1.013546, 0.133188, 1.069445, 0.482352, 0.728077, 0.276154, 0.634812, 0.664758, 0.648423, 0.136216, 0.911821, 0.277823, 0.564100, 0.654552, 1.032464, 0.313946, 0.133964, 0.428428, -0.120104, -0.092578, -0.025437, 0.112612, 0.241768, 0.036459, 0.000781, 0.361299, -0.320234, -0.123325, -0.069655, -0.140188, 0.043708, -0.003233, 0.111466, -0.983384, 0.003828, -0.300385, 0.206171, 0.132122, -0.230647, -0.148266, -0.006329, 0.125195, 0.321254, 0.183355, 0.171405, 0.519565, -0.180334, -0.172402, 0.143520, -0.202216, -0.240691, -0.089228, -0.172781, 0.053442, 0.237887, -0.182654, 0.103789, -0.179412, -0.263752, -0.203764, 0.134586, 0.120579, -0.658633, -0.081455, -0.064605, -0.549282, 0.122780, -0.006196, 0.136101, -0.205189, -0.554134, 0.045437, -5.156563, -1.370234, -0.436849, -0.265520, -0.300131, -0.163026, -0.002634, -0.036077, -0.062793, 0.031877, -0.019075, -0.081476, -0.093537, -0.105177, 0.121342, -0.665138, 0.492291]
-,        [0.368511, 0.126163, 0.267285, -0.092140, -0.076374, 0.127790, -0.697376, -0.107505, -0.014833, 0.013076, 0.079431, -0.653409, -0.679655, -0.036215, 0.887015, -0.739693, -0.356563, -0.670542, 0.116524, -0.671596, 0.552507, -0.527172, -0.620112, 0.303523, -0.046275, 0.304181, -0.152971, 0.327467, 0.207222, 0.360778, 0.966376, -0.782696, -0.625333, 0.575925, 0.492480, -0.683513, -0.458686, -0.694482, -1.342618, -0.885365, 0.671134, -0.815017, -1.123618, -0.996160, -0.012531, 0.137022, -0.384260, -0.379405, 0.142608, 0.585168, 0.178882, -0.416686, -0.034456, 0.444849, -0.230612, -0.434329, 0.586515, -0.135080, 0.754617, 0.062965, 0.680543, 0.691178, 0.684859, -1.009453, -0.443525, -0.004622, 0.095595, -0.154945, 0.295669, -0.097364, -0.609820, -1.099733, 0.069861, 0.455054, -0.370936, -0.089372, -0.295025, 0.137715, 0.423731, 0.278029, 0.161802, 0.327529, -0.055889, -0.437654, 0.210521, -0.610672, -0.390303, -1.449867, -0.477911, 0.146441, -0.512428, -0.567187, 0.454359, -0.218219, -0.236015, 0.293955, 0.058862, 0.177307, -0.034673, -0.156501, 0.328631, 0.010535, -0.586474, -0.550987, -0.148093, 0.488712, -0.233575, -0.016928, 0.064755, 0.600084, -0.615613, -0.591706, -0.654063, -0.021866, -0.116556, -0.589643, 1.051960, -0.215314, -0.761693, -0.764348, 0.321479, 0.145633, 0.066266, -0.213433, -0.825880, -0.569034, -0.372663, -0.612217, -0.323806, -0.206960, 0.039606, -0.349135, 0.363144, 0.085645, -0.255601, -0.408410, 0.173879, -0.649498, -0.658941, -0.024033]
-,        [-0.101986, -0.982497, 0.121167, 0.431745, 0.611346, 0.436402, 0.030651, -0.332102, -0.165254, -0.135136, 0.988062, -0.853410, 0.228207, 0.850863, -0.166716, -0.508283, -0.170288, -0.177642, -0.081875, -0.259153, 0.137827, -0.124725, 0.110210, -0.435969, -0.646500, 0.146737, 0.218358, 0.054239, -0.579250, 1.644623, 0.300835, -0.348944, -0.447304, 0.191113, -0.023039, -1.441022, -0.263116, 0.420921, 0.017478, 0.154837, -0.500126, 0.615560, -0.175597, -0.224499, 0.055730, -0.113374, -0.243521, -0.949963, -0.229463, -0.350424, -0.671721, -0.210877, -0.421147, -0.011006, -0.371703, -0.519187, -0.951451, 0.388892, -0.857859, -0.559848, -0.036710, -0.586392, -0.638254, -0.872167, 1.061024, 0.646899, 0.642854, -0.100042, 0.000489, -0.980303, -0.479470, -0.614281, -0.302171, 0.049474, -0.491665, 0.078844, 0.582367, 0.203842, 0.067312, 0.322708, 0.244865, -0.757258, -0.754685, -0.390596, -0.820800, -0.180159, 0.081134, 0.218771, -1.127272, 0.177047, -0.260718, -0.121612, 0.406059, 0.080607, -0.126344, 0.473632, -0.582001, -0.166842, 0.283338, -0.938131, 0.112171, 0.333475, -0.175909, -1.011024, -0.422048, -0.359289, 0.173455, -0.826768, -1.161838, -0.441281, -0.841085, -0.692596, 0.116860, -1.016453, -0.000093, -0.258300, 0.010206, 0.028433, -0.400987, -0.416422, 0.035781, -0.259105, -0.053083, -0.358073, -0.576019, -0.411970, -0.704507, -1.186426, -0.915295, -0.439983, -0.086067, -0.701423, -0.297845, -0.916900, -0.384204, -0.121673, 0.489743, 0.084561, -2.310273, -0.459500]
-,        [0.217656, 0.265653, 0.963488, -0.810830, 0.174701, -0.651351, -0.412129, 0.018424, 0.221612, 0.024272, -0.463337, -0.201177, 0.552483, -0.050984, 0.609467, -0.283115, -0.814417, -0.299001, 0.136677, -0.007514, -0.393317, -0.112954, 0.262297, -0.151036, -0.773546, 0.093369, 0.369394, 0.196820, -0.230132, -0.503274, -0.288051, -0.383283, -0.557220, 0.802567, 0.024934, 0.844961, 0.355319, -0.610198, -0.065240, -0.011347, -1.169321, 1.674840, 0.483015, -0.651795, -0.374256, 0.430191, -0.316198, 0.253370, 0.196049, 0.160107, -1.544270, -0.091353, -1.074570, -0.539182, -0.321441, 0.076170, 0.286166, -0.192292, 0.376740, 0.122468, 0.218240, -0.422779, 0.241423, 0.158625, 0.178058, 0.716915, -0.245179, 0.474590, 0.700391, 0.719053, 0.199895, 0.165917, -0.349401, 0.320957, -0.443556, -0.156506, 0.758184, -0.115229, 0.847947, -0.409795, -0.057434, 0.186307, 0.021303, -0.721576, 0.392125, 0.219409, 0.006523, 0.118813, -0.127978, -0.514958, 0.046561, -0.199467, -0.554268, 0.603773, 0.157403, -0.506122, -0.074913, 0.003256, -0.448876, -0.339318, 0.115405, 0.466281, 0.044888, -1.169626, -0.094195, 0.002020, 0.548950, -0.115895, 0.096651, 0.863400, 0.171220, -0.221515, -0.413112, -0.656537, 0.505948, -0.604013, -0.356989, -0.118234, -0.775116, -0.316063, -0.419570, -0.111149, 0.025434, -0.247468, -0.243891, -0.495715, 0.117843, -0.309044, -0.710338, -0.546005, 0.079971, -0.533923, -0.093280, 0.792041, 0.290217, 0.297677, -0.435463, -0.133082, 0.390624, -0.440657]
-,        [-0.027623, -0.520606, 0.366652, 0.366920, 0.110765, 0.067766, 0.568598, 0.403870, -0.426075, 0.446787, -0.564921, -0.484712, 1.176127, 1.577892, -0.587026, -2.008296, -1.414529, 0.332445, 0.232604, -0.158589, 0.135544, 0.004485, 0.442484, 0.291143, -0.220130, 0.843739, 0.306758, -0.241769, 0.411973, 0.706446, -0.169061, -0.375001, 0.765985, 0.949722, 0.485202, -0.377286, 0.168350, 0.251595, 0.428132, 0.151634, 0.200285, -0.918432, 0.491114, 1.331128, 0.351792, 0.084093, -0.026795, 0.480666, 0.539945, 0.688980, 0.117946, 0.776814, 0.395591, 0.762882, -0.237322, -0.054401, 0.189336, 0.037207, 0.914189, -0.210556, 0.533153, -0.023657, 0.186922, 0.856207, 0.710707, 0.683019, 0.385949, -0.069647, 0.062268, 0.109723, 0.337564, 0.503760, 0.568601, -1.437298, -0.322728, 0.005619, 0.091126, -0.586608, 0.333106, 0.068259, 0.730908, -0.614170, 0.095166, 0.183864, 0.242265, -0.038400, 0.246024, -0.360178, 0.306432, -0.106558, 0.289723, 0.168776, 0.290573, -0.631843, 0.151848, 0.153769, 0.572106, -0.591181, -0.572245, 0.082630, 0.670177, -0.752368, -0.119415, -0.363331, 0.062047, -0.531213, 0.142062, -0.046623, 0.085885, -0.000628, -0.271570, 0.339346, 0.399097, -0.238036, 0.124080, -0.244270, 0.147540, -0.407162, -0.094069, -0.079711, 0.184479, -0.110065, -0.300862, -0.497591, 0.181274, -0.667472, 0.079653, -0.404499, 0.161956, 0.563946, 0.481352, 0.276905, -0.240346, 0.092994, 0.027425, -0.161611, 0.500684, 0.409692, -0.906049, 0.460292]
-,        [-0.827037, -0.614679, 0.102765, 0.384039, -0.056481, 0.594523, 0.201889, 1.384956, 0.287468, -2.089377, -0.934470, 0.241697, 0.382100, 0.893642, 0.257914, -1.411057, -0.104428, -0.426969, 0.550428, -0.296703, -0.121596, -0.078056, -0.618105, -0.411589, 0.082553, 0.195061, -1.649907, -0.100013, 0.050459, -0.596096, -0.251452, -0.258973, 0.791267, 0.542063, 0.409669, -0.774771, 0.285318, 0.087474, -0.228510, 0.617695, 0.119733, 0.857725, 0.470551, -0.423073, -1.073370, -0.682661, 0.583752, -1.010966, 0.549648, 0.363469, 0.536933, -0.098827, 0.530962, -0.083320, 0.680494, -0.478344, -0.439272, -0.017448, -0.675182, -1.355143, -0.257241, 0.545332, -0.727517, -0.622415, -0.363932, -0.876596, -0.560652, -0.514785, -0.348532, 0.633028, 0.090401, -0.271561, -0.148492, -0.612896, 0.399832, 0.297191, 0.120373, -0.372140, -0.202636, -0.004577, -0.572023, -0.512241, -0.290261, -0.445943, -0.621089, -0.302971, 0.297702, 0.194386, 0.404184, -0.171564, -0.189514, 0.348218, -0.296645, -0.420867, 0.884206, -0.336609, -1.351162, 0.464425, -0.100982, -0.163061, -0.178655, -0.320813, -0.716368, 0.026697, -0.225283, -1.057108, -0.907151, -0.434412, -0.683308, -0.188573, 0.310853, -0.597298, 0.037464, -0.079391, 0.207035, 1.332436, -0.098775, -0.450545, -0.344307, 0.470313, -0.192393, 0.081689, 0.245385, 0.038536, -0.381555, -0.516637, -0.441384, -0.923345, -0.560793, -0.095668, -0.105135, -0.117603, 0.118424, 0.522579, -0.070507, 0.279357, 0.194525, 0.140289, -0.790819, -0.046650]
-,        [-0.361469, -0.600096, 0.013153, 0.621700, 0.815489, 0.040073, 0.467177, -0.540045, 0.137085, 0.601698, 0.398065, 0.029601, -0.073805, -0.860840, -0.210439, -1.049017, 0.817443, -0.812217, 0.455236, 0.223291, -0.000848, -1.168998, -0.052950, -1.039495, -0.265501, -0.800081, 0.100893, -0.379015, 0.657098, 0.173064, 0.499429, 1.008341, 1.445822, -1.578651, -0.751192, -0.724897, -0.424806, -1.081794, 0.139469, -0.568316, 0.212499, -3.145016, -0.949100, -3.087924, -0.125631, -0.196211, 0.968166, -0.326100, 0.560081, -0.766129, -0.964419, -1.022790, -0.273695, -1.342647, -0.898896, -0.673932, -0.068113, -0.834992, -0.210195, -1.427268, -0.791961, -0.880702, -0.994943, -0.724014, 0.783834, -1.960049, 1.065650, -0.085927, 0.952276, -0.039391, 0.080343, 0.260325, -0.102484, 0.160244, -0.032887, -0.655013, 0.706483, -0.294247, -0.577268, -0.327214, 0.408209, -0.144012, -0.343186, -0.245829, -0.410123, -0.748195, 0.099615, -0.030298, -0.390966, 0.526333, 0.173175, -0.069187, -0.116014, 0.095596, -0.007551, -0.336743, 0.286391, -0.407059, -0.263219, 0.133639, 0.049762, -0.761046, 0.229307, -0.685476, 0.003952, -0.528326, 0.192006, -0.090279, 0.452600, 0.031872, -0.094356, -0.278818, 0.147215, -0.573684, 0.167100, -0.167032, 0.744486, 0.402423, 0.422187, 0.104098, 0.561730, -0.358709, -0.262435, -0.402720, -0.127247, -1.112512, -1.608961, -0.931073, -0.871861, -0.427549, -0.678826, -0.353666, -0.388339, 0.054062, -0.112467, 0.171427, -0.440895, -0.185926, -1.155820, -1.245835]
-,        [-0.840656, 0.063972, 0.027030, -0.224422, 0.130252, 0.245757, -0.843072, 0.141066, 0.243564, 0.843943, -0.550057, 0.586542, 0.395379, 0.543657, -0.563065, 0.370933, -0.213990, -0.289490, 0.582855, 0.168274, -0.480625, 0.217123, -0.784187, 0.031440, 1.375357, -0.529885, -0.463216, -0.377415, 0.031138, -0.446063, -0.525084, -0.111409, 0.412686, -0.770878, -0.761752, -0.163329, 0.070949, 0.086449, -0.397373, -0.750697, 0.388610, -0.270845, -1.177796, -0.702434, -0.800602, -0.591662, 0.160111, 0.101636, 0.611821, -0.278893, -0.204781, 0.600651, -0.501108, 0.151420, -0.284075, -0.712207, -0.269634, -1.117149, -0.516721, -0.153451, -0.167552, 0.256490, -1.306765, 0.406813, -0.573938, -1.018594, -0.736228, -0.742639, -0.065041, -0.119560, -0.021230, 0.593532, -0.863720, 0.310609, -0.328445, -0.160034, 0.222006, 0.391024, -0.424068, 0.297761, -1.283239, 0.748787, 0.649620, -0.225541, -0.405884, -0.093564, -0.680114, 0.103118, -0.464638, -0.103093, -0.589863, -0.070862, -0.663060, -0.156397, -0.477129, -0.210473, -0.726305, 0.589258, -0.563388, -0.199529, -0.346055, -0.190581, -0.541371, 0.297876, -0.785913, 0.508048, -0.120036, -0.370425, -0.999022, 0.156433, -0.834916, 0.217700, -0.997457, 0.277056, 0.189440, 0.793719, -0.439514, -0.699201, -0.395547, 0.297611, 0.098112, 0.071661, 0.181048, 0.240579, 0.063032, 0.216492, 0.268899, 0.695970, -0.384920, -0.708866, -0.719038, -1.032282, -1.154516, -1.131287, -0.640458, -0.487318, -0.355280, -0.879212, -2.588947, -0.016989]
-,        [-0.512645, 0.147346, -0.045693, -0.145813, -0.178885, -0.033466, -0.113345, -0.293332, 0.005559, -0.109622, 0.134260, 0.006926, -0.024602, 0.219548, -0.245365, -0.490941, 0.285193, -0.297952, 0.069941, -0.477701, -0.293907, 0.288545, -0.402992, 0.179265, 0.118625, 0.005701, 0.215714, 0.027339, 0.093678, -0.257125, 0.220278, 0.417504, -0.185515, 0.039344, -0.122836, 0.161121, -0.533710, -0.085533, -0.242511, 0.170575, -0.042650, -0.038821, -0.521128, -0.357472, -0.167088, -0.143877, 0.100910, -0.077550, -0.156070, 0.068882, 0.430695, -0.167158, 0.194768, 0.021970, 0.108514, -0.099385, 0.405928, -0.511373, -0.248798, -0.173370, -0.063166, 0.052911, 0.176225, -0.065768, -0.215710, 0.318882, 0.392873, 0.201915, 0.078033, 0.035276, -0.357678, 0.007051, -0.306499, 0.297985, -0.192552, -0.118848, -0.250943, -0.790911, -0.099576, 0.041071, -0.321962, 0.135704, -0.073305, -0.341481, -0.125549, -0.322897, -0.632193, -0.093103, -0.512456, -0.098482, -0.217170, 0.151801, -0.255012, -0.304253, -0.260318, -0.316121, 0.227949, -0.203786, 0.051101, -0.089287, -0.216343, -0.469027, -0.059185, -0.005406, 0.137935, -0.081477, 0.353421, -0.085047, -0.369123, -0.099457, 0.131230, -0.368710, -0.075918, 0.229901, 0.112668, 0.194429, 0.033651, -0.303996, -0.264536, -0.370676, -0.348361, -0.122877, -0.416553, -0.365420, -0.182521, -0.190975, -0.404400, 0.056119, -0.014606, -0.096282, -0.352316, -0.013502, -0.189361, 0.285707, 0.102176, -0.199306, 0.084551, -0.009361, -0.300679, -0.146277]
-,        [-0.362138, 0.476512, 0.240036, -0.197690, -0.444387, 0.146432, 0.303316, 0.378041, 0.856841, 0.547371, 0.159434, 0.797832, -0.152687, -0.074089, 0.107830, -0.291346, -0.104391, 0.685394, 1.061644, 0.510033, 0.463630, 0.774592, 0.984977, 1.195580, 0.053215, -0.482644, 0.508586, 0.334242, 0.393376, 0.606576, 0.068089, 0.570058, 0.113156, 0.040190, 0.726932, 0.341443, -0.037859, 0.400061, 0.600523, 0.638629, -0.288345, 0.016963, -0.305165, 0.376831, 0.189616, 0.116997, 0.511537, 0.175899, -0.395977, 1.035444, 0.156788, -0.361352, 0.153063, -0.324641, 0.585428, 0.706742, 0.473687, -0.410558, 0.079574, 1.047667, 0.692675, 0.433699, -0.235152, 0.303105, -0.707296, 0.420750, 0.165207, 1.298953, 0.091813, -0.753738, -0.886231, -0.569914, 0.454033, -0.182007, -0.222649, 0.576814, -0.043030, -0.048790, -0.341775, -0.182532, 0.463869, -0.490902, 0.050392, -0.313331, 0.290565, 0.039768, 0.310563, 0.030032, 0.119641, 0.281469, -0.644401, 0.026218, -0.264852, 0.337117, 0.270296, -0.296699, 0.289215, 0.090004, 0.646724, -0.311343, -0.488352, -0.395452, -0.096220, 0.000923, 0.367131, -0.484268, 0.497720, -0.128669, -0.411929, 0.010238, -0.468758, -0.501878, 0.207098, 0.630714, 0.397699, -0.807097, -0.097070, -0.352410, -0.145375, 0.077735, -0.454031, -0.202424, -0.136251, -1.417458, -2.041908, -0.925656, -0.550399, -0.427931, -0.087039, -0.049825, -0.045704, -0.350714, -0.384788, -0.180744, -0.027886, -0.033024, 0.418197, 0.375682, -0.139968, -0.913630]
-,        [0.564177, 0.441677, -0.939257, 0.246561, 0.841722, 0.515364, -0.755621, 0.254305, 0.260965, 0.079599, -0.370661, 0.115225, 0.113449, 0.817326, 0.736542, -1.183556, -0.612344, 0.115399, 0.127650, -0.513696, -0.046435, -0.193857, -0.005414, 0.656696, 0.208999, 0.262022, -0.174114, 0.282971, 0.249190, 0.036349, 0.220626, 0.906843, -0.386302, 0.441852, 0.388324, -0.322087, 0.183780, 0.333332, 0.005640, 0.179734, -0.027881, -0.408449, -0.137668, 0.275740, 0.001504, 0.146081, 0.151319, 0.376135, 0.203451, 0.496494, 0.348792, 0.082038, 0.339315, 0.363401, 0.156324, 0.006310, 0.071447, 0.852522, 0.628564, 0.351451, -0.085451, 0.236031, 0.550206, 0.200285, -0.180244, 0.320231, 0.220920, 0.586634, 0.387244, -0.341209, 0.119793, 0.107746, 0.635802, -0.514904, -0.386486, 0.238345, 0.544210, -0.409848, -0.551442, -0.237152, -0.272175, 0.218858, -0.356891, -0.398636, 0.595597, -0.406751, -0.452351, 0.389195, 0.852005, -0.512707, 0.308073, 0.514112, 0.129554, 0.076896, -0.718120, 0.571701, 0.263654, -0.298175, -0.319076, 0.229792, 0.545761, 0.126866, -0.770998, -0.075954, 0.538952, 0.094292, -0.188171, 1.070182, 0.334692, -0.145907, -0.763385, -0.069736, -0.317816, 0.676085, 0.064547, 0.579065, 0.450285, -0.300758, -0.319826, -0.321934, 0.076367, -0.207935, -0.873623, -0.148079, 0.332171, -0.404049, -0.166983, 0.009081, -0.458100, 0.348226, -0.568990, -0.478770, -0.024234, 0.063517, -0.160785, 0.207345, -0.457988, -0.967765, 1.082174, 0.209578]
-,        [-0.910699, -0.152602, -0.579375, -0.109937, 0.363621, 0.301815, -0.188122, 0.103803, 0.468143, 0.358790, 0.026423, -0.719132, 0.758634, -0.733933, 0.191758, 0.441481, -0.442971, 0.922845, 0.418674, -0.893191, 0.232946, -1.064748, 0.041620, 0.514579, -0.012194, 0.283201, 0.951347, 0.413632, 0.014371, 0.829056, -1.053522, -0.711878, 0.352632, 0.648770, 0.034441, 0.205128, -0.085169, -0.320383, 0.288402, 0.732897, 0.362702, -0.195756, -0.546950, 0.923889, -0.604860, -0.463150, -0.359695, -0.130504, -0.135725, 0.178210, 0.098796, -0.729647, 0.321631, 0.239588, -0.524215, 0.409900, 0.161740, 0.236043, -0.766963, -0.112920, -0.150306, -0.364977, -0.157169, 0.199262, -0.646918, -0.826899, 0.838423, -0.204173, -0.586128, -0.710433, -1.354914, 0.395899, -0.939329, -0.237098, -0.705917, -0.802912, -0.967270, 0.185213, -0.575519, 1.012864, 0.060801, -0.451866, -0.229773, 0.521222, 0.944693, -0.506910, -1.005160, 0.386383, -0.408477, 0.068894, 0.223257, -0.565067, 0.723602, -0.747627, -0.761438, -0.312607, -0.085344, -0.338698, 0.445356, 0.090918, 0.895875, 0.061757, -0.124010, 0.469778, 0.313782, 0.437141, -0.632220, -0.640370, 0.382794, -0.545749, -0.194254, 0.075986, 0.790731, 0.087532, -0.133226, -0.027445, 0.339030, 0.831306, -0.607455, 0.931785, 0.263843, 0.302344, 0.010918, 0.090286, -0.078383, 0.013087, 0.062295, -0.230399, 0.019484, -0.964935, -0.082785, -1.268235, -0.540406, -0.661424, -0.986968, -0.463063, 0.354463, -0.334523, -1.801428, 0.061715]
-,        [-0.333959, 0.343388, -0.026811, -0.214643, -0.050609, 0.257887, 0.938866, 0.809384, 0.247368, 0.536190, 0.184550, -0.418647, -0.385351, 0.314403, 0.410751, 0.762620, -0.906096, 0.188386, -0.115785, 0.232182, -0.431906, -0.374527, -0.555561, 0.857619, 0.057855, 0.798252, 0.041009, 0.325321, 0.169433, 0.007448, -0.273958, 0.482527, 0.552130, 0.147994, 0.067601, -0.450960, -0.375782, 0.037464, -0.344237, -0.309255, 0.464719, -0.152033, 0.166643, -0.564525, 0.651959, 0.089023, 0.085359, 0.983258, 0.367623, 0.638596, 0.011996, -0.444661, -0.347799, -0.292966, 0.526421, -0.589536, 0.472277, -0.073314, 0.354722, 0.179923, -0.442808, 1.047789, -0.398897, 0.222375, 0.356018, -0.661466, -0.400043, 0.354762, -0.423251, 0.197603, -0.343248, 0.136711, 0.164593, -0.286027, -0.196997, -0.002373, 0.122706, 0.076356, 0.038383, -0.435502, 0.087311, 0.276754, -0.559260, 0.274428, -0.614136, -0.715158, 0.696708, 0.711732, -0.188215, -0.475146, -0.121827, 0.203231, -0.843876, -0.243223, 0.446076, 0.258019, 0.168521, 0.358979, -0.443752, -0.222513, -0.462613, -0.082090, 0.091625, -0.712476, -0.930954, 0.087067, -0.698911, -0.516022, -0.103082, 0.441426, 0.491524, 0.201152, -0.174909, -0.005889, 0.041700, -0.347225, -0.718769, 0.434880, -0.050209, -0.098672, -0.928020, -0.141871, -0.100185, -0.137722, -0.067757, 0.190198, 0.099408, 0.281364, -0.121898, 0.740417, 0.473613, 0.652927, -0.150939, 0.204924, -0.202109, -0.200262, 0.536497, 1.022100, -0.152239, 0.263852]
-,        [-0.195919, 0.324669, -0.130792, 0.064460, 0.284674, -0.811373, -1.213869, 0.422595, -0.001884, 0.349579, 0.223312, -0.335952, -0.102126, 0.061002, -0.046618, -0.061395, -0.049955, 0.319472, -0.263106, -1.038372, 0.821787, 0.172277, -0.103967, -0.270960, -0.364471, -0.016810, 0.008601, -0.323211, -0.699184, 0.275798, -0.009079, 0.577434, 0.258896, -0.225423, 0.912901, -0.520291, 0.463309, 0.876186, -0.278163, 0.372469, 0.143697, 0.300183, -0.656941, -0.726441, -1.105173, 0.176482, 0.338578, -0.425188, 0.697230, 0.346700, -0.407740, 0.024170, 0.647399, 0.721753, 0.294909, -0.619070, -0.024057, -0.332387, -0.861157, -0.633802, -0.169914, -0.433172, 0.158083, -0.538141, -0.191885, 0.724885, 0.080004, -0.433762, -0.697094, 0.227657, -0.716575, -0.453696, -0.904740, -0.680881, -0.356008, -0.511606, 0.067838, 0.067526, -0.302903, -0.244309, -0.623070, -0.600144, -0.673399, -0.120704, -0.078977, -0.153408, 0.320800, -0.080319, -0.088082, -0.101235, -0.458541, -0.251676, -1.068473, -0.409321, -0.795241, -0.436897, -0.086459, 0.081439, -0.396824, -0.751333, -0.519260, -0.824964, 0.146847, -0.620360, -0.514681, 0.054643, -0.258969, 0.010805, 0.219202, -0.613885, -0.363519, 0.464841, -0.361173, -0.748572, 0.011169, -0.061487, -0.357484, -0.224621, -0.421663, -0.532454, -0.036340, -0.474008, -0.633448, -0.219086, -0.287521, -0.226771, 0.163539, -0.084918, -0.162879, -0.169101, 0.090795, 0.167836, 0.013384, 0.066897, 0.307051, -0.301913, -0.555208, -1.404248, -2.625870, -0.355387]
-,        [0.179403, -0.634968, -0.160073, -0.476003, 0.206296, 0.339916, 0.942438, -0.134269, 0.039596, 0.169394, 0.540640, 0.589633, 0.111786, -0.960807, 0.053699, 0.189883, 0.060720, 0.725796, 0.464304, 0.741698, 0.097309, 0.113261, 0.495387, 0.547018, 1.514482, 0.233109, -0.393990, -0.179219, -0.538611, 1.594767, 0.514725, 1.109726, 0.622101, -0.098693, 0.142972, -0.101612, -0.770148, -0.799749, 0.592856, 0.486029, 0.778315, -0.349282, -0.281215, 0.668890, 0.869441, -0.052247, 0.578185, -0.048041, -0.309324, -0.374596, 0.362309, 0.853138, 0.620456, 0.346061, 0.239439, 0.704331, -0.205535, 0.148889, 0.440688, 0.581501, 0.190095, -0.402323, 0.074006, -0.252159, -0.422395, 0.983322, 0.276421, 0.211003, 0.731113, 0.097089, 0.157310, 0.022852, 0.337095, 0.073252, -0.414827, -0.104146, -0.261737, 0.272835, 0.066404, 0.444707, -0.123379, -0.296404, 0.254550, -0.669788, 0.267951, -0.007876, 0.171188, -0.380567, -0.050210, 0.583079, -0.224773, 0.221250, -0.155469, -0.500360, -0.289050, -0.038388, -0.038972, 0.022921, 0.320465, 0.020209, -0.061899, -0.881194, -0.085933, -0.001558, 0.252588, 0.121356, -0.198122, -0.668132, -0.253770, 0.075839, -0.616635, -0.072293, 0.631908, 0.244215, 0.233187, 0.216124, -0.151754, 0.103138, 0.338089, 0.364768, 0.261662, -0.119304, -0.156049, -2.134429, -1.823461, -1.027921, -0.569518, -0.196808, -0.499702, -0.090135, -0.174646, -0.014638, -0.196235, 0.172462, -0.014835, 0.165809, 0.369094, 0.820044, 0.129148, -0.778282]
-,        [0.777056, 0.821112, 0.049773, 0.298955, 0.333835, 0.238960, -0.037907, 0.239879, 0.901003, 1.077463, -0.110209, 0.121078, -0.128041, -0.356226, 0.470593, -1.812578, 1.806574, -0.047685, 0.663677, 0.109208, 0.761272, 0.273941, -0.329504, 0.606774, 0.729789, 0.536345, 0.398212, 0.575474, 0.325930, 0.660337, -0.196619, 0.144932, -0.008481, 1.074684, -0.704928, 0.408007, 0.333766, 0.586953, 0.535162, 0.899662, 0.106737, 0.201186, -0.415680, 1.885435, 0.249590, 0.528229, 0.160461, 0.604319, 0.361094, 0.841273, 0.369159, 0.884137, 0.726898, 0.978433, -0.239714, 0.886741, -0.115798, 0.567226, 0.515369, 1.020331, -0.173170, 0.448415, 0.168303, 0.988365, -0.274966, 0.407276, 0.436510, 0.709896, -0.334113, 0.081173, 0.402489, 0.870509, -0.725986, 0.697767, -0.008303, 0.482162, -0.639321, 0.151153, -0.272410, 0.171905, -0.346554, 0.375979, -0.175865, -0.524905, -0.439873, -0.111510, 0.349768, -0.201694, -0.728803, 0.207893, 0.066682, 0.266508, -0.489967, 0.193125, -0.416345, 0.334390, -0.212465, 0.199084, 0.079968, 0.257699, -0.677523, 0.406648, -0.484082, 0.255777, -0.046050, 0.315917, 0.262239, 0.690667, -0.243752, 0.032038, -0.016533, 0.660176, -0.869609, 0.216948, -0.253146, 0.652188, 0.026887, 0.027104, -0.298156, -0.223546, -0.645878, -0.212254, -0.494841, 0.136965, -0.361766, -0.131493, 0.285298, -0.051910, 0.040980, 0.408458, -0.168282, 0.379340, 0.156274, 0.142068, -0.547898, -0.201921, 0.409860, 0.261799, -0.078010, 0.593580]
-,        [-0.259708, -0.748893, 0.034131, -0.148562, 0.302648, -0.325784, -0.002890, 0.014953, 0.560602, 0.729971, 0.061280, 0.416057, -0.533058, -0.387205, 0.453549, 0.345973, -0.612903, -0.384864, 0.650051, -0.381289, 0.476763, 0.709135, -0.379469, 0.154450, 0.877640, 0.565739, 0.751539, 0.525367, 0.063698, 0.465284, -0.788906, 1.100157, -0.190772, 0.164485, 0.440085, -0.042910, 0.169530, -0.220578, -0.344337, 0.797916, 0.020843, 0.313503, 0.593778, -0.058445, -0.912651, 0.237957, 0.897710, 0.427893, -0.738593, 0.421186, -0.040741, -0.480427, -0.334305, 0.572988, 0.149572, -0.016546, -0.284607, 0.631778, -0.161607, 0.462314, -0.044091, -0.583952, -0.277518, -0.157851, 0.443588, -0.168271, 0.603782, -0.174268, -0.402825, -0.234514, -0.590570, -0.014324, 0.554373, -0.352593, 0.518223, 0.252613, 0.032415, -0.353836, 0.097632, -0.002683, 0.321078, -0.906373, 0.510212, 0.365840, 0.038900, -0.903734, -0.375720, -1.435299, -0.376583, -0.298512, 0.085368, -0.173639, 0.675134, -0.521723, 0.450216, -0.110422, -0.163246, -0.044331, 0.465344, -0.236222, -0.120629, 0.174124, 0.126380, -0.364652, -0.292731, -0.319343, -0.317679, 0.363398, 0.325963, 0.149456, 0.203952, -0.211041, -0.389556, -0.794214, 0.597466, -0.342001, -0.545193, -0.388640, -0.288251, 0.385264, 0.108681, -0.041646, -0.822763, 0.182910, -0.535228, -0.155164, 0.138198, 0.192721, -0.342852, 0.394644, -0.156983, -0.189885, -0.284714, -0.547091, -0.414247, -0.287554, -0.280097, 0.085843, 0.405747, 0.128372]
-,        [0.487822, 0.943952, 0.087835, 0.373686, 1.071601, 0.358480, 0.577425, -0.637495, 0.733974, -0.309451, 0.833482, -0.097121, 0.326997, -0.148043, -0.382349, 0.271780, -0.339475, 0.594302, -0.055158, 0.427188, 0.616058, 0.168567, 0.546279, 0.121652, 0.147308, 0.591345, 0.374292, -0.647438, 1.036039, 0.193072, -0.161457, -0.458514, 1.411168, 0.115252, 0.354930, 0.661913, 0.492435, -0.173229, 0.250372, -0.536973, 0.701799, 0.822631, -0.392382, 0.222470, 0.262813, 0.875070, 0.265796, 1.277609, 0.415103, 0.486790, -0.117146, 0.961384, 0.122550, 0.911176, 0.704863, 1.903720, 1.063660, 0.529335, 0.199265, 0.523096, 0.880694, 0.531529, 0.805597, 1.328376, 0.931648, 0.466789, 0.223263, 0.356226, 0.079849, 0.360459, -0.206789, -0.285307, 0.007597, -0.294021, 0.376242, 0.214682, 0.278218, -0.152682, 0.008929, 0.523977, -0.939968, 0.169428, -0.411522, -0.500243, -0.249909, -0.028972, 0.221353, 0.124593, 0.207021, -0.156123, 0.006455, 0.252975, -0.365462, 0.223181, -0.071693, -0.299101, -0.393872, -0.014362, 0.062345, -0.023016, 0.360259, 0.148203, 0.260127, -0.499103, -0.333161, -0.688817, -0.462880, 0.132960, -0.234812, 0.000041, -0.011117, 0.441463, 0.229584, -0.397608, 0.359588, 0.253715, -0.342239, 0.174476, 0.029545, -0.390652, 0.069456, -0.502609, -0.000178, -1.467124, -1.133596, -0.299453, -0.424489, -0.316315, -0.292683, -0.212374, -0.019937, -0.129869, -0.015879, -0.008245, -0.009569, 0.063159, -0.270577, 0.512042, 0.336287, -0.847294]
-,        [-0.212108, 0.349465, 0.038222, 0.775325, 0.228532, -0.122218, 0.380314, 0.364848, -0.621759, -0.154995, -0.102726, -0.302056, -0.622266, -0.481608, 0.346394, -0.381904, 0.626318, -0.017453, 0.592406, -0.001812, 0.935004, -0.282680, 0.534068, 0.838573, -0.068493, -1.169597, 1.257990, 0.165592, -0.540378, 0.355994, 0.440960, 0.083987, -0.049972, -0.027073, 0.552295, 0.990320, 1.134181, -0.148043, -0.446199, -0.265648, -0.587987, -0.556448, -0.622981, -0.886163, 0.151511, 0.207034, -0.035922, 0.382251, -0.133356, 0.671854, -0.412887, -0.076821, 0.323668, -0.027308, -0.108068, 0.336219, -0.484509, -1.569413, -0.739896, -0.602495, 0.051927, 0.303999, 0.137028, 0.096651, -0.211814, -0.921351, 0.381268, -0.172118, 0.215505, -0.493057, -0.303830, -0.005801, -0.075795, 0.158319, 0.384397, -0.157201, 0.139428, 0.003672, -0.557308, -0.828491, -0.349077, -0.380914, -0.632774, -0.426778, -0.516501, -0.323242, -0.973302, -0.844187, -1.076725, -0.405889, -0.051685, 0.571103, 0.398037, 0.086504, -0.832037, -0.563140, -0.127755, -0.566596, 0.168646, 0.171823, 0.402470, -0.668224, 0.050610, -0.258044, 0.387401, -0.346708, -0.561931, -0.527913, -0.720931, 0.161497, -0.376324, -0.588567, 0.018900, -0.605480, -0.532438, -1.164333, -0.188993, 0.138216, -0.101638, 0.128775, 0.082950, -0.138310, -0.043167, -0.287821, -0.273626, -0.327070, 0.212214, 0.483853, -0.572429, -0.157727, -0.592266, -0.418545, -0.394013, -0.720252, -0.557900, -0.321804, -0.075557, 0.801903, -0.409739, 0.013297]
-,        [0.605803, 0.089862, -0.240060, 0.381084, -0.080917, -0.516272, 0.882268, 0.045578, -0.308533, -0.073284, 1.202130, 0.125373, 0.948931, 1.002242, -0.036012, -0.389867, -0.465387, -0.416118, -0.350477, 0.127545, 0.921879, -1.253106, 0.259256, 0.505291, 0.679286, 0.399739, 0.141412, 0.170717, 0.045047, 0.639426, 1.219901, 0.974558, 0.547871, 0.804107, -0.015794, -0.483934, -0.147074, -0.432869, -0.078980, -0.538076, -0.547473, -0.865828, -0.027907, -0.697632, 0.136146, 0.114252, -0.063155, 0.076942, 0.529554, 0.288802, 0.259366, -0.058194, -0.021726, -0.901436, -0.742378, -0.051375, -0.492493, 0.609916, 0.399045, 0.693268, 1.511483, 0.415471, 0.141760, 0.372232, -0.428349, -0.265962, 1.047945, 1.504773, -0.228414, -0.239164, 0.123502, -0.434602, -0.456365, 0.036727, 0.101080, 0.052256, -0.356826, -0.691375, 0.414564, 0.215470, -0.254053, 0.035336, 0.160041, 0.407762, -0.080629, 0.592742, 0.382184, 0.458946, 0.037323, 0.608459, -0.263826, -0.075239, 0.133500, 0.227794, -0.030281, 0.076388, -0.067434, 0.135440, 0.620324, -0.031530, -0.440813, 0.467323, -0.004474, -0.276805, -1.081262, 0.142508, -0.302618, -0.239412, -0.184346, -0.244589, 0.785428, -0.635075, -0.293021, 0.274495, 0.282345, 0.394607, 0.262831, 0.058738, 0.074991, -0.059348, 0.335995, 0.248160, 0.111115, -0.598979, -0.135627, -0.228764, -0.210318, 0.145229, -0.471763, -1.511460, -1.288224, -1.270936, -0.515442, -0.180347, -0.283128, -0.347499, 0.450413, 1.029982, -0.961529, -0.487447]
-,        [-0.430691, 0.061836, 0.127156, 0.330624, 0.974157, 0.021097, 0.479983, -0.293387, -0.183083, -0.131769, 0.436625, -0.027416, 0.106731, 0.069847, -0.132383, 0.058032, 0.078735, 1.682266, -0.103016, -0.464473, 0.741807, 0.536508, 0.683235, 0.537025, 0.349743, -0.696611, 1.107692, -0.445631, -0.936745, -0.055975, -0.613136, -0.079007, -0.358538, 0.309887, 0.651721, 0.652316, -0.384106, -0.227620, 0.077786, 0.476114, -0.991301, -1.201499, -0.846461, -0.491399, -0.188962, -0.251298, -0.071251, 0.586303, 0.997611, 0.165223, 0.639650, 0.043654, -0.093163, -0.116811, -0.767320, 0.113828, 0.044751, 0.642551, 0.016657, -1.459462, 0.667605, -0.864490, -0.149723, -0.939308, -0.019712, 0.578095, 1.411342, -0.558576, -0.173143, -0.486010, 0.061686, -0.185631, 0.227893, -0.920386, -0.914071, 0.462371, -0.187815, -0.195932, -0.271376, -0.580702, -0.277860, 0.128197, 0.421939, -0.163721, -0.179683, -0.810986, -0.471572, -0.795047, -0.152469, 0.113613, -0.511229, -0.622694, -0.067829, -0.017868, 0.521273, -0.305330, 0.015712, -0.463695, -0.922129, -0.593243, -0.334944, -0.243682, -0.881642, -1.011581, -0.829523, 0.030061, 0.346090, -0.343679, -0.179151, -0.298747, -0.098712, 0.017067, 0.085729, 0.711792, 0.353442, -0.006229, 0.120721, -0.038761, -0.086866, 0.922002, -0.036375, 0.015068, -0.068018, -0.407217, -0.026236, -0.281492, 0.048184, -0.899356, -0.433692, -0.626164, -0.649587, -0.031527, -0.240852, -0.315863, 0.053532, 0.126169, -0.839199, 0.321925, -0.045330, -0.072397]
-,        [0.092323, 0.568546, -0.127024, 0.441686, -0.038457, -0.014700, 0.448427, -0.334880, -0.215068, 0.086598, -0.463856, 0.755406, -0.161977, -0.506870, 0.092057, -0.162984, 0.208279, 0.736396, 0.085218, -0.597619, -0.393115, 0.384628, 0.508293, 0.332903, 0.170057, 0.356634, -0.491669, 0.279398, 0.304846, 0.263081, 0.943361, 0.070877, -0.184719, 0.903995, 0.775582, 0.842660, 0.396601, -0.276129, 0.822114, 0.215339, -0.145761, 0.293249, -0.078749, -0.234146, -0.741081, 0.275089, 0.337232, 0.401050, 0.104070, -0.293350, -0.383362, 1.009619, 0.341839, 0.276951, 0.752481, -0.185472, -0.221112, -0.104164, 1.217543, -0.175811, -0.247646, -0.275691, 0.373437, 0.395203, 0.547641, -0.123380, 0.328364, -0.775432, 0.191648, 0.280805, -0.125380, -0.433336, -0.086729, -0.121282, 0.129747, -0.103022, -0.020039, -0.271223, -0.599179, -0.723580, 0.178112, -0.079299, 0.734183, 0.404820, -0.790656, -0.664236, 0.165036, -0.650728, 0.167382, -0.317164, -0.211252, -0.205302, -0.111875, 0.354543, 0.127352, 0.029116, -0.394990, 0.253582, 0.033789, -0.249782, -0.339140, -0.029245, 0.249548, -0.616651, 0.441953, -0.312617, -0.940114, -0.164036, 0.406398, 0.063635, -0.085484, -0.928378, 0.517270, 0.027290, 0.186779, 0.279300, -0.150803, 0.379670, -0.479528, -0.257458, -0.212511, -0.347093, -0.416751, -0.399768, -0.873181, 0.107123, 0.332344, -0.226388, 0.024925, 0.192681, 0.031764, -0.307167, -0.176083, 0.140284, 0.027294, 0.079792, -0.165262, 0.543775, 0.180050, -0.531588]
-,        [-0.007919, 0.506287, -0.355119, 1.146391, -0.244782, -0.251325, -0.743908, 0.581607, 0.486017, 0.614704, 0.315264, -0.395550, 0.181541, 0.541057, -1.211566, -1.393841, 0.908428, 0.146711, 0.243578, -0.422935, 0.372411, 0.304600, 0.325620, 0.201230, 0.647259, 0.826883, 0.199253, 0.646822, 0.193618, 0.289732, 0.635402, -0.123881, 0.291802, -0.174950, 0.993815, 0.234432, 0.940019, -0.412297, -0.149143, -0.003797, 0.734250, -0.071541, 0.554551, 1.018812, 0.429824, 0.261769, 0.426705, 0.624220, 0.347138, 0.150685, 0.553467, 0.682285, 0.035191, 0.844952, -0.549152, -0.695509, -0.339244, 0.234156, -0.057095, 0.934270, 0.184838, 0.940148, 0.011925, 0.069171, 0.118343, 0.125070, 1.028235, 0.558268, 0.495000, -0.386723, 0.021967, -0.179975, -0.193712, 0.577625, 0.007679, 0.021651, 0.072575, -0.355335, 0.351407, -0.159591, -0.114635, -0.110621, 0.988686, 0.256765, -0.168208, 0.279468, 0.625993, 0.811832, 0.521222, -0.014653, -0.257377, -0.097946, -0.220308, -0.115163, -0.575008, 0.050797, -0.207166, -0.142130, 0.768914, 0.183391, -0.417837, -0.469970, 0.090285, -1.005255, -0.416734, 0.177547, 0.190469, -0.111573, -0.409939, -0.220653, 0.166539, -0.365081, -0.432981, -0.744632, -0.103423, -0.387334, -0.406092, -0.813046, -0.173800, -0.532800, -0.732077, -0.148625, -0.272774, -0.167023, -0.449799, -0.286548, -0.267440, -0.088842, 0.161246, -0.001571, -0.172990, 0.241096, 0.360600, -0.100408, 0.078206, 0.257373, 0.921394, -0.684147, -1.295360, 0.114559]
-,        [-0.088061, -0.130885, 0.737408, -0.062673, 0.763513, -0.025880, -0.322428, -0.161312, -0.034505, -0.160076, -0.222767, -0.256875, -0.130477, 0.028677, 0.296162, 0.403100, 0.097861, -1.395307, -0.998232, -1.017331, -1.234768, -1.212805, -1.897103, -2.924004, -1.059011, 1.737633, 1.939236, 1.670770, 1.503073, -0.592295, -1.024662, -2.322391, -0.880890, 1.530252, 1.615362, 1.602653, 1.809515, -2.818780, -1.141974, -1.504546, -0.614384, -3.621560, -1.506006, -1.653036, -1.976048, -2.276185, -1.713098, -1.717521, -1.034839, -0.585027, -1.234821, -2.220530, -0.350135, -1.634735, -1.897633, -1.715799, -1.312662, -1.424636, -1.009892, -1.190084, -1.000409, -0.788247, -1.036082, -1.607342, -1.197268, -1.100588, -1.445650, -1.605489, -0.946293, -0.018263, -0.141080, 0.041594, 0.194672, -0.082055, 0.046901, -0.186434, 0.130164, -0.243495, -0.060096, -0.147316, -0.073332, 0.035841, 0.076472, -0.139590, -0.014998, -0.130005, -0.146001, 0.000305, 0.033366, -0.040226, 0.141817, 0.093812, -0.007814, 0.103431, 0.154045, 0.069313, -0.140954, 0.048360, -0.055505, -0.018410, 0.025559, -0.035820, -0.111713, 0.081087, 0.060448, 0.276855, -0.181465, 0.061023, -0.197384, -0.266191, 0.064378, -0.071210, -0.050207, 0.073544, 0.180238, 0.218918, 0.013507, 0.218772, -0.001363, 0.026977, -0.055939, -0.390286, -0.213291, -0.038197, -0.026858, 0.034397, 0.041224, 0.071714, -0.054571, 0.011364, 0.012288, -0.043573, 0.114277, 0.037851, 0.036444, 0.028183, -0.066417, -0.350791, 0.118416, 0.516471]
-,        [-0.634800, -0.617338, 0.534377, -0.196559, -0.024695, 0.286463, 0.303445, -0.109716, 1.310368, -1.075863, 0.728706, -0.527140, -0.902180, 0.448963, -0.372136, 0.088968, 0.089293, -0.955894, -0.123249, -0.476669, -0.792072, -0.572098, 0.106110, -0.072151, -0.631036, -0.110354, 0.294217, -0.173972, 0.583494, 0.923117, -1.288174, -0.203115, 1.140485, -0.505360, -0.979722, -0.036156, 0.566971, -1.074424, 0.129147, -0.380001, 0.315186, -0.847194, -1.009137, -1.632770, -1.448971, 0.434892, -0.222768, -0.409847, -0.641839, 0.059009, -1.056433, -0.208105, 0.637068, -0.986302, -0.463947, -0.742716, -0.512384, -0.071288, -0.941993, 0.308411, 0.770163, 0.411316, -0.890831, -0.925345, -0.547119, 0.562858, -0.600070, -0.408853, 0.162748, 0.140877, -0.615615, 0.148790, 0.197035, 0.474516, 0.335219, 0.157374, -0.023945, -0.657488, 0.069645, 0.069074, 0.174996, 0.013499, 0.083626, 0.272775, 0.104181, -0.043294, 0.165206, 0.436165, 0.825041, -0.263478, 0.299862, 0.151121, 0.146297, 0.014596, 0.121084, 0.008958, 0.133634, 0.036146, 0.030187, 0.380749, -0.713150, 0.394444, -0.231375, -0.027816, -0.337368, 0.474904, 0.170426, 0.802857, 0.279460, 0.533134, 0.237175, -0.034566, -0.405643, -0.071681, 0.278036, -0.089358, -0.603980, -0.552915, -0.022642, 0.260763, 0.691704, -0.225274, -0.011318, 0.130333, 0.296706, 0.489099, -1.246170, -0.503721, -0.649058, -1.432739, -0.453016, -1.248824, -0.427637, -0.690241, -0.253571, -0.338066, 0.357915, -0.056931, -0.523170, -0.521072]
-,        [0.215976, 0.552518, 0.483218, 0.303841, 0.268090, 0.607513, 1.083278, 0.395101, 0.482093, 0.506598, 0.741522, 0.162140, 0.348494, 0.554668, 0.386717, 1.132002, 0.774851, -2.675106, -2.315117, 1.122924, 0.973682, -2.165746, -1.839339, 1.262944, 0.898762, -3.962537, -3.145097, 0.469144, 0.164318, -5.816579, -5.171488, 0.303729, -0.096136, -3.909828, -3.802279, 0.465608, 0.321560, -2.467314, -2.079946, 1.289232, 1.020833, -6.168784, -6.252332, -0.861879, -2.206882, -5.903832, -5.385726, -0.341013, 0.248439, -5.875137, -5.829333, 0.066930, -0.202584, -5.895995, -4.211384, 0.228596, 0.177165, -2.502920, -1.987378, 1.245996, 0.744306, -6.081827, -4.767414, 0.207259, -0.039002, -6.125724, -5.463764, 0.027326, -0.096741, -0.033665, 0.030005, -0.037047, 0.097023, 0.052258, 0.109781, 0.055930, -0.100052, -0.002336, 0.063940, 0.027569, 0.025619, 0.027918, 0.091121, -0.015633, 0.034714, -0.059348, 0.062750, -0.045631, 0.034202, -0.040317, -0.053397, -0.024395, 0.132404, 0.142163, 0.019707, 0.029668, -0.068358, 0.011142, -0.030113, -0.007320, 0.011770, -0.018238, -0.080910, 0.018639, 0.081063, -0.089319, -0.071952, -0.020863, -0.007785, 0.003692, 0.140303, -0.137731, -0.028632, -0.139454, 0.020439, 0.067750, 0.161198, 0.156652, -0.132155, 0.036660, 0.121075, -0.924521, 0.058318, 0.036494, 0.020251, 0.059450, 0.055641, 0.097231, -0.015650, 0.045937, 0.149989, 0.060929, 0.172479, -0.025363, 0.068362, 0.060992, -0.001636, 0.641849, 0.499280, -0.084128]
-,        [0.461040, -0.504862, 0.371189, -0.294549, 0.652172, 0.376139, -0.611876, -0.113370, 0.800389, 0.144257, -0.746526, -0.908231, -0.323036, -0.530786, 0.581550, -0.302818, -0.851176, -0.095351, 0.131948, 0.741204, -0.150736, 0.441012, -0.197857, 1.114257, -0.315556, 0.515010, 1.057873, -0.480143, 0.125953, -0.762782, 0.403267, 0.232952, 0.196285, -0.309826, 1.046701, 0.273273, 0.595385, -0.300531, 1.259430, -0.161455, 0.240315, 0.011272, -0.650744, -0.156328, -0.058285, -0.116863, -0.873239, -1.103270, -0.102577, -0.371363, -0.102625, -0.145347, 0.161883, 0.134847, -0.115761, -0.046651, -0.205255, 0.763210, 0.286148, 0.488902, 0.096458, 0.461840, 0.920604, 0.118951, -0.832438, -0.081036, 0.535020, 0.831730, 0.023321, 0.309423, -0.750177, -0.210728, 0.158554, -0.050555, -0.070499, 0.041920, -0.503329, -0.325597, -0.399682, 0.393668, 0.497705, 0.180687, -0.082702, 0.161975, -0.006980, -0.169564, -0.621412, 0.429597, 0.502889, 0.235365, -0.096622, 0.587819, 0.372230, -0.247774, -0.435298, -0.294628, 0.193479, -0.077345, -0.237764, -0.172259, -0.363040, 0.781196, -0.182474, -0.417102, 0.242212, -0.372480, -0.427062, 0.051388, 0.037318, -0.217571, -0.335699, 0.239055, -0.831414, -0.006818, -0.648100, -0.269912, 0.068500, 0.176890, -0.728281, -0.373464, -0.237237, -0.292721, -0.530058, -0.417368, -0.360687, -0.010280, -0.242564, -0.316750, 0.280443, -0.284388, 0.338053, 0.095373, -0.171413, -0.584715, 0.323486, 0.033342, -0.004788, -0.808682, 0.487739, -0.123189]
-,        [-0.258047, 0.139719, 0.155738, 0.498022, -0.091644, 0.543546, -1.785737, 0.504317, 0.195388, 0.251551, -0.083155, 0.227309, -0.497914, 0.106022, 0.489418, 0.037939, -0.402563, -0.188223, 0.628927, 0.684659, 0.565637, 0.710513, 0.182330, 0.420955, 0.322585, 0.471350, 1.117616, 0.084251, -0.250322, 0.257288, 0.170338, 0.257555, 0.560236, -0.253586, -0.736497, 0.799397, 0.069621, -0.210597, 0.516074, 0.385035, -0.150514, -0.416718, -0.462281, -0.554409, 0.113339, 0.571389, 0.393393, 0.480496, 0.973998, 0.375146, 0.439137, 0.435022, 0.218347, 0.336285, 0.415234, -0.493973, 0.497911, 0.317150, 0.125319, 0.240191, 0.207399, 0.908738, 0.458531, 0.015445, 0.026350, 0.086521, 0.199139, 0.599657, 0.508522, 0.921862, 0.458113, -0.259419, 0.519533, 0.223942, 0.402954, 1.025367, 0.269866, 0.592787, 0.377136, 0.385313, 0.222490, 0.537232, 0.438399, 0.442820, -0.020214, -0.146457, 0.492757, -0.000721, 0.595087, 0.112551, 0.159011, 0.505530, 0.058542, -0.092457, 0.686094, 0.733863, 0.048709, 0.320266, 0.635923, 0.179903, 0.468482, 0.272353, 0.138286, 0.274431, 0.461662, -0.051416, -0.098842, 0.406694, -0.132652, 0.142684, 0.452891, 0.207518, 0.043497, 0.246583, 0.644458, 0.320465, 0.035500, 0.445649, 0.261776, -0.046239, 0.186000, 1.966922, 0.332044, 0.502149, 0.491129, 0.427617, 0.077491, 0.070660, -0.066275, 0.264832, 0.485710, 0.218656, -0.100957, 0.296145, -0.188364, 0.203762, 0.567676, -1.724541, 0.933526, -0.622020]
-,        [0.405727, -0.049119, 0.286431, 0.147158, -0.389579, 0.378057, 0.965618, 0.184305, -0.001285, -0.293624, 0.430025, 0.045500, -0.863138, 0.676911, -0.301411, -0.495975, -0.170062, 0.921277, 0.890125, -0.600027, 1.253352, 0.097689, 0.284408, -0.098251, 0.479675, 0.288028, -0.444411, 0.088762, -0.033156, 0.817547, 0.278084, -0.642228, 0.323368, 1.329700, 0.570495, -0.113237, -0.327981, -0.130078, 0.531668, -0.447187, 0.101808, 0.755266, 0.251238, -0.465378, 0.486854, 0.349891, 0.390512, 0.303823, -0.342205, 0.058704, -0.403758, -0.634703, 0.133306, -0.019732, 0.276474, 0.203649, -0.668223, -0.038279, -0.066135, -0.020631, 0.718466, 0.683809, 0.282559, 0.611041, 0.139731, 0.301535, -0.083587, -0.538307, 0.910446, 0.389164, -0.204175, -0.180414, -0.027728, -0.395957, 0.872094, -0.589938, 0.024515, 0.039236, 0.034192, -0.583018, 0.347311, 0.325325, -0.352074, -0.424357, -0.228462, -0.075519, -0.694077, 0.031840, 0.234599, -0.576768, -0.549291, -0.610366, 0.276429, 0.688982, 0.524703, -0.714079, -0.788099, -0.009774, -0.373597, 0.222735, -0.416794, 0.675864, -0.482141, 0.427115, 0.977103, -0.045355, -0.034633, -0.864586, -0.596418, -0.420684, -0.052609, 0.028454, 0.112550, 0.671193, 0.224850, 0.048179, -0.051561, 0.865190, -0.123035, 0.968734, 0.031050, -0.074638, -0.181067, 0.041371, -0.132371, -0.297282, -0.294588, -0.073292, 0.189984, -0.518243, -0.599525, -0.461607, -0.264133, -0.159324, -0.081819, 0.086560, 0.304976, 1.199655, -0.204344, -0.326647]
-,        [-0.002865, 0.489633, 0.097234, 0.237943, 0.627466, 0.493678, -0.024899, 0.172921, 0.774387, 0.419507, 0.525734, -0.031845, -0.165722, -0.366572, 0.444745, -1.078956, 0.736474, 0.631308, 0.118392, -0.377795, 0.768365, 1.014206, 0.324103, 0.534261, 0.758618, 1.269694, -0.281914, 1.180552, 0.697244, 0.073800, -0.073081, 0.315002, 0.641033, 0.319586, 0.591534, 0.699825, -0.261983, 0.682397, 0.794484, 0.745165, 1.090779, 0.725080, 0.451173, 1.152591, -0.304224, 0.161705, 0.996364, -0.102159, 0.305908, 0.313270, -0.272661, 0.172061, 0.661690, 1.086203, -0.011060, 0.769532, 0.412755, 0.177316, -0.540185, 1.417166, 0.299738, 0.394675, 0.332105, -0.094778, 0.339994, -0.025712, 0.331694, 0.667956, 0.034130, -0.563297, 0.045050, -0.447766, -0.125099, -0.257890, -0.106859, 0.450273, 0.358536, 0.601691, -0.351554, -0.121112, 0.218436, 0.222186, -0.118459, -0.055880, -0.540357, 0.310653, 0.105759, 0.313122, -0.911010, 0.375807, -0.154703, -0.223056, 0.263237, 0.206030, 0.131744, 0.580626, 0.209941, 0.267523, -0.031425, -0.275070, -0.655740, 0.502408, 0.023030, -0.106781, -0.690232, 0.557395, -0.271494, 0.302147, -0.470430, 0.560495, 0.466092, 0.560367, -0.361630, -0.161507, -0.329431, 0.312486, -0.652152, 0.271799, -0.262063, 0.623512, 0.374846, -0.245569, -0.572281, -0.166583, 0.569826, -0.114422, -0.517479, 0.074850, 0.114020, 0.330824, 0.323391, 0.210723, -0.079702, 0.119871, 0.265364, 0.442699, 0.018771, 0.351690, -0.232511, -0.184409]
-,        [-0.030074, -0.874237, -0.346764, -0.929181, 0.176339, 0.046498, -1.040906, -0.515023, -0.580828, -0.642052, 0.325341, -0.065505, 0.592802, -1.080310, -0.746749, -1.476032, 1.063561, 0.048118, -0.463039, -0.203874, -0.665325, -0.195462, 0.102971, -0.554355, -0.469312, 0.490578, 0.208256, -0.572966, -0.524788, 0.524964, 0.333865, -0.586885, 0.793145, -0.078850, 0.216380, 0.211484, 0.100618, 0.324868, -0.042143, -0.704876, 0.598147, -1.251289, -0.843795, -1.231169, -0.655210, 0.138890, -0.447960, -0.296345, 0.062650, -0.129729, 0.383770, -0.856943, 0.132866, 0.116680, 0.473849, 0.463525, 0.495264, 0.348056, 0.392575, 0.534879, 0.263670, -0.280241, 0.306038, 0.306679, 0.839563, 0.014961, 0.933751, -0.307918, 0.161543, -0.436304, -0.290363, -0.334048, 0.110911, -0.396270, 0.136827, 0.043846, 0.159669, -0.071830, -0.019588, -0.509741, -0.070019, -0.115529, -0.159951, -1.096932, -0.129138, -0.254258, -0.481401, -0.813308, 0.434888, -0.647371, -0.421383, -0.261406, -0.187548, -0.347498, -0.728369, -0.553643, 0.041289, -0.519466, -0.167116, -0.821282, -0.350264, -0.720917, -0.069025, -0.409375, -0.207098, 0.108909, -0.451709, -0.169643, -0.132534, -0.524478, -0.637495, -0.549844, 0.267260, -0.249026, -0.561258, -0.514436, -0.003682, -0.458881, -0.385339, -0.630700, 0.158041, 0.705181, -0.255017, -0.397401, -0.226690, -0.220545, 0.232866, -0.000838, 0.151534, 0.373216, 0.325538, -0.244273, 0.313895, 0.034646, 0.159444, 0.146786, 0.132560, -1.048218, 0.872197, -0.924614]
-,        [0.398644, 0.697157, 0.412844, 0.544602, 0.559238, 0.567368, 0.381774, 0.637413, 0.480916, 0.704582, 0.505823, 0.500262, -0.004321, -0.549179, -0.470481, -0.039249, 0.652243, 0.137946, -0.051477, 1.025918, 0.930795, -0.514138, -0.428343, -0.534280, 0.184536, -0.239444, -0.739534, 0.033528, -0.271099, -0.513466, -0.124865, 0.268495, -0.253070, -0.049187, 0.146892, 1.162755, 0.814373, 0.478295, 0.022298, 0.700188, 0.356100, -0.585415, -1.573822, -1.101423, -0.313859, -0.025598, -0.111748, 0.323519, 0.644565, -0.750232, -0.010974, -0.034039, 0.660899, -0.563585, 0.685885, 0.197822, 0.981813, -0.537683, -0.251948, 0.073073, -0.296024, 0.927159, 1.089167, 1.513181, 1.644113, -0.778284, 0.000455, -0.127071, 0.122431, -0.129597, 0.102955, -0.766551, -0.086225, -0.177514, -0.583911, -0.383831, 0.122820, 0.082669, -0.833829, 0.252257, 0.318293, -0.045682, -0.175026, -0.058778, 0.229788, -0.066923, -0.598170, -0.581412, 0.483885, -0.417711, -0.228108, 0.226561, 0.687410, -0.765853, -0.548161, 0.378187, -0.403577, -0.281333, 0.010243, 0.143808, 0.160172, -0.109129, -0.047790, -0.240608, 0.016465, -0.021538, -0.000437, -0.387456, 0.324040, -0.060092, 0.164595, 0.080793, -0.367916, 0.477642, 0.119293, 0.303031, -0.431366, -0.047455, -0.075973, 0.471849, -0.305072, -0.507321, -0.191685, -0.075035, -1.653013, -1.419826, -0.723711, -0.275906, -0.119956, -0.172997, -0.238025, -0.048999, -0.327097, -0.219305, -0.017410, -0.329393, -0.022915, 0.038928, -0.028284, -0.949825]
-,        [0.592486, -0.304625, -0.530283, 0.867564, 0.148183, 0.630127, 0.162508, 0.453558, 0.120175, 0.201822, -0.882409, 0.793452, -0.884696, -0.261570, 0.182161, -0.303262, 0.490797, -0.854090, 0.386578, 0.457244, -0.326217, 0.494677, 0.021359, 0.211651, -0.305172, 0.447724, -0.552577, -0.318159, -0.250063, 0.615511, -0.529117, 0.216804, 0.128811, -0.035700, -0.800461, 0.441099, 0.369480, 0.427796, 0.005786, -0.411817, 0.143379, 0.139867, 0.158527, 0.347002, -0.000714, 1.135432, 0.439754, 0.013767, 0.356557, 0.841044, 0.006044, 0.653867, 0.782096, 0.093446, -0.591189, 0.773961, 0.179880, -0.033019, 0.327446, 0.292316, 0.982810, -0.013546, -0.292585, -0.237561, 0.604868, -0.278638, -0.346654, -0.561569, 0.129345, 0.178403, 0.667596, 0.185867, -0.137998, -0.471303, -0.103858, -0.539066, -0.202855, -0.394464, -0.401953, -0.290126, -0.790298, 0.392889, -0.531058, 0.114659, 0.606036, -0.597634, 0.589270, -0.829461, 1.030318, -0.851290, 0.854968, -0.347327, -1.092906, 0.550079, -0.140711, -0.457287, -0.162644, -0.013719, 0.485426, -0.339045, -0.003146, -0.199531, 0.440425, -0.240698, 0.266848, 0.060851, 0.067212, -0.248580, -0.054919, -1.151017, 0.368872, -0.888914, 0.040447, 0.238101, -0.534257, 0.281898, 0.091853, 0.210197, -0.443296, -1.210378, -0.097738, -0.038209, -0.077419, 0.001884, 0.080585, -0.798679, -0.830760, -0.806903, -0.991939, -0.776582, -0.571305, -0.067301, -0.116991, -0.011465, -0.272750, -0.009375, -0.270327, 0.116531, -0.864919, -0.419824]
-,        [0.532308, 0.018164, 0.828154, -0.311526, -0.712784, -0.573704, -0.889366, 0.216761, 0.827093, -0.142480, 0.279187, 0.894281, -0.688500, 0.687692, -0.269939, 0.108040, -0.326159, -0.251856, -0.039736, 0.361912, 0.250423, -0.281570, -0.855616, -0.110892, -0.275772, -0.330678, -0.900118, -0.363739, 0.520375, 0.450644, -0.063936, -0.388774, -0.449520, 0.524475, 1.081612, 0.258714, 0.908302, 0.162433, -1.430799, 0.019945, 0.092852, 1.030069, 0.322770, 0.305633, 0.003973, -0.112909, -0.321467, 0.413171, -1.048319, 0.133553, -1.087868, -0.722876, -0.373904, 0.197578, 0.117800, 1.151545, 0.358759, 0.162573, -0.583557, -0.268167, -0.100587, -0.615750, 0.188500, 0.131678, 0.422574, 0.659224, 0.021222, 0.631002, 0.040055, -0.466201, -0.621566, -0.042114, -1.026908, -0.837984, -0.684267, -0.891768, -0.438717, -0.987565, 0.027925, 0.459604, -0.723020, -0.413779, -0.281501, 0.569079, -0.295948, -0.741105, -0.279411, -0.955834, -0.300585, -0.325902, -0.010000, -0.025455, -0.141801, -0.578990, -1.058489, -0.059695, -0.319093, -0.860997, 0.602904, -0.812936, -1.150255, -0.722926, 0.064258, 0.244306, -0.962223, -0.339328, -0.527914, -0.846841, -0.388692, -1.163527, -0.643723, -0.187019, -0.974893, -1.882358, -0.930311, 0.087981, 0.133123, -0.585227, -0.443886, -0.511368, -0.484245, 0.295605, 0.158662, 0.377539, 0.195618, 0.026859, 0.265622, -0.141844, 0.067000, -0.185539, -0.109332, -0.372063, -0.178163, -0.669130, 0.061361, 0.508261, 0.644372, -1.101232, -2.845068, 0.427152]
-,        [0.311871, 0.759222, 1.146743, 0.321348, 0.845600, 1.168164, 0.087285, 1.071698, 0.756244, 0.634773, 1.123075, 0.507866, 0.549791, 0.519364, 0.691043, 0.540251, 0.660238, 0.669127, 0.449608, 0.417038, 0.547671, 0.204383, 0.703045, 0.549498, 0.348722, 0.849217, 0.103948, 0.187359, 0.702266, 0.802003, 1.033002, 0.169241, 0.595330, 0.516278, 0.420249, 0.653210, 0.180219, 0.677055, 0.291237, 0.665296, 0.316482, 0.660452, 0.187344, 0.590555, 0.283033, 0.561125, 0.059864, -0.315958, -0.023429, 0.557864, 0.747189, 0.638023, 0.153870, 0.828830, 0.676450, 0.785931, 0.328590, 0.747398, 0.490278, 0.374010, -0.112876, 1.176543, 0.088997, -0.213364, 0.468080, 0.398502, 0.575314, 0.466452, 0.192329, -0.079438, 0.236338, 0.030789, 0.036096, 0.152253, 0.008764, -0.019427, -0.111331, 0.404173, -0.062071, 0.066647, 0.042578, 0.058181, 0.080405, 0.043313, 0.394340, 0.288673, -0.300946, -0.157255, -0.025854, -0.002705, -0.274644, 0.202386, 0.432287, -0.018062, -0.250500, 0.031542, 0.302555, -0.235231, -0.136040, -0.176303, 0.209034, -0.095882, -0.536958, 0.347183, 0.138873, 0.059432, -0.156651, 0.001984, 0.234761, 0.190598, -0.228601, 0.447557, 0.134864, -0.168510, 0.425918, -0.338501, -0.111371, -0.146070, -0.190615, -0.414937, 0.081267, -0.632386, 0.314208, -5.815494, -1.401710, -0.616374, -0.211846, -0.264837, -0.117064, -0.061974, -0.026596, -0.103200, -0.139525, -0.016179, 0.034764, 0.094645, 0.086238, 0.091722, -0.453760, 0.369057]
-,        [0.122820, -1.059378, -0.014949, -0.124725, 0.270359, 0.161261, 1.100430, -0.245315, 0.165941, 0.098171, 0.195504, -0.321701, 0.165703, 0.384029, 0.097366, -0.466007, 0.390254, 0.476587, 0.202001, 0.195766, -0.926175, 1.034900, 0.224325, 0.528384, -0.324462, -0.119525, -0.471335, -0.357768, -0.342279, 0.906737, -0.422457, -0.324387, 0.054159, 0.489761, -0.165257, -0.297045, 0.428203, -0.211179, -1.033454, -0.885123, -0.036720, -0.995343, -0.179566, -0.131373, 0.443050, 0.027627, -0.190871, -0.274088, -0.273911, 0.814906, 0.082743, -1.187683, 0.010652, 0.609075, -0.436623, -0.652529, -0.297330, 1.560385, 0.336432, -0.214570, 0.941373, 0.048979, -0.617738, -0.456394, -0.423666, -0.429306, -0.379837, -0.487882, -0.207453, -0.964620, 0.941572, -0.934732, 0.717068, -0.124318, -0.734679, -0.517800, 0.130265, 0.182422, 0.293824, 0.062770, -0.292827, 0.242523, -0.000060, 0.187477, 0.794872, -0.589094, -0.332543, -0.178796, 0.121445, 0.246511, 0.364181, -0.333435, -0.014801, -0.307578, -0.186072, 0.302088, 0.512741, -0.078138, 0.604631, -0.757389, 0.430304, 0.051568, 0.076402, 0.361217, 0.123987, -0.462875, -0.493645, -0.145959, 0.321371, -0.655287, -0.581257, -0.275676, -0.382771, -0.189797, -0.614807, -0.049987, -0.549999, 0.103481, -0.994187, -0.126733, 0.567433, -0.115853, -0.149111, -0.853070, -0.972335, -0.779566, -0.951603, -0.511189, -0.810048, -0.084921, 0.009965, -0.247859, -0.775555, -0.234872, -0.591588, 0.022754, -0.011063, 0.822479, -1.619526, -0.278915]
-,        [0.266284, 0.071467, -0.240220, 0.051186, 0.092052, 0.270482, -0.343251, 0.122679, 0.195140, -0.154346, -0.466273, 0.058318, 0.276702, -0.518774, 0.377821, -0.012051, -0.175107, -0.355221, 0.228521, -0.553991, -0.102626, 0.050400, -0.349608, 0.694062, 0.081470, 0.255814, 0.371486, 0.238479, 0.036277, 0.470788, -0.281775, 0.180460, -0.395320, 0.477000, 0.289870, 0.186602, -0.138738, -0.560577, -0.236889, -0.186822, -0.127810, -0.963523, 0.405468, -0.863738, -0.401783, -0.080599, 0.637570, 0.399129, 0.437211, -0.580461, -0.322370, -0.225868, -0.946657, -0.231660, -0.083109, -0.100675, -0.297397, -0.413855, -0.190817, -0.752669, 0.470575, -0.583845, -0.295321, 0.408507, -0.587287, -0.508420, -0.396612, -0.788060, -0.510144, -0.646722, -0.312498, -0.097312, -0.096617, -0.073287, -0.417670, -0.247496, -0.387163, 0.388242, 0.214866, -0.640945, 0.500855, 0.077077, -0.245302, 0.388484, -0.234301, -0.028702, -0.042795, -0.390607, 0.095650, -0.097377, 0.258772, -0.413575, -0.253248, -0.118549, 0.093904, -0.566734, 0.116217, -0.676966, -0.102209, -0.199947, 0.524661, 0.406155, 0.280013, -0.511766, -0.157388, -0.043721, 0.011035, 0.122236, -0.048733, -0.025933, -0.263360, 0.176810, 0.313188, -0.427500, -0.591141, 0.494583, -0.461719, -0.607795, -0.025051, 0.103108, 0.024283, 0.220807, 0.103766, -0.137705, -0.058098, -1.437974, -0.672699, -0.512627, -0.501040, -0.391757, -0.293431, -0.294210, -0.173695, 0.115081, -0.052935, 0.018242, -1.191147, -0.561237, -0.679964, -0.173324]
-,        [-0.025389, -0.222591, -0.237104, 0.426059, -0.298609, -0.663311, 0.653490, 0.258525, 0.289797, -0.513781, 0.418211, -0.149957, 0.085707, -0.075298, -0.076604, 0.952128, -0.205047, 0.425299, 0.457771, -0.291567, 0.750961, -0.848913, -1.224298, -0.970212, -0.713907, 0.137873, -0.251579, -0.075866, 0.328854, 0.396828, 0.244317, 1.070995, 0.416195, 0.061948, 0.082536, -0.201583, 0.151102, -0.032049, -0.789310, -0.438712, -0.040295, -0.544604, -1.854661, 0.338804, -1.173195, -0.282061, 0.326935, 0.004348, 0.633773, -0.536272, 0.204949, -0.561100, -0.683393, -0.056044, -0.465860, -0.546044, 0.084303, -0.281397, -0.350605, -0.090112, 0.383976, -0.143874, 0.269821, 0.478826, 0.039881, -0.623767, -0.209785, -1.277658, -0.106764, -1.103140, -1.071559, -0.374035, -0.813471, -1.308934, -0.888446, -1.024832, -0.709189, -0.986493, -0.334853, -0.456500, -1.811137, -0.572622, -0.711286, -1.313008, -1.059942, -0.554941, -0.692559, -0.689634, -0.641373, -0.001420, 0.207680, -0.303679, 0.111444, -0.149361, -0.698263, -0.747275, -0.575958, -0.636967, -1.396848, -0.513894, -0.807252, -0.516279, -0.453613, -0.242392, -0.755148, 0.328538, -1.345418, -0.025000, -0.348517, -0.023463, -0.035870, -0.090333, -1.493505, -0.873250, -0.978142, -0.339200, -0.620502, -0.561287, -1.137931, -0.811036, -1.023539, 0.503024, 0.269620, 0.409340, 0.220280, 0.512068, 0.257928, 0.317174, 0.334588, 0.029501, 0.010630, 0.302528, 0.285711, 0.052208, -0.322212, -0.060261, 0.245691, 0.901597, 3.393164, 0.357094]
-,        [0.714697, 0.198834, 0.378500, 0.441209, 0.478409, 0.359470, 0.263612, 0.711594, 0.723998, 0.672553, 0.624905, 0.126568, 0.818446, 0.592239, 0.545913, 1.031233, 0.831866, 0.273200, 0.348027, 0.188409, 0.543038, 0.447872, 0.389791, 0.526809, 0.401500, 0.009952, 0.534485, 0.339938, 0.420466, 0.291219, 0.406075, 0.405421, 0.491015, 0.139221, 0.351520, 0.036399, 0.547376, 0.382565, 0.299153, 0.601842, 0.454066, 0.076288, 0.581902, 0.415162, 0.200590, 0.699366, 0.397802, 0.262498, 0.404191, 0.088053, 0.468976, 0.581593, 0.138580, 0.399331, 0.218815, 0.688123, 0.496670, 0.522424, 0.245455, 0.361077, 0.624694, 0.631373, 0.375325, 0.290866, 0.252656, 0.500333, 0.200991, 0.314683, 0.142357, 0.075747, -0.128162, -0.002312, 0.110787, -0.069461, 0.098042, -0.002465, 0.088483, -0.136664, -0.010416, -0.005418, 0.250932, 0.238001, 0.165151, -0.051125, 0.136246, 0.038467, 0.093984, -0.004238, 0.148451, 0.126468, 0.066084, -0.122098, 0.087746, 0.082708, -0.045355, 0.140525, -0.067518, 0.084606, -0.031789, 0.058498, 0.120653, -0.028823, 0.004292, 0.192489, -0.266543, -0.030123, -0.000885, -0.006556, -0.106000, 0.184057, 0.130924, -0.123554, 0.024089, 0.022301, 0.044264, -0.072818, 0.148286, 0.150811, -0.045842, 0.002166, -0.131224, -0.016464, 0.633983, -2.934213, -0.031457, -0.084989, -0.266136, -0.287832, -0.226725, 0.114806, 0.013331, -0.182385, -0.299619, -0.339145, -0.099388, -0.318948, 0.041477, 0.595439, -0.806723, 1.980429]
-,        [0.658739, 0.423474, 0.188804, 0.850900, 0.331500, 0.496864, -0.180532, -0.758477, -0.142912, 0.246326, -0.402681, 0.694134, -0.018648, 0.906444, -0.005005, -0.230205, -0.490246, 0.246420, 0.425519, -0.140866, -0.335646, 0.923726, 0.412896, 0.305317, -0.691342, 0.834871, 0.277976, -0.375274, 0.372754, 0.390201, 0.698453, 0.180529, 0.724347, -0.201408, 0.852814, 0.765835, -0.263403, 1.130100, 0.512473, -0.185065, -0.614567, 0.182772, 0.636782, 0.419763, 0.380864, 0.121377, 0.795893, 0.160265, 0.043023, 0.836997, -0.398132, 0.200317, 0.290838, -0.480002, -0.267756, -0.217013, -0.970219, -0.236316, -0.429375, -0.217233, 0.621619, 0.421644, 0.553579, 0.572495, 0.307234, 0.697498, -0.917069, -0.050606, 0.337619, 0.301603, 0.151049, -0.398352, -0.361466, -0.465421, 0.608339, -0.529511, 0.112629, -0.725436, 0.499680, -0.338282, 0.678274, -0.285720, 0.072546, -0.382288, -0.772755, 1.210126, -0.145879, -0.116884, -0.720358, -0.531371, 0.364371, -0.505024, -0.876682, -0.158505, 0.012522, -0.613979, 0.540630, -0.412018, 0.869335, -0.634853, 0.237531, 0.169551, 0.116978, -0.635656, -0.223271, 0.322934, -0.296783, -0.264430, -0.192054, 0.507019, 1.141371, -0.933460, -0.204615, -0.028944, 0.141721, -0.533382, -0.352887, 0.226423, 0.818859, -0.476793, -0.363111, 0.091446, 0.407118, 0.396855, -0.145409, -0.203952, 0.087589, -0.055204, 0.262294, 0.199338, 0.293116, 0.361433, -0.006749, 0.196506, 0.637624, 0.724529, -0.158726, -0.124198, -0.724331, -0.036384]
-,        [0.299766, -0.313944, -0.467019, -0.062077, 0.096533, 0.044891, 0.195158, -0.410604, -0.520166, 0.382466, -0.013114, -0.106630, -0.685964, 0.095143, -0.448005, -0.227458, -0.262332, 0.018466, 0.346486, 0.539908, 0.029986, -0.253484, 0.158108, 0.434832, -0.101589, 0.391189, -0.433168, -0.910399, -0.154412, 0.132082, 0.271177, 0.299155, 0.050307, -0.023028, 0.026508, -0.533982, -0.515434, 0.307145, -0.774510, 0.355678, 0.336550, -0.412612, 0.409012, 0.063737, -0.343189, 0.078308, 0.437466, -0.586174, 0.474969, -0.125367, 0.599346, -0.190629, 0.167938, 0.262471, -0.147379, -0.104129, 0.295098, -0.151104, 0.245405, 0.306354, -0.435632, 0.015225, -0.000266, 0.263441, 0.066663, -0.187305, 0.092575, 0.654265, -0.124608, -0.090125, -0.014798, -0.577854, -0.207785, -0.671137, -0.011887, 0.202323, 0.121644, -0.590775, 0.088351, -0.225664, -0.488243, -0.400358, 0.127503, -0.297315, 0.072303, -0.170495, -0.298051, -0.514123, -0.532493, 0.337158, -0.204790, -0.268435, -0.327848, 0.107742, -0.121912, 0.058422, -0.164023, -0.536047, 0.132375, -0.463623, -0.216141, 0.263717, -0.376626, -0.526190, 0.045851, -0.358343, -0.467715, -0.517142, -0.636448, -0.398777, -0.019413, 0.063624, 0.590347, 0.264131, 0.032219, -0.476816, -0.161030, -0.269219, -0.990646, -0.408112, -0.475713, -0.483366, -0.567893, -0.220840, -0.082115, -0.477065, -0.042572, -0.043222, 0.085184, -0.122064, 0.245728, 0.317270, 0.183863, -0.039121, -0.253561, -0.067060, 0.233643, -0.123104, -0.333886, -0.661331]
-,        [0.671507, -0.996813, -0.026200, -0.116634, -0.203669, -0.264872, -0.546883, -0.340931, 0.054441, -0.155048, 0.116829, 1.118172, 0.785688, 0.604020, 0.138546, 0.064008, -0.379449, -0.526940, 0.631812, 0.055813, 1.044773, -0.013264, -0.478314, -0.059798, 0.939800, 0.297720, -0.330222, 0.005494, 0.682011, 0.093439, 0.931679, -0.428313, 0.761503, 0.150948, 0.083568, 0.318171, -0.563633, 0.102099, -0.346559, 0.491543, -0.132373, 0.150015, -0.979054, -1.804368, -1.147253, -0.921663, 0.599233, -0.389156, 0.652184, -0.119144, 0.077960, 0.008636, -0.309333, 0.144513, 0.415404, 0.019622, 0.240264, -0.169970, 0.283852, 0.196175, 0.167340, 0.923166, -1.156548, 0.117370, 0.170705, -0.371253, 0.235630, 0.948947, 0.322567, 0.333596, -0.116654, 0.015946, -0.425141, -0.057953, -0.561717, -0.392320, -0.235140, 0.408802, -0.051772, 0.090003, -0.436203, 0.270082, -0.528762, 0.739165, -0.641570, 0.245309, 0.347572, 0.428384, -0.113124, 1.070922, 0.073393, -0.159184, -0.834645, 0.557924, 0.475265, 0.027359, -0.453410, 0.330010, -0.438627, -0.105211, -1.374605, 0.402523, 0.667025, -0.393490, -0.608686, -0.552404, 0.808519, 0.022810, -0.676437, 0.567054, -0.425860, 0.157248, -0.060156, -0.158677, 0.632714, -0.485672, -0.309783, -1.035461, 0.454489, 0.379276, -0.388923, 0.365575, 0.172516, -0.048898, -0.182548, 0.107927, -0.025473, -0.041386, -0.258058, 0.050982, -0.265176, -0.229058, 0.156397, -0.215706, -0.441418, -0.134441, 0.286846, 0.052613, -0.723855, 0.248845]
-,        [0.033790, -0.042472, 0.025009, -0.943616, -0.169592, 0.244468, -0.088803, -0.436208, -1.011479, 0.759581, -0.151110, -0.674781, 0.575476, -0.203505, -1.469378, 0.699143, 0.090454, -0.125621, -0.231168, -0.207010, 0.474489, -0.808831, 0.415062, -0.519490, -0.634229, -0.675928, -0.511509, -0.303085, -0.116287, 0.475584, -0.491571, -0.680205, -0.211361, 0.324502, -0.742796, 0.279383, 0.259722, -0.192081, 0.105782, -0.505990, 0.343777, -0.393700, -0.058502, -0.222433, -1.266523, -0.710556, 0.101839, -0.045493, 0.246453, -0.554795, -0.711012, 0.100163, 0.120302, -0.028948, -0.125797, -0.390788, 0.005952, -0.227466, -0.478928, 0.546435, 0.071314, -0.256275, -0.420539, -0.445120, -0.477673, -1.409372, -0.151936, 1.350589, 0.077317, -0.044798, -0.090393, -0.008158, -0.045687, -0.105657, 0.792217, -0.640114, -0.457726, -0.740354, -1.188930, 0.042140, 0.129624, -0.597440, 0.022557, -0.397816, -0.489815, -0.828236, -0.171986, -0.188908, -0.182730, -0.070594, -0.323121, 0.319528, 0.633675, -0.712051, -1.029611, -0.235750, 0.206291, -0.341819, -0.223866, -0.830731, -0.440390, -1.179514, -0.701149, -0.118276, -1.116631, -0.538737, -0.161242, -1.042882, -0.357082, -0.233515, -0.821946, -1.031234, -0.190947, -0.510922, -1.296765, -0.117829, 0.394792, -0.049314, -0.179871, -0.230034, -0.645130, 0.285864, 0.239458, 0.526872, -0.927379, -0.902236, -0.187965, -0.392443, -0.140901, -0.333215, -0.097208, -0.470178, -0.636735, -0.434428, -0.642084, -0.125167, -0.340578, -0.247465, -0.699117, 0.384933]
-,        [0.310858, -0.148457, -0.133485, 0.037847, 0.211088, -0.289056, 0.079974, -0.027804, -0.072778, -0.091056, -0.245228, -0.382729, -0.029490, -0.358894, -0.184593, 0.085057, -0.254206, -0.231234, -0.048044, -0.105235, 0.273219, -0.144894, -0.126401, -0.013071, 0.056133, -0.212343, -0.130075, -0.383606, -0.204593, -0.057750, -0.025637, -0.009054, -0.141285, 0.300358, -0.104042, 0.358779, 0.499882, 0.515454, 0.252745, 0.067514, 0.272814, 0.128028, 0.636638, -0.328395, -0.092363, 0.336245, -0.260988, -0.184170, 0.515310, -0.118105, 0.089824, -0.856702, 0.010640, -0.088514, -0.121414, -0.328773, -0.406882, 0.009621, -0.163813, -0.073404, 0.126254, -0.070250, -0.300395, 0.518819, -0.497369, -0.212992, -0.244347, -0.283016, -0.156651, -0.125233, -0.108807, 0.248267, -0.077571, -0.274782, -0.141806, -0.135605, -0.298533, -0.151621, -0.315936, -0.206093, -0.197133, -0.100942, -0.318389, -0.175774, 0.083070, 0.032014, -0.238426, -0.245901, -0.131987, -0.393452, 0.019465, 0.141534, -0.695494, 0.037409, -0.000905, 0.185513, 0.187142, -0.227112, -0.302157, -0.246540, 0.072239, -0.230828, 0.057701, -0.000618, 0.133381, -0.041398, 0.074193, -0.031754, -0.189264, -0.150518, -0.259158, -0.131455, -0.427561, -0.262641, -0.098921, -0.366367, -0.051812, -0.077249, -0.158460, 0.194591, -0.243859, -0.089705, -0.360216, -0.464991, -0.412411, -0.087035, -0.142277, -0.282242, -0.020906, 0.030247, -0.030239, 0.133102, -0.228634, -0.117514, 0.116862, -0.115119, -0.127234, 0.180846, -0.279938, -0.475276]
-,        [-0.262426, -0.002024, 0.138085, 0.562228, 0.166504, 0.676062, -0.382847, 0.511904, -0.183250, -0.484119, -0.568140, -0.049363, 0.482001, -0.069851, -0.335371, -0.250308, 0.264577, 0.383219, -0.127568, 0.521034, -0.248030, 0.180583, 0.403724, 0.224209, 0.910919, 0.187938, 0.099371, 0.399252, 0.082861, 0.346446, 0.241272, 0.719699, 0.269404, 0.173286, -0.221171, 0.232489, -0.091133, 0.466302, 0.215373, -0.236581, 0.286790, 0.342196, -0.647302, -0.584561, 0.256890, -0.118529, 0.371798, -0.162801, 0.618633, -0.248883, 0.171628, 0.294094, 0.201222, 0.074024, 0.411559, -0.260382, 0.160378, -0.153186, -0.212368, 0.280682, 1.014177, -0.564269, 0.083978, 0.496927, 0.294998, -0.094584, 0.234128, -0.288523, 0.172213, 0.036224, 0.758578, -0.179675, -0.121783, -0.336243, 0.250016, -0.204273, 0.232768, -0.054772, -0.337352, -0.396947, -0.721677, -0.156053, -0.016502, 0.044708, -1.036831, -0.167957, 0.409001, -0.162461, 0.186921, 0.370105, -0.254792, 0.062614, 0.242423, 0.189830, -0.463257, -0.186109, -0.178072, -0.467370, 0.231841, 0.246401, -0.067673, -0.326208, -0.014243, -0.173900, -0.818403, 0.493062, 0.079891, -0.216219, -0.526832, -0.317822, -0.216943, -0.061593, -0.280479, 0.232107, 0.300237, 0.094455, -0.165831, -0.202945, -0.127028, 0.222496, -0.549537, -0.372028, -0.758345, -0.825180, -0.993863, -0.430083, -0.223880, 0.117762, 0.234545, -0.190998, -0.120175, -0.008529, -0.119236, 0.117768, 0.450428, 0.299385, -0.409797, -0.893485, -0.032814, -1.000796]
-,        [0.379075, 0.510187, 1.119463, -0.481526, -0.373844, -0.086293, -0.356797, 0.743757, 0.720835, -0.865550, -0.628100, -0.017222, 0.567829, -0.316082, 0.644710, 0.033966, 0.083237, -0.063132, -0.295738, -1.126745, 0.758468, 0.725130, 1.083851, 0.194399, 0.783066, 0.681592, -0.823999, 0.094935, -0.353126, 0.511162, 0.874870, -0.511467, 0.421065, -0.827040, -0.862673, -0.618972, 0.183278, 0.607797, -0.372561, -0.091450, 0.107886, 0.619630, 0.728977, -0.933111, 0.900946, -0.706031, -0.071242, -0.557192, -0.371846, -0.798103, -0.649232, -0.137883, -0.405884, 0.066769, 0.020404, -0.033240, 0.213077, -0.382012, 0.188921, -0.794704, 0.448430, -0.610914, 0.316427, -0.334844, -0.768223, 0.632621, -0.203044, -1.335223, 0.948260, -0.101604, -0.939067, -0.057565, 0.070669, -0.186868, -0.158636, -0.257006, -0.000472, -0.078391, -0.262884, -0.321078, -0.330029, -0.003348, 0.394072, -0.480619, -1.286534, 0.298969, -0.462161, -0.509189, 0.062463, 0.399854, 0.493791, 0.339540, -0.240707, -0.543514, -0.049911, 0.300959, -0.014169, -0.049961, -0.546325, 0.611519, -0.312385, -0.233058, 0.061953, -0.085172, -0.336846, -0.049165, -0.368185, 0.168902, -0.256735, 0.189524, -0.335310, 0.384885, 0.207876, -0.557070, -0.043623, -0.693254, -0.054311, 0.602349, -0.150692, 0.520325, 0.943980, -0.210714, 0.031486, -0.142515, -2.258196, -1.640501, -0.101549, -0.140350, 0.357735, 0.473535, -0.006679, -0.013583, 0.015085, 0.053557, 0.184205, 0.191489, -0.188910, -0.496720, 1.000860, -0.300340]
-,        [-0.207496, 0.082112, 0.002198, 0.379002, 1.050322, -0.018364, -2.133871, 0.020614, -0.306765, 0.102691, 0.374532, -0.608777, -0.125994, -0.427789, -0.184270, -0.005002, 0.233766, -0.022512, -0.245547, -0.297437, 0.015049, 0.052086, 0.349630, -0.164547, -0.120084, 0.107476, 0.428883, -0.094596, -0.117147, 0.507276, 0.810217, 0.271065, 0.034083, 0.569233, -0.179754, 0.207308, -0.323767, -0.026796, 0.742122, 0.288670, 0.405935, -0.857143, -0.178982, 0.093373, -0.602719, 0.502815, -0.143877, -0.486410, 0.198201, 0.249754, 0.528048, 0.274408, 0.741764, 0.100459, 0.464660, -0.150532, 0.337404, -0.105215, 0.501019, -0.200364, -0.454048, -0.399192, 0.790576, 0.314912, 0.091277, 0.492546, 0.360101, 0.003795, 0.226092, 0.372435, -0.223654, -0.100328, 0.380967, 0.411757, -0.303232, 0.225003, 0.018873, -0.127755, 0.007714, 0.231130, -0.114012, 0.148603, 0.249123, -0.084968, 0.584298, -0.047674, 0.324796, 0.179940, 0.559626, -0.180616, 0.209528, -0.100391, -0.212958, -0.175822, -0.447165, -0.176665, -0.321378, -0.076808, 0.047095, 0.096263, 0.279523, -0.191087, 0.320902, 0.203777, 0.488374, -0.173046, -0.185078, 0.361507, 0.073304, -0.629891, -0.019948, 0.023578, -0.246001, 0.290080, 0.183500, 0.029104, 0.333309, 0.077275, 0.383864, -0.359236, 0.142572, 1.164580, 0.071406, -0.026303, 0.097181, -0.109164, -0.058942, 0.202517, 0.276647, 0.431959, 0.251037, -0.253313, 0.163206, 0.218137, -0.031616, 0.098361, -0.212700, -2.072858, 0.909395, -0.302979]
-,        [0.471168, 0.548138, 0.029795, 0.754152, 0.299139, 0.243246, 0.050421, 0.169007, 0.828627, 0.284645, 0.417774, 0.518869, 0.442235, 0.288627, 0.551083, 0.490523, 0.827325, -5.644500, -4.991712, -4.882710, 1.045868, -4.937376, -4.378326, -4.319814, 0.799836, -5.089392, -5.190098, -5.258492, 0.729397, -2.997686, -3.365723, -3.540306, 1.351643, -3.511256, -3.766550, -4.370877, 1.241170, -4.387100, -4.687080, -4.473077, 0.896365, -5.361313, -5.593819, -5.623663, 1.047337, -4.115372, -4.429565, -4.367165, 1.155541, -3.808935, -4.340910, -4.536428, 1.075716, -3.127963, -3.942866, -3.480800, 1.095331, -4.599060, -4.667012, -3.789944, 1.307730, -3.312141, -4.056509, -3.722698, 1.184006, -2.087762, -3.713468, -3.524289, 1.348427, 0.035657, 0.048097, -0.033578, 0.038517, 0.147592, 0.074937, 0.089395, 0.062415, -0.141064, 0.207885, 0.283328, -0.050636, 0.056694, 0.073259, 0.218338, -0.323249, -0.185650, -0.017888, -0.068810, 0.113614, 0.036779, 0.183646, -0.092020, -0.020384, 0.067080, 0.217264, 0.151913, -0.209674, 0.128402, 0.217652, 0.226298, 0.044937, -0.056367, -0.099447, -0.056709, 0.152247, -0.127457, 0.043623, -0.198143, 0.105272, -0.198766, -0.029628, -0.014328, -0.041113, 0.162254, 0.233070, -0.039877, -0.021540, 0.045236, 0.035818, -0.013687, 0.137599, -0.713995, -0.088005, 0.018107, 0.000849, -0.021523, 0.063882, 0.161416, 0.070552, 0.119602, -0.002373, 0.119180, -0.035406, 0.264314, 0.105823, -0.055710, -0.160843, 0.081919, 1.346090, 0.156973]
-,        [0.389731, 0.271543, -0.475371, 0.863154, 0.029583, 0.216427, 0.351775, -0.744970, 0.164301, -0.909809, -1.147517, -0.078252, -0.188321, 0.106056, -0.374652, 0.335668, -0.447517, -0.574358, 0.249890, 0.344726, 0.163562, -0.354634, -0.406792, 1.032730, -0.446087, 0.442747, -0.501041, -0.342115, -0.457996, -0.358949, 1.345430, -0.299743, -1.014020, 0.367169, -1.235915, 0.360250, 0.191431, -0.272789, -0.485264, 0.259288, -1.028103, -1.299136, -1.284484, -1.265738, -1.561687, -0.459324, -0.150914, 1.296366, -0.807217, 0.575537, 0.600682, 0.456746, -0.389750, 0.444047, -0.107830, -1.731688, -1.725757, -0.073777, -0.853628, 0.147594, -0.115225, 0.025358, -0.520378, -0.857659, -0.051690, -0.370483, 0.460195, 0.017077, -0.341459, 0.975990, -0.088786, -0.804718, 0.343912, -0.413866, 0.222178, 0.383106, 0.392313, 0.032902, -0.288800, -0.084189, -0.247178, -0.163533, -0.553037, -0.645266, 0.198858, 0.525682, 0.370992, -0.412280, -0.474332, 0.543033, -0.849756, -0.031608, 0.134616, 0.249361, -0.026888, -1.009856, 0.435742, -0.605276, -0.210994, -0.144147, -0.056659, -0.300741, -0.558428, -0.382297, -0.731675, 0.106974, -0.720781, -0.229960, -0.676579, -0.166777, -0.821264, 0.007436, -0.020122, 0.070826, -0.624234, -0.603577, -0.135736, 0.425048, -0.979263, -0.547700, -0.758229, -0.235822, -0.255892, -0.260839, -0.317794, -0.498032, -0.321370, 0.310875, 0.072886, 0.487685, 0.057487, 0.203689, -0.286328, -0.829986, -0.538728, -0.356455, -0.103849, 0.141912, -2.775833, -0.338666]
-,        [0.564323, 0.140784, 0.856472, -0.238833, 0.189210, 0.785750, -0.628594, 0.324078, -0.392225, -0.521644, -0.408001, 0.350061, 0.713488, -0.936128, -0.311742, -0.170717, 0.040024, 0.621315, 0.755521, 0.144770, -0.377968, 0.582724, 0.586998, 0.409300, 0.174112, -0.283312, 0.534681, 0.745542, 0.225441, 0.912943, 0.547873, -0.247722, -0.685122, 0.339173, 0.666921, 0.330274, 0.603409, 0.280589, -0.116230, 1.226868, 0.668896, -0.251942, 0.583076, 0.369991, 0.503444, 0.638222, 0.327713, 0.340555, 0.081997, 0.994570, 1.358102, 0.236330, 0.439499, 0.855053, 0.489534, 0.393720, 0.296651, 0.208966, 0.322820, 0.466770, 0.539597, 0.384548, 0.651331, 0.142217, 0.068387, 0.817743, 0.469015, 0.360062, 0.343585, -0.186752, 0.308492, -0.036680, -0.238747, -0.265050, -0.137228, -0.788193, 0.549303, 0.012281, -0.575729, 0.162232, -0.539667, -0.277273, -0.264973, -0.602721, 0.123346, -0.239035, -0.268911, 0.262369, -0.001392, -0.678145, 0.413678, 0.685466, 0.610574, 0.227140, -0.346890, -0.015237, 0.208448, -0.427472, -0.331094, -0.985446, -0.095860, -0.192745, -0.046835, 0.125419, 0.219715, -0.115779, -0.228259, 0.114465, 0.586521, -0.144415, -0.170377, -0.381367, -0.379297, -0.317408, -0.001437, -0.003880, -0.134123, -0.109197, 0.129364, -0.396874, -0.609906, -0.566426, -0.444484, -0.360122, -0.313299, 0.131032, 0.038272, 0.307423, -0.215390, -0.104805, -0.052556, 0.134222, 0.368485, -0.076624, -0.322053, 0.096877, -0.557099, -0.672009, 0.342886, -0.089378]
-,        [0.378864, -0.213307, 0.520092, -0.013222, 0.304914, 0.637399, -0.202702, 0.497181, 0.067163, 0.202300, 0.717347, 0.439300, 0.371010, 0.178511, 0.510860, -0.410908, 1.092843, 0.207168, 0.101908, 0.461048, 0.399288, 0.472276, 0.293941, 0.805545, -0.240238, 0.835745, -0.045296, -0.092134, 0.058080, -0.298542, -0.281104, 0.764739, 0.348641, -0.511394, 0.493844, -0.070648, 0.561571, 0.248418, 0.269392, 0.065793, 0.762864, 0.799745, -0.105707, 1.245155, -0.187870, 0.830337, -0.146562, 0.175961, 0.276817, 0.276910, -0.330261, 0.858294, 0.051360, 0.378943, 0.284400, -0.199312, 0.667640, 0.123405, 0.090577, 0.036313, 0.550111, 0.423013, 0.841890, 0.520910, 0.390112, 0.793240, 0.372834, -0.131071, 0.380068, 0.031817, -0.592510, -0.112228, -0.384636, 0.269294, -0.126909, -0.006688, -0.270168, 0.056397, -0.062108, 0.339947, 0.551232, 0.069011, 0.080656, -0.058879, 0.225587, 0.113807, -0.209015, 0.258218, 0.230165, 0.145434, 0.208674, 0.033682, 0.270562, 0.044452, -0.404794, 0.452645, -0.706243, 0.116645, -0.143776, 0.037119, -0.108780, -0.065067, -0.736520, 0.173104, -0.170291, 0.229733, 0.530070, 0.213034, -0.304370, 0.392792, -0.179947, 0.430722, 0.137225, -0.272778, -0.268921, -0.116263, -0.175691, 0.619347, -0.462566, 0.016540, -0.115227, -0.237171, -1.641774, -0.015145, -0.299223, -0.529595, -0.295582, -0.396062, 0.016148, -0.291123, 0.382373, -0.165763, 0.076042, 0.139049, 0.330101, 0.181756, 0.904896, -0.053469, -0.063498, 0.285725]
-,        [-0.175738, 0.721752, 0.077103, -0.788052, 0.572244, 0.086013, -0.020781, 0.261745, -0.474886, 0.594565, -1.068348, 1.116517, -0.005338, -0.683140, -1.417581, -1.037196, 1.086244, -0.755572, -0.215703, 0.175572, 0.449377, 0.533218, -0.010049, 0.500192, -0.427207, 0.465009, -0.523032, 0.042501, 0.590271, -1.032415, -1.110145, -0.625465, -0.511860, -0.401153, -1.860654, -0.205626, 0.151294, 0.451639, -0.335463, 0.512974, -0.288002, -0.497544, -0.085124, -0.658516, 1.538525, -0.145814, -0.095764, -0.726802, -0.440198, -0.071652, -0.324814, -0.629592, 0.094370, -0.473643, -0.703620, -0.449665, 0.137470, -0.520796, 0.101057, 0.254980, 0.213228, 1.007516, 0.216706, 0.783223, 0.232489, -0.476431, -0.873151, -0.233847, 0.236283, -0.220036, -1.036477, -1.008057, -0.114378, -0.439130, -0.408060, -1.061746, -0.337542, -1.006802, -1.391688, -0.549607, 0.264385, 0.025288, 0.332301, 0.366016, 0.776751, -0.496420, -0.716767, -0.244745, 0.181941, -0.784737, -1.083258, 0.053003, 0.053016, -0.934237, -0.079518, -0.621607, -0.844003, -0.162770, 0.125001, -0.641034, 0.493766, -0.145011, -0.750808, -0.477023, 0.046559, -1.001646, -0.458380, -0.755052, -0.035618, -0.680662, -0.429203, -0.580793, -0.577800, -0.909123, -0.396399, -0.466642, 0.255084, -0.814057, -1.064437, -0.711593, -0.646779, 0.138702, 0.128477, 0.141066, 0.049334, -0.267731, 0.093599, -0.111945, -0.286558, 0.152640, 0.038217, 1.284089, -0.336837, -0.447542, -0.211660, 0.409803, -0.454746, -0.142376, 0.600215, 0.393323]
-,        [-0.461468, 0.507916, -0.352452, -0.298278, -0.003673, -0.094539, -0.377075, -0.328182, 0.174235, -0.056776, 0.005719, 0.436181, -0.610132, 0.134726, -0.814138, -0.133583, -0.336985, -0.004735, -0.101328, 0.548854, -0.553821, -0.289885, 0.601969, -0.057633, -0.238128, -0.304403, -0.232545, 0.365228, -0.002573, -0.030065, 0.032566, -0.298513, -0.987564, 0.574065, 0.321109, -0.265818, -0.114739, -0.393601, 0.764894, -0.596312, 0.601648, -0.311790, -0.321470, -0.766848, -0.627468, -0.658487, 0.458903, -0.384615, -0.310652, 1.122366, -0.528040, -0.141967, -0.660553, -0.012312, 0.803313, 0.514362, 0.012635, 0.817263, 0.450700, -0.126890, 0.002916, -0.237662, 0.582717, -0.578927, -0.205085, -0.113065, -0.025061, 0.569518, -0.230034, -0.420402, -0.323144, -1.149261, -0.010600, -0.446494, 0.350890, 0.149198, -0.423940, -0.800102, -0.380704, -0.623845, -0.431070, -0.082744, -0.024410, -0.390686, 0.412738, -0.702662, -0.374333, -0.206339, -0.508434, -0.219281, -0.347641, -0.581265, -0.501670, 0.096746, -0.632424, 0.012913, 0.208484, -0.075904, -0.111648, -0.264872, -0.307651, 0.516340, -0.357500, 0.231875, -0.414783, -0.076234, -0.209919, -0.692837, -0.317886, -0.461848, -0.125381, -0.290858, -0.432465, -0.508369, -0.748506, -0.141626, -0.295914, -0.308311, -0.190567, 0.002610, -0.304732, -0.098665, -0.079874, -0.171193, -0.105252, -0.146639, -0.054817, 0.166390, 0.217406, 0.274677, 0.044488, 0.340950, 0.352593, 0.340448, -0.336356, -0.261715, 0.361941, -0.035284, -1.691878, -0.153917]
-,        [0.178404, -0.038208, 0.232191, -0.196716, 0.271699, 0.250725, -0.501817, 0.410821, -0.232985, -0.131106, 0.126205, -0.115491, -0.073203, 0.036138, 0.111904, -0.193094, 0.230812, -0.283800, -0.851269, -0.453074, 0.865324, -0.438004, -0.334668, -1.231021, 0.304463, 0.072706, -1.062975, -0.528103, 0.126449, -0.255149, -0.269868, -0.522173, 0.219250, 0.856169, -0.576297, -0.386423, 0.581807, -0.322455, -0.563381, -1.331519, 0.528122, -0.905065, -0.832141, -1.450723, -1.280912, -0.469101, -1.100448, -0.516214, 0.083830, -0.322573, -0.470321, -0.970769, 0.086663, -0.007207, -0.359956, -0.513704, -0.124858, -0.267498, -0.410774, -1.096201, 0.108207, 0.199592, -0.942782, -0.764835, 0.696852, -0.341712, -0.621857, -0.742978, 0.909273, -0.345354, -0.237781, -0.549239, -0.121893, 0.143101, 0.168333, -0.070635, -0.188807, -0.388703, -0.464072, -0.043021, -0.563543, -0.271887, -0.118804, -0.019442, -0.037308, -0.119571, -0.430972, -0.175441, -0.401241, -0.415738, -0.012066, 0.087014, 0.492858, -0.511940, -0.112942, 0.096849, -0.144070, 0.277263, 0.246435, -0.108551, 0.300182, -0.029658, -0.401590, -0.092146, -0.084538, 0.111410, 0.001968, 0.020663, 0.049778, -0.126437, 0.020314, 0.256189, 0.167355, -0.195189, -0.155480, -0.306618, -0.265875, -0.433759, -0.284088, 0.024251, -0.541160, -0.224764, 0.118581, 0.149487, -0.100923, 0.190279, 0.186383, 0.264361, -0.286064, -0.396547, -0.100234, -0.383302, -0.419100, -0.188047, -0.620791, -0.012173, -0.489227, -0.718404, -0.079403, 0.165963]
-,        [0.555882, 0.543102, 0.004916, 0.457923, 0.053477, 0.191788, 0.276559, 0.113723, 0.464302, 0.342792, -0.065664, -0.178324, 0.051681, 0.099129, 0.687678, -0.101461, -0.389675, 0.146989, 0.204773, 0.141366, 0.712104, 0.441918, 0.486169, 0.320018, 0.038683, 0.038429, 0.303072, 0.347775, 0.457372, 0.313133, 0.354968, 0.367038, -0.220579, 0.023928, -0.053398, 0.048954, -0.005570, -0.182149, 0.809837, 0.099750, 0.445143, 0.528561, 1.293460, 0.358725, 1.474255, 0.264080, 0.889885, 0.293914, -0.174557, -0.297950, 0.127503, 0.245020, 0.772695, 0.069305, 0.255988, 0.267890, -0.138750, 0.119383, -0.174681, 0.546577, 0.011736, -0.271154, 0.368582, -0.123630, 0.486320, 0.072313, 0.001855, 0.463940, 0.284667, -0.262487, -0.074628, -0.086904, 0.097233, -0.219020, -0.121333, 0.254421, 0.079805, -0.059095, 0.013418, -0.042889, 0.240097, 0.050968, 0.116595, -0.123352, -0.132952, 0.117077, -0.307839, 0.269452, -0.292302, 0.447308, -0.085626, -0.130710, 0.425510, -0.128858, -0.199392, 0.128123, 0.027034, 0.042718, -0.110971, 0.012515, 0.374013, -0.216937, 0.043381, 0.075051, 0.028366, 0.207221, -0.474830, 0.036068, 0.362676, 0.100971, 0.432408, 0.283963, 0.250501, 0.438969, -0.011514, 0.059720, 0.345499, 0.219504, 0.079047, -0.104546, 0.547867, 0.109424, 0.584689, 0.473310, -2.593436, 0.010049, -0.207555, -0.075693, -0.201750, 0.120680, -0.157293, -0.026960, 0.277093, -0.551750, 0.469250, 0.646061, 0.309544, 0.794684, 1.262816, 1.151810]
-,        [0.307817, 0.984170, -0.958625, 0.216040, 0.076207, 0.283322, -1.044310, -0.123108, 1.053821, -0.563832, -0.299474, -0.115937, 0.031797, 0.242031, -0.100374, -0.485892, 0.392025, 0.848214, 0.465525, -0.505085, 0.121686, -0.384643, 0.318003, -0.173987, 1.064116, 0.551127, 0.763514, -0.131854, -0.809218, 0.334926, 0.078810, 0.527359, -1.000938, -0.190500, -0.484777, -0.208599, 0.135314, 0.219585, -0.188747, 0.267720, 0.629362, -0.389570, -0.627311, 0.412286, 0.306882, -0.734220, 0.837579, 0.702432, 0.308658, -0.406104, 0.392764, -0.086011, 0.251924, 0.231149, 0.786000, 1.205682, -0.562607, 0.118170, -0.123281, 0.018225, 0.125888, -0.081561, 0.636443, -0.008072, -0.339918, -0.374750, 0.309383, 0.556139, 0.012726, 0.294139, -0.449003, 0.189523, -0.149764, 0.450923, -0.614825, 0.283292, 0.111754, -0.087691, -0.862320, 0.806813, 0.563237, -0.285035, -0.699477, 0.271191, 0.255326, 0.342338, 0.421450, 0.022584, -0.028448, -0.017237, -0.770663, 0.084581, 0.011092, 0.413579, -1.218578, 0.240377, -0.042392, -0.158592, -0.090138, 0.844043, 0.267598, 0.531943, -0.893036, 0.667449, -0.565369, 0.436039, 0.012221, 0.542370, 0.315633, 0.434017, -0.155693, 0.375217, -0.189659, 0.404533, -0.134902, -0.360450, 0.144666, 0.884001, 0.227864, 0.200332, 0.419573, 0.506955, 0.245811, 0.018025, 0.243184, -0.131149, -0.068327, 0.432203, 0.039421, 0.176807, 0.006219, 0.113275, 0.218350, -0.100169, 0.057518, 0.274791, 0.464244, -1.344685, 0.105060, 0.093363]
-,        [0.064346, -0.382805, 0.268415, 0.005116, -0.140267, -0.000651, -0.379386, -0.194269, 0.061036, -0.239912, 0.517313, -0.551282, 0.274813, -0.427758, 0.506795, 0.184402, -0.140642, -0.640445, -0.026656, -0.747158, -0.209020, 0.639369, -0.476674, -0.434057, 0.185384, -0.808698, -0.305207, -0.310310, -0.389728, -0.135133, -0.383241, 0.258526, 0.849486, -0.999965, -1.389781, -0.448543, 0.414060, 0.345971, -0.275342, 0.008351, 0.607074, -0.246924, -0.052835, 0.341888, -0.670067, -1.096842, 0.025295, -0.400429, -0.839308, -0.074500, 0.654095, -1.425333, 0.563623, 0.249978, 0.331428, 0.163871, -0.650968, -0.090575, 0.076844, 0.744915, 1.127931, -1.096344, -0.322124, -1.101717, -0.050688, 0.506220, -0.084259, 0.085428, 0.979707, 0.102758, -0.517621, 0.293500, -0.123800, -0.254263, -0.516327, 0.133468, -0.363902, -0.438506, -0.752282, -0.947335, -0.095610, -0.199533, -0.778815, -1.035306, 0.289895, 0.598743, 0.004515, 0.189278, 0.105379, -0.180170, -0.328489, 0.112360, -0.408281, -0.361911, 0.311034, -0.833081, 0.184239, -0.339214, -0.196069, 1.005899, -0.311870, 0.054780, -0.562928, 0.053209, -0.473822, -0.616209, 0.370883, -0.001693, -0.765077, -0.071701, 0.671598, 0.213803, 0.346019, 0.138742, 0.300786, 0.344413, 0.095117, -0.071726, 1.059517, -0.136039, -0.941429, -0.214620, -0.513788, -0.441113, -0.412454, 0.048703, -0.188922, -0.690875, -0.603364, -0.597514, -0.802063, -0.304656, -0.241432, -0.133924, -0.123912, 0.084218, -0.526138, -0.179311, -0.541744, -0.638523]
-,        [0.637306, 0.334489, -0.075270, -0.236331, -0.214262, -0.342261, 0.146927, 0.059802, -0.041623, 1.138196, -0.451503, 0.522985, -0.023648, 0.244912, 0.195884, -0.070557, 0.542112, -0.114754, 0.257078, 0.176004, 0.704561, 0.329078, 0.596181, 0.672043, 0.146022, 0.533260, -0.354706, -0.523190, 1.174448, 1.294303, -0.395609, 0.528255, 0.151928, 0.480442, -0.301450, -0.512108, 0.575484, -0.006334, 0.551655, 0.401129, -0.425324, -0.023358, -0.240803, -0.006029, -0.208706, 1.097693, -0.881012, -0.343797, 0.345362, 0.407767, 0.102985, -0.045165, 0.142290, 0.261813, -0.301718, -0.503456, 0.049598, 0.467374, 0.068017, -0.221261, -0.575655, 0.263983, 0.959989, -0.067945, -0.154998, 0.873320, 0.297925, 0.304836, 0.581930, -0.965914, 0.186097, 0.083578, 0.639802, -0.560614, 0.314812, 0.371575, -0.212183, -0.763062, 0.714150, 0.246117, -1.000552, -1.559003, -0.410091, -0.406688, -0.195883, 0.361401, 0.813437, 0.089866, 0.097401, -0.987078, -0.774752, 0.264216, 0.356070, -0.449540, 0.540874, -0.265585, 0.011967, 0.021187, 0.407597, -0.392869, 0.102149, 0.038556, -0.029813, 0.088591, 0.644865, 0.010768, 0.356610, 0.013897, -0.530158, -0.621619, -0.158088, -0.061500, 0.203488, -0.008858, 0.507684, -0.028513, -1.308115, -0.915825, 0.591024, 0.408080, 0.160006, 0.010866, -0.310992, -0.314816, -0.540970, 0.088507, 0.293182, -0.436577, 0.319454, 0.267738, 0.247281, 0.388630, 0.135367, 0.442457, -0.144076, 0.089925, -0.727778, 0.238353, -0.994062, 0.148544]
-,        [-0.388861, -0.513912, -0.371975, -0.864192, 0.415133, -0.031413, 1.159983, 0.612732, -0.106964, 1.024906, -0.062245, 0.511135, 0.140853, 0.347535, -0.176533, -0.284411, -0.314104, 0.721010, -0.247133, 0.014321, 1.107916, 0.035903, 0.033198, -0.051065, 0.615954, 0.550720, 0.241623, 0.827251, 0.498931, 1.045249, 0.824606, 0.003585, -0.117637, 0.595272, 0.336595, -0.129268, 0.046410, -0.242397, -0.220685, -0.116782, 0.984964, 0.143493, 0.054648, 0.049848, 0.046115, 0.734945, 0.078338, -0.227215, 0.426896, -0.474000, 0.148758, 0.562294, 0.030074, 0.161119, 0.315876, 0.352045, 0.665590, 0.599296, 0.279339, 0.606616, 0.710104, 0.291441, 0.429436, 0.443828, -0.348062, 0.428302, -0.125291, -0.133698, 0.503557, 0.025178, -0.239037, 0.526034, -0.188513, -0.948348, 0.112574, 0.306354, -0.199390, -0.362411, 0.248622, 0.007277, -0.756620, -0.147553, -0.177353, -0.179907, -0.120117, -0.345761, 0.042133, 0.490486, -0.328093, -0.137058, -0.434774, -0.163276, -0.065208, -0.336174, 0.998483, 0.022620, 0.284249, 0.408316, -0.118745, -0.150923, -0.561839, -0.051903, -0.088927, 0.375378, -0.770005, -0.582797, -0.639504, 0.099363, -0.553663, 0.342379, 0.041158, 0.446819, 0.250576, -0.171875, 0.127480, 0.396930, -0.527790, -0.327444, -1.192184, 0.424421, 0.126207, -0.135503, -0.452799, -0.886569, 0.338484, 0.073018, -0.145387, -0.347043, -0.152112, 0.208744, 0.375978, -0.111518, -0.052554, 0.394833, 0.110357, 0.415127, -0.569914, 1.015577, 0.160275, -0.586940]
-,        [-0.292992, 0.138472, 0.427133, 0.473073, 0.405972, 0.967783, 0.876072, 0.152858, 0.058864, 0.392927, 0.720227, -0.212195, 0.185373, -0.760607, 0.875090, -0.847216, -0.349777, -0.199755, 0.527060, 0.028572, -0.012864, 0.005576, -0.068133, 0.567206, 0.499550, 0.632611, 1.408828, 0.544757, 0.236035, 0.798577, -0.541617, -0.053173, 0.897489, 0.559463, 0.177186, 0.693585, 0.225054, -0.029268, -0.389938, 0.307641, 0.860193, 0.138350, 0.309515, 0.090486, 0.445837, 0.365401, 0.110962, 0.667681, 0.068759, 0.675815, -0.221269, 0.702530, 0.401118, -0.055114, 0.211508, 0.345664, 0.124072, 0.247559, 0.465365, 0.417471, -0.643052, 0.064032, 0.172086, 0.806847, 0.347165, 0.271663, 0.055164, 0.856087, 0.567225, 0.328603, 0.451442, -0.013789, -0.457463, 0.122229, -0.051955, -0.076878, 0.057627, 0.129495, -1.173442, -0.141304, -0.345465, -0.239236, 0.017196, -0.262091, 0.095907, -0.564384, -0.803871, 0.133095, -0.059640, 0.458550, -0.017846, 0.130227, 0.083456, -0.291632, -0.897162, -0.147870, 0.543219, -0.288869, 0.195286, -0.358207, -0.541917, -0.051901, -0.394986, 0.183653, 0.306806, -0.037391, -0.453273, -0.241885, -0.471817, -0.124961, -0.445044, 0.422565, -0.057941, 0.757479, -0.078516, -0.520448, -0.480620, 0.229464, 0.067149, -0.088169, -0.030937, -0.429992, -0.593913, -0.781392, -0.120521, -0.044886, 0.345553, -0.855438, -0.534064, 0.143778, -0.069800, 0.487849, -0.218565, 0.394124, 0.855316, 0.364054, -0.156043, 0.811321, 0.707143, -0.033371]
-,        [0.680660, 0.107052, -0.117711, 0.305976, 0.263449, 0.141383, 0.663684, -0.269547, 0.284387, -0.264114, -0.203995, -0.488936, 0.382766, -0.911491, 0.886941, 0.413789, -0.791529, 0.337345, -0.008181, 0.269229, 0.183494, 0.811987, 0.314714, 0.130771, 0.258042, 0.094927, 0.784839, -0.771094, 0.371345, 0.716660, 0.309209, -0.058067, -0.396254, -0.129165, 0.170294, 0.359210, 0.334745, 0.552490, 0.274936, 0.675848, 0.550988, 0.338242, -0.327693, -0.031531, -0.391337, -0.605352, 0.442476, 0.483895, -0.200790, -0.674846, -0.149107, 0.789435, -0.212819, 0.593526, 0.976680, 0.543255, -0.566476, 0.444682, 0.033162, 0.888276, 0.098982, 0.206856, 0.489958, 0.105073, -0.407942, 0.511965, 0.119133, 0.198235, -0.202173, 0.457824, -0.077100, 0.415263, -0.020836, -0.228349, -0.276054, -0.906309, 0.256015, 0.045463, -0.651522, -0.922701, 0.235240, 0.327593, -0.158199, -0.336098, -0.526886, 0.525340, -1.138143, 0.143226, -0.320298, 0.026866, -0.507129, -0.254739, 0.404546, 0.166110, -1.003260, 0.085484, -0.749473, 0.009173, -1.113058, 0.078371, -0.119342, -0.174721, -0.931146, -0.052669, 0.367559, 0.009617, -0.806040, -0.412799, 0.411350, -0.539579, -0.717317, -0.058380, 0.323069, -0.176650, 0.185421, -0.610112, 0.135779, -0.167142, 0.302518, -0.358625, -0.517562, -0.316514, -0.553160, -0.123031, -0.039164, -0.532102, 0.202788, -0.403801, 0.133020, 0.347667, -0.479187, -0.242548, 0.024655, -0.287164, -0.804269, 0.408019, -0.037487, 0.685896, -1.321398, 0.266706]
-,        [-0.144843, 0.366041, 0.269274, -0.633614, 0.123585, -0.246633, 0.026301, 0.437444, 0.133225, 0.702055, -0.173776, 0.475943, 0.438325, -0.681943, -0.350881, -0.133062, 0.765092, -0.572158, -0.773924, -0.282186, 0.221436, -0.880748, -0.069686, -0.681917, -1.019467, 0.170697, 0.183148, 0.418704, 0.819982, 0.111531, -0.886778, 0.177130, 0.401610, 0.436420, -0.116469, -0.402778, 0.374993, 0.356904, -0.568762, -1.157800, 0.004089, -1.221180, -1.174102, -1.125447, -0.378393, -0.257338, -0.853226, -0.130254, 0.438078, 0.763907, -0.941731, 0.267748, 1.054396, -0.634037, -0.414123, -0.120280, -1.565815, 0.874039, 0.031634, 0.256096, 2.218822, -1.226765, -0.959319, -0.643632, -0.587965, -1.202819, -1.074858, -0.685615, -0.010975, -0.013350, 0.039599, 0.514379, 0.204529, -0.235550, 0.009310, 0.071391, 0.463217, -0.524732, -0.274781, 0.185560, -0.188302, 0.211416, -0.519652, 0.168165, -0.005803, -0.004043, -0.570871, -0.536172, 0.219137, -0.114053, 0.227957, 0.420034, 0.480338, 0.203547, 0.000576, 0.417638, 0.279233, 0.299834, -0.540718, 0.298282, 0.027399, -0.045917, 0.638896, -0.207677, -0.013227, 0.331061, -0.468641, -1.316224, -0.018993, -0.272726, 0.495781, -0.315985, 0.572947, -0.172357, 0.955518, -0.207045, -0.144637, -0.148096, 0.069366, 0.287484, 0.129620, -0.266342, 0.116637, -0.042977, 0.094909, 0.024032, 0.050009, -0.112435, -1.065240, -0.713324, -1.082827, -0.187821, -0.617587, -0.531556, -0.330660, -0.503334, -0.087850, 0.188360, -0.090471, -0.003284]
-,        [1.155267, 0.879658, 0.994639, 1.169763, 1.163786, 0.942261, 1.165160, 1.076255, 1.146601, 1.200019, 1.039229, 0.867404, 1.075642, 1.201978, 1.149754, 1.210345, 1.175763, 0.742920, 0.777543, 0.593564, 0.485971, 0.831587, 0.700609, 0.524380, 0.496862, 0.750380, 0.922868, 0.744846, 0.439912, 0.386790, 0.366181, 0.534674, 0.798474, 0.535232, 0.362709, 0.714249, 0.423859, 0.495388, 0.845138, 1.121975, 0.451423, 0.593077, 1.034410, 0.806699, 0.397211, 0.791192, 0.471708, 0.401481, 0.330518, 0.732497, 0.322291, 0.975211, 0.516467, 0.496764, 0.421728, 0.814380, 0.471459, 0.357956, 0.527520, 0.735359, 0.312781, 0.647421, 0.538410, 0.949504, 0.629710, 0.720880, 0.503193, 0.408107, 0.481568, -0.052960, -0.268671, 0.165537, -0.298255, -0.025723, 0.018179, -0.073974, 0.200967, -0.040780, 0.062389, 0.122945, 0.169637, -0.040130, -0.089390, 0.001673, 0.145685, 0.098068, 0.100847, -0.170455, 0.079542, -0.026258, -0.231682, -0.104282, 0.252081, -0.186103, -0.398503, -0.102657, 0.022619, -0.076245, 0.062937, 0.028335, 0.250652, -0.005272, 0.007858, 0.217665, 0.010230, -0.275876, -0.176171, -0.023121, 0.019757, -0.246313, 0.231807, 0.077123, 0.130601, -0.087475, 0.126218, 0.008898, -0.090832, 0.134954, 0.211227, -0.135294, 0.193158, -0.226568, 0.579177, -10.614799, -1.992433, -0.510894, -0.094665, -0.091162, -0.128232, -0.195538, -0.216003, -0.090434, 0.047377, -0.064017, -0.104846, -0.025869, 0.036699, 0.842183, -0.185199, 1.465824]
-,        [0.233906, 0.018979, 0.068536, -0.321883, -0.156766, -0.519895, 0.835937, -0.250589, -0.273366, -0.299598, 0.487324, -0.336208, 0.572909, 0.322294, 0.660148, 0.006078, -0.055882, -0.064851, 0.342713, 0.298828, 0.156979, -0.475518, -0.075817, -0.600176, 0.956833, -0.941728, -0.476349, 0.548846, 0.207334, 0.525924, 0.321071, -0.405368, -0.331891, 0.298619, 0.346349, -0.743126, 0.092976, 0.194602, -0.121200, 0.868895, -0.101500, 0.516106, 0.231281, 0.111616, -0.692180, 0.038963, -0.267467, -0.035878, 0.178013, 0.098741, 0.252797, -0.092644, 0.403929, -0.495815, 0.363396, -1.132970, 0.122214, 0.691646, -0.423028, 0.159618, -0.289162, -0.782299, 0.069376, 0.553950, -0.426574, 0.857675, 0.001118, 0.323317, 0.964074, -0.731500, 0.109606, 0.224375, -0.007312, -0.924751, -0.528790, -0.225531, -0.304292, 0.823654, 0.619470, 0.002010, 0.049160, -0.108419, -0.342443, 0.021568, -0.459727, -1.080327, -0.002512, 0.825447, -0.039079, -0.428382, -0.057350, 0.105391, -0.618638, -1.091923, 0.082320, -0.882306, 0.033829, -0.686145, -0.103134, -0.457634, -0.153429, 0.331494, -0.161160, -0.170073, -0.123054, -0.559412, 0.758922, 0.088241, -1.067011, 0.047326, 0.108610, 0.595045, 0.094640, -0.167046, 0.715749, 0.461915, -0.673011, -0.197915, 0.081149, -0.067878, -0.133503, -0.277091, -0.255549, 0.307361, -0.390229, -0.014534, -0.657256, -0.024553, -0.295233, 0.092803, -0.613964, -0.270534, -0.191278, 0.123579, -0.014724, 0.190896, -0.442643, 0.786028, -1.246605, -0.155692]
-,        [-0.956400, -0.033070, -0.645912, 0.054164, 0.443355, -0.519163, 0.339563, -0.069050, 0.474173, -0.143142, 0.765655, -0.284693, 0.151269, 0.401554, -0.208037, -0.362562, 0.152384, 0.925771, -0.119965, -0.504497, 0.079598, 1.221492, -0.034305, 0.243595, -0.169001, -1.036637, 0.140674, -0.328711, -0.984803, 0.245700, 0.941342, -0.320323, 0.818007, 0.134039, -0.346358, 0.726973, 1.159535, 0.741173, 1.012802, 0.280675, -0.455931, -0.380462, -1.181231, 0.008108, -0.566622, -0.115746, -0.791439, -0.845816, -0.246827, -0.307084, -0.093749, -0.305629, 0.487367, 1.371027, -0.396507, 0.107118, -0.632055, 0.691266, 0.216465, -0.281910, -0.513446, -0.056293, 0.111367, -0.692300, 0.690079, 0.739878, 0.208121, -0.258700, -0.198734, -0.203787, -0.135075, 0.095332, 0.098617, -0.463357, -0.552570, 0.237818, -0.143530, 0.034458, -0.213106, -0.155619, -0.369905, 0.077638, 0.296750, 0.043240, -0.250209, -0.667886, -0.384059, -0.115284, 0.322310, -0.087907, 0.482933, -0.350210, 0.168357, -0.933120, 0.453712, 0.050548, 0.075867, -0.398070, -0.458170, 0.787058, -0.243637, 0.501192, -0.547108, 0.369983, 0.022074, 0.013161, 0.258442, 0.075946, 0.019295, -0.529246, -0.371238, 0.315144, 0.096305, -0.411481, -0.012062, 0.043640, 0.157319, -0.114767, -0.606597, -0.107414, -0.223184, -0.303803, -0.260464, -0.591470, -0.684230, -0.840053, 0.049523, 0.032064, -0.503775, -0.456339, 0.104239, -0.426349, -0.042328, -0.095489, -0.315608, 0.127238, -0.663929, 0.395539, 0.160375, -0.136462]
-,        [0.374084, 0.579592, 0.456258, 0.897206, 0.295650, 0.420372, -0.272627, 0.612872, 0.025517, 0.238909, 0.400464, 0.945944, 0.000231, -0.889496, -1.028595, 1.603144, 1.088148, 0.267467, 0.088722, 0.824838, 0.308087, 0.250373, 0.833285, 0.749423, -0.015540, 1.131225, 0.739352, -0.058095, -0.331950, 0.694748, 0.509195, 0.122415, 0.423087, 0.664064, 0.669229, 0.440410, -0.065764, 0.865336, 0.615983, 0.537942, 0.211898, 0.385176, 1.135673, -0.145780, 0.000431, 0.144120, 0.049542, -0.148883, 0.448148, 0.864551, 0.647549, 0.311588, -0.013777, 1.083942, 0.563011, 0.769888, 0.112436, 0.513671, 1.131390, 0.297803, 0.650459, 0.653614, 0.260405, 0.024118, 0.498928, 0.036033, 1.203140, -0.150715, 0.473842, 0.205834, 0.141414, -0.542657, -0.043870, -0.024640, 0.183125, -0.579666, 0.165683, 0.379154, 0.259849, 0.263756, 0.178063, 0.279349, 0.101314, -0.804911, 0.042115, 0.097973, -0.010992, -0.435178, 0.607616, 0.335985, 0.547923, -0.078634, 0.150481, -0.281504, 0.205506, -0.121597, 0.063013, 0.202489, 0.433986, -0.302375, 0.179067, 0.493229, 0.178093, -0.360430, 0.078104, 0.251063, 0.137243, -0.336632, 0.380339, -0.117113, 0.160893, -0.483591, -0.270679, 0.409564, 0.094039, -0.414659, 0.082923, 0.323154, -0.052311, -0.687244, 0.443484, -0.363855, -1.188755, -0.381227, 0.117386, -0.344062, -0.335294, -0.335555, -0.680357, -0.682156, -0.573550, 0.194853, 0.356537, -0.245709, -0.184843, 0.411740, -0.139492, 0.102871, 0.937149, 0.344548]
-,        [-0.086236, 0.265368, 0.207963, 0.273632, 0.314978, 0.306881, 0.402922, -0.063083, 0.227284, -0.147153, 0.737208, -0.265525, 0.824835, -0.365442, -0.237913, 0.053889, 0.246669, 0.100614, 0.119197, 0.348827, -0.308697, 0.133190, 0.411730, 0.525526, 0.149448, 0.039895, -0.388744, 1.035763, -0.429511, 0.363477, 0.090426, 0.207121, 0.320995, 0.144221, 0.073488, 0.511366, 0.505139, -0.230271, -0.856807, 0.861006, 0.751351, 0.144497, 0.242572, 0.428617, 0.146765, 0.024146, -0.224401, 0.083485, 0.579266, 0.353708, 0.116365, 0.427241, 0.426327, 0.416022, 0.584548, 0.308053, 0.706430, 0.778275, -0.519263, 0.288876, 0.319985, 0.363699, 0.201086, -0.184726, 0.718018, 0.086573, 0.202055, 0.432379, 0.906326, 0.237803, 0.320353, 0.023983, 0.558126, 0.040593, -0.218340, -0.191511, -0.041254, -0.645182, 0.761234, -0.126378, 0.671818, -0.432781, 0.160252, -0.588052, -0.296819, 0.129944, -0.141084, 0.040387, -0.765592, 0.015348, 0.386435, -0.262501, 0.301417, -0.517890, 0.199774, 0.133502, 0.350241, -0.168755, -0.261890, -0.155094, 0.684625, 0.219491, 0.398641, -0.194358, -0.212014, -0.220099, 0.473105, 0.458874, 0.286656, -0.026913, -0.338302, -0.056583, -0.753804, -0.196217, -0.621444, -0.278352, -0.109602, -0.331501, -0.883946, 0.422623, 0.507864, -0.329081, -0.034741, -1.919670, -1.389099, -0.966009, -0.332488, -0.555160, -0.255674, -0.122166, -0.134958, -0.169380, 0.050614, -0.176607, 0.019910, 0.006793, -0.360453, 0.295646, 0.330711, -0.664966]
-,        [-0.646010, -0.487091, 0.209422, -0.183073, 0.539271, 0.127598, -0.875854, -0.179399, -0.953714, 0.446283, -0.018551, 0.096934, 0.426148, 0.555722, 0.523301, -0.188197, -0.896592, -0.503388, 0.871486, 0.158466, 0.441785, 0.896590, -0.395230, -0.893716, -0.404167, 0.915244, 0.492274, -0.138026, 1.392023, -0.886921, -1.359995, -0.596785, -0.131920, -0.208517, -1.194467, -0.359848, -0.451885, -0.376964, -0.160322, -0.416811, -0.612046, -1.628695, -0.547727, -1.301215, -1.778674, -0.810316, 1.823913, 0.023595, 0.014302, -0.737224, -1.188609, -1.355878, -1.317595, 0.048717, -1.342241, -0.652356, 1.017095, 0.984498, -0.452799, -1.599842, -0.976409, 0.701655, -0.456464, -0.370207, -1.459794, -0.554143, 0.763317, 0.865426, 0.993304, -0.146000, -0.910300, 0.130346, 0.022768, -0.256092, 0.417509, -0.887024, -0.346326, 0.045222, 0.346139, -0.023488, -0.257214, -0.207535, 0.905877, 0.345392, -0.572247, 0.008879, 0.037032, -0.049170, 0.095178, 0.696656, -0.359106, -0.184112, -0.568380, 0.214855, 0.595485, -0.168775, 0.071378, 0.287667, -0.387121, 0.201069, -0.067309, -0.034459, 0.525050, -0.116133, 0.042216, -0.668726, -0.150471, -0.231827, -0.535002, 0.293960, 0.001251, -0.301588, 0.213752, -0.089893, -0.009288, 0.011982, 0.054351, -0.345107, -0.111809, -0.192704, -1.169334, 0.054382, 0.028070, 0.294885, -0.054675, 0.268259, -0.213005, -0.550967, -0.136193, -0.729497, 0.167609, -0.089736, -0.399361, -0.422199, -0.151500, -0.188526, -0.317386, -0.908846, -1.161561, -0.450731]
-,        [-0.106977, -0.043799, -0.395485, -0.290547, -0.094179, 0.407160, 0.758195, 0.386288, -0.201466, 0.547783, -0.073571, -0.268317, -0.204340, 1.514553, 0.638234, -0.921462, -1.061464, -1.048262, -1.441663, -3.739961, -0.244259, 0.306677, -0.662196, -2.602259, 0.399602, -1.585678, -1.244685, -2.999046, 0.079361, 0.288030, 0.144081, -0.787066, 0.603429, -0.231254, -0.900156, -2.342917, 0.866665, 1.860260, 0.292741, 0.268022, 1.602168, 0.568780, -2.431171, -4.871250, -2.630782, 0.312927, -0.387790, -1.832035, 0.732951, -0.960111, -0.429081, -3.838503, -0.701739, -0.318624, -0.187355, -1.241390, 0.760518, -0.304603, -0.744566, -2.059459, 0.229420, -1.790597, -2.263557, -5.528323, -0.642496, -0.257561, -0.812170, -2.089045, 0.221576, 0.237119, -0.072666, 0.236253, -0.471177, 0.691906, -0.260007, -0.119604, -0.686163, -0.200370, -0.381265, 0.289891, -0.203707, 0.204037, 0.106788, 0.086575, -0.902080, -0.028440, 0.034852, -0.311502, -0.292023, 0.394582, 0.114637, 0.462017, -0.831899, 0.385233, 0.469131, 0.057559, -0.019982, 0.330823, -0.049302, -0.046382, -0.495802, 0.294404, 0.071211, 0.461608, -0.167343, 0.043648, 0.383208, -0.255526, -0.516076, 0.167941, 0.272112, 0.240838, 0.216476, 0.610643, -0.299370, -0.418674, -0.543823, -0.104028, -0.434147, -0.077840, -0.129503, -0.392064, 0.292263, 0.080044, -0.062532, 0.184946, 0.154027, 0.178563, 0.208836, -0.000951, 0.185021, 0.233300, 0.146250, -0.174803, -0.098545, -0.280874, -0.140989, 0.816233, 0.710767, -0.435617]
-,        [-0.102427, -0.091467, -0.360754, -0.355452, -0.060925, -0.026094, 0.130066, -0.107273, 0.049438, -0.215255, 0.009184, -0.201805, -0.253765, -0.186026, -0.184188, -0.133399, -0.240472, 0.143239, -0.116696, 0.185227, -0.444680, 0.226739, 0.036670, 0.365026, -0.018348, -0.198621, 0.101428, -0.119106, 0.117976, 0.080073, -0.128509, 0.132381, -0.224240, -0.370436, -0.275467, -0.055663, 0.067508, -0.054880, 0.186465, 0.001872, 0.165479, -0.125036, -0.420111, -0.353662, -0.909983, 0.090041, -0.001550, -0.075232, -0.079010, -0.129892, 0.046285, -0.098722, 0.159409, -0.132840, 0.106165, 0.288995, 0.143436, 0.133745, -0.177774, 0.067660, -0.206676, -0.185659, 0.205180, -0.028510, 0.026325, -0.236127, 0.064973, 0.243542, -0.376997, -0.179636, -0.054793, 0.122820, -0.040732, 0.241778, -0.468789, -0.337435, -0.229581, -0.098612, -0.127046, -0.160661, -0.113783, 0.008623, 0.038202, -0.093521, 0.014712, -0.110660, 0.039744, -0.051146, 0.030401, -0.028893, 0.258777, 0.202963, -0.128357, -0.045135, -0.014492, -0.131142, -0.168482, -0.197355, -0.495682, -0.012047, -0.288879, 0.039789, -0.070857, -0.054561, 0.067812, -0.119100, -0.087093, -0.174715, 0.117965, 0.006682, -0.035149, -0.102189, 0.110192, -0.040948, -0.066080, -0.217911, -0.042120, -0.119103, 0.101163, -0.319024, -0.114014, -0.231257, -0.362476, -0.262882, -0.114245, -0.012750, -0.307761, -0.286668, -0.080508, -0.074496, -0.056714, -0.206713, -0.202198, -0.194839, 0.009403, -0.112041, 0.047440, 0.152583, 0.360161, -0.604336]
-,        [0.885631, -0.046302, -0.036781, 0.404625, -0.041156, -0.218536, 0.245267, 0.045179, -0.630638, 0.127606, -0.042256, -0.203114, -0.348924, -0.288735, -0.284311, 0.587576, 0.411558, -0.942450, 0.039523, 0.580158, -0.012432, -1.308442, -0.073600, 0.652421, 0.133371, 0.270615, 0.385678, -0.359499, 0.068497, -0.285556, -0.222432, 0.431961, -0.462126, -0.219583, 0.047883, 0.292517, 0.048832, -0.721091, 0.990565, 0.190969, 0.388667, -0.400128, -0.423550, -0.924354, 0.538296, -0.620433, 0.196091, 0.434253, 0.023273, 0.331756, 0.611280, 1.012598, 0.703955, -0.325637, -0.367247, -0.140500, -1.160903, -0.648044, 1.090847, 0.624481, 0.261481, -0.396443, 0.132822, -0.408161, 0.099757, -0.804716, -0.189801, -0.790913, 0.038417, 0.360936, -0.637232, -0.526630, -0.091455, 0.505353, -0.225528, -0.306614, 0.042755, -0.650134, -0.342292, -0.445066, 0.474588, 0.731453, 0.103749, 0.182023, 0.488735, -0.108439, -0.349335, -0.779826, 0.702619, -0.429076, -0.208679, -0.418028, -0.194773, -0.230600, -0.064309, -0.159205, 0.880418, -1.101687, -0.681838, -0.299695, 0.756703, 0.408370, -1.620542, -0.273202, -0.350319, -0.275580, 0.011999, -0.254402, -0.007327, -0.399241, 0.418769, -0.175991, 0.182494, -0.362846, -0.295838, 1.138706, -0.412615, -0.082513, -0.989069, -0.147226, 0.315312, -0.265381, -0.099201, -0.180251, -0.085295, -0.258403, 0.150651, 0.565217, 0.074231, -0.087672, -0.029243, -0.331558, -0.203506, 0.049486, -0.195006, -0.246173, -0.467001, 0.195934, 0.560457, -0.364814]
-,        [0.844763, 0.396813, 0.834702, 0.997116, 0.677581, 0.634582, 0.721594, 0.806307, 0.546228, 0.499570, 0.262873, 0.437304, 0.773189, 1.004953, 1.015285, 1.169931, 1.128312, -0.098828, -0.160564, 0.056964, -0.101636, -0.156147, 0.043451, -0.090487, -0.076460, -0.313540, 0.065484, 0.215289, -0.043364, -0.212760, -0.037311, -0.008132, -0.048114, -0.078018, -0.098360, -0.007427, 0.187605, 0.219420, 0.269052, 0.253766, -0.026377, -0.612586, -0.378964, -0.701177, -0.648605, -0.075049, 0.214723, -0.220931, 0.424689, 0.080772, 0.068174, -0.059138, 0.075670, -0.360898, 0.071750, -0.232994, -0.325131, -0.107269, -0.277079, 0.128645, -0.027776, -0.387063, -0.027687, 0.340190, -0.181176, 0.363592, -0.188374, 0.132517, 0.042838, 0.050281, 0.035230, 0.087987, -0.002391, 0.011304, 0.126250, 0.121811, 0.067616, -0.211345, 0.118623, -0.038938, -0.091271, -0.052786, -0.265521, -0.012206, 0.030436, 0.093930, -0.153297, 0.270711, 0.023077, 0.122268, 0.014815, -0.034535, 0.073656, -0.146792, -0.349737, -0.128303, -0.150824, 0.011532, 0.126352, -0.061129, 0.014249, 0.021694, 0.006385, -0.081109, 0.057797, 0.061860, 0.021061, 0.004609, -0.058981, -0.103447, 0.072133, 0.056658, 0.204817, 0.186106, -0.192282, 0.257300, -0.028362, 0.179140, -0.037294, -0.032204, 0.135293, 0.329042, 0.571034, 0.763864, -12.449507, -2.327726, -0.699236, -0.131258, -0.161296, -0.106756, -0.051694, -0.086959, -0.023520, -0.102369, -0.079410, -0.134212, -0.001886, 0.061775, -1.072486, 0.969818]
-,        [-0.050136, 0.989089, 0.225435, -0.321550, -0.146730, -0.659607, 0.726061, -0.630969, 0.096737, 0.465087, -0.168510, 0.907330, 0.296767, -0.282092, -0.441176, 0.110620, 0.557222, -0.868866, 0.203083, 0.148384, 1.150137, 0.014387, -0.009909, -0.517356, 0.444957, 0.059693, -0.242953, -0.256203, -0.476507, -0.440620, 0.152792, -0.025847, -0.219198, 0.916783, 1.089286, -0.256871, 0.835882, -0.150409, 0.779313, 0.685594, 0.289956, 1.387550, -0.197394, 0.664405, -0.256522, 0.547118, -0.682772, 0.034382, 0.062979, 0.549852, 0.143067, 0.426903, 0.039751, 0.924349, 0.092689, 0.152044, -0.430128, 0.276940, -1.172237, 0.927318, -0.569320, 0.013182, 0.250426, -0.040995, 0.076495, -0.103495, 0.660116, 0.019845, 1.377967, -0.091168, -0.484018, -0.383450, -0.280908, -0.117304, -0.674097, 0.058731, -0.707560, -0.349484, 0.135246, 0.225924, -0.459143, -0.124318, 0.114464, 0.505762, -0.034896, -0.229273, 0.095137, 0.059403, 0.036297, -0.046502, -0.211909, 0.710108, -0.123602, -0.742863, 0.108391, 0.976749, -1.162330, -1.406388, 0.313187, 0.001643, -0.236066, -0.350342, -0.293969, -0.271995, -0.256745, 0.384670, 0.494232, 0.069908, -0.849596, -0.637876, -0.010184, -0.141751, 0.448912, -0.125790, -0.313050, 0.171786, 0.837217, -0.999656, -0.303642, -0.061299, -0.301466, 0.268213, -0.062709, -0.279502, -0.148102, 0.301218, -0.273290, -0.364679, 0.019252, 0.077850, -0.520811, -0.710543, -0.033795, -0.207866, 0.291062, -0.122896, 0.239904, 0.717508, -0.502017, -0.275749]
-,        [0.070492, 0.067706, 0.768865, 0.408203, 0.485286, 0.837105, 0.082223, 0.182122, 1.198341, 0.024686, 0.561144, -0.098610, 0.473465, 1.032053, 0.451031, -0.108313, -0.360595, 0.123531, -0.265362, 0.173276, 0.169026, 0.573645, -0.083404, 0.411131, 0.205934, -0.004537, -0.868972, 0.601861, -0.250219, 0.284386, 0.314039, -0.115112, -0.101231, 0.466835, -0.373757, 0.153071, 0.395682, 0.293155, 0.744083, 0.073681, 0.039535, 0.005743, 0.131321, 0.474216, -0.389588, 0.495425, -0.225222, 0.392940, -0.465436, 0.426713, -0.531079, -0.146123, -0.082756, 0.664282, 0.406477, 0.241797, 0.092851, 0.077957, 0.239064, 0.065475, 0.180540, -1.225754, 0.207561, 0.299104, 0.645481, 0.104273, 0.379396, 0.325227, 0.296013, -0.646260, 0.333691, 0.259757, 0.558191, 0.287597, 0.741633, 0.632056, 0.597164, -0.503089, 0.384652, 0.635069, -0.107253, -0.308442, 0.605640, 0.342263, -0.217467, -0.462228, 0.207744, 0.004422, -0.229814, -0.230627, -0.536734, 0.643941, 0.024784, -0.314355, 0.118994, 0.381689, 0.231163, -0.507161, 0.428234, -0.026797, 0.234793, 0.202625, -0.063003, -0.439436, 0.378306, -0.150753, -0.285229, 0.867373, 0.406479, -0.918260, 0.073648, 0.014106, 0.928338, -0.121152, 0.254452, -0.285397, 0.291273, -0.262939, -0.459494, 0.348374, -0.418994, -0.714962, -0.213873, -0.391244, -0.096241, 0.056959, -0.252033, 0.491538, 0.074559, 0.013591, 0.133719, -0.362862, -0.405256, -0.071027, -0.388041, -0.305702, -0.038413, -0.653810, 1.790163, 0.688258]
-,        [-0.606155, -0.005118, 0.271270, 0.506750, 0.093796, -0.101580, 0.062905, 0.215301, 0.454563, 0.224742, 0.888565, 0.269659, 0.441537, -0.061427, -0.170222, 0.516319, 0.313220, -0.093461, -0.723831, 0.523147, 0.200516, -0.184338, 0.790236, 0.347820, 0.136375, 0.706719, 0.070345, -0.131965, 0.119990, 0.222175, 0.492403, 0.316829, -0.266401, 0.009006, 0.545620, 0.050159, 0.310778, 0.928718, 1.398060, 1.091986, -0.352942, 0.669001, 0.144466, 0.442678, 0.096102, 0.446164, 0.376295, 0.286633, 0.522965, 0.019290, 0.961837, -0.012852, 0.377517, 0.407149, 0.482094, 0.822401, -0.046237, -0.068284, 0.503893, 0.017732, 0.325905, -0.466605, 0.461634, 0.678556, 0.421285, 0.268342, -0.136088, 0.375901, -0.032561, 0.827508, -0.190722, 0.306173, -0.053309, 0.301089, -0.337621, 0.222731, 0.016111, 0.461033, -0.180884, 0.003717, -0.169113, 0.905114, -0.103686, -0.174131, -0.652959, 0.451213, -0.202417, -0.166378, -1.116843, -0.296205, -0.854915, -0.432782, -1.040795, -0.204071, -0.632191, -0.324941, -0.021606, -0.005633, 0.442234, -0.257484, 0.689286, 1.089956, 0.031534, 0.345939, -0.222805, -0.008104, -0.830912, -0.650288, -0.231805, 0.082029, -0.349653, -0.439202, 0.405534, -0.522056, 0.258044, -0.739026, -0.088699, -0.313729, -0.716579, -0.395446, 0.131190, -0.294566, -0.131354, -0.694554, -0.566484, -0.324110, 0.366054, -0.182965, 0.258494, 0.626482, 0.438481, 0.465149, 0.376561, 0.602970, 0.474408, 0.336227, -0.983308, 0.016399, 0.771344, -0.046823]
-,        [-0.075338, 0.637799, -0.016978, 0.251334, -0.703448, -0.590323, -1.380149, 1.382368, -0.064230, 0.426615, -0.139565, 0.814112, -0.154809, -0.366697, 0.295358, 0.366395, -0.043572, -0.205498, 0.112479, -0.766325, 0.584599, 0.106048, -0.194823, -0.280414, 0.682007, -0.378194, -0.414166, 0.397118, -0.078974, -0.786524, 0.306837, -0.251822, 0.461250, 0.055706, -0.348287, 0.063474, -0.189641, 0.836695, -0.957747, -0.032712, -0.190262, -0.281837, 0.803055, 1.317173, -0.895201, 1.245991, -0.120782, -0.177356, 0.592274, 0.705730, 0.035791, -0.153689, 0.371565, -0.264889, 0.330656, -0.336533, -0.009523, -0.178041, -0.380208, -0.267742, 0.226256, 0.925276, -0.094977, -0.384088, 0.234136, 0.429621, -0.667242, -0.033073, 0.594540, -0.186737, -0.347040, 0.620377, -0.164250, -0.255753, 0.250042, -0.120518, -0.004164, -1.283405, -0.337116, -0.485936, -0.986071, -0.042220, -0.159358, 0.370267, -0.361357, 0.240454, 0.079358, 0.981644, -0.004835, -0.560688, -0.111299, -0.287823, -0.793679, -0.314022, 0.009295, -0.505908, -0.769144, -0.318159, -1.468837, 0.304988, -0.776175, -0.064670, 0.476406, -0.289442, 0.036260, -0.923943, 0.604276, 0.167267, -0.988240, 0.049486, -1.092686, -0.772142, -0.147351, 0.467278, 0.666776, -0.089641, 0.240763, -1.183991, -0.063939, -0.153445, -0.299312, 0.211992, 0.099648, 0.194607, -0.217197, 0.331467, -0.059776, -0.170274, -0.430213, 0.101742, -0.185687, -0.232454, -0.017683, 0.140399, 0.132914, 0.282818, 0.767443, -2.076477, -0.717077, 0.380251]
-,        [-0.373641, -0.558928, -0.400506, 0.011886, 0.593874, 1.124508, 0.912334, 0.754372, -0.146879, 0.211578, -0.253198, -0.032260, 0.599221, 0.131232, 0.814054, -0.027658, 0.346889, 0.706295, 0.362788, 0.101594, 0.322459, -0.006360, -0.130318, -0.146730, 0.067541, 0.313928, -0.297927, 0.293432, -0.671926, 0.037706, 0.241091, -0.369874, 0.550345, 0.625374, 0.149257, 0.678842, 0.120580, 0.917834, 0.095962, 0.195817, 0.255810, 0.381633, 0.653422, 0.182994, 0.136452, -0.327589, -0.288099, 0.094407, 0.060388, 0.175297, 0.372822, -0.336715, 0.041265, 0.164994, 0.288782, 0.267146, 1.040238, 0.849775, 0.741091, 0.448041, 0.546785, 0.344750, 0.225885, -0.438435, 0.751746, -0.595444, 0.203504, 0.851658, 0.458361, -0.909075, -0.078942, 0.071961, -0.389726, 0.060900, -0.691625, -0.492201, -0.439040, 0.090731, 0.072373, -0.280831, 0.741089, -0.034543, -0.083395, -0.505841, -0.877011, 0.437302, -0.244388, 0.493340, -0.020918, -0.479854, 0.421687, 0.794842, 0.331799, 0.515936, -0.693148, -0.314371, -0.702825, -0.406841, 0.146016, -0.339677, 0.604399, -0.265464, -0.471529, 0.294264, 0.051227, -0.210522, -0.276662, 0.167093, -0.234165, -0.903546, -0.485183, -0.127592, 0.461772, -0.436255, -1.053317, 0.286957, -0.262942, -0.417629, -0.196471, 0.500375, 0.196885, 0.125504, 0.001974, -0.421355, 0.375578, 0.431141, 0.076335, -0.083111, -0.254959, 0.038328, -0.410251, -0.010868, -0.583517, -0.014664, -0.018206, 0.138365, -0.306731, 1.335865, -1.319054, 0.343099]
-,        [0.601186, -0.692345, -0.993365, -0.626499, -0.375112, 0.457318, 0.509139, -0.322422, -0.110431, -0.224303, 0.758503, 0.729874, -0.827290, -0.671364, 0.488057, 0.171958, -0.646389, -0.488825, 0.988473, 0.066230, 0.226839, 0.707346, 0.822647, 0.363308, 0.046169, -0.564789, 0.421588, -0.305809, 0.361002, 0.190021, -0.332727, -0.140340, 0.066653, 0.331300, -0.261859, 0.187072, 0.464393, -0.576359, 0.394561, 0.268022, 0.102711, -0.519834, -0.160410, -0.052042, -0.197876, 0.336437, -0.138940, 0.596436, -0.037768, -0.406472, -1.199844, 0.017064, 0.193570, -0.438024, -0.623227, 0.035050, 0.298138, -0.385833, -0.013696, -0.557148, 0.308584, 0.146497, 0.713298, 0.336880, 1.064932, -0.298457, -0.719002, 0.138341, 0.648313, 0.467325, -0.460706, -0.465284, 0.560672, 0.040473, -0.171780, 0.155393, -0.348342, -0.135208, -0.729766, -0.367727, 0.310766, 0.406364, -0.668577, -0.760554, 0.068407, -0.143014, 0.358351, 0.048715, 0.305205, 0.991674, 0.187722, -0.056467, -1.254539, 0.001662, -0.326596, 0.029885, 0.008194, 0.693351, 0.159372, 0.344827, 0.376628, 0.400934, -0.330020, -0.968881, -0.061701, 0.185258, 0.096712, -0.570298, -0.134398, -0.502029, 0.028213, -0.146258, -0.497133, -0.062362, 0.057899, -0.370291, -0.087800, -0.319007, 0.228458, 0.000110, -0.312467, -0.028414, 0.268890, -0.569434, -0.063420, -0.601659, -0.545317, -0.061002, -1.028797, -0.365533, -0.514359, -0.712611, -0.486499, -0.332798, -0.113853, 0.314942, 0.328448, 0.260901, -2.313518, -0.114333]
-,        [0.697838, 0.251771, 0.989574, 0.015116, 0.118104, 0.018733, -1.016140, 0.171505, -0.034127, 1.150271, 0.331886, -0.011223, 0.005927, 0.552579, -0.100624, 0.554469, -0.529437, 0.570508, 0.092837, 0.097813, 0.728822, 0.119980, -0.179734, -0.541891, 1.340586, -0.047884, 0.210062, 0.206324, 0.134608, -0.374693, 0.846319, 0.220131, 0.338497, 0.442738, -0.578076, -0.230883, 1.663671, -0.382050, 0.262618, 0.853113, 0.874012, -0.321811, 0.423527, 0.762630, 0.057066, 0.469488, 0.044962, 0.585076, 0.206049, 0.340328, 0.859666, -0.137275, -0.067890, 0.322307, 0.333802, -0.373845, 0.239851, 0.808385, 0.326924, -0.599668, -0.107884, 0.525873, -0.064604, -0.035981, -0.253051, 1.017163, 0.211845, 0.732878, -0.499937, 0.461995, 0.257963, 0.627951, -0.018483, -0.549554, -1.032073, 0.025903, -0.272917, 0.365956, -0.194463, 0.419717, 0.353062, -0.541506, -0.082993, 0.700096, -0.423588, -1.204529, -0.233303, 0.568597, -0.451546, 0.098007, 0.141896, 0.447538, 0.026320, -0.083164, 0.128951, 0.711940, -0.313718, -0.885653, 0.024396, 0.018479, -0.571487, 0.101071, 1.010939, 0.388758, -0.243416, -0.357597, 0.604132, 0.777216, 0.182741, -0.306294, 0.634732, 1.069994, 0.434466, 0.175697, 0.419811, 0.325752, -0.328482, 0.114708, -0.142561, -0.065856, -0.801215, 0.247606, -0.387251, -0.118583, -0.523832, 0.080542, 0.382271, 0.413759, -0.302762, -0.405651, 0.147708, 0.017788, 0.366741, -0.045308, 0.063037, 0.355190, -0.043219, -1.173340, 0.175169, 0.181523]
-,        [0.188888, -0.151916, 0.136956, 0.434551, 0.506616, 0.710351, 0.327835, 0.279472, 0.098547, -0.027790, 0.184310, 0.065226, 0.005886, 0.359065, 0.286620, 0.440501, 0.004272, -2.535396, 0.774202, -4.769173, -3.093322, -2.137030, 1.320314, -3.849154, -1.801448, -1.453701, 1.503180, -3.983847, -1.820701, -1.667084, 1.545896, -3.115796, -1.903994, -1.842099, 1.293052, -3.358854, -1.809048, -1.732821, 2.039723, -2.137179, -1.162801, -4.000368, 1.303277, -5.656149, -3.753584, -1.641082, 1.807761, -4.203464, -1.879779, -3.523596, 0.808001, -5.446414, -2.992734, -2.660331, 1.265481, -3.961801, -1.848688, -2.391407, 1.322410, -3.320913, -2.279711, -2.080263, 0.934347, -3.274567, -2.315824, -1.479371, 1.533991, -3.641135, -1.868534, 0.098852, -0.242124, 0.040264, 0.090261, -0.120147, -0.149832, 0.062623, 0.016739, 0.062003, -0.073910, -0.059820, -0.142583, 0.129412, -0.055068, 0.056997, -0.180694, 0.002696, -0.231375, -0.104735, -0.215153, -0.139446, -0.038616, 0.036213, -0.011626, 0.186345, -0.439145, 0.102902, 0.105636, 0.053735, -0.104010, 0.175137, -0.105424, 0.096151, 0.187104, 0.033108, -0.110129, 0.245785, -0.218583, 0.114046, -0.135527, 0.058094, -0.083844, 0.138000, 0.220319, -0.105551, -0.045600, 0.218316, 0.169605, 0.166689, 0.155770, 0.134666, -0.231929, -0.393348, -0.076455, 0.012105, -0.077022, -0.100055, -0.114379, -0.156687, 0.106808, 0.164351, 0.055754, -0.122785, 0.252392, 0.080932, 0.247901, 0.163983, 0.137975, 0.238163, 1.319413, -0.298770]
-,        [-0.405999, 0.579319, 0.146061, -0.107529, -0.203393, -0.674213, 0.417160, 0.621304, 0.887210, -0.657988, 0.036396, -0.178891, 1.027488, 0.521954, -0.267462, -0.433533, -0.176556, 0.526971, 0.264465, 0.167266, 0.478557, 1.485474, -0.072212, 0.453704, -0.178020, 0.065468, 0.896310, 0.239511, -0.406407, 0.536315, 0.161678, 0.418637, 0.297211, 0.322582, 0.141667, 0.086568, 0.891116, 0.307452, -0.082941, 1.077837, 0.276117, -0.895725, -0.945495, -0.542989, 0.282425, 0.527054, 0.087900, 0.184583, 0.367523, -0.030845, 0.281738, -0.043659, -0.129137, 0.957532, -0.251797, -0.322714, -0.436994, 0.950031, 0.056384, 0.355837, -0.313892, -0.087730, -0.069355, 0.216876, -0.064545, 0.002108, 0.409574, 0.527539, -0.050900, -0.076966, -0.260985, -0.039684, -0.245767, -0.316802, -0.674963, -0.334660, 0.937480, -0.086830, -0.401110, 0.301960, -0.158967, -0.357843, 0.442318, 1.050800, 0.100444, 0.815643, 0.383677, 0.048356, 0.018361, -0.650896, -0.997641, -0.476387, -0.166920, -0.511247, -0.898925, -0.253065, -0.481034, -0.069641, 0.000449, 0.014271, -0.420166, -0.165035, 0.151428, 0.187269, -0.059656, 0.320081, 0.559124, 0.505134, -0.541574, -0.639186, 0.233844, -0.356637, -0.362409, -0.107959, 0.464517, 0.570519, 0.502567, -0.973840, 0.147566, 0.347876, -0.632628, -0.098900, -0.337379, -0.638528, -0.224387, 0.017705, -0.093452, -0.351816, -0.282680, -0.213569, -0.330400, 0.132501, -0.082295, 0.526120, 0.305759, 0.553706, -0.729695, 0.305341, -0.138731, -0.413332]
-,        [-0.204649, 0.352885, 0.904861, 0.104502, 0.227731, 0.424459, -0.059092, -0.422045, -0.556743, 0.149239, -0.501388, -0.591685, 0.064345, -0.153040, -0.162987, -0.353521, 0.434124, -0.095324, 0.401107, -0.467933, -0.130240, 0.045947, -0.169345, -0.102136, -0.379940, 0.383128, -0.448624, 0.488040, -0.291404, 0.483285, -0.210905, -0.457600, 0.967489, -0.125963, 0.084844, -0.234222, 0.729312, -0.327183, 0.322830, -0.070371, 0.095213, 0.322690, 0.554023, 0.205124, -0.129514, 0.378190, -0.206861, 0.216423, -0.329669, 0.292424, -0.481399, -0.181485, 0.326871, 0.008946, -0.015088, -0.015410, -0.340781, 0.067654, -0.354763, 0.793940, -0.026580, -0.506759, 0.530124, -0.004118, 0.056481, 0.037767, -0.219547, 0.104051, 0.077534, -0.549243, 0.254518, 0.381217, 0.145970, -0.070679, -0.233607, -0.296096, 0.399909, 0.274789, -0.152420, 0.503688, 0.214329, -0.360465, -0.404934, -0.158617, -0.646626, -0.053299, -0.430116, -0.315304, -0.553593, -0.148295, 0.039075, -0.113000, -0.035095, -0.726179, -0.543321, -0.376991, 0.080068, 0.129511, -0.009289, 0.245322, -0.231027, -0.008297, 0.256721, -0.652939, -0.464036, 0.628699, 0.586998, -0.524635, -0.185501, -0.007635, -0.043924, -0.573046, -0.509086, 0.162324, -0.602885, 0.653553, -0.812481, 0.462143, -0.323509, 0.068414, 0.234256, -0.133637, -0.483859, -0.278035, -0.545960, -0.238021, 0.437754, -0.556089, -0.123959, 0.381438, -0.162350, 0.022741, -0.226837, -0.082873, -0.456903, -0.167287, 0.404979, 0.300736, -1.483544, -0.038846]
-,        [-0.254730, -0.823647, -0.029802, -0.151845, 0.505744, 0.563162, -0.982060, -0.216585, -0.486794, 0.708672, -0.358961, 0.623447, -0.779652, -0.229066, -0.844825, 0.012898, 0.624021, -0.138747, -0.291689, 0.730528, -0.143824, -1.401277, -0.661001, 0.087211, -0.455144, -0.752229, -0.026864, 0.909074, -0.047732, -0.387896, -0.637107, -0.167947, -1.307261, 0.191112, -0.245187, 0.412637, -0.807096, -1.468135, -0.345073, 0.234795, 0.398644, -1.250960, -1.745623, -0.409599, -0.140392, 0.191667, -0.712553, -0.171407, -0.330758, -0.251705, 1.271062, 0.221933, 0.294108, -0.044544, 0.431165, 1.330619, 0.176775, -0.203995, -0.279888, -0.759732, 0.038235, 0.802530, -0.492275, -0.383410, -0.173753, 0.060062, -1.444892, -1.005655, 0.376496, 0.464243, -1.310707, -0.211342, 0.047377, -0.070028, 0.203143, -0.964516, 0.786395, -0.145879, 0.058174, -0.896328, 0.118589, 0.440709, 0.364315, -0.383469, 0.094299, 0.388476, 0.039801, -0.417444, 0.253068, -0.355920, 0.453344, -0.392910, -0.399614, -0.142960, 0.065916, 0.127136, 0.156616, -0.000041, 0.192811, -0.502312, -0.663836, -0.147103, 0.527828, -0.167839, 0.639337, 0.157142, 0.497226, 0.100360, -0.635180, 0.096537, -0.348010, 0.054790, 0.059317, -0.236380, -0.288534, -0.022375, -0.065540, -0.418035, 0.058528, -0.853543, -0.471761, 0.028086, -0.090141, -0.407600, -0.439631, 0.120382, -0.142658, 0.058064, -0.461932, 0.186219, -0.837818, -0.415092, -0.693819, -1.149706, -0.668560, -0.265016, -0.789435, -0.755202, -2.386713, -0.663121]
-,        [0.347747, -0.059635, 0.412083, -0.691893, -0.220469, -0.559335, 1.139502, -0.919631, -0.667640, -0.466892, -0.231590, -0.081205, -0.473636, 0.567530, -1.051404, 0.574307, -0.464573, -0.480473, -1.354107, -0.171201, -0.361854, -0.126181, 0.308196, -1.353544, -0.353375, -0.888641, 0.192408, -0.720785, -1.242210, -0.647088, 0.460445, 0.294169, 0.022698, 0.316687, -0.439048, -1.159640, 0.259098, -0.279411, -0.072786, 0.039350, 0.017222, -0.835641, -3.374967, -1.732298, -2.679678, -1.074833, -0.274015, -0.420317, -0.851418, 0.082385, 0.028550, 0.664351, -1.352411, -1.412560, -1.042785, -0.648661, 0.478395, -0.332668, -0.490238, -0.033487, -0.248506, -0.229050, 1.148767, 1.138926, -0.272850, 1.186619, -0.902752, -1.553238, -0.006728, 0.704123, -0.262600, -0.760888, -0.194239, -0.411961, 0.272789, -0.151604, -0.058777, 0.279675, -1.207239, -0.312716, 0.244920, 0.337657, -0.295916, 0.022975, -0.101047, 0.311763, -0.224865, -0.365900, -0.555274, -0.070024, -0.342182, -0.257700, -0.955134, 0.173722, -0.310121, -0.097715, -0.920266, 0.541180, -0.583427, 0.352674, -0.496637, 0.514189, -0.260819, 0.263737, -0.530850, -0.173228, 0.102859, -0.321420, -0.214779, 1.021069, 0.392825, 0.121900, -0.804514, 0.105193, -0.673667, 0.016576, -0.072477, 0.292990, -1.469690, -0.205143, 0.034238, 0.111320, 0.504628, 0.305835, 0.344927, -1.108011, -2.243749, -1.580861, -0.828397, -0.545222, -0.317842, -0.215703, -0.422213, -0.157095, -0.010994, -0.050489, -0.615791, 1.279700, -0.214594, -0.949362]
-,        [0.092193, -0.414483, 0.109765, 0.176008, -0.412606, -0.995545, 0.901161, 0.377637, 0.090177, 0.549883, 0.191764, 0.026781, -0.367977, -0.576225, -0.430879, 0.122506, 0.058757, 0.155950, -0.067095, -0.574612, 0.131900, 0.237937, -0.026369, -0.563129, 0.421591, -0.664069, -0.353291, 0.110302, 0.103261, -0.533163, 0.024294, 0.614646, -0.352441, 0.104304, -0.065371, -0.201862, -0.380723, 0.640319, -0.661810, 0.252262, -0.250765, -0.553608, -0.065073, 0.308235, -0.507966, 0.054503, -0.415222, 0.542294, -0.213668, -0.148766, -0.130839, 0.022568, -0.729241, -0.083503, 0.261768, -0.711895, 0.649288, -0.818134, -0.124702, 0.619659, 0.011027, 0.144903, 0.096745, -0.364169, 0.331769, -0.403190, -0.130685, -0.443868, 0.731603, 0.249736, -0.315331, -0.281393, -0.507343, -0.827057, -0.553987, -0.546167, -0.988068, 0.302307, -0.880511, -0.392230, -0.376202, -0.170387, 0.102537, -0.030017, -0.118891, -0.370853, 0.161377, 0.227974, -0.395915, -0.536029, -0.881914, 0.150959, -0.186098, 0.372862, 0.162691, -0.751465, -0.682458, 0.045105, 0.050861, -0.513632, -0.956237, 0.089806, 0.403531, 0.413302, -0.560551, -0.240027, 0.922928, 0.093636, -0.312733, -0.451767, 0.035759, 0.261510, -0.408550, -0.546023, 0.074630, 0.377284, -0.773779, 0.030872, -0.733646, -0.641562, -0.161913, -0.509135, -0.453825, -1.413329, -0.455891, -0.154175, 0.160790, 0.444804, -0.468217, -0.114838, -0.133794, 0.304769, 0.124174, -0.246536, 0.066485, -0.120751, -0.891891, 0.451182, -0.804693, -0.424588]
-,        [0.290833, -0.179859, -0.680996, 0.754252, -0.091228, 0.550438, -0.652337, 0.397067, 0.111970, 0.283107, -0.032966, 0.475592, 0.344938, -0.277263, 0.377378, 0.131855, -1.091712, -0.292518, 0.361190, 0.529974, 0.725157, -1.418443, -0.723437, 0.533521, -0.090289, -1.362731, -0.776936, -0.289091, -0.755481, 0.490093, -0.301064, 0.992626, 1.222438, -0.143133, -0.798649, -0.421932, -0.491117, -0.247576, 0.327845, 0.123547, 0.120877, -1.109434, 0.488052, -0.581095, -0.019328, -0.122934, -0.471274, 0.005421, 0.029596, -1.432194, 0.718042, 1.147176, 0.158458, -0.028901, -0.382518, -0.163932, -0.464275, -0.647931, -0.377732, -0.978183, -0.436372, -0.006628, -0.142265, -0.741423, -0.367975, 0.300928, -0.647688, -0.101345, 0.882532, 0.182346, 0.291973, 0.033237, -0.748933, -0.392087, 0.456432, 0.337473, -0.032886, 0.355457, 0.186353, -0.082431, -0.379608, -0.763965, -0.175439, -0.197876, -0.248607, -0.923391, -0.749026, 0.029007, -0.329422, 0.051819, 0.149352, 0.010110, -0.887275, 0.855587, -0.263982, 0.076186, -0.154775, -0.001882, -0.028081, 0.570937, 0.176807, 0.195791, -0.611773, 0.291353, 0.132709, -0.649007, -0.285814, -0.100982, -0.213138, 0.373729, 0.381154, -0.067636, 0.220132, 0.134547, 0.146557, -0.220857, -0.928634, -0.144756, -0.434046, 0.018455, -0.452542, -0.260894, 0.183534, -0.116021, -0.173577, -0.134546, -0.866348, -1.050990, -0.729182, -0.782614, -0.469830, -0.107998, -0.536967, -0.405115, -0.233333, -0.303967, 0.297225, -0.962929, -1.747108, -0.498148]
-,        [-0.035862, -0.230129, -0.389570, -0.666008, -0.436379, -0.447321, -0.936105, -0.656739, -0.087894, -0.668757, -0.158305, 0.616094, 1.136346, -0.109522, 0.071329, -0.206153, -0.078920, -0.489665, -1.350765, -0.222027, 0.441013, 0.180312, -0.634990, -0.496587, -0.025162, 1.130190, -0.322368, 0.149867, -0.512897, 0.400006, -0.405307, 0.000286, -0.601745, -0.184418, -0.417136, -0.135069, -0.522297, -0.700848, 0.624187, -0.260241, -0.405288, -0.482398, -1.184160, -0.989005, 0.290472, 0.954841, 0.647453, -0.543859, 0.500900, -0.026911, -0.076623, 0.606166, 0.545758, -0.269584, -0.584363, -1.290185, -0.311334, -0.761699, -0.083614, 0.444707, -0.364962, 0.258864, -0.132618, 0.247569, -0.199987, 0.244422, -0.863728, -0.370392, -0.322233, -0.613109, 0.116197, -0.439660, -0.914934, 0.477474, -0.728970, -0.476863, -0.161519, -0.642537, 0.323342, -0.173528, -0.236529, -0.585862, -0.085665, -0.290241, 0.387212, 0.208299, -0.128088, 0.486426, 1.088730, 0.050994, 0.617690, -0.036148, -0.071023, 0.558004, -0.048459, 0.212465, -0.595297, -0.213861, -0.166093, 0.555708, -0.900895, 0.128981, -0.671051, -0.163872, -0.117481, -0.483692, 0.457449, 0.112586, 0.071498, -0.014259, -0.028119, -0.035349, -0.429973, -0.332208, 0.161743, -0.008838, -0.699436, -0.088698, -0.636462, -0.045829, 0.123110, -0.149128, -0.582923, 0.111886, -0.255187, -1.246421, -1.066070, -0.514121, -0.207482, 0.228343, 0.085564, 0.116458, 0.369659, 0.533878, -0.296206, 0.043774, -0.517420, -0.882577, -0.363728, -0.396617]
-,        [0.413269, 0.352318, -0.238227, -0.081770, -0.071605, 0.241093, -0.838519, 0.655318, 0.827559, 0.197678, 0.281338, -1.355713, -0.580574, -0.311076, 0.099485, 0.998245, 0.050375, 0.211912, -0.703831, -0.468178, -0.076723, -0.765263, 0.016311, 0.380092, -0.923319, 0.134248, 0.188616, -0.771784, 0.150137, 0.049301, 0.693809, -0.431716, 0.139036, 0.013483, -0.246819, 0.169125, 1.019665, -0.506707, 0.817433, 0.569616, -0.435103, 0.083598, -0.524538, -0.995059, -0.014732, 0.979320, 0.091183, 0.581903, 0.214504, -0.323391, -0.079786, -0.131084, -0.235206, -0.125017, 0.544825, 0.989140, -0.329067, -0.331301, -0.815209, -0.013102, -0.630267, 0.254824, 0.848222, 0.745486, 0.295638, 0.012494, 0.239305, 0.681967, 1.113058, -0.115953, 0.298372, 0.946283, -0.580706, 0.484336, 0.835139, 0.342291, -0.278167, 0.244108, -0.094371, 0.018110, -0.331070, -0.978835, 0.116481, 0.190097, -0.333268, 0.309041, -0.017895, 0.192337, 0.251261, 0.473545, 0.503547, -0.025187, 0.540161, -0.364211, -0.651970, 0.669085, -0.093974, -0.805288, -0.035814, 0.390753, -0.024482, 0.304336, -0.030248, 0.345911, 0.096926, 0.564488, -0.014926, 0.174905, -0.240542, 0.587662, 0.550852, 0.117435, -0.178188, -0.185933, 0.371164, -0.169651, -0.326620, -0.461239, 0.682582, 0.312574, -0.302588, 0.020814, -0.364454, -0.672903, 0.027488, 0.104756, 0.032930, 0.456737, 0.320823, 0.747583, 0.669422, -0.101416, -0.373513, -0.490096, 0.100862, -0.442483, -0.339917, -0.774774, -2.616182, 0.053012]
-,        [0.461833, -0.330278, -0.001168, 0.278111, -0.400816, -0.048301, 0.101875, -0.169444, 0.869883, 0.622499, 0.622136, -0.518415, -0.295278, 0.256953, -0.682230, 0.044640, 0.601572, 0.320371, 0.773360, -0.731355, 1.152821, -0.063013, -0.416950, -0.135250, 0.696398, 0.638525, -0.040537, 0.138602, 0.509789, -0.007514, 1.073683, 0.566506, -0.193827, 0.418335, 0.234588, -0.276335, 1.026132, -0.180760, -0.715390, 0.638112, 0.127100, -0.897726, -1.151884, -0.729143, 0.108035, 1.139382, -1.019717, -1.241683, 0.757726, 0.372134, -0.501903, -0.773030, -0.386963, 0.132100, -1.019760, 0.625536, -0.431755, 0.615434, 1.068225, -0.803929, 0.393048, 0.513753, -0.552405, 0.684799, 0.429225, 0.458488, -1.264671, 0.390362, -0.259884, -0.105850, 0.098926, 0.868369, -0.732245, -0.311348, -0.182244, -0.357559, -0.649245, 0.594205, 0.145226, 0.144706, -0.411051, -0.685378, -0.224351, 0.263527, -0.048238, 0.419110, 0.178752, 0.136061, -0.201724, 0.650254, -0.046021, 0.236448, 0.285017, -0.625662, 0.201432, -0.055304, -0.999448, -0.629550, 0.463460, -0.273278, -0.626356, 0.716995, 0.392611, 0.404256, -0.230094, -0.339276, -0.036598, 0.605734, -0.414295, -0.087370, -0.100967, -0.316978, -0.872382, -0.023354, 0.188418, -0.188007, -0.550284, -0.052491, -0.554673, 0.157111, -0.126123, 0.223072, -0.412965, -0.418175, -0.364098, -0.041514, 0.001229, 0.375569, 0.066691, -0.355912, -0.098720, -0.185629, -0.801356, 0.039252, -0.465330, -0.480188, -0.041768, 0.111455, -0.874598, -0.272517]
-,        [0.520302, 0.523459, 0.356430, 0.206838, 0.470832, 0.401773, 0.735642, 0.178926, 0.414667, 0.392345, 0.569523, 0.571879, 0.395854, 0.496686, 0.962903, 1.088374, 0.498547, -4.951350, 0.619952, 0.474294, -2.759443, -5.654844, 0.327951, 0.425169, -5.590364, -3.701253, 0.933297, 0.621033, -2.897974, -4.826089, 0.647525, 0.561645, -2.818669, -4.729028, 0.496744, 0.597958, -3.067952, -6.096121, 0.259632, 0.301067, -4.440497, -6.432069, -1.238450, -1.719232, -6.161730, -6.045283, 0.344668, 0.181777, -4.783831, -6.053032, -0.115616, 0.424077, -4.267404, -2.432093, 1.302578, 1.244848, -2.347771, -5.524650, 0.753120, 0.853591, -2.703907, -3.954115, 0.627514, 0.674365, -3.189643, -4.725538, 0.425755, 0.806794, -3.180956, -0.026488, 0.052250, -0.147668, -0.031573, 0.019698, 0.018974, 0.017825, -0.107989, 0.022418, 0.089476, -0.107306, -0.084613, 0.024856, -0.048760, -0.042050, -0.150475, -0.129382, 0.170956, 0.180149, -0.047421, 0.089031, 0.130044, -0.044401, 0.016038, 0.065893, 0.011281, 0.076778, -0.132981, -0.019605, 0.028456, -0.011049, 0.100434, 0.053148, 0.177209, 0.088197, 0.108488, 0.033332, -0.076023, -0.007724, -0.003546, -0.050741, 0.051506, 0.135216, 0.140301, 0.114620, -0.049870, -0.150084, 0.055048, 0.114760, -0.114449, -0.111672, 0.107920, -0.886445, -0.006980, 0.092180, 0.004805, 0.153199, 0.116168, 0.060582, -0.020965, 0.105477, 0.031830, 0.063937, 0.060792, 0.117393, 0.067294, -0.016120, 0.109868, 0.128437, 0.252103, -0.327554]
-,        [0.073259, 0.327847, 1.134955, 0.165770, -0.207053, 0.364473, -0.718199, -0.565976, -1.090409, -0.872768, -0.034678, 0.151074, 0.335560, 0.782081, -0.625798, -0.108063, -0.217310, -0.048374, 0.351424, -0.580007, 0.329365, -0.290551, -0.587839, 0.286113, -0.482441, -0.133725, -1.049064, 0.101228, 0.189604, -0.239795, 0.601044, -0.054055, -0.046914, 0.603361, -0.683015, 0.660555, -0.727627, -0.233572, 0.208072, 0.462127, 0.100859, 0.470555, 0.485277, -0.213545, 0.424735, 0.115507, -0.003616, 0.227936, 0.131201, 0.257203, 1.000655, -0.148054, -0.899424, -0.133923, -0.566900, 0.813119, 0.003192, -0.256666, -0.312925, 0.395800, 1.284514, 0.209528, 0.217497, -0.291212, 0.157902, -0.575263, 0.642612, 0.883883, 0.120322, 0.603053, 0.240054, -0.366009, -0.306768, 0.714255, 1.386243, -0.694232, 0.038231, -0.341608, 0.030754, -0.228447, -0.688801, -0.138205, -0.037488, -0.826209, -0.643387, 0.305998, -0.518435, -0.615242, 0.009204, 0.436801, 0.262670, -0.147092, -0.102719, 0.232546, 0.368821, -0.746396, -0.363114, -0.361168, 0.163327, -0.493784, -1.215010, -0.818180, -0.683895, -0.523471, -0.463650, -0.151681, -0.192191, -0.875380, -0.805098, -0.335448, 0.063099, -0.167159, -0.501153, -0.508354, 0.236274, -0.264486, -0.933615, 0.073436, 0.155745, 0.069969, -0.628357, 0.254449, -0.327923, -0.813880, -0.144865, -0.779714, -0.096522, -0.152670, -0.567451, -0.583897, 0.009182, -0.064879, -0.141221, -0.194188, -0.058385, 0.164007, 0.094882, -0.407920, -0.690121, -0.152363]
-,        [0.662103, -0.412164, 0.371790, -0.077968, 0.597070, 0.554852, -1.494511, 0.083952, -0.025393, -0.259911, -1.572911, 1.501587, 0.345899, 0.080441, -0.124921, -0.240035, 0.455050, 0.153156, -0.274071, -0.637127, 1.259714, -0.273800, -0.147026, 0.403343, 0.524122, 0.725044, 0.318612, -0.958994, 0.051176, 0.339604, -0.101982, 0.912119, 0.013941, 0.071557, 0.665036, 1.307838, 0.257432, -0.093057, 0.627389, -0.113062, 0.305105, 0.854256, -0.678614, 0.788530, 0.460371, -0.000675, -0.062768, 0.199886, -0.004662, 0.532311, -0.238429, 0.168914, -1.171452, 0.689999, -0.155456, 0.034126, -0.906478, 0.130648, 0.067827, 0.201159, 0.879898, -0.257184, -0.459480, 1.107348, -0.491893, 0.107172, 0.642167, 0.099293, -0.096529, -0.242033, -0.037779, 0.344183, 0.113379, 0.554972, -0.514277, -0.202544, -0.068332, -0.927310, 0.226029, 0.182334, -0.663055, -0.148686, -0.212158, 0.117782, -0.634153, -1.068036, 0.337102, -0.043295, 0.431756, 0.387960, 0.074730, -0.297830, -0.092046, 0.053295, 0.614425, -0.541360, -0.753942, 0.276362, -0.293471, -0.201208, -0.805652, -0.285583, 1.093876, -0.503626, -0.183778, 0.783237, 0.065714, -0.920575, -0.733953, 0.833592, -0.106732, -0.151928, -0.797714, -0.396207, -0.312642, -0.308438, 0.365255, -0.085767, -0.379333, 0.493312, 0.006609, 0.072843, 0.061177, 0.115721, 0.381457, 0.481321, 0.219362, -0.231506, -0.065806, 0.196280, -0.048619, 0.390551, 0.092337, 0.019460, -0.752010, -0.053726, -0.378950, -1.456472, -1.763442, 0.077101]
-,        [-0.627787, 0.233967, -0.631147, -0.005760, -0.587830, -0.196351, 2.536239, -0.471762, -0.060469, -0.342516, -0.371788, -0.551652, -0.594272, -0.124783, 0.162734, 0.221470, -0.575226, 0.307589, 0.451238, 0.118825, 0.133285, 0.285491, 0.174808, -0.293787, 0.134142, 0.341466, -0.274053, -0.007186, 0.361527, -0.403003, 0.075577, 0.185712, 0.254243, -0.364403, -0.551083, -0.188876, 0.279418, -0.206816, -0.078249, -0.482583, -0.017966, -2.893681, -2.832126, -3.528158, -2.871505, 0.192753, 0.059219, -0.649962, 0.402747, 0.459711, 0.013683, -0.194869, 0.063981, 0.813207, 0.331381, -0.170139, 0.424818, 0.651407, 0.255147, -0.018040, 0.693207, 0.519509, 0.478344, -0.249958, 0.856245, 0.639782, -0.391389, 0.275255, 0.491196, -0.204616, 0.123862, 0.015982, -0.086296, -0.322091, 0.190673, 0.106001, 0.087016, -0.311664, 0.087325, -0.075799, -0.268563, 0.140097, 0.116132, 0.437095, -0.145252, 0.128286, 0.058593, 0.134705, -0.280413, -0.051012, 0.101062, -0.259381, -0.030834, -0.058051, -0.047512, 0.108216, -0.370434, -0.115756, -0.140512, 0.123548, -0.057620, -0.245920, -0.027158, 0.119546, 0.013834, -0.265197, -0.065242, 0.212703, 0.001370, -0.153406, 0.216178, -0.080771, -0.085585, 0.040651, 0.237858, 0.315753, -0.062409, -0.210778, -0.207268, -0.001875, -0.144661, 0.738664, 0.022328, 0.135883, 0.182508, 0.635382, 0.280788, 0.069388, -0.153937, 0.204135, -0.143826, -0.158211, 0.278729, 0.345683, 0.137727, 0.437083, 0.168384, 1.968078, 1.246616, -2.124860]
-,        [0.513144, -0.898566, -0.711446, -0.041180, -0.111210, -0.167550, -0.226405, 0.948873, -0.114995, -0.251110, -0.251921, -0.685698, -0.540141, -0.980468, 0.872594, -0.183345, -0.335506, -1.270937, -0.919996, -1.950020, -0.296391, -0.026305, -0.086671, -1.036702, 0.589515, -1.003561, -1.424914, -1.566282, -0.518707, -0.995404, -0.489153, -1.441110, -0.867928, 0.237097, -0.958042, -1.938510, -0.809615, -0.924178, 0.476084, -1.409743, -1.041330, -2.850351, -0.182141, -2.733510, -2.006408, 1.126984, 1.857423, 1.035479, 1.268287, -0.269663, -1.285605, -1.430798, -1.378149, 0.968259, -0.304181, -1.474337, -0.173116, 0.183939, -0.270215, -1.067387, -0.077604, -0.433538, -1.053155, -1.238386, -0.097799, -1.617607, -0.450836, -0.947327, -1.206172, -0.075806, -0.248522, 0.121400, 0.343000, -0.191379, 0.229082, -0.109344, -0.023676, -0.843395, 0.032510, -0.007426, -0.338108, -0.035225, -0.111821, 0.018483, 0.401694, -0.489192, -0.002049, -0.006574, 0.321844, 0.258195, -0.056044, 0.024563, -0.218439, -1.307820, 0.403986, 0.255739, 0.553648, -0.308829, -0.184659, -0.884769, -0.681753, -0.022019, 0.556036, 0.410640, -0.335223, -0.598152, 0.176333, -0.159786, 0.045379, -0.600713, -0.315585, -0.308058, -0.320029, -0.485836, 0.276973, 0.007054, 0.409200, -0.219416, -0.479882, 0.302066, -0.663700, -0.006969, 0.044847, -0.203894, 0.164506, -0.355127, -0.174641, -0.571486, -1.542729, -0.680115, -0.431735, -0.288031, -0.598164, -0.229273, -0.276910, -0.360245, 0.101666, -0.135210, -0.337113, -0.037066]
-,        [-1.118019, 0.142288, -0.572025, 0.071432, 0.175148, -0.241303, -0.738983, 0.000267, -1.084738, 0.694741, -0.386568, 1.151360, 0.607651, -0.946408, 0.069054, 0.861198, -1.158452, -1.103448, 0.741256, -0.054365, 0.254713, 0.095936, 0.019414, 0.066771, -0.061302, -1.395604, 0.077854, 0.290399, -1.141285, 0.538325, -0.687433, 0.448504, 0.125324, 0.384679, 0.346063, -0.005154, -0.239522, -0.381869, -0.529264, -0.272714, -0.542980, -1.435361, 0.746609, 0.860954, -0.746335, -0.469170, -0.795954, 0.925628, 0.405030, 0.236434, 0.108294, 0.801274, 0.565032, -0.937056, -0.318209, -0.604907, 0.429972, 0.136357, 0.080081, -0.431516, 0.059162, 0.830495, 0.578245, 0.481701, 0.267555, 0.594945, 0.475299, -0.940909, 0.036191, -0.980867, 0.593966, 0.547146, 0.253923, 0.361017, 0.636421, -0.203112, -0.009479, -0.022226, 0.355411, -0.526943, -0.658340, -0.057791, 0.046893, -0.370109, -1.082764, -0.909994, -0.103378, 0.410450, 0.051146, 0.292151, 0.483347, 0.157756, -0.369806, 0.275175, 0.168463, -0.196834, 0.025702, -0.347090, 0.237044, 0.037663, 0.084007, 0.469513, 0.626212, -0.041474, -0.242337, 0.500405, -0.074798, -1.067517, -0.235641, 0.520672, -0.231366, -0.272181, 0.173666, -0.056357, 0.031101, 0.207657, -0.735737, -0.391220, 0.244724, -0.542809, -0.521231, 0.235345, -0.205616, 0.067300, 0.313119, 0.419452, -0.841783, -0.380429, -1.319994, 0.044219, -0.275386, -0.500994, 0.079939, -0.280127, -0.345795, -0.124387, 0.281087, -0.740533, -0.569904, -0.392002]
-,        [-0.059171, 0.408163, -0.692375, 0.509351, -0.076159, -0.542113, 1.513471, -0.951324, 0.445782, -0.195459, -0.780600, 0.104925, 0.084049, -0.383298, 0.493105, 0.122618, -0.311936, 0.109584, 1.515676, 0.197801, 0.581509, -0.092516, 0.129877, 0.725353, 1.065018, 0.189596, 0.842125, 0.509803, 0.330500, 0.418891, 0.065119, 0.760149, 0.058713, 0.336099, -0.448760, 0.055127, 0.650570, -0.673542, -0.131906, 0.541743, 0.058015, -0.162653, -0.994213, 0.338824, 0.028444, 0.215698, 0.313836, -0.085035, 1.062193, -0.031355, -0.510818, 0.539153, 1.116321, 0.016825, -0.210613, -0.575343, -0.076873, -0.394836, 0.125821, -0.307281, 0.640855, -1.127722, 0.345466, -0.029392, 0.831551, 0.246674, 0.290765, -0.343546, 0.088168, 0.044032, -0.722026, 0.154573, -0.060405, -0.509168, -0.116323, 0.668548, -0.346216, 0.338026, 0.349283, 0.141148, 0.394837, 0.435370, -0.710872, -0.353921, -0.545107, -0.336814, 0.601339, 0.279592, -0.877229, -0.686478, -0.175053, 0.321542, -0.663031, 0.145331, 0.493410, -0.161843, -0.247708, -0.143428, -0.266001, 0.009255, -0.738761, 0.510401, -0.523680, 0.874356, -0.019007, -0.800066, 0.034108, -0.056192, -0.252198, 0.213017, -0.086391, -0.113753, -0.277577, 0.404482, -0.122308, 0.112590, -0.356977, 0.024266, 0.075069, 0.145872, -0.231455, 0.360401, -0.392215, 0.154280, -0.378831, -0.015241, 0.030050, 0.350180, -0.516874, -0.850210, -0.045047, 0.253035, 0.542206, 0.469410, 0.490596, 0.078511, 0.670731, 1.658151, -0.980560, 0.204451]
-,        [-0.025012, -0.473869, -0.824399, 0.362350, 0.536344, -0.123915, -0.331914, 0.660526, 0.339564, -0.203137, -0.108119, -0.753453, -0.632940, -0.486404, -0.180281, -0.099325, -0.717299, -0.584757, -0.298108, -0.477362, -0.392279, 0.312178, -0.368953, -0.822220, 0.504398, -0.676359, -0.247366, -0.798205, -0.630617, -0.349454, -0.203648, -0.000508, 0.630384, -0.153138, 0.491053, -0.589961, 0.441722, 0.012926, 1.185016, 1.368143, -0.721137, -0.378352, -0.780724, -0.111613, 0.223585, -0.211999, 0.382712, 0.345967, 0.235200, -0.234165, 0.069214, -0.975150, -0.552284, -0.324425, 0.620583, 0.262515, 0.200965, -0.050889, 0.234205, 0.347197, 0.346704, -0.720198, 0.610618, 0.326789, -0.352609, 0.173387, -1.212775, 0.171293, 0.207934, -0.479481, 0.599442, -0.523774, -0.606122, -0.199543, -0.079342, -0.602450, 0.307740, -0.094298, -0.145969, -0.465871, 0.129049, 0.148552, -0.548996, 0.345287, -0.171948, 0.536044, 0.366020, 0.655831, 0.399537, -0.530149, 0.129257, -0.802511, -0.541044, 0.426676, -0.466477, 0.387580, 0.246599, -0.034847, -0.379616, 0.032104, -0.792125, 0.273123, -0.839970, 0.256520, -0.149860, -0.235837, 0.004204, -0.365156, 0.208209, 0.065188, -0.422075, -0.087908, 0.018210, 0.475438, -0.132770, 0.096668, -0.706512, -0.069686, -0.281703, -0.096820, -0.267506, 0.230442, -0.318418, -0.050635, -1.843504, -0.878559, -0.409762, -0.494027, -0.194182, -0.153352, -0.288695, -0.006567, 0.208965, -0.173867, -0.106648, -0.138757, -0.264477, -0.262734, -0.726838, -0.617034]
-,        [0.128822, 0.372056, 0.178402, -0.104419, -0.488250, 0.696349, -0.511164, 0.477894, -0.138421, -0.278798, 0.175609, 0.972379, 0.086503, 0.889798, -0.091106, -0.441016, -0.178111, -0.745308, -1.161008, -1.546673, -0.848998, -0.155885, 0.304851, -0.248358, -0.535505, -0.354977, -0.257409, 0.035282, 0.446636, -0.018606, 0.294477, -0.168873, 0.324035, -1.110011, 0.427742, -0.895611, -0.476940, 0.680874, 0.125801, -0.558309, -0.811609, 1.580034, -1.464637, -2.016795, -2.549108, 0.193960, -0.644997, -0.453193, -0.424745, 0.732450, 0.157898, -0.244337, -0.310086, -0.140910, 0.823518, -0.247799, 0.193223, -0.023816, 0.316101, -1.116235, 0.068768, 0.040875, 0.560937, -0.700520, 0.232960, 0.187865, 0.968364, 0.087307, 0.174856, 0.779396, -0.206977, 0.216087, 0.149857, 0.414101, -0.170118, 0.467935, -0.333893, -0.259897, -0.556148, 0.113923, -0.057031, -0.115182, 0.171853, 0.159937, -0.232012, 0.438752, 0.205257, -0.151286, -0.281834, -0.203701, -0.403897, 0.452799, 0.048139, -0.160105, 0.026643, 0.016603, 0.297682, 0.627080, 0.019523, -0.584157, 0.297141, -0.000710, 0.014502, 0.330059, -0.006542, 0.668963, -0.164092, -0.281797, -0.216818, 1.121890, -0.428223, -0.072146, -0.232840, 0.074585, -0.710291, -0.533589, -0.234513, 0.329297, 0.390465, 0.003240, -0.505953, 0.035170, 0.015510, -0.111826, 0.307005, 0.452173, 0.066091, -1.301687, -1.974134, -2.763621, -2.034446, -1.006891, -0.413950, -0.662157, -0.406750, -0.105981, -0.112926, -0.465144, -1.819757, -0.394843]
-,        [-0.056684, -0.133007, -0.531135, 0.557000, 0.472645, -0.332483, -0.509275, -0.228080, -0.363071, 0.169186, 0.498576, -0.298086, 0.590469, -0.460286, -0.092369, -0.195720, 0.279457, 0.835544, -0.609764, 0.266440, 0.332504, 0.614712, 0.023787, 0.704864, -0.287862, -0.554887, -0.123013, 0.179322, 0.644324, 0.780695, 0.098865, 1.130248, -0.595443, -0.841043, 0.183720, 0.330196, -0.405183, -0.362348, -0.035843, -0.114238, 0.844270, -0.343360, 0.042677, -0.233788, -0.174003, 0.500094, 0.358277, 0.410972, 0.536380, 0.103143, -0.466663, 0.062807, -0.125655, 1.020990, -0.550185, 0.594180, -0.266850, 0.191303, -0.053049, 0.316376, 0.470280, 0.537572, 0.954927, 0.381408, -0.060852, 0.511247, 0.401888, 0.134127, -0.632793, -0.945367, -1.135989, -1.233275, -0.563218, 0.223286, -0.567078, 0.302419, 0.247569, 0.011795, -0.065170, 0.567841, 0.194255, -0.417328, -0.247814, -0.006150, 0.000114, -0.275489, -0.018589, -0.139193, -0.066194, -0.216981, 0.334346, -0.764740, -0.292521, 0.138473, -0.744000, 0.755805, 0.047248, -0.176353, -0.531241, 0.494778, -0.307118, -0.458697, -0.095252, 0.008345, -0.538378, -1.138185, 0.300871, 0.035856, -0.206839, -0.482312, -0.146602, -0.355577, -0.192946, -0.394372, -0.672304, 0.259666, -0.555558, -0.586929, 0.156785, 0.017486, -0.219538, -0.289788, -0.706906, -0.316142, -0.167996, -0.205706, -0.050847, -0.245151, 0.029768, 0.122893, -0.358764, 0.302894, 0.205708, -0.046849, -0.273706, -0.663992, -0.884000, -0.305343, -0.780495, -0.591074]
-,        [-0.674786, 0.113908, 0.269324, -0.179946, -0.097887, -0.129860, -0.044052, 0.926121, 0.275432, 0.031711, -0.097817, -0.269476, 0.254425, -0.894631, -0.445600, 1.689837, -1.364005, -0.930060, -0.810260, 0.174672, 0.379334, -0.849315, -0.400529, -0.275497, -0.042883, -0.082271, -0.521037, -0.385398, 0.376133, -0.843223, 0.080280, -0.383330, -0.073938, -0.302933, -0.203099, -0.330757, -0.266020, -0.160471, 0.314289, 0.117386, 0.685905, -2.963883, -4.135401, 0.899333, -2.691080, -0.055665, 0.095202, -0.090952, 0.455786, 0.357991, 0.136404, -0.370382, -0.481236, 0.329178, 0.333745, -0.440164, -0.093686, -0.188253, -0.338583, 0.090930, 0.011481, -0.717589, -0.226413, -0.268807, -0.286131, -0.278295, 0.008661, 0.569530, -0.004118, 0.037330, 0.480586, 0.003867, 0.302608, -0.079691, -0.160841, 1.095086, -0.440463, -0.587540, 0.451661, 0.250526, -0.332602, 0.064729, -0.178386, 0.882742, -0.315742, -0.245968, -0.358083, 0.018743, -0.479034, 0.313069, -0.712026, 0.375348, -0.432765, -0.160016, -0.412484, -0.044433, -0.822968, -0.227532, 0.254201, 0.325344, -1.014001, 0.220606, 0.379851, 0.696281, -0.164201, -0.317086, -0.232084, 0.522290, -0.429905, -0.475993, 0.277160, 0.279424, 0.538529, 0.241877, -0.005967, 0.673779, -0.324078, -0.267500, -0.213834, 0.708845, -0.695592, -0.105385, 0.067133, 0.055018, 0.419396, 0.316914, -0.353589, -0.036778, 0.408762, -0.324735, -2.540592, -2.811719, -1.747242, -0.902212, -0.532006, -0.266771, 0.027141, -0.462364, -2.760912, -0.659753]
-,        [-0.726638, 0.022202, 0.035380, -0.243832, 0.668149, 0.139510, 0.121296, -0.817563, -0.233547, -0.046577, -0.293150, 0.937033, 0.529844, -0.997801, 0.260192, 0.234839, -0.703614, -0.138658, -0.296246, 0.051407, -0.216383, -0.704623, 0.315551, 0.364249, 0.117920, 0.730445, -0.287948, 0.850416, -0.668653, 0.043433, -0.479237, 0.056194, 0.189128, -0.057493, 0.078294, -0.678588, 0.351552, 0.624445, -0.234822, -0.026470, 0.207904, -0.919843, 0.186702, -0.754609, 0.010041, -1.161767, -0.252199, -0.523088, -0.072049, -0.014695, 0.637359, -0.638236, 0.461049, -0.595162, -1.002683, -0.587507, -0.661964, 0.596210, 0.856460, 0.327774, -0.302163, -0.034159, 0.783623, -0.470459, 0.640863, 0.193042, -0.454937, -0.369818, -0.074486, -0.479958, -0.302399, -0.776984, -1.156316, -0.132269, 0.066226, -0.565021, 0.270571, 0.028331, -0.185788, 0.202070, -0.489261, 0.281623, -0.031376, -0.053670, -0.140050, 0.214818, -0.644595, -0.941369, -0.463054, -0.169178, -0.817428, -0.606968, -0.540593, 0.168047, -0.003493, -0.874661, -0.415126, -0.307104, -0.170105, -0.505812, 0.073663, -0.819645, -0.313055, 0.468600, -0.165201, -0.718908, 0.582833, 0.108570, -0.460706, 0.217636, 0.036973, -0.600616, -0.558127, -0.329423, -0.382207, 0.917549, -0.447051, 0.201471, 0.564963, 0.088760, -0.581464, -0.340397, -0.114313, 0.191643, -1.403025, -0.825632, -0.344516, 0.185402, 0.511734, 0.287238, 0.365315, 0.097793, 0.549398, 0.280654, 0.529950, 0.160116, -0.999598, 0.166968, -0.645541, -0.746355]
-,        [0.629779, -0.123485, 0.759507, 0.012024, 0.899986, 0.192962, -0.302061, 0.175681, 0.630847, -0.132151, 0.612097, 0.861192, 0.565351, 0.794546, -1.074038, 0.256210, 0.248502, 0.868984, 0.426287, 0.238528, 0.565439, 0.602194, 0.841276, 1.119799, 0.709193, 0.036524, 1.123075, 0.304011, 0.769099, 0.405980, 0.595937, 0.137380, 0.742776, -0.161318, 1.047038, 0.354960, 1.186746, 0.821551, 0.079765, -0.050953, 0.750829, 0.171419, 0.094944, 0.917363, 0.394192, 0.521488, 0.425556, -0.093869, 0.519690, 0.307062, 0.107689, 0.625088, 0.462099, -0.201344, 0.545934, 0.075338, 0.366083, 0.387342, 0.185752, 0.477272, 0.436028, 0.408837, 1.416958, 0.757514, 0.302436, 0.675345, 0.911868, 0.519811, -0.212538, -0.203483, 0.154102, -0.594993, -0.166705, 0.493820, -0.099092, -0.314975, -0.702468, 0.455081, -0.004324, 0.113809, 0.469920, -0.300007, -0.095216, -0.476110, -0.024849, 0.143321, 0.170797, 0.272543, -0.381256, 0.422060, 0.668180, -0.095241, -0.465097, -0.098285, 0.466511, -0.114443, 0.043366, -0.312355, 0.288466, -0.407886, 0.087633, -0.077817, 0.523281, 0.238982, -0.409333, -0.602033, 0.018910, 0.164324, -0.225049, -0.411790, 0.333052, -0.621847, -0.369455, 0.541275, -0.020809, 0.436049, 0.447022, 0.313762, 0.620331, 0.216536, -0.499051, -0.179577, -1.187107, 0.130831, -0.992152, -0.343216, -0.426027, -0.451881, 0.141097, 0.453320, 0.179378, 0.004817, -0.043963, 0.217923, 0.027301, 0.686564, 0.099937, -0.241762, -0.264120, -0.380875]
-,        [0.433466, -0.226840, 0.318353, 0.306932, -0.121345, -0.147615, 0.978784, -0.314292, 0.008851, 0.230987, -0.615152, -0.275074, -0.704270, 0.262012, 0.648342, -1.137701, -0.952514, 0.158829, 0.629685, 0.493368, -0.278892, -0.393380, 0.278662, 0.712809, -0.225636, -0.311381, 0.721183, 0.406003, 0.263717, -0.291807, 0.785896, 0.005014, 0.089570, 0.078603, 0.129267, -0.554960, 0.080633, 0.196892, -0.123548, 0.692401, 0.502671, -0.012657, 0.239014, 1.455020, 1.346760, -0.178912, 0.346979, 0.399362, 0.195414, 0.126020, 0.645735, 0.540433, 0.069588, 0.728954, 0.184181, -0.046303, -0.907592, 0.189714, -0.441680, 0.601244, 0.298344, 0.046192, 0.216686, 0.455929, -0.695951, 0.401747, -0.384289, 0.213273, 0.423569, 0.066881, -0.223826, 0.229962, -0.129966, -0.143700, -0.876914, 0.035535, -0.313371, -0.700619, -0.504930, 0.195003, -0.181048, 0.371027, -1.167958, -0.681198, 0.008909, 0.529699, -0.183189, 0.006492, -0.433480, 0.392494, -0.187560, -0.091493, -0.370510, -0.134882, -0.344016, 0.350926, -0.123287, 0.160592, -0.184399, 0.396066, -0.583593, -0.059584, -1.118616, 0.463324, -0.141725, 0.004951, 0.084316, 0.781502, 0.201373, 0.225007, 0.298565, 0.034082, -0.325478, -0.005046, -0.726222, -0.125814, 0.314945, 0.565263, -0.703630, 0.333505, 0.463455, -0.520754, 0.000246, -0.075462, -0.338060, 0.028082, 0.009502, 0.278038, -0.212752, 0.102313, -0.383411, -0.215591, 0.109835, 0.076295, -0.157474, 0.513014, 0.494946, 1.102248, -0.354920, 0.190879]
-,        [0.242538, 0.368172, 0.158822, 0.180733, 0.495591, 0.620436, -0.097120, 0.263168, 0.896579, 0.198819, 0.137517, -0.410421, 0.961376, -0.420322, 0.518963, 0.830963, 0.062641, 0.842119, -0.797399, -0.537890, -0.779769, -0.656815, -0.072283, -0.511392, -0.734370, -0.185660, -0.056787, -0.807317, 0.718385, -0.553092, -0.405202, -0.031148, -0.758578, -0.330729, -0.214401, -0.281536, -0.780144, 0.482637, 0.742623, 0.019866, 0.068397, -1.939831, 0.009063, -1.844910, -0.876967, 0.043398, 0.179163, 0.150848, -0.557043, -0.272130, -0.240902, -0.136670, 0.429352, -0.085608, 0.280171, 0.291468, -0.482468, -0.263406, -0.395751, -0.434367, 0.034785, -0.325358, 0.209875, 0.190346, 0.156787, -0.449191, -0.837361, -0.136351, 0.055747, 0.136224, 0.302037, 0.237047, 0.275312, 0.203640, 0.011061, -0.042715, 0.194367, 0.150642, 0.202639, 0.427271, 0.122458, 0.435163, -0.043355, 0.086396, 0.497138, 0.256619, -0.234990, -0.181277, 0.099091, -0.190411, -0.015602, 0.393474, -0.002170, -0.148399, -0.243944, -0.240931, -0.126466, -0.105518, 0.250371, -0.065168, 0.178866, 0.057799, -0.173721, 0.262201, -0.205056, 0.042896, 0.267824, -0.079492, 0.096626, 0.074194, 0.421941, 0.158167, -0.072873, 0.320311, 0.341299, 0.434392, 0.206895, 0.310756, 0.461415, 0.049633, 0.305045, -1.606209, 0.385185, 0.129405, 0.072484, 0.436806, -0.124156, -0.117310, 0.042262, -0.039583, 0.149898, -0.148778, 0.046965, -0.123938, -0.029233, 0.196571, 0.002649, -0.358461, 2.359470, 0.634928]
-,        [-0.082083, -0.410484, -0.717217, -0.412132, -0.452217, -0.076949, -0.907336, 0.914549, -0.088563, -0.899033, -0.389226, -0.362369, 0.127692, 0.086037, -0.016154, 0.091426, -0.203797, -0.220065, 0.354503, -0.601389, -0.341127, -0.924066, -0.038114, 0.157760, 0.834169, -0.258757, -1.679796, -0.441452, 0.316524, -0.012418, 0.178976, -0.400875, -0.242540, 0.374234, 0.112053, 0.010494, -0.208038, 1.013057, -0.681139, -0.373220, 0.204102, -0.284945, -0.659842, 0.385329, -0.354497, 0.671976, -0.685199, 0.226140, 0.946164, -0.940703, 0.294565, -0.716351, -0.519789, 0.336790, -0.932160, 0.157382, -0.336533, -0.497633, -0.473492, -0.185053, -0.894839, -1.129014, -0.683350, -0.385059, 0.077050, -0.591888, -0.939022, 0.013229, -0.946280, 0.775295, -1.067517, -0.784898, -0.320059, 0.017529, -0.243173, -0.890249, -0.577522, -0.528573, -0.368218, -0.809683, -0.339524, -0.403760, -0.817883, -1.482818, 0.363088, -0.446456, 0.215970, -0.759017, -0.162634, -0.694123, -0.042986, -0.050982, -0.627453, -0.380081, -0.375665, -0.720556, -0.696077, -0.647126, 0.050259, -1.279579, -0.753623, -0.352644, -0.864561, -1.035627, 0.115196, -0.407610, 0.055732, -0.295521, 0.266338, 0.218429, 0.497742, -0.011965, 0.522297, -0.281292, 0.332789, 0.428197, -0.059162, -0.482469, -0.418665, -0.957602, -0.631023, -0.334734, -0.228630, -0.438812, -0.131263, -0.793739, -1.390761, -0.602717, -0.347524, 0.088694, -0.961364, -0.587932, -0.110737, -0.525924, 0.274449, 0.333305, 0.217006, -0.636786, -0.580966, 0.040724]
-,        [-0.225585, -0.336232, 0.215016, -0.436510, 0.451221, 0.270617, 0.378118, 0.474710, 0.000698, -0.312542, 0.209617, 0.380421, 0.539893, 0.618891, 0.782807, -0.378633, 0.628050, -0.039288, -0.563842, 0.304593, -2.053869, -1.092417, 0.166163, -0.499040, -1.465268, -1.000997, -0.865969, -0.375455, -2.149742, -1.779011, -0.390279, -0.502512, -2.425055, -1.211867, -0.743210, 0.179876, -2.177368, -1.045077, -0.117361, 0.198702, -1.747050, -2.984431, -1.599336, -2.041706, -4.149966, -0.511102, 1.458418, 1.166934, -0.814765, -2.326078, -2.180362, -1.158222, -2.411477, -1.014497, 0.267655, 0.310659, -0.594493, -0.961340, -0.361534, -0.228078, -1.805551, 0.552010, 0.939818, 0.204568, -1.349982, 0.207953, 0.606035, 0.994088, -0.436643, 0.105733, 0.120691, -0.705483, 0.007802, -0.639177, -0.122638, -0.869188, 0.057045, -0.372977, -0.577508, -0.841687, -0.181389, -0.164848, 0.044906, -0.626681, -0.458229, -0.343625, 0.268013, -0.744711, -0.320080, -0.071926, -0.497508, -1.117517, 0.194747, -0.114431, -0.501615, -0.521271, -0.272298, -0.153052, -0.335979, -1.353958, -0.685228, -0.229883, -0.126318, -0.415605, -0.183337, -0.144198, -0.364306, -0.328628, -0.340228, -0.513233, -0.723345, -0.703740, 0.027407, -0.046585, -0.299837, -0.498901, -0.377757, -0.341037, -0.203692, -0.426425, -0.629038, -0.823913, 0.106745, 0.032315, 0.113142, 0.028288, 0.069710, 0.334878, -0.083149, 0.224538, -0.019895, -0.258568, 0.372012, -0.162705, -0.263577, 0.117375, 0.114626, 0.511405, -0.885620, 0.366330]
-,        [0.534140, 0.304607, -0.189036, -0.685357, 0.281351, -0.726737, 1.421668, -0.876945, 0.325383, -0.799661, 0.274359, -0.109228, -0.553555, -0.425809, -0.099296, -0.164443, 0.670266, 0.051601, -0.416093, 0.048609, 0.543227, 0.497798, 0.233896, 0.854981, -0.715836, -0.189457, -0.188103, 0.292374, -0.226913, -0.894115, 0.174281, -0.683497, -0.039169, -0.167581, -0.143252, 0.200256, -0.428502, 0.832821, -0.132024, 0.380055, -0.206941, 0.198628, 0.071761, 0.584133, -0.330453, 0.125208, -0.001400, -0.177657, -0.176589, -0.359148, -0.149846, -0.036765, 0.450313, -0.056498, 0.149708, -0.170697, 0.096466, -0.029977, 1.056368, 0.337784, -0.144012, 0.183777, -0.014593, 0.055375, 0.852284, 0.090903, 0.419550, 0.339158, 0.175982, 0.472637, 0.001326, -0.191001, 0.311959, 0.332535, -0.152837, 0.045503, 0.114393, 0.945045, -0.324144, -0.273358, 0.396641, 0.872011, -0.399727, -0.529787, 0.071675, 0.319842, 0.244309, -0.412858, -0.003102, 0.672507, 0.138344, -0.422688, 0.494468, 0.919109, 0.242654, 0.261275, 0.124044, 0.177271, -0.557192, -0.659825, 0.183548, -0.105674, -0.064111, -0.685090, 1.034767, 0.322131, -0.320479, 0.181392, 0.288171, 0.491291, -0.319813, -0.950122, 0.779205, -0.020707, -0.540872, -0.271163, 0.565197, -0.353480, -0.031683, -0.398548, 0.379364, -0.543558, -0.397830, -0.447153, -0.061950, -0.137021, -0.055417, -0.161103, -0.034941, -0.150943, -0.477572, -0.032201, -0.309589, -0.080170, 0.344030, -0.367137, -1.169967, 1.551877, -3.989953, -0.109978]
-,        [-0.759220, -0.263298, 0.583185, -0.478404, 0.185733, 0.309781, -0.164361, 0.194089, -0.558262, -0.494426, 0.990078, 0.035445, -0.094992, -0.284958, 0.268266, -0.029606, -0.233944, 0.064027, 0.361445, 0.206861, 0.688097, -0.209479, 0.360794, -0.023989, -0.287825, 0.912575, -0.933091, -0.233799, 1.045911, 0.147962, -0.077908, -0.575649, 0.773529, 0.356313, -1.294005, -0.314578, 0.785561, 0.269719, -0.022745, 0.190862, 0.195520, -0.472878, 0.501127, -1.351131, 0.354856, -1.129615, -0.088411, -0.097902, -0.472901, 0.196754, -0.546949, -0.553071, -0.010475, 0.625176, 0.499562, -0.299941, -0.257098, 0.308876, 0.058976, -0.294158, 1.025225, -0.592514, -0.736193, 0.146198, -0.158213, 0.306398, -0.380695, -0.574687, 0.289072, -0.629792, -0.104084, -0.740976, 0.178947, -0.108412, 0.133695, -0.509263, -0.358840, -0.807205, -0.338617, -0.491135, -0.270891, 0.213558, 0.029249, 0.160375, 0.165766, -0.084297, -0.590521, -0.027817, 0.317489, -0.131771, 0.338374, 0.024061, -0.439059, -0.675711, -0.156433, -0.258623, -0.113755, 0.036203, 0.524942, -0.118808, -0.405398, 0.089861, -0.293751, -0.321825, 0.072072, -0.380998, -0.143395, -0.285212, -0.342321, 0.400819, 0.071885, -0.516134, -0.374100, 0.157628, 0.261963, -0.433790, -0.689455, 0.670031, 0.550832, -0.449994, -0.120999, -0.336801, -0.329621, 0.064711, -0.089096, -0.051804, 0.262964, -0.067645, 0.511988, -0.192481, -0.238119, -0.297553, 0.173239, 0.678107, -0.437266, -0.037616, 0.264689, -0.417374, -0.351173, -0.329059]
-,        [-0.285338, -0.962189, -0.351427, 0.147103, 0.299252, -0.320548, 1.220927, -0.760929, -0.705887, -0.649890, -0.471495, -0.074963, 0.669163, -0.107138, 0.317698, 0.100056, -0.535979, 0.044993, 1.183994, 0.187003, 0.313446, 0.592347, -1.501639, 0.711507, 0.296289, -0.469716, 1.139888, 0.102344, 0.070903, 0.007793, -1.175333, 0.415732, -1.084558, 0.169070, -0.073020, 0.588292, -0.655455, 0.368385, -0.623970, 0.575067, -0.212756, -1.014055, -1.165097, -0.398215, 0.031559, -0.815157, 0.653133, 1.131629, 0.167448, -0.163413, 0.039417, 0.476462, 1.049270, -0.200652, 0.171931, -0.221414, -0.758681, -0.353979, 1.041689, 0.169438, -0.527302, -0.687711, -0.100205, -0.057863, -0.228139, 0.252491, -0.068234, 0.489082, -0.413420, -0.553315, -0.129965, -0.394824, 0.394928, -1.087952, -0.073541, -0.708314, 0.130034, -0.115663, -0.220303, -0.341389, 0.104854, -0.148672, 0.396346, -0.702444, -0.422865, -0.550654, 0.926107, 0.198123, -0.667743, -0.402892, -0.012246, -0.566110, -0.672598, 0.786034, -0.293717, -0.393259, -0.084813, 0.608947, -0.125260, -0.293005, -0.591345, -0.704152, 0.435477, -0.351556, -0.327243, -0.425640, -0.259176, -0.305271, 0.269827, 0.191654, 0.505168, -0.454956, -0.485423, 0.469246, 0.396653, 0.132031, -0.229040, 0.235047, 0.959505, 0.211028, 0.358439, 0.400879, -0.516562, 0.026977, -0.146946, -0.083174, -0.361263, 0.266142, 0.429045, 0.671588, -0.799788, -0.336045, -0.123697, -0.283925, -0.516304, 0.098988, 0.491023, 0.885432, -0.814073, 0.048204]
-,        [-0.109864, -0.462869, 0.441743, 0.306727, -0.123975, 0.331145, 0.087553, 0.483407, 1.123389, -0.224235, -0.324548, -0.814171, -0.525178, -0.555404, -1.002542, -0.520405, 0.624131, 0.893285, 0.171773, 0.308386, -0.135422, -0.293456, -0.348557, 0.531324, -0.117440, -0.028610, 0.117980, 0.339309, 0.447673, 0.884394, -0.414519, -0.355145, 0.089105, 0.736092, -0.365597, -0.521032, 0.989131, 1.111024, -0.342166, -0.383746, 0.075661, 0.145731, -0.159241, -0.983419, -0.516287, 0.015785, -0.281519, -0.252923, 0.443652, 0.889892, -0.186872, 0.143030, 0.708250, -0.394424, -0.032479, -0.822328, 0.301691, 0.276090, -0.462825, 0.103401, 0.234850, 0.285928, -0.276012, -0.923503, 0.508619, -0.013435, -0.203661, 0.028863, 0.236017, -0.482655, -0.406296, -0.455082, -0.305053, -0.940219, -0.132951, -0.025152, -0.336583, 0.705016, -0.109512, 0.100202, -0.292307, -0.407679, 0.200480, -0.677454, 0.032073, -0.982623, 0.037474, -0.264873, -1.146593, -0.275866, 0.162786, 0.079812, 0.215237, -0.569026, -0.176546, -0.354350, -0.536834, -0.197975, 0.515800, 0.017630, -1.177469, -0.280217, 0.583536, -0.570379, -0.854027, -0.616833, 0.251377, -0.445983, -0.568599, 0.037682, 0.229215, -0.328049, -0.295078, -0.891448, -0.264754, -0.442970, -0.815903, -0.331070, 0.324003, -0.815287, -0.316073, -0.446418, -0.645170, -0.639090, 0.047322, -0.415180, -0.439812, -0.391874, -0.255410, -0.201780, -0.074181, 0.216767, 0.509516, 0.285503, 0.274762, 0.117395, -0.234227, 0.452758, -0.359296, -0.598843]
-,        [0.675104, 1.034136, -0.007962, 0.582525, 0.199481, 0.633804, -0.231874, -0.235607, 0.816614, 0.085048, 0.384542, 0.515404, 0.204250, 1.040492, 0.023392, 0.009584, -0.252606, 0.012054, 0.638514, 0.608648, -0.264655, 0.818771, 0.658645, -0.089040, 0.791800, 0.301189, 0.499651, 0.357577, 0.797269, -0.029096, 0.067127, 0.597152, 0.801085, -0.246065, 1.074787, 0.156481, 0.599200, 0.186310, 0.109418, 0.111796, 0.179822, 0.059620, -0.085602, 0.458128, 0.621050, 0.071526, 1.034784, -0.525603, 0.315060, -0.051389, 0.800848, 0.343952, -0.152136, 0.449982, 0.348822, 0.742363, 0.926079, -0.159063, 0.420583, -0.076269, 1.250191, 1.254284, 0.165288, 0.496839, -0.021550, 0.296973, 0.466510, -0.429009, 0.072934, -0.038769, -0.110417, 0.617744, 0.197244, 0.396860, 0.500399, 0.185661, 0.409091, -0.323220, -0.374313, 0.113454, -0.646641, -0.367467, -0.511872, -0.089326, 0.304351, -0.152108, -0.144794, -0.612771, -0.384563, -0.410795, -0.313295, -0.149940, 0.407035, -0.607750, -0.064679, -0.249476, -0.019479, -0.853125, -0.485194, 0.399527, -0.406655, -0.619080, 0.168878, 0.068324, 0.155874, -0.203457, -0.079919, 0.445299, 0.395229, -0.207814, 0.005100, -0.427510, -0.244600, -0.722956, -0.071682, -0.005176, 0.148816, -0.327033, 0.121346, 0.338710, -0.551098, -0.364161, -1.223974, -0.175555, -0.130195, -0.212911, -0.040126, 0.182208, -0.017400, -0.303878, -0.250627, 0.096607, -0.091366, 0.080193, 0.054917, 0.134886, -0.362823, -0.130251, 1.611604, -0.035828]
-,        [0.080461, -0.093256, 0.203113, 0.886728, 0.444774, -0.054055, 0.187349, 0.041414, -0.470005, 0.158486, -0.440173, 0.330225, -0.560063, 0.504843, 0.904799, -0.416978, -0.880799, -0.203482, -0.041121, -0.257088, -0.824633, -0.013356, -0.512831, -0.428027, -0.885332, -1.053559, -0.429421, -0.105842, -0.465402, -0.059436, -0.795387, -0.361549, -0.730692, 0.354765, 1.067937, 1.228133, -0.646723, -0.721478, -0.465982, -0.928180, -0.156357, 1.318393, 1.325245, -0.279479, -0.975912, -0.071792, -0.520401, -0.992753, -1.328976, -0.105986, -0.622492, -0.811134, -0.635373, -0.516214, -0.256248, 1.185811, 0.593941, -0.545144, -0.361190, 0.132369, -0.615116, -1.456324, -1.240369, -0.962798, -1.780454, 0.088673, -0.139659, -0.120551, -0.039745, -0.766993, -0.115442, -0.599385, -0.112301, -0.329253, 0.268815, -0.150931, 0.202196, 0.314054, -0.334276, -0.770806, -0.539561, -0.641942, -0.079501, -0.248672, -0.229139, -0.280681, -0.527069, -0.499650, 0.621422, -0.119339, -0.678412, -0.031596, 0.345401, -0.331791, 0.179344, -0.135040, -0.476074, -0.748818, 0.406847, -0.618271, -0.039481, -0.137134, -0.268966, 0.535356, -0.047134, -0.352319, 0.141736, -1.049063, -0.640089, -1.813319, -0.289411, -0.439528, -0.168185, 0.343581, 0.594639, -0.671296, -1.223026, -0.741721, 0.264535, 0.290074, -0.051427, 0.148975, 0.072791, 0.006134, 0.221781, -2.949951, -2.571396, -0.913472, -0.533856, -0.300186, -0.117395, -0.218122, -0.099913, -0.080924, -0.388804, 0.015070, 0.193040, -0.378633, -0.372485, 0.232981]
-,        [-0.705468, -0.254439, 0.048578, 0.417857, -0.509509, -0.003809, -0.568588, -0.288380, -0.199876, 0.483793, 0.641369, -0.233856, 0.267558, 0.105300, -0.889677, -0.545707, 0.755499, -0.204169, 0.077367, -0.469976, -0.321227, -0.135245, -0.134265, 0.298436, -0.154113, -0.725928, -0.655307, -0.347020, -0.595112, -0.401012, -0.129140, -0.207589, -0.431462, 0.567774, 0.083193, -0.892385, -0.025000, -0.401136, -0.201573, -0.406056, -0.618247, 0.703425, -0.251914, -0.384691, 0.788820, -0.488089, -0.318673, -0.503808, -0.043505, -0.787325, 0.427872, -0.382660, 0.265642, 0.235572, 0.186394, -0.185727, -1.290744, -0.059567, -0.040140, -0.048780, -0.270348, -0.800366, -0.051757, -0.245801, 0.148730, 0.726756, -0.841489, 0.021588, 0.264385, -0.167072, 0.086773, -0.242778, 0.117368, 0.199000, -0.466677, -0.653551, 0.022368, -0.361977, 0.075541, -0.379075, 0.102178, -0.871315, -0.148218, 0.095990, -0.093865, -0.291494, 0.858432, -0.227257, 0.285029, 0.302914, -0.339833, -0.390664, 0.531226, -0.160931, 0.042869, -0.227756, 0.752722, 0.523966, -0.313603, -0.264171, 0.412416, 0.374484, -0.112327, -0.101567, 0.362556, -0.615532, -0.112630, 0.410562, 0.252764, -0.088879, -0.145399, 0.246594, 0.377938, -0.609466, -0.495987, -0.616763, -0.139869, 0.291656, 0.593305, 0.712314, 1.149970, -0.009934, 0.049792, 0.268169, -0.209191, -0.378317, -0.433834, -0.874102, -0.272659, -0.246893, 0.063157, 0.090127, -0.235226, -0.090607, -0.055724, 0.127774, -1.184848, -0.499485, -2.052012, 0.246006]
-,        [-0.476343, -0.656749, -0.594959, 0.481640, -0.935863, 0.173523, -0.515740, -0.304384, 0.699045, -0.041345, 0.163335, -0.858902, -0.294329, 0.251284, -0.986911, -0.426002, -0.165628, -0.090477, -0.492686, -0.231001, -0.624108, -0.581706, -0.673554, -0.277468, 0.364448, 0.766132, -0.878154, -0.599101, -0.067471, -0.091546, 0.061826, -0.533696, -0.087195, 0.885922, 0.121908, -0.461466, -0.623685, -0.387667, -0.566796, -1.074281, -0.105410, -0.679825, -0.852942, -0.425154, -0.754071, -0.356698, 0.339184, -0.509133, 0.122740, 0.545369, 0.234578, -0.737013, 1.041833, -0.078315, 0.309846, 0.052384, -0.246200, 0.367413, -0.396163, -0.315140, 0.011291, 0.711639, -0.158301, -0.700896, -0.671783, -0.862266, -0.942434, -0.526714, 1.068381, -0.376640, -0.453935, 0.597066, -0.665261, -1.071056, -1.204235, 0.577469, -1.752117, -1.071091, -0.921994, -0.476687, -0.838952, 0.292869, 0.084554, -0.063271, -0.610640, -0.638816, -0.708039, 0.172335, 0.477183, 0.310907, 0.123722, -1.052440, -0.291159, -0.217872, -0.790680, 0.251033, -0.795920, -0.828055, -0.163988, 0.366592, -0.767430, -0.611169, -0.277998, 0.062244, -0.848249, -0.089846, -0.693079, -0.542397, -0.705231, -0.316187, -0.146255, 0.010536, -0.743007, -1.457177, -0.762069, -0.021491, -1.021023, -1.301546, -0.547752, -0.591445, -0.942365, 0.353959, 0.047374, 0.333338, 0.046038, -0.322195, 0.047028, 0.110680, -0.424327, -0.104363, -0.056536, 0.736641, 0.285697, -0.370467, -0.739167, 0.347979, 0.079263, -0.423157, -2.654390, -0.160914]
-,        [0.056773, -0.346846, -0.096590, 0.392101, -0.176585, 0.274992, 0.099512, -0.447671, 0.952721, -0.194535, 0.380880, 0.886738, 1.088139, -0.045421, -1.676053, -0.617533, 1.506544, 0.473213, 0.405560, 0.910771, 0.048793, 0.396343, 0.730292, 0.610130, -0.173178, 0.165786, 1.157260, 0.476835, 0.330547, 0.480243, 0.614132, 0.435053, 0.526499, 0.033817, 0.674205, 0.605578, 0.171545, 0.398086, 0.494766, 0.063656, 0.925420, 0.565001, 0.123293, 0.340291, -1.256619, -0.179178, 0.047437, 0.203687, 0.212937, -0.624478, 0.573136, -0.216873, 0.684849, 0.466658, 0.484511, -0.014111, -0.090981, 0.446279, 0.640067, 0.280170, 0.525480, 1.173589, 0.232704, 0.568236, -0.334607, -0.433692, 0.849558, 0.357922, 0.764294, -0.569451, -0.308349, 0.586812, -1.282243, -0.174404, -0.122571, -0.311136, -0.502099, -0.287225, 0.145918, -0.324206, -1.162578, -0.046619, 0.588875, 0.008297, -0.566601, -0.371632, 0.110468, -0.513686, -0.509970, 0.525336, 0.646310, 0.123869, -0.329063, 0.657319, 0.080880, -0.080322, -0.440107, -0.484896, -0.233718, 0.592422, -0.374420, 0.534234, 0.454957, 0.652447, 0.082396, 0.345564, -0.233916, 0.141204, -0.666116, 0.290108, 0.495170, -0.331252, -0.366154, -0.003512, 0.662302, 0.949895, -0.575652, -0.362805, 0.132698, 0.141777, -0.681760, -0.024456, -0.653540, -0.035804, 0.045190, 0.247199, -0.100138, -0.023429, -0.089732, -0.214065, -0.072293, -0.299930, 0.269135, -0.064519, -0.160808, -0.097501, 0.226840, 0.379957, -0.894112, 0.147457]
-,        [-0.217282, -0.169636, -0.379557, 0.007540, 0.161032, 0.213203, -0.133306, 0.025778, -0.318775, -0.052294, -0.201123, -0.554127, -0.323550, -0.151551, -0.246445, -0.028721, -0.311298, -0.205404, -0.242827, -0.228084, -0.411920, 0.119213, 0.029552, -0.198252, -0.458732, -0.068301, -0.100439, -0.325689, -0.545402, -0.073194, -0.276353, -0.530280, -0.164430, -0.057249, -0.297742, 0.029455, -0.057171, -0.139890, 0.041498, 0.113246, -0.105133, -0.280850, -0.270234, -0.290202, -0.530759, 0.095718, -0.048103, -0.352437, -0.017035, -0.167230, -0.034727, -0.219255, -0.075979, -0.186110, -0.051566, -0.028671, -0.295652, 0.133175, -0.004255, 0.123323, -0.098797, -0.027279, 0.125777, -0.564167, -0.254345, -0.157353, -0.216788, -0.195982, -0.065582, -0.131375, 0.134672, -0.078863, -0.437422, -0.457337, -0.122892, -0.320369, -0.330051, -0.259296, -0.151055, -0.134060, -0.317761, -0.028200, -0.033180, -0.503622, -0.423328, -0.194897, -0.120607, -0.238794, -0.188612, -0.349043, -0.171773, -0.058894, -0.275600, -0.099714, -0.269353, -0.150459, -0.321568, -0.142186, -0.271712, -0.245514, -0.083441, -0.299618, -0.100797, -0.132789, -0.267935, -0.213109, -0.009811, -0.311596, -0.240613, -0.412179, -0.394732, -0.077702, -0.152055, -0.371227, -0.287425, -0.100617, -0.452705, -0.026639, -0.171446, -0.017412, -0.292602, -0.070304, -0.136015, -0.038855, -0.225382, -0.053629, 0.010000, 0.187046, -0.055556, -0.298730, -0.232341, -0.096881, 0.258858, 0.142787, 0.087489, -0.234669, -0.018530, -0.117254, -0.085179, -0.196792]
-,        [0.968411, 0.541700, 0.279667, 0.216470, -0.019070, 1.126228, 0.786122, 0.709954, 0.540367, 0.331505, 0.321610, 0.137191, 0.716753, 0.378697, -0.122821, -0.403844, 0.312023, 0.347858, 0.031418, 0.753717, 0.813304, 0.585215, 0.060200, 0.444990, 0.414372, 0.497387, 0.485923, 0.579328, 0.326475, 0.766590, 0.233440, 0.514710, 0.460493, 0.038592, 0.604617, 0.801017, 0.474714, 0.701432, 0.603331, 0.161599, -0.099609, 0.003636, 0.215021, 0.116878, 0.353780, 0.760608, -0.053768, 0.540415, 0.509094, 0.428548, 0.827633, 0.968273, 0.051655, 0.307672, 0.555610, 1.132753, 0.440904, 0.142770, 0.814000, 0.611373, 0.571892, 0.186873, 0.744119, 0.877531, 0.379563, 0.766619, -0.006820, 1.156889, 0.087499, 0.398952, -0.156952, 0.396662, 0.027753, -0.722767, 0.098614, -0.691592, -0.000039, -0.449276, 0.115383, -0.086793, -0.085375, -0.364719, -0.293596, 0.219572, -0.681139, 0.580409, 0.034119, 0.034220, -0.242976, 0.261123, -0.258971, 0.054299, -0.207186, -0.757550, -0.540058, -0.135843, 0.479507, 0.066689, 0.454868, -0.440901, -0.046134, 0.415792, -0.012449, -0.949356, -0.629484, 0.686895, -0.359788, -0.596434, -0.005993, -0.004877, -0.340095, -0.175106, -0.750458, -0.012727, -0.144656, -0.967291, 0.258171, 0.128890, -0.180845, -0.004930, -0.257705, -0.684587, -0.710359, -0.009117, -0.693891, -0.290497, 0.206151, 0.294560, -0.280262, 0.088302, 0.167070, 0.131801, 0.085441, -0.391638, 0.612801, 0.336624, -0.674915, 0.485545, 0.120667, -0.453852]
-,        [0.451833, -1.205040, 0.099663, -0.265596, -0.709267, 0.029519, 0.696713, -0.076240, -0.142891, 0.111788, 0.215517, 0.317055, -0.856515, -0.641332, -0.389326, -0.380064, 0.188380, -0.221142, 0.382889, 0.247678, -0.443999, 0.045274, 0.430882, -1.050097, 0.268860, -0.027317, 0.569160, 0.782806, -0.491515, -0.014835, -0.343597, -0.102760, 0.660847, 0.153199, 1.160121, -0.280268, -0.337479, 0.220220, -0.566054, 0.539538, -0.157527, 1.352482, 0.572268, 0.694550, -0.179853, -0.509541, -0.597294, -0.098713, -0.194347, -0.903404, 0.075817, 0.283420, 0.424197, 0.487834, 0.187022, 0.091218, -0.164353, 0.275812, 0.278515, 0.775655, 0.214405, 0.835602, -0.468969, -1.195998, -0.001325, 0.319909, 0.605042, 0.456414, -0.591873, -0.367857, -0.389241, 0.771037, -0.047174, 0.011968, -0.433104, -0.159961, 0.228047, 0.239725, 0.099024, 0.207116, 0.209589, 0.528828, 0.036904, 0.475845, 0.439309, 0.357043, 0.449687, 0.059586, 0.117704, 0.031115, -0.128686, -0.356981, 0.591495, -0.377269, 0.394981, 0.349317, 0.398787, 0.186305, -0.411404, -0.130575, 0.486173, 0.599282, 0.197453, -0.591611, 0.712787, -0.159462, 1.002436, -0.169498, 0.549864, -0.331210, -0.714085, 0.244395, 0.301779, -0.041534, -0.357656, 0.185849, 0.826839, -0.237953, 0.277869, 0.159081, 0.447624, 0.025201, -0.630980, -0.275447, 0.252404, -0.449412, -0.448807, -0.012758, 0.403022, 0.160050, 0.307252, -0.257757, -0.002731, -0.093098, -0.084412, -0.163881, -0.551403, 1.062184, -7.721076, 0.042545]
-,        [-0.318427, -0.859096, -0.083298, -0.128221, 0.155532, -0.390514, 2.650661, -1.346968, -0.019522, -0.212502, -0.324233, -0.033544, -0.452705, -0.002327, 0.015661, -0.383465, -0.242105, 0.417454, 0.237154, -0.424145, -0.573515, 0.385679, -0.425838, -0.182354, -0.039129, 0.942280, -0.495237, -0.266293, -0.522672, -0.599872, -0.154367, -0.839951, -0.243931, -0.071594, -0.104590, -0.090728, 0.292840, -0.295368, -0.152896, 0.173717, -0.694152, 0.401338, 0.868037, 0.947286, 0.926273, -0.048475, -0.137441, -0.238789, -0.040819, 0.142944, -0.005482, -0.416856, 0.470682, -0.077270, -0.091953, -0.221419, 0.222049, -0.624582, -0.085838, -0.043330, 0.264086, -0.015365, 0.167779, 0.070385, 0.021995, 0.178888, -0.042349, -0.322585, -0.509750, -0.464524, -0.388668, -0.088354, -0.092982, 0.001720, 0.023908, 0.158187, -0.201140, 0.151374, -0.596760, -0.081286, 0.065270, 0.235854, 0.233367, 0.160952, 0.330720, 0.123448, 0.681767, 0.602307, 0.484816, 0.319353, 0.211218, -0.378991, 0.164357, 0.356775, 0.735338, -0.155715, 0.223334, 0.143170, 0.038097, 0.654415, -0.043988, -0.177952, 0.140660, 0.340763, -0.139618, 0.317580, 0.466719, 0.067320, 0.362633, 0.458039, -0.186299, -0.203988, 0.152510, -0.023355, 0.099967, -0.098719, 0.048032, -0.327497, 0.231065, 0.060571, 0.275086, -0.859116, -0.253402, 0.407302, 0.390844, 0.047219, 0.081890, 0.012912, 0.341627, 0.131112, 0.039020, 0.277145, 0.135380, -0.030867, 0.141035, 0.085501, -0.197599, 3.053846, -1.309403, -0.082859]
-,        [-0.178463, -0.069655, 0.490528, -1.644314, -0.290188, -0.117890, 0.300156, -0.941602, 0.157227, -0.057207, 0.191236, -0.478811, -0.715854, -0.369311, -0.528458, -1.026671, 0.835110, -0.435727, 0.131219, -0.491721, -0.290048, 0.482238, 0.248293, 0.091201, 0.699936, 0.299016, 0.234859, 0.141159, -0.304792, 0.344420, -0.895267, -0.451108, 0.077422, -0.917106, 0.385814, -0.671066, 0.991109, -0.625551, -1.802843, -1.009331, -0.595095, -0.052830, -1.131242, 0.240253, -1.139484, 0.150943, 0.255739, 0.631506, -0.612464, -0.055677, 0.014655, -0.331776, 0.087598, -0.158484, 0.410096, 0.635975, 0.129249, -0.625083, -0.200980, -1.211327, 0.637258, -0.057600, 0.159601, -0.622720, -0.255618, -0.534102, 0.127393, -1.022743, 0.420517, 0.309198, -0.651538, 0.559150, 0.094550, -0.024224, -0.610748, -0.395634, -0.469797, -0.208428, -0.744757, -0.343656, -0.502139, 0.436486, -0.095824, 0.067546, 0.245705, -0.492124, -0.372051, -0.127216, 0.358117, 0.379827, -0.175309, -0.067197, 0.429796, -0.442091, -0.672833, -0.196984, 0.317513, -0.140345, -0.482530, -0.178435, 0.260344, -0.501066, -1.162826, -0.727059, -0.181989, 0.771754, -0.588998, -0.348446, -1.383072, 0.170626, -1.011226, 0.485024, 0.421027, -0.216707, -0.091575, 0.370274, 0.394524, -0.415935, -0.777388, -0.194521, -0.888798, 0.034038, -0.576013, -0.230499, -0.258615, -0.164365, -0.068489, 0.252545, 0.230718, 0.098515, -0.264302, 0.385902, 0.047582, -0.099275, 0.442042, 0.281164, 0.302555, 0.336693, -2.258280, -0.216345]
-,        [0.070948, -0.674482, -0.443707, -0.840637, 0.004180, -0.270763, -0.078345, -0.271618, -0.485841, -0.012293, -0.356009, -0.530523, 1.186254, -0.052879, -0.533756, 0.443112, -0.409858, -0.073024, -0.799112, -0.498735, -1.877346, -0.599253, -0.273149, 0.761926, -1.208968, 0.226220, -1.536744, -0.276183, -0.629072, -0.214528, -1.430588, -1.681119, -1.226596, 0.202075, 0.066414, -1.055360, -1.464641, -0.343779, -0.163177, -0.681126, -1.782676, -1.019129, -2.051741, -0.755968, -1.210862, -0.903493, -2.588826, -0.469818, -2.473539, -0.647814, -1.599484, -1.076149, -0.574723, -0.707092, -2.158410, -1.399281, -0.454670, -1.168725, -0.760646, 0.181315, -1.693528, -1.491443, -1.546293, -1.207777, -1.600469, 1.492174, 2.143270, 1.393260, 1.628977, 0.685776, 0.242797, -0.669112, 0.586651, -0.497131, 0.045963, -0.654347, -0.118991, -0.142318, 0.365089, 0.143962, 0.061526, 0.150645, 0.352164, -0.055251, 0.211446, -0.046116, -0.399090, -0.036307, -0.398885, -0.128606, -0.230720, 0.747662, 0.405863, 0.328283, -0.216897, -0.260790, 0.353170, -0.009815, -0.743662, -0.060263, -0.097787, -0.042077, -0.376181, 0.339312, -0.313378, -0.026851, -0.135025, -0.233615, -0.289076, 0.634572, -0.268602, -0.137957, -0.448674, 0.142160, -0.037423, 0.426312, -0.050786, -0.860822, -0.171801, -0.520264, -0.572653, -0.010738, -0.061107, 0.230580, 0.173500, 0.072054, 0.098886, 0.285543, -0.255949, -0.715976, -1.048506, -1.964619, -0.716219, -0.578663, -0.267244, -0.056610, -0.470853, -0.471600, -0.860554, -0.290716]
-,        [0.866494, -0.899797, -0.590248, 0.731877, 0.590687, 0.497367, -0.718102, -1.174711, 0.900253, 0.047239, 0.557243, 0.140946, -0.086698, -0.179182, 1.013374, 0.371522, -0.043424, 1.147340, 0.958520, 0.695363, 1.238461, -0.129401, -2.116953, -1.279481, -1.207892, -0.662836, -0.375008, -2.504087, -0.943450, 0.358476, -0.821466, -0.210366, -0.703131, -0.000677, -0.379361, 0.049862, -0.788530, 0.988987, 1.067368, 0.535708, 0.335004, -4.376474, -0.998436, -4.429261, -3.156322, -0.737376, -1.650928, -2.736516, -1.486171, -0.346113, -0.972642, -0.788255, -0.711860, -0.071019, -0.948920, -1.513593, -1.556440, 0.096443, -0.069320, -0.408859, -0.765766, 0.684948, -0.381959, 0.101308, -1.502143, 1.179953, 0.046243, 0.477086, 0.428803, -0.438457, -0.023799, -0.094379, -0.265267, 0.146699, 0.490231, 0.543736, -0.003644, -0.369580, 0.586613, 0.251123, 0.109889, 0.234640, -0.123145, 0.414633, 0.016369, -0.382622, 0.081079, 0.077621, -0.016842, -0.466038, -0.093934, -0.404047, -0.205266, -0.270420, 0.211392, 0.065724, 0.241306, -0.322759, 0.395628, 0.068066, -0.044650, 0.190874, -0.077356, 0.012627, 0.370330, 0.231989, -0.052551, -0.019680, 0.331519, -0.505596, 0.373635, 0.163043, 0.217074, -0.401648, -0.361273, -0.039235, -0.215456, -0.884520, -0.059670, -0.134872, -0.164480, -0.616810, -0.015374, -0.030818, 0.053487, 0.280952, 0.330597, 0.221878, -0.047798, -0.114408, -0.290488, 0.236111, 0.059918, -0.028465, 0.317745, 0.174571, -0.100179, -0.389362, -1.875779, -0.145630]
-,        [-0.945627, 0.796845, 0.758870, 0.972714, -0.123547, -0.794090, -1.364862, -0.655388, -0.039842, -0.832442, 0.693094, 0.254870, 0.272169, -0.314612, -0.207776, 0.066078, -0.373053, -0.328691, -1.614728, 0.108344, 1.558756, 0.273989, -0.185430, 0.366019, -0.674383, -1.098915, 0.376503, -0.207277, 0.472014, 0.234712, 0.045333, 0.460524, 0.903669, -0.507288, -0.417869, 0.185917, -0.005844, 0.664243, 0.490284, -0.588432, -0.132625, 0.878242, -0.613366, -0.972125, 0.424800, 0.427979, -0.429336, 1.281460, -0.342935, -0.896289, 0.606042, 0.619533, 0.141398, -0.620977, -0.706181, -0.323358, -0.075745, -0.629521, -0.520156, 0.073631, -0.336030, 0.942594, -0.154147, -0.623132, -0.168514, -0.569448, -0.534672, -0.622151, -0.593189, 0.783033, -0.120949, 0.204485, -0.580111, 0.038208, 0.040731, -0.422056, -0.678284, 0.507939, -0.588349, 0.532964, -0.279153, 0.350161, 0.029561, -0.526025, 0.026260, -0.698420, -0.719182, -0.407963, -0.033944, -1.055536, -0.844121, -0.275361, -1.156048, 0.366841, -0.318955, -1.179528, -0.364565, 0.218687, -0.633362, -0.237270, -0.190347, 0.366709, -0.143951, 0.168307, -0.500077, -0.006738, 0.234614, 0.044531, -0.021836, 0.248991, -0.446017, -0.463717, -0.490791, 0.114835, 0.051850, 0.446437, -0.261441, 0.283957, -0.002578, -0.116184, -0.493063, -0.004510, 0.115850, -0.356810, -0.080817, 0.191509, 0.091300, 0.074995, -0.343968, -0.301328, -0.126317, -0.006186, -0.248644, -0.527024, -0.271482, -0.242589, -0.357574, -0.927682, -1.278130, -0.254105]
-,        [0.199821, -0.199095, -0.496301, 0.254211, 0.348571, 0.023281, -1.372463, 0.350546, -0.494667, 0.039520, -0.338549, -0.063375, -0.010289, -0.794904, -0.316328, 0.827460, -0.444017, -0.040377, -0.153877, -0.404834, 0.250645, -0.736918, 0.072987, 0.417602, -0.157262, 0.084301, 0.906834, -0.055131, 0.616601, 0.077955, 0.196431, 0.108163, -0.004713, 0.139405, 0.696631, 0.636288, 0.436138, -0.867046, 0.792316, -0.018052, -0.247739, -1.035710, -1.180945, 0.453533, -1.474009, 0.204248, -0.190844, -0.858204, 0.787876, -0.482538, 0.628671, 0.681893, -0.060813, -0.350927, 0.755172, 0.296567, -0.030091, -0.745583, 0.039808, -0.250812, -0.233330, -0.838292, 0.168157, 0.673029, -0.823437, -0.072352, 0.077450, -0.273542, 0.719081, -0.090748, -0.073960, -0.145484, -0.417478, -0.498963, -0.002596, 0.438601, -0.302353, -0.430887, -0.281392, -0.302710, -0.317046, -0.702551, -0.631475, -0.148607, -0.525227, -0.613813, -0.201341, -0.202010, -0.539026, -0.763552, 0.025779, 0.110739, -0.576528, 0.060348, -0.545410, 0.264614, -0.920162, -0.484040, -0.016710, 0.222694, -0.160746, -0.282827, -0.245416, -0.298664, -0.099414, -0.498755, 0.074838, 0.132895, 0.068343, -0.453730, -0.236434, 0.487087, -0.665759, -0.875865, -0.345982, -0.370133, -0.131599, -0.185664, -0.095649, 0.109930, -0.459879, 0.741461, -0.475754, -0.260410, 0.023724, -0.017057, -0.050621, -0.091438, 0.298645, 0.142995, 0.131284, -0.093980, 0.170973, -0.102027, -0.021860, -0.163024, -0.286101, -1.888730, -0.706386, -0.564805]
-,        [0.099508, 0.280969, -0.192969, 0.010335, -0.154544, -0.022914, 0.434552, 0.406317, -0.152120, 0.627024, 0.630341, 1.220999, 0.199106, -1.012651, 0.030097, -0.162610, 0.995332, 0.953923, 0.182863, 0.216281, 0.471683, 1.184139, 0.748453, 0.602709, 0.179236, 0.205647, 0.566745, 0.220639, 0.496618, 0.648612, 0.595519, -0.333134, 0.712548, -0.368868, 0.903132, 0.493387, 0.629384, 1.015262, 0.298289, 0.892117, -0.364541, 1.113029, 0.264387, -0.483535, -0.105332, 0.471479, -0.347846, -0.297461, 0.394879, -0.185026, 0.914188, -0.004891, 1.157449, 0.510823, 0.378765, -0.173289, 0.880083, 0.335471, 1.093928, -0.019589, 0.828322, -0.365005, -0.043325, 0.419538, 1.270834, -0.051060, 0.560551, 0.605849, 0.802154, -0.026299, 0.104117, -0.155186, -0.150691, -0.611731, 0.114758, 0.632649, -0.251577, -0.270049, -0.028100, -0.081424, -0.149160, 0.354885, 0.428388, 0.079774, -0.347273, -0.409005, -0.050303, -0.371534, 0.266292, -0.131386, -0.062710, -0.231129, 0.104674, 0.147354, -0.029351, 0.337223, 0.271194, 0.245444, -0.158005, 0.261356, -0.575744, -0.329945, -0.022976, 0.510458, -0.983453, -0.577740, -0.250380, 0.384427, 0.137620, 0.524223, -0.102119, 0.508493, 0.228678, -0.743914, -0.246838, 0.161890, 0.187322, 0.400268, 0.276090, -0.150988, 0.064985, -0.501833, -0.710148, -1.017939, -0.289038, -0.854042, 0.263811, 0.203474, 0.270685, 0.082214, -0.526653, -0.405405, 0.039437, 0.432865, 0.088376, 0.110582, 0.225792, 0.613306, -0.329888, -0.276897]
-,        [-0.011629, -0.670402, 0.405037, -0.512396, -0.572089, 0.455258, -1.167405, 0.372578, 0.058863, 0.699261, 0.716913, 0.588219, 1.163274, -0.626093, -0.253863, -0.428025, 1.797392, -0.700505, -0.544518, -1.065287, -1.207732, -1.693356, -0.811591, 0.213586, -0.205034, -0.443684, -0.086363, 0.708469, 0.575083, 0.005318, 0.323697, -0.150847, 0.200512, -0.933602, 0.835277, -0.886797, 0.395572, -0.399434, -0.744803, 0.134624, 0.359545, -3.173527, -2.396781, -1.851041, 0.157903, -0.794661, -0.514427, -0.144465, -0.862035, -0.110277, -0.483942, 1.035882, -0.066805, -1.112364, 0.163254, 0.955227, -0.095958, 0.727726, -0.044311, 1.832126, 0.046999, -1.140667, -0.898127, 0.020363, -0.181378, -0.516084, 0.509491, 0.279487, 0.513425, 0.056894, -0.404478, 0.100169, 0.033278, 0.094296, -0.499781, -0.780916, -0.252116, -0.336454, -0.633180, -0.087957, -0.228679, -0.263397, 0.364109, -0.255349, 0.117160, -0.053175, -0.390114, -0.158037, 0.063809, -0.471007, 0.500781, 0.523880, 0.205888, 0.155684, -0.377997, -0.710171, 0.121511, 0.375050, -0.128371, 0.286169, 0.994376, 0.301873, 0.107057, 0.023110, 0.099228, -0.216887, 0.623716, -0.173399, 0.511638, -0.343041, -0.013911, -0.195032, 0.107149, -0.345337, -0.827019, -0.562852, 0.491760, -0.478552, -0.530084, -0.081310, 0.464261, -0.042045, 0.499722, 0.101782, 0.188656, 0.026066, 0.339039, 0.152251, 0.149062, -0.323220, -0.229245, 0.302860, -0.666202, -0.503021, -0.214618, -0.091973, -0.279939, -1.656256, -3.175977, -0.266943]
-,        [0.598650, 0.714155, 0.518275, 0.500537, 0.761209, 0.606532, 1.119087, 0.549110, 0.611215, 0.678092, 0.796247, 0.474135, 0.561023, 1.255868, 0.729846, 1.216269, 0.682839, 0.633892, -3.353333, 0.846977, -3.167831, 0.785005, -3.477647, 1.141927, -2.817585, 0.462160, -4.155431, 0.418543, -3.140234, 0.262496, -3.381971, 0.710625, -3.137069, 0.531657, -3.134884, 0.804084, -3.005241, 0.526222, -4.757227, 0.396493, -3.131465, -1.486684, -5.920908, -1.025879, -5.308813, 0.458517, -2.594268, 0.869753, -2.648882, 0.551273, -3.295384, 0.659316, -3.447875, 0.850319, -2.233362, 1.200255, -2.235758, 0.330731, -3.514308, 0.793527, -3.336953, 0.045863, -3.905623, 0.771832, -4.455171, 0.336792, -3.597165, 0.174563, -3.787795, 0.045324, 0.132994, -0.059986, 0.023546, 0.066268, -0.047286, 0.115831, 0.016143, 0.008993, -0.055409, 0.004232, -0.018495, -0.063253, -0.101581, 0.129896, -0.011657, -0.084134, 0.070274, -0.009818, 0.069424, -0.077799, -0.067595, 0.119502, 0.023227, 0.064343, 0.007653, -0.025534, -0.017526, -0.166514, 0.030202, 0.129526, 0.011156, -0.057609, -0.180689, 0.030341, 0.039056, -0.089241, -0.061780, -0.027111, -0.223599, -0.069104, -0.172650, 0.018401, 0.030213, 0.135294, -0.002584, 0.139299, -0.092930, 0.049159, 0.106883, 0.063119, 0.051254, -1.083993, 0.063417, 0.038079, 0.074020, 0.067744, 0.013289, 0.027650, 0.009936, 0.004114, 0.079732, 0.055174, -0.050893, -0.070154, 0.045713, 0.048235, -0.005404, 0.241918, -0.344056, 0.786375]
-,        [0.124392, 0.506578, 0.394883, 1.013287, 0.305573, -0.622787, -1.065755, 0.191486, 0.713269, 0.055381, -0.657678, 0.677036, 0.283369, 0.136578, 0.391354, 0.680676, 0.435889, -0.052572, -0.399764, -0.845730, -0.156950, 0.200896, 1.255401, -0.058546, 0.847046, 0.572643, -0.011198, 0.696658, -0.015201, -0.253315, 0.329129, 0.451976, -0.090342, 0.203662, 0.691419, 0.472670, 0.341065, -0.020971, 0.713732, -0.436994, -0.638057, -0.355886, -0.225009, -0.069845, 0.646947, -0.644003, 0.390006, 0.143172, -0.721495, 0.654274, -0.531544, -0.579495, -0.012650, -0.767708, -0.511721, 0.064707, 0.637494, -0.461084, 0.645219, 0.758035, 1.068838, 0.476337, 0.714327, 0.550678, -0.071764, -0.044594, 0.457791, 0.479217, -0.276608, -0.083022, 0.329903, 0.388413, -0.979548, 0.845812, -0.159350, 0.493685, 0.432974, -0.385063, -0.343409, 0.139778, 0.131706, 0.455648, 0.325941, 0.207300, -0.231189, -0.148663, -0.465856, 0.357455, 0.119105, 0.128229, 0.086119, -0.021365, 0.517442, 0.402903, 0.048149, -0.599970, -0.061462, -0.101615, -0.397270, -0.165711, -0.175355, -0.541519, -0.646415, -0.385667, -0.350473, 0.122334, 0.089756, 0.072874, 0.591932, 0.703627, -0.326770, 0.124995, -0.942126, 0.320432, -0.010227, 0.287456, 0.544772, 0.244055, 0.512728, -0.535293, -0.130649, -0.019236, -0.184906, 0.140254, -1.222504, -0.961953, -0.123121, -0.601861, -0.234508, -0.148489, -0.155534, -0.101353, 0.223452, 0.013323, -0.004191, 0.131487, -0.205586, -1.428224, 0.636759, -0.110542]
-,        [0.408197, 0.233027, -0.169320, 0.521465, 0.478118, -0.616113, -0.292206, 1.006023, -1.419376, 0.743206, -0.440592, -0.687379, -0.640091, -0.327529, -0.267571, 0.937527, -0.488300, -1.131187, 0.391968, -0.204856, -1.215627, -0.744707, 0.905195, 0.621273, -0.245281, 0.156358, 0.515677, 0.302665, -0.098779, -0.078533, 0.415752, 0.396926, -0.330416, -0.183861, 0.208786, 0.414190, 0.393579, 0.219518, -0.325786, 0.082285, -0.608885, -1.022587, 0.242562, 0.432984, -1.667899, 0.806709, -0.070416, -0.717870, -0.439430, 0.221336, 0.128760, 0.071128, -0.554060, -0.503143, -0.471578, -1.251667, -0.621004, 0.079162, -0.061188, 0.130124, -0.628661, -0.006189, -0.445274, -0.341525, -1.129362, 0.278291, -0.153386, 0.376253, -0.349859, -0.356189, -0.124419, 0.640930, 0.359996, 0.596166, 0.481605, 0.549217, 0.566605, -0.847768, 0.451235, 0.314483, -0.140546, 0.345382, 0.233751, 0.549763, 0.117774, -0.072376, -0.169180, 0.059956, -0.363284, -0.305309, -0.633819, 0.102562, -0.122154, -0.259478, -1.339036, 0.095757, -0.359949, -0.252587, -0.085494, 0.489667, -0.685173, -0.397664, 0.078025, 0.885669, 0.454150, 0.010460, 0.373906, -0.044483, 0.228103, -0.573264, 0.344809, -0.102403, 0.579624, 0.440729, 0.889634, -0.158655, -0.667159, -0.376296, -0.070549, -0.668695, -0.016127, -0.034488, -0.190626, -0.107756, -0.069119, 0.123919, -0.198393, 0.119652, 0.173690, 0.343638, -1.130538, -0.840986, -0.394794, -1.411064, -0.739635, -0.717137, 0.210635, -0.396480, -2.044200, -0.396970]
-,        [-1.324226, 0.663646, 0.547883, 0.353242, -0.392806, 0.036168, -0.247165, 0.675172, 0.434230, 0.415350, -0.271045, 0.535864, -0.182338, 0.128739, 1.354094, -0.312771, -1.052014, -1.315997, 0.757546, 0.616230, 0.184266, 0.890559, -0.244966, 0.472538, 1.178380, -0.066126, 0.099627, -0.302338, 0.083780, 0.035364, -0.349597, 0.541578, 0.488518, -0.505649, 1.215011, -0.251248, 0.129166, -0.766655, -1.549158, -0.135779, 0.336101, 0.361881, 0.815762, -1.342363, -1.394397, 0.160789, 0.295281, 0.455003, -0.101426, -1.033820, -0.018512, -0.743904, -0.167663, -0.059520, 0.209454, 0.167200, 0.405765, -0.060841, 0.113283, 0.119926, 0.070990, 0.097870, -1.020403, -0.235650, 0.501850, 0.504396, -0.303296, 0.064176, 0.603425, 0.143695, 0.488192, 0.182595, 0.208671, -0.469789, -0.035121, -0.325560, -1.221913, 0.518166, 0.332218, 0.117806, -0.258755, -0.574550, 0.342690, 0.276406, -0.142808, -0.269460, 0.595489, -0.184875, -0.762641, 0.298222, 0.238976, 0.128200, 0.480660, 0.158488, 0.772965, 0.205078, 0.392385, 0.292170, -0.986692, 0.023112, -0.654169, 0.611404, 0.404435, 0.049619, -0.095245, -0.549957, 0.386680, 0.280377, -0.636298, 0.571602, 0.162814, -0.291387, -0.418226, -0.052146, 0.731032, 0.305194, -0.337784, 0.071251, 0.092633, -0.580298, -0.661279, 0.271249, 0.250158, 0.275995, 0.210133, 0.292186, -0.034549, -0.189227, -0.224618, -0.416478, -0.085025, -0.736770, 0.013924, -0.550263, -0.976249, -0.397786, 0.639026, -0.675866, -0.347103, -0.305549]
-,        [0.549050, 0.339415, 0.169565, -0.065676, -0.506499, 0.329104, -0.387778, 0.200091, -0.563500, 0.847771, -0.152172, 0.280416, -0.225927, -0.437646, -0.458235, 0.545480, 0.276917, 0.046488, 0.133466, 0.569176, 0.338874, 0.236730, -0.340736, -0.724626, -0.075305, 0.116878, -0.323726, 0.154466, -0.914670, -0.014420, -0.160128, -0.357645, -1.131055, -0.202306, -1.101001, -0.076302, -0.834057, 0.628251, 0.647170, -0.336007, 0.479664, -0.856660, -1.005392, -0.852833, 0.414732, 0.184902, -0.223883, 0.075591, -0.411379, 0.407115, -0.344380, 0.341844, 0.013019, -0.221393, -0.270183, -0.303238, -0.096464, -0.625043, -0.152587, -0.113810, 0.210090, -0.293875, 0.257030, -0.027045, -0.368091, 0.076388, -0.160440, 0.423242, -0.441474, -0.736237, -0.888899, -0.592051, -0.251645, 0.063614, -0.445225, -0.605882, -0.161852, -0.001837, 0.580117, -0.155277, -0.169210, -0.189315, 0.074354, -0.385807, -0.383996, 0.304692, -0.440088, 0.900899, 0.524997, -1.008721, 0.578523, 0.249183, -0.797097, -0.426257, 0.680469, -0.251464, -1.108574, -0.495422, -0.555255, 0.129355, 0.006309, -0.093498, 0.270039, -0.019851, -0.987078, -0.446994, 0.369118, -0.171805, 0.321864, -1.059553, 0.586220, -0.448931, -1.108314, -1.656583, -0.635765, -0.609615, -0.296971, -0.537863, -0.629422, -0.403028, -0.429670, -0.295261, -0.320956, -0.329900, -0.237267, -0.465977, -0.308221, 0.306080, -0.089838, 0.239971, -0.038087, 0.224355, -0.420593, 0.300667, -0.393613, -0.207907, -0.009264, -0.631227, -0.550452, -0.395518]
-,        [-0.111999, -0.372181, -0.162882, 0.277507, -0.825897, 0.722695, -0.203742, 0.155572, -0.477896, -1.135035, 0.312348, 0.378645, 0.113755, -0.112924, 0.405903, 0.112517, -1.501532, 0.519305, -0.039530, -0.073947, -0.179874, -0.655149, 0.381208, 0.219597, -0.841717, 0.674781, -0.055518, -0.699564, -0.374748, -0.163976, 0.091266, 0.511434, -0.254548, -0.796163, 0.055676, -0.586402, -0.315183, -1.151412, -0.444666, -0.091865, 0.166218, -1.143934, 0.641482, 0.058693, 0.059570, 0.280728, 0.608999, -0.448084, -1.443020, -0.331293, -0.454621, -0.929911, -0.083371, -0.714644, -1.522981, 1.036977, -0.276279, -0.634575, -0.383315, 0.092268, -0.669690, 0.714502, 0.138071, -0.531892, -0.725805, 0.780451, -0.128811, 0.407948, -0.479674, -0.124188, 0.565482, -0.360654, 0.180568, -1.048658, 0.323928, -0.805539, -0.485475, -0.515857, -0.073338, -0.318527, -0.729730, -1.252007, -0.392329, 0.164704, -0.492673, -0.816711, -0.029458, -1.229675, -0.208325, -1.203106, -0.386078, -0.188616, -0.212535, -0.572345, 0.000072, 0.037459, -1.046150, -0.728032, 0.238366, -0.630735, 0.037041, -0.596369, 0.233582, 0.153178, 0.150235, -0.017384, -0.649507, -0.111000, -0.817884, -1.362018, 0.360579, -0.557937, -0.489016, -0.702814, 0.051454, -0.129815, -0.372440, -0.126119, -0.575375, -0.450803, 0.260034, -0.146183, -0.019293, -0.020683, -0.286257, -0.157342, -1.112517, -0.647258, -0.366830, -0.369018, -0.205066, -0.087624, -0.234307, -0.182858, 0.102638, -0.198214, -0.366932, -0.024877, -0.378080, -0.293157]
-,        [-1.474253, -0.402679, -1.116730, -0.850234, 0.641983, -1.446901, 0.870524, 0.325883, 0.494695, -0.714130, 0.123469, 0.425544, -0.103393, 0.018270, -0.431915, 0.462705, -0.774362, 0.861584, -0.581294, -0.514902, -0.731780, 0.014259, -0.730624, 0.667964, 0.329087, -0.440106, -0.896126, -0.396022, -0.151747, 1.725883, -0.881115, -0.071847, -0.784032, -0.107842, 0.726924, -0.099443, 0.124844, 0.391186, 0.271717, -0.021241, -0.524921, -0.239833, -0.804923, 0.501380, -0.332995, -0.379522, 0.008034, -0.526546, -0.215040, 0.552054, -0.486346, 1.215169, 0.429162, -0.274238, -0.141000, 0.425948, 0.439310, -0.125975, -0.152010, 0.816190, 0.835289, 0.693169, -0.588673, 1.319942, 0.357637, -0.358091, 0.700489, 1.001526, -0.126729, -0.140359, -0.601253, -0.656118, -0.270678, -0.425154, 0.288327, -0.022014, -0.548056, -0.343334, -0.182382, -0.005105, 0.442861, -0.518892, 0.466654, -0.360364, 0.541177, 0.070069, 0.190763, -0.538595, -0.298693, -0.847428, 0.284893, -0.718500, -0.664326, 0.444078, 0.663513, -0.307186, 0.147040, 0.484042, -0.194305, -0.430282, -0.443235, -0.240967, -0.373234, -0.616274, 0.034650, -0.391130, 0.275024, -0.421465, 0.004029, 0.236663, 0.490599, -0.558422, 0.150927, 0.265803, 0.416037, -0.489972, 0.201128, -0.193712, 0.048571, -0.651184, 0.328777, -0.316494, 0.031255, -0.321709, -0.182911, -0.457356, -0.400269, -0.464480, -0.390279, 0.374461, -0.217685, -0.271571, -0.210314, -0.295130, 0.065660, -0.075768, 0.592196, 1.078277, -1.758302, -0.620860]
-,        [0.521601, 0.031217, -0.521725, 0.146646, -0.439591, 0.688068, 0.515211, -0.018676, 0.446172, -0.451988, 0.165134, 0.601975, -0.336448, 0.237207, 0.781388, -0.320848, -0.248585, 0.169179, -0.248308, 0.479100, 0.521832, -0.453763, -0.934192, -0.428710, 0.175164, 0.260841, 0.673060, 0.639619, 0.235360, 1.064243, -0.291564, -0.364418, 0.618581, 0.316938, -0.711890, -0.755852, -0.241819, 0.155967, -0.277042, 0.934313, 0.021254, 0.235528, -0.030151, -0.838203, 0.725623, -0.196505, -0.851072, 0.035293, -0.055826, 1.813027, -0.244271, 0.207093, -0.445490, 0.045970, 0.185311, -0.145312, -0.611575, 0.309986, -0.388508, -0.369514, 0.055114, -0.115081, -0.287975, -1.396416, -0.735663, 0.004895, 0.380464, 0.693579, 0.055356, -0.173459, 0.218547, -0.911825, -0.018090, -1.145111, -0.216550, -1.043782, -0.355850, -0.056328, 0.034440, -0.244937, -0.031003, -1.002856, -0.941377, -0.322374, -0.027896, 0.490064, -0.586781, -0.214402, -0.185541, -0.580628, -0.248412, -0.710406, -0.229864, -0.518828, -0.492435, -0.088460, -0.614905, -0.965677, 0.128227, -0.012244, -0.486716, -0.614621, -1.275044, -0.217276, -0.403302, 0.137015, 0.205651, -0.318814, -0.838031, 0.253020, -0.252598, -0.709967, 0.316914, -1.009396, -0.685494, -0.970135, -0.885590, -0.945862, -0.653321, -0.561106, -0.953225, -0.251326, -0.230179, -0.154458, -0.509160, -2.640702, -1.278064, -0.951575, -0.581143, -0.322915, -0.377369, -0.265667, -0.010984, -0.146120, -0.087506, 0.057584, 0.619287, -0.310373, -0.799528, -0.518058]
-,        [-0.703517, 0.584115, 1.641145, -0.236422, 0.603071, -0.499842, -0.163164, 0.198297, -0.018984, 0.029397, -0.176906, 0.862584, -0.120448, 0.209055, -0.418138, 0.403564, -0.022669, 0.328531, 0.727507, 0.120209, -0.763687, -0.100897, 0.555295, 0.393065, -0.002386, -0.150058, 0.081492, 0.044665, 1.137481, -0.285457, 0.122119, 0.393439, 0.511446, -0.348287, -0.055678, -0.057759, 0.264713, -0.401378, 0.387969, -0.100611, -0.070176, 1.137777, 0.598134, 0.156615, -0.470767, -0.150009, 0.029235, 1.101142, -0.866581, -0.099238, 0.122327, 1.736580, -0.393916, 0.365347, 0.687570, 0.629168, 0.000491, -0.046190, -0.203707, -0.205650, 0.034434, 0.103353, 0.409306, 0.859082, 0.964133, 0.882897, 0.542916, 0.811970, -0.239209, -0.105220, 0.133613, 0.063373, -0.013084, 0.021191, -0.172296, -0.167167, 0.743223, 1.116423, 0.491315, -0.155198, -0.431780, -0.085408, 0.310231, -0.219321, -0.725155, -0.067681, 0.174024, 0.349036, 0.751451, -0.211274, 0.241381, -0.068917, -0.512915, 0.482461, 0.130644, 0.140215, -0.360384, 0.223580, 0.526089, -0.128418, 0.100952, -0.566029, 0.119228, -0.365639, -0.708754, 0.264993, -0.396527, 0.231202, -0.418336, 0.244020, -0.288773, -0.184925, -0.423508, -0.286214, -0.819344, 0.270097, 0.115704, -0.365881, 0.425830, 0.678565, 0.404158, 0.163020, -0.342003, -0.311814, -0.144381, -0.018606, 0.089548, 0.176184, -0.629233, -0.241492, -0.047038, -0.161888, -0.252987, 0.292499, 0.165226, -0.300058, 0.105926, 0.208407, -0.138813, -0.069235]
-,        [0.367166, -0.409870, 0.291180, -0.139565, -0.171697, -0.098277, -0.617167, 0.557068, 0.701603, 0.607696, -0.014406, 0.128772, 0.739417, 0.111020, 0.033824, -0.941880, -0.028245, 0.186549, 0.067737, 0.668829, -0.207726, -0.000535, 0.373971, 0.597285, 0.298534, -0.564656, -0.840657, 0.771069, 0.025762, 0.463516, -0.343060, 0.306713, -0.083815, 0.848163, -0.036333, 0.244923, 0.462488, 0.695624, -0.041270, 0.201276, -0.386661, -0.372498, -0.357969, 0.241903, 0.201069, -0.597662, 0.409536, 1.121576, 0.117649, 0.047521, 0.924184, 0.556938, -0.515071, -0.189884, 0.358173, -0.630574, 0.528397, 0.071725, 0.108311, -0.130340, -0.233332, 0.820982, -0.651167, -0.049266, 0.392913, -0.373482, 0.032144, 0.560956, 1.055955, -0.127512, 0.255945, 0.104376, 0.618735, -0.188155, -0.385475, 0.170308, 0.249615, 0.167468, 0.505278, 0.305596, -0.389507, -0.236151, 0.057559, 0.221060, -0.056642, -0.451024, 0.211603, 0.116033, 0.331178, -0.663140, -0.284967, 0.393277, -0.014258, 0.147858, 0.662782, 0.134774, 0.066069, -0.126275, 0.346013, 0.072852, -0.104950, 0.140041, -0.464345, 0.187089, 0.216075, 0.265046, -0.218474, 0.478006, -0.612814, 0.282577, -0.426672, 0.236413, -0.563846, 0.209824, -0.009513, -0.515969, -0.360596, -0.091327, 0.499377, 0.400921, 0.024584, -0.694781, -0.807586, -0.387824, -0.285093, -0.556760, -0.139825, 0.059308, 0.008954, 0.100668, 0.123367, -0.282867, 0.389405, -0.533162, -0.475860, -0.224032, 0.352987, -0.561389, 0.315282, -0.108991]
-,        [0.092933, 0.437392, 0.320675, 0.139881, 0.309714, 0.701308, -0.683072, 0.549054, 0.518983, 0.700810, 0.723927, 0.496334, 0.146986, -0.312676, -0.229389, 2.243150, -1.151497, 0.521555, -0.016192, 0.334535, 0.104631, -0.118000, 0.031398, 0.595361, 0.655252, 0.593232, 0.282503, 0.327249, 0.116980, 0.470606, 0.036894, 0.382275, 1.065196, 0.228554, 0.350398, 0.445155, 0.418835, 0.311415, -0.032910, 0.547245, 0.617669, -0.148727, -0.083111, 0.007835, 1.283351, -0.589682, 0.631685, -0.055880, 0.710156, -0.047926, 0.600999, 0.290888, 0.799430, 0.047175, 0.266090, -0.188642, 0.425211, 0.350117, -0.057958, 0.575495, 0.441656, 0.492151, 0.248838, 0.002357, 0.025794, 0.304983, -0.043179, 0.426672, 0.518763, 0.048178, 0.126236, -0.721646, 0.256120, 0.342945, 0.385407, -0.665314, 0.360614, 0.256072, 0.342966, -0.778817, 0.348585, 0.026881, 0.515091, -0.833807, 0.576566, -0.263187, 0.420671, -1.241107, 0.456285, -0.200495, 0.164609, -1.212123, 0.338885, 0.239594, 0.378359, -0.442926, 0.243242, 0.417208, -0.010188, -0.696976, 0.166451, 0.361303, 0.258738, -0.965116, 0.696781, 0.177585, 0.650556, -1.336282, 0.097111, 0.315380, 0.075914, -0.551622, 0.557304, 0.373184, -0.114931, -1.326143, -0.046992, 0.215634, 0.656957, -0.801595, 0.546077, -0.406023, -0.490956, 0.029232, -0.044844, 0.192240, 0.124233, 0.328802, -0.160911, -0.120699, 0.310729, -0.348262, 0.301787, -0.279163, 0.138964, 0.233081, 0.276995, -0.418749, 1.040553, 1.489938]
-,        [-0.707520, -0.096226, -0.174265, 0.632090, 0.027437, -0.162746, 1.911601, -0.997319, 0.296433, -0.413128, -0.066272, 0.763306, -0.929590, 0.359473, -3.043879, -5.410028, 1.388067, 0.111103, -0.607217, -2.634912, 0.806922, 0.457722, 0.253980, -2.354207, 0.766178, 0.837673, -0.248076, -2.666744, 0.194571, 0.864145, 0.001223, -2.710231, 0.040640, -0.540531, -0.450641, -1.827931, -0.033553, 1.034047, -0.357267, -2.028670, 0.476144, 1.045681, -3.174436, -2.928865, 1.088685, -0.083190, -1.087787, -2.451976, -0.205474, 0.476880, -0.110584, -2.060645, 1.014347, -0.646818, -0.230095, -2.091337, -0.041228, 0.109567, -0.482206, -1.799369, 0.440970, 0.506907, -0.208974, -1.377411, 0.732769, -0.319312, -1.288432, -4.587369, -0.560486, -0.061027, -0.254153, 0.480667, 0.063720, -0.118807, -0.139425, -0.061852, -0.030048, -0.293664, -0.330023, -0.061671, 0.355738, -0.010033, 0.067849, 0.218307, 0.176109, -0.395767, -0.301931, -0.062094, 0.436888, 0.066792, 0.035119, 0.133725, 0.160651, 0.118691, 0.010048, -0.145327, 0.346300, 0.197762, -0.191877, -0.037201, -0.062164, -0.125492, -0.212450, 0.085463, 0.154720, -0.049570, 0.061946, 0.024384, 0.049214, 0.121265, 0.040102, 0.031128, 0.144227, 0.037340, -0.204894, -0.037092, 0.311887, -0.021418, 0.348415, 0.317760, -0.209790, -0.033505, -0.029372, 0.069990, 0.083427, 0.015062, -0.218797, -0.058326, -0.137546, -0.190709, 0.022223, 0.115771, 0.096581, -0.127070, -0.176420, -0.214926, -0.045054, 1.690703, 1.314574, -0.175986]
-,        [0.164149, 0.978152, 0.246093, 0.315253, -0.378876, 0.350503, 0.364575, -0.205007, 0.713759, 0.577314, 0.299741, 0.160532, 0.664629, -0.012559, -0.168951, 0.123036, 0.254854, 0.284169, 1.247716, 1.425583, -0.063110, -0.573948, -0.039371, 0.968769, -0.620009, 1.052490, 0.056840, 0.290701, -0.137359, 0.947447, 0.236122, 0.651904, -0.645425, 0.055784, 0.198825, 0.999004, -0.807423, 0.639554, -0.024706, 0.675353, 0.524092, 0.654487, -0.400134, 0.502561, -0.146796, 0.019684, 0.880918, 1.244159, 0.431692, 0.056240, -0.029226, 0.409620, 0.990201, 0.325027, -0.118725, 0.355468, 0.257685, 0.922878, -0.063865, -0.149802, 0.639517, -0.425139, -0.536569, 0.010575, -0.310757, -0.111161, 0.258925, -0.174453, 0.471557, -0.296078, -0.436753, -0.050491, -0.745623, -0.213704, -0.458604, 0.088939, -0.104593, -0.378842, 0.063548, -0.405319, 0.427354, -0.659829, 0.142773, -0.287657, 0.339768, 0.069224, -0.251902, 0.433171, -0.170272, -0.029029, -0.318591, 0.067098, 0.448928, -0.272277, -0.164771, 0.105650, 0.044638, -0.779331, -0.239208, -0.046493, 0.124798, -0.038946, -0.194671, -0.188048, 0.296465, 0.148559, -0.030662, -0.125958, -0.529075, 0.469162, -0.410448, 0.581551, 0.579660, 0.048118, 0.443433, 0.698981, -0.540767, 0.347062, -0.319499, 0.166742, 0.050181, -0.366557, -0.119922, -2.724293, -1.291049, -0.991743, -0.336206, -0.209201, -0.239792, -0.010221, -0.306613, -0.087293, -0.234626, -0.320381, -0.388386, -0.104922, -0.108879, -0.162301, -0.407638, -0.071465]
-,        [0.272763, 1.065577, 0.276129, 0.945345, 1.046115, 0.617175, 0.560306, 0.215568, 0.501309, 0.786116, 0.496170, 0.005209, 0.537718, 0.350318, 0.024939, 0.176612, 0.680731, 0.679443, 1.109877, 0.657203, 1.012715, 0.766058, 0.226537, 1.334273, 0.629218, 0.730855, 0.212929, 0.445959, 0.179556, 0.168905, 0.321373, 1.095120, -0.084795, 0.498986, -0.054518, 1.144814, 0.290265, 0.476346, 1.076803, 0.766376, 0.688941, 0.159724, 0.996320, 0.795463, 0.474697, 0.200379, 0.291843, 0.730615, 1.027012, 0.254008, 0.654028, 0.908841, 0.422091, 0.923848, 0.281203, -0.264711, 1.175272, 0.978342, 1.348671, 1.168998, 0.152827, 0.186442, 0.459038, 0.331365, 0.638391, 0.466940, 0.832582, 0.775891, 0.664647, -0.688186, 0.328627, 0.440070, 0.228080, 0.389241, -0.160413, -0.316322, -0.485813, -0.535603, 0.183571, -0.063365, 0.273045, -0.412824, 0.397843, -0.178276, -0.408055, 0.192362, -0.054863, 0.509014, 0.388369, 0.393056, -0.185283, -0.195321, -0.334713, 0.305394, 0.077246, -0.152052, 0.255320, 0.755163, 0.232718, 0.521532, -0.203269, -0.014013, 0.552447, 0.158136, -0.005660, -0.472140, -0.390375, 0.223915, -0.478928, 0.099948, -0.660622, -0.045915, 0.366667, 0.406914, 0.281148, -0.648931, -0.240538, -0.003642, 0.175798, -0.368482, 0.096528, -0.616172, 0.045951, -4.446115, -1.739401, -0.544738, -0.449697, -0.094902, -0.303595, -0.254020, 0.031462, -0.064786, 0.002715, -0.112848, -0.110786, 0.217227, -0.486052, 0.574523, 0.123754, -0.251760]
-,        [-0.216845, 0.147277, -0.435801, 0.350974, 1.065181, -0.259494, -1.015969, -0.379263, 0.251122, -0.349875, -0.931851, 0.230899, -0.194360, -0.912435, 1.065484, -0.706975, -0.021981, 0.162146, 0.101279, 0.383193, -0.390567, -0.353465, 0.254507, 0.273317, -0.814157, -0.778118, -0.346574, -1.322686, 0.127937, -0.592393, -0.264620, -0.045126, 0.020156, -0.131152, 0.041907, -0.306970, -0.266746, -0.244263, 0.653388, -0.362903, -0.429242, -1.262344, 0.199269, -1.185427, -0.905680, 0.584217, 0.896253, -0.332902, 0.476243, -0.285960, 0.302332, -0.678857, -0.126726, 0.874235, 1.665186, 0.085363, 0.276482, -0.687508, -0.580356, -0.177902, -0.676259, -0.135992, -0.963529, 0.129528, 0.901974, -0.266959, -0.662670, 0.097999, 0.465973, -0.757561, -0.603695, -1.011679, 0.287656, -0.331826, -0.360121, -0.973418, -0.563768, -0.259071, 0.391335, -0.680945, -0.039423, -0.623197, -0.421027, -0.416484, -0.660893, 0.125530, -0.010944, 0.299861, -0.317241, 0.236737, -0.352581, -0.936856, -0.406623, -0.433645, -0.282942, -0.675720, -0.366738, -0.485712, -0.364930, -1.048898, -1.051365, 0.762055, 0.101593, -0.060503, -0.033020, -0.324204, -0.233568, -0.803918, -0.865981, -0.059190, 0.061075, 0.337098, 0.024450, -0.457718, 0.081480, -0.255979, -0.424214, -0.250852, -0.094360, -0.968425, -0.376920, 0.098044, -0.293720, -0.176551, -0.386859, -1.097496, -1.283064, -1.230736, -0.812467, -0.164607, -0.155232, -0.184622, 0.270388, 0.193462, 0.146472, 0.002379, 0.226829, -1.218837, -0.864062, -0.393540]
-,        [1.127931, 0.045731, -0.483746, -0.500661, -0.432062, -0.340185, 0.317967, 0.418612, -0.186847, -0.167535, -0.229084, -0.355681, 0.661056, -0.997031, -0.611891, 0.248496, 0.459520, 0.532770, 0.256658, 0.628659, 0.048880, -0.887354, -0.702868, -0.576948, 0.108075, -0.332764, -0.655590, 0.131295, 0.294594, -0.317373, 0.856620, -0.198277, 0.167189, -0.639161, -0.044133, 0.106509, 0.851262, -1.674197, -2.199753, -0.960687, -0.879199, -2.959779, -3.360831, -2.595070, 0.935586, -0.447836, -0.386990, -0.628035, -1.647995, -0.743297, -0.208254, 0.819203, 0.742714, -0.544633, -1.978041, -0.778574, -0.456675, -0.718977, -0.571353, -0.147350, -0.432658, 0.610265, 0.133698, 0.917068, 0.310675, -0.035798, 0.224472, -0.626162, -0.585233, -0.203667, -0.144148, -0.333240, -0.249932, 0.360696, -0.165959, 0.245309, -0.161093, 0.087559, -0.188030, -0.038867, -0.191772, 0.001797, -0.123504, -0.083465, -0.194091, 0.072902, -0.055028, -0.466575, -0.045444, -0.393854, -0.187058, 0.030304, 0.526620, -0.332129, 0.027600, 0.480444, 0.501681, 0.134147, -0.607042, -0.670810, -0.077716, -0.480435, -0.247494, -0.025383, -0.357939, -0.244320, 0.451523, 0.209909, 0.197681, 0.165446, 0.386589, 0.645816, 0.150196, 0.766726, -0.421546, 0.018312, 0.483752, 0.118564, -0.330759, 0.084189, 0.244729, -0.004824, -0.011927, 0.023806, 0.057400, -0.922168, -2.423072, -1.661053, -0.827699, -0.674016, -0.812249, -0.401049, -0.294028, -0.568196, -0.284110, -0.055702, -0.025074, 0.411600, -1.515487, -0.704765]
-,        [0.324755, -0.715040, -0.505065, 0.219130, -0.447687, 0.367339, 1.933684, -0.355893, -0.373404, -0.283585, -0.252261, -0.543906, -0.130064, -0.680869, -0.643988, 0.299719, 0.585202, 0.260579, -0.273863, -0.238887, -0.202678, -0.508797, -0.159804, 0.418336, 0.053515, 0.575193, 0.430152, -0.489049, -0.433504, -0.040637, 0.323923, -0.361976, -0.520499, 0.286942, 0.355006, 0.347032, 0.155935, -0.661928, -0.713391, -0.300831, -0.009632, 0.218242, -0.155653, 0.098991, 0.039237, 0.346078, 0.101249, -0.133060, 0.262705, 0.327073, 0.571132, 0.446945, -0.000915, -0.228913, 0.720278, -0.069902, -0.521747, -0.053045, 0.272726, 0.844080, 0.113468, -0.314312, 0.451452, 0.119473, 0.307151, -0.054029, 0.576958, 0.203913, -0.776188, -0.164412, -0.187812, -0.077538, 0.011589, -0.041051, 0.024225, -0.279770, -0.180531, -0.189065, -0.450139, -0.708250, -0.585349, -0.474214, 0.116435, -0.084466, 0.167052, -0.344262, -0.459908, -0.111097, 0.188415, -0.697037, 0.211136, -0.302400, 0.049337, -0.126059, -0.036699, -0.363725, -0.191311, 0.002356, -0.176698, 0.308327, -0.036174, -0.363028, -0.437199, -0.147321, 0.630028, -0.168950, -0.160131, -0.207131, 0.184845, -0.462396, -0.428885, 0.188443, -0.161249, -0.089034, -0.075949, -0.038910, 0.066203, -0.128429, -0.358190, 0.070230, -0.080402, -0.086092, -0.220562, -0.244901, -0.060637, 0.012664, -0.066442, -0.512479, 0.221521, -0.289122, 0.203831, 0.088016, -0.053759, -0.299994, -0.004713, -0.176603, -0.447929, 1.942000, -32.268944, 0.593068]
-,        [0.408219, 0.386803, -0.308881, -0.695114, -0.343952, 0.114873, 0.169841, 0.004975, 0.690178, 0.507594, -0.117192, -0.510375, 0.419511, 0.141418, 0.546423, -0.623597, -0.907001, -0.209662, -0.936486, -0.415757, -0.224956, 0.115457, 0.173380, -0.075076, -0.869360, -0.018252, 0.931569, -0.299704, -0.374219, -0.293311, 0.173612, -0.462882, -0.745701, 0.345673, 0.438612, -0.041256, 0.227639, -0.086671, 1.050402, 0.453399, -0.632257, -0.731457, -0.213723, -0.566552, -0.419575, -0.400657, 0.296949, -0.820066, 0.428882, 0.309649, 0.570364, -0.650941, -0.509222, 0.407065, 0.419210, -0.008549, -0.037260, 0.142640, -0.473014, -0.476360, 0.322605, 0.097204, 0.361836, -0.258549, 0.545270, -0.352011, 1.268573, -0.103882, 0.058234, 1.274567, 0.001377, -0.361189, -0.609120, 0.003960, 0.097724, -0.268450, -0.508389, -0.359807, -0.543707, -0.129423, -0.503295, 0.045970, -0.188117, -0.460181, -0.974594, 0.010801, 0.045131, -0.121758, 0.362122, 0.171265, -0.056631, -0.605532, -0.997575, 0.035563, 0.275233, -0.683800, 0.386125, 0.066270, -0.639491, 0.345410, -0.112771, -0.948721, 0.116048, -0.330644, -0.380873, -0.822782, -0.669909, 0.540319, -0.286326, -0.521928, 0.220912, -0.623972, -0.933896, -0.668621, -0.377960, 0.027816, -0.253114, 0.356901, -0.268330, 0.070095, -0.509296, -0.128250, -0.459741, -0.388370, -0.045669, -1.038737, -1.061106, -0.470416, -0.648112, -0.219294, -0.255660, 0.004994, -0.607451, -0.175690, -0.234835, -0.092148, 0.156475, 0.454167, -1.580611, -0.433385]
-,        [0.152704, 0.491498, 0.058316, 0.430079, -0.746530, 0.466164, -0.505656, -0.402487, 0.007798, -0.081081, 0.277037, 0.684638, -0.068853, -0.580505, -0.376820, -0.484415, 0.643765, -0.871125, 0.561546, -0.299120, -0.208331, -0.457491, -0.368246, 0.163719, -0.174798, 0.380919, 0.490527, 0.590412, 0.615461, -0.379874, -0.091139, -0.765789, 0.385622, -1.728170, -0.050628, 0.481068, -0.364555, -0.596912, 0.849921, -0.107931, 0.996336, -1.314935, -0.588134, -0.861705, 0.458212, -0.651962, -0.086098, 0.013843, 0.155706, -0.456494, 0.045454, -1.604724, -1.074932, -0.669486, -1.004007, 0.313821, -1.185891, -0.392295, -0.727826, -0.233649, -0.506951, -0.451967, -0.301208, -0.040248, 1.001741, -0.191853, 0.316158, 0.142166, 0.708310, 0.338111, -0.511999, 0.080987, 0.249126, -0.498993, -0.182460, 0.064216, 0.785299, 0.055849, 0.282734, 0.404741, -0.310037, 0.038649, -0.150033, 0.031425, -0.293812, -0.071814, 0.096750, -0.033414, 0.587943, 0.140750, 0.221539, 0.125866, -0.329356, -0.581807, -0.092827, -0.154650, 0.164246, -0.490140, -0.498979, -0.465946, 0.446405, -0.047874, 0.275551, 0.347659, -0.050157, -0.065492, 0.097297, -0.243213, -0.846932, -0.202605, 0.111643, 0.250938, 0.135728, -0.044789, -0.062058, -0.844571, 0.622666, -0.131299, -0.674051, -0.128531, -0.587230, -0.276529, 0.131457, -0.016750, 0.162729, -3.571891, -1.801712, -0.849755, -0.471717, -0.173068, -0.625310, -0.213964, -0.221231, 0.035815, 0.034145, -0.059647, 0.245163, -0.734035, -0.577321, -0.466102]
-,        [0.665749, 0.631417, 0.231406, 0.433391, 0.077398, 0.461895, 0.248561, 0.486561, 0.511926, 0.034070, -0.738060, -0.067277, 0.092015, 0.328276, 0.561492, 0.666230, 0.631377, -1.117235, 0.890069, 1.464318, -1.028890, -2.068914, 0.733747, 0.762969, -2.723296, -5.729214, 0.007673, -0.072739, -4.634249, -1.455407, 0.895037, 0.689571, -1.190978, -5.731458, -1.895198, -0.905558, -5.828984, -2.116389, 0.900889, 1.189228, -1.181811, -6.010698, -1.523331, -0.345431, -3.582780, 0.465964, 1.742211, 1.463405, -0.251248, -0.928506, 1.538530, 1.271158, 0.224733, -5.927231, -1.972089, -1.862783, -5.611730, -6.824301, -2.227367, -2.179253, -5.684155, -5.881713, -1.451275, -1.725700, -6.381321, -4.935200, -0.005227, 0.226210, -3.333234, -0.006135, -0.112909, 0.092912, 0.175897, 0.079296, -0.102286, -0.108351, 0.125914, -0.194555, -0.048759, 0.140884, -0.040203, -0.190971, -0.060265, -0.170837, 0.172828, 0.087303, -0.066140, -0.051097, -0.091138, 0.057003, 0.065582, 0.225922, -0.062190, -0.104634, -0.135572, -0.108528, 0.238234, -0.156143, 0.102035, 0.093431, -0.126985, 0.000664, -0.283737, -0.079812, 0.291557, 0.026880, 0.049815, 0.254527, 0.113586, -0.061932, 0.015761, 0.093263, -0.052994, -0.026151, 0.352232, 0.021766, 0.279794, 0.175557, 0.072772, 0.015954, 0.117341, -0.594926, 0.012498, 0.131027, -0.004765, 0.027023, 0.047564, 0.198448, -0.023784, 0.070588, 0.063824, -0.070548, 0.067577, -0.121430, 0.094601, 0.113353, 0.026020, 0.089017, 0.391147, 0.192144]
-,        [-0.259963, -1.029864, 0.148606, -0.364274, -0.148897, 0.940614, -1.184120, 0.495415, -0.206588, -0.594053, -0.529671, 0.528343, 0.160609, 0.428855, -0.748512, 0.678328, -0.941858, -0.752224, 0.076323, -0.946935, -0.151299, 0.248094, -0.575943, -0.085681, -1.195159, -0.860788, -0.311781, 0.126142, 0.316513, -0.342473, 0.558025, -0.005412, -0.341106, -1.297112, 0.242715, -0.568317, 0.880283, -0.120266, -0.624770, -0.221166, -0.432318, 0.573933, 0.353820, 0.173357, -0.894078, 0.259133, -0.534554, 0.740603, 0.057575, -0.663855, -0.216496, 0.218592, 0.166907, -0.349434, -1.186722, -0.162994, -0.416250, -0.469395, 0.101636, -0.076111, 0.245587, -0.497036, 0.495213, 0.152730, -0.366891, -0.162417, -0.607762, 0.281961, 0.315577, -0.137667, 0.401138, -0.079185, -0.539631, -0.074678, 0.458806, 0.067559, -0.527614, -0.675319, -0.094425, -0.591464, 0.006357, -0.485295, -0.058677, -0.256721, 0.798220, 0.058485, 0.524563, -0.203698, -0.227871, 0.234409, -0.451282, 0.174557, -0.090056, 0.078882, -0.665106, -0.630885, -0.384372, -0.357392, 0.355987, 0.682705, 0.033556, -0.972882, -0.428219, 0.250930, -0.505437, -0.149402, 0.430282, -0.402979, -0.410758, -0.213529, -0.074979, -0.080892, -0.053445, -0.114911, 0.288810, 0.186489, -1.141785, -0.408883, -0.064008, -0.395538, -0.598677, -0.274190, -0.269994, 0.035120, -0.292677, -0.237730, 0.155743, 0.369576, 0.200154, 0.123436, 0.070437, -0.241586, -0.197027, -0.219341, -0.673257, -0.616313, -1.028589, -1.047920, -1.027176, -0.171550]
-,        [0.307333, -0.207369, 0.536128, 0.612273, 0.316592, 0.076138, -0.550641, 0.411909, -0.616801, -1.015892, -0.320995, 0.468061, -0.377179, -0.050609, 0.155162, 1.104852, -0.992373, 0.785558, 0.757597, -0.198655, 0.406865, -0.895749, 0.323348, 0.294218, -0.579475, -0.139725, 0.782582, -0.878645, -1.027433, -0.734806, 0.253270, 0.898851, 0.418548, 0.524662, -0.483884, -0.429025, 0.300023, 0.364838, -0.581929, -0.273881, 0.325316, -0.560795, 0.387382, 0.624326, -0.260787, 0.683365, 0.386800, -0.320098, 0.271712, -0.489347, 0.067667, 0.209002, 0.236991, 0.028486, 0.352925, 0.575178, 0.032443, -0.842301, -0.836039, -0.008794, -0.072081, 0.780042, 0.296495, -0.888206, 0.091725, -0.532056, -1.313292, 1.011177, -0.620889, -0.181103, 0.598020, -0.587306, -0.175597, -1.217269, -0.735998, -0.944044, -1.039879, 0.509760, -0.805578, 0.054796, -0.372963, -0.162831, -0.010370, 0.387591, 0.665845, -0.265157, -0.154807, 0.196090, -0.483377, -0.441080, -0.699926, -0.639621, -0.398997, -0.336240, -0.570969, -0.121784, -0.416332, -0.596120, -0.410990, -0.443279, -0.436843, 0.321894, -0.741620, -1.312584, -0.287619, 0.416585, -0.778459, 0.390104, 0.528103, 0.158101, 0.098886, 0.759460, -0.008804, 0.002582, 0.097351, 0.505854, 0.098541, -0.075547, 0.035575, 0.150149, -0.300322, 0.138882, 0.274327, -0.624792, -0.014420, 0.056014, -0.217258, 0.397851, 0.210604, 0.379962, -0.487186, -0.164279, -0.189197, 0.415813, -0.126779, -0.696879, -1.158158, -0.484774, -1.309215, 0.391886]
-,        [-0.017215, -0.782138, -0.192996, 0.038637, 0.335191, 0.316933, -1.754267, 0.313955, -0.176504, 0.075090, 0.149414, -0.380013, 0.676123, -0.741055, -1.076422, 0.000484, 1.612320, -1.388128, -0.921635, 0.195185, -0.973532, -0.503210, 0.546630, 0.148324, -0.320087, -1.819994, -0.822270, -1.394009, -1.420673, -1.166534, 0.147020, -0.316972, -1.317104, 0.153662, 1.494133, 1.186889, 0.179979, -1.281471, 0.272487, -0.287021, -0.990553, -3.831275, -2.870003, -1.463022, 0.114291, -0.778006, 0.533081, 0.717934, -0.120500, -0.722774, 0.696913, -0.102291, 0.240670, -0.329812, 0.014346, 0.470769, -0.210948, -1.347989, 0.303687, -0.522395, -0.895957, -1.812515, -1.353741, -0.171144, -1.121094, -1.865141, -0.857012, -0.660696, -0.737036, -0.266510, -0.671210, 0.344219, 0.009703, 0.133230, -0.454765, 0.160633, 0.297827, 0.510650, -0.206069, -0.035519, 0.323624, -0.602388, -0.253220, -0.070086, 0.915594, 0.007954, -0.399205, -0.262381, 0.785102, -0.002061, -0.210145, -0.460876, 0.189274, 0.066136, -0.560659, 0.102015, 0.509010, -0.369870, -0.513513, 0.090822, 0.372988, -0.100624, -0.228074, 0.135896, 0.013255, -0.432996, 0.001967, -0.316698, 0.500551, -0.490388, 0.248398, 0.313573, 0.420174, -0.239225, -0.183544, -0.328287, -0.124975, -0.441064, 0.125699, -0.089799, 0.634283, -0.064236, 0.357966, 0.247944, 0.247744, 0.059886, 0.218314, 0.067671, 0.150837, 0.069525, -0.116359, -0.029420, -0.021040, -0.039043, -1.406316, -1.425204, -0.305037, -1.677674, -4.551808, -0.864145]
-,        [0.525251, 0.462175, 0.523516, 0.384726, 0.112236, 0.578138, 1.424870, 0.432486, 0.302334, 0.520262, 0.404875, 0.309299, 0.418460, 0.574461, 1.161014, 0.774680, 1.281940, -2.354302, 0.829143, -2.541400, 0.750179, -3.248135, 0.612085, -3.097013, 0.438242, -2.485400, 0.566451, -2.195887, 0.838994, -3.005637, 0.480909, -2.213692, 0.613314, -2.840748, 0.527190, -3.133812, 0.357806, -2.788651, 0.404365, -2.899416, 0.368623, -4.892067, -1.428847, -6.090207, -1.588956, -3.195183, -0.107564, -3.652233, 0.146424, -2.928562, 0.557281, -2.708248, 0.401202, -2.092520, 0.766460, -1.897834, 0.772875, -3.375230, 0.417175, -3.021518, 0.416763, -2.033230, 0.930528, -2.551760, 1.037599, -2.679307, 0.837334, -2.215552, 0.845857, 0.115845, -0.001104, 0.002331, 0.052869, 0.148813, 0.074932, 0.041035, -0.000889, 0.118238, 0.001358, -0.033412, 0.139926, -0.053124, 0.056390, -0.109655, 0.109933, 0.080593, 0.110846, -0.119858, 0.053169, -0.080911, -0.049860, 0.007670, -0.026955, -0.037026, -0.119150, -0.076077, -0.143314, 0.019125, -0.065526, 0.068714, 0.127706, -0.090154, 0.044473, 0.001712, 0.135863, -0.049706, 0.133666, 0.037814, -0.030698, -0.036682, -0.186004, -0.090987, 0.128647, 0.161187, 0.083986, -0.044240, -0.076231, 0.059475, 0.046094, -0.070666, -0.187282, -1.057124, 0.087356, 0.024922, 0.092749, 0.087168, 0.044193, 0.154731, 0.113009, 0.051067, 0.099487, -0.045580, -0.116878, 0.068274, -0.071759, 0.032805, -0.061836, 0.388977, -0.338489, 0.155739]
-,        [-0.185165, 0.343877, -0.233053, 0.190224, 0.224967, -0.022291, -0.561651, 0.476213, -0.289437, -0.159954, -0.256098, 0.151109, 0.636973, 0.569421, 0.131918, -0.975977, 1.149445, -0.110665, -0.266572, 0.662948, -0.248521, -0.607804, -0.979384, -0.229451, -0.831164, -0.486084, -0.427795, 0.388077, -0.550978, 0.152491, -0.355063, -0.604058, 0.415996, -0.336070, -0.621301, 0.813476, -0.421837, 0.220064, -0.864255, 0.249006, -0.515183, -1.398764, -2.070363, -2.365749, -0.937165, -0.635328, 0.045272, 0.469277, 0.448125, 0.344918, 0.489145, 0.644712, -0.156827, -0.478530, 0.184063, 0.322654, -0.452356, -0.490094, -0.521852, 0.190750, -0.435306, -0.108966, -0.076744, -0.166237, -0.608637, -0.962848, -1.148534, 0.609204, -0.837764, 0.177518, -0.739838, -0.410572, 0.280516, 0.437697, 0.664381, -0.315889, -0.319559, 0.513208, -0.084712, -0.195911, 0.012536, -0.194906, 0.273736, 0.075052, 0.559707, -0.071480, 0.491559, -0.312929, 0.322551, -0.575987, 0.306394, -0.957015, 0.279198, 0.472406, -0.246193, -0.996397, 0.005732, 0.520507, -0.427459, -0.201283, 0.435776, -0.077373, 0.271185, -0.931269, 0.349004, 0.202436, -0.277073, -0.752211, 0.340664, 0.285459, -0.161787, -0.650930, 0.452286, 0.527099, -0.361401, -0.325889, 0.517591, 0.168193, -0.194765, 0.105478, 0.444926, -0.043559, 0.267527, 0.076335, 0.303110, 0.360187, 0.403575, -0.730301, -5.237340, -2.752052, -1.164119, -0.564176, -0.217585, -0.269421, -0.245746, 0.086044, -0.058657, -0.436598, -2.487331, -0.529590]
-,        [0.227832, 0.289311, -0.215600, -0.137325, 0.709893, -0.438660, 0.161300, 0.670021, 0.035531, -0.495473, 0.085240, -0.512962, 0.320521, 0.696711, -0.271111, -0.218695, 0.156113, 0.192236, -0.233589, 0.251213, 0.313267, 0.715200, -0.332309, -0.349793, -0.122775, 0.257941, -0.444683, -0.224378, 0.860109, 0.104130, 0.017849, -0.345935, 0.491609, -0.269245, -0.648780, -0.267994, 0.182583, -0.002471, 0.050802, 0.114197, 0.122756, -0.471650, -0.493377, -0.076590, -0.273909, -0.356627, 0.204835, 0.318184, -0.086121, 0.112249, 0.182093, 0.674444, 0.407665, -0.106244, -0.066683, -0.068898, 0.240303, -0.173560, 0.509435, 0.063504, 0.706025, 1.274350, -0.594508, -0.325050, -0.307319, -0.038186, 0.127736, 0.025775, 0.365942, -0.183075, 0.420544, -1.010562, -0.529424, -0.860970, -0.566187, -0.269729, 0.322205, -1.118705, -0.205722, 0.388184, 0.290108, -0.727544, -0.959887, -0.299130, -0.225476, 0.100368, 0.008091, -0.318592, -0.040762, -0.239053, -0.588960, -0.196856, -0.131857, -1.050815, 0.214394, -0.129542, -0.893175, -0.041389, -0.322734, -0.270179, 0.391735, 0.072171, -0.162950, -0.784389, -0.029535, 0.242994, -0.126585, 0.026650, -1.480111, -0.268325, -0.101796, -0.545394, -0.817685, -0.329040, -0.455776, -0.045828, -0.085801, -0.254173, -0.361586, -0.712361, -0.111542, -0.064339, -0.045147, -0.567386, -0.261367, -1.096935, -0.283735, -0.344366, -0.171382, -0.204838, -0.227417, 0.525436, -0.287764, 0.019076, -0.115764, 0.105172, 0.429413, -0.019204, 0.015650, 0.035924]
-,        [0.392027, 0.014573, 0.591449, 0.211878, 0.616805, -0.204621, 0.515908, -0.085317, 0.503217, -0.166035, -0.136449, -0.253241, -0.155444, 0.416445, -0.402270, 0.338539, -0.220915, -0.039383, 0.974701, 0.355437, -1.024062, -0.586214, 0.522538, 0.706397, 0.299409, 0.143771, 0.712947, 0.362309, -0.025014, -0.050526, 0.981363, -0.238597, -0.076824, 0.057037, 0.302204, -1.377530, -0.520592, 0.729032, 0.216972, -0.352260, -0.090573, -0.086374, -0.388587, -0.081099, -0.400525, 0.011161, 0.682443, 1.518323, 0.444959, -0.167958, 0.009864, 0.959846, -0.163259, 0.035337, -0.932101, -0.712028, 0.120487, 0.602489, 0.143525, 0.667230, -0.594401, -0.230034, -0.644984, 0.571843, 0.045192, -0.153357, -0.032953, -0.348106, 0.055808, -0.497306, 0.405039, -0.785453, -0.550055, -0.338042, 0.825578, -0.012650, 0.314632, -0.156503, -0.197524, -0.065335, -0.889916, 0.351822, 0.201932, -0.438941, -0.190120, 0.102204, -0.351300, -0.823791, -0.551690, 0.451341, -0.117386, -0.251938, -0.083738, -0.502149, -0.719871, -0.294466, 0.031245, -0.312497, -0.305806, -0.777248, 0.211286, 0.027301, -0.261542, -0.752489, 0.329562, -0.427332, -0.526546, -0.509080, -0.029664, 0.626079, -0.348542, 0.114102, -0.117123, -0.099443, -0.101272, -0.267365, -0.320469, -0.031986, -0.118392, -0.176852, -0.548015, -0.249395, -0.061756, -0.730089, -1.202273, -0.432104, -0.488840, -0.147651, 0.291240, -1.446582, -0.662404, -0.860047, -0.345294, -0.284111, -0.578629, -0.070070, 0.100075, 0.020165, -5.276432, -0.298412]
-,        [0.335599, 0.596698, 0.540913, 0.568533, 0.640444, 0.371959, -0.297759, 0.473040, 0.503795, 0.552706, 0.398773, 0.636499, 0.347025, 0.829136, 1.277420, 1.202911, 0.899269, 0.394981, -2.445275, -2.793918, 0.638155, 0.684683, -2.237081, -2.442153, 1.052061, 0.566111, -2.142107, -2.744306, 0.718286, 0.516514, -1.757398, -2.401504, 0.908557, 0.468204, -2.558690, -2.747670, 0.525836, 0.835204, -2.001980, -2.846737, 0.740319, -6.164813, -3.234972, -6.183743, -5.145988, 1.037666, -1.804209, -2.399468, 0.811469, -0.053032, -2.742801, -3.384230, 0.428689, 0.703304, -1.952713, -2.374984, 0.865238, 0.155513, -2.915749, -4.060163, 0.037372, 0.503126, -2.173507, -3.643552, 0.580299, 0.358590, -2.322193, -2.578049, 0.589180, -0.186452, 0.288259, 0.091239, 0.087816, 0.055451, 0.063230, 0.022033, -0.227171, 0.001464, 0.060891, 0.062930, -0.090898, -0.204600, -0.054833, 0.037694, -0.003265, 0.025850, 0.080557, 0.014379, -0.085053, -0.056444, -0.013004, 0.080054, 0.037354, -0.238224, 0.104949, 0.059757, 0.046390, -0.228543, 0.159056, -0.053989, -0.002224, -0.093438, -0.111547, 0.062667, 0.046745, 0.006408, -0.028446, 0.129017, 0.017864, -0.214141, 0.131245, 0.187303, -0.118031, -0.069534, 0.037274, 0.044481, -0.049354, 0.033666, -0.013212, -0.002020, -0.149081, -1.054219, 0.077021, 0.122044, 0.085334, 0.030960, 0.067661, 0.066441, 0.149451, 0.187539, 0.172900, 0.066381, -0.022561, 0.010653, -0.204201, 0.032018, -0.063173, -0.252558, -1.365624, 0.029838]
-,        [1.259616, 0.345192, 0.435134, 0.204181, -0.134024, -0.221392, -0.734973, 0.431709, 0.181462, 0.989504, 0.068427, 0.606944, 0.567138, 2.063390, 0.215008, -1.089585, 1.076989, -0.149962, 0.204733, 0.212840, 0.014609, -0.069315, -0.639375, 0.637601, 0.633620, -0.435272, -0.360281, 0.013361, 0.036174, -0.043755, 0.525056, 0.826901, 0.526683, -0.182660, -1.157771, -0.292653, -0.435701, -0.627145, -0.826866, 0.237916, 0.047396, -0.634164, -3.670777, -7.189508, -2.241699, -1.847693, -0.752713, 0.304485, 0.257411, -0.739729, -0.191600, 0.276067, -0.042370, -0.470219, 0.050262, 0.716012, 0.413267, -0.091270, -0.888123, 0.196777, -0.795044, -1.272132, -1.235700, 0.285373, -0.383229, -0.431714, -1.122226, 0.074586, -0.672589, -0.066901, -0.436102, -0.540068, -0.024214, 0.183822, -0.435614, -0.369766, 0.165881, 0.731760, -0.235880, -0.313710, 0.207275, 0.438950, -0.380481, -0.018824, 0.480889, 0.467974, -0.549965, 0.306520, -0.135175, 0.472273, -0.388947, -0.074958, -0.304199, 0.442958, 0.206585, -0.486009, -0.066293, 0.386958, -0.343145, 0.182062, 0.016864, -0.092289, 0.264421, -0.377005, -0.461149, 0.267676, 0.249768, 0.257633, -0.104295, 0.377963, -0.281682, -0.239011, 0.158951, 0.084021, -0.095306, -0.111381, 0.410086, -0.035932, 0.212052, -0.053475, 0.288276, -0.797819, 0.422181, 0.237215, 0.049968, 0.207031, 0.449107, 0.012162, -0.090130, -0.059065, -0.204965, -0.091280, -0.125937, 0.100780, -0.191931, 0.062249, -0.388347, -1.250732, -5.881318, -0.336924]
-,        [-0.675816, -0.362010, 0.065066, -0.041863, 0.265642, 0.580256, -0.764680, -0.149121, -0.306020, -0.618522, 0.471829, -0.623201, -0.375482, -0.776721, -0.784715, 0.432743, 0.612653, -0.396498, -0.442559, -0.110088, -0.814824, -0.990170, 0.086180, -0.078269, -0.927785, -0.247782, -0.382831, -0.033201, -0.293591, 0.214587, -0.667832, -0.870018, -0.834409, 0.463372, 0.183989, -0.616499, -0.815419, -0.789533, 0.207671, -0.650897, -0.030364, 0.643490, 0.068883, 0.573942, -0.044248, 0.015089, -0.320674, -0.554499, -0.169985, -1.098532, -0.243943, -0.395526, -0.052041, -0.351033, -0.955073, 0.085239, -0.144761, -0.166621, 0.774704, -0.740989, -0.866804, 0.392519, 0.209276, -0.890556, -0.486067, 0.356587, -0.630157, -0.351235, 0.112232, -0.218186, 0.025785, 0.202657, -0.025487, -0.170841, -0.526754, -0.040783, -0.463338, -0.431940, -0.174802, 0.610508, -0.219908, -0.550736, 0.180557, 0.405148, -0.219271, -0.349956, 0.192446, -0.009230, 0.779862, -0.597041, -0.579815, 0.672705, -0.605271, -0.753516, -1.826413, 0.237617, 0.472188, 0.023767, -0.752280, 0.512741, 0.686476, -0.299157, -0.534491, -0.415471, 0.565669, -0.776265, 0.001532, 0.235585, -0.106519, -0.874198, -0.203798, -1.109108, 0.128447, -0.396214, 0.078106, 0.194141, -0.029562, 0.361129, -0.766108, 0.062292, 0.615221, -0.199320, 0.006556, -0.307665, -0.229174, 0.411943, -0.112372, -0.845672, -0.630656, -0.231966, -1.258131, -1.261317, -0.859247, -0.549001, -1.105674, -0.287675, -0.292976, -0.511116, -4.001730, -0.381866]
-,        [0.146265, -0.087118, -0.469650, 0.424379, -0.136358, 0.190121, -0.069702, 0.709217, 0.187875, 0.567238, 0.026826, 0.566890, -0.402483, -0.385181, 0.996978, -0.614320, -0.390571, 0.030845, 0.331448, 0.226823, -0.292458, -0.203614, 0.195939, -0.041175, 0.033238, 0.196025, 0.125971, 0.501414, -0.471063, -0.340793, 0.946256, -0.255066, 0.157767, -0.235876, 0.380197, 0.368599, 0.634510, -0.485062, 0.019218, 0.515776, -0.368639, -0.175012, -0.320537, -0.403271, -0.925710, 0.060103, 0.099629, 0.294698, -0.236451, 0.591661, -0.912631, 0.302710, -0.280947, -0.056544, -0.040262, -0.089850, 0.173539, -0.019684, 1.119659, -0.780530, -0.071084, 0.521418, 1.251042, -0.652041, -0.847548, -0.451004, 0.743357, -0.569465, -0.364101, 0.390594, -0.564756, 0.481033, 0.177587, -0.308641, 0.319270, -0.260347, -0.215781, 0.717641, 0.432331, 0.595181, -0.426980, -0.430796, -0.727824, 0.287776, 0.395487, -0.017237, -0.959711, -0.833932, -0.365525, -0.055239, -0.675582, 0.638678, 0.643295, 0.525802, -0.282303, -0.643113, -0.621617, 0.895058, -0.090682, 0.698699, 0.117231, 0.297567, -1.311929, 0.028374, 0.271437, 0.251296, -0.438223, 0.739261, 0.095525, -0.590377, -0.825602, -0.286957, -0.540586, 0.989098, -0.641814, 0.245020, -0.030161, -0.055904, -0.483603, 0.863613, 0.223792, -0.105311, -0.267482, -0.342497, 0.373747, 0.045401, -0.140565, -0.656453, 0.263609, -0.271682, -0.196815, 0.281016, -0.330961, -0.374669, -0.444473, 0.459866, 0.853412, -0.127356, -1.143578, 0.113336]
-,        [1.120321, 0.104612, -0.051837, 0.595081, 0.437940, -0.957850, -1.242777, 0.277917, 0.562668, -0.010719, -0.073986, 0.026507, 0.426135, -0.639030, 0.261500, -0.787395, 1.203927, -0.029173, 0.364033, 0.380163, 0.414959, 0.315959, 0.260293, -0.643801, 0.430130, -0.347868, -0.303406, 0.637899, 0.826112, -0.635080, 0.092251, 0.066995, -0.227147, 0.539050, -1.033296, -0.322536, 0.658185, 0.127619, 0.393773, -0.178239, 0.340873, 0.264401, 0.293113, 1.201658, 0.459624, 0.467014, 0.534830, 0.031849, -0.827602, 0.283096, -0.108081, -0.198762, -0.286836, 0.414869, 0.304897, -0.585710, 0.356133, 0.222226, -0.005876, 0.043616, 0.248572, 0.533638, 0.390665, -0.705508, 0.759085, 0.953263, 0.190924, -0.413207, -0.939458, 0.556904, 0.292037, -0.781658, 0.517514, 0.289712, -0.261998, 0.243287, -0.212048, -0.396039, -0.287485, 0.274322, -0.847864, 0.292832, -0.230912, 0.045841, -0.369959, 0.565056, 0.068137, -0.045474, -0.574328, 0.303597, -0.143247, -0.061747, -1.199381, -0.072545, -0.451415, 0.430366, -0.289484, 0.293975, 0.274976, -0.140861, 0.497257, 0.277803, 0.491411, 0.813771, -0.381618, -0.314286, -0.289798, 0.074202, -0.082472, -0.084129, 0.363386, 0.587028, -0.560834, 0.693389, 0.052539, 0.581824, -0.373185, 0.314240, -0.704944, 0.306477, 0.363739, -0.045681, -0.346136, 0.286099, -0.698087, -0.333465, 0.027042, -0.129926, -0.307145, -0.028380, 0.379194, 0.014426, 0.095279, 0.412677, 0.108144, -0.151269, 0.033520, -0.996212, 0.166073, 0.131883]
-,        [-0.319221, -0.594193, 0.214436, -0.166467, 0.217196, 0.357076, -0.044829, 0.372117, -0.436379, -0.654139, -0.527093, -0.945366, 0.155762, 0.800458, -0.816886, -0.190780, -0.855909, 0.112395, -0.603626, 0.043236, -0.653085, -0.574869, 0.376882, -0.229486, -0.319208, 0.720484, -0.660662, -0.511608, 0.073283, -0.128295, 0.778439, 0.054595, -0.044053, 0.482540, -0.318733, 0.889083, -1.292742, -1.656198, -0.206776, -0.781859, 0.058332, -0.295506, -0.596085, -1.876101, -1.107053, -0.909786, 0.153728, -0.484596, -0.724030, 1.239224, 0.045853, -0.858555, -0.994920, 0.038891, -0.134916, -0.044669, 0.221081, 0.429759, -0.360475, 0.334563, -0.733312, 0.574493, -0.981401, -0.122730, -1.154292, -0.135595, -0.126755, -0.391092, -0.172202, 0.468328, -0.237860, 0.508828, -0.151050, 0.119572, -0.111145, -0.744170, -1.311089, 0.438269, 0.058422, 0.072885, -0.826926, 0.493480, -0.745782, 0.398065, 0.076651, 0.252678, -0.733232, -0.462689, -0.956067, -0.444791, -1.185628, -0.082330, 0.197814, 0.587511, -0.912742, -0.646780, -0.509288, 0.688242, -0.778658, -0.315934, -0.350747, -0.621968, -0.348475, 0.323352, 0.219996, -0.329633, -0.977465, -0.618337, 0.143011, 0.419216, -0.942550, -0.470405, -0.125454, 0.599936, -0.252258, -0.252585, -0.815285, 0.689454, -0.700100, 0.091676, 0.095526, -0.270926, -0.342442, -0.079301, -0.114647, -0.349258, -0.296767, -0.385970, -0.276389, -0.861948, -0.155272, 0.055421, -0.230341, -0.866883, -1.189804, -1.220703, 0.423589, 0.059483, -4.494853, -0.293395]
-,        [-0.162940, -0.389490, 0.640939, -0.309208, 0.383295, -0.687126, 0.639548, 0.773901, -0.786581, -0.054484, -0.522918, -0.374907, 0.048701, -0.427533, -0.147190, -0.151180, 0.232945, 0.358200, 0.943519, 0.930923, 0.181380, -0.984969, -0.024365, -0.379544, 0.184424, 0.628468, 0.386828, -0.470508, -0.340375, -0.939988, -0.101060, 0.317725, -0.414684, 0.158989, -0.069785, -0.099008, 0.225728, 0.052373, -0.188044, -0.290656, -0.055449, -0.814806, -0.176643, 0.928390, -1.377964, -1.388270, 1.162566, 0.279921, 0.185327, -0.459609, -0.728259, 0.444777, -0.413332, -0.031582, -0.465177, 0.348616, -0.116780, -0.380389, -0.137399, 0.528340, -0.146935, -0.273274, -0.914025, 0.135626, -0.536220, -0.815408, -0.137762, 1.068791, 0.720587, 0.285643, 0.084652, -0.033218, -0.667279, 1.023886, 0.270260, 0.091056, -0.430437, 0.015957, 0.457574, 0.736268, 0.242348, 0.314288, -0.399021, -0.109170, -0.605853, 0.084003, -0.212003, -0.113242, -1.164653, 0.011449, 0.446210, 0.701705, -0.604554, 1.174299, 0.119862, -0.307976, -0.339840, -0.146001, 0.013948, 0.073108, -0.469648, -0.322838, -0.240147, 0.182558, -0.048221, 0.521460, -0.275412, -0.085662, -0.426105, 0.543759, -0.128327, -0.253755, -0.596109, -0.498630, 0.039572, -0.339160, -0.636967, 0.275162, 0.192565, 0.583001, -0.263995, -0.026188, 0.136017, 0.160196, -0.278575, -0.663249, -0.596723, -0.240117, -0.175308, -0.134114, -0.194551, 0.345681, -0.083999, -0.142686, 0.196064, -0.333622, -0.449685, 0.622504, -0.482575, -0.738370]
-,        [0.447890, -0.070258, 0.130009, 0.227891, -0.142403, -0.204757, 0.066210, -0.137001, -0.205861, -0.294886, 0.101599, -0.155781, 0.104300, -0.196215, -0.017472, -0.151147, -0.150238, 0.365243, 0.183569, -0.492893, -0.683501, 0.522334, -0.027681, 0.444727, -0.024573, -0.328421, 0.463765, 0.006560, -0.569724, 0.065701, 0.158099, -0.108323, 0.353590, 0.208604, 0.471118, 0.070990, 0.670706, 0.723244, -0.025428, -0.480681, 0.194033, -0.319407, 0.481754, -0.159709, -0.265368, 0.088505, -0.345517, -0.314338, -0.071687, 0.024394, -0.704787, 0.161078, 0.149789, 0.134200, 0.474750, -0.782070, -0.330822, 0.103276, -0.342259, 0.104549, -0.091426, 0.227985, 0.267746, -0.124718, 0.194971, 0.624602, 0.011970, 0.422881, 0.348028, -0.362036, -0.140929, -0.532736, -0.447954, -0.699365, 0.419602, 0.050408, -0.184056, -0.783040, -0.246525, -0.676889, -0.080052, -0.479605, 0.016623, -0.253497, -0.025305, 0.186407, 0.562153, 0.098215, 0.085328, -0.018272, 0.003097, -0.188161, 0.061211, -0.091406, 0.260642, -0.105822, 0.124034, -0.110724, -0.109736, 0.267737, 0.236891, -0.246254, 0.126590, -0.305446, -0.158149, -0.570344, -0.019562, 0.016192, 0.292058, 0.364114, 0.064892, 0.387893, -0.241430, -0.005206, 0.381611, -0.150025, 0.143405, 0.042659, -0.446770, -0.107486, -0.048626, -0.030804, 0.017620, -1.005084, -0.908046, -0.588221, -0.270561, -0.379100, -0.144581, -0.344587, 0.029809, -0.183622, 0.114878, -0.093830, 0.110725, -0.052923, -0.720837, -0.087346, -0.142938, -0.426220]
-,        [0.231573, -0.142943, 0.686970, 1.331910, -0.170100, -0.316529, -0.374799, 0.747956, 0.384890, 0.081372, 0.304613, 0.588801, 0.235572, 1.026871, 0.040627, -0.024361, 0.507829, -0.250954, -0.288578, 0.806945, 0.421764, 0.773587, -0.560441, 0.860095, -0.184447, 0.340145, 0.840775, -0.536525, -0.050754, -0.162041, 0.642985, -0.375449, 0.623697, 0.692719, 0.708295, 0.388439, 0.854308, 0.439375, 0.095927, 0.185947, 0.421197, 0.664324, 0.202428, 0.236061, 0.353958, 0.078579, -0.874769, 0.390233, 0.745786, 0.520935, 0.323041, 0.015048, 0.360646, -0.000871, 0.420240, 0.725919, 0.135376, 0.074882, 0.680806, 0.406108, 0.418759, -0.022090, 0.471488, 0.400226, 0.883625, -0.062566, 1.110793, 0.863743, -0.654780, 0.194520, -0.363700, 0.198146, -0.083777, -0.155670, 0.527614, 0.389922, -0.635765, -0.195228, 0.035381, -0.339134, 0.754240, -0.073334, 0.036858, 0.446920, 0.401160, 0.282287, -0.205536, -0.112206, 0.380380, -0.151332, 0.386730, 0.606770, 0.357911, -0.058251, 0.110204, 0.552928, -0.055455, 0.003523, 0.099699, 0.345119, -0.120580, -0.110215, -0.451453, 0.072687, -0.866451, 0.141831, 0.241060, -0.109433, -0.093158, -0.127632, -0.318277, 0.543716, -0.236051, 0.458574, -0.212830, -0.152954, -0.126255, 0.449434, -0.660618, 0.353711, 0.082320, -0.094449, -1.435808, 0.405685, -0.412542, 0.114528, -0.132950, -0.273008, -0.310885, -0.295666, 0.022051, -0.614255, -0.345994, 0.245327, -0.246411, 0.361472, -0.712357, -0.473668, 1.420865, 0.478132]
-,        [-0.536627, 0.244802, 0.117119, -0.406880, 0.425589, -0.336567, -0.862127, 0.759954, 0.534526, 0.006531, 0.241792, 0.864289, -0.385803, -0.541301, 0.191834, 0.099293, -0.308615, -0.173504, -0.535543, 0.313335, -0.372072, -0.692512, 0.024334, -0.630693, -0.038718, 0.178634, -0.287833, -0.590131, 0.458066, -0.138620, -0.385595, 0.576396, 0.572820, -0.135272, 0.171352, 0.566179, -0.000764, -0.488465, 0.211621, -0.111755, 0.914120, 0.417688, -0.043035, 0.227659, 0.299008, 0.085737, -0.094154, -0.388321, 0.077745, 0.810563, -0.294670, -0.455562, -0.072718, 0.460627, 0.291566, -0.385641, -0.243163, 0.109260, -0.195152, 0.035809, 0.441797, -0.550371, -0.109359, -0.319230, 0.626941, 0.082945, -0.443365, 0.357349, 0.420512, -0.395775, -0.465592, -0.209291, 0.467355, 0.477978, -0.153732, 1.134251, -0.279742, -0.821454, 0.333143, 0.085168, -0.220426, -0.796551, -1.052639, 0.564002, -0.678155, -0.785979, -0.686193, -0.667804, 0.069558, 0.084599, -1.163450, -0.062129, -0.623297, -0.333050, -0.461542, -0.027415, -0.319896, 0.661293, -0.094932, -0.758722, 0.006860, -0.755442, 0.344962, -0.385405, 0.158500, -0.305337, 0.385051, 0.553957, 0.370803, 0.441456, -0.101454, -0.547190, -0.455266, -0.074237, -1.013281, 0.522895, -0.202682, -1.056164, -0.619421, -0.169251, -0.093457, -0.123551, -0.106415, -0.347571, 0.207884, 0.103525, -0.249147, -0.164861, -0.310964, -0.458738, -0.754807, -0.398497, 0.336955, -0.124198, 0.416256, 0.052618, 0.322198, -0.495328, -1.299486, 0.164736]
-,        [-0.948659, 0.057659, 0.468049, 0.660675, -0.505288, 0.522781, -0.426860, -0.291079, 0.726360, -0.831573, 0.040873, -0.373497, 0.193884, -0.259531, -0.301255, 0.274465, -0.303902, 0.659314, 0.789485, 0.695243, 0.172316, -0.178799, 0.185816, -0.159964, -0.606810, 0.209399, -0.586518, 0.948382, -0.187569, 0.568327, 0.036380, -0.714387, -0.576567, -0.050448, 0.326817, -0.414771, 0.129848, 0.140087, -0.080677, -0.049978, -0.131197, -0.036672, 0.667319, -0.532235, -0.023222, 0.610353, 0.165977, 0.053669, -0.069229, -0.547415, 0.117224, 0.356348, 0.553913, 0.261655, 0.740739, 0.354171, 0.153239, 0.202169, 0.032286, 0.962546, 0.633121, 0.488160, 0.552314, 0.503122, -0.177538, 0.337885, -0.629662, 0.092600, 0.084646, 0.208244, -0.310076, -0.124882, -0.034101, -0.346251, 0.216964, 0.004918, 0.382473, 0.225704, 0.379408, -0.280392, 0.526822, -0.435317, 0.381358, 0.204630, 0.164635, 0.350561, 0.367383, 0.399073, -0.517483, -0.516330, -0.341753, -0.052768, 0.722750, -0.085315, 0.414779, -0.506944, 0.533643, -0.292594, 0.185414, 0.382449, 0.470160, -0.059722, -0.026136, 0.095944, 0.136179, -0.246617, -0.181882, -0.425883, 0.044284, 0.065403, 0.450383, -0.158402, 0.038451, -0.263588, 0.398849, -0.138167, 0.144770, -0.213445, 0.547391, 0.075225, 0.211532, 0.039887, -0.604799, -0.581855, -0.181385, -0.387512, -0.014267, 0.179080, 0.470979, 0.390051, 0.542886, 0.233492, -0.134484, -0.477947, -0.039683, -0.137598, -0.418449, -0.093238, 0.483518, -0.052891]
-,        [0.612676, -0.250837, -1.258192, 0.173355, -0.017045, -0.235687, -1.139024, -0.075842, -0.114370, -0.299858, 0.020356, -0.397089, -0.050076, 0.114348, 0.169983, 0.277462, -0.342003, 0.514786, -0.725638, -0.550982, 0.040096, 0.572923, -0.581563, 0.032455, -0.232684, -0.150335, -0.455234, -0.625907, -0.680944, -0.569625, -0.429996, 0.118393, -0.269263, -0.175763, -0.275116, -0.289914, -1.253439, -0.629589, 0.224624, -0.232711, 0.395453, -1.284907, -0.017416, -0.141251, -0.452538, -1.345870, 0.606488, 0.739858, -0.045493, -0.795075, 0.112591, 0.696711, 0.203247, 0.045679, -0.302622, 0.011573, -0.826429, -0.267566, -0.074888, -0.177410, 0.016798, 0.067096, 0.791277, -0.651342, -0.429186, -0.368851, -0.919570, -0.826473, -0.803940, 0.318818, -0.351348, -0.068267, 1.157650, -1.022553, -1.176181, -0.711734, -0.319565, -0.466079, -0.668799, 0.222191, 0.240148, -0.690000, -0.595543, -0.332643, 0.068594, -0.757262, -0.578382, -0.818587, -0.566357, -0.290934, -0.237093, -0.212071, 0.199219, -0.587593, 0.066381, -0.841995, -0.051607, -0.958247, -0.590055, 0.406845, -0.395412, -0.703510, -1.059615, -1.354754, -0.589267, -0.446936, -0.281903, -0.609187, -0.132526, 0.037913, -0.862140, 0.376687, 0.175492, -0.301017, -1.165361, -0.315149, -0.145389, 0.282276, -0.371454, -0.189354, -0.063973, 0.130651, -0.142695, 0.046255, -0.984289, -1.150762, -1.335200, -0.647874, -0.313926, -0.239199, -0.189504, 0.097198, -0.000240, 0.189441, -0.238374, -0.602599, 0.416454, -0.699403, -1.564252, -0.374725]
-,        [-0.121367, 0.196544, -0.125597, 1.083988, -0.026206, -0.358352, -0.112917, 0.967651, 0.303910, 0.585418, 0.526028, 0.328051, 0.089469, 1.010490, -0.923583, -1.134543, 0.338473, 0.399421, 0.332989, 0.450267, 0.767488, -0.219387, 0.512864, 0.107729, 0.591289, -0.374969, 0.786242, 0.463203, 0.917201, 0.539893, 0.251363, 0.828925, 0.331617, 0.124570, -0.160390, 0.269657, 0.754942, 0.042170, 0.151010, 1.149563, 0.144704, -0.202451, 0.354643, -0.157381, 0.376877, 0.524903, 0.475989, 0.382920, 0.457305, 0.149220, 1.014566, 1.086402, 0.045991, 0.684719, 0.156313, 0.731904, 0.053511, 0.011088, -0.590337, 0.618984, 0.297006, 0.207728, 0.586592, 0.980321, 0.514397, 0.733312, -0.027702, 0.806502, 0.904226, -0.461712, -0.097951, 0.496005, 0.251630, -0.053904, -0.265568, 0.197014, -0.106339, -0.660617, 0.425499, -0.225256, 0.439638, 0.057148, 0.262414, 0.413354, 0.035384, 0.144830, -0.341339, 0.049670, 0.353501, -0.378743, -0.261674, 0.636017, -0.035711, -0.166621, 0.163523, 0.094127, 0.389980, -0.779980, -0.111411, 0.133889, 0.188877, -0.226580, 0.322335, 0.235910, 0.164505, 0.180561, 0.332783, 0.369457, -0.247963, -0.621767, -0.141727, 0.452016, 0.135168, -0.956294, 0.657790, 0.562945, 0.076288, -0.427823, 0.344022, 0.516203, 0.290975, -0.390319, -0.717725, -0.645323, 0.294497, 0.464505, -0.392729, 0.061070, -0.154256, -0.748650, 0.067026, -0.390779, -0.003896, 0.008328, 0.174717, 0.097799, 0.289542, -0.266446, 1.102581, 0.066875]
-,        [-1.230832, -1.040122, 0.242505, -0.422917, 0.431478, -0.927375, -0.867345, 0.256515, 0.007687, -0.217864, -0.359566, -0.861513, 0.298442, -0.983849, 0.420030, -0.299794, 0.359710, -1.629816, -0.268918, -1.648814, -0.790316, 0.074712, -0.619126, -0.663827, -0.487942, -0.301695, -1.104555, -1.053784, 0.073739, -1.670465, -1.640949, -0.596714, 0.171392, -0.947276, 0.502230, -1.595131, 0.406325, -0.166519, -0.461603, -1.596400, -0.245247, -1.209702, -0.369396, -0.210569, -0.779881, -0.327966, -0.165905, -0.566072, 0.410297, -0.553350, 0.095456, -1.279445, 0.513418, -0.246292, -0.403607, -0.413833, -0.412836, -0.110221, -0.668384, 0.463506, 0.313161, 0.368000, 1.510353, -1.026220, 0.055136, -0.408868, -0.153766, 0.809417, -0.261664, -0.448146, 0.298897, -1.031800, -0.676216, -0.796945, -0.409954, -0.433285, -0.692385, -0.805651, -0.369281, -1.018588, -0.507350, -0.969238, 0.329222, -0.214555, -0.796094, -0.748120, 0.401241, -0.408147, -0.730038, -0.702114, -0.336889, -0.647122, -0.410332, -0.742460, 0.103388, -0.110666, -0.351905, -0.227166, -0.023827, -0.340541, -0.584750, -0.693772, 0.302046, 0.020350, -0.379072, -1.085586, 0.907441, -1.137904, -0.424785, -0.873481, 0.241290, -0.526260, -0.330255, 0.021343, -0.246736, -0.375683, -0.356299, -0.466171, 0.377460, -0.573927, -0.996375, 0.191766, -0.079021, -0.017503, 0.147269, 0.139092, -0.515836, -0.413742, -0.104507, -0.125242, -0.066503, 0.021526, -0.437490, -0.234139, -0.504740, -1.038852, -1.219054, -0.989438, -2.040231, -0.064840]
-,        [0.105138, 0.114826, -1.172125, -0.091266, -0.558020, -1.410031, 0.469626, 0.270500, -0.387846, -0.182671, 0.284110, -0.005558, 0.340728, -0.859553, 0.208036, -0.041069, 0.055240, -0.387834, 0.733633, 0.820191, 1.220164, -0.676063, -0.881202, 0.058180, -0.165468, -0.766300, 0.260008, -1.134553, -0.189504, -0.485496, -0.180971, -1.177239, 0.057813, 0.687150, 0.158536, 0.152683, 0.624233, -1.457033, -0.730381, -1.647888, -0.880914, -2.139654, -1.420678, -0.205006, -0.329667, -0.603496, -0.771429, 0.444558, -0.381847, -0.015652, -0.535167, -0.439322, 0.497780, 1.045236, -0.801837, 0.464758, -0.215966, -1.801250, -0.320253, -0.068250, -0.071632, -1.059742, 0.136573, -1.596243, -0.873277, 0.310323, -0.420746, -0.187172, -0.889317, 0.009943, -0.546299, 0.012565, 0.161333, -0.539830, -0.260419, 0.000948, 0.445266, -0.590113, -1.114774, -0.896677, 0.068572, -0.736158, -0.419901, -0.217688, -0.595782, 0.139586, -0.226714, -0.052001, -0.713338, -0.291703, -0.532171, 0.441627, -0.294516, -0.226671, -0.186175, 0.582901, -0.856612, -0.832580, -0.159282, 0.559413, -1.170991, -0.317341, -0.417745, -0.685103, 0.078054, -0.182130, -0.573695, -0.364780, -0.984536, -0.117024, -1.033545, 0.171746, -1.058510, -1.142835, -0.112558, -0.787680, 0.041268, -0.475334, -0.075389, 0.222854, -0.545431, -0.360776, -0.243976, -0.578519, -0.247696, -0.355926, -0.529471, -0.359810, -0.246037, -0.100977, -0.292131, -0.143948, -0.115794, 0.041485, -0.064195, 0.007269, -0.244953, 0.723391, 0.165477, -0.347504]
-,        [-0.010386, -0.066320, -0.245615, -0.099704, -0.072653, 0.065917, -0.323597, 0.229952, -0.033041, -0.331902, -0.334696, -0.135612, 0.089873, 0.033642, -0.587378, -0.184495, 0.064442, -0.066380, -0.367234, -0.072365, -0.400780, 0.148423, -0.085915, -0.280846, 0.009753, -0.257918, -0.001453, 0.017719, -0.235334, -0.079644, 0.321342, 0.430873, -0.098654, -0.143172, 0.445402, -0.032389, -0.105087, -0.153404, -0.004377, -0.113246, -0.345755, -0.303743, -0.642656, -0.392927, -0.210361, -0.251944, 0.142047, -0.395603, -0.412300, -0.049107, -0.150350, -0.149114, -0.135405, -0.062500, -0.257064, -0.053266, 0.042052, -0.084213, -0.166403, 0.062085, -0.420428, 0.093232, -0.213910, -0.227675, -0.084125, -0.265821, -0.271918, -0.013173, 0.001854, -0.077501, -0.105388, 0.083857, -0.009030, -0.094167, -0.261925, -0.123183, 0.031349, 0.133433, -0.115412, -0.045008, 0.048231, 0.114191, -0.192629, 0.006395, -0.152733, -0.200029, 0.129807, -0.123479, -0.094185, -0.364460, -0.093375, 0.075352, -0.212308, -0.168089, -0.135854, 0.192208, 0.245998, -0.244565, 0.158999, -0.189370, 0.079279, -0.197958, 0.005561, -0.192681, -0.144542, 0.202438, 0.014958, -0.000672, 0.014978, -0.149369, 0.040735, -0.125253, -0.146189, 0.030864, -0.183284, -0.197090, -0.088349, -0.110391, -0.239841, 0.000356, 0.083757, -0.340726, -0.356253, -0.188216, 0.023251, -0.038833, -0.210204, -0.447332, -0.145342, -0.239840, -0.226830, -0.062182, 0.053997, 0.052634, -0.107887, 0.064000, -0.082200, -0.375364, -0.501934, -0.325481]
-,        [-0.300828, -0.633046, -0.339191, -0.199125, -0.005649, -0.460252, 0.608615, -0.045358, 0.129193, -0.013744, -0.107922, 0.400331, -0.818900, 0.115883, -0.321272, -0.162217, 0.421290, -0.122085, 0.121119, 0.699334, -0.320350, -0.098864, -0.630642, 0.095225, -0.005204, -0.906352, -0.724481, -0.368114, -0.625027, -0.165635, -0.771677, -0.566115, -0.375715, -0.315996, -0.616439, 0.166209, -0.005946, -0.080181, 0.195957, -0.247622, -0.450800, -3.041322, -1.307811, -2.305261, -2.469103, -0.238553, -0.644518, 0.239092, -0.280928, -0.591641, -0.536767, -0.343325, -0.367457, 0.101936, -0.711414, -0.213259, -0.182168, -0.124150, -0.062992, -0.442652, -0.065306, 0.558531, 0.919273, 0.546466, -0.256315, 0.325155, 0.624118, 0.196782, -0.308269, 0.177532, 0.431365, -0.285794, -0.177722, 0.225292, -0.613632, -0.101185, 0.316386, -0.308969, 0.012435, 0.253526, -0.481085, 0.120228, 0.038466, 0.128871, 0.109597, 0.018301, -0.312075, 0.289979, 0.317933, 0.576478, -0.084409, 0.099047, 0.358860, -0.552820, -0.195237, -0.542464, -0.089762, -0.319468, 0.219069, 0.262030, -0.088832, 0.086744, 0.303444, -0.178896, 0.459283, -0.041084, -0.247543, -0.333320, 0.250442, -0.030429, -0.217085, -0.084531, 0.325470, -0.093761, -0.017182, 0.085852, -0.376576, 0.220376, 0.300926, 0.044871, -0.158799, 0.060823, 0.211163, 0.151027, 0.569984, 0.387794, -4.110965, -5.178005, -2.523882, -1.349667, -0.744444, -0.553097, -0.210029, -0.313801, -0.095640, -0.085099, -0.084580, 0.535033, -0.919754, -1.446198]
-,        [0.253172, -0.199395, 0.258491, 0.392663, -0.251865, 0.339204, -0.711352, 0.597460, 0.800771, 0.551720, -0.742673, -0.444130, 0.715202, -0.934756, -0.693680, -0.075801, 1.463512, 0.386327, 0.286819, -0.434515, 0.520914, -0.280644, 0.385613, 0.530301, -0.072687, 0.002681, 1.416811, 0.870180, -0.320782, 0.304533, -0.038524, -0.094183, 0.089031, 1.056376, -0.686271, -0.052207, 0.340009, 0.823485, 0.538046, -0.051457, 0.392395, 1.072036, 0.094798, 0.707923, 0.113076, 0.481704, 0.547856, 0.467583, 0.337963, 0.141879, 0.079488, 0.325159, -0.089633, 0.226221, 0.424011, -0.059103, 0.122919, 0.389439, 0.060001, 0.504467, 0.156067, -0.747984, 0.402195, 0.209832, -0.116474, 0.615488, 0.900642, 0.371146, 0.128559, -0.243671, 0.274417, -0.572053, -1.131719, -0.688661, -0.348868, 0.314066, -1.107011, 0.018057, 0.407223, -0.060607, -0.100123, -0.178517, -0.220758, 0.141162, -0.021501, 0.282016, 0.374557, -0.228304, -1.370025, -0.592032, 0.082692, 0.634041, -1.089690, 0.336599, 0.184415, -0.328095, -1.143037, -0.514558, -0.356880, 0.587435, -0.196139, 0.450011, 0.038536, -0.052541, -0.796818, 0.506745, 0.520164, -0.171221, -0.843599, 1.011672, 0.092221, 0.181874, -0.320221, 0.329206, -0.050402, -0.131221, -1.045926, 0.076605, 0.153326, 0.403128, -0.726025, -0.066028, -0.376415, -0.219755, -0.398422, -0.395685, -0.053460, -0.178719, 0.010277, -0.599871, -0.429596, -0.453089, -0.013124, 0.416953, 0.111769, -0.229973, 0.409458, -0.461331, -0.656283, 0.552059]
-,        [0.503363, 0.608964, -0.590327, -1.239895, -0.430550, -0.078389, 1.539080, -0.394702, -0.393462, -0.286480, -0.619200, -0.559214, 0.498135, 1.519705, -0.057923, -0.993421, -1.258987, 0.044227, -0.407463, 1.330383, -0.566276, 0.448895, 0.034452, 0.520154, 0.281676, 0.327928, -0.265145, -0.247618, -1.094166, 0.359344, 0.629579, -0.040379, -0.484521, 0.932822, 0.307820, -0.122480, 0.070321, 1.007466, 0.014346, 0.012452, -0.255750, -1.429863, 0.010198, 1.393313, 0.613058, -0.412423, 0.147140, 0.625258, 0.550127, 0.716902, 0.007347, 0.707818, 0.166654, -0.162315, 0.456527, -0.051025, -0.319570, 0.124362, 0.419263, -0.941867, -0.138058, 0.846310, -0.318426, -0.607514, 0.355983, 0.717532, 0.305346, 0.518447, 0.278427, 0.355713, 0.938174, 0.094135, -1.035040, 0.276854, -0.065966, 0.163273, -0.285861, 0.370011, -0.218239, 0.188960, 0.014692, 0.138347, 0.160285, 0.209473, -0.713856, 0.624601, 0.186140, -0.068023, -0.271461, 0.149402, 0.022101, -0.124361, -0.275375, 0.024451, 0.135211, 0.329463, -0.447667, 0.058662, -0.127567, -0.843198, -0.541913, 0.284182, -0.904307, 0.334178, -0.265690, 0.118440, -0.324051, -0.560783, 0.045815, 0.249356, 0.216665, -0.798859, -0.170636, 0.086109, 0.298456, -0.952765, -0.704292, 0.267061, -0.311326, -0.624586, -0.491133, 0.318778, -0.102063, -0.164530, 0.116426, 0.184485, 0.166367, 0.196157, 0.035107, 0.491822, 0.440916, 0.479199, 0.442478, 0.358321, 0.352769, 0.278190, -0.044647, 1.962947, -2.717206, 0.104081]
-,        [-0.304302, -0.256316, -0.999438, 0.176521, 0.385980, -0.298386, 0.809138, -0.381731, -0.077982, -0.660712, 0.105094, 0.484839, 1.151630, -0.067050, 0.242341, -0.080032, -0.693755, -0.225849, 0.543656, 0.307479, 0.076561, 0.048790, -0.149134, 0.137333, 0.696099, 0.061283, 0.511592, -0.165998, 0.204511, 0.479606, -0.662751, 1.465960, -0.208944, -0.345462, 0.433596, 0.321835, -0.285494, -0.503645, -0.265500, 0.434505, 0.407117, -0.188286, -0.195540, 0.472988, 0.188076, -0.130170, -0.223892, 0.460700, -0.095127, 0.752022, 0.407264, -0.093343, -0.077374, 0.188566, 1.093966, -0.054435, 0.245050, 0.584264, 0.097260, -0.150827, -0.683918, 0.086819, -0.024153, 0.637450, 0.308982, 0.365499, -0.560383, 0.364295, 0.794388, 0.319252, -0.050246, 0.271063, -0.378163, -0.114819, 0.451904, 0.221362, 0.741133, -0.241746, -0.539901, 0.231803, -1.114176, 0.122252, -0.105890, -0.435577, 0.555498, -0.014320, 0.593475, -0.049152, -0.603903, -0.272777, 0.072638, 0.183878, 0.532650, -0.161245, 0.181367, -0.427655, 0.107442, -0.032496, -0.202876, -0.323329, 0.137574, 0.073510, 0.137464, -0.025995, 0.067930, -0.325439, -0.085579, -0.108184, 0.514904, -0.124758, 0.605901, -0.476776, 0.840483, -0.843502, -0.685119, -0.882907, -0.654233, 0.146778, 0.597085, -0.327029, -0.198190, -0.064288, -0.217457, -0.338829, -0.362223, 0.082294, 0.418404, -0.103233, 0.266099, -0.481058, 0.090848, -0.022166, 0.305377, -0.031122, -0.065808, -0.367675, 0.010303, 0.956986, -1.447202, -0.113355]
-,        [-0.550582, -0.092588, 0.408798, 0.429661, -0.026848, 0.337458, 1.358039, -0.074647, 0.111048, 0.969525, 0.363535, 0.822807, 0.387911, 0.482825, 1.009104, 1.084839, -1.061055, -1.526519, -1.488551, -1.090908, -6.477592, -0.862726, -0.241435, -0.450373, -6.404679, 0.585200, 0.026875, 0.513814, -4.426308, 0.277905, 0.428931, -0.065525, -5.681930, -0.176559, 0.816396, 0.274267, -5.130718, 0.575181, 0.715840, 0.924495, -2.040405, -1.919946, -0.386394, -0.806177, -6.669785, 0.412392, -0.001517, 0.299126, -6.034499, 0.186497, 0.007729, -0.305742, -5.916633, 0.463518, 0.519334, 0.940603, -2.437921, -0.145674, 0.289941, 0.595532, -5.707115, -0.010306, -0.031586, -0.360923, -6.150892, 0.480972, 0.479021, 0.325319, -5.610494, -0.177154, 0.012605, -0.031362, 0.279895, 0.094551, -0.186342, 0.066284, 0.220325, -0.344992, -0.106582, 0.208916, 0.188143, -0.116263, -0.187374, 0.123432, 0.234092, 0.015409, 0.176215, -0.132688, 0.283579, 0.018095, -0.242318, 0.020276, 0.212343, 0.084341, 0.117334, 0.153439, 0.033180, 0.145950, -0.095082, -0.147241, -0.013453, -0.029918, 0.019809, -0.369262, 0.041830, -0.420593, -0.073751, 0.065118, -0.073248, 0.150410, -0.216138, -0.005327, 0.051446, -0.108383, -0.121061, 0.057000, -0.019065, -0.083516, 0.241615, 0.110400, 0.115122, -0.543607, 0.237637, 0.056155, -0.044852, -0.092531, 0.020194, 0.064244, 0.080420, 0.210845, 0.036458, 0.359955, 0.013447, 0.228891, 0.189532, -0.072112, -0.040982, 0.253522, 0.728333, -0.423325]
-,        [0.029259, 0.574643, 0.608410, 0.603080, 0.021458, -0.508343, -1.204664, 0.970615, -0.519274, -0.468380, 0.401805, 0.674520, -0.297219, 0.658849, 1.155780, -0.647105, -0.166079, -1.849329, -1.239334, 0.131908, -0.869466, -2.497272, -1.206434, 0.310570, -0.175122, -1.317669, 0.050032, 1.276926, -0.739147, -0.111926, 0.112167, 0.889166, 0.033636, -0.729940, -0.830856, 0.611284, -1.788621, -1.442449, -1.095599, 0.274894, -0.532681, -1.780686, -1.102731, -1.569264, -2.530366, -0.910101, -0.297041, 0.631232, -0.599408, -1.560265, -1.370874, 0.241102, 0.567729, -1.257831, -0.590284, 0.985238, -0.396090, -1.970559, 1.031211, 1.279078, -0.425926, -1.572632, -0.836024, 0.253530, 0.145995, -0.487943, -1.978422, -0.370028, -0.836792, 0.375312, -0.529259, -0.361555, 0.363687, 0.492023, 0.201882, -0.435740, -0.220025, 0.020868, 0.390896, -0.177798, -0.234847, 0.071385, -0.407733, -0.448675, 0.127323, 0.250056, 0.229696, 0.862079, -0.056776, 0.201790, -0.089031, -0.305125, 0.359400, 0.202156, 0.007241, 0.068686, -0.297768, -0.004266, -0.248778, -0.755885, -0.205598, 0.224398, 0.196599, -0.021371, 0.240354, 0.386417, -0.420053, -0.528004, 0.019895, 0.473002, -0.067785, -0.714682, -0.003317, 0.484860, -0.158564, 0.071657, 0.070268, -0.409136, 0.361994, -1.053626, 0.148154, -0.169053, 0.103148, -0.113408, 0.250696, 0.140699, 0.399397, 0.058137, 0.196944, -0.269028, -2.001228, -1.556453, -0.742692, -0.862506, -0.519084, -0.235394, -0.312794, -0.899808, -1.635887, -0.435880]
-,        [1.016987, 0.789476, 0.591444, 0.822402, 0.852411, 0.779749, 1.134572, 0.832295, 0.934028, 1.153708, 0.964129, 0.787287, 0.724268, 1.077838, 1.266512, 0.976622, 1.212482, 0.704925, 0.890630, 0.731683, 0.488538, 0.882592, 0.846587, 0.725255, 0.714515, 0.566919, 0.816956, 0.509598, 0.362740, 0.961671, 0.724953, 0.314009, 0.355068, 0.498674, 0.406162, 0.525788, 0.454567, 0.386387, 0.410320, 1.192280, 0.593563, 0.406409, 0.975449, 0.712265, 0.116645, 0.572322, 0.926129, 0.630766, 0.312097, 0.585199, 0.579057, 0.853549, 0.492808, 0.640931, 0.302782, 0.828861, 0.311958, 0.948659, 0.502462, 0.739675, 0.412398, 0.486780, 0.642234, 0.955004, 0.525947, 0.751940, 0.336065, 0.797173, 0.350262, 0.094267, -0.019331, 0.086768, -0.197507, -0.072173, 0.020813, -0.194479, 0.095135, -0.109803, -0.163572, -0.052004, 0.346275, 0.031139, -0.225184, 0.102400, 0.027159, 0.004084, 0.073722, 0.030969, 0.098740, 0.136564, -0.199698, 0.187688, -0.214997, -0.161424, -0.457189, -0.169406, -0.193947, 0.090230, -0.092054, 0.008981, 0.225154, 0.083537, -0.077930, 0.135223, -0.249743, -0.153423, -0.124209, -0.047717, 0.228758, -0.023775, 0.096353, 0.097238, 0.142015, 0.046264, 0.098440, -0.320683, 0.092598, 0.292066, 0.139306, -0.308511, 0.127723, -0.302640, 0.556142, -10.553928, -1.901991, -0.564377, -0.341160, -0.078599, -0.306012, -0.210566, -0.022733, -0.005727, -0.137258, -0.094303, -0.076382, -0.000411, 0.322208, 0.906634, -0.258280, 1.026451]
-,        [0.473746, 0.046825, 0.160045, -0.144064, 0.398239, -0.037274, -0.790625, 0.465043, -1.030129, 1.150525, 0.859717, 0.031813, 0.327270, -0.378268, -0.061205, 0.743620, 0.930896, -0.333815, -0.225055, -0.019287, 0.999095, -0.078709, -0.420359, 0.277655, -0.045903, -0.400757, -0.362266, -0.231521, -0.038130, -0.730522, -0.789167, -1.635643, 0.185566, -0.226346, 0.036765, -0.940365, -0.127215, -0.784012, -0.727261, -0.780672, -0.093410, -2.515896, -2.432790, -2.439840, 0.150447, -0.644340, -0.322068, 0.142440, -0.172856, 0.433684, -0.595372, -1.105998, 0.204179, 0.698817, 0.047767, -1.122282, 0.065877, 0.566287, 0.371690, 0.463744, -0.194505, -0.095287, -0.288464, -0.033600, 0.270976, -1.560852, 0.563242, -0.168572, -0.889388, -0.222799, -0.336520, -0.054802, -0.153713, -0.578122, -0.833754, -0.269463, -0.621651, 0.030650, -0.244661, 0.015423, 0.168658, 0.043512, -0.268926, 0.083035, 0.377768, -0.670082, -0.191192, 0.893347, 0.347932, -0.207653, -0.210800, 0.221197, -0.817237, -0.542279, 0.151509, -0.405279, -0.378488, -0.176869, -0.109436, 0.375607, -0.097094, -0.330843, -0.299322, -0.170288, -0.124841, -0.353317, -0.463301, -0.407899, -0.430540, -0.020754, -0.661898, -0.324213, -0.274723, -0.613401, -0.453006, -0.344211, -0.558678, -1.098734, -0.417257, -0.064261, -0.309333, -0.392240, 0.133746, 0.139543, 0.249707, 0.442774, 0.466401, 0.053345, -0.021565, -0.144527, -0.228786, -0.189083, -0.521413, -0.596629, -0.788478, -0.523991, 0.380939, -0.857068, -4.201898, 0.036785]
-,        [-0.245116, 1.106751, 0.348810, -0.226713, 0.197114, 0.982333, -1.598545, -0.220964, 0.162872, 0.473499, 0.663029, -0.378918, 0.428616, 1.451357, -0.800401, -1.063527, -0.974646, 0.118375, 0.056875, 0.276592, 0.350879, 0.715759, -0.464493, 0.736299, -0.226749, 0.890105, 0.849502, 0.290910, -0.490613, 0.078470, 0.166678, -0.162657, 0.327437, 0.186477, 0.331681, 0.439108, 0.503448, 0.534236, 0.049338, 0.103006, 0.367307, -0.567252, 0.015776, -0.212432, 0.237554, -0.052420, 0.352831, 0.335846, 0.102362, 0.032055, -0.249872, 0.486030, -0.088893, 0.483103, -0.310218, 0.296726, -0.141502, 0.706075, 0.649426, 0.090619, 0.075234, -0.281803, 0.684145, -0.126759, 0.551872, 0.131034, 0.004979, 1.506208, -0.234629, -1.694327, 0.254985, -0.178245, -0.186017, -1.182953, 0.494971, 0.800750, 0.589286, -1.096263, 0.490809, 0.613578, -0.103371, -1.086590, 0.139656, -0.373018, 0.021342, -1.049685, 0.246227, -0.347583, -0.253979, -1.064786, 0.145136, 0.015106, 0.145024, -0.759597, 0.027027, 0.148015, 0.323661, -1.173549, 0.509197, 0.283282, 0.433364, -0.569510, -0.256631, 0.599188, 0.282366, -0.344347, -0.148180, 0.011610, -0.156558, -0.576726, 0.178898, 0.245284, 0.138924, -1.460356, 0.514851, 0.220854, 0.319197, -0.678148, -0.402223, -0.064247, 0.408862, -0.385770, -0.267867, -0.235182, -0.316821, -0.198087, 0.339702, 0.181072, -0.205466, 0.446588, -0.024899, -0.153124, -0.073206, 0.511252, -0.287392, 0.595555, 0.419922, -1.561796, 0.037261, 0.415653]
-,        [-0.281156, 0.135955, 0.740404, -1.060263, -0.475040, 0.277476, -0.284374, 0.437341, -0.417162, -0.427967, 0.815030, 0.261943, -0.512814, -0.383044, -0.061332, 0.132955, 0.648072, 0.588529, -0.676022, -1.076357, -0.237196, 0.624693, -0.374304, 0.687230, 0.421876, -0.589722, 0.450980, 0.903560, -0.494977, -0.220886, -0.670628, -0.578647, 0.373619, 0.660907, 0.750698, 0.011170, 0.329415, -0.212001, -0.260678, 0.160065, 0.727716, -0.959561, -0.460635, 0.133373, 0.971623, -0.480991, -0.366760, -0.162471, -0.781995, -0.815666, -0.078014, 0.090300, 0.867946, -0.677304, -0.060553, -0.072076, -0.023076, 0.388199, 0.167901, 1.231539, 0.729414, -0.617950, -0.232981, -1.076626, -0.732407, -1.034736, -0.490227, 0.111582, -0.356852, -0.455282, 0.138267, -0.656070, -0.322121, -1.208752, -0.534499, 0.037533, -0.834514, -0.056536, -0.260190, 0.173656, -0.450050, -1.119681, -0.101200, -0.423107, -1.107499, -0.510668, -0.011034, -0.765387, -0.335905, -0.116838, -0.680745, -0.550747, -0.295245, 0.045786, -0.467880, -0.218193, -0.629660, -0.873354, 0.130655, 0.401535, 0.560370, 0.027409, 0.461894, 0.003339, -0.546754, -0.628606, -1.185858, -1.037542, 0.809319, -0.429106, -0.911619, -0.126646, -0.739815, -0.181675, -0.505501, 0.329382, 0.361778, -1.149387, -0.414753, -0.211850, -0.609008, 0.006256, 0.064621, -0.064614, 0.213995, -0.634528, -0.688338, -0.840474, -0.755257, -0.603130, -0.048009, 0.055553, -0.792782, -0.279725, -0.879136, -0.365609, 0.614409, 0.041241, 0.072650, 0.383073]
-,        [0.469381, 0.764651, 0.458133, 0.634325, 0.650891, 0.427617, -0.003575, 0.443966, 0.386469, 0.938018, 0.427787, 0.527784, 0.320384, 0.224236, 0.300502, 0.469037, -0.092956, 0.261130, 0.668550, 0.447538, 0.828134, 0.339456, 0.279326, 0.875987, 0.471815, 0.424152, 0.482777, 0.677949, 0.603745, 0.077683, 1.158722, 0.545867, -0.948689, 0.329076, -0.093189, 0.330660, 0.444326, 0.857165, -0.207218, 0.962310, 0.763656, 0.945966, 0.706530, 1.049666, 0.133264, -0.311112, -0.613563, -0.208834, 0.465379, 1.119622, -0.109499, 0.109745, -0.358695, 0.876251, 0.741288, 0.672017, 0.168508, 0.840973, 0.198336, 0.865625, 0.055022, 0.392841, 0.779543, 0.378579, 1.038035, 0.100248, 1.055582, 0.561417, 0.388305, -0.190235, -0.839929, -0.114012, -0.981343, -0.282425, -0.589348, 0.234435, -0.288099, 0.438176, -0.224386, 0.016030, -0.173126, -0.796885, 0.032136, -0.654859, -0.586469, -0.571581, 0.074255, -0.568303, -0.002632, 0.284342, 0.068709, 0.077167, 0.153948, 0.236687, 0.222128, -0.021627, 0.201596, -0.009484, -0.404691, 0.481889, -0.278678, 0.220343, -0.740344, -0.181658, -0.328854, 0.309785, -0.813822, -0.188872, -0.139335, -0.129854, -0.303356, 0.329101, -0.464110, 0.723876, 0.445173, -0.057740, 0.039316, -0.223680, 0.067709, 0.172155, -0.672299, -0.685097, -0.123836, -3.133412, -1.317155, -0.630190, -0.176157, -0.529511, -0.171244, -0.419266, 0.005809, -0.153052, 0.063270, -0.075313, -0.046621, -0.220074, 0.244818, -0.388121, 0.424569, -0.228085]
-,        [0.395125, -0.238459, 0.214121, 0.687335, 0.360823, 0.041857, 0.509485, 0.347272, -0.626395, 0.736323, -0.140888, 0.183138, 0.476834, -0.052921, 0.417740, -0.398908, 0.181240, 0.647541, 0.646189, -0.601834, 0.627621, 0.462803, -0.069135, 0.538511, 0.993609, 0.422649, 0.965631, -0.026038, 1.077855, 1.016826, 0.576333, 0.374104, -0.283739, 0.492563, 0.270049, 0.088435, 0.647735, 0.758199, 0.420761, 0.488312, 0.614889, -0.494516, 0.111291, 1.040421, 0.350242, 1.243725, 0.316024, 0.632861, 0.585973, 0.632089, 0.199508, 0.906349, 0.465940, -0.526286, 0.418201, 0.350185, 1.479042, -0.430292, 0.500162, 0.742604, 0.829472, 0.664753, 0.059545, 0.333194, 0.991821, 0.742056, 1.058099, 1.328875, 0.804365, -0.365194, 0.962766, -0.029433, -0.245685, 0.083552, 0.249341, -0.241300, -0.240493, -0.768925, 0.077893, 0.442089, 0.144942, -0.325039, -0.503808, 0.148236, -0.878193, -0.311956, 0.577910, -0.149533, -0.548534, -0.172939, 0.866747, 0.156368, -0.195980, 0.180657, 0.227179, 0.518178, -0.527513, 0.627896, 0.342075, 0.338951, 0.142442, -0.230807, 0.021765, 0.074614, 0.445197, -0.223035, -0.492226, 0.189490, -0.012800, 0.657758, 0.057686, -0.212759, -0.584424, -0.380508, 0.193805, 0.723318, 0.055802, 0.560095, 0.164949, 0.086621, 0.412721, -0.404351, -0.505489, 0.095368, -0.872993, -0.553131, 0.193855, 0.297485, 0.119761, -0.231779, 0.261640, -0.232878, 0.288348, -0.060271, 0.156386, 0.047648, -0.285858, 0.255223, -0.682318, -0.405715]
-,        [-0.644923, -0.033455, 0.278593, -0.478468, 0.462945, 0.806980, -1.203117, 0.076183, -0.509238, 0.311738, 0.131903, -0.594589, 0.407324, -0.153318, 0.332440, 0.311779, -1.002902, -0.058862, -0.781681, 0.168182, -0.414168, 0.021904, -0.585391, -0.724890, -0.784612, 0.294150, -0.925530, 0.961486, 0.316422, 0.415033, 0.258984, -1.122977, -0.343862, -0.343339, 0.284273, 0.692787, 0.247857, -0.781043, 0.556956, 0.213475, 0.018140, -1.260522, -0.248622, -1.309507, -0.008077, 0.473283, -1.285422, -0.754278, 0.068727, -0.834977, -0.420475, -0.578987, -0.309108, 0.086768, -0.328609, -1.187422, -0.152767, 0.257179, 0.483987, 0.236759, 0.469625, 0.124447, -0.565992, -0.551800, -0.415767, 0.582221, 0.097032, -0.945561, -0.772963, -0.416328, 0.144766, -0.200700, 0.671071, 0.140157, 0.233260, 0.048941, -0.153425, -0.249884, -0.462013, -0.510355, 0.486710, -0.108504, -0.281781, 0.587292, 0.187950, -0.798208, 0.330694, 0.149119, -0.296677, 0.473565, 0.108123, 0.607361, 0.567056, -0.428338, -0.567680, 0.569947, 0.074077, -1.305668, 0.954673, 1.310925, -0.065100, -0.212509, 0.415211, 0.210558, 0.744434, -0.345431, -0.098682, 0.686143, -0.124526, -1.037314, 0.550858, 0.734047, 0.295149, -0.091128, 0.922833, 1.414394, 0.182570, -0.375690, 0.639054, 0.288452, 0.087944, -0.219640, -0.063344, -0.276387, 0.135644, -0.155921, -0.237907, -0.290920, 0.106742, -0.340684, 0.047598, -0.410913, -0.319577, 0.432513, -0.447071, -0.291628, 0.038819, -1.456238, -3.452294, 0.011961]
-,        [0.028517, 0.875549, -0.172043, -0.487787, -0.327300, 0.125024, -0.300200, -0.046967, -0.274902, -0.164624, -0.431482, 0.897238, 0.298263, 0.418907, -0.402964, 0.098432, -0.520994, 0.539268, -0.071645, -0.499389, -0.006275, -0.418121, -0.181740, -0.132127, -0.199422, 0.027599, -0.656480, 0.935179, 0.759628, -0.582148, -0.723427, -0.744120, 0.438577, 0.260585, 0.054341, -0.089705, 0.948270, -0.822908, 0.554905, 0.332886, 0.231979, -1.173042, 0.210150, -0.682197, 0.042421, -0.562415, -0.649233, -0.038213, 0.261058, 0.229748, 0.212732, 0.120985, -0.380205, -0.068198, 0.628219, 0.987762, 0.236002, -0.446006, -0.600711, 0.693698, -0.692228, -0.026163, -0.255568, 0.466618, -0.541266, -0.896392, -0.109592, 0.619951, 0.073593, -0.250336, 0.161007, -1.211777, 0.002491, 0.504537, 0.120042, -1.097178, 0.046104, -0.001080, -0.218868, -0.514971, 0.148063, -0.204532, -0.397651, -0.678398, 0.372281, 0.179724, 0.551375, -0.522937, -0.213832, 0.422739, -0.160231, 0.047900, -0.815347, 0.361830, 0.370499, -0.268371, 0.590701, 0.089351, -0.000178, -1.054508, 0.210211, -0.049492, -0.087140, -0.873572, 0.068826, -0.092025, -0.325927, -0.710775, 0.051388, 0.106856, -0.027138, -0.519000, 0.258167, 0.166737, 0.517975, -0.601254, 0.859631, 0.136112, -0.092787, -0.281352, 0.639515, 0.143811, 0.135255, -0.613071, -0.596865, -0.433903, -0.541282, -0.068663, 0.100601, 0.219129, -0.117028, 0.169898, -0.171389, 0.166838, 0.287680, 0.570213, -0.067757, -0.475644, -1.289367, -0.212631]
-,        [0.560768, -0.585069, 1.042926, 0.057537, 0.627237, 0.194825, -0.287044, 0.722415, -0.167280, -0.037770, 0.174418, 0.609175, 0.391087, 0.587009, 0.110066, -0.334550, 0.569910, -0.358837, 0.737910, 0.071077, 0.206235, 0.143878, 0.476567, -0.282090, 0.614096, 0.349363, 0.587743, 0.674777, 0.200894, -0.617709, 0.461428, 0.156419, -0.182532, 0.007321, -0.063056, -0.108603, 0.793667, 0.414736, 0.757998, -0.086708, 0.925777, -0.168462, -1.781710, 0.439519, -0.131724, 0.375885, 0.619932, 0.148379, 0.267822, 0.986832, 0.043785, 0.744929, 0.671494, -0.118888, 1.429926, 0.246268, 0.287830, 0.255871, -0.065822, -0.108781, 1.022730, 0.746766, 0.153532, 0.112043, -0.882609, -0.050653, 0.472294, 0.109241, 0.364206, 0.423955, 0.483368, 1.119593, -0.708650, 0.159786, -0.041684, 0.271110, 0.103443, -0.457635, -1.031734, -0.159631, -0.135587, 0.496120, -0.045600, -0.243442, -0.193556, -0.320918, -0.399691, 0.455536, -0.277769, -0.336726, 0.729309, 0.170706, 0.647460, 0.354510, 0.315861, -0.031118, -0.454304, 0.088275, -0.366887, 0.408100, 0.613196, -0.496303, -0.146356, 0.503909, -0.427720, 0.009621, 0.255084, 0.277140, 0.436705, 0.778549, -0.523131, 0.397722, 0.278915, 0.382990, 0.035231, 0.498793, 0.086479, -0.165617, 0.548695, 0.308482, 0.019761, 0.237392, -0.516000, -0.470458, -1.467786, -1.054560, -0.436500, -0.227279, 0.161736, -0.339047, 0.070711, 0.009106, -0.347907, -0.032608, -0.037500, 0.101517, 0.293898, -0.395804, 0.295920, 0.004051]
-,        [-0.378480, 0.159326, -0.394697, 0.593908, -1.076020, 0.373801, 0.055303, -0.778307, 0.427014, -0.116935, 0.153489, -0.516943, -0.168908, -0.994293, -0.159309, 0.115861, 0.150673, 0.398913, -0.292643, 0.263119, 0.353148, 0.980065, -0.086694, -0.659411, 0.175940, -0.619001, 1.072955, -0.492727, 0.339200, -0.216247, -0.409413, -0.760706, 0.600458, 0.121962, -0.079712, 0.650804, 0.145669, -0.312917, 0.692104, -0.552540, -0.183076, -0.065009, -0.310146, -0.174850, 0.269051, 0.089899, -0.184085, -0.612779, -0.484708, -0.461584, 0.178556, -0.291102, -0.256502, 0.129727, 0.276962, -0.267562, 0.145320, -0.270771, 0.107431, -0.201688, 0.616675, 0.889144, -0.534702, 0.294793, 0.074280, -0.356944, 0.523210, 0.248656, 0.068260, 0.373569, -0.007254, 0.140805, 0.550142, 0.083624, -0.290685, -0.063711, 0.026031, 0.416888, -0.443066, -0.361746, 0.294119, 0.443817, -0.166236, 0.181912, -0.535740, -0.347731, 0.432762, -0.071677, 0.042297, -0.018334, -0.458734, -0.448549, -0.854647, -0.062092, -0.453930, -0.460309, 0.011334, 0.000198, 0.005805, -0.385903, -0.361262, -0.112769, -0.297477, -0.472202, -0.707489, 0.311137, -0.293376, 0.056850, -0.100247, -0.104283, -0.537229, -0.207729, -0.541450, -0.537749, -0.152109, 0.445635, -0.409736, -0.072078, -0.229801, -0.144437, 0.585195, 0.119563, -0.533055, -0.132234, -0.676448, -0.585662, -0.545307, -0.483140, -0.094545, -0.448002, -0.320183, -0.349005, -0.130777, 0.207066, 0.199186, -0.168748, -0.216779, 0.091693, -0.404063, -0.698506]
-,        [-0.124133, 0.572335, 0.709752, -0.194983, 0.167559, -0.686337, 0.722063, 0.213804, 0.225715, 0.908123, 0.871158, 0.094036, 0.216317, 0.079398, 0.911678, -0.167731, 0.534496, -0.146503, -0.385842, -0.607224, -0.312544, -0.332718, -0.178265, 0.602828, -0.024301, 0.615198, 0.687926, 0.444334, -0.555399, 0.165367, 0.053346, 0.001926, 0.528633, -0.329375, 0.826010, 0.718799, -0.176295, 0.019529, 0.556856, -0.135703, 0.302764, 0.337626, 0.490161, -0.278800, -0.500179, 0.127124, 0.216930, 0.064443, 0.410887, 0.253899, 0.117781, -0.540205, 0.875576, 0.432590, 0.031105, -0.260786, 0.066847, 1.013398, 1.471073, 0.363973, -0.077030, 1.088262, 0.178584, 0.296716, 0.425447, 0.827321, 0.734876, 0.602014, -0.695694, -0.008835, -0.322690, -0.442857, 0.304972, -0.267238, -0.220741, 0.192562, -0.393771, -0.330668, -0.466298, 0.659661, 0.140986, -0.477057, -0.519298, 0.229672, -0.046485, -1.036785, -0.393624, 0.455563, 0.505577, 0.564810, -0.163743, -0.105756, 0.226666, 0.109880, -0.527346, -0.144676, -0.481564, 0.037842, -0.391656, 0.431086, 0.777290, -0.280546, 0.070846, -0.470834, -0.659193, -0.067331, -0.369676, -0.173159, 0.148964, -0.341896, -0.201597, 0.374409, 0.054203, -0.635671, 0.151469, 0.196072, 0.250679, -0.144782, -0.879868, -0.331361, 0.080283, -0.245819, -0.685321, -0.651617, -0.315832, -0.254154, 0.089121, 0.490602, 0.213651, 0.535617, -0.238056, -0.507406, 0.305755, 0.277152, 0.120582, 0.234725, 0.847777, 0.697906, -0.656072, 0.191486]
-,        [-0.496113, -0.586747, 0.077235, -0.728332, -0.376225, -0.258997, 0.492277, -0.254680, 0.456661, -1.020999, 0.789594, -0.409946, 1.266068, -0.812135, 0.779959, -0.257657, -0.068034, -0.789798, -0.488742, 0.063867, -0.817370, -1.478209, -0.960213, -0.360242, -0.359372, -0.052047, 0.492399, 0.414286, 0.295478, -1.234015, 0.050451, -0.804135, -0.945604, -0.969065, -0.781403, -0.439274, -1.169503, -0.738661, -0.320948, 0.246951, -0.918940, -0.506393, 0.677154, -0.594088, -1.793671, -0.658806, 0.877752, 0.171749, -0.094211, 0.248463, 0.667756, 0.531485, -0.263423, -0.933107, 0.270454, -0.475114, 0.278355, -0.278597, 0.132671, -0.005335, 0.057796, -0.742131, -0.982074, -0.327653, -0.889854, -0.426612, -0.562805, 0.470094, -0.296859, -0.377261, -0.175563, -0.219645, 0.579839, -0.356921, 0.254289, -0.080463, 0.593571, 0.052044, -0.551019, -0.625171, -0.752569, -0.601178, 0.062377, -0.640629, -0.957807, -0.335104, -0.046275, -0.602369, -0.507849, -0.512213, -0.459167, -1.040238, 0.383414, -0.547792, -0.271039, -0.430230, -0.215119, -0.179787, -0.628648, -0.065073, -0.100351, 0.025401, -0.336201, -0.646640, -1.351962, -0.978479, -0.528569, -0.535694, -0.124203, -0.633569, 0.226907, -1.552707, 0.368725, -0.780015, 0.295031, -0.270690, 0.211352, -0.217927, -0.942260, -0.922310, -0.196191, -0.110246, 0.315357, 0.025463, -0.069287, -0.397442, -0.668077, -0.473634, -0.328182, -0.154774, -0.313014, -0.536879, -0.079340, 0.031325, 0.143818, -0.261115, 0.551350, 0.737983, -1.194307, 0.069566]
-,        [-0.036434, -0.030016, 0.021028, -0.010993, 0.037242, 0.049737, -0.119653, 0.131949, -0.078873, -0.145109, 0.141936, 0.080976, -0.146163, -0.033211, 0.047470, 0.074644, 0.071057, -0.394050, -0.125489, 0.233562, -0.053800, -0.046553, -0.088920, 0.008083, 0.156813, -0.274670, -0.080376, 0.312888, 0.073279, -0.136133, 0.045045, 0.177347, 0.020161, -0.293525, -0.028622, 0.095789, -0.154147, -0.251646, -0.178050, 0.224917, -0.045710, -0.114673, -0.440109, -0.150236, -0.267676, -0.298154, -0.147636, 0.069509, 0.036496, -0.366316, -0.453885, -0.080941, -0.018829, -0.212968, -0.176521, 0.153243, -0.027978, -0.341697, -0.124627, 0.320965, 0.194229, -0.087538, -0.014567, 0.046595, -0.073313, -0.161668, -0.346589, -0.198330, 0.233347, 0.001693, -0.140718, -0.239791, 0.012221, 0.108463, -0.059575, -0.192996, -0.163687, -0.109686, -0.005121, -0.112583, 0.100503, -0.000711, -0.028705, 0.096475, -0.139961, -0.126862, -0.304401, 0.086641, -0.159875, -0.003594, -0.004334, -0.221591, -0.021428, -0.029065, 0.102320, 0.021556, -0.274770, -0.087033, -0.113692, -0.281265, -0.138485, 0.047812, -0.038156, 0.076099, -0.053377, -0.133266, -0.104822, -0.198902, -0.278886, -0.027837, -0.191183, -0.029519, -0.079191, -0.088877, -0.107684, 0.108067, -0.059466, 0.022499, -0.129707, 0.061664, -0.141163, -0.257627, -0.216255, -0.067177, -0.113365, -0.034459, -0.060813, -0.157985, -0.091104, -0.062622, -0.228580, -0.026553, 0.038259, -0.072388, 0.015734, -0.129296, -0.178311, -0.246877, -0.220145, -0.331466]
-,        [0.277880, -0.405699, 0.285721, 0.150573, 0.723346, -0.178831, -0.345080, 0.103699, 0.464047, 0.391521, 0.264900, 0.248761, 0.939851, -0.801318, 1.471200, 0.168907, -0.710000, 0.519780, 0.325849, 0.306670, 0.371617, 0.385167, 0.519722, -0.214301, 0.077435, 0.521751, 0.904358, 0.870623, 0.558671, 0.683082, 0.602831, 0.760085, 0.196333, 0.559177, -0.087334, 0.594820, 0.579683, 0.196370, 0.904738, 0.458481, -0.106779, 0.605733, 0.450279, 0.492509, 0.206989, 0.817427, 0.364457, 0.034086, 0.240048, 0.392574, 0.584869, 0.340040, 0.781495, 0.194720, -0.125122, 0.951486, 0.294733, 0.389121, 0.705620, 0.221916, -0.030654, 0.192050, -0.136157, 0.334497, 0.575121, -0.302065, 0.873244, 0.899848, 0.416073, 0.513661, -0.592846, 0.857511, 0.024383, 0.448390, -0.527549, -0.066111, 0.136455, 0.555871, -0.407880, -0.582029, 0.129953, 0.110593, -0.221129, 0.179881, 0.836967, -0.394401, -0.422516, -0.065113, -0.072181, 0.204953, -0.625464, -0.296177, -0.157707, 0.096870, -0.272155, 0.109862, 0.474377, -0.018945, -0.376449, -0.013339, 0.315813, 0.253003, -0.752058, 0.180367, 0.770925, 0.126598, -0.205585, 0.048609, 0.220978, -0.178755, -0.773374, -0.337331, 0.123941, -0.121792, -0.403816, 0.576278, 0.314447, 1.310296, -0.299258, 0.286032, 0.984225, -0.165551, -0.208605, -0.390015, -0.094943, -0.409232, -0.109305, -0.143916, 0.482184, -0.346799, -0.429014, -0.413090, 0.019197, -0.434638, -0.396976, 0.120483, 0.592646, -0.389042, -0.405507, -0.403079]
-,        [-0.284546, -0.504243, -0.274061, -0.110930, 0.454748, -0.359176, -0.822351, -0.046977, -0.127106, -0.499123, -0.416727, -0.302003, 0.306691, -0.312461, -1.079274, -0.440929, 0.106683, -0.469395, -0.960823, -0.762956, -0.051248, -0.010236, 0.016928, 0.309137, -0.025460, 0.729475, -1.052731, 0.150603, 0.430321, 0.214716, -0.756244, -0.056344, -0.221348, 0.380939, -0.745472, -0.585575, -0.086588, -0.514192, -0.165924, -0.340672, -0.177792, -1.168101, -0.212394, -0.766612, -0.348694, 0.056533, -0.181158, 0.088921, 0.243772, -0.391096, -0.404869, -1.004581, -0.355886, 0.363742, -0.785777, -0.185217, 0.090748, -0.255510, -0.528676, 0.104173, -0.375522, -0.763847, -0.675981, -0.826694, 0.553030, -0.476773, 0.295935, -0.217050, 0.179643, -0.583434, -0.402298, 0.284211, 0.275438, -0.547279, 0.096952, -0.718468, -0.768839, -0.001263, -0.111156, -0.674103, -0.105914, 0.042511, -0.893713, -0.499859, 0.365633, -0.856315, -0.142469, -0.476165, -0.077479, 0.336751, 0.448888, -0.512977, 0.239803, -0.192047, -0.577071, 0.161504, 0.464915, -0.598684, 0.022438, -0.284622, 0.277815, -0.240701, -0.122872, 0.092023, -0.459588, -0.518490, 0.290163, -0.538503, 0.160155, -0.845000, -0.165434, -0.005075, -0.130544, -0.301118, 0.375664, 0.095620, -0.287620, -0.030274, 0.144627, -0.673400, -0.298100, -0.335144, -0.567359, -0.229189, -0.372293, -0.105876, -0.096052, -0.263287, -0.669031, -0.845850, -0.747562, -0.597714, -0.391431, -0.247153, -0.236286, -0.242554, -0.282172, -0.743214, -0.148249, -0.626375]
-,        [0.008599, 0.399760, -0.268615, -0.363194, 0.783943, -0.741414, 0.508366, -0.032685, -0.515302, -0.182034, 0.584244, -0.374545, -0.117216, -0.010483, 0.052444, -0.607329, -0.152637, -0.089835, -0.074850, 0.219232, 0.258686, -0.459669, -0.013436, 0.118626, -0.342751, 0.165008, 0.810765, -0.711785, -0.496508, -0.695012, -0.027656, 0.000309, 0.093718, -0.086696, 0.517539, -0.124560, 0.435673, -0.212753, -0.429422, -0.081275, 0.129241, -0.435780, -0.718019, 0.138637, 0.376362, 0.481470, 0.065657, -0.163651, 0.365776, 0.021988, 0.186008, -0.130856, -0.211732, -0.358817, -0.115545, -0.124032, -0.130065, 0.025972, 0.522122, -0.479666, 0.423581, 0.045617, -0.530537, -0.107446, -0.133714, 0.134154, 0.174397, 0.246771, -0.006691, 0.064243, 0.436533, -0.330333, 0.054414, -0.691185, -0.189689, 0.392186, -0.224849, -0.302615, -0.916847, -0.283555, -0.646172, -0.214558, 0.637416, -0.224270, -0.206971, -0.548392, -0.125901, -0.343325, -0.577513, -0.592362, -0.982570, -0.653396, 0.220856, 0.395769, -0.189306, -0.044449, 0.044269, 0.252584, -0.315104, -0.535497, -0.270946, -0.208970, 0.112978, -0.122752, -0.060467, -0.530066, -0.739928, 0.166345, -0.117071, -0.509935, -0.301329, -0.303017, -0.586502, -0.213450, 0.342292, -0.555840, -0.837172, 0.267277, -0.028615, -0.368926, -0.190913, -0.280543, -0.859468, -0.456086, -0.732074, 0.093906, -0.044109, 0.017612, -0.119683, 0.351723, 0.356471, -0.351656, -0.081885, 0.199326, -0.009370, -0.294386, 0.042459, 0.669614, 0.028126, -0.209496]
-,        [0.079819, 0.090626, 0.495957, 0.347671, -0.836004, -0.171473, -2.057135, -0.370410, 0.952121, 0.731614, -0.186785, -0.594905, 0.126121, -0.768966, 0.616779, 0.852050, -1.145659, -0.727145, -0.121986, -1.210227, -0.219901, -0.214729, -0.574268, 0.350101, -0.052926, -0.497617, -0.299044, -0.464182, 0.493184, 0.279863, -0.473119, 0.998299, 0.902939, -0.192305, -0.085271, -0.331699, 0.046562, 0.550810, -0.355774, -0.747144, 0.174251, -1.042094, 0.318171, 0.360532, -1.257316, 0.356743, -0.699978, 0.442012, 0.508533, 0.491495, -0.975535, -0.028691, 0.062393, 0.121278, -0.695058, -0.268753, 0.832558, -0.369259, 0.103183, -0.387292, 0.461241, -0.746083, -0.410732, -0.883698, 0.558206, -0.223874, -0.200144, -0.258201, -0.120343, -0.664113, -0.000366, -0.317593, -0.823568, -0.684496, -0.722208, 0.644588, -0.851586, -0.412848, 0.099823, -0.496872, -0.879319, -1.082560, -0.198529, -0.046911, -0.161751, 0.005848, 0.420209, 0.246071, -0.999235, -0.142491, -0.337548, 0.187092, -0.874415, -0.269594, 0.857060, 0.241001, -1.115324, -0.592944, -0.392389, -0.198873, -1.272051, 0.103693, 0.600093, 0.032378, 0.127123, -0.320147, 0.765756, 0.022473, -0.887456, -0.671157, -0.410120, -0.093830, -0.391364, -0.790520, 0.826647, -0.543656, -0.746250, -0.698215, 0.054185, -0.254196, -0.543178, -0.197115, 0.058685, 0.171501, 0.099349, 0.102770, 0.001981, 0.017442, -0.037408, -0.357780, -0.495351, -0.157082, -0.693345, -0.128631, -0.409980, -0.073296, -0.111992, -1.919615, -1.984570, -0.206566]
-,        [0.413129, -0.221653, -0.137287, 0.547146, 0.052480, -0.018375, 0.159131, 1.078537, 0.745256, 0.294198, 0.400725, 0.012674, 0.503146, -1.291916, -0.254075, -0.865733, 1.648947, 0.685032, 0.857436, 0.263252, 0.518539, 0.594977, 1.487273, -0.578414, 0.312647, 0.969609, -0.018318, -0.125683, 0.450929, 0.618714, -0.012929, -0.208326, 0.435409, 0.783703, 0.420095, -0.648107, 0.212741, 0.419467, -0.655854, 0.924056, 0.386097, 0.379937, -0.273647, 0.603910, 0.262143, 0.566136, 0.378759, 0.770380, 0.227119, 0.401784, -0.913366, -0.104939, 0.587596, 0.179771, -0.390582, 0.072163, 0.408661, -0.538757, 0.395508, 0.507071, 0.300687, 0.084484, 0.364175, -0.201907, 0.509731, 0.208267, -0.122695, -0.118263, 0.313685, -0.157930, 0.063314, 0.155644, -0.663709, -0.269098, -0.332477, 0.209033, -0.346110, 0.414019, 0.141483, 0.025598, -1.111682, 0.626723, 0.304288, 0.519147, -0.582727, 0.376741, -0.379280, -0.112204, -0.704292, 0.721825, -0.525523, -0.095983, -0.739635, -0.025911, -0.088275, -0.041404, -0.241635, 0.352425, -0.046773, 0.057479, -0.491334, -0.059778, -0.092257, 0.025165, -0.438571, 0.746055, -0.164155, 0.157335, -0.617998, 0.410923, -0.153316, 0.071195, -1.048257, 0.191625, 0.218502, 0.554469, -1.194451, 0.178620, -0.096325, -0.208979, -0.705377, -0.203766, -0.256365, -0.293214, -0.118920, 0.230038, 0.116266, 0.311096, 0.074174, 0.024538, -0.271146, 0.368617, 0.043529, 0.392768, 0.148382, 0.186878, -0.334091, 0.558178, -1.024049, 0.343903]
-,        [0.576171, 0.131884, -0.220728, -0.101849, 0.137428, 0.224246, 0.288940, 0.121117, 0.726114, 0.723872, 0.629642, 0.356439, 0.491877, -0.184784, 0.316413, -0.200576, 0.259281, 0.682319, 0.145532, 0.297352, 1.011338, -0.251521, 0.085780, 0.409892, 0.451603, 0.846681, 0.016285, 1.150165, 0.349529, 0.355367, 0.815623, -0.006620, 0.448159, 1.112691, 1.006909, 0.430082, 0.483652, 0.328049, 0.588655, 0.595067, 0.769392, 0.829246, 0.283447, -0.524478, 0.119791, 0.730564, 0.828904, 0.559306, -0.058486, 0.163873, 0.535826, 0.571356, 0.677521, 0.093678, 0.930092, 0.424222, -0.188372, 0.602691, 0.471302, 0.710964, 0.184617, 0.160822, 0.791867, 0.347608, 0.957384, 0.468578, 0.184668, 0.450909, 0.622015, 0.435514, 0.032686, -0.704675, 0.591891, 0.204348, -0.078207, -0.139961, 0.277604, -0.278750, 0.425991, 0.288079, 0.131749, -0.433450, -0.117477, 0.055429, -0.141531, 0.354869, -0.506281, 0.233342, 0.179221, -0.013342, -0.034448, 0.077170, 0.320523, 0.234697, -0.386859, 0.236575, -0.086188, -0.091321, -0.182518, 0.143271, 0.036094, -0.376042, -0.052137, 0.208422, -0.132471, 0.192173, -0.024694, 0.265039, -0.582158, 0.166141, 0.196063, -0.175763, 0.225673, 0.031959, -0.331587, 0.263761, 0.395741, -0.093145, -0.327313, -0.079251, 0.320521, -0.455350, 0.020652, -1.223632, 0.990103, -0.583647, -0.134709, 0.121336, 0.052302, -0.107514, -0.075083, -0.180639, -0.074200, 0.623186, -0.183703, -0.100192, -0.160254, 0.767919, -0.093521, -0.001869]
-,        [0.839536, -0.398960, -0.270878, 0.126477, -0.894128, 0.036505, -0.209807, 0.904507, 0.012037, 0.049921, -0.937538, -0.049472, -0.678060, -0.388558, -0.064133, 0.314764, -1.076161, 0.725421, 0.637478, 0.153713, 0.266581, -0.197272, 0.459578, -0.125900, 0.645915, 0.138427, -0.361219, -0.331330, -0.490559, 0.006143, 0.624498, -0.208734, -0.577283, -0.471086, 0.162826, -0.039164, -0.276210, 0.657575, 0.277605, -0.054504, -0.583599, -1.286945, 0.274109, -0.197924, -0.148777, 0.803186, 0.191598, -0.403489, -0.023362, -0.168191, -0.242961, 0.659055, -0.185388, -0.624895, -0.341321, -0.043572, -0.741587, -1.085708, -0.841656, 0.809240, 0.529797, -0.357352, -0.213308, 0.067062, -0.660503, -0.832077, 0.380405, -0.573602, 0.416160, -0.384231, -0.028994, -0.413379, -0.527627, 0.538269, 0.055316, 0.214596, -0.279899, -0.681938, -0.492854, -0.095712, -0.244822, -0.404557, 0.248244, 0.474874, -0.341439, -0.376749, -0.522519, -0.029865, -0.442328, -0.614058, -0.224126, -0.113766, -0.214549, -0.139244, -0.026863, -0.721919, -0.151429, 0.122145, -1.310090, -0.221219, -0.528917, -0.120037, -0.145189, 0.572776, -0.031466, 0.048446, 0.766337, -0.020235, -0.338217, -0.662512, 0.235015, -0.202687, -0.271060, 0.144590, -0.212265, -0.381457, 0.097274, -0.676269, -0.368082, -0.152864, 0.134630, 0.161134, -0.340773, 0.036254, -0.376149, -1.070150, -0.689798, -0.675600, -0.652005, -0.763073, -0.628936, -0.147296, -0.083670, 0.187147, 0.075530, 0.496623, 0.062057, -0.016151, -1.351498, -0.244424]
-,        [0.195749, -1.214938, 0.551812, 0.037912, 0.649070, -0.931244, 0.329661, 0.035813, 0.938564, -0.718083, -0.264449, 0.482559, -0.446106, 0.758401, -0.454720, -0.357499, -0.284606, 0.805980, -0.965022, 0.402604, -0.394913, -0.138290, -0.775697, -0.605502, 0.201182, 0.724319, -0.578700, 0.051503, 0.666248, -0.183279, 0.093379, -0.172958, 0.004104, 1.232363, 1.083297, -0.173437, 0.323056, 0.777809, -0.015093, -0.035228, -0.178266, 0.988347, -0.286355, -0.440571, -0.053733, 0.649075, -0.677305, -0.637786, 1.476780, -0.133538, 0.758692, -0.604580, 0.666197, -0.437369, -0.202816, -0.228228, 0.585087, -0.760427, -0.812931, -1.061903, 0.123699, 0.107888, 0.218458, 0.869228, -0.683349, -0.120161, -0.401510, -0.755949, -0.367954, -0.243985, -0.141647, -0.168935, 0.108243, -0.096004, -0.083128, -0.249073, -0.210081, -0.857351, -0.444307, -0.323230, -0.197945, -0.205337, 0.502299, 0.396918, 0.247647, 0.072954, -0.051169, -0.008865, 0.629316, 0.009763, 0.161214, -0.036471, 0.306463, -0.190773, -0.674153, -0.175605, -0.213333, -0.861195, -0.870497, 0.021743, -0.559093, -0.445580, -0.499894, 0.037694, 0.512431, -1.361270, 0.180192, -0.535759, 0.277713, -0.081076, -0.022125, -0.043349, -0.596209, -0.884354, 0.573074, 0.127961, -0.045862, -0.148603, 0.508499, 0.594464, 0.217782, 0.071529, 0.258804, -0.012081, -0.609343, -0.426267, -0.224126, 0.074703, -0.118008, -0.723986, 0.004210, -0.286920, 0.015418, 0.504160, -0.284781, -0.184803, -0.015743, -0.333012, 0.050975, 0.006409]
-,        [0.453723, -0.336162, -0.642352, 0.229768, -0.022449, -0.570556, 0.756657, 0.307758, -0.026409, -0.543258, -0.994825, -0.364446, -0.581997, 0.122739, -0.867922, 0.098727, -0.121294, 0.231231, 0.248078, -0.071129, -0.065104, -0.917346, 0.192928, 0.085958, 0.663869, 0.802379, 0.702516, -0.297192, -0.125298, -0.899029, -0.838587, 0.099988, -0.085997, -0.466386, 0.000637, 0.266663, -1.342707, -1.284905, -0.593090, -0.439482, -0.409564, 0.249671, -1.591006, 0.024734, -0.161450, 0.226579, 0.191699, 0.018318, -0.104683, -0.355535, -1.045017, -0.496666, -0.678292, -0.033839, -0.573143, -0.960655, 0.000068, -0.465075, 1.457710, -0.824894, -0.707944, -0.131255, -0.573873, -0.011372, -0.798287, -1.687977, -0.264575, -0.233351, 0.115064, 0.209519, -1.254360, -1.238806, 0.168186, 0.711008, -0.484030, -0.262494, -0.029443, -0.876501, -0.798893, 0.438229, 0.029344, 0.188100, -1.545679, 0.145472, -0.020274, 0.436293, 0.068623, 0.067158, -0.071975, 0.294554, -0.234171, 0.096954, 0.042444, 0.327085, -1.137222, 0.443546, 0.010306, 0.321467, -0.838070, 0.308251, 0.125808, -0.202978, -0.357427, -0.455574, -1.032663, 0.142127, 0.588422, 0.665343, 0.062840, 0.030946, -0.387735, -0.404893, -0.266294, 0.227956, -0.763691, 0.479278, -0.070336, 0.319557, -0.219514, -0.090482, -0.343050, -0.374585, 0.162155, -0.075278, -0.234055, -0.099130, -0.411421, -0.339812, 0.024639, -0.416071, 0.050984, -1.334934, -0.719648, -1.785005, -1.261148, -0.571782, -0.058618, 0.161480, -1.163227, -0.512856]
-,        [0.837057, 0.401916, 0.785999, -0.261171, -1.430645, 0.220535, 0.353529, -1.270554, 0.603707, 0.409532, 0.138574, 0.521689, -0.224741, 0.800695, 1.176859, -0.092977, -0.683348, 0.079867, -0.011142, 0.111432, -0.254457, 1.450590, 0.700841, 0.375710, 1.096411, -0.310026, -0.842125, 0.027345, 0.771983, -0.613153, 0.150409, -0.296051, -0.210822, -0.327638, 0.249695, -0.075114, 0.742707, 1.149679, 0.335833, 0.327993, -0.285601, -0.496144, 0.635458, -0.588667, -0.972638, -0.328183, 0.855174, 0.765939, -0.514241, -0.177131, 0.031905, -0.167273, -0.089140, 0.110620, -0.159158, 0.724733, 0.069670, -0.725559, 0.025897, 0.628447, -0.462036, 0.684772, -0.126544, 0.158885, 0.297948, 0.310683, -0.067181, 0.377659, -0.668633, -0.141137, 0.189776, 0.165151, -0.527073, 0.406719, -0.651465, -0.485540, -0.090373, 0.417471, -0.311345, -0.645950, -0.026050, 0.217682, 0.132561, -0.181277, -0.367019, -0.014882, 0.057983, 0.180004, -0.420000, 0.920295, -0.486903, -0.055126, 0.196175, 0.452237, 0.420400, -0.410090, 0.025063, -0.237608, 0.647216, -0.688097, -0.994953, 0.533746, 0.237582, -0.558117, -0.487231, -0.300292, 0.334833, -0.340400, 0.043934, 0.288671, 0.195378, -0.212320, 0.006716, -0.020961, 0.058616, -0.344603, -0.456650, -0.004538, 0.510933, 0.442625, 0.223013, 0.586902, 0.522642, 0.267775, -0.121373, 0.318998, 0.223822, 0.368535, 0.102339, -0.016456, -0.014507, 0.251730, 0.105712, 0.367129, 0.717121, 0.295611, -0.062876, 0.281159, 0.292067, -0.137616]
-,        [0.950214, 0.693361, 0.621395, 0.557245, 0.942781, 0.816237, 0.747374, 0.207364, 0.823888, 0.996290, 1.094558, -0.110993, 0.197235, 0.404608, 1.239201, 0.834458, 1.129731, 0.740907, 0.206515, 0.787946, 0.093404, 0.075107, 0.507850, 0.163764, 0.047310, 0.580626, 0.313444, 0.795041, 0.461639, 0.097504, 0.926707, 0.522377, 0.213599, 1.019992, 0.546139, 0.075782, -0.005921, 0.501460, 0.124590, 0.666301, 0.649685, 0.733301, 0.575785, 0.575714, 0.220110, 0.416606, 0.325696, 0.417302, 0.468804, 0.662596, 1.462689, 0.530465, 0.651015, 0.130919, 0.659079, 0.607408, 0.568524, 1.118135, 0.597628, 0.158897, 0.308273, 0.889748, 0.268896, 0.523351, 1.054321, 0.577535, 0.372178, 0.918059, -0.163980, -0.271212, -0.079418, -0.156321, 0.371691, 0.136344, 0.090570, -0.189879, 0.389954, -0.278563, -0.065554, 0.106700, 0.214543, 0.168496, -0.301675, 0.191439, 0.338871, -0.128126, 0.023701, 0.169506, 0.196516, -0.104230, -0.064985, -0.188948, -0.088618, 0.150380, 0.109301, -0.465659, 0.143680, -0.097806, -0.513527, -0.638376, -0.087712, -0.060601, -0.032129, 0.037377, 0.107396, -0.292136, -0.095766, -0.130027, 0.379190, 0.277775, -0.324939, -0.043143, 0.428528, 0.022555, -0.233158, 0.014771, 0.322701, 0.161017, 0.046957, -0.035639, 0.292094, 0.040983, -2.471154, 0.032380, -0.009088, -0.078666, -0.038668, -0.241374, 0.108696, -0.024269, 0.048070, -0.011492, -0.551817, 0.282266, -0.100884, 0.162534, 0.179105, 1.031659, -0.065386, 0.783878]
-,        [0.370405, 0.482641, 0.532666, 0.200278, -0.066312, 0.303785, 0.520794, 0.376097, 0.231374, 0.187164, 0.512049, 0.434705, 0.303552, 0.713934, 0.014510, -0.283214, 0.044386, 1.680139, -2.539363, -2.584853, -2.039699, 0.860187, -3.404386, -2.878201, -3.737317, 1.650789, -2.306357, -2.220934, -2.146118, 1.646357, -3.993701, -3.366581, -2.504847, 0.857145, -3.497960, -3.845216, -3.084538, 0.746251, -3.975118, -3.618124, -4.186779, 0.621341, -3.857939, -5.795592, -5.012539, 0.975372, -4.002496, -4.350863, -3.713695, 1.195735, -2.831863, -3.654269, -2.397001, 0.433679, -4.532908, -3.582469, -3.125760, 0.937238, -4.294980, -4.269003, -3.048461, 0.990923, -2.807754, -3.148081, -2.364955, 1.587902, -2.570204, -3.048394, -2.188735, -0.035056, -0.071977, -0.075305, 0.082526, -0.107979, 0.029212, 0.007611, -0.065538, 0.136078, -0.032798, -0.145222, -0.090291, 0.006201, -0.115547, -0.067690, 0.024352, 0.047967, 0.051229, -0.153919, 0.375854, -0.004230, 0.154743, 0.058792, -0.053882, -0.170982, -0.085611, -0.077307, 0.100257, 0.067044, 0.111521, -0.176177, -0.105478, 0.075502, 0.060785, -0.023189, 0.039336, -0.162273, 0.082575, 0.021217, -0.044408, 0.203859, 0.025144, 0.118614, -0.150261, -0.018107, -0.265114, -0.217209, -0.059323, 0.007490, -0.001950, -0.000061, 0.032598, -0.530465, 0.046417, 0.065148, 0.048481, 0.130673, 0.152493, 0.286955, -0.022836, 0.046206, 0.122887, -0.110672, -0.088788, -0.027169, 0.135303, 0.060706, 0.345626, 0.627353, 1.087335, 0.185997]
-,        [0.491556, -0.319348, -1.152966, 0.101977, 0.186649, 0.880086, 0.295084, 0.583256, 0.161603, -0.218241, 0.477189, -0.769718, 1.027707, -0.125720, 0.109624, 0.007213, 0.562557, -0.086276, -0.488930, -0.969038, -0.967021, -0.301324, 0.410984, -0.077106, -0.624781, -1.297181, 0.077625, 0.048319, -0.123022, -0.149365, 0.326521, 0.505793, -0.096645, 0.489765, 0.143604, -0.417953, -0.898745, -1.018837, -0.431195, -0.016213, 0.914469, -3.399552, -2.156047, -0.848335, 0.455927, 0.200187, -0.772117, -0.665055, 0.464719, -0.147693, 0.272823, -0.311327, -0.135157, 0.115375, -0.088841, 0.977107, 0.390198, -0.812652, -1.331865, -0.855377, -1.057461, -1.172655, -0.676782, -0.862263, -1.307891, -0.804296, 1.078770, 0.516410, 0.552286, -0.593031, 0.225073, 0.807811, -0.127625, -0.736805, 0.262448, -0.032010, 0.308008, -0.692278, -0.163253, 0.708001, 0.503557, 0.016473, 0.025785, 0.172159, 0.739491, 0.020911, 0.074953, 0.460606, 0.180301, 0.088124, 0.281645, -0.421258, -0.073805, -0.025979, -1.140767, 0.371779, -0.009302, -0.653709, 0.250104, -0.936679, 0.023079, -0.671400, -0.195788, -0.502857, 0.407296, -0.099437, 0.058206, -0.090411, -0.627961, 0.213199, -0.310550, -0.255286, -0.153473, 0.335585, 0.312082, 0.296917, 0.805643, 0.053266, -0.519508, -0.449577, 0.098056, -0.053584, 0.161579, 0.151789, 0.287668, 0.243527, -0.240047, -0.585761, -3.310928, -2.217628, -2.024512, -0.831595, -0.500444, -0.340756, -0.147555, -0.135183, 0.599113, 0.097607, -4.190848, -0.158286]
-,        [0.538923, 0.640700, 0.614549, 0.487717, 0.516256, 0.305071, 2.590255, 0.304712, 0.366333, 0.472779, 0.265914, 0.796769, 0.749027, 1.484394, 1.385718, 0.851173, 0.666908, -0.755297, 0.339530, 0.323835, 0.388188, 0.344998, -0.482047, -0.466916, -0.054166, -0.140954, 0.314246, 0.494425, -0.330091, -0.490465, -0.236388, -0.104188, -0.306866, -0.503393, -0.750401, 0.629169, -0.368187, -0.226983, -0.297891, 0.487046, -0.017500, -0.563082, -0.652098, 0.022171, -0.188875, -0.800154, 0.720408, 0.339369, 0.405382, -0.626094, 0.130294, -0.274210, -0.631138, -0.475700, -0.710778, -0.428963, -0.093651, -0.526281, 0.184547, -0.180838, -0.088434, 0.125720, -0.355718, 0.017002, -0.067933, -0.390732, -0.416353, 0.237329, -0.477881, 0.235390, 0.055714, 0.043697, -0.187580, 0.016537, 0.153467, 0.420413, 0.102595, 0.413101, 0.095552, 0.045521, -0.028847, 0.108256, 0.243883, 0.367455, -0.108057, -0.009735, 0.037026, 0.362212, -0.004292, 0.178392, 0.047157, -0.106554, -0.151240, -0.399333, -0.134436, 0.288873, -0.176240, -0.004789, 0.098815, 0.339075, -0.294107, 0.219495, 0.253792, -0.013090, -0.153828, -0.118525, -0.210069, 0.350099, -0.064758, 0.077757, 0.295418, 0.164204, -0.114608, -0.205693, 0.210541, 0.054592, -0.024110, 0.083042, 0.188027, -0.133841, 0.008500, -1.738137, 0.351307, 0.048367, 0.098786, 0.083930, -0.044796, -0.070975, -0.028367, 0.167320, 0.058646, 0.137903, 0.181066, 0.194217, -0.215607, 0.249339, 0.068906, 2.168468, 1.339752, 1.581281]
-,        [0.199779, 0.289739, -0.147376, -0.016688, -0.283734, -0.516373, -0.080415, 0.202320, -0.228852, 0.092018, 0.162825, -0.104912, -0.287284, -0.567938, -0.585042, 0.390199, 0.018169, 0.420494, 0.079949, 0.120512, 0.341647, -0.046184, 0.441680, 0.929763, 0.100785, -0.296064, 0.350923, -0.597656, 0.494380, -0.115847, -0.436505, 0.595673, -0.120324, -0.000613, 0.019978, 0.166689, -0.029230, -0.827440, -0.315474, -0.241590, 0.438881, -0.982330, -0.356298, 0.216482, 0.375529, 0.116200, -0.007237, 0.764656, -0.120232, -0.526634, 0.082470, 0.045619, 0.202278, -0.068385, -0.146143, 0.090387, -0.546127, 0.150658, -0.534139, 0.114753, -0.274062, -0.220296, -0.525736, -0.186783, -0.067228, -0.001879, 0.548628, 0.277179, 0.631560, 0.073021, -0.318919, -0.456041, -0.169084, -0.170665, 0.086939, 0.128537, -0.525627, -0.192635, -0.319020, 0.776240, -0.066387, -0.529212, -0.020857, -0.503730, 0.171360, -0.306308, -0.180048, -0.296849, 0.337342, -0.178437, -0.216735, 0.273195, 0.109155, 0.281213, -0.491180, -0.115769, -0.102188, -0.572590, -0.250053, 0.708232, -0.007971, 0.300357, -0.075016, 0.351981, -0.121901, 0.514411, 0.046728, -0.283025, 0.074312, 0.180166, 0.704740, -0.052290, -0.769171, -0.369281, -0.432961, 0.624252, 0.198614, -0.024748, -0.046044, 0.003501, -0.230709, -0.075541, -0.191874, -1.104915, -1.582473, -0.739778, -0.347314, -0.450850, -0.214200, -0.079259, -0.222436, 0.210180, 0.105235, -0.369576, 0.184151, 0.259903, -0.197255, 0.040123, -1.154695, -0.791838]
-,        [0.043427, 0.101880, -0.720230, -0.214588, 0.052990, 0.152297, 0.073674, 0.225772, 0.230124, -0.370598, 0.049607, -0.223699, -0.403291, 0.373646, -0.396983, -0.404862, 0.201673, 0.163933, -0.488447, 0.377060, -0.582268, 0.082053, -0.252970, -0.337566, 0.436509, 0.563969, -0.980260, -0.491420, -0.167263, -0.072375, -0.155433, -0.142146, -0.712195, -0.191316, 0.134508, 0.194269, -0.765683, -0.680286, 0.068212, -0.486231, -0.170891, -0.461195, -0.168535, 0.158368, -0.657166, 0.100558, 0.270393, 0.115336, -0.041690, -0.772861, 0.013801, -0.644612, -0.122142, 0.133721, -0.374943, -0.239947, 0.314779, -0.593319, -1.028296, -0.619073, 0.470784, 0.387700, -0.462346, 0.189195, -0.091144, 0.213854, 0.056041, -0.131757, 0.054771, -0.051532, 0.265683, 0.114801, -0.269116, -0.038708, -0.265270, -0.616950, 0.072415, -0.537198, -0.032193, -0.302877, -0.280530, -0.048626, -0.354592, -0.167807, 0.105336, 0.263564, 0.189425, -0.539156, 0.101596, 0.214687, 0.144844, -0.347158, -0.501110, -0.382062, 0.433083, -0.499987, -0.369059, -0.359873, -0.155157, -0.270218, -0.027518, -0.033623, -0.083738, -0.542667, -0.390011, -0.085966, -0.649686, -0.715444, -0.344765, -0.195247, -0.350718, -0.183565, 0.205814, -0.304703, -0.430536, -0.043530, -0.397914, -0.333555, -0.001288, -0.922814, -0.568366, -0.479113, -0.363112, -0.264477, -0.392352, -0.240713, -0.343996, -0.570722, -0.106267, 0.318922, -0.248769, -0.142317, -0.423631, -0.295569, -0.166377, 0.028600, -0.070486, -0.043484, -0.749965, -0.445226]
-,        [-0.455704, -0.367605, 0.033397, 0.430628, -0.580325, 0.513245, 0.758669, -0.512410, 0.009464, -0.388913, 0.082601, -0.238288, 0.709878, 0.825032, 0.089140, -0.458570, -0.276437, 0.299374, -0.150572, 0.396494, 0.331221, 0.814596, 1.002422, 0.160059, -0.009429, 0.547159, 0.258050, 0.667540, 0.153655, -0.195713, 0.587587, -0.333235, 0.227798, -0.851631, -0.523014, 0.451997, 1.936289, 0.371913, 0.510558, -0.206616, -0.795066, -0.230680, -0.484265, -0.389792, -0.371833, -0.231577, 0.488968, -0.425129, -0.348769, -0.289934, 0.401118, -0.265012, -0.489469, -1.022550, -1.049723, -1.035544, -1.605099, 0.423697, -0.234652, 0.220852, 0.007637, 0.281163, 0.564946, 0.688151, -1.053415, -1.129742, 0.000419, -0.961812, -1.574503, 0.718390, -0.147912, -0.005636, 0.220161, -0.777476, 0.052124, -0.019612, -0.256725, 0.721012, 0.084798, -0.264228, 0.837334, 0.614132, 0.224173, -0.650605, -0.337374, -0.246299, 0.493823, -0.392356, -0.553909, -0.313404, -0.020658, -0.291845, -0.373466, 0.192552, -0.233013, -0.931080, -0.144021, -0.691760, -0.497970, -0.802227, -0.104241, 0.678928, -0.479479, -0.593862, -0.281439, 0.587183, 0.238582, -0.839060, 0.405922, 0.019061, 0.081280, -0.968868, -0.590746, 0.124272, -0.823774, -1.023639, -0.633506, 0.583357, 0.390371, -0.033664, -0.145843, 0.066226, 0.262964, -0.037137, -0.148049, -0.530613, -1.157207, -0.728995, -0.636148, -1.106836, -0.541094, -0.117413, -0.844588, -0.337001, -0.370387, -0.048355, -0.443429, 0.491303, -1.008861, -0.170671]
-,        [-0.240469, -0.088388, -0.050617, 0.040950, 0.384453, 0.035052, -0.505740, 0.024513, 0.019953, 0.454970, -0.035344, 0.143703, -0.065362, -0.074294, 0.029205, 0.558847, -0.846348, 0.802954, -0.297345, 0.088042, 0.351447, -0.247811, 0.131312, 0.185291, -0.639422, 1.228002, -0.457721, 0.736556, -0.705210, -0.018197, 1.132728, 0.169805, -0.245905, -0.134123, 0.184641, 0.294739, 0.251935, -0.091122, -0.024208, 0.250229, 0.663781, -0.703582, -1.184086, -0.111207, 0.611526, -0.202606, 0.136224, -0.084066, 0.109319, 0.961281, 0.734086, -0.553413, -0.822572, -0.759501, 0.134447, 0.411969, -0.230839, -0.503247, -0.083788, 0.911864, 0.010106, 0.155442, 0.337732, -0.659963, -0.649151, -0.620846, -0.085608, 0.405218, 0.428769, 0.207125, -0.761220, -0.050785, 0.568799, -0.209193, -0.686263, -0.494411, 0.073409, 0.120896, -0.314347, 0.433901, 0.609750, 0.138347, -1.051813, -0.074924, -0.096111, 0.097770, -0.629968, -0.149705, 0.995629, 0.069824, -0.507578, 0.463348, -0.127878, 0.791818, -0.272298, 0.314437, -0.192737, 0.164828, -0.534275, 0.177236, 0.634922, -0.012099, -0.666592, -0.080471, -0.802429, 0.815296, -0.582494, 0.121447, 0.342432, 0.102381, -0.631323, -0.373549, -0.158131, 0.080013, -0.555222, 0.181057, -0.248375, 0.368645, -0.865425, -0.365679, -0.365785, -0.074136, -0.151276, 0.210054, -0.058057, -0.425573, 0.369580, 0.162793, -0.538892, -0.756223, 0.238036, 0.126249, -0.335699, -0.637561, -0.031472, -0.136892, 0.820942, -0.320227, -1.040148, 0.243880]
-,        [0.463783, -0.178164, -0.161193, -0.121385, -0.029456, 0.268215, -0.580853, 0.036860, -0.241933, 0.265894, 0.021032, 0.153255, -0.073226, -0.445052, 0.345289, 0.197707, -0.359833, 0.058252, 0.279436, -0.170051, -0.098199, -0.167343, -0.118001, -0.133898, -0.054680, 0.048327, -0.278957, -0.241741, -0.226556, -0.082557, 0.112989, -0.133283, -0.015634, -0.267155, -0.058841, -0.513979, 0.256591, -0.289875, 0.141789, -0.268492, 0.013679, -2.449242, -0.730699, -1.193690, -2.272645, 0.024093, -0.050153, -0.147621, -0.193654, -0.242479, -0.080889, 0.263844, -0.254590, -0.212833, 0.127268, -0.422253, -0.052893, -0.237981, -0.525261, -0.512669, -0.650083, -0.469338, -0.535305, 0.096273, -0.403280, -0.367918, 0.050544, -0.304310, -0.037981, -0.095012, 0.005825, 0.244865, -0.033012, -0.368478, 0.092159, -0.062624, -0.105048, 0.371307, 0.284308, -0.160261, -0.280659, -0.463817, 0.108111, -0.171235, -0.322593, -0.314792, -0.201602, -0.139862, -0.276968, 0.172593, -0.388593, 0.179360, 0.112263, -0.092371, -0.118285, 0.182241, -0.489541, -0.349218, 0.285786, -0.316806, -0.078863, 0.099913, -0.320104, -0.000216, -0.323643, 0.165789, 0.141004, -0.053438, -0.115623, -0.155494, -0.180493, 0.045364, -0.349355, -0.230827, -0.161258, -0.092898, -0.261440, -0.182281, -0.299549, 0.137989, 0.012255, -0.667738, -0.338874, -0.210614, -0.002665, -0.198898, -0.090273, -0.121862, -0.299429, -0.657579, -0.686660, -0.762489, -0.449555, -0.732996, -0.894924, -0.199560, 0.081375, -0.738047, -1.193113, -1.361301]
-,        [-0.037840, -0.090147, -0.093037, -0.126988, 0.058215, -0.051737, 0.162803, 0.111022, -0.079102, 0.201400, -0.042715, -0.191786, -0.193095, -0.126542, -0.025505, -0.165888, -0.234681, -0.102664, -0.173547, -0.052122, -0.153458, -0.009512, 0.025913, -0.061380, -0.050071, 0.020559, 0.149618, 0.077452, -0.043690, 0.121790, 0.086500, 0.136572, -0.035494, -0.364275, -0.106113, -0.108547, 0.071053, -0.067058, -0.119748, 0.016540, -0.141845, 0.046927, -0.052248, -0.147136, 0.075456, -0.053454, -0.082944, 0.009150, -0.045009, -0.009073, 0.186811, -0.062901, -0.015742, -0.179935, -0.239425, 0.267317, -0.090964, 0.002127, 0.092121, 0.044615, -0.094869, -0.132101, -0.018551, -0.015001, -0.124619, -0.100814, -0.094540, -0.058733, 0.020312, 0.022737, -0.177138, -0.215403, 0.017098, -0.013247, 0.043873, -0.092172, -0.203607, -0.225058, -0.228436, -0.144596, 0.058827, -0.160343, -0.151314, -0.018664, -0.008870, -0.053860, -0.091009, -0.063169, 0.026012, 0.135998, 0.016125, -0.024611, -0.313466, -0.283187, -0.176922, -0.248649, 0.054289, -0.079408, -0.058343, -0.008806, -0.038938, -0.252949, -0.248356, -0.168628, -0.088408, 0.016176, -0.081672, -0.148759, 0.006915, 0.109609, 0.108362, 0.044784, -0.084534, -0.097174, 0.037298, 0.137556, -0.138145, -0.057599, -0.052492, -0.030041, -0.068842, -0.250186, -0.114884, -0.040302, -0.137396, -0.116461, -0.237142, 0.039125, -0.043762, 0.110813, 0.010499, 0.023653, 0.103664, -0.001490, -0.027987, 0.069075, 0.062530, 0.054590, -0.290110, -0.242321]
-,        [0.621956, 0.134128, 0.106858, 0.206163, -0.231300, -0.677617, 0.615824, 0.304548, -0.646662, -0.041260, -0.103222, 0.040630, 0.065578, 1.067830, -0.316446, 0.002354, -0.655882, 0.350141, -0.508778, 0.698554, -1.031919, 0.238672, -0.260517, 1.510144, 0.201433, -0.509499, -0.677126, -0.222488, -0.501917, 0.124112, -0.693356, -0.074927, -1.147349, -0.580732, -1.202806, -0.709954, -0.899744, -0.577671, 0.806737, 0.285346, 0.112550, 1.282619, -1.505866, 0.251990, -0.568899, -0.831360, -0.388091, -0.588045, -1.306208, -0.277605, -0.156644, -0.710567, -0.070480, 0.022162, -0.923132, 0.917638, 0.200826, -0.335211, -1.275367, 0.144078, -0.415296, 0.021836, 0.296428, 0.360108, 0.508004, 0.575939, -0.721218, 0.227193, -0.666800, -0.100555, -0.029360, 0.201346, -0.688038, -0.531766, -0.380042, -0.475378, -1.136672, 0.160555, 0.523320, -1.098696, 0.089920, 0.386222, -1.008369, -0.365132, -0.399681, 0.107851, 0.305883, 0.968535, -0.193057, -0.234760, -0.022385, -0.304367, -0.778658, 0.037071, 0.289521, 0.395209, 0.497724, 0.433371, 0.057210, -0.789093, -0.629421, -0.030112, -0.091249, -0.216021, -0.548137, -0.131148, -0.006292, 0.294565, -0.229362, 0.082440, -0.102864, -0.097108, 0.522459, 0.641562, -0.852911, -0.407582, -0.724833, 0.298007, 0.346641, 0.269433, 0.119040, 0.131472, -0.157605, -0.133775, -0.124598, -2.476791, -1.414906, -0.856571, -0.774453, -0.648434, -0.397201, -0.288338, 0.091505, -0.036685, 0.089352, 0.257938, -0.455238, 0.799207, -0.606110, -0.281485]
-,        [0.436615, 0.734563, 0.298839, 0.132604, -0.212901, 0.527582, 0.108348, -0.320235, 0.872571, 0.635802, 0.603919, 0.268345, 0.285895, -0.004529, -0.436804, 0.185116, 0.203243, -0.073728, 0.226459, -0.238208, 0.656200, -0.156991, 0.927899, 1.076599, 0.045213, 0.674497, 0.057861, 0.193926, 0.709178, 0.958556, 0.888328, 1.045193, 0.721558, 0.793659, 0.441641, 0.597095, 0.101597, 1.317018, 0.165140, 0.016032, 0.726908, 0.346463, -0.382671, 1.258537, 0.634641, 1.261039, 0.601584, 0.735973, 0.662745, -0.213054, 0.230193, 0.415249, 0.032210, 0.971298, 0.187335, -0.238938, -0.645287, 0.222571, 0.767604, 0.779266, 0.560298, 0.453914, -0.615053, 0.055087, 0.920352, 0.122674, 0.399844, 1.735019, 0.049281, 0.206464, -0.324921, 0.410191, -0.330935, -0.753777, -0.348642, 0.216880, 0.256043, -0.407793, -0.840725, 0.284051, 0.462758, -0.528303, 0.794535, -0.741382, 0.161506, -0.181641, -0.638164, -0.017222, 0.184739, 0.017353, 0.361120, -0.193755, 0.036213, 0.214882, 0.042131, -0.094976, 0.291035, -0.177204, 0.452250, 0.250639, 0.235665, -0.342165, 0.010082, -0.460028, 0.642739, -0.324402, 0.186050, 0.248404, -0.145791, 0.214546, 0.125995, -0.079162, -0.197317, 0.048987, -0.240856, -0.528447, -0.009595, -0.205717, -0.448778, 0.333254, -0.752809, -0.443749, -0.323447, -2.386012, -1.337915, -1.023669, -0.419746, -0.402260, -0.352493, -0.132611, 0.025364, -0.109704, -0.152478, 0.028780, -0.018763, -0.007664, 0.201976, -0.186671, 0.474336, -0.944434]
-,        [0.007924, 0.602218, 0.602402, -0.285122, -0.302277, 0.182450, -0.978628, -0.676335, 0.066788, -0.714958, 0.309554, -0.070983, -0.799121, 0.862246, -0.965305, -0.654339, -0.922875, -0.801330, -0.695359, -0.611180, 0.339126, 0.907534, -0.702322, -0.447562, 0.790097, -0.306104, 0.043847, -0.092457, -0.583455, -0.152387, -0.031079, 0.191605, 0.245584, -0.011457, -0.507603, -1.185227, 0.723446, 0.775714, -0.590548, -1.202738, -0.429410, 0.989957, -0.686007, -0.930934, -1.537104, -0.702081, -0.472600, -1.266952, -0.830113, 0.290757, -0.670671, -0.042887, 0.238528, -0.159073, -0.552404, -0.352170, -0.684590, 0.110663, 0.218014, -0.240641, 0.923994, 0.168318, -0.701852, -0.043021, -0.936364, 1.041959, -0.551416, -0.890819, 0.087078, -0.602967, 0.712800, -0.866096, -0.809229, -0.657629, -0.702432, 0.044735, -0.064296, -0.572612, 0.257416, -0.305216, -0.314119, 0.047909, -1.039145, 0.513175, -1.519588, -0.718053, -0.571965, -0.097959, -0.486686, -0.342403, -0.237693, -0.154779, -0.664102, 0.043242, 0.088790, -0.923784, -0.606197, 0.330560, -0.885219, -0.281704, 0.016382, 0.646298, -0.401120, -0.531148, -0.317268, -0.633077, 0.225884, 0.098659, -0.991825, -0.785490, -0.174219, -1.004238, -0.567804, -0.606453, -0.256772, -0.052754, -0.330748, -0.115717, -0.684002, -0.119651, 0.016171, -0.105811, 0.059083, -0.069628, -0.048975, -0.148753, 0.345394, 0.048997, 0.189696, -0.973033, -0.480522, -1.754401, -1.231755, -1.058163, -0.655704, -0.241057, 0.174038, -1.277713, -1.900048, -0.659417]
-,        [1.062636, -0.422370, 0.181425, 0.741736, 0.150923, -0.140867, 0.544993, 0.440148, 0.058401, 0.215503, -0.674391, 0.448026, -0.709297, 0.813693, -0.100576, -0.662285, -0.041534, -0.078589, -0.224927, -0.382677, 0.204946, 0.492964, 1.210779, 0.090513, 0.172095, 0.344328, -0.542504, 0.587186, -0.153696, 0.107872, 0.439135, -0.224230, 0.179842, -0.659719, -0.187776, -0.279647, -0.884559, -0.290913, -0.770885, -1.268801, -0.192522, 0.712741, -1.548320, -0.579139, -1.485410, -0.539563, -0.622833, 0.187577, -1.127214, 0.455110, 0.071678, -0.422831, -0.071582, 0.452828, -0.025205, 0.083715, 0.809050, 0.888304, -0.144207, 0.807767, -0.233316, 0.082069, 0.352149, -0.399142, -0.121283, 0.863159, -0.844023, -0.449640, -0.131964, 0.361791, 0.360284, 0.195205, -0.625954, 0.399888, -0.203209, -0.093557, 0.010057, 0.177812, -0.400566, -0.356432, 0.228931, 0.480457, -0.103529, 0.103465, -0.724494, 0.755340, 0.102749, 0.315367, -0.624226, 0.718361, 0.333053, 0.242761, 0.128832, 0.412739, 0.223481, 0.655285, 0.471494, 0.308224, -0.022345, 0.078075, 0.115566, 0.409468, -0.238270, 0.096570, -0.475511, -0.284312, -0.020567, -0.710958, -0.124959, 1.031034, 0.334142, 0.297379, -0.162668, 0.597122, 0.126565, -0.127177, -0.392842, -0.530005, 0.528129, 0.226712, -0.127839, -0.049234, -0.104391, -0.127664, -0.677635, -1.146705, -1.121047, -0.485042, -0.532475, -0.050380, 0.168713, 0.292105, 0.153852, 0.156336, 0.251354, 0.141753, 0.292631, -0.097255, -0.062513, -0.099134]
-,        [0.046279, -0.285217, -0.073646, 0.636464, -0.073761, -0.517504, -0.602013, -0.369474, 0.775536, 0.796139, 0.496013, -0.649670, 0.027849, 0.742117, -0.052764, 0.106615, -0.134637, 0.203094, 0.004066, -0.668068, -0.841680, 1.071114, 0.170558, -0.189476, 0.260283, 0.460936, -0.206992, -0.195225, 0.155024, 0.040101, -0.029298, 0.726800, 1.415276, 0.387199, 0.767911, -0.596984, 1.059101, -0.425542, -0.773341, -0.978205, 0.702548, 0.033625, 0.052619, -0.155301, -0.852063, 0.629903, -0.266931, 0.621749, 0.151143, 0.521532, -0.126609, 0.722311, 0.460729, 0.271680, 0.010530, -0.198317, 0.039104, -0.893620, -0.401327, 0.037897, 0.200919, 0.158156, -0.225539, -0.476913, 0.286039, 0.717241, -0.262751, -0.037063, 0.121672, -1.500884, 0.497807, -0.108470, 0.467267, -0.206170, -0.133295, -0.240931, -1.426807, -1.015857, -0.124348, -1.309002, -0.591935, -0.186933, 0.062647, 0.163792, -0.097408, -1.332596, -0.406522, 0.049700, -0.413389, -0.544634, -0.691945, -0.115697, 0.716255, -0.839802, -0.645019, 0.378852, -0.921306, -0.369213, 0.379187, -0.580525, -0.494491, 0.023540, 0.102827, 0.343652, 0.241776, 0.288912, -0.808255, 0.521558, -0.526925, -0.207273, -0.262976, 0.170817, -0.824856, -0.244401, -0.363725, -0.055864, -0.910164, -0.374401, -0.098105, 0.102511, -0.470357, 0.198577, 0.062711, 0.248245, -0.310119, 0.305457, -0.731538, -0.866802, -0.375641, -0.223478, 0.285609, 0.169098, -0.138074, -0.130578, 0.229649, 0.206279, 0.149636, -0.324332, 0.629127, 0.187964]
-,        [0.099921, -0.039647, 0.500816, 0.088503, 0.590417, 0.292970, 0.166936, -0.384146, 0.580330, 0.236240, -0.294379, 0.253654, -0.418909, 0.247882, 0.303390, 0.494059, 0.125204, -0.180579, 0.104191, -1.030337, -0.012701, -0.453348, -0.079260, 0.104317, -0.204760, -0.224636, 0.217503, 0.415401, 1.332785, -0.224505, 0.148884, -0.432652, -0.125590, -0.284938, 0.137280, 0.175508, 0.041716, -0.148102, -0.187427, -0.585042, 1.219440, -0.745363, 0.151140, 0.473133, -0.341605, -0.473547, 0.437689, -0.156366, 0.106790, 1.078405, -0.008489, 0.539268, 0.054479, -0.246127, 0.674965, -0.658687, 0.659704, -0.086355, 0.290757, 0.100465, -0.011073, -0.203048, -0.217650, 0.075476, 0.490362, 0.315304, 0.238833, 0.746361, 0.830285, 0.550203, -0.197212, 0.479630, -0.337880, -0.276448, 0.385433, -0.410179, -0.216695, 0.428849, -0.529681, -0.084192, 0.120032, 0.153935, 0.044495, 0.316143, -0.799070, -0.080897, 0.240533, -0.256582, -0.505934, 0.870408, 0.514376, -0.006731, -0.738155, -0.405156, 0.177174, 0.034879, -0.386648, 0.470125, -0.336395, -0.211969, -1.034719, 0.472232, 0.474558, 0.889433, -1.150585, 0.156076, -0.038475, 0.934939, 0.246812, 0.978235, 0.262582, 0.929377, 0.171626, 0.996579, -0.103487, 0.006111, -0.144287, 0.082820, -0.299978, 0.420206, -0.215689, 0.193977, -0.341632, -0.074562, -0.715954, -0.512606, -0.612407, -0.586192, 0.185034, 0.270335, -0.014324, 0.093185, 0.451248, 0.131454, 0.185804, -0.023783, -0.696102, 0.396281, -0.594711, -0.549610]
-,        [0.321757, -0.208631, -0.179696, -0.015702, 1.091514, -0.213465, -1.298659, 0.046716, 0.630857, -0.147142, 0.151369, -0.030629, 0.323539, 0.527910, 0.118132, 0.394148, -0.167576, 0.418735, 0.450860, 0.407912, 0.197633, 0.391402, 0.769101, 0.108745, -0.322759, 0.837917, 1.283610, 0.177418, -0.938765, 0.943831, 0.000071, 0.043536, -0.214030, 0.702562, -0.065283, 0.641032, -0.012955, -0.136059, 0.897223, 0.658227, 0.415276, -0.354548, -0.918706, -0.849352, -0.448246, 0.495288, 0.517583, -0.554640, 0.039101, 0.139604, 0.529710, 0.194519, 0.159977, 0.665117, 0.246201, 0.133259, 0.982525, -0.199057, 0.720179, -0.036437, 0.417106, -0.354636, 0.534282, 0.428462, -0.105087, 0.693150, 0.293839, -0.231288, 0.398770, -0.235791, 0.049708, 0.138831, 0.343506, 0.232963, 0.352151, 0.231138, 0.079479, 0.435226, -0.267262, 0.511845, 0.135629, 0.226095, 0.207085, 0.078928, 0.326562, -0.146972, 0.548596, 0.244392, 0.665717, 0.251515, 0.489276, 0.182528, 0.456748, -0.271590, -0.195980, 0.118599, -0.416676, 0.021389, -0.038864, 0.734169, 0.221232, -0.180947, 0.066129, 0.481227, 0.449935, 0.318916, 0.184627, 0.643869, 0.384736, 0.143259, 0.193689, 0.407137, 0.308792, -0.027395, 0.205248, 0.366614, 0.487758, 0.219616, 0.224979, 0.321838, 0.494640, 2.013561, 0.494548, 0.558228, 0.662401, 0.806555, 0.500088, 0.677432, 0.600372, 0.753176, 0.401110, 0.437815, 0.570530, 0.272042, 0.201884, 0.291515, 0.247561, -1.447969, 1.008314, -0.607574]
-,        [-0.131523, -0.414928, 0.043129, -0.276480, -0.071219, -0.132935, 0.020177, 0.014997, 0.254715, 0.008109, -0.136937, 0.008855, 0.033621, 0.025239, -0.166921, 0.024088, 0.104963, 0.220892, -0.205673, 0.248310, 0.320187, -0.239946, 0.125940, 0.358647, -0.023959, 0.253736, -0.232872, -0.273337, 0.074409, -0.079214, -0.093385, 0.319310, -0.021641, 0.111188, -0.319157, 0.388474, -0.094694, -0.004770, 0.085846, -0.020047, -0.959423, -0.069900, -0.752229, -0.168349, -0.004381, -0.425279, -0.104763, 0.203853, -0.157833, -0.262220, -0.133918, 0.014455, 0.203528, 0.111900, -0.008089, 0.007045, -0.062634, 0.068829, 0.259400, -0.144107, 0.116836, 0.201083, 0.268330, -0.039837, -0.065834, 0.238760, -0.188996, -0.162595, 0.354864, -0.486925, -0.586207, -0.197937, -0.102634, -0.375767, -0.014089, -0.229498, -0.340352, -0.115087, -0.212258, -0.151234, 0.161787, -0.633174, -0.462494, -0.358480, -0.199447, -0.274200, -0.551436, 0.153175, 0.163971, -0.343541, -0.232549, 0.117092, -0.034655, -0.023961, -0.102591, 0.237416, -0.377349, -0.517865, -0.366804, -0.001126, -0.231004, -0.211304, -0.145498, 0.220364, -0.119383, -0.224984, 0.126601, 0.144093, -0.025071, -0.340247, -0.405560, -0.008946, -0.119931, -0.780901, -0.617719, -0.474643, -0.143662, -0.387682, 0.173959, -0.183068, 0.016796, -0.177662, -0.736917, -0.312139, -0.151345, -0.102096, -0.054625, 0.189502, -0.007500, -0.094409, 0.174813, -0.228940, -0.178382, -0.069595, -0.245616, -0.181479, -0.104216, 0.138691, -0.695149, 0.060369]
-,        [0.286183, 0.043335, -0.405289, 0.175100, -0.144236, -0.154257, -0.113520, -0.295330, 0.113265, 0.120391, 0.228150, -0.395919, 0.175307, -0.113754, 0.049853, 0.206926, -0.128019, 0.216280, -0.740246, -0.461094, 0.171751, -0.217485, -0.265854, -0.334618, 0.205913, -0.093607, -0.592080, -0.180063, -0.179565, 0.242101, -0.576548, -0.647661, 0.349765, 0.121584, -0.324822, -0.423724, -0.026523, 0.132080, -0.427756, -0.816174, 0.192405, -0.191694, -0.357196, -0.310867, 0.103534, 0.055228, -0.533881, -0.344882, -0.267519, -0.148447, -0.387289, -0.024012, 0.505127, 0.384087, 0.089405, -0.477226, 0.134145, 0.275921, -0.636454, -0.535002, -0.045538, 0.090781, -0.540014, -0.150010, 0.005906, 0.451496, -0.292380, 0.193544, 0.457799, 0.047436, -0.216617, 0.094559, 0.055452, -0.329616, -0.276043, 0.008632, 0.029780, 0.069224, 0.043015, 0.088510, -0.040860, -0.134851, -0.087167, -0.242725, -0.101260, -0.175459, -0.184559, -0.000870, -0.093199, 0.117744, 0.029294, 0.053962, -0.126199, -0.231004, -0.136360, -0.238307, 0.160383, -0.211777, -0.095851, -0.119509, -0.303135, 0.022248, -0.072973, -0.059419, -0.163343, -0.057202, -0.122510, -0.342899, -0.134367, -0.003243, -0.096144, -0.065406, -0.287015, 0.004113, 0.103300, -0.169762, 0.018581, -0.148179, -0.018806, -0.202970, -0.017930, -0.422493, -0.260596, -0.157739, -0.011402, -0.110729, -0.301189, -0.246855, -0.077366, -0.142381, -0.220025, -0.401496, -0.418153, -0.140663, -0.234982, 0.022242, -0.103366, 0.158667, -0.546870, -0.462112]
-,        [-0.221903, -0.516522, 0.638017, -0.243761, 0.231967, -0.281188, -1.199973, 0.188382, 0.969754, 0.860712, 0.372543, 0.537733, 0.028074, -0.412863, 0.445555, 0.056266, -0.320423, 0.087991, 0.901309, 1.656536, 0.054120, 0.664651, 0.291680, 0.407951, 0.734177, 0.151341, -0.538134, -0.580827, 0.652354, 0.173872, 0.833141, -0.728288, 0.641681, -0.005611, -1.110300, 0.352358, -0.157595, 1.041720, 0.744584, -0.343577, -0.066786, -0.178238, -0.467422, 0.605949, 0.702438, 0.578535, 0.213929, 1.313833, -0.567558, 0.398900, 0.282984, -0.340185, -0.821086, -0.457429, 0.575008, 0.302806, -0.307552, 0.037907, -0.365055, 1.269904, -0.050154, 0.563967, 0.993524, 0.546019, -0.405612, 0.605799, -0.044734, 0.407058, -0.144048, 0.458780, 0.014225, -0.745302, -0.423928, -0.798801, -0.153830, 0.337511, -0.350597, 0.399358, 0.311828, 0.427645, 0.164937, -0.468949, -0.300640, 0.069817, -0.382049, -0.024706, 0.085243, 0.207765, -0.194690, 0.599469, -1.001746, -0.206346, -0.715690, 0.324312, -0.416800, 0.070425, 0.307631, 0.556806, -0.064040, -0.181309, 0.093652, 0.318318, 0.293611, 0.429577, 0.010705, 0.218123, 0.280934, 0.370019, -0.747153, -0.070202, 0.051664, -0.278134, 0.097882, 0.186138, -0.950825, 0.483227, -0.245570, 0.358230, -0.162497, 0.443804, 0.481552, -0.459639, -0.738052, 0.034835, -0.033117, -0.218860, 0.097195, 0.095768, -0.007492, -0.150173, 0.205863, 0.457852, 0.262492, 0.535970, 0.384921, 0.415055, 0.414710, -1.310814, -0.933430, -0.196085]
-,        [-0.552403, -0.472987, 0.415396, 0.180522, 0.653963, -0.215802, 0.876056, 0.482385, -0.271584, -0.673862, 0.415839, -0.482122, -0.401537, -0.054262, -0.208348, -0.350982, 0.123881, -0.465871, -0.321889, 0.789886, -0.353853, -0.216171, 0.657008, -0.100126, 0.300657, -0.101206, -0.738982, 0.512551, 0.216249, 0.148686, -0.491834, 0.208826, -0.151209, 0.412216, 0.112953, 0.177856, -0.538925, -0.289698, 0.602081, -0.831406, -0.807273, 0.040575, 0.081936, 0.218957, -0.654398, -0.391575, -1.093511, -0.004009, 0.307077, 0.555678, -0.126403, 0.080190, 0.346575, 0.351318, 0.250903, 0.385567, -0.283558, 0.515169, -0.088923, -0.523518, 0.562178, 0.356219, 1.152990, -0.307839, -0.639399, -0.597426, 0.262502, -0.238894, 0.732963, 0.107159, -0.444782, -0.077788, 0.526372, -0.112414, 0.064959, 0.204580, -0.284193, -0.114153, -0.022607, -0.020804, 0.238226, -0.320236, 0.189480, 0.349007, 0.580435, -0.582222, -0.296385, -0.081332, 0.239116, -0.498264, -0.128372, -0.373997, 0.204908, 0.316586, 0.570136, -0.196321, -0.708283, 0.338047, 0.214742, 0.114092, 0.030950, -0.786387, 0.133680, 0.717794, 0.676194, -0.220272, -0.352940, -0.139991, -0.188669, -0.164713, 0.139539, -0.462160, 0.080427, -0.395198, -0.159492, 0.787155, 0.720735, -0.862365, -0.194955, -0.283207, 0.040313, -0.380653, -0.272851, -0.615560, -0.463551, 0.358674, -0.193086, -0.190969, -0.339842, -0.424098, -0.859990, -0.234882, 0.067764, 0.343555, 0.151305, -0.116032, -0.107998, 1.061555, -0.859442, -0.006299]
-,        [0.476975, 0.672173, -0.030748, 0.203000, 0.390122, 0.855227, 0.150012, -0.025629, 0.048861, 0.052980, 0.042785, -0.172794, 0.606288, 0.334229, -0.124332, -0.396011, -0.277623, 0.964494, 1.066906, -0.235636, 0.508943, 0.478915, 0.132001, 0.284846, -1.166091, 0.491388, -0.561776, 0.303686, 0.572399, -0.189789, 0.292235, 0.047633, 0.304372, 0.362804, -0.123155, 0.192848, -0.553249, 1.398530, -0.365159, -0.542271, 0.661917, -0.144970, -0.826154, -0.608124, -1.051762, 0.061300, 0.799405, 0.426486, 1.398645, 1.036576, 0.945536, -0.299834, 1.098324, 1.101237, -0.269608, 0.191706, 0.635921, -0.296022, -0.110807, 0.329438, -0.344340, -0.205954, 0.288382, -0.562741, 0.086526, 0.473628, 0.414207, -0.473310, -0.498116, -0.026428, 0.290217, 0.085651, -0.457788, -0.274559, -0.141747, 0.229680, -0.291282, 0.505684, -0.526779, -0.062882, 0.109888, -0.151507, -0.104595, -0.551934, 0.482462, -0.186424, -0.095801, -0.384712, -0.070952, 0.493209, 0.079596, 0.184087, 0.214271, 0.165734, 0.537874, 0.104358, -0.486624, -0.013977, -0.036975, -0.620327, -0.529405, 0.019033, -0.273148, -1.036322, -0.358989, -0.187287, 0.406559, 0.115928, -0.173231, -0.100270, -0.382268, 0.228538, 0.275296, 0.292013, -0.725883, -0.473019, 0.118223, 0.711742, 0.183733, -0.034964, 0.053990, -0.362460, -0.156243, -0.685955, -1.066831, -0.603133, -0.372622, -0.522395, -0.471209, -0.095430, -0.092763, -0.771948, -0.124142, 0.009804, 0.091288, -0.135924, -0.348190, 0.613950, -0.833484, -0.750453]
-,        [0.510540, -0.678733, 0.807077, 0.265020, 0.586463, -0.095008, -1.099258, -0.077556, -0.578925, -0.197524, -0.252436, -0.262340, -0.593989, -0.676963, -0.357516, 0.731546, 0.007259, -0.368778, 0.376231, -0.001911, 0.293617, -0.144273, 0.648233, 0.326933, 0.687316, -0.245563, 0.030012, -0.161541, -0.486908, -0.131708, -0.624244, -0.410606, -0.509559, -0.984288, -0.119841, -0.204508, -0.283856, -0.661118, -0.479630, 0.209561, 0.174903, -0.986071, -0.355380, 0.000790, -1.122020, 0.159128, -0.086621, 0.853259, 0.708115, -0.765798, -0.282904, 0.245684, 0.009862, -0.255460, -0.639772, 0.112792, -0.006224, 0.491282, 0.458810, 1.122097, -0.141806, 0.254962, 0.370484, 0.158613, 1.087146, -0.595847, -0.617107, -0.301694, -0.480411, -1.369929, 0.072131, -0.044003, -0.118170, -1.062150, -0.504489, 0.486549, -0.157114, -0.538729, -0.254704, 0.114938, 0.269911, -0.348244, 0.320142, 0.625656, -0.730641, 0.084612, 0.602995, 0.104584, 0.260957, -0.105930, -0.488581, -0.431695, -0.726124, -0.391415, -0.431382, -0.686891, -0.404024, 0.048734, -0.094660, 0.101200, -0.516320, 0.021763, -0.532122, 0.160241, -0.895621, 0.798875, 0.057973, 0.064868, 0.071288, -0.000037, 0.042442, 0.499785, -0.284167, -0.190380, -0.623448, -0.717778, -0.420762, 0.496770, -0.475954, 0.311652, -0.311820, 0.183961, 0.408521, 0.059920, -0.373643, -0.428588, -0.894032, -0.522905, 0.066357, 0.422531, -0.209069, -0.739309, -0.378469, -0.745039, -0.079526, -0.171494, 0.538038, -1.018471, -1.104580, -0.015952]
-,        [0.343567, 0.630317, 0.455655, 0.526086, 0.509044, 0.477488, 0.437558, 0.437656, 0.740417, 0.785781, 0.681198, 0.575327, 0.348978, 1.049592, 0.940989, 0.611789, 0.635123, 0.340824, 0.735416, -4.492416, -3.614564, 0.873146, 0.702785, -3.150963, -2.309089, 0.238987, 0.516966, -4.966856, -3.433369, 0.470976, 0.252213, -5.161923, -4.456734, 0.783890, 0.448494, -4.205753, -2.511061, 0.533647, 0.409728, -5.177548, -3.438698, -1.429376, -5.342938, -5.356662, -5.080507, 0.571809, 0.335921, -5.049072, -5.011543, 0.681409, 0.974590, -2.724061, -3.052990, 0.467491, 0.531195, -3.257594, -2.888802, 0.896562, 1.032775, -2.541879, -1.823836, 1.196060, 1.073424, -2.506034, -2.050827, 0.504292, 0.264332, -4.883365, -4.156619, -0.092979, 0.005127, -0.015731, -0.031307, 0.102413, -0.070395, 0.045043, 0.047765, -0.147722, 0.184910, 0.039310, -0.059730, -0.055959, 0.109853, -0.072762, -0.095424, -0.099524, 0.006523, 0.033609, 0.040144, -0.027763, 0.009764, -0.092439, 0.067493, -0.017562, -0.006775, -0.029751, -0.066149, -0.001490, 0.084221, 0.063925, 0.075155, 0.096953, -0.120000, 0.106510, 0.050649, -0.053212, -0.042064, 0.060123, 0.034696, 0.031433, 0.001588, -0.119871, 0.068183, 0.125218, 0.036738, 0.007392, -0.032994, 0.083195, 0.046909, 0.086465, 0.136598, -1.115996, 0.000091, 0.044878, 0.009119, 0.042408, 0.030093, 0.085392, 0.052649, 0.125063, -0.007452, 0.043426, 0.120709, 0.063906, -0.035772, -0.021559, -0.088100, 0.204260, -0.091288, 0.154143]
-,        [-0.452321, 0.217945, 0.153899, 0.173097, -0.620828, 0.185559, 0.375045, -0.046413, -0.017680, 0.561223, -0.358442, -0.079889, 0.290673, 0.862132, -0.444163, -0.083460, -0.144665, -0.101229, 0.565685, -0.493596, -0.546056, 0.063454, 0.710470, -0.104238, -0.623755, 0.476429, -0.056985, 1.170286, -0.453661, -0.028828, 1.418927, 0.666847, 0.346317, 0.233187, 0.019955, 0.173432, 0.525384, 0.274419, 0.837025, 0.125176, 0.530865, 0.027210, 0.055522, 0.205213, -0.371055, 0.496979, 0.002934, -0.837606, 0.710249, -0.203816, 0.315042, 0.454489, 0.136429, -0.292216, -0.211456, 0.411402, -0.241496, 0.269549, 0.522684, -0.191559, -0.436910, 1.925282, 0.508003, 0.230075, 1.123712, 0.013216, -0.492970, 0.161226, -0.070232, -0.710346, -0.838882, 1.035381, -0.244728, -0.086632, 0.027472, -0.539331, 0.239075, -0.244135, -0.405148, -0.214502, -0.137131, -0.116478, -0.703058, 0.211669, 0.599504, -1.042733, -0.321768, 0.162028, -0.830722, 0.042251, 0.219232, -0.505819, -0.525208, 0.050777, -0.861881, -0.402479, 0.434640, 0.772818, 0.782870, 1.001795, 0.248292, -0.387453, -0.107300, -0.758720, -0.208899, 0.528115, 0.289283, 0.489399, 0.912513, -0.210874, 0.203608, 0.049876, -0.114295, -0.007742, 0.539633, 0.050472, -0.133617, -0.214242, -0.130300, -0.247959, 0.339934, -0.129543, -0.138593, 0.336273, -0.408567, -1.061121, 0.019215, -0.498066, -0.526602, -0.308189, -0.089594, -0.346300, -0.181327, 0.041079, -0.154597, -0.157844, 0.072551, 0.383802, -0.846576, -0.472319]
-,        [0.197315, 0.072949, -0.074690, 0.227356, 0.545851, -0.366839, 0.714370, 0.011066, -0.048057, -0.119331, -0.379820, -0.042913, -0.264612, -0.465501, 0.271540, 0.341774, 0.331430, -2.100466, -4.126751, 0.825593, -1.166342, -1.969295, -3.451304, 1.127299, -1.123564, -0.615176, -1.901252, 1.384654, -0.908575, -0.941252, -3.453439, 1.598963, -0.291780, -1.068623, -1.837304, 1.594454, -1.105726, -2.015840, -3.435192, 1.034004, -2.187357, -3.000744, -3.155008, 0.814086, -2.266277, -2.635426, -3.862096, 1.185633, -1.232395, -2.292250, -3.661659, 0.961886, -0.481420, -3.239844, -3.919511, 0.336285, -1.341594, -1.823399, -3.100001, 0.613933, -3.204578, -1.185151, -2.317182, 1.730286, -0.371031, -0.655467, -1.634622, 1.944121, -0.418212, 0.052025, -0.125692, 0.273004, 0.156934, -0.613155, -0.137349, -0.155626, 0.185998, 0.027664, -0.108344, 0.120500, 0.031652, -0.370851, 0.086321, 0.104771, -0.037143, 0.011409, -0.065585, 0.190359, -0.054838, -0.384073, 0.140362, -0.041757, -0.083108, -0.402717, 0.035073, -0.354509, -0.275936, 0.075115, -0.156760, -0.044187, -0.158247, -0.036940, 0.516594, -0.151560, 0.082213, 0.038155, 0.264310, -0.022627, -0.078084, -0.399153, 0.207889, 0.015082, 0.302738, -0.208428, -0.059495, -0.223281, -0.124793, -0.478841, -0.057728, -0.483470, -0.172225, 0.276665, 0.076182, 0.107810, 0.038918, 0.104237, 0.058567, 0.010332, 0.404274, 0.097826, 0.210640, -0.209892, -0.157884, 0.076058, 0.098400, 0.218704, 0.340162, 0.475670, 0.913762, -0.738519]
-,        [0.378346, 0.111096, -0.169145, 0.205154, 0.207400, -0.737358, 0.486416, -0.347685, -0.001226, 0.149821, 0.992781, 0.366627, -0.139166, 0.282020, 0.608424, -0.713756, 0.339023, -0.260784, -0.262607, -0.562807, -0.634936, 0.140766, 0.869318, 0.356548, 0.103256, 0.104046, 0.414132, -0.760907, 0.363193, 0.646449, 0.079255, 0.393863, 0.290616, 0.275852, 0.534876, -0.161586, 0.436088, -0.370495, 1.515251, -0.243070, -0.474739, 1.100327, -0.044201, 0.178416, -0.219762, -0.369068, 0.582419, -0.438906, -0.064569, 0.658186, -0.549450, -1.494722, -0.896511, -0.180009, -0.125255, -0.396762, -0.258813, -1.087158, 0.158478, -0.016713, -0.074565, 0.235128, 0.830632, -0.110180, -0.216582, 1.060663, 0.240439, 0.682568, 0.130983, -0.791113, 0.495313, -0.427464, -0.815007, 0.578619, 0.586824, -0.355955, 0.077935, 0.271883, 0.230182, -0.462693, -0.008459, -0.072044, -0.131751, -0.145711, 0.405463, -0.342589, -0.076199, 0.582303, 0.306949, -0.427755, -0.392426, -1.410641, -0.317610, -0.662340, -0.626865, -0.500585, -0.780811, -0.703514, -0.623728, -0.036840, -0.324440, -0.495144, -0.546885, -0.527216, -0.789721, 0.263662, 0.381796, 0.374970, -0.781934, 0.233421, 0.046815, -0.762969, -0.237538, -0.770972, -0.005991, 0.114106, -0.626800, -0.491806, -0.975608, -0.448001, 0.158114, -0.008369, 0.276398, -0.134532, -0.970789, -1.123116, -0.473529, -0.615021, -0.126588, -0.350727, -0.055074, -0.061919, -0.070868, 0.043736, -0.372586, -0.330368, 0.514211, 0.568511, -1.485659, -0.084484]
-,        [-0.549509, 0.074364, 0.471394, 1.013647, -0.562324, 0.232822, -0.229459, 0.261400, 0.428732, 0.898400, -0.226221, 0.099740, -0.091804, -0.250032, 1.025529, 0.193784, -0.226141, 0.547340, 0.262931, 0.254017, 1.335936, 0.457849, 0.525409, 0.395582, 0.056979, 0.408255, -0.349341, 0.558842, 1.331339, 0.419154, 0.333608, 0.344865, 0.418549, -0.494667, -0.210875, -1.007057, -0.155112, 0.920884, 0.802679, 0.142580, 0.347515, 0.407647, 0.280258, -0.187728, -0.884003, 0.375546, -0.324390, 0.102169, 0.732850, -0.189325, -0.369236, -0.385102, 1.360491, -0.132037, -0.108875, 1.058650, 0.434152, 0.352233, 0.049789, -0.201526, 0.019513, -0.768532, -0.667375, -0.406481, -0.092994, 0.983496, 0.544464, -0.289022, -0.330326, -0.372803, -0.394535, -0.450384, -0.431539, -0.250811, -0.394398, -0.233469, 0.049080, -0.558628, 0.348138, -1.006237, -0.170771, -0.018202, 0.193669, 0.419534, 0.003079, -0.748776, 0.132875, 0.056790, -0.524145, -0.095268, 0.279379, -0.194943, -0.419134, 0.446419, 0.755212, -0.113052, 0.497516, 0.437066, -0.093292, -0.374877, -0.458490, 0.187427, -0.041750, -0.761244, -0.148823, -0.490670, 1.051132, -0.847289, -0.415964, 0.031651, -0.558742, -0.640889, -0.777600, 0.865278, 0.745136, -0.093019, -0.544306, -0.120454, 0.273851, -0.274442, -0.055429, 0.335062, -0.156297, 0.421946, 0.336121, 0.055462, -0.290422, -0.084416, 0.430273, 0.498866, -0.109152, 0.533613, 0.231440, 0.808563, 0.015919, 0.126990, -0.655926, 0.002879, 0.954300, 0.157880]
-,        [0.464950, -1.111639, -0.734045, 0.315738, 0.493782, -0.080492, 0.117153, 0.652547, 0.217386, -0.862709, 0.130441, -1.129788, -0.181319, -0.809421, -0.842841, 0.118092, 0.611417, 0.228486, 0.594250, 0.484825, 0.229006, -0.499974, 0.000732, -0.151765, -0.674837, -0.019511, 0.045572, 0.233144, -0.010078, -0.128868, -0.461709, -0.608915, 0.074288, -0.345746, -0.250994, 0.058561, -0.396333, 0.099976, -0.243224, 0.581670, 0.410985, 1.185786, 0.147520, 1.076167, 1.373478, -0.519898, -0.189922, -0.155894, -0.069269, -0.356188, 0.670254, -0.278396, 0.391873, 0.152695, -0.905310, -0.537984, 0.229761, 0.217047, 0.337497, -0.171010, 0.935396, -0.438758, -0.693220, -0.750219, 0.605875, -0.721313, -0.415956, -0.123868, 0.308929, -0.296937, -0.513623, -0.556825, -0.093569, -0.170650, -0.364877, -0.246544, -0.310905, -0.085079, -0.169346, -0.148270, -0.157293, -0.665356, 0.231018, -0.428692, 0.435903, -0.122152, -0.076921, -0.105290, 0.721915, -0.295359, 0.299675, -0.241074, 0.515996, -0.665364, -0.520233, -0.559083, 0.260487, -0.784432, 0.088033, -0.016840, 0.105858, 0.194159, 0.081600, 0.247525, -0.046288, 0.207638, 0.318604, 0.317319, 0.184079, 0.003932, 0.324450, -0.247294, 0.239046, -0.523418, -0.684442, -0.418545, -0.018543, 0.442119, -0.147231, 0.326373, 0.130390, -0.117951, 0.014530, 0.217551, -0.977423, -0.250813, 0.229413, -0.109844, 0.151326, 0.122605, -0.394995, 0.389721, 0.520378, -0.347192, -0.078626, -0.240702, -0.039737, 0.436682, -6.894183, 0.809867]
-,        [-0.219558, -0.253911, 0.568876, -0.236477, -0.127561, 0.084817, -0.671591, 0.802492, 0.495164, -1.156349, 0.389529, -1.340919, -0.556120, -1.150739, -0.907451, -0.873329, 0.995573, -0.979326, -0.109271, -0.467170, -0.510805, -0.394829, -0.790350, 0.038536, -0.637863, 0.083282, 0.143794, -0.315655, 0.683567, -0.181817, -0.647766, 1.049222, 0.653278, 0.148805, 0.304886, -0.129822, -0.668245, -0.088644, -0.096584, -0.583877, 0.371862, -0.356911, 0.661990, 0.254274, 1.210651, -0.005515, -0.157900, -1.411197, -0.269898, -0.589478, 1.015511, -0.179669, 0.824820, -0.262604, -1.249435, -0.592666, 1.499495, -0.385148, -0.677176, -0.327163, 0.044805, -0.049239, -0.741257, 0.138022, 0.527736, -0.590098, -0.321536, 0.010566, 0.236651, -1.048713, 0.466227, -0.419192, 0.106975, 0.170540, -0.096131, -0.220535, 0.085619, -0.521102, -0.110387, -0.235853, -0.528968, -0.300122, 0.497793, -0.300870, 1.143844, -0.636467, -0.162691, -0.336593, 0.633087, -0.310316, 0.426036, -0.592132, -0.343011, 0.326404, 0.087819, -0.144951, 0.286199, 0.167173, -0.417793, -0.626973, 0.133678, -0.239594, -0.189440, -0.333520, -0.067075, -0.013455, 0.035615, -0.556842, -0.313204, -0.662879, -0.399432, -0.497698, 0.357597, 0.207039, -1.172656, -0.931062, 0.280091, 0.324708, -0.118348, -0.204903, 0.800584, 0.157238, -0.228398, 0.009863, -0.118408, 0.170217, 0.022140, -0.098436, 0.275907, -0.265291, -0.888906, -1.591341, -0.763593, -0.213770, -0.616252, -0.918534, 0.322107, -0.342027, -3.123490, 0.095208]
-,        [0.660808, -1.146046, 0.109362, -0.257211, 0.051598, 0.303643, 0.186528, -0.155627, -0.155554, 0.162228, -0.591681, -0.370923, 0.603964, 0.532786, 0.095348, -0.158847, -1.142733, 0.810677, 0.680870, 0.886758, 0.756931, -0.094405, 0.471494, 0.233388, -1.123411, 0.209063, -0.303870, -0.802253, -0.973781, -0.977044, -1.146605, -1.825174, -1.227835, -0.542391, -0.445391, -0.941372, -0.456931, 0.200843, 0.306813, 0.186368, -0.156152, -0.073519, -1.603689, -2.532007, -2.555956, -0.385900, 0.545646, -0.808661, -0.259996, 0.612369, 0.409815, 0.461340, 0.422617, -1.082180, -0.827438, -0.586036, -1.884368, -0.314880, 0.081235, 0.071758, -0.015631, 0.440817, -0.505461, -0.504775, 0.777354, -0.741467, -1.584931, -1.126055, -1.049737, -0.649247, 0.305731, -0.108378, -0.593359, 0.124047, 0.063305, 0.123803, -0.072420, 1.055643, -0.048680, -0.087572, -0.288940, 0.174991, 0.396366, -0.080659, -0.110839, -0.247367, -0.453321, -0.313638, 0.214252, 0.019558, 0.332252, -0.013486, -0.077050, -0.125684, -0.816202, -1.123249, -0.426847, -0.277311, 0.106855, -0.632409, -0.179572, -0.557426, -0.524257, -0.186768, -0.480232, 0.408167, 0.050341, -0.366560, -0.646009, -0.042886, 0.167102, 0.480151, -0.243910, 0.010636, 0.069363, -0.338341, 0.235791, -0.257893, -0.280808, -0.126216, -0.275771, -0.029313, 0.149058, 0.256092, 0.051141, -0.248357, -0.458453, -1.404882, -3.250907, -1.990318, -1.375933, -0.560004, -0.503875, -0.337920, -0.030630, -0.280376, 0.095979, -0.293162, -0.827400, -0.819620]
-,        [-0.253507, 0.067579, -0.473865, -0.033553, 0.104539, 0.252199, 0.530934, -0.344185, -0.035862, 0.704990, -0.494026, -0.620780, -1.096630, -0.250875, -0.338989, 0.061684, 0.086314, -0.242646, -1.217014, 0.458799, 0.397032, 0.336936, -0.340514, 0.312803, 0.906130, -0.576394, 0.101766, 0.346776, 1.375291, -0.226211, 0.158063, -0.105928, -0.034762, -1.260943, 0.368679, -0.071120, -0.759349, -1.058941, 0.842742, 0.246806, -0.233688, 0.294084, -1.010926, -0.215534, -0.291103, 0.076844, -0.444859, 0.634104, 0.584041, 0.232406, -0.073667, -0.465418, -0.282154, 0.373805, 0.710569, 1.387054, 0.253343, 0.094768, -0.772829, 0.779839, -0.055813, -2.017839, -0.349204, 0.923725, -0.028912, -0.700134, -0.177950, -0.413029, -0.513170, 0.024555, -0.599418, -0.191873, 0.273997, -0.184545, 0.349018, -0.779179, 0.250866, 0.000661, -1.244738, -0.004397, -0.594510, -0.360204, -0.551952, -0.588164, -0.674424, -0.614505, -0.171991, -0.585226, -0.381331, -0.575839, -0.036987, 0.258144, 0.426978, 0.366737, -0.238349, -0.132179, 0.020453, -0.164991, -0.524853, -0.739924, -0.163108, 0.891499, 0.292732, -0.316760, 0.218271, -0.481730, -0.397803, -0.406545, -0.235571, -0.039359, -0.349423, 0.084390, -0.329384, 0.357692, 0.092541, -0.332223, 0.074506, -0.140581, 0.103127, -0.268994, -0.059869, -0.020554, -0.230354, -0.151248, 0.035480, 0.072448, -0.230255, 0.534918, 0.516278, 0.370173, 0.451481, 0.369691, 0.113229, 0.240809, 0.781289, 0.255244, -0.142717, 0.647346, 0.796286, 0.142889]
-,        [0.071417, 0.661317, 0.230360, -0.293618, 1.049262, -0.077439, -0.375845, 0.136681, 0.665663, -0.308812, 0.836586, 0.016613, 0.669147, 0.141034, -0.154869, 0.801619, -0.106026, 0.947912, 0.615981, 0.217271, 0.786513, 0.634644, 0.244055, 0.765719, 0.346010, 0.545388, 0.869688, 0.403377, 0.765181, 0.174220, -0.577748, 0.389365, 0.463378, 0.516372, 0.784002, 0.076420, 0.299121, 0.151646, 0.576463, 0.259681, 0.894117, 0.426241, 0.418087, -0.001406, 0.397694, 0.797819, 0.648678, -0.104110, 0.277456, 0.389784, 0.636259, 0.181823, -0.020171, 0.556562, 0.199103, -0.044334, 0.351752, 0.335041, 0.258567, 0.324101, 0.458222, 0.662542, 0.618261, 0.994485, 0.445882, 0.750581, -0.212393, 0.572395, 0.286541, -0.211360, -0.044496, 0.143056, -0.176018, -0.260136, 0.061875, -0.032156, -0.260084, -0.032882, 0.886994, -0.216793, -0.137867, -0.180008, -0.351783, -0.056798, -0.969352, -0.554369, -0.093017, 0.158309, 0.082158, -0.019625, 0.332362, 0.580115, 0.357927, 0.090266, 0.060560, 0.401221, -0.291779, -0.186921, 0.326344, 0.233441, -0.111269, -0.378562, 0.348861, -0.106777, 0.204063, -0.267963, 0.516086, -0.060431, 0.104489, -0.143049, 0.565796, 0.063953, -0.054729, -0.585045, -0.177396, 0.664141, -0.400193, 0.097690, -0.202650, -0.166494, -0.413508, -0.248031, -0.651403, -0.371556, -0.816022, 0.278315, 0.716453, -0.533633, 0.372620, -0.352114, -0.135240, -0.416968, 0.208427, -0.132228, 0.179266, 0.402686, 0.491826, -0.315100, -1.341017, -0.313129]
-    ],
-    "trunk.0.bias": [-0.096951, 0.159315, 0.659019, -0.494976, -0.223398, 1.044974, 0.396342, 1.061778, 0.123915, -0.045460, -0.074882, 0.426558, -0.162609, 0.548142, -0.169641, 0.596240, -0.071415, -0.017785, -0.113707, -0.615177, -0.294307, -0.356338, 1.698619, -0.164949, 0.063399, 0.981682, 0.220694, 0.072801, -0.261371, -0.037425, 0.273143, -0.244676, 0.310719, -0.161373, -0.423577, 0.150470, 0.180514, 0.130344, -0.478595, -0.352730, 0.449552, -0.129355, -0.566255, 0.011711, 0.047635, -0.127131, -0.594710, -0.102294, 0.101558, -0.204799, 1.380438, -0.428515, 0.454922, -0.488705, -0.174460, -0.659909, -0.604552, -0.256938, 0.299904, 0.871786, -0.199740, 0.017215, 0.517447, 1.205566, 0.191308, -0.728593, 0.182729, 0.256554, -0.458867, -0.690869, -0.033829, 0.072414, 0.364024, -0.306909, -0.478939, 0.493915, 0.308506, -0.437725, 0.343343, 0.074266, 0.048670, -0.393210, 0.050824, -0.579360, -0.394513, -0.088736, -0.367062, 2.201519, -0.029929, -0.171453, 0.474278, -0.284002, 0.051734, 0.341602, -0.428003, -0.159079, 1.906158, 0.125804, 0.344638, -0.012016, 0.213052, 0.290615, -0.184813, 0.166627, 0.047853, -0.208370, -0.270717, -0.051606, 0.033733, -0.260817, -0.264560, -0.418675, 0.031886, -0.099899, 1.343397, -0.043076, 0.195188, -0.176997, 0.090020, -0.118636, 0.026071, -0.420793, 0.323435, -0.668177, 0.135277, -0.469423, -0.131101, -0.318903, 0.434361, -0.231387, 0.799957, -0.341091, -0.296439, -0.113968, -0.615024, 0.244132, 0.335107, 0.182949, -0.265039, -0.087170, -0.218677, -0.459861, -0.365563, -0.571250, -0.374715, -0.079559, 0.496154, -0.266400, -0.243467, -0.423492, 0.668161, 1.852180, 0.173796, -0.046310, 0.317424, -0.118547, -0.456142, -0.421675, 0.024411, -0.162434, -0.471905, 0.608118, 0.110146, -0.444303, 0.088288, -0.134179, -0.177265, 0.003422, -0.209943, -0.308057, 0.856031, -0.281411, 0.076585, 0.242463, 1.664281, 0.128860, -0.125358, -0.375223, 1.694900, 1.038543, -0.174375, 0.143971, 0.026030, -0.180657, -0.218476, -0.318745, 0.553653, 0.036364, -0.229883, -0.012517, -0.270527, 0.059534, -0.257893, -0.320747, -0.016120, -0.164129, -0.190151, -0.488142, 1.048501, 0.073327, 1.923184, 0.624069, -0.020612, 0.095913, -0.168450, -0.480797, -0.024098, -0.116642, 0.468890, -0.419499, 0.170235, 0.308147, -0.145053, -0.074291, -0.664916, -0.471256, -0.010699, 0.110093, -0.273240, -0.238906, -0.014994, -0.139583, 0.595064, 1.439103, 0.325106, 0.298716, 1.577913, -0.533337, -0.400392, 0.253516, -0.114703, -0.085138, -0.228953, -0.021003, -0.652422, -0.256259, -0.005819, 0.037457, 0.034262, 0.695264, -0.205682, -0.178015, -0.373475, -0.290729, -0.537487, 0.106038, 1.655418, -0.398784, 0.054879, 0.025236, 0.176447, -0.475646, -0.269537, 0.156654, -0.215559, -0.262387],
-    "trunk.2.weight": [
-        [0.389694, 0.315890, 0.486200, 0.364026, 0.440311, -0.680635, 0.639054, -0.047599, -0.608420, -0.613779, -0.045734, -0.328194, 0.016646, 0.122069, -0.514976, -0.350789, -0.079207, 0.435592, 0.124666, -0.343318, -0.884333, -0.007911, -0.575156, -0.290604, -0.442648, 0.396636, 0.056942, -0.584085, -0.497318, -0.366813, -0.221860, -0.259054, -0.126650, 0.112345, 0.086262, -0.449281, -0.705499, 0.027891, -0.288376, 1.317391, 0.517867, -0.297819, 0.373412, 0.171710, -0.469271, -0.116635, 0.171288, -0.341568, 0.221328, 0.223129, -0.241306, 0.467127, -0.497913, 0.219454, -0.606685, -0.190874, -0.463571, -0.080489, -0.186908, 0.067577, -1.029057, -0.748510, -0.086947, -0.568658, -0.857837, 0.268958, 0.100964, 0.159023, -0.202047, 0.877911, -0.303191, -0.235078, -0.246380, 0.183926, -0.962375, -0.563562, -0.659877, 0.460248, 0.262373, -0.092749, -0.566451, -0.305556, 0.394431, 0.598104, 0.214496, -0.102227, 0.962785, 0.317949, -0.757380, 0.463911, -0.363845, 0.368028, 0.339382, -0.107584, 0.150964, 0.384799, -0.055446, -0.998356, -0.428935, -0.367507, -0.243697, 0.311681, -0.308454, -0.456915, 0.342898, -0.087928, -0.243285, -0.395439, 0.158080, 0.347465, 0.169181, 0.130058, 0.142360, 0.453890, -0.014284, -0.813613, -0.395188, -0.407316, 0.016579, -0.309617, 0.204809, 0.290048, 0.539275, -0.257012, 0.089660, 0.239249, -0.581977, -0.123579, -1.024035, 0.692945, -0.054092, -0.418401, -0.541319, -0.107500, 0.161775, -0.480322, -0.190965, -0.267155, -0.555004, -0.565372, 0.080862, -0.305389, 0.537237, 0.254201, -0.212297, 0.297021, 0.336768, -0.634128, 0.290786, 0.418994, -0.753614, -0.434112, 0.250768, 0.259200, -0.431537, -0.322241, -0.068293, -0.067486, -0.125206, 0.586574, 0.282730, 0.425310, -0.011704, -0.140024, 0.357426, 0.403217, 0.136166, -0.164811, 0.079024, -0.682882, -0.081883, 0.443942, 0.073295, 0.100235, -0.435757, -0.696424, -0.013054, -0.137325, -0.284062, -1.160745, 0.164199, -0.253314, -0.864472, 0.297618, 0.621902, 0.048464, -0.228431, -0.248023, -0.266904, 0.110062, -0.053532, -0.190208, 0.663188, 0.118951, -0.379890, -0.557892, -0.202864, -0.441786, -0.399679, -0.014981, 0.286340, -0.601985, -0.306474, -0.289091, 0.310742, 0.259637, -0.106341, 0.293677, -0.477000, 0.140229, -0.230236, -0.378442, 0.056107, 0.800789, 0.627576, -0.346073, -0.820825, -0.908273, 0.401993, 0.330116, -0.408540, -0.002608, -0.618430, -0.537714, -0.124422, 0.286089, 0.026404, 0.375307, -0.236395, -0.043203, 0.161120, -0.028925, 0.188592, 0.065640, 0.735287, -0.369647, 1.005524, -1.092296, 0.113915, -0.198503, 0.331718, -0.110976, -0.209860, 0.423517, 0.442930, 0.152056, 0.209893, 0.209813, 0.313872, 0.198813, -0.245423, -0.064104, 0.187044, -0.761863, -0.225146, 0.151342]
-,        [-0.049097, 0.005733, -0.027414, 0.066875, -0.019158, -0.168312, -0.097490, -0.060893, -0.268533, -0.008172, -0.156916, 0.123889, 0.016456, -0.141329, 0.023102, -0.038391, -0.071237, -0.001203, -0.115831, -0.136600, -0.096030, -0.049016, -0.131031, 0.064748, -0.161027, 0.044834, 0.059279, -0.078578, -0.074831, -0.105296, 0.034226, -0.001436, -0.041042, -0.018898, -0.006232, 0.032060, 0.131907, 0.024109, -0.072630, -0.056983, -0.070723, 0.014010, 0.071010, 0.042438, 0.067245, 0.160849, -0.146043, 0.017408, -0.221517, -0.100368, -0.007411, -0.155226, -0.120556, 0.076448, -0.125278, -0.103716, 0.018536, -0.206622, -0.047393, 0.042624, -0.033149, -0.007100, 0.060372, -0.015911, 0.064909, -0.056849, -0.008920, 0.113970, -0.066674, -0.239394, 0.016174, -0.004897, -0.007388, 0.141704, -0.205404, -0.031466, 0.102544, -0.059967, -0.169619, -0.067320, -0.062593, 0.011425, 0.022144, 0.013925, -0.251725, -0.128090, -0.080064, 0.049316, -0.077302, 0.018851, -0.075771, -0.167054, -0.280046, -0.011600, -0.188027, -0.285901, -0.168228, 0.064940, 0.008989, -0.126368, -0.098457, -0.090258, 0.005382, 0.074737, -0.197462, -0.149171, -0.071637, 0.072535, -0.228159, -0.048793, -0.101911, -0.146359, -0.058467, -0.046232, 0.082772, -0.149866, -0.157893, -0.121253, 0.052307, 0.034332, 0.000016, 0.116421, -0.119207, 0.133023, -0.019790, 0.052575, 0.104616, -0.069534, 0.062945, -0.125592, -0.004369, -0.075611, -0.025225, -0.232577, -0.073161, -0.216095, 0.056374, -0.012913, 0.068368, -0.068550, -0.004733, -0.108522, -0.126576, -0.202208, -0.078226, -0.030465, -0.167233, -0.120396, -0.074459, 0.087471, 0.008815, 0.033359, 0.011024, -0.045405, -0.010708, -0.028744, -0.275725, 0.008662, -0.117990, -0.013604, -0.073100, -0.096766, -0.103517, -0.061077, -0.072859, -0.074814, -0.200471, -0.113623, -0.227669, 0.058757, 0.027443, -0.006142, -0.072474, -0.009949, -0.024987, -0.036538, 0.042259, 0.007048, -0.013529, -0.005634, -0.030283, 0.037399, 0.115867, 0.078363, -0.034081, -0.057957, 0.068153, -0.119958, -0.118041, -0.024948, -0.063244, -0.113574, 0.237041, -0.168493, -0.136905, 0.061142, 0.091548, -0.044723, -0.160931, -0.231609, -0.125537, -0.142958, -0.077942, 0.010470, 0.000865, -0.032377, -0.055006, -0.122901, 0.146345, 0.124975, 0.102710, -0.060408, 0.033743, 0.043521, -0.041277, -0.024885, 0.147652, -0.004576, -0.044006, 0.083957, -0.184515, -0.110172, -0.012343, -0.015784, 0.077145, 0.049237, -0.277387, 0.203472, 0.015408, 0.016536, -0.245317, -0.017772, 0.049338, 0.020524, -0.096653, -0.118913, -0.060460, 0.025986, -0.028854, -0.127175, 0.013946, 0.124828, 0.049363, 0.034216, -0.065717, -0.058701, -0.121504, 0.066006, 0.084046, -0.132258, 0.008064, -0.049956, -0.007023, 0.007037, -0.059675, 0.149226]
-,        [-0.206209, -0.568954, 0.193835, -0.179415, -0.328869, 0.417474, -0.608570, -0.062825, -1.280499, -0.566933, 0.265409, -0.415365, -0.034492, -0.552235, 0.170790, -0.222009, -0.030009, -0.636408, 0.371725, 0.101584, 0.103978, 0.000028, -0.840083, -0.104490, 0.219434, 0.084475, -0.348496, -1.466921, 0.304195, -0.186241, -0.518717, -0.320722, -0.339591, -0.349985, 0.066452, -0.762877, -0.225691, 0.053335, -0.293188, 0.405221, 0.298445, -0.543750, 0.475951, -0.525639, -0.266066, 0.526154, 0.236437, 0.132666, -0.297654, -0.276631, 0.030430, -0.273690, -0.257136, -0.070680, 0.280073, -0.365445, -0.424605, 0.199761, -0.248908, 0.211576, -0.096878, 0.022727, -0.073929, -0.179844, -0.414007, -1.188810, -0.101122, -0.308654, 0.358082, 0.465675, -0.232570, -0.156853, 0.053218, -0.550824, -0.110880, -0.686484, 0.319467, -0.229988, 0.282785, -0.189921, 0.270655, -0.447489, -0.199775, 0.028119, -0.257318, 0.138966, -0.071958, 0.037577, -0.686389, -0.141366, -0.662344, 0.483617, -0.182967, -0.413618, 0.301390, 0.173242, -0.149677, -0.115264, -0.058104, 0.619559, 0.235155, 0.163967, -0.455174, 0.286588, -0.211256, 0.272952, -0.099825, -1.180302, 0.749694, 0.010407, -0.172047, -0.196293, -0.196079, -0.041804, 0.083500, -0.070968, -0.071876, -0.108840, -0.466257, -0.401817, 0.428717, 0.644539, -0.586502, -0.092529, 0.015982, -0.531366, -0.068707, -0.325239, -0.827918, -0.361375, -0.473476, 0.289821, -0.648291, 0.065828, -0.114807, 0.059552, -0.041755, -0.721177, 0.383528, -0.433391, 0.003184, -0.200504, -0.412670, -0.463861, -0.060920, -0.289206, -0.005508, -0.041511, -0.138554, 0.349767, -0.269269, -0.169263, -0.106091, -0.269397, -0.431890, -0.345312, -0.229831, -0.155492, 0.078274, 0.040210, -0.137158, -0.307931, -0.123631, -0.116437, -0.041062, -0.423066, -0.443622, -0.270259, 0.205987, -0.349787, 0.290071, -0.136117, -0.418019, 0.084081, -0.133642, -0.313099, -0.169548, 0.088264, -0.111382, 0.174945, -0.218231, -0.068129, -0.646465, -0.196513, -0.176063, 0.029182, 0.241354, -0.250331, 0.010324, -0.532117, -0.742147, -0.156361, -0.105230, -0.176353, -0.177838, 0.167147, 0.582011, -0.284172, -0.032782, -0.157614, 0.354685, -0.068308, -0.163358, -0.124687, -0.366470, -0.041342, -0.352802, -0.229701, 0.008670, -0.046726, -0.577552, -0.141138, 0.061912, 0.139544, 0.079271, -0.202481, -0.002492, 0.252102, 0.302419, -0.031406, -0.524422, 0.022223, -0.987063, -0.542702, 0.154071, -0.234049, -0.789140, 0.138082, 0.087930, 0.028401, 0.225737, 0.242009, 0.036234, 0.512891, 0.431260, -0.023673, -0.140721, -0.097360, 0.308305, -0.285044, -0.300157, -0.375225, -0.751098, -0.649143, -0.192860, -0.373559, 0.095148, 0.227932, 0.523628, 0.177399, -0.129643, -0.573549, 0.045511, -0.102763, 0.055761, 0.614092]
-,        [-0.023648, -0.162024, -0.123705, 0.007733, -0.203591, -0.299872, -0.137203, -0.422634, 0.073040, -0.280418, -0.191662, -0.051140, 0.075125, -0.178373, -0.211429, 0.032473, 0.051656, -0.305405, 0.147658, -0.229872, 0.023679, -0.225771, -0.094858, 0.025595, 0.113598, -0.326364, -0.363713, 0.093866, 0.196731, 0.008705, -0.195747, 0.008699, 0.050731, 0.354641, -0.119612, -0.250466, -0.134310, 0.246724, -0.137425, 0.169924, 0.197019, 0.162249, -0.411271, 0.177500, -0.165438, 0.193688, -0.139332, -0.123605, -0.121446, -0.009614, -0.323404, 0.005698, -0.320742, -0.019433, -0.100895, -0.068202, -0.100015, -0.369685, -0.127418, -0.077735, 0.237476, 0.356242, -0.020391, -0.025810, 0.141548, -0.317136, -0.297307, -0.111878, -0.098209, -0.019615, -0.216559, -0.319003, -0.006354, 0.018465, -0.048583, 0.193216, -0.036531, -0.165701, 0.136236, -0.228714, 0.010340, 0.124030, -0.076597, -0.012574, 0.239435, 0.020736, -0.407028, 0.085652, -0.185962, 0.234894, -0.024149, 0.094165, -0.152740, -0.120494, -0.130575, -0.050912, -0.147082, -0.005797, -0.025018, 0.032106, -0.048952, 0.062152, -0.086334, -0.048857, -0.371384, 0.084877, 0.074649, 0.012271, -0.152747, 0.348246, -0.029519, 0.000789, -0.016556, 0.008050, 0.170827, -0.466975, -0.141523, -0.088860, 0.012733, -0.059453, -0.069344, 0.032557, 0.185961, -0.219072, 0.098095, -0.575270, 0.072199, 0.172431, -0.201227, -0.110571, -0.047935, -0.316817, -0.165741, -0.294808, -0.236513, -0.013370, -0.112223, -0.082462, -0.126353, -0.017691, 0.043660, 0.074458, -0.181468, -0.384114, -0.111902, 0.190333, -0.039896, -0.210477, -0.160675, 0.310450, 0.288215, -0.115471, -0.181940, -0.016676, -0.257150, -0.264406, -0.091221, 0.070329, -0.038044, -0.013152, -0.058644, 0.029840, 0.042332, 0.148846, -0.040314, 0.041217, -0.060060, 0.034900, 0.062905, -0.214880, 0.267186, 0.137285, 0.153827, 0.033631, -0.097667, -0.085669, -0.036380, -0.007131, -0.414979, -0.356778, -0.076406, 0.038418, 0.071728, 0.007980, -0.155983, -0.203060, -0.233606, 0.124248, 0.054028, -0.051080, 0.013477, -0.238839, 0.179595, 0.063428, 0.090443, 0.190717, -0.322223, -0.123297, -0.020100, -0.303758, 0.029558, -0.214606, -0.116982, 0.003188, 0.123924, 0.082235, -0.042314, 0.141873, -0.062058, -0.314670, 0.083047, 0.237829, -0.048269, -0.059926, 0.225391, -0.197724, -0.295354, -0.040215, -0.043301, -0.116665, -0.157322, -0.096764, 0.076371, -0.062100, -0.096150, -0.184108, 0.026580, -0.160253, 0.177868, -0.000046, 0.248792, -0.073849, -0.155161, 0.056427, -0.173307, 0.082863, 0.133648, -0.018304, -0.154718, -0.323689, 0.002881, 0.026216, -0.114860, -0.127739, -0.063774, -0.151849, -0.269717, 0.025606, -0.055290, -0.017945, 0.299214, -0.428318, -0.191027, 0.112973, 0.110771, -0.027344]
-,        [0.197165, 0.097688, 0.357765, 0.012515, -0.115632, 0.154566, -0.441613, 0.339368, -0.528752, -0.096354, 0.228882, 0.210242, 0.088393, 0.043092, -0.177655, -0.116680, -0.142484, -0.212784, 0.089271, -0.425386, -0.249366, 0.114322, -0.263244, -0.325664, -0.050700, -0.063417, -0.133586, -0.070284, -0.213015, 0.121322, 0.487395, -0.309566, 0.187775, 0.143837, 0.022801, -0.462709, 0.016571, 0.088912, -0.139379, 0.395081, 0.105705, 0.280983, 0.628494, -0.272617, -0.104049, 0.366952, 0.163979, -0.131980, -0.216270, -0.195138, 0.327364, -0.292630, -0.191640, -0.121190, -0.544613, -0.140057, -0.153478, 0.139500, 0.106509, 0.031519, 0.179838, -0.203870, -0.433579, -0.229150, 0.028453, -0.034802, -0.123245, -0.033118, -0.126397, -0.288211, -0.156794, -0.308909, 0.337574, -0.235177, 0.053698, 0.061649, -0.181827, -0.112983, -0.326469, -0.149031, -0.385765, -0.601648, 0.250560, -0.442128, -0.233343, -0.102409, -0.327556, -0.269955, 0.559806, -0.050068, -0.615714, -0.377707, -0.513001, -0.635936, -0.237054, 0.052063, 0.106135, -0.479481, -0.161837, 0.169111, -0.099960, -0.338432, -0.103738, -0.357040, -0.303377, -0.123305, -0.245009, -0.551306, -0.135590, 0.081173, -0.051546, 0.229238, 0.022065, -0.079128, 0.411984, 0.006082, 0.133922, -0.843787, 0.267341, 0.203158, -0.428782, 0.029548, -0.532838, -0.384793, 0.064205, -0.188157, -0.115562, 0.033745, -0.368096, -0.221641, -0.305542, -0.204500, -0.242976, 0.138853, -0.083407, -0.018503, 0.234896, -0.133905, -0.086644, -0.231974, 0.165317, -0.172195, 0.080804, -0.017103, -0.286778, -0.342310, -0.805310, 0.069767, -0.294379, 0.213460, -0.417697, 0.350024, 0.178237, -0.571129, -0.374815, -0.390917, -0.200414, -0.193693, -0.272352, -0.371194, -0.413018, -0.220284, 0.253748, -0.389070, 0.009746, 0.169375, -0.103913, -0.126716, -0.143024, 0.344485, -0.103604, -0.142594, -0.455703, -0.234662, 0.117062, -0.674514, -0.151517, -0.152344, -0.692548, -0.354977, 0.023930, -0.407740, -0.017322, -0.320473, -0.377702, -0.106876, -0.053449, 0.001029, 0.053086, -0.529144, -0.108027, -0.019689, -0.119045, 0.046036, -0.131816, -0.109578, 0.340836, 0.092725, -0.220963, -0.268739, 0.014254, -0.588419, -0.626080, 0.153106, -0.169091, 0.165258, 0.229998, -0.277827, 0.425774, -0.164123, 0.638067, -0.269121, 0.232563, 0.096119, -0.010956, -0.309503, -0.457532, -0.035751, -0.373142, -0.367181, -0.239598, -0.107142, -0.494826, -0.099502, 0.040565, -0.532888, -0.325557, 0.169743, -0.074776, -0.227993, -0.173581, -0.369500, -0.016418, -0.220357, 0.095121, -0.010375, 0.013399, -0.752598, -0.322922, -0.461894, -0.010705, 0.189078, -0.932815, -0.445278, -0.176908, -0.668697, 0.461128, -0.342056, 0.032826, 0.093554, -0.215776, -0.085446, 0.197778, -0.507500, -0.203542, -0.307062]
-,        [-0.419673, -0.647279, -0.092354, -0.381698, -0.769853, -0.882126, -0.320275, 0.234996, 0.191428, 0.208115, -0.057646, -0.466742, 0.228680, -0.207988, 0.302739, -0.477144, 0.107770, -0.371439, 0.404618, 0.184698, 0.412052, -0.282337, 0.218424, 0.287891, 0.102198, -0.022260, 0.099366, 0.229912, 0.134254, -0.217832, -0.272714, -0.001258, 0.022375, 0.142362, -0.481252, 0.303370, 0.359533, 0.144893, 0.350724, 0.051676, 0.146194, -0.103308, 0.317295, 0.028513, 0.163251, -0.110656, 0.340563, 0.434753, -0.074297, 0.200900, -0.255884, 0.443698, -0.574732, -0.291470, -0.026093, -0.190369, -0.031461, 0.656314, 0.079654, 0.182676, 0.611717, 0.039482, -0.531779, -0.145733, -0.006100, 0.102543, 0.381024, -0.302922, 0.103175, 0.058901, 0.372128, -0.636740, -0.053975, -0.265956, -0.272682, 0.121569, 0.003220, 0.100369, -0.206774, 0.005008, -0.337755, 0.262972, 0.128770, -0.576003, -0.267339, 0.566572, 0.023956, 0.069756, 0.618606, -0.185119, 0.634705, -0.325161, 0.380226, -0.322026, 0.025918, -0.206201, -0.067498, 0.509899, 0.148527, -0.142264, -0.079863, -0.082737, 0.165065, 0.365233, -0.127789, 0.434494, 0.353170, 0.342517, -0.061061, 0.401892, -0.654518, 0.467552, 0.149094, 0.766285, -0.652481, -0.158199, 0.104392, -0.355143, -0.770364, 0.179667, 0.073804, 0.107437, -0.225768, -0.373587, -0.141333, 0.041109, -0.167545, 0.115434, -0.966003, 0.292625, -0.129565, -0.308788, 0.333667, 0.118011, -0.239495, 0.075713, -0.221582, 0.318325, -0.218000, -0.387807, 0.224281, 0.428053, 0.023061, -0.097330, -0.140711, -0.221364, -0.400809, -0.180298, -0.443909, 0.191846, 0.061807, -0.117185, -0.171322, 0.059615, -0.238694, -0.094375, -0.223937, 0.125721, 0.425929, 0.286399, 0.431390, 0.604433, 0.310012, -0.049847, -0.066537, 0.696151, -0.200464, -0.192836, 0.418526, 0.307943, -0.329522, -0.125735, 0.132638, 0.226507, -0.191201, -0.117557, 0.275295, 0.208543, -1.632906, -0.689001, 0.194776, -0.076976, 0.463732, -0.305408, -0.614998, 0.052737, -0.113605, 0.126448, 0.261186, -0.193521, -0.088020, 0.257251, 0.474760, 0.031030, -0.222343, -0.033423, 0.074105, 0.294449, 0.009902, -0.196807, 0.082261, -0.292428, 0.198332, -0.166692, 0.080409, 0.607087, 0.431824, 0.110553, -0.783077, 0.077470, 0.692146, -0.047285, 0.286221, -0.067569, -0.226097, 0.433423, -0.253792, 0.278733, 0.583358, 0.005203, 0.733795, 0.401923, -0.204221, 0.175574, -0.434630, -0.340146, 0.035387, -0.019103, -0.144280, -0.793241, 0.314077, -0.218636, 0.041137, -0.179164, 0.141755, -0.184316, -0.116157, -0.041985, 0.012258, -0.771060, 0.251611, -0.050506, 0.489599, 0.068278, -0.270757, 0.335412, -0.284884, -0.023481, 0.078777, 0.108869, 0.059672, -0.137109, 0.059249, -0.422475, 0.513517, 0.811300]
-,        [-0.860833, 0.370701, 0.083255, -1.349241, 0.041973, -1.007719, -0.054557, 0.386545, 0.408772, 0.103174, -0.723151, -0.059990, -0.483306, -0.137256, -0.470900, -1.476158, 0.434876, 0.182430, 0.017188, -0.116180, 0.267060, -0.123537, -0.156134, -0.800644, -0.399776, -0.395255, -0.279472, -0.202689, -0.266273, -0.391113, -0.730220, 0.627990, -0.024856, -0.378713, 1.447790, -0.057128, -0.740385, -0.477226, -0.029720, 0.061788, -0.579391, -0.039112, 0.870846, 0.707071, 0.544744, 0.288437, -0.067003, -0.785268, 0.214614, -0.052300, -0.224206, -0.612539, -0.196426, -0.088487, 0.522513, 0.317041, 0.508758, -0.411716, 0.272240, -0.361177, 1.187890, 0.219018, 0.600188, -0.003436, -0.499673, -0.005616, 0.191933, -1.134463, -0.316736, 0.008629, 0.332495, -0.052025, -1.218262, -0.731289, -0.224387, -0.536656, 1.237230, -0.684058, 0.145255, -0.578191, -0.556393, -1.337205, -0.367042, 0.319098, -0.550920, -0.345576, 0.191902, 0.266123, 0.337128, -0.139660, -0.625961, -0.548291, 0.085887, -0.082263, -0.043344, 0.221728, 0.088341, -0.082633, -0.434684, -0.015118, -0.287082, -0.760538, 0.249593, -0.650593, -0.341628, -0.473656, -0.533575, -0.199743, 0.463434, 0.018103, -0.036112, -0.862876, -0.187058, -0.205740, -0.563691, -0.014497, 0.211204, -0.304314, 0.283504, 0.390740, -0.710242, -0.724819, -0.536553, -0.847179, -0.365510, -0.309295, 0.043244, -1.000612, -0.084124, -0.617610, 0.471172, 0.231681, -0.797852, 0.641914, -0.874534, -0.499823, -0.886128, 0.200793, -0.121497, -0.773374, 0.341237, -0.084637, 0.103633, -1.086357, 0.299980, 0.595879, 0.413258, -0.892443, -0.356929, -0.044122, 0.564235, -0.635577, 0.014286, -0.424058, -1.133332, -0.234241, -0.423143, -0.476864, -0.366745, 0.567548, -0.846309, -0.280498, 0.417082, 0.555348, -0.286544, 0.374574, 1.261662, 0.267406, -1.211056, -0.714549, -0.923841, -0.158461, -1.581456, 0.244243, -0.746174, 0.455309, -0.875854, -0.419862, -0.560017, -0.097457, -0.310755, -0.512215, 0.265447, -1.426852, 0.124998, -0.605484, -0.687514, 0.204736, 0.359739, -0.484224, -0.016446, 1.017137, -0.437182, 0.364932, 0.303425, -0.444312, -0.719350, 0.209594, -0.090497, 0.643169, 0.542639, -0.511561, 0.138393, -0.745658, -0.715042, -0.131064, -0.028582, -0.102846, 0.150360, 0.217371, 0.233912, -0.496173, -0.029857, 0.211256, 0.590737, -0.539645, -0.310297, 0.247401, 0.126021, -0.975891, 0.941878, -0.819280, 0.256023, 0.302616, -1.226901, -0.417837, -1.550873, -0.163134, -0.009899, 0.021501, -0.939157, -0.106066, 0.027730, 0.231647, 0.695886, -0.604251, 0.148557, 0.197995, 0.185746, -0.074368, -0.146253, 0.056770, 0.225290, -0.016239, 0.102443, -0.295251, -0.979002, 0.223345, -0.016197, -0.585458, -0.028656, -0.594790, 0.257639, -0.332853, -0.231005, -0.739581]
-,        [-0.088656, -0.275873, -0.069871, 0.264807, 0.046283, -0.027366, 0.392958, -0.719898, 0.180355, 0.090372, 0.210532, -0.474416, 0.345111, -0.236505, 0.276918, 0.221532, 0.621451, 0.250725, 0.452669, 0.927112, 0.310187, -0.258270, 0.084299, 0.099728, 0.186073, -0.474635, -0.461939, 0.576735, 0.348936, 0.179139, 0.005045, 0.477390, -0.049944, -0.106470, -0.127516, 0.387609, 0.059824, 0.718235, 0.490286, -0.090946, 0.433679, -0.232350, 0.137651, -0.655736, 0.287843, 0.543822, -0.530497, 0.111537, 0.006046, -0.381097, -0.276060, -0.189955, -0.353470, 0.090737, -0.036149, -0.352714, 0.138208, 0.351058, -0.468002, 0.152249, -0.005923, -0.003995, -0.044220, 0.250807, 0.478862, -0.122928, 0.508490, 0.107917, -0.139216, 0.027771, 0.464507, -0.417422, -0.306049, 0.208686, -0.000456, 0.524559, 0.390514, 0.285522, -0.036450, 0.238320, -0.211046, 0.500316, 0.259296, 0.243639, -0.032130, 0.446025, -0.065356, -0.227490, 0.339359, -0.158325, 0.567756, 0.094338, 0.463516, -0.127606, -0.007374, 0.289587, -0.482151, 0.858604, 0.234877, 0.566332, 0.283510, -0.013294, -0.144832, 0.187817, 0.177072, 0.401929, 0.772339, 0.619205, 0.447516, -0.096384, 0.694147, 0.344253, 0.171636, 0.199656, -0.379043, 0.218372, 0.577792, -0.282736, 0.086950, 0.556257, -0.076218, -0.265030, 0.017611, 0.223755, -0.354059, 0.331466, 0.260808, 0.225691, 0.287211, -0.167095, 0.290900, 0.412403, -0.248100, -0.158630, -0.032354, -0.097385, 0.311920, 0.639346, 0.150917, 0.238893, -0.058552, 0.109234, 0.731486, 0.608231, -0.015789, -0.312035, 0.511390, 0.355185, -0.460808, -0.639353, -0.214704, -0.342566, -0.259148, 0.089372, 0.144995, -0.078597, 0.205146, 0.380860, 0.123912, 0.186301, 0.719710, 0.484778, 0.236373, -0.354695, -0.276012, 0.515731, -0.285881, -0.082133, 0.143318, 0.015954, -0.138976, -0.080387, 0.124262, -0.558458, 0.007791, 0.630978, 0.226074, 0.027634, -0.899586, -0.194113, -0.056712, 0.387217, -0.034701, 0.040386, 0.677573, -0.021855, 0.303213, -0.123686, 0.329784, -0.042651, -0.415448, 0.148047, -0.162334, 0.038063, -0.487772, 0.197216, -0.057212, 0.301448, 0.107546, -0.050008, -0.228787, -0.928279, -0.161464, 0.557344, 0.010606, -0.176858, 0.023261, 0.187340, -0.259647, 0.113991, 0.187463, 0.483277, 0.100956, 0.078275, 0.503340, 0.028250, -0.086397, 0.041336, 0.280276, 0.249627, -0.522375, 0.399832, -0.786105, -0.110082, -0.191535, -0.181389, -0.158076, -0.234442, -0.067391, 0.131862, -0.007990, 0.016980, -0.050772, 0.351223, -0.390207, -0.375005, 0.051775, 0.170442, 0.155862, -0.534572, 0.026643, -0.050101, 0.047263, 0.495235, 0.501068, -0.486922, -0.606753, 0.141393, -0.019419, 0.206138, 0.298078, -0.134519, 0.667739, -0.331948, -0.500531, 0.088559]
-,        [-0.018280, -0.310176, -0.220762, -0.018098, -0.383522, -0.048143, -0.529484, -0.865615, 0.165383, 0.184038, 0.256835, -0.430686, -0.098614, 0.065179, -0.109389, -0.859225, -0.005748, -0.315520, 0.456482, 0.635216, 0.495204, 0.147463, 0.390695, 1.303958, 0.340120, -0.669107, 0.125123, 0.122746, 0.740442, -0.030975, 0.328049, -0.763723, 0.076045, 0.345014, -0.192190, 0.158767, -0.551960, -0.164382, -0.183051, 0.203145, 0.388841, 0.107997, 0.818773, -0.192180, -0.521063, 0.122970, 0.050482, 0.747413, -0.536175, -0.354072, -0.021692, 1.381338, -0.555609, 0.931080, 0.085566, -0.377091, 0.054277, -0.164379, 0.441169, -0.215201, 0.270921, -0.060236, -0.419524, 0.317208, 0.260298, 0.012215, -0.085265, -0.233401, 0.126168, -0.073565, 0.242672, -0.471862, -0.723556, 0.364934, -0.872403, 0.553079, -0.214347, -0.489910, 0.103499, -0.013332, -0.875418, -0.596053, -0.408976, 0.269015, 0.229835, 0.471189, 0.652133, 0.003760, 0.549132, 0.500942, 0.318680, -0.584098, 0.107899, -0.431865, -0.046356, 0.020908, -0.293075, -0.469414, 0.404633, -0.371338, 0.871761, 0.257131, 0.717459, 0.732860, -0.106485, 0.735885, 0.199083, 0.771762, -0.701266, -0.165597, -0.696441, -0.400446, -0.727571, 0.208102, -0.333938, 0.192130, 0.869398, -0.450782, -0.413867, 0.904941, 0.247307, 0.886123, -0.486692, 0.410015, -0.259289, -0.128810, 0.686297, 0.452891, -0.425138, -0.004314, -0.371674, -0.120634, 0.512162, -0.009948, -0.568870, 0.761612, -0.117243, 0.129609, 0.296048, -0.350097, -0.041358, -0.430770, -0.147999, -0.622333, -0.206336, -0.001678, 0.060094, -0.416829, -0.764429, 0.302115, 0.017421, 0.253174, 0.598672, 0.530148, -0.483856, 0.658377, -0.458685, 0.393315, -0.244934, 0.407187, 0.135102, 0.285329, -0.444760, 0.301528, 0.851431, -0.924128, 0.157137, -0.447036, 0.063482, 0.250430, -0.383794, 0.252351, 0.100870, 0.045084, -1.002859, -0.006405, 0.155296, -0.337142, -1.300554, -0.378390, -0.444533, -0.316664, 0.064827, -0.780636, 0.458211, 0.107276, 0.514121, 0.620748, 0.692988, -0.204779, 0.585908, 0.527377, 0.097459, 0.023788, 0.625635, 0.364693, -0.313175, -0.083471, -0.095372, 0.304586, -0.086857, -0.596284, 0.733253, -0.229124, -1.230546, 0.358090, 0.028044, -0.299435, -0.180427, -0.144527, -0.042221, -0.089946, -0.076402, 0.000955, 0.574031, 0.189474, 0.299631, 0.024563, -0.273517, -0.192192, -0.489814, 0.230206, -0.456345, 0.410513, 0.184503, -0.196109, -0.676122, -0.168606, 0.375400, -0.389034, 0.218045, -0.421196, 0.025180, -0.309016, 0.123773, 0.458571, -0.394238, 0.210658, 0.169973, -0.634585, 0.014476, -0.074725, -0.248723, -0.212745, -0.497935, -0.399284, -0.106888, 0.273801, 0.442756, -0.266059, 0.243162, -0.296988, 0.792985, -0.456303, -0.013423, 0.860524]
-,        [0.014014, 0.139091, 0.152036, -0.181307, 0.079749, -0.203076, -0.132584, 0.362941, 0.014949, 0.051978, 0.222644, -0.077914, -0.338792, -0.258542, 0.280095, -0.370751, 0.139141, 0.061290, -0.040595, 0.062720, -0.023297, -0.320578, -0.109350, 0.067474, 0.084887, 0.050723, 0.162942, -0.039103, -0.161695, 0.039434, -0.025002, -0.147797, 0.081577, 0.250460, 0.376192, -0.122566, 0.328695, -0.249290, -0.344939, 0.355795, -0.156879, -0.284669, -0.000277, 0.456007, -0.010614, -0.230507, 0.194040, -0.007051, -0.539269, -0.126837, 0.230164, 0.181228, -0.288222, -0.071233, -0.367250, -0.160327, 0.201832, -0.123648, 0.025965, 0.198475, -0.515756, -0.216469, -0.605412, -0.221049, -0.132322, -0.152835, -0.740498, 0.250362, 0.082260, 0.383524, -0.026117, -0.087496, 0.184416, 0.336579, 0.251733, 0.188057, -0.293935, 0.015189, -0.129553, -0.175128, 0.242492, -0.090253, -0.048112, -0.046217, -0.260937, 0.007976, -0.129787, 0.094392, -0.311811, -0.212013, 0.153477, 0.358440, -0.300291, 0.039463, 0.405109, -0.086278, -0.207542, 0.328846, -0.614471, 0.357425, -0.143205, -0.093771, -0.084541, 0.154872, 0.096952, -0.093532, 0.169832, 0.153371, 0.149419, 0.135894, -0.588010, -0.100113, -0.086206, -0.090931, -0.347464, -0.387037, -0.031606, -0.013300, -0.148146, -0.090245, -0.418836, -0.252722, 0.247299, -0.146918, -0.167019, 0.180986, -0.565547, -0.264653, -0.056087, -0.061011, -0.330155, -0.094734, 0.014537, -0.668401, 0.133271, -0.473285, -0.241082, -0.089351, -0.182709, 0.392874, -0.137582, -0.051754, -0.229383, 0.025153, 0.060803, 0.340680, -0.210865, -0.525139, -0.220453, 0.123181, -0.112248, -0.123728, 0.040438, -0.156019, -0.147650, -0.088404, -0.065898, -0.610164, -0.133141, -0.381005, -0.268622, -0.104939, -0.273501, 0.091182, 0.079522, -0.074412, 0.191208, -0.326401, -0.056315, -0.196271, -0.134238, -0.011779, -0.233474, -0.189795, 0.023542, -0.393074, 0.034265, -0.261366, -0.243176, -0.275867, 0.101791, -0.058900, -0.114491, 0.180050, -0.348621, -0.145831, -0.118749, -0.254314, -0.024162, 0.143640, -0.303483, -0.079520, 0.003603, 0.368424, -0.141821, 0.179123, 0.147620, -0.240326, -0.189531, -0.368094, 0.386989, -0.152461, 0.083824, 0.282579, -0.050536, -0.559842, -0.013883, 0.224590, 0.503358, -0.037005, 0.018977, -0.590544, -0.014870, 0.206716, 0.026977, -0.305243, -0.317751, 0.038505, 0.247790, -0.102768, 0.218887, -0.472561, -0.206372, -0.429392, -0.007736, 0.091845, -0.364195, -0.183604, -0.039348, 0.119503, 0.043458, -0.479977, -0.003398, -0.283627, 0.458398, -0.188535, 0.453374, 0.038793, -0.215902, -0.131863, 0.029666, 0.001567, -0.330435, -0.528733, 0.188194, 0.132668, -0.028608, 0.114987, 0.136377, -0.015694, 0.189852, -0.053734, -0.226208, -0.064802, 0.052151, 0.297814]
-,        [0.060568, 0.258536, 0.010280, -0.004995, -0.016377, 0.675634, 0.047068, 0.558249, -0.046040, 0.107481, 0.153200, -2.029628, -0.226401, 0.143827, -0.126801, 0.584505, 0.043823, 0.152705, 0.176265, 0.065774, -0.015299, -0.125194, -0.376746, 0.066023, 0.315163, 0.043424, 0.095655, -0.101828, 0.002150, 0.068318, -0.060000, 0.200039, -0.047984, -0.456414, 0.215866, 0.078713, 0.066741, 0.041823, -0.039335, 0.009123, -0.049164, -0.134419, 0.268823, 0.073070, 0.103864, 0.121456, -0.017374, -0.039502, 1.610455, 0.167345, 1.275017, 0.172927, -0.384927, 0.138523, -0.013013, -0.256115, 0.680795, 0.440862, -0.061289, 0.089299, 0.177322, 0.102886, -0.043782, -0.392063, -0.094283, 0.083787, -0.107564, 0.159069, -0.126606, -0.114070, -0.135789, -0.309837, 1.212433, 0.051993, -0.025468, -0.134497, 0.208187, 0.019237, 0.106410, -0.150096, -0.153655, 0.098282, -0.114193, -0.052436, -0.094415, -0.041385, 0.235361, 0.384354, 0.063527, 0.089308, -0.029371, 0.235414, 0.190344, 0.276736, -0.296494, 0.030583, 0.146031, 0.025281, 0.059101, -0.117265, 0.073614, -0.032973, 0.197921, -0.047189, 0.872711, -0.090361, -0.243539, -0.004116, 0.116289, 0.051443, 0.440394, -0.015140, 0.026260, -0.019354, 1.500623, 0.102236, -0.079447, -0.201281, 0.688410, -0.005181, -0.014528, 0.325293, 0.030011, 0.000670, 0.018131, 0.082111, -0.069967, -0.035879, 0.512674, 0.023171, 0.273943, 0.098649, 0.076524, -0.095366, 0.029364, -0.103288, -0.072438, -0.078766, 0.010219, -0.048338, -0.162351, -0.070565, 0.037686, 0.367676, 0.023665, 0.255406, 0.284482, -0.069781, -0.250008, -0.075468, 0.071283, 1.526728, -0.071490, -0.018428, -0.000794, 0.155378, -0.083485, 0.180775, 0.063589, 0.146282, 0.185036, -0.010102, 0.230767, 0.047506, 0.308573, 0.231541, 0.311560, -0.523634, 0.241095, 0.238918, 0.861130, -0.008838, 0.019250, 0.073721, 1.575968, -0.041234, 0.213613, -0.138767, 0.889201, 0.079730, -0.072836, -0.093837, -0.024647, -0.066169, 0.027024, 0.117618, 0.024216, 0.045790, -0.076276, 0.045379, -0.112135, 0.104495, 0.176996, 0.088774, 0.102056, -0.051592, 0.005771, 0.108612, 0.585341, 0.054021, 0.230809, 0.022337, -0.045784, 0.157927, 0.193469, -0.062880, 0.039822, 0.049136, -0.134279, 0.025479, 0.121823, 0.000122, -0.072213, -0.019063, 0.102435, -0.200582, -0.075656, 0.003069, 0.022134, 0.051740, 0.071530, -0.012130, -0.263968, -0.128624, 1.377794, -0.049006, 0.926747, -0.155308, -0.087060, -0.034881, -0.034464, 0.031720, -0.024087, 0.016980, 0.092044, -0.071792, 0.088960, 0.146751, 0.002521, -0.482772, 0.095982, 0.059191, -0.025949, 0.144171, 0.304195, -0.150788, 1.504567, 0.064504, 0.342712, -0.011152, -0.076990, -0.001909, 0.091741, 0.081159, 0.034268, -0.077416]
-,        [-0.287344, -0.212133, -0.174707, 0.084942, -0.070931, -0.265712, -0.028944, -0.155562, -0.098095, 0.056377, -0.121791, -0.137865, 0.016814, -0.033748, -0.178885, -0.344086, 0.209164, -0.010648, 0.153708, -0.117202, -0.063127, -0.139448, -0.089215, 0.352645, 0.186145, -0.183376, -0.128681, 0.006446, 0.210505, 0.034138, -0.233407, 0.068674, -0.008983, -0.137237, 0.076619, -0.056079, -0.242019, 0.215635, -0.003110, 0.048755, -0.155208, -0.321527, 0.131968, 0.010468, -0.023213, -0.041216, 0.184815, -0.387367, -0.055280, 0.051338, 0.031198, 0.099844, -0.078719, -0.155382, -0.091267, -0.081079, 0.016811, -0.054604, -0.002539, -0.015558, 0.061664, -0.194460, 0.206564, -0.068481, 0.124784, 0.278348, -0.075460, 0.163723, -0.068757, 0.269694, 0.237897, -0.172909, 0.047180, 0.129406, 0.044884, -0.239263, 0.136172, 0.040329, -0.105171, -0.060053, -0.035230, 0.010421, -0.071344, 0.048309, -0.290291, -0.145970, 0.072106, -0.026469, -0.125807, -0.104096, -0.052546, -0.086691, -0.227880, -0.006305, 0.015762, -0.082367, -0.192771, 0.077753, -0.190119, 0.349788, 0.134593, -0.055599, 0.085170, 0.170810, -0.091640, -0.328745, -0.263171, -0.046198, -0.186380, 0.076634, 0.172763, 0.124604, -0.127174, 0.085891, -0.247186, 0.142959, -0.028997, -0.003092, -0.075398, 0.223105, -0.106143, -0.352062, -0.195335, 0.390326, -0.237674, -0.130919, 0.001898, -0.112272, -0.265472, 0.060671, -0.176164, 0.052002, 0.075415, 0.062666, -0.255317, -0.159532, -0.051941, -0.146797, 0.151374, -0.056537, 0.027326, -0.092369, -0.062092, -0.112859, -0.183438, -0.085001, 0.191110, -0.160124, -0.248038, 0.004282, 0.177754, -0.266982, -0.242492, -0.182277, 0.095767, 0.180650, -0.159143, -0.108589, 0.086268, -0.083082, -0.049735, -0.219629, -0.149467, -0.038843, 0.276612, -0.032640, -0.094067, 0.058233, -0.099172, 0.126309, -0.059058, -0.198651, 0.227239, -0.156095, -0.262278, -0.074186, -0.071348, 0.105744, -0.206614, 0.007068, -0.100195, -0.149353, -0.158682, 0.018069, 0.068467, -0.005786, -0.217072, 0.075721, -0.212986, -0.048337, 0.216959, 0.039489, -0.186454, -0.036578, 0.052906, -0.014702, 0.044156, 0.192988, -0.264550, 0.131653, -0.101587, -0.276963, -0.204811, -0.111649, -0.217873, -0.065242, 0.018122, 0.025448, 0.123504, -0.147242, 0.009221, -0.088714, -0.107050, -0.194891, 0.017579, -0.067515, -0.085069, 0.146967, -0.089596, -0.082973, -0.003673, -0.148627, -0.342119, 0.081744, -0.066799, 0.113675, -0.273682, -0.062244, 0.011668, -0.050309, 0.117982, -0.034634, -0.142715, -0.343282, -0.214166, -0.158971, 0.202282, -0.026260, 0.042603, -0.227753, 0.007833, -0.230891, 0.203659, -0.020258, -0.248031, -0.048199, 0.022769, 0.092510, -0.162195, -0.311481, -0.063064, 0.070858, -0.051408, -0.221736, -0.202080, -0.080431]
-,        [0.079306, -0.210543, -0.219917, 0.132808, -0.345382, -0.365596, -0.477462, -0.088325, 0.242996, 0.030594, 0.358017, -0.044782, 0.584198, 0.227182, 0.131426, -0.528033, 0.183577, 0.001976, -0.144697, 0.188600, -0.081534, 0.416419, -0.201949, -0.081141, -0.084370, -0.380073, 0.192748, 0.117949, -0.005813, -0.373090, -0.701769, -0.109455, 0.104794, 0.122632, -0.220446, -0.449052, -0.284399, 0.210139, 0.329314, -0.068696, -0.259908, 0.087152, -0.044752, -0.035217, -0.266116, 0.169621, 0.409836, 0.026646, 0.051081, -0.308647, 0.141782, -0.030586, -0.166852, -0.309197, 0.229007, -0.265266, 0.348107, 0.394127, 0.124937, 0.181987, -0.225257, 0.271066, 0.309686, -0.012221, -0.252698, -0.349720, -0.221104, 0.168784, 0.113293, 0.267863, 0.208948, -0.416158, 0.173556, -0.207525, 0.132397, 0.345315, -0.305981, 0.146194, -0.180115, -0.544241, -0.124200, -0.352602, 0.221396, -0.115251, 0.222782, 0.400167, -0.219644, -0.155797, 0.031301, -0.103700, -0.178061, 0.010554, -0.082351, -0.113998, -0.073190, 0.009966, -0.364564, -0.003039, -0.214548, 0.146972, -0.046309, 0.302320, 0.194859, -0.103654, -0.256737, -0.135035, -0.175424, 0.274364, -0.131862, -0.361588, -0.520948, -0.239536, 0.258604, 0.515045, -0.339137, -0.880150, -0.437924, -0.138512, 0.010487, -0.302706, 0.075528, -0.369519, 0.048287, 0.223888, 0.264407, -0.232617, 0.441222, -0.352504, -0.310932, -0.185678, 0.187110, 0.085729, -0.161725, -0.172096, -0.180999, -0.022495, 0.072142, 0.278917, 0.280666, 0.152100, -0.195756, -0.057431, -0.199499, -0.068867, -0.677617, -0.165761, -0.252115, 0.103808, -0.070025, 0.064730, -0.011274, -0.489112, -0.129815, -0.104764, -0.074487, 0.130596, -0.133536, -0.306703, -0.252452, -0.567082, 0.019843, -0.034145, -0.243075, 0.169695, -0.032648, 0.079023, -0.161004, -0.043295, 0.036922, -0.319742, -0.117236, -0.758413, -0.208571, -0.327468, -0.478831, -0.233009, -0.182262, 0.163223, -0.045236, 0.086363, 0.055584, -0.105207, -0.195998, 0.027963, 0.007541, -0.184480, 0.338438, -0.272920, 0.255044, -0.096624, 0.024327, 0.247865, -0.336523, 0.078106, -0.074976, -0.079229, 0.178314, -0.485916, 0.304465, -0.791050, -0.001410, 0.070113, -0.191226, -0.450020, 0.052311, -0.113075, -0.238506, 0.066852, -0.312893, -0.809713, 0.092530, 0.126864, 0.015046, 0.177485, 0.049285, 0.361556, 0.165303, -0.124029, 0.384082, 0.065649, 0.071120, -0.160660, -0.112620, -0.459676, 0.116380, -0.386088, -0.355967, -0.049403, -0.305400, 0.497503, -0.184175, -0.073820, 0.020226, -0.362346, 0.218598, -0.341381, -0.048990, 0.264207, -0.118617, -0.391995, -0.389946, -0.201893, 0.036632, 0.425825, 0.288943, 0.070077, -0.121453, 0.119423, -0.055254, 0.352958, 0.113563, 0.075319, -0.432524, 0.048025, -0.281388, 0.208520]
-,        [-0.123652, -0.099988, 0.178813, 0.070100, 0.034783, -0.029238, -0.079006, -0.286557, -0.072354, -0.043672, 0.208920, -0.347684, 0.086256, -0.012038, 0.184392, -0.248398, -0.084669, 0.296022, -0.291663, -0.135688, 0.045629, -0.101350, -0.180031, -0.156278, 0.057329, 0.110901, -0.044760, 0.030097, -0.139163, 0.029608, -0.351615, 0.067900, -0.072352, 0.399231, -0.158700, -0.218686, -0.380913, -0.041173, -0.034612, 0.131168, 0.072752, -0.237457, 0.101591, 0.320244, -0.125709, 0.150576, 0.032586, 0.290269, -0.490700, -0.168873, 0.016913, 0.043581, -0.174085, 0.109170, 0.187386, -0.290954, -0.522238, 0.173605, 0.041893, -0.068633, 0.240262, 0.281074, -0.002221, -0.243747, -0.110339, 0.094836, -0.720239, -0.149343, -0.234928, -0.181577, 0.091369, -0.223752, 0.006381, 0.186132, -0.343979, -0.030979, -0.073923, 0.045296, -0.130143, -0.236446, 0.287305, -0.078306, -0.439733, -0.309773, -0.055272, -0.046488, -0.095900, 0.020115, -0.138021, -0.044414, -0.045558, 0.159557, -0.202203, 0.014563, 0.102802, -0.128081, -0.072409, -0.155429, -0.390405, -0.046693, 0.163500, -0.288837, 0.007068, 0.099466, 0.053530, 0.133380, -0.015772, -0.022648, -0.244968, 0.011887, -0.100117, -0.183422, -0.100232, -0.007227, 0.142088, -0.147653, 0.103727, -0.059148, -0.028045, -0.171943, 0.000498, 0.231025, -0.023783, 0.267090, -0.274582, -0.353662, -0.178514, -0.216856, -0.280236, -0.048179, -0.174729, 0.056218, 0.170568, 0.116830, -0.137349, 0.010412, 0.115062, 0.118872, 0.236615, 0.017085, -0.266471, 0.262789, 0.099951, 0.011224, -0.138614, 0.105253, -0.186190, -0.074431, -0.171762, 0.233662, -0.091585, 0.074094, 0.085192, -0.015264, 0.119403, 0.113085, -0.005095, -0.240247, -0.292807, -0.082459, -0.131479, 0.027445, -0.088649, -0.067888, -0.048593, 0.116937, -0.218995, -0.056024, 0.074161, 0.160132, -0.029133, -0.037137, -0.019952, -0.144476, 0.019132, -0.110080, -0.060301, 0.219187, -0.405127, -0.373926, -0.209936, -0.124357, -0.056866, 0.087743, 0.036144, 0.038779, -0.435511, -0.151404, -0.151405, 0.165779, 0.295466, -0.146447, 0.219620, 0.226083, -0.128904, 0.153579, -0.172704, 0.120135, -0.190308, 0.211564, 0.194283, 0.183239, 0.143688, -0.159405, -0.207393, -0.419390, -0.115078, -0.006114, 0.075288, -0.056562, -0.086726, -0.353077, 0.144393, 0.278466, -0.013385, -0.070502, 0.240091, 0.335545, -0.075307, -0.194846, 0.157376, -0.157419, 0.079509, 0.020431, 0.141175, -0.001076, -0.269996, -0.026942, -0.060918, 0.072664, 0.006920, -0.185998, -0.084705, 0.111147, 0.032721, -0.131584, -0.223291, 0.136630, -0.026564, -0.371752, -0.091892, -0.231653, 0.070848, -0.041758, 0.049803, 0.103162, -0.064875, -0.176696, 0.321469, 0.178595, 0.227548, -0.093801, 0.091542, -0.300434, 0.137200, 0.114359]
-,        [-0.599646, -0.347548, -0.099804, -0.478848, -0.175963, -0.837303, -0.048019, -0.092077, -0.486009, -0.147982, -0.103845, -0.299118, 0.417275, -0.042383, -0.159428, -0.078256, 0.065112, -0.356557, -0.121412, 0.442057, 0.009281, -0.028774, -0.122752, 0.362626, -0.362547, -0.148367, -0.243358, -0.238296, 0.023904, -0.150818, 0.166409, -0.151665, 0.299238, -0.293996, -0.137542, -0.336385, 0.017535, -0.205204, -0.016084, -0.126539, -0.332046, 0.142900, 0.080333, -0.101441, -0.427625, -0.215965, 0.137778, -0.149119, -0.172532, -0.189041, 0.072703, -0.705785, -0.402582, -0.094710, 0.180740, -0.076179, 0.316640, -0.019835, -0.124191, -0.098462, -0.402653, 0.256964, 0.269611, -0.188676, 0.358871, -0.145567, 0.107460, 0.125665, 0.221966, -0.685687, 0.030625, -0.334012, -0.170380, -0.081475, -0.015301, -0.098533, -0.184812, -0.380405, -0.182957, -0.185190, -0.242093, -0.574859, 0.100808, 0.426683, 0.020288, -0.289047, 0.084145, 0.080026, 0.079009, 0.120394, 0.322719, -0.160125, -0.463550, -0.290025, 0.018609, -0.351964, -0.019302, -0.564389, -0.301095, -0.073311, 0.104833, 0.036031, -0.370989, 0.161282, -0.198113, -0.323198, 0.244808, -0.140861, -0.107588, 0.207385, -0.309565, 0.034527, -0.002446, 0.531780, -0.113280, -0.261957, -0.192658, -0.301186, 0.015828, -0.279200, 0.066633, -0.433250, 0.216475, 0.053574, -0.025741, 0.144282, 0.243180, 0.062847, -0.102320, -0.387650, -0.300463, -0.291477, 0.271868, 0.187931, 0.389148, -0.051567, 0.236046, -0.483569, -0.063226, -0.254671, 0.238511, -0.109274, -0.319332, -0.206731, -0.223326, -0.179532, -0.569715, -0.019830, -0.184499, 0.167080, 0.056369, -0.003527, -0.549909, -0.067965, -0.090273, -0.036355, -0.274968, -0.155271, 0.221644, -0.175218, 0.472795, -0.213011, 0.044472, 0.226397, 0.078667, -0.343718, -0.003386, -0.084140, -0.253260, 0.106222, 0.081915, 0.056600, 0.305375, -0.231886, -0.407244, 0.035563, -0.349724, -0.045180, -0.631886, 0.060597, -0.191654, -0.253718, 0.076571, 0.264624, -0.280038, -0.214697, -0.264619, 0.110024, -0.061800, -0.194510, -0.178571, -0.342861, -0.189110, 0.085291, 0.085439, -0.255429, 0.074665, -0.032377, -0.194427, 0.496867, 0.225934, -0.295669, -0.072354, 0.288308, -0.629619, -0.131337, -0.168843, 0.274417, 0.133068, -0.797769, -0.132251, -0.643105, 0.107621, -0.010170, 0.032851, -0.035906, -0.408202, -0.386661, 0.089960, 0.241227, 0.146222, -0.386777, -0.161415, -0.126204, -0.238907, 0.300281, -1.038220, 0.166090, -0.677354, -0.174574, -0.830257, -0.024311, -0.153074, -0.401837, -0.139896, -0.515122, 0.522576, 0.279553, -0.047322, -0.084978, 0.552124, 0.119910, -0.157468, -0.210655, -0.028094, 0.091018, -0.365351, 0.399455, 0.243645, -0.155495, 0.307421, -0.007744, 0.047982, -0.440111, 0.039290, 0.300230]
-,        [0.934839, -0.171444, 0.088284, -0.407377, -0.376971, -0.603937, 0.058265, -0.012478, -0.624975, -0.600424, 0.487091, 0.024569, -0.800033, -0.479221, -0.515002, -0.380262, -0.890943, -0.012428, -0.426981, -0.120719, -0.297421, -0.088762, -0.278617, -0.209425, 0.454826, -0.354112, 0.068532, -0.740818, -0.031350, 0.256945, 0.141601, 0.559550, -0.047780, 0.603562, 0.195463, -0.254334, -1.115468, -0.060281, 0.131884, 0.203743, 0.000848, 0.192541, -0.031936, 0.022856, -0.385843, 0.001073, 0.139191, -0.315783, -0.075230, -0.033662, -0.488794, 0.087626, -0.342842, -0.644944, 0.390791, 0.049711, 0.066622, 0.910882, -0.205281, -0.117987, -0.299264, 0.513891, 0.423591, 0.068417, 0.224818, -0.372129, -0.175503, -0.909113, -0.003807, -1.007471, 0.055666, -0.029987, -0.214709, -0.134754, 0.490768, -0.616123, 0.129654, 0.601331, -0.154412, -0.505678, -0.508284, -0.335260, 0.166706, 0.081411, 0.107181, 0.227550, 0.325596, 0.007304, -0.260473, 0.606964, -0.119071, 0.239033, -0.718490, -0.844322, 0.266784, 0.583165, 0.160757, 0.824240, -0.326149, 0.375741, 0.600843, 0.761607, -0.906771, 0.078523, -0.023605, 0.129730, -0.412666, 0.527091, -0.197553, -0.284559, -0.039449, 0.405658, -0.387187, 0.888971, 0.061163, -0.813685, 0.562484, -0.210179, -0.019002, 0.555675, 0.149676, 0.524076, -0.323190, 0.205656, -0.244994, 0.832954, 0.548951, -0.564302, 0.235905, 0.124037, -1.160384, -0.447743, -0.272850, 0.056333, 0.593637, 0.337631, 0.201672, -0.020046, 0.832583, 0.466858, -0.128493, -0.276524, -0.063911, -0.228145, -0.243001, 0.732761, -0.278997, -0.239523, 0.133707, 0.335396, 0.179340, -0.189843, 0.304736, 0.164555, 0.346339, -0.084050, 0.476126, 0.522574, -0.883655, 0.039924, -0.254658, -0.334637, 0.250381, 0.201361, -0.936898, -0.191828, -0.242857, 0.393645, -0.336672, 0.193109, -1.105741, 0.740274, 0.258219, -0.506660, -0.157122, -0.009358, -0.325087, 0.005185, 0.162448, -1.147662, -0.065753, -0.323334, -0.754915, -0.271429, -1.032091, 0.115660, 0.705091, -0.572051, 1.037095, -0.507285, 0.468847, 0.097687, 0.019555, 0.062905, -1.103368, -0.142472, -0.312203, 0.733313, -0.092227, -0.002863, -0.452222, -0.304263, 0.222776, -0.321612, -0.272841, 0.371053, -0.316753, -0.400488, -0.347196, -1.110759, -0.486437, 0.126574, -0.041795, -0.954547, 0.463569, -0.376934, -0.099634, -0.308689, 0.898181, 1.069350, 0.757747, -0.736939, -0.747715, -0.682624, -0.050855, -0.651276, -0.412358, 0.072575, 0.137177, 0.472524, 0.008965, -0.329205, -0.012286, 0.566650, -0.194200, -0.346706, -0.201088, -0.116769, -0.029187, -0.244123, 0.204436, 0.157429, -0.913133, 0.092507, -0.013418, 0.283306, -0.872841, 0.452520, 0.065437, -1.278914, 0.364071, -0.431479, 0.159990, 0.002040, 0.362480, 0.033533]
-,        [0.018344, -0.186261, -0.061423, -0.475894, -0.129673, -0.167156, -0.730461, -0.112083, -0.325316, -0.274646, 0.198540, -0.348867, -0.594803, 0.030770, -0.182482, 0.006241, -0.034016, -0.082638, 0.017713, 0.056216, 0.064272, 0.204512, -0.237724, 0.372630, -0.510885, -0.056288, -0.319780, 0.054315, 0.186825, -0.365732, 0.133827, -0.002197, -0.032061, -0.376293, 0.032121, 0.114091, -0.147317, 0.087050, -0.474682, 0.287767, 0.098961, -0.355409, 0.113014, -0.224583, 0.075289, 0.052437, -0.364362, -0.446453, -0.210935, -0.105732, -0.199446, -0.200586, -0.312914, -0.078628, -0.271640, -0.165124, -0.178771, -0.001529, -0.113337, -0.202228, -0.264679, -0.029809, -0.258553, -0.306030, -0.122316, -0.228197, -0.426074, -0.086043, -0.037096, -0.186046, -0.354714, -0.307976, 0.059420, 0.226068, -0.028116, -0.150467, -0.498852, 0.199163, -0.323276, -0.151016, 0.434640, -0.037670, 0.097866, -0.538082, -0.091236, -0.088377, 0.064446, -0.370782, -0.376158, -0.384870, -0.031357, 0.013703, -0.056592, -0.183024, -0.181262, 0.182716, 0.062816, 0.301132, -0.118191, -0.379034, -0.376206, -0.034674, 0.161980, -0.212714, 0.030270, -0.335189, 0.006732, -0.073830, -0.198022, -0.154778, -0.056749, 0.222025, 0.012978, -0.524183, -0.226713, -0.239482, -0.039263, -0.112880, 0.159492, -0.107767, 0.280793, -0.106100, 0.219168, -0.144711, -0.039664, 0.064126, 0.103786, 0.025611, -0.510500, 0.141561, -0.127974, 0.111139, -0.126673, -0.207397, -0.186849, -0.239146, -0.242684, 0.012695, 0.083161, 0.048831, -0.029981, -0.386577, -0.076037, 0.181429, 0.298512, -0.255442, -0.363518, 0.085608, -0.317170, 0.283169, -0.041734, -0.004234, -0.482788, -0.434447, -0.197686, 0.014336, -0.133120, -0.062422, 0.037178, -0.175122, -0.256694, -0.118688, -0.213292, -0.411252, 0.062860, 0.152720, 0.185138, -0.104199, 0.293811, 0.360561, -0.040200, -0.206350, -0.103074, -0.444148, 0.153912, -0.163563, 0.081829, -0.061242, -0.021260, -0.231380, 0.150124, 0.199125, -0.301219, 0.046106, 0.130090, -0.101650, -0.380483, -0.236186, -0.180982, 0.018864, -0.054977, -0.039980, 0.199050, -0.008143, -0.064448, 0.171881, 0.204550, -0.004019, -0.178497, 0.063621, -0.123181, -0.268730, -0.154786, 0.241540, -0.059563, 0.123507, 0.007797, -0.102456, -0.144212, 0.052008, 0.188043, -0.201972, -0.133220, -0.374416, -0.306052, -0.027613, -0.343128, 0.082615, -0.460640, 0.087814, 0.438152, 0.038445, -0.353425, 0.168173, 0.163893, -0.076298, -0.380173, -0.204916, -0.037164, -0.095269, -0.005814, -0.040805, -0.098796, 0.131080, 0.228306, -0.062009, 0.167995, -0.292139, 0.006323, -0.281237, 0.069211, -0.035876, -0.439409, -0.125061, -0.290363, -0.149307, 0.026472, -0.570536, 0.267055, -0.110626, -0.226815, -0.010671, -0.268147, 0.170776, -0.040374, -0.245499]
-,        [0.408877, 0.133300, -0.189234, -0.074836, -0.070656, -0.275514, -0.267817, -0.173538, -0.217650, -0.033295, 0.050462, -0.261761, 0.055082, 0.027646, 0.094039, -0.123559, -0.056480, -0.229671, 0.018483, -0.214563, -0.170034, -0.008656, 0.207477, 0.326395, -0.213359, 0.103754, -0.314450, 0.194824, -0.026347, 0.538126, 0.180484, -0.576089, -0.280502, -0.162128, 0.293019, 0.169929, 0.072179, 0.082934, 0.232222, -0.295664, -0.233434, 0.158937, 0.278273, -0.325307, 0.023823, 0.098287, -0.091008, -0.013759, 0.012654, -0.186109, -0.303244, -0.312235, -0.232263, 0.057868, -0.072421, -0.058146, -0.007573, 0.169619, -0.070026, 0.178459, -0.083566, 0.046076, -0.593766, 0.084219, 0.211772, -0.131285, -0.171680, -0.126748, -0.080699, 0.298372, -0.340741, -0.257830, -0.296576, 0.045853, 0.153449, -0.394342, -0.124412, 0.133176, 0.097429, -0.218603, -0.380682, -0.453117, 0.228381, 0.106151, -0.211389, 0.108291, -0.140121, 0.162133, 0.006531, -0.471868, 0.372120, -0.035418, -0.143788, -0.170640, -0.089790, 0.162177, -0.224928, -0.126631, 0.097600, 0.042506, -0.054182, -0.103539, -0.282742, 0.435972, 0.090144, 0.323685, 0.229837, -0.295444, -0.194976, -0.293442, -0.266343, 0.022038, 0.143019, 0.204347, -0.300324, -0.040236, -0.271889, 0.015730, -0.096131, 0.111418, 0.339527, -0.179931, 0.003845, -0.225734, 0.481807, -0.147260, 0.073633, -0.249915, 0.042092, -0.137181, -0.270799, -0.144505, -0.112192, -0.024656, -0.125541, 0.276527, -0.084300, -0.271535, 0.199287, -0.266161, -0.158199, -0.409902, -0.070160, 0.281358, -0.438594, 0.262782, -0.565023, 0.030576, 0.023137, -0.010847, -0.254388, -0.292871, -0.135524, -0.016693, -0.485366, -0.118623, -0.223601, -0.057271, 0.001661, -0.125466, 0.520771, -0.140302, 0.279406, -0.392042, 0.276677, 0.279114, -0.215029, -0.177704, 0.455325, 0.070786, -0.236366, -0.063552, -0.241189, -0.395489, -0.216275, -0.376290, -0.239232, -0.442494, -0.190248, -0.326735, 0.003956, 0.054039, -0.125052, -0.008130, -0.176895, 0.163938, -0.174429, -0.671173, 0.343967, 0.165613, 0.364682, -0.046164, -0.014982, -0.071048, -0.202178, 0.098685, -0.151127, 0.210109, -0.504562, -0.237116, -0.064180, -0.103451, 0.127834, -0.159624, 0.280669, 0.165604, -0.224568, -0.045455, 0.135225, -0.019205, 0.350704, 0.141118, 0.021590, -0.312490, 0.204761, 0.105300, -0.193862, 0.377363, -0.250713, -0.304069, 0.035856, -0.334919, -0.546593, 0.094174, -0.139084, -0.058889, -0.247576, -0.145125, -0.049956, -0.235135, 0.089096, -0.110433, 0.177646, -0.689743, 0.257129, -0.102240, 0.024306, 0.020528, 0.289790, -0.395880, 0.138148, -0.151847, 0.118568, 0.438830, 0.155331, 0.034506, -0.394426, 0.279618, -0.261203, -0.056711, -0.258261, -0.294550, 0.032662, -0.089689, 0.131896, 0.193632]
-,        [-0.612141, -0.181976, 0.109814, 0.385561, -0.009153, 0.137832, -0.269793, -0.048152, -0.903263, -0.235036, -0.561046, -0.163812, -0.291163, -0.236484, -0.183485, -0.081717, 0.275929, -0.286970, 0.177612, -0.083707, 0.248054, -0.225036, 0.050099, -0.345236, -0.125730, 0.040106, 0.026418, -0.791125, -0.056963, 0.125985, 0.073224, -0.092540, 0.029383, 0.041879, -0.394930, 0.248369, 0.263345, 0.038157, 0.294949, -0.130245, 0.548048, -0.088474, 0.313462, -0.956241, -0.034212, 0.654611, 0.411915, -0.026252, -0.313011, -0.234014, -0.111894, 0.539671, -0.439172, 0.425135, 0.033020, -0.269699, -0.058666, -0.336435, -0.266558, 0.300739, -0.556903, 0.206432, 0.230455, -0.116938, 0.426722, 0.389699, 0.165061, 0.016701, 0.289066, -0.349931, -0.110063, -0.630419, -0.079322, -0.001297, 0.316961, 0.276108, -0.457364, 0.071992, -0.155734, -0.246561, -0.106954, -0.094026, -0.184458, 0.061141, -0.310643, 0.469662, -0.174509, 0.024637, -0.466859, -0.007392, 0.212384, -0.103202, 0.062991, 0.036244, 0.135927, 0.263232, -0.151019, -0.357887, -0.489398, -0.713576, -0.770214, 0.537700, 0.129139, 0.120095, 0.385324, 0.390002, 0.146697, -0.478348, -0.046280, -0.306066, -0.256473, -0.322506, -0.461677, 1.196357, -0.518913, -0.081505, 0.436461, 0.042556, 0.029683, 0.287169, 0.100019, 0.358304, 0.052391, -0.244870, 0.145967, -0.872498, -0.035646, 0.057765, -0.335032, 0.152155, -0.092010, 0.261204, 0.728156, 0.165146, 0.131396, -0.658235, 0.214116, 0.167661, 0.126092, 0.194565, 0.135103, 0.462863, -0.090921, -0.355919, 0.268269, -0.675488, 0.194327, 0.075680, -0.220855, -0.122479, -0.598410, -0.624273, -0.658893, 0.180585, -0.055373, -0.379200, -0.167847, -0.170327, -0.483203, -0.447412, 0.247859, -0.054598, -0.702521, 0.590952, -0.469044, -0.291305, -0.250789, -0.061667, -0.061659, 0.018995, -0.171499, -0.039520, -0.168444, -0.011984, -0.365830, 0.278965, -0.090494, -0.430238, -0.662453, -0.237911, 0.378423, 0.352559, -0.240788, -0.097992, -0.589205, 0.239548, 0.054078, -0.163000, 0.204373, 0.237046, -0.349506, 0.293987, 0.220726, 0.145730, 0.413612, 0.270634, -0.066468, 0.082465, -0.529665, 0.187662, 0.237104, -0.146706, 0.154347, -0.193525, -0.507822, -0.084689, -0.183317, -0.048502, -0.066780, 0.250205, 0.156543, 0.453065, 0.023349, 0.260932, -0.384050, 0.341096, -0.091734, 0.120828, 0.716797, 0.132390, 0.004326, -0.208851, 0.014579, 0.147983, -0.559360, -0.331960, -0.145229, -0.314894, -0.009431, -0.685663, 0.420852, -0.501328, 0.022547, 0.115112, -0.075276, -0.396821, -0.218902, 0.156531, -0.432258, -0.516333, 0.174910, 0.151694, 0.132826, -0.122898, -0.169253, 0.214917, -0.398598, 0.292845, -0.142130, -0.259672, 0.454272, -0.250187, -0.076862, -0.332858, -0.279459, -0.079965]
-,        [-0.254257, -0.009902, 0.144784, 0.170312, 0.095508, -0.080493, -0.297588, -0.196857, -0.124506, -0.050669, 0.052944, 0.055892, -0.168647, -0.068965, -0.222210, 0.077349, -0.086948, -0.182982, 0.131419, -0.058090, 0.174918, -0.059842, -0.111889, -0.216439, -0.140768, -0.087666, 0.104324, 0.260045, 0.012802, -0.359186, 0.036430, 0.149542, -0.002477, 0.056438, -0.014363, -0.099917, 0.007839, -0.191967, -0.012829, 0.047382, -0.361663, -0.144949, -0.034116, -0.342348, 0.291893, 0.018648, -0.134364, -0.221652, -0.135436, -0.050259, -0.457944, -0.350337, -0.157781, -0.065537, -0.075582, -0.224392, -0.166818, -0.114683, -0.082538, -0.040674, 0.037899, 0.129776, 0.164085, 0.082703, -0.110400, 0.117048, -0.122878, -0.242665, -0.059805, -0.260243, -0.098450, -0.178241, -0.094922, -0.196731, -0.010381, -0.268870, -0.058844, 0.143376, -0.018465, -0.173877, 0.117131, 0.129604, -0.262009, -0.150146, -0.075673, -0.095415, -0.255618, 0.036389, 0.115274, -0.184510, -0.086028, -0.127761, -0.302735, -0.091612, -0.019817, 0.190525, 0.070839, -0.118194, -0.266172, 0.176895, 0.036374, -0.289227, 0.027841, 0.055443, 0.040632, -0.141510, -0.097858, -0.007386, -0.090337, 0.061394, -0.228134, 0.012773, -0.103283, -0.009943, -0.138379, 0.128640, -0.108095, -0.016590, -0.048654, 0.013969, -0.106440, 0.029086, -0.146035, -0.108396, 0.068045, 0.074546, 0.062074, 0.093352, -0.100184, -0.380192, -0.181217, 0.263688, -0.185524, -0.159226, -0.326653, -0.202082, 0.309884, -0.129648, -0.158719, 0.184182, 0.143332, 0.085298, -0.293378, -0.113526, -0.033851, -0.145377, -0.053138, -0.010144, -0.243922, -0.147123, -0.222414, -0.147589, 0.023348, 0.124703, -0.024646, 0.218641, -0.030411, 0.116540, -0.412137, -0.202387, -0.059737, 0.002063, -0.103053, 0.216587, -0.142970, 0.051138, -0.021479, -0.268763, 0.002411, 0.115353, -0.197170, -0.006823, -0.099845, 0.370393, 0.250399, -0.252729, -0.117080, 0.078139, -0.118517, -0.152871, -0.396841, -0.089708, -0.100409, -0.249129, 0.162648, 0.209865, 0.176946, -0.123439, -0.229268, 0.142197, -0.173685, 0.011405, 0.228697, 0.084116, -0.207613, -0.257283, 0.065867, 0.250854, -0.014691, -0.097890, -0.131373, -0.005858, 0.015696, -0.163069, 0.136982, -0.305007, -0.011874, -0.139934, -0.192095, 0.047499, 0.040463, 0.158492, -0.158225, 0.044193, -0.107958, -0.265699, 0.169067, 0.144726, -0.155452, -0.183490, -0.174629, -0.060915, -0.198947, -0.046465, -0.282101, 0.035635, -0.329640, 0.156515, 0.140094, 0.127385, 0.006727, 0.026444, -0.086674, -0.115838, -0.008333, -0.241031, 0.332321, -0.192918, 0.002057, -0.186044, 0.073149, -0.125814, -0.085603, -0.023338, -0.091586, 0.049058, 0.113622, -0.031471, 0.254473, -0.022785, 0.082148, -0.046012, -0.105525, 0.102908, -0.150555, 0.167899]
-,        [-0.035715, -0.111092, -0.138504, -0.050144, -0.163509, -0.170213, 0.047597, -0.102057, -0.117240, -0.029661, 0.051103, -0.006873, 0.024466, 0.080365, 0.175927, -0.031796, -0.195683, 0.095330, -0.162163, 0.025865, 0.060638, -0.009597, -0.217199, 0.171100, -0.134491, -0.056574, -0.096575, -0.027394, -0.078713, -0.284173, -0.088124, -0.062244, -0.032277, -0.254590, 0.137286, -0.059845, -0.166612, -0.179033, -0.148763, -0.132801, -0.129447, 0.221576, -0.309818, -0.281632, 0.007049, -0.092731, -0.043137, -0.059582, -0.203199, -0.175576, -0.053756, -0.123078, -0.036253, -0.163716, 0.044382, -0.093650, 0.135094, -0.104877, 0.091033, -0.037826, -0.091870, -0.009756, -0.052145, -0.110477, 0.037996, -0.185682, -0.148815, 0.009638, -0.018663, -0.000447, -0.246898, -0.253432, -0.020119, 0.128626, 0.196384, -0.092062, 0.074653, -0.175763, -0.279087, -0.150399, -0.028421, 0.053704, -0.102676, 0.037716, 0.032661, 0.143158, -0.134677, -0.032757, -0.115304, 0.243516, 0.011065, 0.184423, 0.048867, 0.007733, 0.078790, -0.028227, -0.036733, 0.117049, -0.171507, 0.075158, -0.101014, 0.072881, -0.015602, 0.121842, -0.039118, 0.163607, -0.124017, -0.052295, -0.179633, 0.324585, -0.197155, -0.153304, -0.226683, -0.034956, -0.150193, -0.166815, -0.141173, -0.077165, 0.134654, -0.073388, -0.079636, -0.119847, -0.189686, 0.100839, 0.021546, -0.086175, -0.112956, -0.042790, -0.146643, -0.164866, -0.031689, -0.043447, -0.010422, -0.085146, -0.025334, 0.031262, 0.001444, 0.106105, -0.098165, 0.027715, 0.125785, -0.111604, -0.049749, 0.025261, -0.153957, -0.068461, -0.117877, -0.120498, 0.040719, -0.009933, -0.142240, -0.146716, -0.152509, -0.039703, -0.053491, 0.028118, -0.073891, -0.107051, 0.207967, 0.105740, -0.016288, -0.099660, -0.158654, -0.065035, -0.053258, 0.031319, -0.184651, -0.012940, -0.274966, -0.115881, 0.080026, -0.194356, -0.103277, -0.214548, -0.077218, 0.045744, -0.063244, 0.013704, 0.025009, -0.147571, -0.173476, -0.080991, -0.198430, -0.194875, -0.045594, 0.036830, -0.269989, -0.064920, 0.107081, -0.282507, -0.042060, -0.173869, -0.110547, -0.023623, -0.236986, -0.010036, 0.177491, -0.010846, 0.049423, -0.154344, -0.047658, -0.048580, 0.048007, 0.110091, 0.055679, 0.251290, -0.059914, -0.159753, 0.000193, -0.068996, 0.017271, -0.031781, -0.052959, 0.110713, -0.286880, -0.104762, 0.010554, 0.018032, -0.142277, -0.032198, -0.092425, -0.042209, -0.097694, -0.003598, -0.199918, -0.012721, -0.087428, 0.015098, -0.072256, 0.010741, -0.105268, -0.030835, -0.068863, -0.164556, -0.172721, -0.158033, -0.172804, 0.023096, -0.053846, -0.208435, -0.056859, 0.056076, 0.036798, -0.078774, -0.300060, -0.005886, 0.114895, -0.090208, 0.106042, -0.051412, -0.006627, -0.087104, -0.064260, -0.029640, 0.072924, 0.019377]
-,        [-0.458330, -0.065314, 0.051426, 0.089974, 0.394385, -0.124330, 0.149434, 0.273455, -0.044295, -0.256030, 0.238066, -0.494018, -0.069122, 0.208743, 0.249324, 0.034104, 0.518019, 0.273387, 0.012657, -0.167019, 0.233003, -0.047498, -0.541069, 0.276526, -0.132964, -0.115308, 0.361604, -0.216209, 0.356117, 0.575706, 0.069500, 0.011204, 0.394431, 0.149338, 0.209910, 0.152815, -0.139929, -0.128324, 0.470755, 0.536242, -0.115253, -0.076792, -0.321791, 0.240038, -0.076309, 0.412938, 0.463516, -0.248960, -0.311033, 0.235554, 0.101635, -0.031056, -0.625473, -0.082951, 0.589893, -0.239172, -0.363237, 0.094772, -0.188615, 0.228310, 0.203581, -0.005248, 0.150177, -0.302242, -0.179010, 0.076462, -0.092542, 0.303090, 0.019981, 1.137220, 0.194029, -0.525265, -0.219042, -0.330561, -0.275580, 0.108927, 0.075781, -0.238035, -0.107518, -0.233375, -0.180126, 0.266511, 0.328189, 0.120817, 0.246004, -0.057199, 0.236807, -0.166779, -0.367666, 0.169866, 0.215084, 0.257746, -0.285723, 0.370111, 0.220570, -0.352316, -0.282243, 0.456084, -0.282478, 0.393427, -0.031805, 0.186632, -0.136886, 0.113285, -0.113246, 0.293061, 0.141238, -0.157504, 0.070125, 0.267346, -0.071851, 0.084705, -0.119448, -0.474038, -0.071302, -0.115419, -0.085881, -0.145362, 0.371078, 0.072929, 0.176090, -0.049057, 0.279765, -0.000858, -0.022652, 0.316892, 0.340361, -0.388564, -0.075066, 0.091105, -0.429765, 0.366745, 0.381492, -0.344281, -0.588039, 0.204244, 0.133704, -0.217635, -0.062035, 0.157092, -0.023912, -0.018577, 0.424739, -0.317440, 0.211643, 0.413033, -0.021897, 0.264993, -0.448776, 0.037613, -0.161346, -0.397232, 0.203127, -0.207143, 0.079005, 0.550025, 0.363391, 0.204882, 0.118427, -0.112620, 0.235085, -0.106158, 0.329841, -0.070054, 0.391594, 0.069752, 0.212861, -0.746183, 0.297149, 0.213815, -0.161533, -0.208503, 0.343641, -0.076421, -0.597261, -0.290866, 0.332683, 0.159122, -0.012564, 0.279637, -0.220429, 0.476309, -0.099258, -0.155825, 0.286220, -0.111217, -0.235858, -0.174055, 0.381713, 0.149248, -0.016651, 0.010607, 0.175670, -0.117448, -0.229530, -0.263483, -0.369484, -0.018438, -0.450823, 0.186891, -0.175829, -0.153791, 0.035674, -0.183668, -0.035040, -0.016399, 0.232261, -0.227464, 0.335654, 0.532224, 0.079622, 0.188407, -0.035126, 0.157398, 0.148800, -0.038452, -0.106196, 0.256658, 0.106134, 0.223471, 0.470392, 0.024011, -0.242479, -0.273648, 0.213553, 0.455389, -0.653413, 0.041827, -0.155458, 0.173622, -0.301027, -0.286688, 0.030806, -0.170041, -0.034566, 0.424486, 0.190089, 0.199853, -0.369107, -0.563317, 0.218167, 0.057626, -0.335957, 0.009449, -0.340848, -0.099417, -0.383957, -0.312298, -0.057563, -0.191385, -0.110222, -0.173032, 0.085866, 0.110852, -0.174983, 0.055243]
-,        [-0.040579, 0.009120, 0.043895, -0.032011, -0.025085, -0.093261, -0.095835, -0.179953, 0.062159, 0.121285, -0.043238, -0.008409, 0.005973, -0.124092, -0.124449, -0.071114, -0.049130, -0.110540, -0.068192, 0.199428, -0.047520, -0.015745, -0.164628, 0.055975, 0.016186, -0.062769, -0.036883, -0.008588, -0.022752, 0.025971, -0.108534, -0.116335, 0.074309, -0.061012, -0.126707, -0.042165, -0.080394, 0.035941, -0.006348, -0.037972, -0.193834, -0.058032, -0.039704, 0.096782, 0.080031, -0.003621, 0.137567, -0.120154, -0.134412, 0.018123, 0.033808, -0.042458, -0.069453, -0.328086, -0.107069, -0.068702, 0.117811, -0.165855, -0.081923, 0.022296, -0.157356, 0.073884, -0.030344, -0.019966, 0.156634, -0.094249, -0.041651, -0.120148, -0.148074, -0.070417, -0.197887, -0.049462, -0.002418, -0.034653, 0.045521, -0.137879, -0.007319, -0.066554, -0.096965, -0.057506, -0.039163, 0.142854, 0.065140, 0.012121, 0.011515, -0.016454, 0.114995, 0.086004, 0.036915, 0.022187, -0.160313, -0.119821, 0.032035, -0.121818, -0.152480, 0.007255, 0.088164, 0.009571, -0.247210, -0.148970, -0.075505, -0.202534, -0.117170, -0.087350, 0.085974, 0.067685, -0.018630, 0.099611, -0.067083, -0.063023, -0.298718, -0.055957, -0.060316, -0.132824, 0.070875, -0.170032, -0.150865, -0.139121, 0.056826, -0.057555, 0.173526, -0.033044, -0.176352, 0.004065, -0.156959, -0.027710, -0.033842, -0.073733, -0.128360, -0.003599, -0.051226, -0.061700, -0.003758, -0.014539, -0.046511, -0.110425, 0.128015, -0.231739, -0.106121, -0.038900, 0.097092, 0.035449, 0.017131, -0.104227, -0.043500, -0.024928, -0.202910, -0.208084, -0.120633, 0.066237, -0.059753, -0.102700, -0.190374, 0.033872, -0.053534, -0.110964, -0.101446, -0.316068, -0.192431, -0.179674, 0.077152, -0.006705, -0.076162, -0.032159, 0.034086, 0.152305, 0.037173, 0.021813, -0.132683, -0.156665, 0.079378, -0.155447, -0.214694, 0.096089, -0.063509, 0.101612, -0.035093, 0.108689, -0.010299, -0.109493, 0.063949, -0.027202, 0.081326, 0.074989, -0.216796, -0.140920, 0.013567, -0.108084, 0.000514, -0.019131, -0.074172, -0.056545, -0.030716, 0.061396, -0.145528, 0.060607, -0.153891, -0.014031, -0.197471, -0.057406, 0.000210, -0.142272, -0.195956, -0.108426, -0.051464, 0.025249, 0.033301, 0.072820, -0.070160, -0.075075, -0.414190, -0.056709, 0.014012, -0.123079, -0.135602, -0.083215, -0.132410, -0.122187, -0.067494, -0.030361, -0.059567, -0.083601, 0.008446, -0.157833, 0.036584, -0.063084, -0.093042, -0.123170, -0.095886, -0.208335, 0.114761, -0.132242, -0.079764, -0.144490, -0.033118, -0.137616, -0.048970, 0.042755, -0.073891, -0.120175, -0.004388, -0.166212, -0.074016, 0.139331, -0.004680, -0.146244, 0.065165, -0.012432, 0.047423, -0.082236, 0.037926, -0.174762, 0.068420, -0.074712, -0.105722, 0.088164]
-,        [-0.046047, -0.077782, -0.072670, 0.048064, 0.080695, 0.053605, -0.148551, -0.002632, 0.136921, 0.081758, -0.196538, -0.022679, 0.018270, -0.199811, -0.017917, -0.026385, -0.030578, -0.046242, -0.084453, -0.092006, 0.036471, -0.006298, 0.080028, 0.002893, -0.007520, 0.059094, -0.010420, 0.024109, -0.034540, 0.043189, 0.057060, -0.050602, 0.019008, -0.143357, -0.048301, 0.052075, -0.038122, -0.161743, -0.034597, -0.038366, 0.138539, -0.060280, 0.109303, 0.015743, 0.084897, -0.028790, -0.035126, -0.025812, -0.013752, -0.075507, -0.057290, -0.016817, -0.059354, -0.017783, -0.174337, 0.054961, -0.167784, -0.013771, 0.105341, -0.131677, 0.012741, 0.025520, -0.032889, -0.007659, -0.031949, -0.121068, 0.053323, 0.156139, -0.011189, 0.032822, 0.059274, -0.087523, -0.097301, -0.105343, -0.018288, -0.085081, -0.200451, 0.032524, -0.100363, 0.097778, -0.086690, -0.032116, -0.105756, 0.067323, -0.261774, -0.059640, 0.037834, -0.091150, -0.146043, 0.058377, 0.039362, 0.025734, -0.147672, -0.192481, -0.000868, -0.029110, 0.026198, -0.139250, 0.119737, -0.091958, 0.003645, 0.045168, 0.009725, -0.072847, 0.045700, -0.020811, -0.073889, 0.019743, 0.126147, -0.071116, -0.062224, -0.012270, -0.051406, -0.000757, -0.043139, 0.004464, -0.151708, -0.105171, -0.126025, -0.153861, -0.109301, 0.034973, -0.104740, -0.007381, -0.024377, 0.039487, -0.087381, -0.120720, -0.141085, -0.026317, -0.086749, -0.131637, -0.084068, -0.140019, -0.143149, 0.038702, 0.122081, -0.180597, 0.078860, 0.005682, -0.044780, 0.153937, -0.142003, 0.008541, -0.101201, 0.082696, -0.298679, -0.104412, -0.140073, -0.185615, 0.097767, -0.142964, -0.025000, -0.115711, -0.110167, 0.163947, -0.020080, -0.195479, 0.009070, -0.103477, 0.155703, -0.069419, 0.011504, 0.085962, -0.017733, 0.161727, -0.098206, 0.036252, 0.042113, -0.064033, 0.027284, -0.009835, -0.025986, -0.053179, -0.112603, -0.034949, -0.007333, 0.075203, -0.098117, -0.162997, -0.121015, -0.073834, -0.058533, -0.092694, -0.036647, -0.018775, 0.018602, -0.168613, 0.089585, 0.000668, 0.025817, 0.019525, 0.062639, -0.217481, -0.072229, -0.147712, -0.140469, -0.175691, -0.075498, 0.106342, 0.034267, 0.113258, -0.024707, -0.026473, -0.125003, -0.090292, -0.079193, 0.127680, -0.073144, -0.086198, 0.107201, -0.077340, 0.097076, -0.051535, -0.032654, 0.044856, -0.116133, 0.128222, -0.014611, -0.144770, 0.070385, -0.063003, -0.009643, 0.006162, -0.143435, 0.007556, -0.098342, -0.058925, 0.064623, 0.018984, -0.196358, 0.002673, -0.116668, -0.014540, -0.038217, -0.136647, 0.057334, -0.000507, 0.004463, -0.257679, -0.094026, 0.039301, -0.088010, -0.042726, 0.051292, -0.101677, -0.032600, 0.159947, -0.051587, -0.053612, 0.015849, -0.020240, -0.082337, -0.036632, -0.258447, -0.149285]
-,        [-0.658637, 0.106754, 0.235567, -0.000504, 0.552401, -0.764388, -0.255761, -0.438169, 0.299967, 0.088594, 0.024116, -0.245515, -0.016316, 0.366202, -0.219262, -0.268569, -0.074151, -0.425329, -0.349602, 0.313943, -0.314167, 0.019974, -0.567779, 0.036768, -0.242031, -0.285336, 0.457764, -0.079357, -0.046529, -0.061296, 0.183200, -0.546308, 0.069850, -0.105130, 0.374142, -0.060355, -0.703511, -0.087380, -0.098454, -0.055363, 0.092006, -0.012356, -0.343065, -0.565110, -0.039104, 0.334866, -0.292418, -0.450661, -0.155155, -0.477960, 0.284383, -0.219844, -0.334876, -0.390410, -0.006981, 0.008229, 0.002598, -0.162977, 0.240954, -0.144639, -0.357650, 0.646374, 0.127950, -0.088293, -0.311204, -0.101811, 0.196295, 0.074313, -0.151742, -0.134440, -0.524423, -0.304666, -0.276680, -0.153932, 0.030670, -0.259292, -0.342229, -0.051689, 0.078199, -0.101358, -0.388595, -0.008958, 0.261168, -0.028763, 0.103167, 0.431909, -0.152178, -0.192203, -0.246212, -0.049546, -0.142099, 0.055494, 0.003677, 0.062425, -0.043206, 0.393238, 0.225769, -0.609372, -0.159690, 0.281472, -0.531121, 0.051536, -0.398324, -0.168112, 0.130358, -0.286058, 0.101853, -0.141964, -0.028528, -0.041702, -0.052279, -0.251851, -0.210637, -0.114024, 0.076784, -0.473463, 0.065678, -0.431333, 0.120714, -0.254784, -0.142483, 0.353236, -0.124452, -0.019775, 0.078557, 0.247796, -0.482897, -0.154288, -0.422332, -0.009952, -0.053845, -0.144347, 0.326843, -0.000633, -0.232074, -0.542158, -0.113417, 0.044390, -0.233312, -0.048311, -0.003342, -0.013585, 0.181201, -0.605850, -0.238430, -0.024176, -0.062027, -0.137852, -0.217846, -0.242133, 0.030449, -0.128778, -0.058626, 0.266037, -0.386955, -0.340986, 0.075557, -0.452153, -0.016460, -0.119887, -0.233433, -0.367034, -0.555793, 0.078289, 0.196385, 0.119540, -0.358643, -0.130659, -0.259907, -0.207711, 0.138630, -0.459215, 0.154035, 0.008166, 0.010875, 0.315831, -0.049319, -0.550451, -0.219088, -0.192750, -0.453107, -0.625762, -0.063055, -0.276695, -0.378767, -0.238526, 0.206749, -0.506889, -0.684414, -0.335796, 0.322596, -0.420535, 0.202036, -0.112299, 0.198768, 0.262577, -0.130528, 0.058547, -0.072894, -0.291406, -0.141710, -0.385042, -0.274753, -0.184454, -0.018838, -0.442298, 0.231416, -0.045796, 0.253314, -0.057567, -0.106653, -0.405415, 0.248306, -0.190615, 0.241643, 0.316655, -0.214964, -0.308112, 0.520440, 0.438730, 0.021812, -0.004166, 0.144664, -0.290205, 0.228864, -0.362363, -0.579378, -0.053231, 0.206127, 0.057934, -0.129633, -0.457669, -0.090144, -0.203801, 0.068372, 0.086405, 0.127227, -0.156889, -0.245172, -0.266207, -0.008069, -0.253160, 0.032422, 0.257203, -0.013328, -0.092804, 0.038682, -0.016658, -0.112899, -0.005132, -0.081388, -0.141735, -0.096620, 0.226035, -0.477307, 0.208416]
-,        [0.202843, 0.134124, -0.391636, -0.297185, -0.011658, -0.047831, 0.024302, -0.125255, -0.090586, -0.027028, -0.023756, -0.015154, -0.003414, -0.098078, -0.089321, -0.089910, -0.217007, 0.433903, -0.297922, 0.215831, -0.026146, 0.004086, -0.127329, -0.214164, -0.115660, -0.239289, -0.205400, -0.091063, -0.234181, -0.330681, -0.063497, 0.020265, -0.010916, -0.103104, 0.129922, 0.276863, -0.081175, -0.218258, -0.121386, -0.098463, -0.414301, 0.124276, 0.092320, 0.064890, -0.198692, -0.028684, 0.489292, 0.074956, -0.058565, -0.096196, 0.067188, 0.030843, -0.246315, 0.016468, -0.222098, -0.131102, -0.191907, 0.158619, -0.019801, -0.133217, -0.208832, -0.037142, 0.082140, -0.279772, -0.034469, 0.302348, 0.281374, 0.144277, 0.154300, 0.215610, 0.228577, -0.328795, -0.022705, 0.060273, -0.298717, -0.091747, -0.065004, -0.046004, -0.251963, -0.161770, -0.049771, -0.022349, -0.078574, 0.128085, 0.073545, -0.081848, 0.057556, -0.147558, -0.002902, 0.076919, -0.051730, -0.158548, 0.192811, -0.029556, 0.212380, 0.106213, 0.140999, -0.052383, 0.031206, -0.116643, 0.315130, -0.118418, 0.118408, -0.204130, 0.222958, -0.031445, 0.112951, -0.171910, -0.084380, 0.096421, -0.110512, -0.045919, -0.090912, 0.002261, -0.157761, -0.093490, -0.259023, -0.029230, -0.071247, 0.062210, 0.013132, -0.139695, -0.280956, 0.098381, -0.021885, 0.165288, -0.334825, 0.168549, -0.313412, -0.325919, -0.112789, 0.124552, -0.083310, 0.175171, -0.177703, -0.315555, -0.050288, 0.002947, -0.063265, -0.004524, 0.029658, -0.234976, -0.060397, -0.272090, -0.175025, 0.360304, -0.013287, -0.139205, -0.116227, -0.274013, -0.251199, 0.048101, 0.122999, 0.002551, 0.070577, -0.000961, -0.069256, -0.362411, -0.093493, -0.064496, -0.097516, 0.191875, -0.244342, -0.189266, -0.087659, 0.147236, -0.116486, -0.185816, -0.100887, -0.214065, -0.451497, 0.043944, 0.092117, -0.057657, 0.201808, -0.094580, -0.096289, 0.013129, -0.297372, -0.075123, 0.195997, 0.252137, -0.102872, -0.072787, -0.178679, -0.235447, -0.014044, -0.073983, -0.011009, -0.033161, -0.176160, 0.077434, 0.013890, 0.039467, -0.124357, -0.106733, -0.165763, 0.414674, -0.173635, 0.082323, 0.088040, 0.166702, 0.000530, -0.449294, 0.065260, 0.149283, -0.212333, -0.131135, 0.048313, -0.081571, -0.355075, -0.294308, 0.083123, 0.003634, 0.008773, -0.197936, -0.124678, -0.314731, -0.292098, -0.027465, -0.223394, -0.063410, -0.222842, -0.031718, 0.160037, -0.157422, -0.320137, 0.113449, 0.267528, 0.013339, -0.103908, -0.289830, -0.145461, -0.168505, 0.097708, -0.157094, 0.062099, -0.120926, -0.086918, -0.233339, 0.118754, 0.190527, 0.219742, -0.045034, -0.024854, -0.119657, -0.210486, -0.220174, 0.046515, -0.340568, -0.067458, -0.201671, -0.046475, -0.085739, 0.001816, 0.084660]
-,        [-0.206763, -0.543231, -0.045132, -0.382728, -0.384912, 0.447889, -0.443867, 0.027600, 0.371453, 0.076747, -0.145464, -0.194390, 0.240519, 0.118660, -0.032561, -0.266141, 0.220558, -0.217762, 0.360037, -0.027987, 0.324755, -0.210598, 0.409196, -0.162520, -0.010110, -0.074719, 0.290278, 0.626528, -0.237979, -0.512047, 0.004251, -0.252721, 0.091729, 0.110613, -0.282366, -0.030785, -0.046050, -0.124909, -0.627870, 0.033089, 0.118894, -0.018619, -0.051928, -0.086680, 0.061951, -0.271766, -0.161597, 0.323172, -0.277291, -0.040604, 0.030420, 0.191129, -0.353371, -0.109935, -0.120151, -0.028725, -0.144191, 0.438367, -0.050368, 0.073103, -0.622178, 0.415441, 0.144287, 0.271822, 0.032090, -0.041369, 0.304456, -0.106329, 0.063169, 0.285410, -0.066877, -0.267299, 0.315943, 0.215887, 0.052373, -0.010595, -0.170738, -0.214364, -0.469112, -0.195131, -0.203317, -0.028821, 0.469086, 0.299859, -0.084928, -0.365269, -0.009125, -0.211546, 0.669063, -0.556529, -0.102657, -0.319432, 0.014359, -0.150860, -0.177429, -0.058489, -0.286571, 0.619366, -0.027345, 0.067873, -0.342880, -0.199830, 0.012956, 0.375264, -0.306453, 0.308516, 0.136822, -0.224437, 0.046708, -0.086769, -0.400879, -0.207678, -0.218218, 0.667489, 0.511735, 0.037310, 0.212684, 0.040699, 0.338207, -0.114319, -0.047459, -0.349971, -0.224921, -0.038079, -0.349819, -0.436195, -0.569671, -0.394449, -0.605258, -0.032687, 0.071643, -0.431467, -0.290310, 0.398183, -0.197496, 0.115795, 0.094566, 0.176675, -0.355795, 0.340177, 0.170192, -0.473868, -0.504585, 0.032633, 0.148769, 0.340138, -0.431863, -0.127273, -0.192654, 0.005847, -0.542399, -0.591654, 0.348400, -0.407382, 0.170457, -0.458198, 0.002046, -0.059381, 0.348132, 0.205068, 0.051467, -0.023800, -0.184592, 0.032288, -0.314585, 0.616769, -0.374257, -0.319651, 0.088543, -0.167450, -0.623814, 0.477813, 0.327113, 0.008918, -0.099849, -0.414299, -0.169203, 0.495050, -0.739090, -0.673567, 0.249519, -0.378043, 0.082898, -0.358900, -0.293197, 0.181786, -0.331563, 0.178930, 0.143139, -0.144626, -0.108494, 0.012645, 0.050358, -0.163923, -0.132176, -0.623626, -0.093400, 0.220408, 0.048616, 0.331097, -0.065918, -0.586120, 0.128021, -0.106242, 0.239609, 0.605268, -0.274880, 0.372505, 0.040080, -0.335380, 0.173842, -0.080335, -0.072848, 0.287810, 0.324321, 0.019937, 0.085673, 0.137744, -0.117848, 0.094307, 0.578687, -0.152081, -0.204536, 0.071561, -0.680518, 0.110916, -0.048516, 0.179081, 0.157021, -0.532188, -0.789381, -0.249075, -0.066420, -0.187827, -0.295973, -0.059845, -0.019449, 0.193354, -0.356321, -0.449531, 0.022121, 0.255881, -0.134366, 0.368661, -0.251200, 0.259438, -0.509327, -0.282034, 0.241998, 0.045122, 0.147339, -0.626320, 0.018085, -0.813330, 0.243638, 0.073807]
-,        [-0.219392, -0.056142, 0.101271, 0.394685, 0.104598, -0.453141, -0.578547, -0.080989, 0.256544, 0.007072, 0.192353, -0.069511, 0.603097, 0.146573, 0.064077, 0.239290, 0.052373, -0.264250, 0.215726, -0.087225, 0.373127, -0.063617, 0.035631, 0.117991, 0.257529, 0.061426, -0.180716, -0.390243, -0.876565, 0.754506, 0.527549, 0.310576, -0.121749, 0.062367, 0.069690, 0.148645, -0.334247, -0.049326, -0.555318, -0.488911, -0.164116, 0.256354, 0.117692, -0.036135, 0.033189, 0.410972, -0.170138, -0.064510, 0.286309, 0.011640, -0.434130, 0.462094, -0.293805, -0.429878, 0.297543, 0.123305, -0.066003, -0.452955, -0.340299, -0.161501, 0.272521, -0.007066, -0.333960, -0.081112, 0.090243, -0.129990, -0.108104, -0.307827, -0.175037, 0.262295, 0.073954, -0.304777, 0.149256, 0.108213, -0.477639, -0.183149, 0.251629, -0.275713, -0.206712, -0.155774, -0.332627, 0.115273, -0.140651, 0.538343, 0.093649, -0.190125, 0.065351, -0.355416, 0.227653, 0.063926, 0.381907, -0.570225, 0.127803, -0.236928, 0.031238, -0.232974, -0.468087, -0.115549, -0.280048, 0.302961, 0.204382, 0.503147, 0.161542, -0.959621, 0.568956, 0.068610, 0.128878, 0.741336, 0.029129, -0.086292, -0.509021, -0.137668, 0.203680, 0.184435, -0.172194, -0.228973, 0.172810, -0.311229, 0.281303, 0.416860, 0.268944, 0.177376, -0.089904, 0.228872, -0.068839, 0.375721, 0.524194, -0.397241, -0.548554, 0.231667, 0.040048, 0.405072, -0.186409, 0.257576, -0.478299, 0.113588, -0.128221, -0.070420, -0.248628, 0.002984, -0.202346, -0.381234, -0.046768, -0.206479, 0.280249, 0.167456, -0.402419, -0.481277, -0.228018, 0.013647, -0.349121, 0.288452, -0.137988, 0.243974, 0.003566, 0.029504, -0.223068, 0.455641, -0.521524, 0.077104, -0.386147, 0.078009, 0.161993, 0.604064, -0.253573, 0.489449, 0.236094, -0.156365, -0.120881, 0.536798, -0.520173, 0.057226, -0.229904, -0.112821, 0.504900, -0.244855, 0.356113, 0.428301, -0.358349, -0.651832, -0.074217, -0.085793, 0.087638, -0.033630, -0.059661, 0.035529, 0.155394, -0.196944, 0.307269, -0.124349, 0.207465, 0.148049, 0.024911, -0.115115, -0.115790, -0.113043, 0.327498, 0.012710, -0.248910, -0.073134, -0.551218, -0.274865, 0.587582, -0.499482, -0.506503, 0.168745, -0.136680, -0.191124, 0.185218, -0.295888, 0.368299, 0.475914, -0.094887, 0.524044, -0.064881, 0.528808, -0.170406, 0.281510, 0.122754, -0.256411, 0.174328, -0.290377, -0.513371, -0.227618, 0.359165, -0.089337, -0.344863, -0.010662, 0.231940, 0.166706, -0.298545, -0.338165, -0.043562, -0.229420, -0.480425, 0.354987, 0.241133, 0.005053, 0.297296, -0.475390, -0.062238, 0.251220, -0.132216, 0.237435, 0.223724, 0.159493, -0.172254, 0.164571, 0.159456, -0.145859, 0.180136, -0.266039, -0.237439, -0.411746, -0.242846, 0.019571]
-,        [-0.190426, -0.287247, 0.340192, 0.660448, 0.863038, -0.447883, -0.332410, -0.622664, 0.381762, 0.000680, -0.404620, -0.529939, -0.160499, -0.156926, -0.110388, 0.086182, -0.388402, -0.220735, -0.055119, 0.374061, -0.002476, -0.043325, -0.090253, -0.292875, 0.018355, -0.425081, 0.045567, -0.143574, 0.502791, -0.158333, -0.239936, -0.243988, 0.138508, 0.500370, 0.454693, -0.085422, 0.244561, -0.426112, -0.206680, 0.340639, 0.213689, 0.178933, -0.047719, 0.211651, -0.565705, 0.452021, 0.185644, 0.012084, 0.314845, -0.204050, -0.495884, 0.371473, -0.498312, 0.028282, 0.185959, -0.314373, -0.358511, 0.209945, -0.092144, -0.139904, -0.018631, -0.332756, -0.858324, 0.378571, -0.264987, -0.438000, -0.150995, 0.000458, -0.082966, -0.617645, 0.369437, -0.383581, -0.191789, -0.088343, 0.577596, 0.260084, 0.166183, 0.157099, 0.127270, 0.114562, 0.158866, 0.278945, -0.198151, 0.011948, 0.154079, -0.254269, 1.102553, -0.410829, -0.210065, 0.012055, -0.200637, -0.057563, 0.070394, -0.224680, 0.027103, -0.073092, -0.584003, 0.671454, 0.088046, -0.423112, -0.080459, 0.561007, 0.823137, -0.107043, -0.758518, 0.094749, -0.281646, 0.274353, -0.477113, -0.554233, 0.187278, -0.145464, 0.162851, -0.558933, -0.413123, 0.290050, -0.103843, -0.550959, 0.336686, 0.177091, -0.632287, 0.314903, -0.236860, 0.163387, -0.741930, -0.323754, 0.319602, -0.232590, 0.383240, 0.246139, -0.056608, 0.159025, -0.045179, -0.058561, 0.168680, 0.023096, 0.133069, -0.194224, 0.154902, 0.205718, -0.033946, -0.214994, 0.348124, -0.434754, 0.371766, 0.271113, -0.374712, -0.085028, -0.226743, -0.071472, -0.661250, -0.509206, -0.182674, 0.358404, -0.084380, -0.547605, 0.077565, -0.060565, 0.173217, -0.131430, 0.075285, 0.280785, -0.482358, 0.474369, -0.186830, 0.178969, -0.730268, -0.611991, 0.378496, 0.028419, -0.063916, 0.595255, 0.437316, -0.346159, -0.667217, 0.086724, -0.072248, -0.438117, -0.035870, -0.176162, 0.447853, 0.255983, -0.083559, -0.249247, 0.084596, -0.146173, -0.038055, 0.006648, 0.051749, -0.116281, -0.502844, -0.131192, 0.089498, -0.217240, -0.549548, 0.292780, -0.054944, -0.353980, -0.095366, 0.112303, -0.234444, -0.587376, 0.188073, 0.159891, -0.142118, 0.269082, -0.194036, 0.063107, 0.064564, 0.342598, 0.598514, -0.129835, 0.207172, 0.721354, -0.125991, -0.120394, -0.166351, 0.597489, 0.429371, -0.500578, 0.214463, -0.030393, -0.435785, -0.321950, -0.498457, 0.004887, 0.182428, -0.188437, 0.657299, 0.109034, 0.295018, -0.753674, 0.078384, 0.407678, -0.174842, -0.714948, 0.048219, -0.159736, 0.437184, -0.636409, 0.125795, 0.369847, -0.076541, -0.057277, -0.220109, -0.420291, -0.442158, 0.285232, -0.202216, 0.388870, 0.101604, -0.158180, 0.209070, -0.274671, 0.012049, -0.364755]
-,        [-0.226388, 1.158485, 0.535696, 0.091833, -0.127379, 1.066092, 0.835621, 0.259049, 0.684636, -0.810179, 0.561927, -0.404441, 0.140878, 0.514344, -0.349276, 0.042726, 0.563436, 0.118876, 0.032413, -0.499664, -0.481941, 0.116811, -0.967861, 0.653575, -0.061845, 0.734131, -0.318648, 0.264124, 0.460958, -0.273996, 0.468691, 0.427226, 0.503602, -0.359652, -0.098225, -0.444795, 0.360494, 0.110673, -0.028134, 0.718283, -0.223588, 0.194358, 0.738698, 0.352617, -0.237801, 0.486227, 0.078125, -0.676690, 1.121217, -0.336767, 0.774783, -0.078056, 0.058448, -0.206373, -0.404577, -0.221963, 1.088889, -0.791590, 0.369284, 0.164296, 0.507913, 0.847231, 0.665673, -1.397946, -0.339751, 0.038545, 0.357040, 0.146357, 0.011224, -0.390592, 0.499489, 0.038053, 1.003335, -0.440165, 0.424390, -0.385455, 1.255019, 0.225806, 0.472062, -0.659189, -0.038814, 0.448757, -0.558681, -0.164034, -0.700231, -0.597255, 0.471324, 1.841237, 0.321541, -0.288752, -0.379565, 0.871342, 0.722107, 0.973219, 0.002986, 0.140857, 1.222092, 0.699657, 0.011482, 0.528224, 0.514313, -0.896764, -0.481940, 0.356651, 0.346367, -0.074874, -0.137859, 0.361525, -0.769976, 0.453482, 0.377551, 0.746108, 0.307562, -0.783444, 1.782321, 0.100466, 0.799685, -0.007565, 0.317384, 1.378901, 0.322516, 0.187240, 0.629713, -0.168744, 0.774482, 0.487142, -0.844077, -0.480457, -0.539745, -0.305851, 0.106476, -0.089047, 0.388447, 0.463110, -0.343445, -0.786322, 1.050003, 0.415400, -0.195568, 0.063727, 0.303521, -0.605983, -0.210599, -0.559112, -0.166777, 0.158896, 0.514543, 0.834334, 0.305522, -0.636128, -0.040859, 1.165199, -0.260782, 0.306300, 0.555553, 0.440378, 0.393563, -0.788630, 0.565451, 0.934227, 0.035666, -0.383040, 0.742101, 0.400191, 0.547360, 0.413147, -0.095041, -0.359687, -0.998681, -0.101308, 0.083525, -0.161308, 0.228431, -0.035620, 1.535672, -0.006749, 0.853480, -0.472283, 1.739282, -0.060997, 0.209845, 0.005202, -0.404429, -0.237682, 0.611335, 0.622537, -0.112595, 0.723369, -0.648104, -0.165560, -0.209250, -0.172697, 0.530045, 0.320144, 0.105594, -0.152655, -0.271411, 0.124883, 0.460112, 0.430300, 1.167809, -0.025159, -0.686144, -0.137219, 0.123877, -0.204599, 0.130526, -0.086193, -0.334540, -0.585248, -1.141487, 0.747817, 0.109408, 0.437507, 0.057035, 0.127012, 0.760674, -0.462899, -0.614522, 0.220046, 0.538927, 0.227241, -0.067939, -0.959068, 1.633926, -0.144130, -0.473227, 0.148685, 0.393270, -0.031704, -0.182772, 0.523552, -0.103452, 0.264053, 0.368678, 0.440063, 0.029878, 0.348720, 0.151997, 0.041777, 0.054251, 0.175357, 0.293443, 0.005296, 0.262941, -0.306510, 1.015311, -0.828226, 0.222683, -0.254893, 0.138209, -0.335200, -0.142184, -0.179128, 0.317159, -0.147713]
-,        [-0.175425, -0.503099, 0.132095, -0.507713, 0.140273, 0.810550, 0.214802, 0.798871, 0.077371, -0.364645, -0.822038, -1.131791, -0.430086, -0.660977, -0.051374, 0.783028, -0.157455, -0.033472, -0.237841, 0.853105, 0.203453, 0.078923, -0.334688, 0.216545, 0.130273, 0.045910, -0.128009, 0.052413, 0.057787, 0.109722, -0.250325, 0.567883, -0.159079, 0.007517, -0.173939, 0.539082, 0.256823, -0.235407, -0.129946, -0.639128, -0.198646, -0.015119, 1.007174, 0.271616, 0.800419, 0.385067, 0.014687, 0.164063, 1.300028, 0.428954, 0.998304, 0.319238, -0.314547, 0.206683, 0.265617, 0.068391, 0.247425, 0.168113, -0.293644, -0.025278, -0.601963, 0.201296, -0.084276, -1.224129, -0.048842, 0.071462, -0.143829, -0.629802, -0.370056, 0.077589, 0.088332, -0.091487, 1.109228, 0.451678, -0.336965, -0.265162, 0.646605, 0.404332, 0.018064, -0.217255, 0.070044, 0.169853, -0.668159, 0.106954, -0.127140, -0.080013, 0.062136, -0.011335, -0.135786, -0.663539, 0.063246, -0.187753, 0.740708, -0.380168, -0.152753, -0.646186, 0.208045, 0.187736, -0.055363, -0.489136, 0.510528, 0.141239, 0.116881, 0.078866, 2.170357, 0.127127, -0.473608, 0.507696, -0.172630, -0.115471, 0.679938, -0.038624, 0.146022, 0.348679, 1.160064, -0.561476, 0.106564, -0.514950, 1.106517, -0.433441, -0.315974, 0.652242, -0.063909, 0.424827, -0.243632, 0.576178, 0.078708, 0.004091, 0.017885, -0.241131, 0.327960, -0.000217, 0.538000, 0.144223, 0.404994, -0.223751, -0.112562, -0.318509, 0.057800, 0.256701, -0.138439, -0.158557, 0.105259, -0.077724, 0.236439, 1.141523, 0.477473, 0.439926, -0.110433, -0.289742, -0.106253, 1.933299, -0.117602, -0.232625, -0.119122, 0.215780, -0.145664, 0.009786, 0.456109, 0.404257, 0.318878, -0.104033, -0.139836, 0.832928, 0.570324, -0.156934, 0.211199, -1.084442, 0.814022, 0.573879, 1.220218, 0.107932, 0.265687, 0.331411, 1.682142, -0.070263, 0.013662, 0.313227, 1.202310, 0.415069, 0.195906, 0.205460, -0.014889, 0.421292, 0.487251, -0.599493, -0.209439, -0.170824, -0.055723, -0.300891, 0.092149, -0.201640, 0.065084, -0.019659, -0.231516, -0.114090, -0.239851, 0.180531, 0.250925, 0.500927, 0.192594, 0.176661, 0.363325, -0.410030, 0.213353, -0.093601, 0.151815, 0.502554, 0.026613, 0.116172, 0.087700, -0.103093, 0.210579, 0.376182, 0.197216, -0.712264, -0.134367, 0.431908, -0.340104, -0.337891, -0.260673, -0.050106, -0.218506, -0.565675, 1.003097, 0.014544, 0.445714, 0.352841, 0.270281, -0.106318, -0.278761, -0.142568, -0.100776, 0.461017, 0.018336, -0.021971, 0.117752, -0.482864, 0.279843, -0.485299, 0.003723, -0.008888, -0.027834, -0.301397, 0.009182, 0.365629, 2.141095, 0.382099, 1.443275, 0.448078, -0.173982, -0.237121, 0.437316, -0.151484, 0.176935, -0.151787]
-,        [-0.450253, -0.416590, 0.057398, 0.253753, -0.082496, -0.198363, 0.085966, -0.095206, -0.222126, -0.000955, 0.330728, -0.260933, -0.178802, 0.396872, 0.339567, 0.067573, -0.198979, 0.107526, 0.236042, -0.006504, -0.015878, 0.032797, -0.409854, 0.003897, 0.024063, 0.079322, 0.379681, 0.098494, 0.316883, 0.046004, -0.200261, 0.002121, -0.243422, -0.144884, 0.182074, 0.026153, -0.053489, -0.126710, 0.176755, -0.018310, -0.387931, -0.238106, 0.447360, 0.348576, -0.120733, 0.023482, -0.322684, 0.158643, -0.043070, -0.377503, 0.158405, 0.309035, -0.428963, 0.176239, 0.141176, -0.126516, 0.218918, 0.201921, -0.114132, 0.021794, -0.113852, 0.216511, 0.406856, -0.323852, 0.213380, 0.109332, 0.177833, 0.552056, 0.053457, 0.099204, 0.416743, -0.159274, -0.218468, -0.203012, 0.121802, -0.598584, 0.002080, -0.406285, -0.227095, -0.283330, -0.467546, 0.379123, -0.344063, 0.042174, -0.064806, 0.513683, -0.017072, -0.014904, 0.454562, 0.460882, -0.637104, -0.233044, -0.116892, 0.030820, 0.117082, 0.074523, -0.235160, -0.047346, -0.100916, 0.144714, 0.112480, 0.008729, -0.183331, 0.029861, 0.090390, 0.010285, 0.093199, 0.060734, -0.066012, 0.533345, -0.073155, 0.448127, 0.137131, 0.272046, -0.241017, 0.034082, -0.198116, -0.195647, 0.174045, 0.166874, 0.030182, -0.164512, -0.486791, 0.295217, 0.074401, 0.147100, -0.094556, -0.011162, -0.493266, -0.273353, -0.179476, 0.284028, -0.115947, 0.250311, -0.060616, -0.332414, 0.126531, -0.221171, 0.127079, -0.182505, 0.044708, 0.317896, -0.335329, -0.168582, 0.035237, 0.431886, 0.228815, 0.182498, 0.044595, -0.034233, -0.159821, -0.010879, -0.052963, -0.383344, 0.299562, 0.609200, -0.182497, -0.629291, -0.353857, -0.068460, -0.080919, -0.626057, -0.458004, 0.152930, -0.113849, 0.102077, 0.029748, -0.330353, -0.346190, -0.212482, 0.206258, 0.152022, 0.050278, -0.174333, -0.111584, -0.310211, 0.727391, -0.271137, -0.346492, -0.564832, 0.243267, 0.480785, -0.111473, -0.041688, 0.060055, -0.005584, -0.124354, -0.041818, -0.332211, 0.513840, 0.373544, 0.157823, -0.025328, 0.048290, -0.418032, 0.013722, 0.050774, 0.500182, -0.188282, -0.067453, 0.157795, -0.354628, 0.010215, 0.054527, 0.222793, 0.214996, 0.088208, -0.351291, 0.225053, 0.513609, 0.029755, -0.038042, 0.109530, 0.512723, -0.308274, -0.174398, 0.341598, -0.111923, 0.473323, 0.386213, -0.214344, -0.027420, -0.527060, -0.696305, 0.283428, 0.281001, -0.267791, -0.268899, -0.250787, 0.224252, 0.506541, -0.032641, 0.212040, 0.048934, 0.046066, 0.026839, -0.078501, 0.028039, -0.012934, -0.517067, 0.185140, 0.171217, -0.143924, -0.132132, 0.098608, 0.157736, -0.093516, 0.696789, 0.339870, 0.274182, 0.096136, 0.021433, 0.106569, -0.066193, 0.003783, -0.297819]
-,        [0.122272, -0.199256, -0.475531, -0.031196, -0.365447, 0.412744, 0.360095, 0.515880, -0.331765, -0.329025, -0.724578, -0.526582, -0.485626, -0.167472, -0.141446, 0.077233, 0.009262, -0.128303, -0.277420, -0.356720, 0.148659, 0.013970, 0.110861, 0.026355, -0.609617, -0.180877, -0.419538, -0.046892, -0.444669, -0.897217, 0.252942, -0.302712, 0.008108, -0.004785, -0.030684, 0.023157, 0.299114, 0.220777, -0.232976, -0.614013, 0.032991, -0.244630, 0.068192, -0.164851, -0.513829, -0.590809, -0.221531, -0.029636, -0.022053, 0.039472, -0.385162, 0.030587, -0.242910, -0.001322, -0.265871, -0.236379, -0.072328, -0.041377, 0.139523, -0.245623, -0.008092, 0.098579, -0.426669, -0.334574, -0.782115, -0.226788, -0.126995, -0.602537, -0.117170, 0.010720, -0.168131, -0.176848, 0.445520, 0.140816, -0.308310, -0.094559, 0.413242, -0.038437, 0.172155, -0.200977, 0.069158, -0.062145, 0.232537, -0.112199, -0.140298, -0.127249, -0.141147, -0.382161, -0.042741, -0.198015, -0.088719, -0.462199, 0.031916, 0.045092, -0.045070, -0.264766, -0.261508, 0.027635, -0.065854, -0.375088, -0.236133, -0.233841, 0.042386, 0.197634, -0.603351, -0.392878, -0.263726, 0.169703, -0.261711, -0.130323, 0.022130, 0.644283, 0.149802, -0.073775, -0.873748, -0.480822, -0.240337, -0.208474, -0.202850, 0.292448, -0.269971, 0.040036, -0.350896, -0.265898, -0.040130, 0.000584, -0.313082, -0.242062, -0.942666, 0.223116, -0.831779, -0.589896, -0.157811, 0.082714, 0.438071, -0.379688, -0.148375, 0.249442, 0.035161, -0.259795, 0.043238, -0.850501, -0.435400, -0.067621, -0.836310, -0.531587, 0.076501, -0.413451, -0.125882, -0.070937, -0.080709, -2.685043, 0.190486, -0.517833, 0.216975, -0.052270, -0.457776, -0.272341, -0.606767, -0.022853, 0.001156, 0.313509, 0.103437, -0.458249, -0.090697, 0.276139, -0.084593, -0.346669, 0.114286, -0.031055, -1.156526, -0.121500, -0.332947, -0.211146, 0.053024, -0.392496, -0.580621, -0.266083, 0.541359, 0.030961, 0.424241, 0.205575, 0.003523, 0.006250, -0.616279, -0.093776, -0.486951, -0.803154, 0.083171, -0.382368, -0.171038, -0.673195, -0.045104, 0.004838, -0.270985, -0.028157, -0.020797, -0.102061, -0.987734, -0.413769, -0.144360, -0.183031, 0.190038, 0.252944, -0.019418, -0.272108, 0.369988, -0.309215, 0.021402, -0.450680, -0.329048, -0.514663, 0.119757, -0.451321, 0.448584, -0.252903, -0.636913, 0.517871, -0.336556, -0.034267, 0.485524, -0.330532, -0.549393, -0.531299, -0.332669, 0.142902, -0.177666, -0.088125, -0.064467, -1.070151, -0.409037, 0.265211, -0.114578, -0.685516, -0.275434, -0.047069, -0.370819, -0.167175, -0.964802, -0.227016, 0.228980, -0.100485, -0.146174, 0.031899, -0.244203, -0.031527, -1.595541, 0.027114, -1.221593, 0.190987, -0.239306, -0.172247, 0.345281, 0.135048, -0.854138, -0.526561]
-,        [0.164951, -0.319929, -0.416392, -0.112237, 0.269730, -0.358876, -0.398174, -0.415521, 0.112526, -0.230586, 0.189905, -0.129381, -0.056317, 0.298669, -0.021131, -0.091071, -0.155597, 0.065763, 0.151999, 0.432184, 0.148717, 0.072320, -0.306268, -0.034553, -0.180788, 0.050452, 0.150649, -0.027477, 0.163838, 0.118994, -0.017452, 0.002001, 0.491290, -0.247743, -0.026535, -0.067823, -0.265086, 0.039140, -0.289407, -0.049830, 0.264002, -0.247293, 0.284028, 0.319350, 0.070154, 0.226490, 0.086274, 0.070732, 0.042693, 0.039400, -0.205719, 0.157006, -0.393534, 0.007198, -0.224699, -0.066427, 0.213033, 0.445280, -0.231696, -0.088275, -0.418076, -0.066584, 0.011339, 0.015015, 0.106532, -0.118657, -0.125957, 0.292329, -0.157699, -0.035874, 0.248868, -0.192095, 0.011774, 0.013553, 0.020734, -0.292190, -0.235816, 0.071474, -0.016987, -0.188608, -0.088864, 0.281043, -0.366056, 0.241150, 0.414659, -0.041604, 0.115787, 0.051093, 0.017372, 0.264913, -0.041639, -0.424935, 0.138207, -0.037555, 0.109075, 0.221950, -0.037684, -0.126094, -0.431059, -0.535559, -0.129634, 0.146658, 0.508762, 0.407191, -0.122859, -0.001612, 0.290902, 0.096477, -0.183589, 0.184982, -0.107977, -0.322369, 0.009586, -0.131128, -0.157129, -0.087060, 0.040310, -0.313205, 0.127559, -0.139001, -0.125870, 0.355720, -0.222983, 0.022243, -0.083155, -0.272592, -0.082987, -0.227753, 0.113107, 0.126198, -0.015191, 0.245654, -0.061874, 0.138311, -0.298547, -0.037862, 0.172072, 0.110949, -0.156861, -0.087930, -0.242406, 0.193406, -0.032528, 0.210009, -0.007042, 0.156770, -0.176601, -0.081843, -0.014917, -0.051391, -0.591416, -0.409753, 0.148745, 0.467216, 0.074758, -0.004790, 0.230897, -0.166104, 0.203794, -0.058507, -0.256876, 0.200708, 0.009979, 0.099325, 0.188246, -0.092547, 0.225658, -0.095615, 0.318119, 0.160248, 0.036557, -0.089456, 0.242658, 0.078661, -0.477836, -0.261121, -0.402079, 0.391852, -0.477786, -0.165741, -0.159096, 0.180216, 0.034190, 0.117133, -0.190258, -0.165350, -0.023214, 0.044671, -0.494153, -0.128671, -0.489609, 0.036280, 0.351415, -0.230275, -0.114897, -0.175533, -0.132539, -0.010625, -0.199885, -0.155935, 0.230600, 0.002726, 0.094852, 0.088878, -0.160338, 0.003856, -0.190671, -0.156059, 0.098462, -0.053371, -0.240138, 0.203975, -0.153320, -0.269392, -0.156064, 0.207251, 0.026552, 0.173937, -0.077929, -0.106367, -0.142680, -0.063300, -0.229700, -0.095979, -0.103677, -0.291369, 0.065835, 0.150559, -0.082524, 0.203100, -0.182796, -0.195435, 0.062907, 0.231573, 0.417056, -0.036576, 0.194909, 0.193612, -0.269431, -0.161550, -0.201972, -0.118321, -0.189770, -0.054445, 0.314898, -0.357485, -0.096599, 0.063933, 0.120157, 0.128070, -0.030712, 0.075424, 0.298356, 0.005514, 0.257213, 0.049574]
-,        [-0.085372, -0.074907, -0.040171, 0.003680, -0.220241, -0.156524, -0.148768, 0.071556, -0.076276, -0.443751, 0.244439, -0.235963, -0.138958, -0.152412, -0.145061, 0.011596, -0.266890, -0.015435, -0.071146, -0.403104, -0.301754, -0.080149, -0.108980, -0.162922, -0.105424, 0.134008, 0.083010, 0.211677, 0.225952, -0.293803, 0.264913, 0.412807, 0.105550, 0.097291, -0.206832, -0.169255, -0.453523, 0.030715, 0.067734, -0.187993, 0.038539, -0.502910, 0.198968, 0.130675, 0.592954, -0.135784, -0.397530, -0.113446, -0.396960, -0.217329, -0.285864, -0.396730, -0.234129, -0.249743, -0.143391, -0.142144, -0.151985, -0.369635, -0.283656, 0.019861, -0.172378, 0.160314, -0.461176, -0.496577, 0.027169, 0.707061, 0.134833, -0.055052, -0.220508, 0.103252, 0.041112, -0.381293, 0.174388, -0.206582, -0.387892, -0.307322, 0.054232, -0.208805, -0.036956, -0.068850, -0.650250, 0.054882, 0.051227, -0.167078, -0.218154, 0.351419, 0.055883, -0.005525, -0.171490, -0.359544, 0.025137, 0.249996, -0.026997, -0.244622, -0.044224, -0.170184, 0.205821, -0.200685, -0.158422, -0.038890, -0.372897, -0.446748, -0.364281, 0.380306, 0.249291, -0.219952, -0.415808, 0.106797, 0.093146, -0.000953, -0.429900, -0.279952, 0.102220, -0.262618, 0.197519, 0.087010, 0.154189, 0.133375, 0.033541, 0.389183, 0.447181, -0.071170, -0.238030, 0.220269, -0.370875, 0.168632, -0.280489, -0.652437, -0.933000, -0.182016, -0.715666, 0.234744, 0.199399, -0.326117, 0.051810, -0.125045, -0.002778, 0.084019, 0.075650, -0.322825, 0.121430, -0.158621, -0.289058, -0.233591, -0.225598, -0.120510, -0.050325, -0.153530, -0.207916, -0.629168, -0.142752, -0.114317, -0.064770, -0.281805, -0.322829, -0.351752, -0.404810, -0.150101, 0.244146, -0.501140, -0.072086, 0.202299, -0.248698, 0.011953, 0.292915, -0.204834, -0.108362, -0.102675, -0.866377, -0.242926, -0.234745, 0.018007, -0.237833, -0.731902, 0.510330, -0.160801, -0.076255, -0.584449, -0.098526, -0.513831, -0.272930, 0.171614, 0.064856, -0.617972, -0.088544, 0.588533, -0.185910, -0.049343, -0.097960, 0.441118, -0.141436, -0.066025, -0.460221, -0.277330, -0.090884, -0.023663, -0.503059, 0.146047, 0.062445, -0.341822, -0.002758, -0.104796, -0.302206, -0.077031, -0.520731, -0.002349, 0.495501, 0.085982, -0.129168, 0.405274, 0.133803, -0.303852, -0.057782, 0.008535, 0.169269, -0.313661, -0.406718, -0.830405, -0.153990, -0.269756, -0.267723, -0.517531, 0.058599, 0.035740, 0.321215, 0.493477, -0.469671, -0.206276, -0.096134, -0.140174, 0.378367, -0.080673, 0.025854, 0.105733, -0.181537, -0.262389, -0.024325, -0.131409, -0.078240, -0.361014, -0.224982, 0.157530, 0.100979, -0.290022, 0.600742, 0.070838, 0.116038, 0.050465, -0.433692, -0.495003, 0.028890, -0.196249, -0.291341, -0.539257, 0.493719, 0.015701]
-,        [-0.171283, 0.053093, 0.071769, 0.205813, -0.196150, -0.180631, -0.077151, -0.066123, -0.201540, 0.064484, -0.167355, -0.225686, 0.244148, 0.065759, -0.095244, -0.079857, 0.220726, -0.154599, 0.221956, 0.000462, -0.121337, -0.182018, -0.152943, 0.192552, -0.238298, -0.160012, -0.071418, -0.009564, -0.258170, 0.143823, 0.094673, 0.060304, 0.131223, -0.351864, -0.134259, 0.053643, -0.012139, -0.059088, 0.044018, -0.115820, -0.273745, -0.106050, 0.203638, -0.161629, 0.074074, -0.037907, 0.128991, -0.020219, 0.016709, -0.257997, 0.077601, -0.056258, -0.065997, -0.251905, 0.318660, -0.393530, -0.012566, 0.034766, 0.248117, 0.023480, 0.207949, 0.152187, 0.022088, -0.034156, -0.013798, -0.057258, -0.065126, -0.087010, -0.096824, 0.072910, -0.110735, -0.077599, 0.125019, 0.080816, -0.107487, -0.163386, -0.098391, -0.055718, -0.002521, -0.317897, -0.097701, 0.004698, -0.158566, 0.057370, 0.154154, 0.023805, -0.034396, 0.235835, 0.039859, 0.073536, -0.139670, -0.210140, -0.098037, 0.176484, -0.101413, -0.049611, -0.218430, 0.101461, -0.211766, -0.089572, -0.093636, -0.086636, -0.062739, -0.308140, -0.000112, 0.003457, -0.059159, 0.131544, -0.030887, 0.338631, -0.154173, 0.007133, -0.181832, 0.123386, -0.233460, -0.086483, -0.143232, -0.155445, 0.171276, 0.156839, -0.192099, 0.109388, -0.086633, 0.169132, -0.029079, -0.231664, -0.075700, 0.021087, 0.085858, 0.044174, -0.391818, 0.151136, -0.085025, -0.146697, 0.025022, 0.047454, 0.166623, -0.218112, -0.097935, -0.517998, -0.008929, -0.011722, -0.035417, -0.266363, -0.126592, 0.111290, -0.120888, -0.007879, -0.075774, 0.191188, -0.083817, -0.083073, 0.215335, -0.136496, -0.221408, 0.202935, -0.103555, -0.250532, 0.189981, -0.172245, -0.058542, -0.107427, -0.294451, -0.173944, 0.041004, 0.269147, 0.090673, -0.194674, -0.331283, 0.288115, 0.185386, -0.070198, -0.213895, -0.106523, -0.027489, -0.060377, -0.050593, -0.030657, -0.442587, 0.117556, 0.045044, -0.184022, 0.257948, -0.211567, -0.250773, 0.176398, 0.138778, -0.030635, -0.079033, 0.186991, 0.063234, -0.073798, -0.008859, -0.370399, -0.109744, -0.243031, -0.133277, 0.114584, -0.029622, 0.165657, -0.015757, 0.017049, -0.094925, 0.040184, 0.192899, -0.242403, -0.088618, 0.008517, 0.043386, -0.010485, -0.356893, -0.137225, 0.053375, -0.095235, 0.090580, 0.080719, -0.060029, -0.152120, 0.028653, 0.214496, 0.226503, -0.128652, -0.057943, -0.145966, 0.017148, -0.163390, -0.065781, 0.056556, 0.010806, 0.043244, -0.295141, -0.148479, -0.300143, -0.138082, 0.051256, -0.152656, 0.137089, -0.184254, -0.050154, -0.203376, 0.273959, -0.262722, -0.145504, -0.118997, -0.191958, -0.020834, -0.189609, -0.050669, -0.128915, -0.109547, -0.107856, -0.049716, -0.068451, -0.040306, -0.056421, -0.108413]
-,        [-0.978880, 0.160793, 0.074459, -0.028362, -0.028457, -0.227247, -0.276394, -0.226080, 0.287601, 0.031645, -0.403502, 0.049300, 0.512982, 0.215499, -0.145245, -0.162026, -0.267601, 0.060450, -0.057402, 0.335141, -0.139669, -0.034466, -1.217744, 0.120776, 0.251319, -0.358048, -0.525405, -0.210159, 0.091656, -0.612146, -0.288412, -0.325555, 0.455281, 0.139197, -0.084194, 0.173020, 0.150156, -0.347834, -0.284514, 0.519554, -0.448286, -0.282333, -0.026615, 0.197341, -0.409438, 0.888202, 0.724088, 0.222605, -0.376687, 0.065114, 0.188680, -0.220643, -0.446039, -0.181138, 0.113275, -0.009578, 0.273930, 0.138443, 0.016212, 0.043395, 0.611145, 0.027678, -0.010138, -0.089250, -0.477809, 0.075216, -0.628626, -0.454140, -0.259806, 0.225637, 0.306404, -0.013964, -0.230071, 0.216343, 0.252772, -0.418679, 0.078891, 0.030288, 0.020636, -0.305840, -0.074274, -0.237494, 0.051453, 0.074733, -0.932106, -0.099212, 0.376443, 0.078233, -0.082455, -0.003625, -0.064385, 0.295615, 0.065494, -0.433724, -0.172178, 0.130343, -0.146212, -0.252171, -0.557309, 0.038486, 0.045375, 0.077498, -0.401466, -0.411847, 0.148517, -0.051038, -0.199897, -0.006044, -0.391601, 0.785152, -0.025364, 0.066057, 0.280731, -0.028844, -0.167703, -0.263044, -0.298124, -0.006094, 0.294803, 0.168514, -0.205118, 0.040901, -0.385258, 0.439337, -0.024227, -0.155244, 0.480802, -0.015722, -0.558709, -0.033435, 0.128365, 0.335806, -0.147204, -0.723396, -0.194722, 0.312543, 0.313025, 0.270059, -0.421260, -0.054587, 0.026056, 0.056047, 0.034019, -0.398589, -0.042424, -0.235896, 0.298717, -0.015375, 0.116940, -0.406553, -0.209094, -0.236469, 0.198881, 0.099107, -0.327692, 0.646033, -0.379889, 0.208724, 0.304474, -1.111871, -0.412247, 0.083471, -0.487279, 0.137343, -0.516314, -0.112401, 0.583763, -0.046531, 0.012489, 0.223119, -0.965723, -0.483573, 0.228612, -0.218112, 0.202760, -0.527816, -0.302177, -0.754268, -0.402262, -0.187183, -0.402384, -0.738072, -0.053745, -0.071948, 0.322274, 0.234970, -0.097409, -0.182393, -0.256283, -0.046919, -0.036684, -0.085578, -0.125411, 0.007288, 0.332618, -0.579556, -0.084848, -0.158022, -0.413882, 0.199597, 0.013789, -0.167260, -0.392941, -0.104347, 0.081870, 0.194241, -0.694694, -0.491276, 0.071058, -0.560599, -0.350848, -0.082687, -0.094817, 0.215495, -0.565339, 0.358335, 0.106296, -0.690256, 0.041532, -0.446110, 0.575722, -0.346954, -0.794140, -0.869524, 0.049985, 0.519785, -0.516629, -0.043278, -0.006405, 1.042883, 0.098171, 0.074006, 0.110873, -0.207106, 0.209180, -0.103959, 0.145942, 0.221465, 0.006696, -0.323645, 0.031511, -0.071183, 0.071459, -1.075300, 0.417796, -0.218510, -0.378981, -0.025358, -0.050487, -0.619709, -0.522434, -0.685743, -0.855510, -0.016789, -0.263062, -0.393115]
-,        [-0.208084, 0.016464, -0.179890, 0.117035, -0.150994, 0.063821, -0.322869, -0.206725, -0.037337, 0.159997, -0.262214, -0.183818, 0.026619, -0.081668, -0.016414, -0.213427, -0.278867, -0.235779, -0.372823, -0.166774, 0.030021, -0.119447, -0.064975, 0.030145, -0.028422, -0.040778, -0.144293, -0.047656, -0.004882, -0.094930, 0.164872, -0.216540, -0.109160, 0.201708, -0.154144, 0.089040, -0.160909, 0.053185, 0.144357, -0.187161, -0.437249, -0.115141, 0.002031, -0.320370, 0.113622, -0.020585, 0.011283, 0.114968, -0.304834, -0.178033, -0.276044, -0.259282, -0.199906, 0.039128, -0.127880, -0.375980, -0.058411, 0.170565, -0.079146, -0.049015, 0.293320, -0.190698, 0.062911, 0.167963, 0.021098, 0.092324, -0.285937, 0.122273, -0.310456, -0.129140, -0.257117, -0.123935, -0.072264, -0.219548, -0.312269, -0.196525, 0.113644, -0.147633, -0.003164, -0.235226, -0.106538, 0.424307, -0.412845, -0.219365, -0.126170, 0.033898, -0.011317, 0.194646, -0.065955, -0.026518, -0.184365, -0.319596, -0.112186, -0.189721, -0.003997, 0.116639, -0.109292, -0.228317, -0.255369, 0.027353, 0.035299, 0.324031, -0.254131, -0.035821, -0.253494, -0.048864, -0.399765, 0.094704, -0.193963, 0.101128, -0.299920, -0.068771, -0.184854, -0.076331, -0.105856, -0.058584, -0.082788, -0.154670, -0.081443, -0.076682, -0.328211, -0.277618, -0.135593, -0.082241, 0.076504, 0.301851, -0.178507, -0.039707, -0.161815, -0.236587, -0.009052, -0.166661, -0.244252, -0.116923, 0.122192, -0.083532, -0.202335, -0.309196, -0.039029, -0.020351, 0.021160, 0.095380, 0.048125, 0.167673, -0.126170, 0.271527, -0.243122, 0.095061, -0.176120, 0.096992, 0.088922, -0.108367, -0.057007, -0.343033, -0.312566, 0.024479, 0.049710, -0.012745, 0.156179, -0.129601, -0.218436, -0.388056, -0.313268, -0.212092, 0.036947, -0.090637, 0.065338, 0.014753, -0.227762, -0.240805, -0.239408, 0.135077, 0.069334, 0.043578, 0.175577, -0.056877, 0.035484, 0.215795, -0.026994, -0.061303, -0.038672, 0.100255, -0.155030, -0.091755, -0.007988, 0.148315, -0.264163, -0.082483, -0.205093, -0.127114, 0.076533, -0.071432, -0.063954, 0.017753, -0.062183, -0.332119, -0.049116, -0.071142, -0.382512, -0.056080, -0.103325, -0.139602, -0.098151, -0.003744, 0.117381, -0.311578, -0.073371, -0.104476, 0.149685, 0.180358, -0.052388, -0.265422, -0.073130, -0.129849, -0.097785, -0.078717, -0.185964, -0.171461, 0.110873, -0.137520, -0.094088, -0.084758, 0.124301, 0.136416, -0.099416, -0.013485, -0.190071, -0.026988, -0.100044, -0.265037, 0.081059, 0.014928, 0.072388, -0.007767, 0.144508, 0.007244, -0.190997, 0.168919, 0.035134, -0.020902, -0.104509, 0.095737, 0.150883, -0.046063, 0.060044, -0.168467, -0.328414, -0.034950, 0.213734, -0.323240, -0.134029, -0.164223, -0.160999, 0.381828, -0.143601, 0.045420]
-,        [0.299902, -0.203034, -0.096625, -0.249718, -0.663668, 0.528052, -0.287359, 0.095038, 0.230224, -0.093248, -0.173724, -0.419256, -0.010767, 0.184235, -0.317173, -0.648896, -0.144835, -0.100438, -0.093210, -0.296217, -0.097384, 0.107959, -0.216082, 0.096358, -0.390585, 0.217318, 0.268780, -0.330139, 0.236279, 0.436879, -0.085791, 0.082190, -0.107886, -0.177903, -0.323768, -0.428279, 0.263145, -0.425432, 0.053141, -0.128908, -0.449559, -0.203429, 0.035127, -0.459788, -0.206880, 0.303653, -0.066498, -0.185163, 0.128377, 0.103159, -0.103657, 0.140550, -0.324974, 0.055341, -0.010590, -0.084525, 0.336089, -0.051114, -0.134781, 0.044211, 0.454894, 0.027683, -0.122437, -0.409857, -0.264485, -0.174164, -0.396398, 0.274101, 0.151932, -0.091681, -0.011932, -0.375635, -0.309183, -0.167081, 0.061159, -0.452762, -0.533449, 0.054410, 0.273323, -0.204484, -0.046088, 0.188239, 0.122341, 0.060252, -0.537175, -0.636795, -0.018717, -0.144248, -0.249659, 0.222587, 0.130330, -0.280697, -0.085796, 0.240562, -0.054948, 0.151291, 0.322587, -0.322722, -0.537536, 0.518864, 0.305143, 0.089196, -0.376050, -0.053117, -0.297542, 0.042073, 0.063066, -0.578300, -0.330223, -0.351960, -0.362164, -0.368249, 0.260863, -0.320474, 0.015331, -0.152554, -0.220700, -0.071624, -0.163035, -0.326402, -0.417600, -0.301686, -0.176217, -0.269186, 0.105354, -0.013724, 0.402393, -0.231608, -0.628715, 0.531827, -0.417882, 0.104982, -0.046027, 0.214864, 0.214452, -0.182402, -0.168411, -0.332830, -0.307387, -0.330510, -0.261219, 0.319946, -0.133150, -0.337770, -0.318251, -0.015506, -0.318527, 0.054068, -0.506446, -0.022882, -0.421495, -0.333697, -0.073230, -0.147255, 0.322795, -0.188123, -0.158112, -0.472228, 0.062355, -0.377002, -0.120433, -0.497000, -0.431209, -0.321525, 0.149864, 0.082613, 0.389833, -0.195704, 0.300488, 0.179768, 0.606705, -0.797271, -0.025902, -0.479107, -0.634542, 0.174740, -0.552082, -0.107158, -0.029689, -0.002155, 0.221263, -0.446703, -0.128016, 0.152275, 0.725063, -0.594696, -0.227749, 0.045785, -0.293344, -0.200758, -0.303352, -0.181326, -0.052908, 0.270835, -0.655303, 0.128337, -0.388082, -0.002762, -0.075972, 0.011532, 0.001828, 0.348195, 0.146785, -0.653763, 0.095399, -0.024080, 0.065647, 0.308672, -0.480232, 0.128550, -0.318684, -0.306988, 0.127129, 0.182860, -0.109637, -0.523193, 0.037093, -0.864292, -0.196923, -0.165075, 0.066714, -0.060757, -0.223550, -0.365823, -0.089574, -0.061829, -0.468285, 0.006598, -0.501175, -0.351367, -0.532802, -0.334678, -0.055275, 0.410230, 0.138720, -0.267077, 0.091343, 0.250251, 0.373944, -0.362270, -0.160151, -0.138036, -0.015921, -0.360249, -0.302932, 0.490812, -0.188326, -0.189844, 0.130909, 0.223819, -0.609008, -0.006910, -0.003281, 0.130208, 0.140713, 0.263742]
-,        [-0.300058, 0.026285, -0.175342, 0.000179, 0.219686, -0.262215, 0.130775, -0.181267, 0.034209, -0.006567, 0.301602, -0.484040, -0.339221, -0.396567, -0.341406, 0.602929, -0.187428, 0.101286, -0.194939, -0.508601, -0.617646, 0.012019, -0.115537, -0.521715, -0.317060, 0.096738, -0.095420, -0.040526, -0.421837, 0.006963, -0.015644, -0.154117, 0.206012, 0.167012, -0.065130, -0.050477, -0.100754, -0.608025, -0.602689, 0.244745, 0.244614, -0.221526, 0.092583, -0.274814, 0.073982, 0.279977, 0.133703, -0.054125, -0.609533, -0.260347, -0.699432, -0.481453, -0.169179, -0.106498, 0.133879, 0.138729, 0.162876, -0.041925, -0.023636, -0.123751, -0.466024, -0.461372, -0.014325, -0.587455, -0.157837, 0.454032, 0.131828, 0.124244, -0.206660, 0.040471, -0.058095, -0.240219, -0.068589, -0.162878, -0.025964, -0.104955, 0.296205, -0.401502, -0.013623, -0.200057, -0.001422, 0.286613, 0.007606, -0.202530, -0.167699, 0.128123, 0.163442, -0.139011, -0.163884, 0.287592, 0.452162, -0.027796, -0.390290, -0.210387, 0.018612, 0.171183, 0.078640, -0.572051, -0.265217, -0.292188, 0.274197, 0.043688, -0.061810, -0.158168, 0.459992, 0.088921, 0.331507, 0.366563, 0.279065, 0.018471, -0.339216, -0.082908, 0.125359, -0.056544, 0.529439, -0.349395, -0.254044, -0.205626, 0.179412, 0.043238, 0.153929, 0.195742, -0.164635, -0.310660, 0.138113, 0.078280, 0.056766, 0.306936, -0.942513, 0.245627, -0.239546, -0.277887, -0.015314, 0.513592, 0.054413, -0.461286, 0.221121, -0.444695, 0.083331, 0.086263, -0.044755, 0.058377, -0.268573, -1.077194, 0.398175, 0.246293, 0.004665, -0.299718, 0.188974, 0.059517, 0.009732, -1.176560, 0.893905, -0.028723, -0.251053, 0.043647, 0.341190, -0.341522, 0.496319, 0.276100, -0.024889, -0.355886, -0.399436, -0.155300, -0.206353, -0.336079, 0.369283, 0.136444, 0.204135, 0.726386, 0.513291, -0.079258, -0.482149, 0.431830, 0.509446, 0.396571, 0.203937, -0.623693, -1.286099, -0.178962, 0.344731, -0.055046, -0.288233, -0.209238, 0.237264, -0.026120, -0.573722, -0.123082, -0.120402, 0.447720, -0.395135, -0.091443, -0.260364, 0.183252, 0.083450, -0.650552, -0.182816, -0.108165, 0.169955, -0.503958, 0.043041, 0.090543, -0.032406, -0.197241, 0.039918, -0.742062, -0.105504, -0.119676, 0.391814, 0.361387, 0.471085, -0.285522, 0.182298, 0.360561, 0.178800, -0.050557, -0.087234, 0.135783, -0.029256, -0.031456, 0.071881, -0.050853, 0.033412, -0.339721, 0.204114, 0.258903, -0.850290, 0.213088, -0.034565, -0.090599, -0.317402, -0.041759, 0.006735, 0.050346, -0.123653, -0.315069, 0.499159, -0.052308, 0.103710, -0.193968, -0.648609, 0.053117, -0.344835, -0.142029, 0.294667, 0.283039, 0.582541, 0.442370, 0.159155, -0.008992, 0.033299, -0.138794, -0.150672, 0.122876, -0.944437, 0.226593]
-,        [0.003228, 0.054156, 0.378334, -0.355258, 0.201431, -0.242493, -0.056405, 0.056895, -0.472523, 0.211577, -0.630348, -0.112865, -0.193804, 0.259971, -0.267272, -0.116848, 0.136312, 0.196836, -0.547635, 0.083918, -0.091856, -0.173956, -0.236769, -0.021287, -0.253762, 0.058133, -0.019580, 0.546143, -0.442017, -0.093583, -0.224645, -0.013353, 0.163627, -0.067649, 0.048375, -0.387946, 0.078177, -0.281343, 0.169481, -0.220137, -0.266920, -0.270417, -0.067003, 0.103318, 0.643462, 0.173522, -0.144086, 0.142291, -0.093695, -0.150369, -0.006846, 0.002609, -0.372774, 0.005696, -0.161555, -0.478547, -0.054282, -0.052078, -0.178929, 0.047265, -0.153697, -0.098100, -0.369398, -0.142870, -0.373326, 0.095095, -0.309174, -0.132584, -0.142184, -0.142471, -0.116975, -0.290077, 0.357145, 0.147083, -0.129891, -0.228360, 0.394344, 0.006417, 0.085779, 0.136839, 0.144508, -0.109744, -0.082300, -0.163796, 0.036618, 0.000927, -0.118356, -0.045865, 0.106201, -0.430901, -0.171262, -0.332066, 0.017242, 0.265698, 0.129610, 0.155297, -0.045771, -0.118244, -0.145718, -0.264981, -0.408923, -0.231183, 0.079697, 0.129657, 0.199056, 0.451641, -0.136322, -0.660684, -0.074964, 0.257284, 0.058141, 0.268315, -0.079767, -0.331826, 0.133969, -0.075717, -0.310992, 0.093281, 0.075924, -0.316430, 0.389500, -0.101082, -0.089299, -0.053319, -0.228570, -0.323044, -0.029625, 0.207148, -0.129956, -0.673948, 0.112146, -0.051535, -0.328643, -0.107636, -0.527634, 0.021701, -0.243325, -0.262593, 0.368866, -0.369768, 0.211799, -0.410962, -0.191964, 0.142401, -0.359203, -0.134290, -0.085908, -0.218613, -0.245047, 0.074669, 0.043051, -0.702181, -0.258390, -0.224979, -0.331239, -0.107966, 0.117494, -0.086909, 0.370372, -0.108962, 0.012116, 0.106417, -0.276701, -0.069781, 0.050796, -0.287319, -0.536167, -0.296718, 0.118404, 0.070485, 0.258012, 0.250638, 0.106022, -0.224311, -0.077773, -0.259991, 0.363308, 0.339972, -0.230355, -0.516363, -0.064645, -0.187963, -0.398948, 0.026726, -0.014983, 0.007488, 0.022977, -0.097560, 0.339564, 0.054609, -0.082339, -0.227039, 0.181658, -0.014132, -0.224920, -0.151640, -0.187367, -0.039630, 0.107785, -0.094304, -0.449900, -0.242396, 0.504779, 0.324242, -0.182280, -0.006337, 0.313639, -0.312574, -0.192608, -0.218591, 0.368416, -0.416015, 0.267675, -0.114481, -0.130711, 0.097305, 0.166121, -0.179729, 0.011959, -0.133186, 0.090597, -0.323687, -0.015940, -0.042489, -0.255089, -0.045389, -0.227002, 0.264672, -0.039544, 0.130329, 0.209624, -0.149479, -0.199525, -0.726314, -0.278268, 0.037450, 0.163799, 0.036923, 0.109590, -0.324630, 0.152575, -0.203469, 0.111238, -0.038555, -0.087805, 0.085072, -0.448794, -0.164960, -0.263273, 0.119736, 0.277340, -0.111972, 0.227518, -0.270493, 0.205911, 0.227413]
-,        [-0.576740, -0.276747, -0.076199, -0.290418, -0.228913, -0.252649, -0.336111, 0.062569, -0.683002, -0.335429, 0.252497, 0.004423, 0.089313, -0.065287, 0.080072, -0.094692, 0.101895, -0.053641, -1.127209, -0.391465, -0.534100, 0.225511, -0.478261, -0.079150, 0.388164, -0.007560, -0.448460, -0.023966, -0.308771, 1.047026, -0.415039, 0.064176, 0.403859, 0.272740, 0.389763, 0.275887, -0.342373, 0.065546, 0.088059, -0.155293, -0.336699, 0.336980, -0.182988, 0.266552, 0.172354, 0.087091, -0.247007, -1.051192, -0.112074, -0.531649, 0.325133, -0.115126, -0.097028, -0.244889, -0.365441, -0.160419, -0.247848, -0.208171, -0.120656, -0.275260, -0.684868, 0.349526, -0.098807, 0.051284, 0.224947, -0.057271, -0.061108, -0.053146, 0.046568, 0.175911, -0.315666, -0.318578, 0.348713, -0.348487, -0.270643, -0.039938, -0.153357, -0.300469, 0.064037, -0.645114, -0.233168, -0.492937, 0.121553, -0.006336, -0.168312, -0.089292, -0.228746, 0.295124, -0.477447, -0.021056, -0.287801, -0.108393, -0.278626, -0.101102, 0.002816, 0.442729, -0.149569, 0.063796, -0.004036, -0.112756, 0.276579, 0.296575, -0.219857, 0.108144, 0.061771, -0.600534, -0.108123, -0.250283, 0.115800, 0.113404, -0.369729, 0.346773, -0.190804, -0.073538, 0.083562, -0.411981, 0.098432, -0.253403, 0.231667, 0.283742, -0.054380, -0.238532, -0.279276, -0.333617, -0.396480, -0.275937, 0.324094, -0.506050, -0.479292, -0.101106, 0.117488, 0.162199, 0.370850, -0.338066, 0.022326, 0.029098, 0.181755, -0.066080, 0.056387, 0.387628, -0.034048, 0.054072, 0.414974, 0.006294, -0.271626, -0.055328, -0.533660, 0.148113, -0.281944, -0.281082, -0.220915, 0.220807, -0.050379, -0.539857, -0.147489, 0.385332, -0.539071, -0.288441, -0.144438, -0.359506, -0.115705, -0.598216, 0.146953, -0.492749, -0.133685, -0.532488, -0.531448, -0.235747, -0.131217, 0.254665, -0.447275, 0.134534, 0.132298, -0.444222, 0.229637, -0.138201, -0.347311, -0.544724, 0.268413, -0.619716, -0.240778, -0.025286, -0.762392, -0.386936, -0.005133, -0.106633, -0.287294, -0.675561, -0.053458, 0.067153, -0.439469, 0.161678, -0.834322, -0.541089, 0.181371, 0.265154, 0.091488, 0.187085, -0.009298, -0.116576, -0.018509, -0.274545, -0.223062, 0.053372, -0.448716, -0.093513, -0.003685, -0.204186, -0.088702, -0.062113, -0.180855, -0.205013, 0.010574, 0.142190, -0.430393, 0.278255, -0.094058, -0.196524, -0.449649, 0.028162, 0.001062, -0.319865, -0.420400, -0.320133, 0.183403, -0.487672, -0.308792, 0.108175, 0.383024, -0.276998, -0.712165, 0.033435, -0.018039, -0.250591, 0.287781, -0.311800, -0.285899, -0.046897, 0.103748, -0.412999, 0.273009, -0.257319, -0.101558, -0.087517, -0.314819, -0.128826, 0.192185, 0.137563, 0.047637, -0.117734, 0.057712, -0.250617, -0.029088, -0.056494, -0.597226, -0.630198]
-,        [-0.034889, -0.234416, -0.028579, -0.142802, -0.263511, -0.142402, -0.117368, -0.156327, -0.025627, -0.207768, 0.066567, -0.225975, -0.012840, 0.009831, -0.003848, -0.300694, 0.005148, 0.293174, 0.269206, -0.064905, 0.024229, -0.111150, -0.123580, 0.353532, 0.017471, 0.101108, -0.033159, -0.004992, 0.059525, -0.264094, -0.113597, -0.155544, 0.058654, 0.068723, 0.004249, -0.040029, 0.120963, -0.362631, -0.531651, -0.204250, -0.193662, -0.009295, 0.352268, 0.299387, -0.068405, 0.052050, -0.207297, 0.138838, -0.360739, -0.255191, 0.024726, 0.000774, -0.411236, -0.279073, 0.120448, -0.350704, -0.344863, 0.078600, -0.086317, 0.053834, -0.061916, 0.080796, -0.395567, -0.022990, -0.020817, 0.033874, 0.100481, 0.181703, 0.062142, 0.149053, 0.166028, -0.297821, -0.189265, 0.069967, -0.184828, 0.087837, -0.076037, -0.113131, -0.048425, -0.308478, -0.256782, 0.010535, 0.087714, -0.242452, -0.012304, 0.135973, -0.292572, 0.065157, -0.182335, 0.074439, -0.152901, 0.087101, 0.056040, -0.100324, -0.040358, -0.301817, 0.136383, -0.148951, 0.041795, 0.132434, 0.309010, 0.214347, -0.214830, 0.136923, -0.178791, 0.031926, -0.003751, 0.226900, 0.095934, 0.233019, -0.293192, -0.361822, 0.012653, -0.213391, -0.363680, -0.188269, -0.021807, -0.248658, -0.120720, -0.159974, 0.089631, -0.134887, -0.025738, 0.059024, -0.042222, 0.180304, -0.225254, -0.174009, -0.161186, 0.082280, -0.312245, -0.035408, -0.066267, -0.173522, -0.282043, -0.233997, 0.004752, -0.108190, 0.099097, 0.030166, -0.200732, 0.168991, 0.043277, 0.285220, -0.044335, -0.140990, -0.266739, -0.057387, -0.102151, 0.230403, -0.225911, -0.210833, -0.086053, -0.296358, -0.079780, 0.026566, -0.051640, 0.202477, -0.296037, 0.133989, -0.271852, -0.353646, -0.282411, 0.253511, 0.002824, -0.237376, -0.034269, -0.291225, 0.137477, -0.091500, -0.427504, 0.095415, -0.285089, 0.102090, -0.094385, 0.281641, 0.477469, -0.089418, -0.393563, -0.175048, -0.154086, 0.015449, 0.138171, -0.248977, -0.168269, -0.206281, -0.302285, 0.080663, -0.132815, 0.147604, 0.219350, 0.177203, 0.142215, -0.012514, -0.276423, -0.186874, -0.220592, 0.160848, -0.055024, 0.170392, 0.048502, -0.386180, 0.428969, -0.063956, -0.136611, -0.309470, 0.221344, 0.185147, 0.037931, 0.089277, -0.096702, -0.171720, 0.050205, 0.321772, 0.028448, -0.107880, -0.109982, -0.099910, -0.122270, -0.075637, -0.158861, -0.231184, -0.131805, 0.004021, -0.167285, 0.053729, -0.327228, -0.271696, 0.036152, 0.051752, 0.144899, -0.100130, -0.014240, 0.158516, -0.044248, -0.154977, 0.066227, 0.002829, -0.011549, -0.077938, 0.400563, -0.084681, 0.160803, -0.105745, 0.237475, -0.074256, -0.060190, 0.220275, -0.264894, -0.040733, -0.505388, -0.018051, -0.092153, -0.133308, -0.056462, -0.361108]
-,        [-0.146699, 0.262957, -0.034420, 0.055521, -0.147436, -0.019245, -0.101870, 0.018137, -0.313328, -0.203506, 0.105067, -0.246456, 0.014996, -0.040768, 0.031881, -0.072964, -0.008301, -0.170678, 0.171783, -0.169676, -0.041710, -0.147871, -0.233242, -0.041941, -0.175439, 0.185200, 0.058211, -0.105516, 0.026199, -0.115591, -0.211925, 0.283804, 0.185990, -0.007960, -0.001984, -0.064071, -0.251109, -0.044975, 0.071804, -0.511215, -0.305565, -0.327482, 0.222551, -0.207149, -0.112886, 0.139805, 0.109780, -0.145825, -0.193422, -0.031462, -0.268613, -0.345470, -0.364013, -0.144588, -0.265911, -0.153296, 0.071766, 0.095451, 0.006324, 0.082252, -0.212880, 0.121920, -0.123620, -0.121000, 0.210528, -0.177735, -0.206608, 0.077155, -0.132874, 0.112416, 0.248298, -0.266851, -0.103377, -0.130969, -0.021109, -0.198753, 0.146715, -0.074622, -0.118720, -0.503162, -0.091893, -0.147409, -0.210946, -0.175695, -0.228828, -0.104455, -0.149798, 0.053314, -0.087636, 0.243357, 0.027470, -0.013576, -0.000538, -0.039198, -0.076652, -0.477649, 0.001397, 0.115503, -0.106459, -0.239752, -0.043453, -0.090224, -0.335032, -0.184867, 0.376802, 0.044604, -0.018590, -0.113273, -0.359739, -0.037859, -0.036127, 0.290838, 0.308900, 0.010162, -0.034277, 0.101383, -0.261573, -0.197983, -0.021488, -0.341177, -0.264182, -0.134430, 0.127664, -0.019397, -0.102575, -0.095468, 0.129222, -0.030658, -0.079328, -0.008291, -0.041003, -0.087341, -0.408682, -0.013909, 0.027672, -0.095642, -0.205582, -0.232134, 0.052296, -0.124254, -0.086457, -0.030601, -0.214438, -0.013194, 0.049393, 0.043435, -0.300994, -0.123765, -0.255615, -0.048661, -0.042029, -0.065030, 0.019552, 0.117667, -0.107422, 0.025402, -0.176141, 0.118474, -0.132182, -0.164543, -0.195329, -0.072375, -0.017454, -0.116100, 0.219613, -0.228810, 0.096672, -0.195035, -0.352439, -0.107126, -0.106891, 0.230160, -0.140555, -0.180808, 0.420752, 0.060100, 0.136361, -0.222825, -0.027416, -0.032586, 0.064472, -0.063874, -0.096826, -0.317803, -0.022186, -0.210854, -0.154350, -0.132679, 0.201628, -0.053058, -0.182482, -0.208057, -0.204579, -0.020346, -0.363283, -0.243055, 0.038100, -0.082668, -0.070760, 0.108832, 0.162264, 0.029663, -0.090759, -0.197019, -0.292805, 0.022769, -0.354647, -0.086334, 0.121498, 0.032022, -0.246320, -0.134478, 0.259414, -0.095373, -0.117677, -0.205132, -0.106830, 0.011453, -0.391194, -0.295004, 0.054249, -0.325409, -0.216555, -0.186379, 0.137730, 0.047713, -0.160606, -0.084447, 0.173818, 0.206439, -0.110922, -0.157129, -0.076314, 0.033643, 0.011036, -0.468112, 0.180721, -0.087958, 0.242202, -0.329802, -0.244668, -0.072961, 0.025048, -0.321832, 0.271484, 0.089674, 0.261208, 0.020815, 0.001188, -0.426929, -0.066489, -0.301444, -0.055089, -0.290812, -0.372366, -0.091895]
-,        [-0.046862, -0.140524, -0.030524, 0.043400, -0.071287, 0.020397, -0.042201, -0.317413, -0.242706, -0.337482, 0.147670, -0.385253, 0.331780, -0.539666, -0.247630, -0.059049, -0.108500, 0.021539, -0.344013, 0.090951, 0.125979, -0.016641, -0.247902, -0.271701, -0.045573, -0.127477, 0.061987, -0.167752, 0.064310, -0.102492, -0.357315, 0.263523, 0.331486, -0.308457, -0.099348, -0.189065, -0.019709, -0.121614, -0.085451, 0.549280, 0.061513, 0.116489, -0.102787, 0.348383, 0.186172, 0.347296, 0.135899, -0.189130, -0.338543, -0.148538, 0.333339, -0.037003, -0.341946, -0.147569, 0.010244, -0.360097, -0.185522, 0.152771, 0.119081, 0.258910, 0.067620, -0.420598, -0.214497, 0.190168, 0.310275, -0.051917, 0.189992, 0.104270, -0.238023, -0.054339, 0.213791, -0.359950, 0.081509, 0.410901, -0.217971, -0.336297, 0.008953, -0.099263, -0.130377, -0.283856, -0.220756, 0.085731, -0.188297, 0.029349, 0.005332, 0.116496, 0.061053, 0.232099, -0.169103, -0.113223, -0.382052, -0.092107, -0.167853, -0.068176, 0.056537, -0.248173, -0.206924, -0.088414, -0.437739, 0.155651, -0.098731, 0.075783, -0.320954, -0.304249, 0.080872, 0.312474, -0.022001, -0.169264, -0.567658, -0.031431, -0.246467, 0.218161, -0.349398, -0.133032, 0.038427, -0.226307, -0.247518, -0.084934, -0.063088, -0.012190, 0.112756, -0.199262, -0.282596, 0.054291, -0.124655, 0.132078, -0.108864, -0.201017, -0.328617, 0.183909, -0.006912, -0.004914, -0.080784, -0.153144, -0.100417, 0.073128, 0.447541, -0.101514, 0.084057, -0.222045, -0.114715, -0.123940, -0.089459, -0.169133, -0.199329, -0.140306, -0.134505, -0.068106, -0.126883, 0.190942, -0.006955, -0.211291, 0.048001, -0.211295, -0.143744, 0.028204, 0.265388, 0.037746, 0.027370, 0.218924, -0.339113, -0.283956, -0.249392, -0.035422, -0.069932, -0.229823, -0.344965, -0.100734, -0.099981, -0.123866, -0.305513, -0.185851, -0.118414, -0.038186, -0.200191, -0.173042, 0.172304, -0.129049, -0.135993, -0.038245, 0.072136, -0.090321, 0.010330, 0.069426, -0.030632, -0.368326, -0.506759, -0.110351, 0.014613, 0.126416, -0.114292, -0.033500, -0.005391, 0.197098, -0.067983, 0.066335, 0.157808, -0.094843, -0.103066, 0.186953, -0.123684, -0.190159, 0.232657, 0.298718, -0.053550, -0.095634, 0.085961, -0.228598, -0.243092, -0.150126, 0.082017, -0.228547, 0.198621, -0.060005, -0.014675, -0.007475, -0.264037, 0.121982, 0.162524, 0.263960, -0.145297, -0.216695, -0.009887, -0.133191, -0.332851, 0.535499, -0.075936, 0.079687, 0.049782, 0.306140, 0.070155, -0.420362, 0.143853, -0.491772, 0.432943, -0.200518, 0.335013, 0.035032, 0.034520, -0.162364, -0.020745, -0.145545, 0.010487, -0.078443, 0.079858, 0.145258, -0.360662, -0.231583, 0.067203, -0.001540, 0.068836, -0.068421, 0.051018, -0.328475, -0.066558, 0.011837]
-,        [-0.033217, -0.336040, 0.469065, -0.399640, 0.122043, -0.453094, -0.404363, -0.431319, 0.661787, -0.117202, -0.343856, -0.244724, 0.114757, 0.290156, 0.210622, 0.055479, -0.139184, 0.312279, 0.045634, -0.062561, -0.095475, 0.078789, -0.320650, 0.186094, 0.143159, -0.227381, 0.041275, 0.034545, -0.049790, 0.042662, -0.021545, -0.118600, 0.419283, 0.008169, 0.086301, 0.354138, -0.249227, -0.106949, 0.188118, -0.217666, -0.211838, -0.277662, 0.356190, 0.307784, 0.142708, -0.378125, -0.051323, 0.139329, 0.032996, -0.095002, -0.381770, 0.546527, -0.405118, -0.134812, 0.066319, -0.369574, 0.180668, 0.676945, -0.104635, -0.212377, 0.070259, 0.122774, -0.240798, -0.057848, 0.605161, 0.219394, -0.401252, 0.292258, 0.295187, -0.609035, 0.284201, -0.565058, 0.007819, -0.162564, 0.094374, 0.225000, -0.110348, -0.368321, -0.020404, 0.183365, -0.105374, -0.184963, -0.115201, 0.451888, 0.214240, -0.104696, 0.462347, -0.510785, 0.670138, -0.076656, 0.399850, -0.103508, -0.319624, -0.105178, -0.261231, 0.243822, -0.233530, 0.646535, 0.125297, -0.015391, 0.120920, -0.068111, -0.280912, 0.312467, -0.076731, 0.337803, 0.211497, -0.065520, -0.064905, -0.314057, -0.053789, 0.240289, -0.175587, -0.127390, 0.369097, 0.087529, -0.022676, -0.133480, -0.149837, 0.913189, 0.413975, 0.088474, -0.330330, 0.019117, -0.263735, -0.546179, 0.335645, 0.009320, -0.182831, -0.106751, 0.577048, -0.024152, -0.176639, 0.212339, -0.541165, 0.005939, 0.102566, 0.063519, -0.014504, 0.315062, 0.058263, -0.041031, -0.109269, 0.079180, -0.081200, 0.181348, -0.427025, 0.120922, -0.578925, 0.440566, 0.016902, -0.672910, 0.068924, -0.102631, -0.196055, -0.079187, -0.117081, 0.020276, 0.275218, 0.033794, 0.346078, 0.333095, -0.187366, -0.086610, -0.253334, -0.051928, -0.163236, -0.000169, 0.378116, -0.261972, -0.454400, 0.197026, 0.578938, 0.216365, -0.214375, -0.362097, 0.198415, 0.155185, -0.899054, -0.103153, 0.184643, 0.162571, -0.246276, 0.004002, -0.369342, 0.101857, 0.351119, -0.436367, -0.089687, 0.036977, 0.762714, 0.075518, 0.175207, 0.147481, -0.093044, -0.084408, 0.007688, -0.351127, 0.188633, 0.520627, -0.204528, -0.069999, -0.145028, -0.133726, -0.497711, 0.151045, 0.108009, -0.069774, 0.158758, 0.006442, -0.189910, -0.585980, 0.077998, 0.009769, 0.083812, 0.241165, -0.138506, -0.251449, 0.161616, -0.280713, 0.045375, 0.267764, 0.052809, -0.344414, -0.109167, 0.036792, -0.156550, -0.003753, 0.205383, 0.292140, -0.022206, -0.017205, 0.009473, 0.055430, 0.095736, -0.305560, -0.215702, -0.490587, 0.117666, -0.462481, 0.170469, 0.141639, 0.049351, 0.639387, 0.275331, -0.125282, -0.413406, -0.075418, -0.092244, 0.102895, 0.092909, -0.489252, 0.054336, 0.129121, -0.290257, 0.384962]
-,        [0.015983, -1.007015, 0.083784, 0.532700, -0.366125, -0.610847, -0.678230, -0.100993, -0.961510, 0.150575, 1.116340, 0.595314, 0.551502, -0.192402, 0.359451, 0.579072, 0.096197, -0.252747, 0.597957, 0.709032, 0.147101, 0.022837, -0.025522, 0.511067, 0.029571, -0.106580, 0.520693, -0.309597, 0.043579, -0.876173, 0.100425, 0.130274, -0.136955, 0.074180, -0.256105, 0.029322, 0.066378, 0.178636, -0.215183, 0.137996, -0.298984, 0.663306, -1.036160, 1.199257, -0.192389, 0.008159, 0.332605, 0.330398, 0.367943, -0.030163, 0.093997, -0.033410, -0.500383, -0.073730, 0.464696, -0.276931, 0.341568, 0.922954, 0.122774, -0.553379, -0.230232, 0.472910, 0.444414, 0.749693, 0.274084, 0.218125, 0.373766, 0.964594, 0.152936, 0.593916, 0.310842, -0.219830, 0.014504, 0.539344, 0.159411, -0.058076, -0.082148, 0.401991, 0.320144, 0.262074, -0.289730, 0.253209, 0.078384, 0.586746, -0.611339, 0.606046, 0.383974, -0.746843, -0.569301, -0.224211, 0.125927, -0.308556, 0.283209, 0.056304, -0.304008, 0.313543, -0.360961, 0.645278, 0.189376, -0.042372, -0.247914, 0.616148, 0.179996, -0.493576, 0.370152, 0.887609, 0.162848, -0.028356, -0.490810, 0.408711, -0.078236, 0.087801, -0.040470, 0.381512, -0.183482, 0.286566, -0.432444, 0.382196, 0.400017, -0.102268, 0.285567, 0.159741, -0.637244, 0.013933, -0.305671, 0.263403, 0.608741, 0.306025, -0.551082, -0.287763, -0.091376, 0.760761, 0.105495, -0.404405, 0.472983, 0.383122, -0.006048, -0.359779, 0.660460, 0.907014, -0.189768, 0.211250, 0.741027, 0.639161, 0.351074, -0.118099, -0.224364, -0.345956, -0.154971, 0.512914, -0.034949, 0.003335, -0.701309, 0.742173, -0.534469, 0.646178, 0.067844, -0.065713, 0.478189, -0.131373, -0.466642, -0.228666, 0.251522, -0.165267, -0.537627, 0.169155, 0.437639, 0.644080, 0.443915, 0.050982, 0.187043, 0.061591, 0.028142, -0.119167, -0.908884, 0.515921, -0.049785, 0.627489, -1.931929, -0.784337, 0.583839, 0.836516, -0.290256, 0.387838, 0.358654, 0.146275, -0.202771, 0.054950, 0.454405, -0.317034, 0.384592, 0.273180, 0.399946, -0.081181, 0.170836, 0.093074, 0.187639, 0.300116, 0.282995, 0.348868, -0.742440, -0.488523, -0.525804, 0.361185, 0.892563, -0.305378, -0.301240, -0.232692, 0.310319, -0.091311, 0.911335, 0.518812, 0.003362, 0.005461, -0.110610, -0.086141, -0.437924, 0.655208, 0.760797, 0.130959, 0.289570, -0.016718, -0.118552, -0.257193, 0.670797, -0.137594, 0.110858, 0.336002, 0.205267, 0.218405, -0.668243, -0.149678, -0.010064, 0.497702, -0.237065, 0.397445, -0.718382, 0.391768, -1.112111, -0.234898, 0.072963, -0.021682, 0.100663, 0.631499, -0.238227, 0.238177, 0.525468, 0.042953, 0.348438, -0.176358, 0.266603, 0.461878, 0.467350, 0.116401, 0.745621, 0.188203]
-,        [-0.072719, -0.050845, -0.145457, -0.177538, 0.033163, -0.013276, -0.120409, -0.098373, -0.162590, -0.069673, -0.115601, -0.064879, -0.006506, -0.224703, 0.024425, -0.262170, -0.055287, -0.070645, -0.139166, -0.088266, -0.023878, -0.057965, -0.045355, -0.165031, -0.086195, 0.002571, -0.015588, -0.091735, 0.129082, 0.040097, 0.181081, -0.024945, -0.062251, -0.010964, -0.115294, 0.056672, -0.147014, -0.126060, 0.047264, -0.153700, -0.020358, -0.250288, -0.020229, 0.181690, -0.094709, -0.036599, 0.000255, -0.110332, -0.223023, -0.169454, 0.052994, 0.081064, 0.071887, -0.088514, -0.194080, -0.103776, 0.006016, 0.000713, -0.132821, -0.094358, -0.047472, 0.049450, 0.154289, -0.136844, 0.112481, 0.026006, 0.024854, -0.172176, -0.107020, 0.019827, -0.018417, 0.021708, -0.096009, 0.023572, -0.202441, -0.143922, 0.016917, -0.024159, -0.016233, -0.305272, -0.071148, -0.113534, -0.079806, -0.080146, -0.181573, -0.062390, -0.024161, -0.092685, -0.078680, -0.175240, -0.042627, -0.055590, 0.039592, -0.156066, 0.051893, -0.212468, -0.038098, 0.040252, -0.166563, -0.065098, 0.020586, 0.095742, -0.128567, -0.062731, -0.286789, 0.064618, 0.039006, -0.172718, -0.075755, -0.109967, -0.276940, -0.076294, -0.096563, -0.017704, -0.352992, 0.113356, -0.053423, -0.041592, -0.031111, 0.097776, 0.020223, -0.137952, -0.315147, -0.112413, -0.042989, 0.083192, -0.080606, 0.026120, 0.064914, -0.126144, -0.069513, 0.119129, 0.067212, -0.003605, -0.062424, -0.130091, -0.101757, -0.030425, -0.072580, -0.205351, -0.033471, -0.083883, -0.058574, -0.121427, -0.238898, -0.061079, 0.055877, -0.256980, -0.172997, -0.076630, -0.111372, -0.276303, -0.058198, -0.055076, -0.108215, -0.207974, -0.095286, -0.130439, -0.022384, -0.118422, -0.039646, -0.148344, -0.009303, -0.172489, -0.028663, -0.073162, 0.020659, -0.181214, -0.193909, 0.059607, -0.078874, -0.054103, 0.010352, -0.078914, -0.275067, -0.122661, 0.214889, -0.159499, -0.064690, -0.214519, 0.079595, 0.039176, -0.054083, -0.053882, -0.235836, -0.148424, -0.105142, -0.250529, -0.004666, -0.236249, -0.120074, -0.218386, -0.220754, 0.031048, -0.185586, 0.023394, -0.022563, -0.134058, -0.248955, -0.061624, 0.137864, -0.081676, -0.162539, 0.080777, -0.060845, -0.028942, 0.063413, 0.164063, -0.007657, -0.280743, 0.033959, -0.061616, -0.123654, -0.070506, -0.005748, -0.086968, -0.102183, -0.165347, -0.013715, -0.149598, 0.030535, -0.083987, -0.251033, 0.085894, -0.039692, -0.027684, -0.139852, -0.205657, -0.198718, 0.057689, -0.070495, 0.214292, -0.096144, -0.085479, 0.066659, 0.022536, 0.158752, -0.202345, -0.016099, -0.206159, -0.078541, -0.048272, 0.013559, -0.059021, -0.101671, 0.201670, -0.097285, 0.120848, -0.251479, 0.028200, -0.177077, -0.170078, 0.023329, -0.225819, 0.145699, -0.010734]
-,        [-0.401093, 0.256344, 0.071643, 0.152317, -0.045909, -0.385421, 0.360221, -0.040410, 0.036918, -0.344866, -0.226225, -0.204928, -0.246651, -0.144198, 0.149668, -0.679328, -0.288581, 0.132091, 0.024896, 0.130013, 0.460020, 0.029457, 0.289381, -0.513255, 0.012705, -0.254548, -0.502319, -0.300680, -0.083743, -0.406920, -0.109384, 0.144024, 0.137624, -0.121670, -0.348129, 0.116821, -0.802926, -0.257819, -0.261516, -0.333403, -0.805219, -0.006382, 0.308625, -0.320645, 0.244556, 0.002813, -0.186413, -0.247834, 0.333813, -0.739470, -0.448202, 0.062306, -0.291945, -0.396319, -0.021274, -0.062212, -0.049649, 0.285475, 0.007846, -0.236668, -0.500411, 0.144887, 0.007406, 0.141541, -0.299384, 0.102424, -0.375048, 0.054639, 0.077634, 0.036145, -0.190388, -0.183116, -0.236496, -0.423924, -0.056237, -0.492918, -0.008708, -0.262872, 0.224685, 0.176243, -0.249656, 0.110539, -0.214064, 0.370665, 0.039062, -0.061574, 0.106264, 0.111897, -0.061303, -0.254681, 0.802302, 0.000142, -0.556067, -0.311252, 0.054153, -0.271400, -0.270782, 0.539250, -0.337215, -0.082361, -0.256051, -0.042380, 0.383512, -0.298694, -0.073564, -0.250376, 0.405254, 0.140321, -0.646363, -0.343982, 0.112351, 0.243178, 0.721078, -0.506592, -0.485559, -0.174896, -0.264375, -0.338885, -0.285152, -0.093685, 0.020065, 0.438066, -0.039430, 0.210133, -0.336750, 0.134995, -0.295893, -0.392594, -0.356801, -0.254316, -0.443797, 0.114317, -0.180845, -0.202157, -0.406027, 0.038203, -0.093291, 0.118153, -0.228030, -0.640363, 0.144092, 0.683892, 0.011386, -0.171294, 0.024686, 0.204711, -0.565613, 0.224999, -0.197267, 0.093911, -0.307303, -0.203261, 0.433403, -0.090136, -0.076991, -0.090376, -0.472931, 0.474319, -0.348545, -0.326830, -0.040796, 0.652648, -0.214474, -0.171190, -0.280216, -0.162127, -0.144660, -0.326465, -0.318375, -0.327671, -0.136115, -0.160840, -0.271537, -0.445742, -0.385688, 0.276907, -0.106482, 0.009669, -0.517631, -0.299109, -0.262082, 0.087670, -0.359338, 0.054774, 0.085154, -0.461025, -0.179709, -0.246951, -0.019744, 0.023006, 0.257842, -0.037712, -0.000343, 0.183241, 0.003507, -0.640634, 0.393414, 0.620784, -0.410354, 0.015340, 0.246848, -0.202312, -0.639857, -0.418250, 0.309953, 0.445749, -0.080520, -0.029745, 0.431899, -0.010809, -0.125220, 0.306693, 0.126442, -0.399900, 0.067975, -0.048390, 0.032571, -0.076802, -0.066748, -0.628700, 0.309439, -0.584828, -0.315669, 0.556300, 0.132516, -0.254987, -0.301503, -0.527859, -0.206299, -0.057190, -0.322539, -0.262639, -0.191961, -0.220765, 0.402018, -0.297202, 0.273244, -0.279452, -0.356084, -0.219682, -0.190738, -0.028965, 0.136067, -0.359081, 0.178021, -0.234712, -0.113900, -0.363232, -0.122431, -0.213636, -0.735692, -0.483222, 0.227563, -0.530219, 0.253503, 0.025093]
-,        [0.231585, -0.956908, 0.114011, 0.084344, 0.373360, -0.275965, -0.230782, -0.704796, -0.078144, 0.469878, 0.345062, -0.204478, -0.233104, 0.003779, -0.016082, 0.088116, -0.185455, -0.304765, -0.186889, 0.008307, 0.027661, 0.125706, 0.004914, 0.272450, -0.110608, -0.498935, 0.027299, -0.148034, -0.190809, 0.278123, -0.046119, -0.077759, 0.034700, -0.539403, -0.468047, 0.223684, 0.057722, -0.253959, -0.186834, 0.286689, 0.505105, -0.149613, 0.402823, 0.175474, 0.194050, -0.074681, 0.153539, -0.278080, -0.355633, -0.169004, -0.586031, 0.074208, -0.528377, -0.084259, 0.128225, -0.166732, 0.251738, -0.463827, -0.094903, -0.629975, -0.369287, 0.627652, 0.231583, 0.287405, 0.211841, 0.173776, 0.159242, -0.355505, 0.330775, 0.093832, -0.336170, -0.768834, -0.202059, 0.205653, 0.315654, 0.285756, -0.626182, 0.221758, -0.034218, 0.158014, 0.013641, -0.667484, -0.303568, -0.067729, -0.083370, -0.123097, 0.133114, -0.090179, -0.043524, 0.217393, 0.793986, 0.168137, -0.502670, -0.012879, -0.085092, -0.040974, -0.432413, -0.298046, -0.435705, 0.086091, -0.534983, 0.654738, 0.067205, 0.372140, -1.070157, 0.321837, 0.060840, 0.615453, 0.205501, -0.618915, 0.134432, -0.074196, 0.139651, -0.024157, -0.625651, -0.107061, 0.464280, -0.361557, -0.054249, 0.491208, 0.311460, 0.086452, 0.133103, 0.055489, 0.246152, -0.170327, -0.064610, -0.082443, 0.187933, 0.478285, -0.219559, -0.554386, 0.086955, 0.073640, 0.056618, -0.168745, 0.298645, 0.059458, 0.199448, 0.486720, 0.038349, -0.020321, 0.574060, -0.571188, -0.275693, 0.140532, -0.246078, -0.284729, -0.186097, 0.556615, -0.150769, -0.283390, -0.136026, -0.336251, -0.584618, 0.085417, -0.150283, 0.481089, -0.291920, 0.100011, -0.169003, 0.275164, 0.040830, -0.235241, -0.197744, -0.180452, -0.194201, -0.401268, -0.165783, -0.153074, -0.181771, 0.385322, 0.148305, -0.373644, -0.400158, 0.496842, -0.269696, 0.524819, -0.409741, -0.337003, 0.015489, 0.193851, -0.081485, -0.024369, -0.047287, -0.643581, 0.032259, -0.010443, 0.707735, 0.209074, 0.237741, -0.225497, 0.020787, 0.172539, 0.209489, 0.048398, 0.161152, -0.519055, -0.411822, -0.309678, -0.198978, -0.572127, 0.257821, -0.270840, -0.193409, 0.931519, 0.016845, 0.075163, 0.667038, -0.281890, -0.043750, -0.008857, -0.264686, -0.217973, -0.091019, 0.343891, 0.170086, -0.113671, 0.111111, -0.519397, 0.017356, -0.131620, -0.717889, -0.521409, 0.117616, 0.419408, -0.634829, -0.005646, 0.407375, -0.235550, 0.030797, -0.339302, 0.042296, -0.064215, -0.476452, 0.036692, 0.316559, -0.508202, 0.120265, -0.480835, 0.010987, 0.472753, 0.022541, 0.178707, 0.185568, 0.007671, -0.515659, -0.361901, 0.511266, -0.160005, 0.445385, -0.688266, 0.030521, -0.243860, -0.283190, 0.080685]
-,        [-0.050980, 0.268505, 0.134077, 0.026093, -0.115478, -0.350697, -0.012890, -0.294183, 0.008052, 0.022894, -0.186765, -0.251828, 0.309344, -0.119767, -0.040543, -0.089713, 0.053741, 0.262821, 0.025749, 0.097987, 0.124200, 0.307428, -0.040262, -0.184755, -0.061828, -0.059959, -0.095364, -0.251455, 0.289718, 0.094115, -0.180627, 0.027428, -0.035496, -0.114235, 0.103871, -0.162809, -0.289489, 0.029743, -0.042851, -0.258876, 0.150010, -0.113225, -0.560054, 0.015942, -0.095131, 0.492563, -0.034795, -0.292349, 0.125094, 0.132383, 0.323185, 0.195765, -0.172915, 0.111605, -0.099897, -0.028953, -0.079137, 0.267007, -0.157146, -0.087621, -0.006509, -0.321856, -0.096789, -0.129004, -0.108914, -0.190296, -0.405785, 0.148555, 0.199202, 0.096468, -0.111055, -0.221598, -0.336929, -0.460075, 0.069169, -0.236611, 0.010492, -0.104081, -0.214602, -0.364367, -0.026297, 0.012895, 0.055143, 0.227969, 0.268220, -0.166316, -0.097716, -0.140705, 0.217611, -0.116444, 0.192912, -0.470884, -0.129491, -0.286456, 0.227327, 0.189516, -0.114847, 0.008594, 0.003723, -0.070481, 0.157509, 0.169378, -0.082787, 0.172379, -0.054143, -0.045646, 0.036371, 0.064263, -0.222479, 0.004109, 0.100963, -0.142250, -0.401575, 0.050621, -0.212174, 0.329499, 0.272513, -0.084936, 0.016607, -0.451928, 0.195426, -0.356622, -0.264471, -0.004556, -0.189474, -0.355519, -0.166381, -0.062348, 0.122317, 0.012924, -0.097140, -0.076398, -0.019677, -0.105613, -0.363297, -0.033071, -0.014616, -0.158830, -0.296658, -0.262756, -0.058807, -0.191228, -0.043417, -0.026881, -0.201632, 0.133407, -0.395103, -0.095016, -0.217064, -0.221415, -0.338434, -0.421423, 0.207753, -0.198059, 0.131314, 0.034685, 0.163135, 0.123147, 0.341320, -0.078388, 0.035869, -0.337521, 0.143708, 0.096502, 0.166021, -0.235810, -0.087105, 0.044457, -0.147040, 0.003812, -0.299893, -0.333146, 0.160686, -0.025018, -0.036597, -0.123747, 0.136178, 0.139450, -0.200141, -0.298508, -0.024016, -0.038271, 0.170492, 0.053737, -0.211599, -0.398623, -0.008310, -0.030318, 0.011585, 0.004966, -0.606497, -0.309848, -0.242127, -0.164883, -0.187134, 0.202968, -0.256883, -0.031143, -0.010848, -0.382387, 0.079953, -0.071796, -0.276358, -0.032262, -0.149289, -0.033118, -0.586267, -0.280700, -0.039955, -0.211671, 0.164173, -0.217753, -0.044877, -0.192035, 0.058942, -0.140313, -0.235633, -0.231376, 0.159614, 0.144958, -0.063354, -0.180889, -0.342742, -0.087317, -0.330802, 0.156140, -0.119465, -0.062587, -0.006519, -0.132887, -0.044789, -0.164521, 0.094598, 0.180189, 0.245538, -0.294630, -0.058322, 0.181673, -0.388163, -0.256327, 0.061352, 0.026845, -0.468213, 0.044265, -0.023658, -0.103954, -0.196418, 0.212670, -0.020384, -0.015137, -0.372662, -0.243239, -0.385517, -0.173888, -0.037070, -0.109347]
-,        [-0.407788, 0.100413, 0.611265, 0.244091, -0.064106, -0.497834, -0.568735, -0.101935, 0.057431, 0.007519, 0.393510, -0.604963, 0.155606, 0.133764, 0.026166, 0.388649, 0.080436, 0.489015, 0.269830, 0.149371, -0.240659, -0.064676, -0.380799, 0.077645, -0.319979, 0.037054, 0.070972, 0.406736, 0.016941, -0.063239, 0.285753, -0.037165, 0.010206, -0.011919, -0.058909, -0.089905, -0.289476, -0.118774, 0.276709, 0.368797, 0.300174, -0.793804, 0.338928, 0.017532, 0.035578, 0.175667, -0.081471, 0.361547, -0.403744, 0.346375, 0.226186, 0.098254, -0.583974, -0.197482, -0.148708, -0.089009, 0.248739, 0.041843, -0.185778, -0.189533, -0.051663, -0.307467, 0.322278, -0.315215, 0.267909, -0.456433, -0.194288, 0.243605, -0.051009, 0.719334, 0.309217, -0.314472, -0.273804, -0.046111, 0.065299, -0.141258, -0.240800, -0.375524, -0.116156, 0.158597, 0.031893, -0.079266, 0.256000, 0.541501, -0.326760, -0.105482, -0.174986, -0.048318, 0.051199, 0.496034, -0.446443, 0.030715, -0.281345, 0.108388, -0.048951, -0.087836, -0.160710, -0.114795, -0.005346, 0.152485, -0.101995, -0.077798, -0.004166, -0.246919, -0.100832, 0.140058, 0.293168, 0.228307, -0.065336, -0.049495, -0.048023, 0.148159, -0.069734, -0.143764, -0.237330, 0.154368, 0.562683, 0.231143, -0.308001, 0.062049, -0.872192, 0.514664, 0.500945, 0.209106, -0.019921, -0.343105, -0.301178, 0.549239, -0.305184, -0.101114, -0.582924, 0.049177, 0.102351, 0.260747, 0.054426, -0.223087, 0.183468, 0.057563, -0.094435, 0.026796, -0.081820, -0.439611, -0.495270, -0.527467, -0.476445, -0.092105, 0.339872, 0.027433, -0.422169, -0.039854, -0.381018, -0.498790, -0.013560, -0.252631, -0.364638, -0.196520, 0.096029, 0.109538, 0.238290, 0.205526, -0.014998, 0.019509, 0.002812, -0.151121, 0.293232, -0.268577, 0.190521, -0.337635, 0.117649, 0.246772, -0.248362, 0.206011, -0.308912, 0.145141, 0.078175, -0.057700, 0.336883, -0.269988, -0.309508, -0.436115, 0.350216, 0.721543, -0.135299, -0.063404, -0.275384, 0.125799, -0.713735, 0.356685, 0.141878, -0.021796, 0.510145, -0.264649, 0.322161, -0.184975, -0.011880, -0.207449, 0.160860, -0.082576, -0.161384, -0.185511, 0.127979, 0.139464, -0.226397, 0.018493, -0.131601, -0.428924, 0.306734, 0.266713, 0.254000, 0.377914, 0.707680, -0.328110, -0.016247, 0.078593, -0.214393, -0.663848, 0.024160, 0.088895, -0.082730, 0.182306, 0.255715, -0.172978, 0.077695, -0.523347, 0.047208, 0.346929, -0.982404, -0.210986, 0.332984, -0.557614, -0.244454, -0.180600, -0.041900, -0.244514, 0.155454, -0.241582, 0.368982, -0.062316, 0.529294, -0.542452, -0.290468, -0.377873, -0.003495, 0.040835, 0.507752, -0.226069, 0.132801, -0.350787, 0.294904, -0.121106, 0.114438, -0.468198, 0.115273, -0.359539, 0.402828, -0.072381]
-,        [0.235851, 0.102434, -0.400954, 0.225023, 0.314891, -0.416457, -0.026845, -0.115950, -0.152901, 0.015054, 0.327259, -0.564191, 0.128669, -0.335280, -0.317203, -0.374432, -0.340972, -0.080950, -0.348507, -0.027647, -0.448849, -0.113296, -0.476287, -0.289825, 0.049362, 0.139091, 0.269526, 0.148098, -0.466999, 0.253267, 0.129243, -0.611986, -0.104097, 0.389242, 0.244503, -0.676173, -0.296059, -0.615953, 0.250864, -0.061934, -0.462481, -0.074607, 0.091274, -0.702014, -0.003741, 0.063585, 0.038109, 0.040019, -0.536099, 0.118804, -0.273483, -0.303911, -0.261447, -0.313854, 0.148438, -0.286857, 0.326370, -0.180793, -0.190662, -0.176355, 0.059315, -0.224087, -0.130383, -0.913907, -0.066052, -0.125252, -0.200167, -0.686207, -0.103321, -0.141048, -0.446354, -0.381068, -0.207275, -0.380891, -0.396553, -0.234748, 0.325792, -0.309329, 0.408169, -0.175753, 0.105674, -0.134727, -0.305042, -0.081530, -0.031154, -0.205260, 0.205716, -0.211761, -0.118944, -0.111048, -0.282320, 0.388084, -0.261402, 0.949129, -0.048741, 0.135673, 0.082444, 0.117976, -0.126155, 0.284683, -0.739394, -0.199762, -0.507324, -0.567874, -0.434417, 0.145339, 0.182711, -0.393356, -0.329395, 0.153245, 0.008065, 0.132785, 0.620674, -0.002621, -0.044796, 0.011844, -0.171398, 0.103724, 0.376598, -0.266599, -0.029009, -0.343075, -0.048437, -0.068794, -0.098117, 0.139154, -0.645117, 0.276167, -0.467537, -0.353033, -0.132041, -0.018942, -0.339361, 0.008199, 0.041427, -0.031488, 0.184937, 0.012959, 0.075934, -0.450980, 0.139975, 0.067427, 0.174758, 0.235962, 0.069231, 0.478870, -0.061039, -0.263785, -0.175019, 0.113319, -0.525072, -0.042922, -0.169793, -0.202943, -0.467585, -0.158854, -0.099618, -0.378216, -0.539614, -0.188647, -0.024865, -0.718399, 0.376126, -0.440474, -0.392755, 0.552336, -0.325573, -1.029018, -0.113169, 0.156396, -0.398546, 0.309896, 0.161984, -0.230909, -0.437933, 0.121417, 0.082349, -0.358452, -0.355908, -0.511262, -0.509346, -0.222243, -0.145023, -0.113285, 0.071771, -0.053419, -0.360411, 0.003191, 0.098511, 0.015572, -0.638240, 0.090938, -0.321473, 0.030805, 0.166593, -0.252513, -0.125595, -0.230612, -0.334651, -0.271397, -0.121257, 0.158055, 0.398534, -0.575749, -0.157006, -0.419335, -0.126018, 0.110527, 0.143478, 0.268416, 0.071331, -0.314289, 0.224973, 0.288939, 0.204659, -0.234435, -0.276588, 0.002291, -0.475699, -0.081504, -0.296928, -0.432126, -0.241824, -0.119465, 0.524085, -0.073752, -0.430915, -0.002572, -0.221662, -0.438958, -0.273476, -0.547316, 0.252605, 0.608631, -0.173438, -0.095448, 0.542133, -0.183983, 0.679724, -0.424384, -0.067799, 0.177738, -0.191169, -0.217228, 0.161133, -0.319629, -0.189832, 0.359881, -0.418591, -0.158175, -0.307167, -0.293522, 0.160199, -0.005466, -0.373511, -0.166497]
-,        [-0.224010, -0.210842, -0.084309, 0.100230, -0.180262, -0.077112, -0.255345, -0.088958, 0.096428, -0.306030, -0.154242, -0.395790, 0.080145, -0.101946, 0.353837, -0.160902, 0.083810, -0.361316, 0.331146, 0.113075, -0.358877, 0.162662, -0.052116, 0.240643, -0.048780, -0.236575, 0.152026, -0.167078, 0.071990, 0.146488, 0.028220, 0.176263, 0.197765, 0.014640, -0.196703, 0.132695, -0.019881, -0.102131, 0.274919, -0.068027, -0.260390, -0.060276, 0.065324, -0.240208, -0.188268, 0.183552, 0.162898, -0.082620, -0.106660, -0.139374, -0.153006, -0.315733, -0.467111, -0.029094, -0.125305, -0.027270, -0.155433, 0.311398, -0.306220, -0.038458, -0.274997, 0.140237, 0.159516, 0.161945, 0.319208, -0.353085, 0.026266, -0.298195, -0.370448, -0.262474, -0.022072, -0.367681, 0.069105, -0.034924, -0.049419, 0.032502, -0.046149, 0.103908, -0.241348, -0.301244, 0.417167, 0.178471, -0.145625, 0.063880, 0.021844, 0.177719, -0.355590, -0.104489, -0.032949, -0.079969, -0.337209, 0.003374, -0.421952, -0.095157, 0.153965, 0.163941, 0.065644, 0.051189, -0.052700, 0.198171, 0.078539, 0.150553, 0.079214, -0.106243, 0.052028, 0.399754, -0.099189, -0.048499, -0.350826, 0.164034, -0.100390, 0.006482, 0.106476, 0.125574, -0.302472, 0.106466, -0.001951, -0.170674, -0.168580, -0.263446, 0.021994, -0.023812, 0.224078, 0.294452, -0.036880, -0.195294, -0.060993, -0.182310, -0.029639, -0.153639, -0.267341, 0.055813, -0.093401, -0.029238, -0.056474, -0.072861, 0.073507, -0.192153, 0.078370, 0.074331, 0.109782, -0.006688, 0.274956, -0.129888, -0.077853, 0.032520, -0.045826, 0.223315, -0.072236, 0.381344, -0.058244, -0.160035, -0.035549, -0.002115, 0.329969, -0.475955, -0.105570, 0.161399, -0.180367, -0.054133, 0.225618, -0.134707, -0.124768, -0.103138, 0.116196, -0.015203, -0.210436, -0.135758, 0.105062, -0.033005, -0.003466, 0.048977, 0.222279, -0.140591, 0.095549, -0.193218, -0.008122, 0.028272, -0.454862, -0.236683, 0.021183, 0.034940, -0.078366, 0.072634, -0.201373, -0.208224, 0.092598, 0.206512, -0.136939, -0.251991, 0.225938, -0.025985, -0.180388, 0.164817, -0.184156, 0.089651, -0.068970, 0.100592, 0.285264, -0.061121, -0.262519, -0.222357, -0.177364, 0.026919, -0.225394, 0.085052, 0.012805, -0.222733, 0.022917, -0.142206, -0.137462, -0.070767, -0.027459, 0.145138, -0.212025, 0.242407, -0.139806, -0.078897, 0.191488, 0.011355, 0.162786, 0.065635, -0.308924, 0.140517, 0.233508, -0.125086, -0.114276, -0.039805, -0.013715, -0.201792, 0.153641, 0.029874, 0.012412, -0.088794, -0.113351, -0.184115, -0.303342, 0.210841, -0.354337, -0.231445, 0.186901, -0.024507, -0.094094, 0.058795, -0.135186, -0.158604, 0.214875, -0.055938, -0.273705, 0.180719, -0.000908, -0.056256, -0.055971, -0.197719, -0.253670, 0.263556]
-,        [0.101267, 0.086598, -0.045579, 0.114482, -0.157057, -0.082845, -0.125808, -0.288161, -0.114564, -0.200747, -0.020736, -0.009054, 0.084222, -0.104608, -0.067113, -0.070524, -0.038682, -0.000328, -0.247194, -0.001962, 0.013983, 0.077559, -0.247244, 0.003342, 0.048370, -0.300832, -0.065190, -0.000804, 0.084731, 0.144813, -0.008112, -0.051943, 0.125674, -0.129934, 0.015088, -0.031286, -0.019634, -0.189236, 0.124388, -0.096795, 0.050238, -0.036030, 0.147461, 0.061692, -0.008450, 0.239974, -0.134232, -0.068341, 0.014062, -0.109456, -0.002552, -0.184324, -0.174101, 0.000489, -0.112456, -0.082687, -0.108959, -0.163914, -0.177010, -0.031560, 0.001449, 0.100453, -0.168615, 0.103689, 0.054390, -0.000395, -0.067425, -0.047451, 0.157138, -0.152720, 0.103988, -0.137139, 0.145433, 0.042882, 0.023579, 0.056988, -0.062124, -0.004451, -0.060151, -0.218667, 0.159851, 0.166858, -0.330852, -0.059315, -0.089098, -0.157761, 0.060055, -0.152993, -0.082159, 0.121256, 0.005442, -0.129291, -0.146808, -0.170175, 0.003287, 0.050041, -0.086319, 0.118555, -0.075329, 0.034226, -0.026529, -0.074846, 0.056030, -0.166136, 0.120965, 0.209852, -0.107602, -0.025655, -0.021346, -0.125476, -0.118607, -0.134442, -0.105680, -0.206670, -0.140321, -0.026048, -0.032200, -0.241020, -0.224254, -0.179246, -0.064154, -0.028459, -0.196740, -0.098365, -0.066780, -0.344580, 0.008505, -0.189706, -0.168087, 0.107748, -0.090970, 0.130750, -0.304383, -0.051944, -0.065319, -0.166413, -0.028343, -0.240742, -0.038664, -0.028484, -0.082752, -0.163754, -0.168795, -0.010557, 0.061224, -0.117612, -0.089578, -0.057183, -0.154053, -0.064235, -0.134974, -0.031768, -0.053653, -0.113617, 0.118473, -0.182457, -0.035831, 0.037415, -0.005610, -0.028021, -0.164821, -0.056893, 0.127298, -0.049350, -0.082328, -0.112310, -0.104850, -0.067156, -0.030481, 0.140751, -0.016228, -0.146770, -0.069648, -0.317652, 0.019496, 0.026424, 0.099687, 0.077780, -0.001111, 0.027680, -0.042951, -0.173407, -0.117967, -0.198032, 0.170171, -0.165783, -0.072491, -0.120805, 0.088230, -0.066065, -0.144099, 0.105267, -0.014952, -0.037144, -0.179448, -0.239948, 0.034383, 0.126388, 0.050779, -0.106063, 0.086978, 0.112140, 0.066217, 0.083376, -0.118243, 0.100075, 0.013941, -0.086533, -0.138601, -0.003651, 0.045253, -0.116534, -0.139191, -0.014799, 0.122519, -0.140033, -0.153206, -0.084495, -0.156653, -0.119378, -0.169599, -0.141183, -0.165911, 0.092072, 0.144621, -0.237889, -0.178233, -0.127193, 0.064826, -0.072430, 0.022556, 0.021308, -0.035204, -0.002827, -0.048337, -0.120792, -0.160623, -0.197498, 0.066593, -0.104681, 0.059911, -0.102945, -0.094150, -0.142993, -0.010138, -0.151910, -0.252501, 0.008694, 0.093385, -0.120502, -0.185087, 0.003706, -0.088818, 0.162014, -0.001108, -0.029149]
-,        [-0.135068, -0.079930, 0.114485, -0.032287, -0.283025, -0.336298, -0.247748, -0.175119, -0.014985, 0.116600, 0.158491, -0.258522, -0.125743, 0.193983, -0.296152, -0.196672, -0.110162, 0.180193, -0.169579, -0.068544, -0.235215, -0.281294, -0.220177, -0.070306, 0.110253, 0.077693, -0.087996, -0.328079, -0.149718, -0.223137, 0.137069, -0.051359, 0.021991, -0.159617, 0.084441, -0.168847, 0.173261, -0.068680, 0.218185, -0.477591, -0.406302, -0.261176, -0.053547, 0.063643, -0.226595, 0.020063, 0.021567, -0.205011, -0.241733, -0.070147, -0.121670, 0.045268, -0.213173, -0.178173, 0.062293, -0.317479, 0.090939, -0.449377, 0.416722, 0.189038, -0.056977, 0.178675, -0.489406, -0.021067, 0.100742, -0.044182, -0.245382, -0.125482, -0.047266, -0.084657, 0.155268, -0.054689, 0.013554, -0.479558, 0.198162, -0.550388, -0.437042, -0.174300, -0.084337, -0.110640, 0.026439, -0.276043, -0.284473, -0.272109, -0.003978, 0.046212, -0.282817, 0.209146, 0.107762, 0.102589, -0.329917, -0.133542, -0.022145, 0.012760, 0.081632, 0.017159, 0.051277, -0.101644, -0.283628, -0.096004, -0.202360, -0.326817, 0.251111, -0.333083, -0.248307, 0.095847, -0.062050, 0.001039, 0.014089, -0.103450, -0.120122, -0.186455, 0.066738, -0.031533, -0.143354, -0.119027, 0.072944, 0.035124, 0.037457, -0.020101, -0.214477, -0.306662, -0.050987, -0.092107, -0.104561, -0.040101, 0.023073, -0.070386, -0.259253, -0.170271, -0.294659, -0.318079, 0.198474, -0.171444, -0.130927, -0.135501, -0.282623, -0.111404, -0.084632, -0.400032, -0.065710, 0.232869, -0.136972, 0.000268, -0.302957, -0.093358, -0.347228, 0.121699, -0.153982, -0.036399, -0.168465, -0.264180, 0.000489, -0.122688, -0.246544, -0.088728, -0.122181, -0.081939, 0.122536, -0.111580, -0.016035, -0.510124, -0.150670, -0.080910, 0.019591, -0.317290, -0.027840, -0.124522, -0.116712, -0.349723, -0.280030, -0.311829, 0.079732, 0.068039, 0.150606, -0.089863, -0.176850, -0.158632, -0.058045, -0.377655, 0.072193, 0.037342, 0.149699, -0.197618, -0.194312, 0.149699, -0.156304, -0.080334, -0.051940, -0.046929, 0.185995, -0.252743, -0.108744, -0.016267, -0.206348, -0.453423, -0.191088, -0.204329, -0.097813, -0.067230, 0.238344, -0.217622, 0.000202, -0.410933, 0.081369, -0.079288, -0.003029, 0.005652, 0.031321, -0.243516, 0.023651, -0.023887, -0.013305, 0.247571, -0.066377, 0.042282, -0.288097, -0.088249, -0.321711, -0.163033, -0.133470, -0.281814, -0.056335, -0.257613, -0.060261, -0.005777, -0.014618, 0.055460, -0.103406, -0.017016, -0.050914, -0.197586, 0.078593, -0.257217, -0.297346, -0.305623, -0.259769, -0.249428, -0.058846, -0.245422, -0.148651, -0.174138, -0.313775, 0.003463, 0.060715, -0.108693, 0.148101, 0.002908, 0.043641, -0.048671, -0.200489, -0.349301, -0.425691, -0.111745, -0.004929, -0.153159]
-,        [-0.270113, -0.426326, -0.296630, -0.125128, -0.048854, -0.227698, -0.290353, -0.045098, 0.257617, -0.056521, 0.047900, -0.013915, 0.253374, -0.145965, -0.146175, -0.164334, -0.095911, -0.012804, -0.090901, 0.206387, 0.049623, -0.043521, 0.134725, 0.173714, -0.191533, 0.053634, 0.375240, 0.290336, -0.199687, -0.133456, -0.299188, -0.173048, -0.196571, -0.142335, 0.432965, -0.182073, 0.067676, -0.287170, -0.310739, 0.356097, 0.239430, 0.167268, -0.022575, 0.012322, -0.116400, 0.026414, -0.228033, 0.329055, -0.375798, -0.413749, -0.742259, -0.097181, -0.168357, 0.121229, 0.125798, -0.038577, -0.464550, 0.101354, -0.079552, -0.171082, -0.173199, 0.026768, -0.125947, -0.087534, 0.270527, 0.104117, -0.076203, -0.331743, 0.206201, 0.221172, 0.216636, -0.100891, -0.185493, -0.228666, 0.016174, -0.050469, 0.035643, 0.012924, 0.298981, -0.196708, 0.185101, -0.295218, -0.243138, 0.048812, -0.221622, -0.147765, -0.104992, 0.021272, -0.430504, -0.030699, 0.093608, -0.199749, -0.204590, -0.241051, -0.018777, -0.031139, -0.184743, -0.080113, -0.540225, -0.011570, -0.432453, -0.144132, 0.240670, 0.049173, -0.123265, 0.021795, -0.072164, -0.036798, -0.132646, -0.407679, -0.498591, -0.074708, 0.058344, 0.263233, 0.070789, 0.223576, -0.074761, -0.355667, -0.095056, 0.007865, 0.374950, 0.075833, -0.281111, 0.079841, 0.103327, 0.041030, 0.116296, -0.331591, -0.073952, -0.331010, -0.077296, -0.331954, -0.424424, 0.104996, -0.247460, -0.008329, 0.102106, -0.009439, -0.018566, 0.460429, 0.125803, -0.466267, -0.112447, -0.210294, 0.293737, 0.010878, -0.584178, -0.061947, -0.082657, -0.180462, -0.101361, -0.055078, -0.152336, -0.002703, -0.058895, -0.320685, -0.110227, 0.189485, -0.185840, 0.044594, 0.122031, -0.228147, -0.494760, -0.552450, -0.310104, -0.151372, 0.044972, -0.154800, -0.506730, 0.124730, -0.388427, 0.185108, 0.104222, 0.233780, -0.299106, -0.174479, -0.153890, 0.294862, -0.425881, -0.422315, -0.346651, -0.573831, -0.281687, 0.028305, -0.096122, -0.012470, 0.351097, -0.325964, 0.115938, -0.163263, -0.027753, -0.041039, -0.148431, 0.012925, -0.309642, -0.113101, 0.073269, 0.110642, -0.189911, -0.237328, 0.126419, -0.226836, 0.016624, -0.040717, -0.020180, -0.051477, -0.171013, -0.190521, 0.073415, 0.219673, 0.116574, -0.141924, 0.016396, -0.320466, -0.120150, -0.013742, -0.319645, 0.309234, -0.074619, -0.011468, -0.351954, -0.207315, -0.301374, 0.149946, 0.150254, -0.170021, -0.552366, 0.034503, -0.021163, 0.104966, -0.226783, 0.070840, -0.149586, -0.095219, 0.174473, -0.194935, -0.225768, 0.095607, -0.096460, -0.266845, -0.106698, -0.032895, -0.071387, -0.118986, 0.007763, 0.189365, -0.346602, -0.043963, -0.312237, -0.091249, -0.249866, -0.237125, 0.317993, 0.110873, -0.050206, 0.194975]
-,        [-0.014864, -0.077410, -0.138331, 0.233280, -0.058528, 0.134686, -0.243550, -0.199678, -0.261017, -0.032965, 0.111422, 0.042420, 0.410397, -0.348640, -0.104661, -0.213982, -0.142007, -0.058838, 0.332698, -0.267346, -0.429762, 0.242424, -0.429006, -0.469978, -0.357277, 0.218621, 0.067298, 0.161985, 0.071873, -0.005562, -0.219721, 0.095520, 0.035374, 0.304689, -0.378288, -0.390886, -0.266132, -0.254235, 0.094715, -0.231868, -0.221666, -0.137132, -0.014198, -0.332202, 0.002871, 0.388269, 0.006632, 0.213936, 0.044174, 0.004044, -0.114916, 0.017708, -0.154635, 0.090982, -0.362313, -0.097544, 0.079647, 0.268333, 0.002647, 0.058507, -0.163991, 0.277505, 0.144195, -0.072729, -0.318205, -0.275091, -0.416951, -0.417993, 0.103991, -0.042757, 0.081481, -0.385776, -0.150988, 0.019533, 0.077220, -0.208960, -0.017223, -0.341440, -0.389778, -0.230379, -0.613278, 0.196575, -0.191450, 0.289867, -0.314084, -0.415512, 0.080727, 0.078767, 0.485962, -0.213459, -0.183756, 0.323797, -0.020175, -0.157816, 0.147231, 0.106925, -0.282670, 0.357564, -0.174732, 0.034491, 0.086017, -0.069048, 0.062286, 0.242351, -0.050018, -0.181570, 0.120081, -0.107472, 0.187388, -0.025404, 0.082285, -0.092299, -0.029404, 0.159776, -0.162337, 0.373542, -0.441651, -0.082084, 0.145451, 0.175331, -0.159675, -0.111344, -0.012200, -0.146154, 0.034514, 0.203016, 0.359620, 0.146790, -0.188081, -0.319878, -0.676006, 0.240836, -0.039824, 0.021913, -0.195323, -0.711269, 0.065407, -0.601510, -0.642980, 0.226909, 0.074381, 0.095291, -0.011101, -0.443425, -0.161930, -0.036208, 0.189687, -0.189043, -0.445997, 0.076255, -0.005850, 0.005923, 0.180985, -0.354148, -0.117079, -0.209622, -0.282612, -0.375291, -0.317700, 0.030331, -0.385825, -0.158768, -0.433701, -0.077204, -0.088493, 0.105025, 0.531934, -0.386302, 0.171358, -0.126584, -0.551354, 0.037729, 0.429146, 0.150702, -0.099201, -0.363568, -0.140838, 0.173111, -0.352493, -0.179536, -0.200652, -0.046050, -0.052809, -0.076460, -0.034571, -0.080616, -0.182084, 0.169093, -0.068134, 0.218289, 0.295344, 0.579220, 0.128924, 0.135982, -0.006529, 0.027983, -0.227863, -0.111199, -0.054811, 0.477880, -0.351598, 0.422725, 0.363684, -0.222557, 0.037055, 0.001831, -0.116277, 0.263530, 0.396673, 0.031548, -0.040231, 0.218766, -0.004633, -0.122550, -0.092564, -0.105746, 0.305527, -0.134235, 0.200809, -0.064840, -0.171871, -0.376350, -0.208223, -0.381491, -0.181329, 0.668231, -0.696748, -0.262162, -0.247144, -0.124220, -0.233944, -0.018143, 0.021969, -0.140369, 0.646894, 0.042008, 0.240929, -0.268211, 0.158394, -0.416975, -0.571955, 0.028345, -0.252834, 0.142752, -0.130481, 0.006463, -0.217614, 0.186369, 0.003582, -0.202999, -0.464081, 0.062561, -0.137128, -0.275812, 0.356574, -0.566575]
-,        [0.016325, -0.047145, 0.094666, -0.289112, -0.183570, 0.207274, 0.037872, -0.505434, -0.889065, 0.786322, 0.166666, -0.398727, 0.327642, -0.712283, -0.420145, 0.128804, 0.196975, -0.049755, 0.031592, 0.261630, -0.504759, 0.282346, 0.418341, -0.391065, -0.194748, -0.586802, -0.273539, 0.319106, -0.498805, 0.526697, -0.023198, 0.419700, -0.252236, -0.198914, -0.299178, -0.645170, -0.090827, -0.238109, -0.403752, -0.135885, 0.441179, -0.031200, 0.619412, 0.663544, -0.490605, 1.607273, 0.290852, 0.558317, 0.621734, -0.214689, -0.493519, 0.053568, -0.410009, 0.933138, -0.089779, -0.509169, -0.102243, -0.305549, -0.139406, -0.326335, -0.018812, 0.011091, -0.244540, 0.031488, -0.044042, -0.443458, 0.663441, 0.414719, -0.301710, -0.215646, -0.114575, -0.417314, -1.115749, 0.734042, -1.540929, 0.028794, 0.518800, -0.277588, 0.400334, 0.199103, -0.515813, 0.231235, 0.890162, 0.736830, -0.498554, -0.168915, -0.048686, -0.036858, 0.625483, 0.525116, 0.055342, -0.436318, 0.710435, 0.030953, -0.162603, -0.356385, -0.472284, -0.536169, -0.541886, -0.032100, 0.494492, -0.020332, -0.244526, -0.273401, -0.143551, 0.803291, -0.260121, -0.547442, -0.332100, 0.501342, 0.691708, 0.128914, 0.214408, -0.285919, -0.249940, -0.818625, 0.605479, -0.468611, 0.246141, -0.011674, 0.585566, -0.187934, -0.177317, 0.496018, -0.150688, -0.155835, 0.732139, 0.540990, -0.141721, -0.202028, -0.488164, -0.158605, 0.284612, -0.424694, 0.512282, 0.922998, -0.085302, 0.456642, 0.268873, 0.144093, 0.132046, -0.259055, -0.107421, -0.182956, -0.131181, -0.317887, 0.697522, 0.455553, -0.053562, -0.385704, 0.023671, -0.896894, -0.224412, 0.447738, 0.003870, 0.565531, 0.753360, 0.154869, 0.245720, -0.296502, 0.458639, -0.809455, -0.983294, 0.441398, 0.366447, -0.412116, 0.266282, 0.575316, 0.100969, -0.109681, 0.147096, 0.979212, 0.105966, 0.208190, -0.750201, 0.438131, 0.161128, -0.040447, 0.010666, -0.285698, 0.111289, 0.258671, -0.036000, 0.288832, 0.509160, -0.255005, -0.084426, 0.748508, 0.196426, 0.080162, 0.299356, 0.368326, 0.633359, 0.315677, -0.011558, 0.081779, -0.346328, -0.530786, -0.504362, -0.505145, 0.117262, 0.409278, 0.529177, -0.125120, 0.295957, 0.323640, 0.647531, -0.560059, -0.212380, -0.041743, -0.501217, 0.167496, 0.089661, 0.506011, -0.464233, -0.247402, 0.334986, 0.129267, 0.081880, 0.855500, 0.168892, 0.355205, -0.624345, 0.181249, -0.526188, 0.207206, -0.128869, 0.253485, -0.479360, 0.159115, 0.412354, 0.225303, 0.130343, 0.061858, 0.434582, 0.304987, -0.332457, 0.241934, -0.456825, -0.496751, 0.332860, 0.208157, 0.141905, 0.082304, -0.617006, 0.025089, -0.561546, 0.469256, -0.837339, -0.185918, -0.083797, 0.111590, -0.063679, -0.342314, 0.014178, -0.528922]
-,        [-0.120857, -0.092193, 0.077874, 0.024258, -0.090838, -0.087137, -0.041012, -0.054525, -0.014438, -0.178503, -0.112138, -0.115099, -0.001151, -0.126654, -0.009648, 0.012407, 0.075723, -0.019571, -0.129961, 0.156415, 0.055107, 0.056059, 0.087744, -0.034618, 0.023288, -0.087430, -0.144471, -0.064501, -0.081330, -0.033177, -0.025623, -0.109545, -0.156011, 0.169450, 0.039998, -0.204827, 0.112656, -0.108561, 0.059745, 0.028445, -0.229786, -0.203931, 0.105272, -0.038613, 0.080155, 0.002002, -0.037726, 0.044289, -0.025172, -0.054605, 0.028894, -0.032980, -0.113390, -0.149108, 0.034488, 0.029401, 0.068815, 0.095254, -0.125471, 0.128641, -0.022077, -0.006649, -0.022116, -0.009758, -0.157231, -0.148138, 0.080506, 0.105599, -0.044136, -0.056894, -0.158895, -0.065812, 0.197242, -0.141222, -0.173585, -0.147120, -0.068994, -0.038717, -0.092506, -0.277959, -0.076768, -0.060373, -0.084209, 0.053498, -0.171767, -0.047536, -0.134563, 0.041912, 0.010108, 0.060881, 0.097474, -0.116038, 0.143496, 0.078620, -0.177491, -0.002572, -0.118646, -0.135975, 0.051001, -0.112200, 0.011254, -0.031971, 0.054342, -0.085634, -0.081401, -0.095830, -0.146358, 0.074400, -0.109205, 0.016608, -0.204867, -0.161091, 0.029577, -0.098721, -0.060676, -0.008469, -0.114293, -0.058745, -0.085746, 0.049212, -0.173782, -0.032761, -0.166032, -0.060131, -0.135911, -0.025845, -0.141803, -0.064223, -0.161134, -0.116414, 0.027244, -0.053008, 0.002270, -0.015883, 0.157557, 0.017540, 0.055954, -0.166086, -0.084227, -0.175522, 0.044791, -0.036831, -0.052741, 0.157537, -0.109109, -0.070931, 0.191178, 0.086331, -0.220871, -0.275822, 0.106273, 0.019002, -0.055806, -0.012240, 0.029231, -0.021791, -0.019600, -0.033896, -0.025322, -0.084272, 0.077925, -0.022944, -0.072835, -0.085905, -0.068013, 0.029067, -0.157257, -0.000309, 0.061537, -0.050019, -0.074069, -0.083238, 0.044260, -0.116122, 0.069717, -0.046774, -0.026014, -0.001080, 0.002356, -0.064699, 0.068294, 0.004521, -0.001438, 0.136680, 0.013529, 0.094152, -0.094546, -0.077063, 0.044685, 0.231587, -0.150450, -0.036405, 0.170728, -0.153472, -0.097234, 0.123686, -0.061902, 0.025402, -0.059826, -0.057809, 0.095571, -0.153050, -0.070876, 0.073780, 0.028492, -0.052300, -0.077042, -0.055064, -0.074055, -0.049777, 0.071180, -0.049020, 0.012639, 0.059473, -0.081638, -0.025467, -0.079708, -0.026304, -0.055708, 0.096762, 0.057357, 0.043252, -0.028427, -0.224182, 0.158202, -0.046224, -0.074717, 0.015916, -0.087113, -0.022598, 0.049905, -0.071700, -0.050155, -0.109322, -0.083114, -0.129343, -0.095650, -0.120236, -0.110756, -0.216812, 0.104149, -0.032460, -0.085049, 0.070833, -0.131597, 0.059485, -0.086778, -0.019026, -0.178665, -0.158402, -0.148085, 0.024120, -0.011453, -0.009161, -0.018148, -0.015364]
-,        [0.267005, 0.029323, -0.259337, -0.573921, 0.641827, -0.466334, -0.279031, 0.051784, 0.644637, -0.650046, -0.349170, -0.334867, -0.123068, 0.195596, -0.032731, -0.467319, 0.374032, -0.048626, 0.214548, -0.285715, -0.048772, -0.079829, 0.364219, -0.626995, -0.262582, 0.108766, 0.029448, 0.455048, -0.026692, -0.087685, 0.224377, -0.178588, 0.081895, -0.030487, 0.293639, -0.230337, 0.122626, 0.303243, -0.223184, -0.003609, 0.779204, -0.326050, 0.022865, 0.100738, -0.326851, 0.253798, 0.339073, 0.721933, 0.164610, 0.193249, -0.273035, 0.044898, -0.475946, 0.246221, 0.639134, -0.237985, 0.262398, -0.204225, 0.439200, 0.210390, 0.030050, -0.345579, -0.593222, 0.187308, 0.058370, 0.202643, -0.401892, 0.105054, -0.008985, 0.069945, 0.676118, -0.179018, -0.211425, -0.023438, -0.138056, 0.246877, 0.452685, -0.349286, 0.122433, -0.349855, -0.249081, -0.004365, 0.300023, -0.066896, 0.118859, -0.050172, 0.420210, -0.271301, -0.207908, -0.087736, 0.256373, 0.277795, -0.280116, -0.002984, -0.152216, -0.195043, -0.222957, -0.030288, -0.038197, -0.618486, -0.329498, 0.485252, 0.107091, 0.463244, -0.320700, 0.828420, 0.504490, -0.219395, 0.279441, -0.374024, 0.236224, 0.091726, 0.496700, -0.220629, -0.410637, -0.052872, 0.200924, -0.251964, 0.133643, 0.275105, -0.157349, 0.102210, -0.063138, -0.474522, -0.267184, -0.001132, 0.119250, -0.779348, -0.556573, -0.008818, -0.415168, -0.251162, 0.388173, -0.127286, 0.549560, -0.293212, 0.300725, 0.142737, -0.003498, -0.264051, 0.125557, 0.095142, 0.123618, -0.134440, 0.812829, 0.063865, -0.269859, 0.402338, -0.308773, -0.252949, -0.032665, -0.460616, -0.160239, -0.064850, -0.376324, -0.083407, 0.106216, -0.326797, 0.004312, 0.463802, -0.126935, 0.226926, -0.039423, 0.175428, -0.052691, 0.175366, 0.520857, -0.346927, -0.296039, 0.471682, -0.124468, 0.181724, 0.330412, -0.407505, -0.774265, 0.028913, -0.183847, -0.448348, -0.384816, -0.284788, -0.469422, 0.464144, -0.271830, -0.400851, -0.191832, -0.373829, 0.328623, 0.016333, -0.042220, 0.091424, 0.555212, 0.310284, -0.259944, -0.034622, -0.027172, -0.045879, 0.224039, 0.121956, -0.198237, -0.136828, -0.091293, 0.157976, -0.439193, -0.004450, -0.034472, -0.091876, 0.153891, -0.378728, -0.283376, 0.340926, 0.146772, 0.100314, -0.043007, -0.232146, 0.464402, 0.399643, 0.432034, 0.269030, 0.211668, -0.658369, 0.099566, 0.132592, -0.504574, -0.182430, -0.642487, -0.151020, -0.589142, -0.297003, 0.372844, -0.044294, 0.134008, -0.224879, -0.039446, 0.212026, -0.087602, -0.033061, -0.356896, 0.279921, -0.190031, -0.278173, 0.115353, -0.015056, -0.080500, -0.363987, -0.207739, -0.120207, -0.418991, 0.471784, -0.577329, -0.114017, -0.149191, 0.077800, -0.309756, -0.283809, 0.016147, -0.298542]
-,        [-0.045425, -0.177522, -0.074158, 0.479857, 0.911344, 0.095429, -0.603200, 0.071064, 0.572988, 0.089726, -0.520066, 0.006949, 0.592058, 0.859004, 0.835200, -0.185002, 0.523767, 0.640823, -0.042805, 0.711888, 0.190610, 0.054408, 0.007288, -0.556757, -0.592372, -0.357269, 0.920868, 0.095830, 0.015221, 1.000718, 0.228523, 0.705527, 0.566786, 0.076716, 0.021677, 0.280833, 0.275667, 0.414182, -0.089233, 0.598551, 0.222322, -0.219424, -0.084992, 0.105550, 0.766106, 0.240869, -0.150808, 0.080106, 0.112002, 0.568788, -0.147808, 0.880532, -0.197916, 0.228181, 0.772538, -0.143984, -0.356822, 0.213085, 0.650300, -0.825186, 0.558514, 0.341828, -0.325376, 0.538370, 0.226570, 0.144219, 0.483092, -0.137935, -0.074051, -0.034930, 0.201297, -0.108312, 0.806103, 0.379811, -0.024958, -0.187192, 0.532076, 0.488868, -0.011822, 0.130984, -0.371491, -0.205985, 1.205187, -0.599539, -0.217740, -0.225194, 0.403506, -0.748659, -0.236910, 0.521513, -0.095284, 0.149401, -0.023209, 0.339154, 0.091326, 0.646758, -0.472309, 1.135801, 0.128674, 0.015083, 0.651450, 0.191641, 0.743985, 0.325793, -0.304996, -0.546903, -0.683204, 0.286530, 0.238256, -0.267965, 0.459220, -0.292120, 0.273986, 0.050080, -0.207513, -0.004914, 0.640753, -0.023064, 0.453085, 0.128394, 0.305177, 0.384291, 0.487748, -0.104598, 0.480017, -0.251020, -0.236312, 0.182746, -0.620259, 0.214634, -0.017634, -0.063695, 0.123841, 0.051684, -0.646557, 0.656246, 0.418147, 0.181175, -0.061143, 0.610902, -0.126372, -0.127632, -0.323423, -0.330413, -0.095836, 0.902305, 0.478963, 0.863294, 0.044372, 0.183730, 0.602780, -0.323840, 0.562069, 0.359848, -0.019672, 0.131696, -0.205267, 0.412139, 0.087813, -0.289666, 0.560228, 0.171276, 0.097924, 0.559934, -0.034934, 0.447599, 0.582502, -0.369400, -0.450674, 0.695268, 0.010091, 0.565719, 0.266487, -0.152603, -0.224169, 0.366737, 0.407308, -0.367909, -0.436024, 0.000748, -0.443620, 0.220205, 0.369656, 0.044984, 0.421892, 0.250765, -0.797717, -0.322377, -0.336269, -0.702158, 1.097826, 0.552713, -0.149362, -0.006648, 0.381017, -0.107349, 0.427548, 0.343738, 0.505035, 0.040810, -0.362299, 0.672453, 0.251431, -0.550764, -0.315079, -0.060555, 0.681432, 0.797206, 0.340965, 0.478213, 0.283710, 0.147497, 0.065128, -0.015951, 0.481337, -0.063644, 0.244344, 0.639563, -0.256909, -0.474420, 0.355145, 0.048634, 0.120260, 0.044881, -0.411959, -0.680849, -0.512554, -0.520114, 0.161323, 0.876446, -0.172606, 0.175831, 0.079354, -0.831884, 0.300610, 0.593245, 0.210489, -0.225109, 0.294050, -0.418698, -0.366362, -0.140951, 0.313004, 0.449253, -0.305606, 0.537491, -0.259598, -0.126808, 0.610413, 0.336587, 0.590491, 0.059434, 0.468806, -0.283631, 0.085170, 0.948374]
-,        [0.017954, 0.235962, 0.067053, 0.137818, -0.099891, -0.167735, -0.009770, -0.111742, -0.147545, 0.080870, 0.273998, -0.444215, 0.162195, 0.458624, -0.116738, -0.257707, -0.121165, 0.204208, -0.332886, -0.290528, -0.001059, 0.041668, -0.472210, 0.400574, 0.306299, -0.164530, -0.001574, 0.019188, 0.097947, -0.073101, 0.021343, -0.079189, 0.035219, -0.408884, -0.306625, 0.034969, 0.036933, -0.023213, 0.207757, 0.017705, 0.022585, -0.113609, 0.212291, -0.055340, 0.075278, -0.147171, -0.018400, -0.293454, 0.035473, -0.115799, -0.053961, 0.021554, -0.383464, 0.060947, -0.298527, -0.386034, 0.138504, 0.010594, 0.156108, 0.029115, 0.162878, -0.124619, -0.123555, -0.242221, -0.080496, -0.019711, -0.043377, -0.005347, 0.193151, -0.128256, 0.053706, -0.064363, -0.069420, 0.077167, -0.210918, -0.257624, -0.100968, -0.075247, -0.092494, 0.075832, 0.136178, 0.076540, 0.179636, -0.057774, 0.102405, -0.225800, 0.100386, -0.044531, -0.338727, 0.065323, 0.127028, 0.045809, 0.191515, -0.006634, -0.111429, 0.263571, 0.001982, -0.334937, -0.111304, -0.207264, -0.071219, -0.125907, 0.064363, 0.239455, -0.515174, 0.144885, -0.275308, -0.066030, -0.297757, 0.050570, -0.124635, 0.017454, 0.103300, 0.561457, -0.319563, 0.033115, -0.270987, -0.142656, 0.136708, 0.009572, 0.103876, -0.032231, 0.111054, -0.149688, -0.109652, -0.152955, 0.194581, 0.087161, -0.333344, -0.106715, -0.349150, 0.127842, 0.103503, -0.042164, -0.217916, -0.164538, 0.033923, 0.187643, -0.211224, 0.102540, 0.066194, 0.169805, -0.148252, -0.135146, -0.043068, 0.071017, -0.033720, -0.303765, -0.106692, 0.181426, 0.025761, -0.321614, -0.142991, -0.261506, -0.053975, 0.314735, -0.148424, -0.012620, 0.114408, -0.128453, -0.325072, -0.085999, 0.046443, -0.111866, 0.124527, 0.074146, -0.021359, 0.027732, -0.130786, 0.042846, 0.038315, -0.296039, -0.096150, -0.025317, -0.436105, -0.019619, -0.356571, -0.098651, -0.294303, -0.107835, -0.135848, -0.053817, -0.198020, 0.017438, 0.035304, -0.048587, -0.154578, -0.097086, 0.017740, 0.319714, -0.063579, -0.131058, -0.023764, -0.196469, -0.489640, -0.365935, -0.255996, 0.134111, 0.128666, -0.336818, 0.146081, 0.131275, 0.431087, 0.012949, -0.049323, -0.112791, -0.210431, 0.031816, 0.121225, -0.136668, 0.123785, 0.234845, -0.014658, 0.032860, 0.107002, -0.020563, 0.259841, -0.338425, 0.129208, -0.111538, 0.054710, 0.189906, 0.141877, -0.073932, -0.040693, 0.043755, -0.520463, -0.208042, -0.139332, -0.186977, -0.138968, 0.053472, 0.002403, 0.024661, 0.049620, -0.315627, 0.109818, 0.056401, 0.457739, -0.439310, 0.055413, 0.338150, -0.174557, 0.070938, 0.069583, 0.204521, 0.135594, -0.038717, -0.147637, -0.320720, 0.070919, 0.148729, -0.147585, -0.064868, 0.115165, -0.161907]
-,        [-0.221663, -0.114455, -0.454606, -0.425125, 0.022276, -0.262407, -0.209089, -0.247651, 0.168359, 0.305198, 0.240200, -0.196428, -0.244902, -0.145493, -0.106225, -0.284657, -0.203289, 0.231789, -0.118239, 0.125378, 0.204289, -0.473830, 0.146915, 0.076087, -0.621112, 0.032479, -0.130583, 0.033925, -0.453486, -0.256443, -0.187524, -0.230598, 0.000950, 0.095403, -0.331899, 0.581351, -0.055796, -0.126740, -0.409232, -0.161218, 0.003937, -0.158545, -0.255194, -0.081202, 0.486148, -0.214938, 0.029510, 0.245082, 0.102731, -0.317599, 0.234607, 0.019713, -0.478754, -0.430338, -0.203483, -0.628305, -0.121446, 0.055253, 0.258697, 0.141287, -0.054519, -0.005787, -0.295537, -0.381700, 0.506345, -0.021090, -0.016315, 0.141185, -0.160684, 0.205897, -0.171386, -0.353837, 0.103410, -0.015789, 0.470589, 0.008487, -0.287679, -0.227414, -0.024750, -0.090794, 0.203229, 0.110953, -0.237768, 0.021431, 0.066318, -0.224581, 0.156719, 0.269245, 0.151226, 0.089353, 0.404339, -0.564381, -0.095596, -0.061985, -0.195282, 0.142758, -0.104441, 0.013289, 0.588381, -0.337247, 0.155838, 0.043014, 0.001740, -0.178659, -0.116477, -0.467963, -0.518046, -0.026280, -0.000537, -0.481691, -0.176409, -0.595532, 0.077624, 0.003730, -0.912353, -0.249467, 0.199144, -0.483805, -0.425577, -0.040457, 0.064080, 0.235455, -0.101973, 0.089359, 0.393925, -0.231134, 0.403773, -0.738047, -0.788719, -0.139308, -0.277213, -0.892039, -0.226965, 0.320180, -0.147619, 0.535964, 0.002743, -0.142393, -0.412589, 0.242217, -0.152974, -0.462233, 0.096522, -0.177779, -0.253505, -0.173993, -0.211093, 0.026415, -0.187824, -0.239403, -0.171373, -0.134755, -0.219988, -0.203135, -0.249071, 0.052295, 0.094095, -0.404801, -0.220455, 0.343637, 0.296698, 0.142789, -0.847962, 0.098538, -0.117060, -0.310857, 0.018762, 0.311930, -0.459672, 0.235714, -0.165975, 0.045449, 0.304375, -0.028915, 0.089019, -0.351675, -0.078385, -0.326256, -0.729401, -0.311190, -0.271472, -0.095449, -0.224828, -0.225502, 0.202336, -0.241661, 0.012421, 0.034748, 0.270434, -0.697369, 0.023967, -0.504012, 0.245470, -0.302843, 0.179396, 0.077435, -0.303835, -0.123114, -0.142982, -0.053120, 0.372375, -0.053812, 0.267783, 0.412410, -0.613532, -0.446831, -0.437821, -0.020004, -0.649371, -0.482126, -0.103082, -0.038687, -0.044285, -0.126493, 0.002321, -0.083956, 0.239919, 0.241142, 0.162727, 0.037648, -0.177698, 0.186577, -0.057294, 0.317866, 0.476893, -0.593967, -0.344061, -0.025476, 0.093566, -0.217273, 0.233805, 0.112707, 0.014511, -0.389777, -0.801486, -0.007426, 0.313906, 0.024531, -0.535728, -0.469145, -0.353598, -0.066229, 0.003692, -0.384299, -0.422777, -0.178003, -0.321377, -0.273729, 0.129778, -0.065962, 0.653386, -0.447262, -0.603009, 0.159969, 0.189732, -0.196921]
-,        [0.015656, -0.087027, 0.052933, 0.020353, -0.222111, 0.003547, -0.053246, -0.125165, 0.052692, -0.094706, 0.008131, -0.104158, -0.093412, -0.163704, -0.006854, 0.120440, -0.072094, -0.135826, 0.008079, 0.162716, 0.119343, -0.053877, 0.004967, -0.140809, 0.199049, -0.110124, -0.151015, 0.006742, -0.061019, -0.031347, -0.158855, -0.090857, 0.145962, 0.031286, -0.087381, 0.039518, -0.087563, 0.018567, -0.005914, -0.128094, 0.097237, 0.101004, 0.028069, -0.047955, -0.063190, -0.149676, -0.168705, -0.139437, 0.038107, -0.228186, 0.052131, -0.083822, -0.178325, -0.071434, -0.190607, -0.042816, -0.053764, 0.199664, -0.028623, 0.011735, -0.118069, 0.100490, -0.135688, -0.115187, -0.221548, -0.115390, -0.059707, 0.126642, 0.030329, 0.004667, -0.260937, -0.117734, -0.050958, -0.071103, 0.130633, -0.094906, -0.108460, -0.048931, -0.119817, 0.042125, -0.222384, 0.031580, 0.116783, 0.172860, -0.107345, -0.226206, 0.094016, 0.022301, -0.063405, -0.281228, 0.139440, -0.227269, -0.018181, -0.044445, 0.055879, -0.021547, -0.081482, -0.026391, -0.052324, -0.071999, 0.007966, -0.067679, -0.181370, 0.148833, -0.143068, 0.058272, -0.114406, -0.106646, -0.085892, 0.097707, 0.075038, 0.067751, -0.029268, -0.038257, -0.027744, -0.169233, 0.242671, -0.078103, -0.141931, -0.042154, -0.035781, 0.031970, -0.153494, 0.048291, -0.075553, -0.061945, -0.058805, -0.061071, -0.109684, -0.135302, 0.130305, 0.035431, -0.019540, -0.004506, 0.034635, 0.109496, -0.091499, 0.090700, -0.161561, -0.111717, 0.061153, -0.179615, -0.023603, -0.096729, -0.004143, -0.005445, -0.123370, -0.057420, 0.048799, -0.203335, -0.181278, -0.012091, 0.099612, -0.059034, 0.011121, 0.089500, 0.003739, 0.018034, 0.054549, -0.028532, -0.064836, 0.048070, -0.102994, -0.135465, 0.002124, -0.032401, -0.187996, -0.259908, -0.023236, -0.120612, -0.264402, -0.019065, -0.076557, -0.000630, -0.073655, 0.082514, -0.004844, 0.212634, -0.051490, -0.138897, 0.199896, -0.058620, -0.026719, -0.079436, -0.099302, -0.070936, 0.045666, -0.110301, -0.152728, -0.054914, -0.183579, -0.085233, 0.015385, 0.041713, -0.182236, -0.109254, -0.052852, -0.080924, -0.120489, -0.245157, -0.063538, 0.177949, -0.059148, -0.256605, -0.021289, 0.016682, -0.178606, 0.016738, 0.048910, -0.216877, 0.010687, -0.124070, -0.095683, -0.076120, -0.109035, 0.134187, -0.118619, 0.119172, 0.056678, 0.024505, -0.063414, -0.046030, -0.086212, 0.054672, 0.058724, 0.156187, -0.158862, 0.067447, 0.027016, 0.011206, -0.193347, -0.050970, -0.030938, -0.014080, 0.214405, -0.237938, 0.219348, -0.136242, -0.180021, -0.093795, -0.050037, -0.152943, -0.029877, 0.120583, 0.047592, 0.088386, -0.074204, -0.147593, -0.098775, -0.074546, -0.170982, -0.291112, 0.090485, -0.006898, -0.024912, -0.247451]
-,        [-0.166174, -0.081273, -0.078045, 0.121570, -0.060840, -0.217628, -0.143244, 0.165547, 0.150756, 0.071686, 0.029595, -0.174557, -0.053827, -0.082183, 0.039092, 0.235487, -0.077590, 0.122823, 0.116079, -0.100187, 0.131138, 0.012653, -0.013384, -0.006054, -0.082812, 0.024611, -0.030164, -0.132842, 0.069831, -0.136663, -0.086160, -0.083729, 0.017281, -0.110103, -0.197212, 0.032221, -0.025144, 0.025549, -0.210247, -0.129495, 0.018011, -0.260436, 0.251769, -0.097226, 0.051420, 0.076235, 0.039273, -0.012025, 0.083840, 0.016527, -0.131659, -0.036053, -0.122913, -0.061302, -0.037923, -0.105233, -0.090073, -0.002043, -0.105943, 0.043103, 0.023170, 0.005573, -0.234775, -0.197188, -0.163186, -0.027868, -0.003726, -0.038958, 0.030608, -0.175180, -0.074048, -0.134823, -0.194992, -0.176872, -0.018536, -0.131217, 0.019463, -0.001194, 0.029280, 0.097056, 0.157100, -0.134775, 0.120121, -0.099239, 0.028657, -0.119884, -0.090065, -0.012207, -0.129448, 0.157260, 0.104165, -0.082445, 0.091362, -0.114652, -0.124320, 0.166553, 0.006359, 0.071749, -0.098275, -0.013610, 0.071896, -0.103794, 0.064147, -0.042347, 0.151114, 0.000752, -0.123062, 0.096899, 0.069636, -0.074525, -0.186415, -0.003687, -0.117613, -0.025267, -0.185663, -0.062342, -0.018393, -0.032050, -0.129711, 0.074318, -0.128980, -0.086548, -0.070677, 0.122121, 0.051237, 0.014987, 0.083423, -0.082570, 0.050780, -0.046403, -0.062611, -0.048095, -0.083898, -0.042862, -0.100129, 0.120521, -0.066372, -0.158632, -0.121286, -0.119082, -0.123315, -0.015839, -0.010863, -0.244465, -0.122402, -0.112126, 0.046155, 0.015856, -0.068780, 0.130323, -0.231335, 0.177194, -0.149161, -0.162421, -0.013826, -0.175212, -0.044549, -0.164905, -0.041420, -0.092811, -0.114358, -0.176812, -0.082851, 0.031785, -0.032130, 0.000834, -0.092638, 0.093628, -0.375840, -0.099528, -0.188982, 0.098669, 0.007129, 0.059646, 0.092677, -0.101351, -0.070645, -0.019992, -0.288838, 0.048528, -0.007562, -0.059387, 0.182551, -0.000978, 0.015164, -0.150619, -0.079555, -0.064744, 0.093800, -0.068802, 0.001858, -0.139920, -0.042191, 0.058059, -0.077057, 0.243165, 0.107951, -0.003959, -0.057097, -0.038773, -0.188013, -0.145413, -0.016199, 0.100414, -0.013814, 0.086347, -0.052862, -0.146282, -0.230131, -0.049875, 0.189191, -0.146663, -0.000726, -0.003395, -0.029012, 0.031260, 0.160484, 0.068935, -0.025117, -0.234121, -0.188804, -0.209466, -0.047461, 0.118634, 0.036709, -0.041380, -0.188233, -0.040891, -0.166291, -0.051357, 0.032842, -0.041570, -0.100378, -0.136968, 0.197083, -0.033721, -0.161067, 0.085520, -0.026344, -0.209584, 0.030165, -0.095084, -0.021727, -0.067641, 0.138065, -0.036476, -0.028357, 0.104701, -0.024075, -0.092655, -0.114044, -0.202427, 0.178090, -0.039121, -0.221933, 0.006152]
-,        [0.094883, -0.084900, 0.076679, 0.004090, -0.080860, -0.291505, -0.164660, -0.011604, -0.015171, 0.015459, -0.007295, -0.169244, -0.092490, -0.081735, -0.028124, -0.116888, -0.143117, -0.046140, -0.153825, 0.124360, 0.137523, -0.234619, -0.033872, 0.021393, -0.016491, -0.081814, -0.005554, -0.126669, -0.050946, -0.160460, -0.234415, -0.119897, 0.035020, -0.072526, -0.038022, -0.009465, 0.025288, -0.043070, -0.218416, -0.179565, 0.093407, -0.098513, -0.146594, -0.142258, -0.144250, 0.056700, -0.414168, -0.007917, -0.013200, -0.251331, 0.103375, 0.087286, -0.126771, -0.021169, -0.095302, -0.096957, 0.122673, 0.082721, 0.161145, 0.013552, 0.063334, -0.019711, -0.094689, 0.086533, 0.200744, 0.028672, -0.148403, -0.092244, -0.101070, -0.046404, -0.167187, 0.041663, 0.053326, 0.004911, -0.135282, -0.130187, -0.086944, -0.008353, -0.043711, -0.170769, 0.006182, -0.091437, -0.201612, -0.342033, -0.036326, -0.203530, -0.087859, -0.079999, -0.209276, 0.061545, -0.009031, -0.026314, -0.101487, 0.002269, 0.092581, -0.054735, 0.041439, -0.232651, 0.165679, -0.187215, -0.075053, 0.096323, -0.204915, -0.028550, -0.039772, -0.005889, -0.100905, 0.076626, -0.155404, -0.056782, -0.081475, -0.092299, -0.116409, -0.153658, -0.127897, -0.155273, 0.009569, -0.074543, 0.123325, 0.052446, -0.069210, -0.176659, 0.110908, -0.076546, -0.216984, -0.099452, -0.028991, -0.118041, -0.232683, -0.023938, -0.034621, -0.137786, -0.249982, -0.035533, -0.136464, -0.178976, -0.054674, -0.135920, 0.033529, 0.026977, 0.068794, -0.033928, -0.037850, -0.195461, -0.291371, -0.115361, -0.071720, -0.077088, -0.172533, 0.035219, -0.240323, 0.019603, 0.011858, -0.056804, 0.090587, -0.051529, -0.066419, -0.146483, -0.039842, -0.168980, -0.001319, -0.113631, -0.076811, 0.036208, -0.046611, 0.094615, 0.032323, -0.164952, -0.275606, 0.160738, -0.190163, 0.108765, 0.011069, -0.217716, -0.164521, 0.095187, -0.143381, -0.239796, -0.058113, 0.007441, -0.023456, -0.112082, 0.049153, -0.057075, -0.153942, -0.076020, -0.047734, 0.089689, -0.037875, -0.304610, -0.029247, -0.051647, 0.066989, -0.097911, 0.059510, 0.083860, -0.005704, -0.101883, -0.334565, 0.065727, 0.090474, -0.073550, 0.091302, 0.002656, 0.083104, -0.006667, -0.196104, -0.195404, -0.208890, -0.187901, -0.136763, 0.149401, -0.100889, -0.011458, -0.276117, -0.064997, 0.025432, -0.026745, -0.132715, -0.116310, -0.110887, 0.197062, -0.011696, -0.138950, 0.081240, -0.223913, 0.166741, -0.068126, 0.160032, -0.103929, -0.163852, -0.146281, 0.054270, -0.203650, -0.187719, -0.086578, 0.050517, -0.084907, -0.090881, -0.179766, 0.034114, 0.025324, 0.069131, -0.270951, 0.180578, -0.070134, -0.089647, -0.003319, -0.165428, 0.020694, -0.258791, -0.147139, -0.037570, -0.074323, -0.172572, -0.147242]
-,        [-0.257019, -0.378402, 0.018506, -0.033368, 0.086925, -0.460773, -0.027639, 0.266474, -0.463857, -0.352940, 0.301901, -0.098471, 0.192495, -0.825438, -0.796894, -0.135576, -0.479626, 0.388232, 0.310559, -0.200282, 0.083196, -0.113204, 0.213879, 0.444270, -0.634243, 0.331541, 0.126479, 0.011876, 0.225873, -0.547154, 0.092895, -0.187047, 0.140161, 0.157183, -0.164953, -0.316162, -0.053121, 0.060827, -0.387165, -0.025005, 0.265673, -0.247338, 0.094988, 0.093049, 0.237682, 0.041210, 0.086200, -0.034465, -0.311892, -0.055585, -0.056246, 0.371823, -0.378209, -0.003201, 0.211395, -0.199408, -0.140773, -0.168755, -0.286283, -0.110677, 0.064672, 0.028350, -0.082379, -0.361460, -0.099274, -0.201748, 0.027801, -0.068770, -0.249815, 0.042324, 0.048148, -0.380384, -0.005502, -0.007533, -0.062137, -0.316415, -0.372714, -0.101083, -0.446182, -0.325157, -0.129364, -0.423401, -0.055443, -0.166064, 0.223858, -0.096473, -0.037733, -0.009633, -0.346490, 0.285457, 0.300767, 0.468643, -0.021830, -0.435915, 0.134085, -0.306958, -0.292536, 0.071878, 0.245186, -0.197440, 0.021554, 0.641076, 0.130005, 0.008703, 0.096613, 0.218942, 0.290139, -0.001617, 0.108958, 0.032075, -0.126518, -0.080953, 0.102514, 0.195563, 0.077403, 0.507059, -0.159770, 0.060082, 0.215834, -0.366173, 0.184854, -0.155438, -0.457534, 0.291901, -0.449512, -0.077487, -0.061630, -0.127194, -0.180227, -0.027165, -0.622802, 0.197619, 0.219099, 0.034801, -0.186542, 0.020071, -0.102483, 0.459506, 0.177416, -0.146092, -0.087171, -0.252475, -0.091703, -0.399760, -0.251521, 0.442142, -0.038302, -0.533738, -0.207909, 0.082779, -0.314518, -0.395215, -0.383644, -0.056970, -0.513985, -0.449022, -0.538543, 0.433731, -0.484857, 0.376757, 0.225569, -0.403120, -0.635537, -0.029005, 0.063550, -0.051300, -0.258582, -0.258115, 0.336685, -0.303801, -0.544250, -0.188796, 0.245728, -0.097900, -0.361352, 0.288137, 0.434176, 0.156782, -0.488481, -0.100404, -0.196080, 0.185522, -0.007415, -0.050442, 0.030866, -0.145428, 0.117587, -0.041583, 0.373604, 0.067206, 0.145744, -0.112333, 0.104183, -0.018293, 0.020308, -0.035458, -0.244281, -0.026793, -0.149251, 0.039573, 0.019208, -0.390003, 0.350251, -0.407775, -0.334180, -0.296864, -0.162596, -0.081201, 0.269264, -0.285329, 0.092804, -0.525950, -0.003554, 0.399815, -0.048374, 0.137964, -0.373873, -0.046610, -0.040256, 0.123498, 0.226733, -0.455998, -0.241274, 0.369157, -0.172265, -0.327379, -0.374018, -0.133638, 0.269528, -0.118172, -0.509756, -0.439463, -0.053303, -0.420731, 0.313894, -0.448653, -0.136196, -0.479232, 0.072756, -0.376704, -0.158534, 0.193664, -0.353306, 0.096339, 0.111960, -0.149120, -0.236598, -0.079625, 0.205977, -0.022403, 0.074148, -0.222632, -0.381129, -0.136186, 0.363862, 0.043201]
-,        [0.027363, 0.587979, 0.130065, 0.245798, -0.065391, 0.088170, -0.117558, -0.037034, 0.556591, -0.117789, 0.347302, -0.177438, 0.158947, -0.131921, 0.260324, -0.095797, 0.246328, 0.295720, 0.225078, -0.263881, 0.340138, -0.001490, -0.750401, -0.085555, 0.228602, -0.095523, 0.304024, -0.170790, -0.090649, 0.197745, -0.194595, 0.456867, 0.110023, 0.101711, 0.162509, 0.166877, 0.126105, -0.344814, -0.292689, 0.135464, -0.160332, 0.372539, -0.303449, -0.372408, 0.024325, -0.446071, 0.854523, 0.367107, -0.462524, -0.002948, 0.333052, -0.030159, -0.454377, 0.976534, -0.234843, -0.288778, 0.030054, 0.558081, -0.190432, -0.376755, 0.098227, 0.276830, 0.141396, 0.151353, 0.324104, 0.441849, -0.244997, -0.353049, -0.092879, 0.499903, 1.065102, -0.367223, -0.464362, 0.083030, 0.379621, -0.172031, 0.503319, 0.144341, -0.265265, -0.486131, -0.122461, 0.186217, 0.076793, 0.545155, -0.043243, 0.229936, -0.233453, 0.164991, 0.044707, -0.107214, -0.634036, 0.111771, -0.163115, 0.397394, 0.006692, 0.492232, -0.144240, 0.295670, 0.036680, 0.279212, 0.210231, -0.103259, 0.249918, -0.047759, 0.164310, -0.026534, 0.153671, 0.751014, 0.149220, -0.116300, -0.287013, -0.369466, 0.359249, 0.471781, -0.259872, 0.215375, 0.185940, -0.549390, 0.037132, -0.028520, -0.750587, -0.212111, -0.482196, 0.246929, -0.325575, 0.093762, 0.310311, -0.221792, -0.587679, 0.193300, -0.459344, -0.064515, 0.124172, -0.026365, 0.292310, -0.561284, 0.604502, -0.058674, 0.337828, -0.170861, -0.118461, -0.261118, -0.257521, -0.207288, 0.270599, -0.091656, -0.295044, 0.249365, -0.406857, 0.400294, -0.070799, -0.261541, -0.644659, -0.324057, -0.405682, -0.416221, -0.093544, -0.100442, -0.217937, -0.386641, -0.011909, -0.460077, 0.130350, 0.212719, 0.082459, -0.142304, 0.172930, -0.112907, -0.079815, -0.370394, 0.076661, 0.130610, -0.175816, -0.355415, -0.027899, -0.408754, 0.402738, -0.193362, -0.209023, -0.028211, -0.021698, -0.336347, 0.166171, 0.262371, 0.491619, 0.095693, -0.346547, -0.029075, 0.336205, 0.175601, -0.541084, 0.051943, 0.153421, 0.126212, 0.053459, -0.051887, 0.347328, -0.409933, -0.282151, -0.270028, 0.029715, 0.014328, -0.539863, 0.167583, -0.362285, -0.421985, 0.053534, -0.126512, -0.598637, -0.311417, 0.247853, -0.156787, -0.085120, -0.100902, -0.138006, 0.197186, 0.119787, 0.232353, 0.792555, 0.228777, -0.239945, -0.101054, -0.314640, -0.265762, 0.522096, 0.042400, -0.870200, -0.154362, -0.372768, -0.146007, 0.270135, -0.134539, -0.013083, -0.298291, 0.024934, -0.008359, 0.244486, 0.243066, 0.096934, -0.313666, -0.176084, -0.027572, -0.121767, -0.593582, 0.151261, 0.021080, -0.165397, 1.192065, 0.122488, -0.107302, -0.235658, -0.427821, -0.049732, -0.107098, -0.051815, 0.063812]
-,        [0.280446, 0.362517, -0.284262, 0.258003, -0.041261, 0.794637, -0.073178, 0.657018, -0.019785, 0.103888, 0.314286, -2.957350, -0.129310, 0.287425, -0.085282, 0.708673, 0.102023, 0.243994, 0.217123, 0.063304, -0.184189, -0.133362, -0.199031, 0.028118, 0.429681, -0.019232, 0.297992, -0.258147, 0.026376, 0.113864, -0.095800, 0.254796, -0.069316, -0.024852, 0.407583, 0.117479, 0.082685, 0.103024, 0.011077, 0.074657, -0.016236, -0.128261, 0.486134, 0.078630, 0.010401, 0.207135, 0.037200, -0.013907, 2.073232, 0.147580, 1.586662, 0.300326, -0.536693, 0.141198, -0.023709, -0.528968, 0.747218, 0.610345, -0.038800, 0.150312, 0.328904, -0.000160, -0.077192, -0.071584, -0.140116, -0.067762, -0.099200, 0.280232, 0.046891, 0.349740, -0.235333, -0.458461, 1.416840, 0.197671, 0.167150, -0.005094, 0.136341, -0.040986, 0.076081, -0.064044, -0.232461, 0.049415, -0.021672, -0.009529, -0.065441, 0.137498, 0.270960, 0.077913, 0.168731, 0.403453, 0.181270, 0.324920, 0.182246, 0.463601, -0.057982, 0.164085, -0.242428, 0.053507, 0.136671, -0.088904, 0.049483, -0.027419, 0.504354, -0.069694, 0.825615, -0.087701, -0.113070, 0.093732, 0.163913, -0.008207, 0.469569, 0.086329, 0.001924, 0.012081, 1.816444, 0.354198, -0.118851, -0.290517, 0.842752, 0.076539, 0.037525, 0.625486, -0.014290, -0.047615, 0.009772, 0.015673, -0.068433, 0.012908, 0.791997, 0.325590, 0.257171, 0.207982, 0.038826, -0.180853, 0.171292, 0.040065, -0.245538, -0.042414, -0.031187, -0.025518, -0.055559, 0.080850, 0.042810, 0.593360, 0.011365, 0.184230, 0.311280, -0.138663, -0.245005, -0.024041, 0.145946, 1.910162, -0.074105, 0.061743, -0.001328, 0.329188, 0.260701, 0.427586, 0.225084, 0.185901, 0.216862, 0.064917, 0.337633, -0.083781, 0.107410, 0.373050, 0.291929, -0.596661, 0.632835, 0.225590, 1.028802, -0.025795, -0.022747, 0.022993, 2.013178, -0.139521, 0.376085, -0.064875, 0.935658, -0.018005, -0.255977, -0.116910, 0.003519, -0.182829, -0.022453, 0.174591, 0.096254, 0.311627, -0.090798, 0.429891, -0.086555, 0.228852, 0.502065, 0.089488, -0.031525, 0.314416, 0.039910, 0.173236, 0.782598, -0.000623, -0.017315, -0.043388, -0.112438, 0.234913, -0.137804, -0.009509, 0.060644, -0.016808, -0.171425, 0.404379, 0.240751, -0.098655, 0.004113, -0.060556, 0.197791, -0.179082, -0.160025, -0.040294, 0.185938, 0.088276, 0.151396, 0.052183, -0.350084, -0.037000, 1.717224, -0.142545, 1.448259, 0.006816, -0.153946, -0.007865, 0.036419, 0.071303, -0.102254, -0.152197, 0.178603, -0.226508, 0.172317, 0.265892, -0.023433, -0.636756, -0.018850, 0.092078, -0.058347, 0.304507, 0.358625, -0.381471, 1.720834, 0.066592, 0.253802, -0.123857, -0.066525, 0.087705, 0.038323, 0.012320, -0.015701, 0.035505]
-,        [-0.572680, -0.951447, 0.172748, -0.048959, -0.052293, 0.174610, 0.032122, -0.041682, 0.319375, -0.984376, -2.753484, -0.818964, -0.337615, 0.329957, -0.072198, -0.421931, -0.114940, -0.463451, -0.822364, 0.128617, -0.151685, -0.300004, 0.596707, -0.021275, 0.036495, 0.357083, 0.348722, 0.051008, 0.355688, 0.272542, 0.236014, 0.235312, -0.625689, 0.149553, 0.134283, 0.239901, -0.167530, -0.466319, -0.221288, 0.607724, -0.141043, -0.635471, 0.969940, -0.051977, -0.025437, 0.352847, -0.125045, -0.209846, -0.055788, -0.451880, -0.188171, -0.595067, -0.382715, 0.391923, 0.724135, -0.210798, 0.754991, -0.266918, -0.197964, 0.039608, -0.028779, 0.498100, 0.018043, -0.794418, 0.472856, -0.110294, 0.608629, -0.100266, 0.252803, 0.370591, -0.155496, -0.462660, 0.201459, -0.144747, -0.087503, -0.233831, 0.197475, -0.350949, 0.169601, -0.365587, 0.006650, 0.213671, 0.103945, 0.179851, -0.955650, 0.211387, -0.119113, 0.086025, -0.263926, -0.485935, -0.093985, 0.489604, 0.360979, -0.225058, 0.172744, -0.429641, -0.468946, -0.391156, -0.678002, 1.072278, 0.059174, -0.283534, -0.410690, -0.037802, -2.295399, 0.245355, -0.071863, 0.178734, -0.369832, -0.854729, -0.237018, -0.375471, -0.110354, -0.406737, -2.834449, -0.467826, 0.111672, -0.185786, 0.206126, -0.532129, -0.408013, -0.591893, 0.297608, -0.657974, -0.100232, 0.288270, 0.004122, 0.034523, -0.233686, 0.242254, -1.002935, -0.309216, -0.282352, -0.285148, 0.406582, -0.444011, 0.135381, -0.328493, 0.264179, -0.198686, -0.030977, -0.316481, -0.126464, 0.162302, 0.152305, 0.200858, 0.595619, -0.143785, -0.155515, -0.649397, 0.076237, -6.325493, 0.321491, -0.487424, -0.308732, -0.523036, -0.260931, 0.184772, 0.788049, -0.135784, 0.363244, -0.548579, 0.027065, 0.505199, -0.053061, 0.807967, 0.055053, -0.311164, 0.579209, 0.770463, -2.054801, -0.299308, -1.036552, 0.255606, 0.362068, 0.481841, 0.349639, -0.069521, 0.146385, 0.033656, 0.448329, -0.171899, 0.047655, 0.343783, -0.110275, -0.151287, -0.000778, -0.053141, 0.044559, -0.167751, -0.205533, 0.352867, -0.288482, 0.044482, -0.303466, -0.229535, 0.188543, -0.132798, -2.076106, -0.123956, -0.005917, -0.193320, -0.327314, -0.033383, -0.004753, -0.821668, 0.375425, 0.237179, 0.573654, -0.030122, -1.015911, -0.230018, 0.277203, 0.198049, -0.527202, 0.036667, -0.648266, -0.270647, 0.147319, -0.297665, 0.320534, 0.241940, 0.027030, -0.107576, -2.346229, 0.201846, -1.030716, -0.116329, 0.166239, 0.162780, 0.141392, -0.168153, -0.086262, -0.091421, 0.832730, -0.626469, -0.377559, -0.017075, 0.591601, -0.413106, 0.000936, -0.010624, -0.137746, -0.378398, 0.056157, -0.283031, -3.334220, -0.003206, -1.851324, 0.079560, -0.323473, -0.355026, 0.319768, 0.725586, -0.162476, -0.229389]
-,        [0.159379, -0.259410, 0.047460, 0.241636, -0.076290, 0.034522, -0.269519, -0.086078, -0.400739, -0.378575, 0.316346, -0.198187, -0.176705, -0.005906, 0.055225, -0.437865, -0.000305, -0.075149, 0.179951, 0.158947, 0.083540, -0.052007, 0.323272, 0.082285, -0.140724, 0.028586, -0.657112, 0.039794, 0.464710, -0.175025, -0.016281, -0.012779, 0.122386, -0.047942, 0.105744, -0.058402, -0.020810, -0.280161, 0.161518, 0.284274, 0.026299, -0.174215, -0.097105, 0.063732, 0.315155, 0.209467, 0.279089, 0.215308, -0.210808, -0.224036, -0.496610, 0.017019, -0.217233, -0.318330, 0.199377, -0.483002, 0.146992, -0.077422, -0.005633, -0.115820, -0.508551, 0.279572, -0.035259, -0.157656, 0.025105, 0.061654, 0.270511, -0.020401, 0.125990, 0.315959, 0.138071, -0.362962, -0.280249, -0.251982, -0.278122, -0.251400, -0.222225, 0.003797, 0.143980, 0.185130, -0.078610, -0.387881, 0.017946, -0.186218, 0.160005, -0.104886, 0.241455, 0.066179, 0.168564, 0.007501, 0.138857, 0.281483, -0.483466, -0.150969, -0.081086, -0.078802, -0.033644, -0.184364, -0.206265, -0.112131, 0.269146, 0.196908, -0.060539, 0.132148, -0.174321, 0.501842, 0.381159, -0.141743, -0.551159, 0.450726, 0.071987, -0.079221, -0.418844, -0.029391, -0.244810, -0.278400, -0.337894, -0.371091, 0.012152, -0.036694, -0.167719, 0.378314, -0.411808, 0.206228, 0.163038, 0.226424, -0.565505, -0.083364, -0.033653, -0.108047, 0.025182, 0.342904, -0.541980, -0.136851, -0.296028, 0.076070, -0.407778, -0.117656, -0.184791, -0.023890, -0.298085, 0.057709, -0.686972, -0.213876, -0.006509, 0.033756, -0.455686, 0.041161, -0.100342, 0.699221, -0.460454, 0.059689, -0.020292, -0.318354, -0.212668, -0.140621, -0.216542, 0.488326, -0.044687, 0.164061, 0.067456, 0.303584, -0.251077, 0.222853, 0.096899, 0.357727, -0.601396, -0.537379, -0.309170, -0.139565, -0.430259, 0.246330, 0.399565, -0.304903, -0.208759, -0.213083, -0.017093, 0.059677, -0.215377, -0.032145, 0.058980, 0.189123, -0.043748, 0.035416, -0.300994, 0.097551, 0.219271, 0.387607, -0.032275, 0.015271, 0.300199, 0.064801, 0.023638, -0.103148, -0.461696, -0.069626, 0.203442, 0.151535, -0.221872, -0.210113, 0.263603, -0.329702, -0.048920, 0.236996, -0.087841, 0.067790, 0.076962, -0.568797, -0.243254, -0.216952, -0.253235, -0.092101, -0.134914, 0.044657, -0.375751, 0.058392, -0.184237, 0.057494, -0.055092, 0.306055, -0.199336, 0.129549, -0.367444, 0.260732, -0.153173, 0.236088, -0.356721, 0.099814, -0.420487, -0.222397, -0.086164, -0.043288, -0.178953, -0.058193, -0.121543, -0.239201, 0.400346, -0.097697, -0.015955, -0.395755, 0.136626, -0.007723, 0.243519, -0.058466, -0.276145, -0.203069, -0.167890, -0.326446, -0.254795, -0.281763, 0.182772, -0.223531, 0.154646, -0.209091, -0.373248, 0.300696]
-,        [0.087529, -0.026351, -0.004420, 0.170635, 0.193002, -0.358658, 0.155106, -0.207267, -0.109834, -0.315941, 0.086870, -0.230787, 0.134211, 0.295332, 0.065689, -0.195761, -0.104011, 0.136535, 0.434206, -0.363277, -0.095986, 0.080661, -0.260597, -0.140840, -0.086771, -0.168468, -0.219034, 0.090235, 0.182988, -0.306021, -0.258832, 0.130646, 0.142758, 0.061138, 0.127325, -0.116397, 0.075190, -0.482593, -0.074995, -0.543021, -0.088907, -0.434446, 0.470752, 0.193871, -0.113485, -0.536690, -0.303651, 0.195050, -0.693218, -0.157591, -0.006399, 0.171785, -0.144306, 0.066817, 0.106938, 0.004584, -0.409272, 0.459880, 0.072795, -0.369501, -0.324119, 0.017849, -0.238945, 0.213982, -0.012874, 0.003813, -0.214770, -0.132141, 0.013017, -0.194680, -0.038856, -0.169457, -0.155373, 0.200747, 0.013549, -0.396756, -0.144648, -0.252748, -0.174220, -0.101418, -0.336428, -0.050891, -0.183402, -0.014861, -0.025051, -0.357423, -0.105351, -0.125432, -0.059636, 0.029822, -0.040526, 0.277151, -0.490534, -0.031287, 0.033166, 0.058679, 0.046379, -0.183765, 0.112802, 0.204613, -0.337981, -0.249406, 0.097175, -0.284078, -0.380390, -0.045685, -0.026391, 0.160156, -0.234386, 0.270606, -0.006431, -0.138590, 0.240289, -0.232871, -0.177040, -0.464633, -0.269890, -0.051788, 0.422636, -0.346787, -0.128361, -0.165350, -0.170511, 0.596567, -0.109034, -0.123964, 0.001717, -0.040151, -0.407738, 0.105310, -0.193868, -0.248033, -0.221635, -0.249862, 0.174835, 0.106402, -0.635894, -0.198665, -0.093419, -0.264589, -0.118200, 0.249631, -0.508975, -0.589584, 0.243932, 0.041639, -0.197700, -0.012693, -0.099848, -0.156642, 0.083769, 0.006739, 0.171107, 0.043657, -0.103889, -0.341295, -0.098480, -0.098518, 0.214807, -0.036199, -0.095349, 0.105131, -0.346266, -0.020128, -0.105527, 0.057853, -0.068977, 0.162537, -0.000812, 0.152601, 0.043946, -0.157712, -0.031715, 0.472501, -0.457083, 0.154503, -0.370176, 0.461510, -0.313682, -0.696057, 0.220429, 0.120237, -0.431031, 0.177850, 0.314113, -0.215219, -0.401750, -0.200652, 0.053497, -0.090301, -0.372598, -0.230680, 0.341837, 0.118348, -0.282498, -0.267321, -0.272773, 0.119237, -0.011091, -0.116866, -0.156353, -0.288065, -0.007866, -0.228033, 0.042683, -0.146421, 0.117269, 0.103249, -0.354980, 0.248466, 0.138195, 0.300689, 0.008503, 0.449040, -0.490099, 0.190289, -0.044918, -0.138558, 0.054203, -0.591123, -0.147426, -0.323438, -0.209005, 0.064610, 0.201708, 0.209664, -0.535366, 0.278640, 0.236852, 0.242874, -0.106918, -0.342861, 0.004138, -0.281905, -0.216653, -0.418143, 0.070260, 0.152045, -0.058420, -0.358856, -0.221421, -0.024360, 0.277485, 0.183100, -0.358549, -0.210443, -0.088819, 0.047303, 0.188983, 0.066597, -0.555266, -0.014478, -0.427304, -0.705303, 0.532456, 0.039004]
-,        [-0.285636, 0.237068, 0.251749, 0.265121, -0.239681, 0.176118, -0.008776, -0.210085, 0.277868, -0.263902, -0.505148, -0.447369, 0.088307, -0.260323, -0.107756, -0.384651, -0.044051, 0.389526, 0.248646, 0.229244, -0.114133, 0.038218, -0.316254, -0.023033, -0.330966, -0.260200, -0.324525, 0.144441, 0.138881, -0.233126, -0.065264, 0.215249, -0.078651, -0.433452, -0.020995, 0.087151, -0.252590, -0.374022, -0.106454, -0.078954, 0.177316, -0.158795, -0.387387, 0.053443, 0.047635, 0.331188, 0.141553, 0.045753, -0.227478, -0.136984, -0.023427, 0.067335, -0.412271, -0.043764, 0.069859, -0.410716, -0.470218, 0.189284, -0.008373, -0.089172, -0.129757, 0.141498, -0.082224, -0.428205, 0.057853, -0.307272, -0.180716, -0.370858, 0.139550, -0.011454, 0.290000, -0.455801, -0.088907, -0.512061, -0.171089, -0.230512, -0.163391, -0.335148, 0.172868, -0.290651, -0.263665, -0.220230, -0.001344, 0.115440, 0.159544, -0.009305, 0.172550, 0.072088, -0.075092, 0.004511, -0.243039, -0.006707, -0.197347, 0.029856, 0.288113, 0.011251, -0.173751, 0.006698, 0.058644, -0.245527, -0.275047, 0.189745, -0.067331, 0.043507, -0.036972, 0.079804, 0.160000, -0.091089, 0.042613, -0.192715, -0.294327, 0.107458, 0.150567, 0.072026, -0.263253, -0.252334, -0.288886, 0.190242, -0.236354, 0.004202, -0.230216, 0.173029, -0.088956, -0.006890, 0.038860, 0.181648, 0.283449, 0.003443, -0.043165, -0.192170, -0.132270, 0.062741, -0.072962, 0.337830, 0.139098, 0.007018, 0.081789, -0.348196, 0.108250, 0.091382, -0.020404, -0.244954, -0.185852, 0.100787, 0.054659, 0.022112, 0.009162, -0.092566, -0.268665, -0.026267, -0.055062, -0.787472, -0.197133, -0.269774, -0.274204, -0.235803, -0.289365, -0.318985, -0.234047, 0.221464, 0.098800, -0.251924, 0.061496, 0.188950, 0.079461, 0.123932, -0.086599, 0.203210, 0.220061, -0.193508, -0.332948, 0.096265, -0.091807, -0.332975, 0.067579, -0.261650, -0.277485, -0.154858, -0.136151, -0.489450, 0.433053, -0.119128, 0.200258, -0.249850, -0.125851, -0.140798, -0.116961, -0.311380, -0.068916, -0.204334, -0.374066, -0.073961, -0.100362, -0.004731, 0.158567, 0.077876, 0.327020, -0.183662, -0.434874, 0.084640, 0.120115, -0.068090, 0.102368, 0.170569, 0.063296, -0.183622, -0.345901, 0.151728, -0.179759, -0.119969, 0.129410, -0.180053, -0.000920, 0.213079, -0.431433, -0.383494, -0.142517, 0.219226, -0.164853, -0.079624, -0.072408, -0.109532, -0.046604, 0.019803, -0.114979, 0.086197, 0.054814, -0.100300, -0.102474, -0.054676, 0.132712, -0.431929, 0.009629, -0.161249, 0.095356, -0.108594, -0.207143, -0.479284, 0.042936, -0.206369, -0.063526, 0.312886, -0.415244, -0.270079, -0.063010, -0.024085, -0.713902, -0.174593, 0.042210, 0.278720, 0.115611, -0.272608, -0.457660, 0.032224, 0.167130, 0.270821]
-,        [0.009799, -0.123026, 0.059929, 0.209892, -0.196698, -0.568654, -0.236907, 0.026179, -0.001154, 0.283764, 0.194842, -0.143556, -0.306888, 0.225943, 0.479077, -0.269200, 0.009565, -0.271165, -0.215514, 0.146421, 0.310396, 0.155608, -0.771435, 0.307794, 0.072640, 0.181114, -0.556473, -0.403141, 0.152270, 0.683695, 0.252143, -0.438370, -0.029017, 0.385288, -0.056145, 0.051423, 0.234703, -0.144601, -0.041867, 0.005057, -0.387030, 0.246293, -0.500890, -0.046143, -0.086802, 0.154222, 0.169996, -0.212609, -0.060564, -0.116486, -0.406332, -0.093484, -0.396799, 0.584288, -0.454871, -0.521806, 0.403288, 0.120596, 0.067351, -0.353614, 0.054036, 0.189888, -0.128355, -0.101739, 0.076617, -0.018905, -0.233594, 0.012588, 0.205589, -0.075220, 0.391371, -0.371915, -0.143082, 0.422469, -0.239561, -0.179618, 0.356376, 0.027879, 0.180314, 0.040981, -0.194038, 0.015428, -0.077231, 0.227887, 0.184097, -0.254254, 0.663183, -0.116821, 0.120594, -0.032796, 0.265950, -0.356682, -0.177609, 0.084553, 0.299084, 0.093169, -0.118093, 0.425591, -0.259144, -0.075194, 0.291477, 0.479272, 0.125408, -0.135644, -0.271857, -0.013571, -0.096170, 0.156101, -0.200470, 0.244839, 0.108254, -0.198146, -0.090299, 0.492012, -0.114661, -0.150756, 0.077789, -0.363738, 0.073731, -0.131917, -0.166969, -0.089828, 0.325854, 0.125859, 0.077815, -0.361246, 0.032554, -0.198939, -0.715588, -0.184596, -0.354171, -0.247426, 0.135137, -0.396419, -0.241928, 0.090027, -0.052794, -0.060523, -0.101576, -0.549613, 0.164392, -0.120566, 0.333416, -0.129948, -0.224330, -0.528526, -0.002904, -0.001693, -0.421113, -0.153574, -0.638130, -0.023133, 0.119150, 0.129384, -0.136822, 0.269672, 0.324494, -0.218041, 0.084618, -0.422070, -0.084031, 0.251743, -0.934388, -0.010898, -0.615406, 0.167571, -0.038018, -0.513001, 0.024767, -0.134791, 0.042833, -0.159277, 0.252631, -0.040978, -0.413013, -0.135394, 0.140037, -0.282970, -0.379658, -0.202882, -0.030680, 0.102864, 0.084390, 0.180138, 0.081985, 0.064299, -0.356289, -0.531795, 0.011027, -0.156891, -0.340409, -0.037528, -0.062954, -0.337881, -0.172127, -0.052497, -0.305255, 0.071789, -0.292552, -0.046851, 0.084998, -0.072634, 0.177596, 0.133709, -0.100884, -0.123955, -0.113909, -0.339010, -0.113029, 0.418386, 0.031638, -0.037571, -0.003654, -0.247177, -0.214552, 0.161685, -0.302591, -0.282703, 0.592982, 0.218967, 0.084745, -0.093328, 0.083368, -0.007478, -0.065113, -0.107317, -0.470878, 0.065406, 0.339303, 0.325672, -0.104902, -0.141649, 0.023336, 0.283753, 0.126601, 0.156149, 0.204030, -0.278765, -0.098841, -0.446497, -0.037857, 0.011187, -0.270901, 0.034442, -0.464527, 0.091273, 0.065852, 0.080820, 0.140768, -0.054270, -0.277446, -0.075214, -0.310411, 0.035250, -0.066245, 0.281673]
-,        [0.059780, 0.006474, 0.311999, 0.437291, 0.152879, -0.000020, 0.063044, -0.117598, -0.240025, 0.374039, 0.182232, -1.385053, 0.441345, 0.098834, 0.885791, 0.483844, 0.731381, 0.699002, 0.273749, 0.953689, 0.275797, -0.127988, -0.110239, 0.425925, -0.012273, -0.172851, -0.020808, 0.760600, 0.344023, -0.090308, 0.495250, -0.502969, 0.883142, 0.024101, -0.311687, 0.402241, 0.386374, -0.316975, 0.689320, -0.523689, 0.087889, -0.349401, -0.074060, 0.351599, 0.818781, -0.056253, 0.521011, 0.627301, -0.466117, -0.110587, 0.066748, 0.789970, -0.251188, 0.508605, 0.779831, -0.086391, -0.292375, -0.367263, 0.270661, 0.018494, 0.619387, -0.160019, 0.292248, 0.555526, -0.156779, 0.024132, 0.731543, -0.470734, 0.169330, 0.699135, -0.162127, -0.168145, -2.799478, 0.904599, 0.916090, 0.551982, -0.382494, 0.347219, 0.254151, -0.203594, -0.014720, -0.171173, -0.289373, 0.163552, 0.380619, -0.128940, 0.100999, 0.370639, 0.192333, -0.002798, -0.785441, 0.571884, 0.646481, 0.191265, -0.026032, 0.682936, 0.498938, 0.445120, 0.008118, -0.722660, 0.583412, 0.692591, 0.464182, 0.653671, -1.937980, 0.861920, 0.694075, 0.515686, 0.490896, 0.520158, 0.406339, 0.458527, -0.110711, 1.003699, -0.689091, 0.262196, 0.635300, 0.055922, 0.420582, -0.090252, -0.003081, -0.331173, 0.008014, 0.903007, 0.579746, 0.309626, 0.345733, -0.109471, 1.064112, -0.053174, 0.631099, -0.423113, 0.473438, 0.059652, -0.023569, 0.082464, 0.252114, -0.912587, 0.707726, 1.150462, -0.017799, 0.769371, -0.370803, -0.412023, 0.450881, 0.798540, -0.048992, 1.073949, -0.215384, 0.919615, 0.358643, -0.923757, 1.052411, -0.180550, 0.295301, 0.169218, -0.049518, 0.133927, 0.248578, -0.136293, 0.513384, -0.550515, -0.357507, -0.008914, -0.026133, 0.272605, 0.276658, -1.408684, -0.325784, -0.261711, -0.784177, 0.896110, 0.149838, 0.352660, -0.073644, -0.132077, 1.399834, -0.127732, 0.530128, 0.866437, -0.114193, 0.705835, 0.196322, 0.177258, 0.576688, 0.333791, -0.176699, 0.286572, -0.089999, 0.169264, -0.230842, -0.455836, 0.160709, 0.204309, -0.210308, 0.396537, -0.376362, 0.490137, 0.302587, -0.235606, 0.139979, 0.566609, 0.223658, 0.842448, -0.390011, 0.580658, 0.157005, 0.245659, 1.181661, 0.023770, 0.181353, 0.470044, 0.115287, 0.392450, 0.318417, 0.411700, 0.388773, 0.300240, 0.786704, 0.430433, 0.012317, 0.616333, 0.210612, -0.778908, -2.986458, 0.244509, 1.213349, 0.139804, 0.759621, 0.285531, 0.642190, 0.235411, 0.037975, 0.031509, -0.065181, 0.076407, 0.992559, 0.136251, 1.349258, -0.112085, 0.069962, -0.314572, 0.650960, 0.169333, -0.172168, 0.242645, -0.715004, 0.708817, -1.498829, 0.474400, 0.053788, -0.215870, -0.144050, 0.333089, 0.492155, -0.125890]
-,        [-0.178282, -0.135975, -0.212754, 0.156852, -0.033802, -0.196988, 0.161271, 0.008323, -0.097279, 0.210215, 0.364270, -0.124676, -0.002157, -0.066155, 0.204564, -0.170374, 0.085444, -0.173212, -0.054665, -0.272667, -0.102034, 0.316496, 0.079294, -0.048774, 0.161196, 0.133045, 0.322504, -0.099287, -0.101361, -0.055693, 0.020447, 0.015188, 0.102996, 0.030490, -0.138339, -0.027070, 0.275829, -0.197195, -0.481915, 0.000054, -0.102030, -0.126508, 0.082236, -0.449033, 0.178253, -0.092694, 0.238742, -0.459410, -0.157722, -0.310569, -0.045490, 0.030115, -0.301937, 0.032025, -0.079141, -0.233135, -0.386046, 0.440752, -0.282601, -0.091128, -0.279180, -0.132748, -0.181086, 0.230510, 0.079862, 0.022093, -0.093364, -0.056570, 0.096454, 0.209544, -0.590513, -0.267474, -0.135746, 0.170073, 0.078849, 0.214673, -0.153914, 0.068847, -0.254691, -0.219983, 0.091807, -0.214205, -0.449881, 0.163700, 0.112212, 0.111073, -0.144709, -0.006604, -0.242662, -0.204941, -0.221272, -0.378833, -0.315980, 0.142645, -0.180198, 0.120641, -0.405074, 0.195897, -0.105106, 0.370979, 0.097990, 0.026001, -0.012827, 0.103660, -0.036760, 0.435093, 0.069921, 0.040706, -0.028389, -0.372779, 0.132338, 0.175803, 0.331566, 0.387370, -0.199987, -0.004662, -0.045551, 0.035344, -0.192603, 0.132387, 0.043505, -0.261533, -0.167797, -0.113498, -0.138786, 0.030830, -0.297277, 0.003884, -0.303972, 0.252039, -0.230796, 0.057540, 0.336330, 0.197626, -0.156529, -0.006939, -0.188990, -0.349626, -0.097707, -0.049181, -0.263065, -0.043672, 0.211240, -0.185860, 0.184176, 0.093993, -0.302733, 0.146783, -0.214074, 0.076291, 0.017199, -0.185904, -0.440356, -0.218940, -0.101046, -0.058978, 0.240164, -0.172920, -0.407051, -0.010756, -0.048408, -0.124983, 0.010944, -0.228959, 0.095940, 0.141837, -0.012992, -0.000843, 0.092118, 0.039168, 0.063680, -0.266287, -0.067628, -0.163988, -0.740583, 0.035368, -0.147458, -0.351528, -0.552386, -0.440267, 0.013997, -0.015195, 0.009333, -0.268287, 0.279004, 0.176228, -0.337366, -0.204497, 0.149298, -0.300454, -0.073591, 0.188924, 0.075136, -0.054747, -0.295527, 0.034596, -0.155626, -0.016550, -0.342426, 0.057997, -0.205396, -0.392552, -0.077839, -0.250504, -0.034606, -0.097211, -0.157455, 0.164426, -0.101475, 0.331852, 0.221066, -0.089768, 0.021989, -0.173924, 0.104330, -0.154106, -0.160333, 0.047017, 0.269166, 0.169236, -0.135212, -0.087301, -0.159414, 0.036353, 0.046653, -0.175870, -0.504269, 0.134876, 0.076347, -0.266023, -0.268161, -0.214809, -0.006652, -0.107573, 0.035544, -0.098830, 0.179289, -0.243898, 0.220068, -0.256340, -0.027830, 0.031537, 0.190002, -0.043413, -0.442679, -0.106084, -0.192765, -0.006898, 0.447292, 0.392173, -0.051697, -0.096973, -0.385179, -0.186001, -0.171702, 0.207244]
-,        [0.297528, 0.122549, 0.016059, 0.055647, 0.179761, -0.038918, -0.186001, 0.023709, -0.055352, 0.048373, -0.159036, -0.233104, -0.336096, 0.013623, -0.094783, -0.325449, -0.447777, -0.086307, -0.011309, -0.113582, -0.159891, -0.139455, -0.381667, 0.205020, -0.154378, 0.006106, 0.072015, -0.406512, 0.067287, -0.283272, -0.397096, 0.302924, -0.376697, -0.202909, -0.351903, -0.142623, -0.248137, 0.104085, -0.012253, -0.032860, 0.105210, -0.096171, 0.256686, -0.203675, -0.321876, 0.179013, 0.216168, -0.172543, -0.066937, 0.142116, 0.162829, -0.209021, -0.319149, -0.133195, 0.044267, -0.367265, -0.224802, -0.092384, -0.382551, -0.057703, -0.492342, -0.003115, 0.004098, -0.165390, -0.367973, 0.071951, 0.143533, 0.101471, 0.055144, 0.047324, -0.066720, -0.260064, 0.322113, 0.018588, 0.136884, -0.050745, 0.085320, 0.077564, -0.031006, -0.095041, 0.210316, -0.017810, -0.476770, -0.052057, -0.079312, -0.225371, -0.330129, -0.153431, -0.206937, -0.022176, 0.154586, -0.123585, -0.347010, 0.116765, -0.034500, -0.397035, -0.150423, 0.103317, -0.086115, 0.013082, 0.345457, 0.173672, 0.045000, 0.004146, -0.151409, -0.024861, -0.237565, -0.071424, -0.084414, 0.098140, 0.099107, 0.170862, -0.058092, -0.193932, -0.449123, -0.130227, 0.385095, -0.295348, 0.275017, -0.055000, -0.061165, -0.005898, -0.085398, -0.247826, -0.213906, -0.073171, 0.022939, -0.146184, -0.253065, 0.336143, -0.322012, -0.194680, 0.161125, -0.151598, 0.367408, 0.171315, 0.044543, 0.060445, -0.216036, -0.104127, 0.095163, -0.171819, -0.158290, -0.251397, -0.264359, -0.132853, -0.245284, 0.221556, -0.184215, -0.218118, -0.143160, -0.578988, -0.121982, -0.134148, -0.067607, -0.021951, -0.056118, -0.569517, -0.010646, 0.056124, -0.011049, -0.038243, 0.312095, -0.087786, -0.167138, -0.295318, -0.184054, -0.116678, -0.165609, -0.274492, -0.541907, -0.114601, -0.197181, -0.044583, 0.147983, -0.194584, -0.286353, -0.013865, 0.080748, -0.229346, -0.183036, -0.148263, -0.378065, -0.016905, 0.060496, -0.127978, -0.044397, 0.402719, 0.140651, 0.005812, 0.115128, -0.060631, -0.156995, -0.307462, 0.084973, 0.121910, -0.096783, -0.014170, -0.354969, -0.166337, -0.013646, 0.026677, -0.029105, -0.005863, 0.003457, 0.155726, 0.124031, -0.008716, 0.046069, 0.015851, -0.111860, 0.259056, -0.028493, -0.292393, 0.092799, -0.477503, -0.049025, 0.196693, 0.350062, -0.031505, 0.135879, 0.120724, -0.123893, 0.153559, -0.019630, 0.086691, -0.531211, 0.129956, -0.176561, 0.079651, -0.232187, -0.037957, 0.026438, 0.038317, 0.185384, -0.166092, 0.243805, -0.070849, 0.323826, -0.132545, -0.047724, 0.034376, -0.285550, -0.041895, -0.248786, -0.290564, -0.255127, -0.085298, -0.031404, -0.397039, -0.262324, -0.346421, -0.186287, 0.059446, -0.152684, -0.210619]
-,        [0.325923, -0.537954, 0.001238, 0.556254, -0.408655, -0.197215, 0.058121, -0.192269, -0.237426, -0.331201, -0.118613, 0.049562, -0.234738, -0.295498, 0.152616, -0.248390, -0.527171, 0.157345, 0.097594, -0.082582, 0.213331, 0.125898, -0.210477, -0.061918, -0.359410, -0.069925, -0.008484, 0.105118, -0.537042, 0.354601, -0.396339, -0.195309, 0.130510, 0.185087, -0.357589, -0.065030, 0.195815, 0.020676, -0.511685, -0.227677, -0.378123, -0.062307, 0.176750, -0.117528, -0.600039, -0.420456, -0.126174, 0.223973, -0.617041, -0.217579, -0.156668, 0.029861, -0.472577, -0.194060, -0.060065, 0.099865, -0.237349, 0.537610, -0.001482, 0.075590, -0.178083, -0.303292, -0.122200, 0.076417, -0.042556, 0.492102, 0.078749, -0.159724, 0.268715, -0.098168, 0.152953, -0.223805, -0.171955, 0.058945, -0.454762, -0.225376, 0.011570, -0.469673, -0.105951, 0.003694, 0.164144, 0.103628, -0.268525, -0.000563, 0.308294, 0.120875, 0.386132, 0.014454, -0.264974, -0.609921, -0.243112, 0.212250, 0.165459, -0.133635, 0.024689, -0.242017, -0.006160, -0.080526, -0.285840, -0.026518, -0.145366, -0.175613, -0.342970, 0.530605, 0.004626, 0.055710, -0.076626, -0.037515, -0.289981, -0.095290, -0.071199, -0.644251, -0.083999, 0.352859, -0.335175, 0.265454, -0.514824, 0.068616, -0.408943, -0.303899, 0.125438, -0.183772, 0.117590, -0.106750, -0.157347, -0.302072, -0.154582, 0.097043, -0.249394, 0.000246, -0.381974, -0.210902, 0.277990, 0.033723, -0.505385, 0.469008, 0.547934, -0.076266, 0.200063, -0.346085, -0.226880, -0.008915, -0.054294, -0.105316, -0.221637, 0.119090, 0.210781, -0.637925, -0.435602, 0.491361, -0.436058, -0.028491, -0.661189, -0.970781, 0.292682, -0.013842, -0.160529, -0.526047, -0.105136, 0.164246, -0.147473, -0.358203, -0.152112, 0.279379, 0.474194, 0.438174, -0.517186, -0.745995, 0.296558, -0.052359, -0.126741, 0.104558, -0.487402, -0.052287, 0.110924, 0.140001, 0.111783, -0.002010, 0.024158, 0.043490, -0.116817, -0.476970, -0.297928, 0.171421, -0.116440, 0.163796, -0.199005, -0.231497, -0.250749, 0.141722, 0.440094, 0.204033, -0.207886, -0.242756, -0.170716, -0.342511, -0.209739, -0.021214, -0.408683, 0.045772, 0.170985, -0.161848, 0.303117, 0.059146, -0.048299, -0.071930, 0.305592, 0.423387, -0.112479, 0.016662, -0.227619, -0.270408, -0.010255, 0.134905, -0.130834, 0.037611, 0.041815, -0.126455, 0.167070, 0.189691, 0.299164, -0.294118, 0.343111, -0.379451, -0.209132, -0.101485, -0.125007, 0.064594, 0.744467, -0.485186, -0.080985, -0.303566, 0.068043, -0.091380, 0.059572, -0.055051, -0.520998, -0.064551, 0.091850, -0.546044, 0.332909, -0.005813, -0.530422, -0.099822, 0.066774, -0.349397, -0.527537, 0.087098, 0.202586, -0.202077, 0.027486, -0.144991, 0.317774, -0.111435, 0.620247, -0.252587]
-,        [-0.259119, 0.196531, -0.100959, -0.125226, -0.163421, -0.173319, -0.136181, -0.094598, 0.321548, -0.113185, 0.246261, -0.623555, 0.012637, -0.050904, 0.118751, 0.128432, 0.082539, 0.079896, -0.081197, -0.014503, 0.032450, 0.286434, -0.067339, 0.075674, -0.511429, 0.200111, -0.217917, 0.079661, 0.120487, 0.193400, 0.095505, -0.232626, -0.217681, -0.046710, 0.091311, -0.263215, -0.127250, 0.166642, 0.225672, -0.352030, 0.143129, -0.269387, -0.078245, -0.018108, -0.169912, 0.238365, 0.124343, -0.620945, -0.304025, -0.222693, 0.108690, 0.400915, -0.178193, -0.118468, 0.070845, -0.306979, -0.021607, 0.123210, 0.206966, 0.054592, -0.233482, -0.132527, 0.056552, -0.208878, 0.068212, -0.041822, -0.332014, 0.089243, -0.053747, -0.141617, 0.091431, -0.414611, 0.141010, -0.285572, 0.024602, 0.170584, -0.284970, -0.330138, 0.382268, 0.003401, -0.244078, -0.139497, -0.055688, -0.018947, -0.016948, -0.149435, 0.086850, 0.209821, -0.233706, -0.136173, -0.245913, -0.148811, -0.162765, 0.208412, 0.369119, 0.110839, -0.191483, 0.079157, -0.183688, 0.056469, -0.214629, -0.140562, -0.314761, -0.486350, 0.070988, -0.148807, -0.325727, -0.061260, -0.024348, 0.236399, -0.100178, 0.239417, 0.084564, -0.037879, -0.132542, -0.004971, 0.085038, -0.216984, -0.365261, -0.066937, 0.014534, -0.362879, 0.130156, 0.062628, -0.157776, 0.192567, -0.156951, -0.021745, -0.148085, 0.117711, 0.080089, -0.366568, -0.290126, -0.343430, 0.070837, -0.240755, 0.075429, -0.424843, -0.194594, -0.207777, -0.036274, -0.009561, -0.255382, -0.092594, -0.389628, -0.224849, -0.323392, -0.160938, -0.212907, -0.005286, -0.075120, -0.065640, -0.159901, -0.172585, 0.149204, -0.080764, -0.044029, 0.008331, 0.012964, -0.214876, 0.059026, -0.390724, 0.340512, -0.084788, -0.193006, -0.274970, -0.165690, -0.294929, -0.210073, 0.505755, 0.218088, -0.114443, -0.119321, -0.168886, 0.020818, -0.200461, -0.272194, -0.110445, -0.096830, 0.133100, -0.257393, -0.144826, -0.085612, -0.010755, 0.025933, -0.360218, -0.079759, -0.091505, 0.123845, -0.311714, -0.099529, 0.030092, 0.079065, -0.115888, -0.051104, -0.164459, -0.282775, -0.142339, 0.187685, 0.027923, 0.083045, 0.047320, -0.433185, -0.562434, 0.043587, -0.083420, -0.070825, -0.237513, -0.010583, -0.158171, -0.224579, -0.207378, 0.039755, -0.165831, -0.194530, -0.222067, -0.359454, -0.269651, 0.055553, 0.054103, 0.041249, -0.139643, -0.122989, 0.071867, 0.107525, -0.198120, -0.170083, -0.046426, 0.048433, -0.014893, 0.075570, -0.199809, -0.021451, -0.211035, 0.153969, -0.248489, -0.198439, -0.190027, 0.200148, -0.207070, -0.099123, -0.295445, -0.079968, -0.197700, -0.026338, 0.299992, 0.128285, 0.099731, -0.111144, -0.329491, -0.195728, -0.002564, -0.109884, -0.261075, -0.174538, 0.085534]
-,        [0.121013, -0.091886, 0.092830, 0.143514, -0.214491, -0.179212, -0.265174, -0.080346, -0.005076, -0.300844, -0.009192, 0.049740, 0.190521, -0.048764, -0.191835, -0.316858, -0.158603, 0.277194, 0.199214, 0.079489, -0.163026, 0.229394, -0.098332, 0.446891, 0.113054, -0.006188, -0.070322, 0.259447, -0.082273, -0.295501, -0.071488, -0.064358, -0.143664, 0.138948, -0.313345, -0.078905, 0.184020, -0.182726, 0.045739, 0.111066, 0.040529, 0.153877, 0.015557, -0.256056, 0.020957, 0.143350, 0.041610, 0.104558, -0.124019, -0.140618, -0.127610, -0.020265, -0.343487, -0.247972, 0.096450, -0.253507, -0.051760, -0.169113, -0.345463, 0.075833, -0.099473, -0.413832, -0.197806, 0.099191, -0.291891, 0.109282, -0.172833, -0.117394, -0.132230, 0.218184, -0.235027, -0.221311, -0.046198, -0.227604, 0.008096, -0.212082, -0.048619, -0.251566, -0.371607, -0.201861, -0.241930, -0.271785, -0.219494, -0.307033, -0.308103, -0.079796, -0.048888, 0.103063, -0.076760, -0.376256, 0.371721, -0.049536, -0.577302, 0.105039, -0.086664, 0.061133, 0.055596, 0.263766, 0.191305, -0.002584, 0.024202, 0.089590, -0.143450, -0.009710, -0.297110, 0.109101, 0.033305, 0.007246, 0.012349, 0.280949, -0.269876, -0.165997, 0.158762, 0.351823, 0.297877, -0.188423, -0.030615, -0.437564, -0.030356, -0.173032, 0.216913, -0.008796, -0.242598, -0.094650, -0.402881, -0.014882, 0.053374, 0.053093, 0.148141, -0.156329, -0.391438, -0.293559, -0.564461, 0.067253, -0.186303, 0.265900, 0.391457, -0.286428, 0.034796, 0.517427, -0.071654, -0.172753, -0.081388, -0.174805, -0.396766, -0.000225, -0.143872, -0.271578, 0.022974, 0.016796, -0.135727, -0.435259, 0.133395, -0.168292, -0.179092, -0.439570, -0.273112, -0.178170, -0.150310, -0.130636, 0.157298, -0.040198, 0.020935, -0.135863, 0.093649, -0.437620, 0.010319, -0.589040, -0.206698, -0.034486, 0.300250, 0.140695, -0.074476, 0.006949, -0.234405, 0.122526, 0.147342, -0.281989, -0.209926, -0.156905, 0.005782, 0.269298, 0.177432, 0.134508, -0.052229, -0.204841, -0.141745, -0.005453, 0.157392, -0.326924, 0.004590, 0.030834, -0.191172, -0.182118, -0.152175, 0.130907, -0.531015, -0.135137, -0.216996, -0.167437, -0.006962, -0.066010, -0.114811, 0.187913, 0.037195, -0.194217, -0.170685, -0.438273, -0.048623, -0.043559, 0.345718, 0.049845, 0.012426, -0.038086, -0.192120, -0.141754, -0.002586, 0.245906, -0.255356, -0.282712, 0.095216, -0.398898, -0.265769, 0.280136, -0.012933, 0.316366, -0.125076, -0.237598, -0.052800, 0.119050, 0.027322, 0.043761, -0.032951, -0.152130, 0.076597, -0.078607, -0.147678, -0.528399, 0.038608, -0.262744, -0.201554, 0.168382, -0.102336, -0.430909, -0.108814, 0.046453, -0.469549, -0.001920, -0.237977, -0.191468, 0.093231, -0.206337, 0.097346, -0.244995, 0.240681, 0.324586]
-,        [-0.390941, 0.453230, 0.393344, -0.008754, 0.105907, 0.701582, 0.082207, 0.705324, -0.348576, 0.625377, 0.631333, -0.333651, -0.126803, 0.102953, -0.457467, 0.639527, 0.075574, 0.072429, 0.466244, 0.019998, 0.440354, 0.247483, -0.925631, -0.420194, -0.035490, -0.035763, 0.050518, 0.464938, -0.392143, -0.294188, -0.193663, 0.288494, -0.027856, -0.003122, 0.188956, -0.417784, -0.280788, 0.084002, -0.056135, 0.329136, -0.182360, -0.028242, -0.092509, 0.054723, 0.283799, -0.044795, -0.603824, -0.312876, 1.455561, 0.425309, 1.698848, -0.042873, 0.012757, 0.166513, 0.063231, 0.386848, 0.579856, 0.400858, -0.072278, 0.518998, 0.648610, -0.045280, 0.114169, -1.009430, 0.290140, -0.050699, -0.245155, 0.213558, 0.154466, -0.120785, -0.018952, -0.019236, 2.021508, 0.044895, -0.499743, -0.528951, -0.206406, 0.034036, -0.039310, -0.428410, -0.030398, -0.394309, 0.070164, -0.142332, -0.340813, -0.164352, 0.452711, 1.166098, -0.601108, -0.227835, -0.624138, 0.102089, -0.283021, 0.077312, 0.065664, 0.146755, 0.938931, -0.228275, -0.243347, -0.037982, -0.312494, 0.139082, 0.033477, -0.227038, 1.285758, -0.324336, -0.375023, -0.384817, 0.461107, -0.154858, 0.112479, -0.216132, -0.021935, -0.096071, 1.613664, -0.028900, -0.298890, 0.520499, 0.304508, -0.547297, -0.039802, -0.101529, 0.133570, -0.178012, 0.040912, 0.122472, -0.531270, -0.210794, -0.149342, 0.032167, 0.635554, -0.155375, -0.189417, -0.112721, 0.185865, -0.301852, -0.044184, -0.232415, -0.020927, -0.391486, 0.268712, -0.620820, -0.047307, -0.015377, 0.283993, 0.315765, 0.484916, -0.413280, -0.099401, -0.141069, 0.143676, 1.654325, -0.120226, -0.202585, -0.139186, -0.043417, -0.681498, 0.311908, 0.412734, -0.564677, -0.380016, -0.365710, 0.428587, 0.604650, 0.713723, 0.129874, 0.535681, 0.095086, 0.774195, 0.280674, 0.922459, -0.048351, -0.318545, 0.220892, 1.591702, 0.280392, -0.424263, 1.159974, 1.205214, 0.310507, 0.042970, -0.210188, -0.003840, 0.231331, -0.372445, 0.819724, -0.226285, -0.560432, 0.263936, 0.206952, -0.417936, 0.284228, -0.139544, 0.042101, 0.475954, -0.493150, 0.319053, -0.184401, 0.685495, -0.027850, 1.087633, 0.292919, -0.236688, 0.055738, 0.931677, -0.500298, -0.238179, -0.145167, -0.135190, -0.104262, 0.017238, -0.088574, 0.079682, -0.599252, 0.225168, -0.106325, -0.234308, -0.127399, -0.392692, 0.079575, -0.251865, 0.279027, 0.191168, -0.243727, 1.274830, 0.190008, 0.090987, 0.284190, -0.279367, 0.068933, -0.118652, 0.156003, 0.069558, 0.044329, 0.521685, 0.156974, -0.265220, -0.195246, -0.331148, 0.267435, 0.037243, -0.008182, 0.017020, 0.011206, 0.747904, 0.197925, 1.869025, 0.312918, 0.375213, 0.167712, 0.072677, -0.101311, 0.132649, 0.443405, 0.305063, -0.474259]
-,        [-0.132150, -0.089154, -0.051588, -0.126436, -0.019474, -0.178146, -0.164526, 0.030104, 0.063409, -0.099565, -0.003236, 0.010194, 0.004070, -0.075045, -0.102755, -0.119271, -0.160555, 0.057395, -0.175108, 0.149271, -0.044342, 0.005956, -0.013264, 0.197192, -0.046621, -0.194020, 0.012208, 0.068696, -0.168298, -0.052789, 0.059855, -0.195133, 0.000972, 0.033473, 0.040036, -0.112194, 0.078584, 0.075851, -0.147603, -0.065748, 0.153749, 0.020454, -0.012729, 0.022349, -0.067390, -0.093886, 0.186278, -0.165260, -0.076203, -0.123149, -0.066409, -0.321487, -0.044846, -0.116198, 0.068437, 0.004564, -0.346340, 0.041091, -0.056960, 0.065214, 0.032418, -0.029470, -0.044462, 0.033091, 0.018602, -0.209906, -0.038376, -0.196481, 0.035592, -0.037501, -0.068668, -0.316309, 0.017159, 0.098269, 0.074622, 0.031052, -0.000627, 0.028954, 0.005940, -0.164987, 0.079089, -0.119070, -0.178593, 0.020888, -0.112755, 0.107309, -0.110818, 0.119486, -0.144626, 0.071808, -0.133141, -0.047742, -0.263734, 0.136751, -0.035019, -0.099136, 0.028748, -0.145630, 0.071950, -0.027107, 0.079422, 0.026581, -0.089522, 0.078860, -0.098016, -0.181007, -0.117788, -0.013481, -0.123768, -0.106359, -0.089316, 0.165237, -0.050031, 0.070057, -0.264531, -0.036278, -0.224207, -0.173753, -0.179741, -0.150566, -0.050942, -0.092408, -0.071859, -0.153597, -0.133078, 0.167552, 0.027545, -0.219835, -0.153230, 0.104780, -0.038076, -0.080665, 0.031892, 0.020874, -0.054930, -0.210331, -0.060443, -0.083544, 0.147529, -0.066211, -0.035182, 0.012340, -0.211660, 0.060143, 0.018875, -0.054626, -0.166192, -0.026309, -0.119402, -0.072613, -0.276256, 0.059991, -0.110888, -0.388764, -0.077753, 0.030454, -0.210102, 0.072158, 0.073604, -0.033854, -0.060617, -0.065205, -0.120392, 0.098685, 0.203087, -0.235156, 0.117626, -0.057769, 0.050726, 0.103837, -0.195030, -0.034711, -0.117306, -0.112554, -0.283597, 0.118665, 0.033094, -0.073104, -0.137895, -0.183840, -0.149132, 0.034283, 0.084473, 0.128720, 0.036533, -0.000448, 0.017282, -0.096901, -0.093502, 0.034550, -0.032182, -0.162062, -0.121345, -0.083492, -0.007463, 0.080919, -0.043914, -0.014818, -0.043827, 0.143008, 0.040039, 0.028514, -0.129977, -0.026104, -0.052881, -0.184493, -0.068435, 0.013475, -0.065219, -0.049121, -0.020331, 0.193038, 0.092102, -0.353767, 0.016944, 0.027668, -0.046851, -0.119394, -0.114017, 0.116309, -0.015396, -0.143394, -0.190185, 0.137244, -0.187751, -0.152030, -0.196430, 0.005900, 0.015772, -0.022246, 0.074694, -0.093018, 0.070480, -0.002359, 0.149895, -0.144048, -0.225181, 0.114967, 0.027926, -0.278770, -0.129556, -0.239615, 0.052131, -0.157427, -0.023759, -0.075308, -0.282194, 0.002102, 0.199722, 0.003245, 0.171965, -0.166642, 0.008620, -0.213116, -0.034716, 0.117940]
-,        [0.072083, 0.300489, -0.368572, 0.156131, 0.140662, 0.030114, 0.017096, -0.430636, 0.038886, 0.090419, -0.136081, -0.165185, 0.117719, 0.085375, -0.320369, -0.093366, 0.168646, -0.155391, -0.027993, -0.133584, 0.031019, 0.098479, -0.065506, -0.009192, -0.192517, -0.418236, -0.113366, -0.173125, 0.014066, 0.376975, 0.265973, -0.167819, -0.191745, 0.007092, 0.165165, -0.456998, -0.040660, 0.052464, -0.204085, -0.385024, -0.100097, 0.182167, 0.264044, -0.240800, -0.241978, 0.191997, -0.303530, 0.114577, -0.065790, -0.073509, 0.151191, 0.330299, -0.193598, -0.194624, 0.072842, -0.147786, -0.186278, 0.048366, 0.189814, -0.089380, -0.027917, 0.182876, -0.401533, 0.099271, 0.390585, -0.188817, 0.135085, -0.400340, -0.159584, -0.294633, -0.585906, -0.064375, -0.155657, -0.347772, -0.030777, -0.175888, 0.108331, -0.000386, 0.239160, -0.158640, -0.025478, -0.130967, 0.114622, -0.071182, 0.387005, 0.319452, -0.141728, -0.298161, -0.648623, 0.186484, 0.051302, -0.086878, -0.219514, -0.815710, 0.074981, 0.325735, -0.191623, 0.013685, -0.147268, -0.155033, -0.340998, 0.444188, -0.009237, 0.107830, -0.148408, -0.168904, -0.237504, -0.468104, 0.305246, -0.120545, -0.220097, 0.079539, -0.127911, 0.173875, -0.137493, -0.273736, 0.349517, -0.256857, 0.008066, -0.224316, -0.282111, -0.506901, 0.233588, 0.141268, 0.126029, -0.656271, 0.197519, 0.141737, 0.189192, -0.254638, -0.052044, -0.016083, 0.088439, 0.142880, 0.127853, 0.144833, 0.125158, 0.031671, 0.204000, -0.017798, 0.302083, -0.209834, -0.161801, -0.105077, 0.193349, -0.008221, -0.450088, 0.137798, -0.180975, -0.280626, -0.252772, -0.380029, -0.103030, 0.052445, -0.384820, -0.048907, -0.368967, 0.151518, -0.000642, 0.024915, 0.125870, 0.121651, 0.125835, -0.058687, -0.572311, 0.179459, -0.025939, 0.028347, 0.436562, -0.160861, -0.019090, -0.141233, -0.220749, -0.057650, -0.172663, -0.048195, -0.107263, 0.107459, -0.396937, 0.028020, -0.176694, -0.060216, 0.104492, -0.193656, 0.145522, -0.260031, 0.552651, 0.102493, -0.093437, -0.021451, -0.207138, 0.005319, -0.257518, 0.064389, 0.001220, 0.204299, 0.241770, 0.023279, -0.416729, -0.073386, -0.237967, -0.045909, -0.105954, 0.104421, -0.336659, 0.022328, -0.351689, -0.281050, 0.040727, 0.034623, -0.276922, -0.076160, 0.032953, 0.563777, -0.064390, 0.355153, 0.165352, -0.035408, 0.479388, -0.519799, 0.183668, -0.683813, 0.005802, 0.217875, -0.066922, -0.139339, -0.206172, 0.022898, 0.046973, 0.481742, -0.133435, -0.448883, -0.035684, 0.023673, 0.174531, -0.303749, -0.051442, 0.194549, -0.136455, -0.326530, -0.171252, 0.098913, 0.153742, -0.054636, -0.029479, -0.222910, -0.108408, 0.017345, 0.173949, -0.109444, -0.107715, -0.223385, 0.335731, -0.079597, -0.390660, -0.116069]
-,        [-0.125194, 0.088906, 0.410893, 0.139107, 0.332142, 0.112694, -0.212665, 0.374899, -0.386713, -0.010056, 0.630579, -0.156279, -0.101863, 0.415467, 0.051029, -0.350927, -0.146119, 0.057136, -0.178579, -0.266375, -0.253325, -0.157273, -0.611733, -0.100376, -0.056403, 0.041883, -0.325512, -0.046319, -0.695748, 0.250891, -0.313116, 0.170549, 0.189860, -0.035162, -0.206725, -0.790939, 0.321397, -0.629021, -0.466220, -0.145610, -0.440130, -0.211785, 0.023657, -0.209269, 0.031850, 0.273793, 0.188212, -0.406603, -0.323767, -0.095452, 0.100678, -0.053106, -0.196546, -0.126251, 0.213508, -0.066511, 0.109111, -0.092927, -0.231084, -0.491996, 0.021873, 0.093854, -0.295000, -0.366665, 0.170606, -0.147370, -0.531461, 0.239365, -0.350013, 0.208284, -0.511565, -0.478275, 0.294724, -0.068121, -0.262366, -0.158685, -0.206281, 0.040527, 0.263157, -0.087117, -0.131397, 0.059604, -0.018380, -0.118603, 0.055437, 0.201673, -0.003768, -0.010244, 0.220018, 0.019111, -0.453914, 0.054925, -0.036530, 0.526853, -0.044097, -0.209080, -0.175262, -0.095762, 0.216347, 0.050926, -0.434196, -0.176069, -0.198740, 0.087448, -0.266839, 0.070716, -0.199646, -0.350621, 0.160200, 0.058490, -0.617195, 0.017148, -0.145182, 0.012877, -0.093306, -0.492692, 0.143113, -0.050678, 0.191314, 0.403639, -0.513671, -0.258554, -0.434744, 0.080386, -0.480324, -0.037513, -0.430554, -0.111798, -0.863247, -0.862325, -0.220313, 0.058222, 0.040822, -0.328282, 0.216584, -0.251968, -0.032142, 0.073378, -0.391354, -0.597154, 0.187513, 0.155975, -0.003469, -0.596351, -0.052218, 0.365661, -0.298481, -0.349442, -0.489635, -0.291343, -0.232982, -0.114621, 0.231237, -0.519073, -0.213090, 0.357032, -0.245636, 0.248674, 0.100976, -0.536638, -0.395708, -0.372253, 0.226367, 0.005525, -0.091979, -0.397896, -0.356718, -0.031223, 0.066703, -0.493194, -0.311660, -0.062278, -0.065135, -0.236910, 0.107706, -0.044438, 0.003187, 0.053025, -0.147687, -0.230639, 0.015027, 0.124333, 0.056044, -0.266644, 0.158818, -0.158007, -0.445798, -0.411592, -0.015289, -0.219112, 0.300097, 0.422375, -0.192994, 0.410353, 0.020835, -0.433045, -0.091318, -0.291256, -0.002610, -0.126206, 0.103051, 0.165659, -0.157481, 0.335110, -0.158286, -0.076086, 0.221970, 0.175722, 0.137921, 0.096149, -0.049663, -0.383143, -0.021284, 0.098704, -0.084184, 0.184728, -0.499436, 0.057854, -0.451364, -0.112013, -0.236029, -0.244732, -0.034715, -0.481986, 0.477152, -0.010105, -0.158954, -0.093155, -0.230956, 0.158813, -0.380195, -0.128285, 0.051846, -0.463005, -0.264477, 0.127688, 0.170567, -0.202601, -0.055458, -0.441252, 0.223407, 0.016304, -0.128579, -0.524368, -0.225308, -0.226635, 0.060469, -0.306638, 0.009032, -0.160583, -0.678168, -0.294937, 0.160312, 0.142756, 0.150952, -0.388104]
-,        [-0.040507, -0.457287, -0.238229, 0.226084, -0.039860, -1.359044, -0.281062, -0.549201, -0.118504, -0.476866, -0.101824, -0.505760, -0.048910, -0.073736, 0.079397, -0.610782, -0.376291, 0.061981, -0.614434, -0.070567, -0.138181, 0.402840, 0.256765, 0.672219, -0.315490, 0.327089, -0.006896, -0.219561, 0.661132, -0.218304, 0.004263, -0.273199, -0.183902, 0.061755, -0.845706, 0.074672, 0.171140, -0.912386, -0.109109, 0.563764, 0.427396, 0.201810, -0.597500, -0.034875, 0.152153, 0.088020, 0.293175, 0.113412, -0.324310, -0.026531, -0.839625, -0.385622, -0.360282, -0.222644, 0.653220, -0.156560, 0.116286, 0.147883, -0.188781, 0.031943, -0.006683, -0.078387, -0.285152, -0.009517, 0.032056, -0.061397, 0.180012, 0.071417, 0.139979, 0.178039, -0.191157, -0.386532, 0.140446, 0.528361, -0.634681, 0.361844, -0.389191, 0.239569, -0.452280, -0.942977, -0.532620, 0.510987, -0.172538, 0.215874, -0.372077, 0.028614, 0.145326, 0.128912, -0.023650, 0.124775, 0.430844, -0.721804, -0.628236, -0.356943, 0.134551, 0.368047, -0.028354, 0.358315, -0.030572, 0.272410, -0.258932, -0.337393, 0.322027, -0.084300, -0.127136, 0.215114, 0.014562, 0.094203, 0.065447, 0.090989, -0.326552, -0.957437, 0.017894, -0.239759, -0.564376, -0.060417, 0.213606, 0.165964, -0.106577, 0.376861, 0.143101, 0.496035, 0.051362, -0.137410, -0.444054, 0.458702, 0.421099, -0.369345, -0.392234, 0.301363, -0.300757, 0.358976, 0.180659, -0.089761, 0.370667, -0.329226, 0.224404, -0.578812, 0.301011, 0.085561, 0.208071, 0.303782, 0.220398, -0.142313, 0.092389, -0.182620, 0.128346, 0.030186, -0.294774, 0.046271, -0.276846, -0.354426, -0.458163, -0.552872, -0.106567, -0.434986, -0.182826, 0.102247, -0.208543, -0.130180, -0.101904, -0.271581, -0.386448, -0.251482, -0.060948, 0.329147, -0.014186, -0.292241, 0.400365, -0.211872, 0.036528, -0.621280, 0.370633, -0.093989, -0.613338, -0.407444, -0.075664, -0.491693, -0.458877, -0.283197, 0.233945, 0.027639, -0.202958, 0.287381, -0.061743, -0.164218, -0.287146, -0.312362, 0.362149, -0.215698, 0.436317, -0.186318, -0.561700, 0.073298, -0.224934, 0.439410, 0.066521, -0.088524, -0.313180, -0.166679, 0.240246, -0.089814, 0.246095, -0.092100, -0.300422, -0.109629, 0.016898, 0.109100, -0.282973, 0.421335, 0.513742, 0.068797, 0.086440, 0.278911, 0.348038, 0.035629, -0.000739, 0.373394, -0.108125, 0.071015, 0.418460, -0.272427, -0.380328, -0.138874, -0.401421, 0.006186, -0.194349, -0.062598, 0.413081, -0.131642, -0.137457, -0.278506, 0.140060, 0.157245, -0.195680, -0.340897, -0.232593, 0.336824, 0.499761, -0.461316, -0.131375, 0.124868, 0.392073, -0.363452, 0.029881, -0.139925, -0.329362, -0.039591, -0.263251, -1.036839, -0.173691, -0.072177, 0.011772, -0.000689, 0.077306, 0.351769]
-,        [0.545052, 0.180897, -0.066573, 0.047621, 0.441610, -0.505494, 0.145184, 0.274431, -0.003523, -0.025556, -0.797009, -0.403899, 0.322820, -0.317673, 0.026162, 0.043350, 0.076832, 0.103977, 0.138263, 0.472226, 0.467977, -0.115270, -0.283978, 0.411070, 0.296869, -0.357345, 0.315353, -0.117617, -0.473054, 0.137923, 0.467647, 0.188421, 0.103498, 0.033289, -0.001532, 0.949371, 0.372806, 0.418301, -0.033743, -0.204287, 0.212455, 0.525103, -0.224379, 0.634331, -0.427540, 1.114517, 0.010395, -0.055997, -0.248988, 0.802119, -0.429281, 0.833406, -0.540716, 0.363978, 0.274299, -0.512821, 0.550866, -0.109121, -0.137352, -0.238144, 0.395303, 0.176507, -0.164382, -0.180014, 0.499446, 0.600640, -0.105392, 0.042956, 0.668442, -0.504289, -0.778866, -0.495873, -0.839666, -0.353036, 0.289958, 0.520585, -0.159677, 0.137783, 0.294930, -0.738806, -0.212185, 0.283045, 0.010160, 0.027211, -0.207157, -0.553692, -0.277829, -0.364255, -0.155487, 0.007382, 0.555721, 0.079072, 0.122592, -0.258426, 0.354819, 0.182760, -0.378492, 0.008010, -0.255292, 0.374956, -0.270013, 0.036386, -0.329645, 0.203829, -0.097464, 0.148883, 0.257545, -0.245789, 0.434663, 0.267898, -0.217085, 0.240392, 0.118141, -0.142553, -0.316181, -0.756130, -0.620108, -0.062754, 0.429948, -0.245659, -0.740952, -0.794958, -0.098143, -0.202224, -0.251420, -0.033815, 0.576727, -0.899796, -0.385794, 0.462044, -0.613213, 0.716188, 0.184055, -0.392877, 0.077391, 0.299168, 0.553108, 0.398246, -0.944647, 0.395459, -0.311513, -1.003485, 0.289884, 0.250045, 0.038659, -0.091332, -0.439679, 0.512751, -0.211546, 0.414032, 0.006356, -0.215304, -0.086605, -0.667475, 0.269406, -0.331858, -0.080397, 0.059304, 0.240737, -0.287707, 0.494714, 0.204513, -0.168801, 0.245744, -0.041898, -0.605989, -0.055428, -0.504925, 0.121192, -0.406287, -0.576336, 0.331061, 0.391521, -0.315225, -0.090058, -0.152917, 0.293684, 0.365329, -0.352737, -0.227592, 0.149105, 0.216005, 0.061503, -0.159517, -0.000945, 0.039942, 0.346192, -0.204557, -0.343443, 0.104136, 0.342771, -0.117521, -0.101688, 0.197784, 0.075555, -0.613654, -0.217294, 0.073412, -0.316962, 1.189357, -0.478624, -0.342919, 0.859547, -0.370708, 0.896357, -0.064327, -0.350301, 0.322092, -0.118273, -0.019568, 0.654582, 0.179757, -0.060600, 0.374821, 0.055053, 0.563572, -0.345696, 0.223418, 0.183353, -0.024576, -0.093954, -0.564446, -0.311262, -0.114790, -0.819911, 0.401671, -0.144375, 0.167215, 0.213160, 0.258007, -0.135741, 0.354193, -0.003043, -0.930764, -0.000490, -0.141681, 0.371376, 0.572507, 0.577503, -0.550889, -0.065274, 0.030363, 0.058723, -0.523892, -0.204298, -0.196671, -0.413599, 0.198551, -0.248672, 0.146836, 0.105689, -0.110431, -0.046722, -0.437149, -0.533193, 0.674232]
-,        [0.267926, -1.149700, 0.106403, 0.359003, 0.856134, -0.423679, -0.378728, 0.330180, 1.290068, 0.184863, 0.016216, -0.032321, -0.705618, -0.060401, 0.529687, 0.453535, -0.180259, -0.724228, -1.072150, -0.387136, -0.152223, 0.012034, -0.169515, -0.173081, -0.077784, 0.153395, 1.159584, 0.089061, -0.104579, 1.153482, 0.332742, 0.805515, -0.484655, 0.039477, 0.212828, 0.540378, 0.884262, -0.102199, 0.125359, 0.020049, -0.946836, -0.925032, 0.315439, -0.832852, 0.219010, -0.428905, -0.399390, -0.498942, 0.383064, -0.648871, 0.118222, 0.621872, -0.003294, 0.599467, -0.802897, 0.467207, 0.676111, 0.258722, -0.109638, 0.336897, 0.639457, 0.601471, 0.303878, -0.002012, -0.948059, 0.183639, -0.109733, 0.127288, 0.081412, 0.475434, 0.374103, 0.100365, -0.513497, 0.319173, 0.801834, 0.757518, -0.028593, 0.590755, -0.617854, -0.823090, 0.052224, -0.642576, -1.358484, -0.223660, 0.196413, 0.103572, -0.255742, 0.250127, -0.753828, 0.324614, 0.304788, 0.439252, 0.051971, -0.653654, 0.364627, 0.532920, 0.091221, -0.250385, -0.053471, -1.069178, -0.796055, 0.753674, -0.746429, -0.904967, 0.959083, -1.776373, 0.232124, 1.037454, 0.109276, -0.268935, 0.207065, -0.510136, -0.416139, -0.310863, 0.150158, -0.131015, 0.106475, -0.152195, -0.527045, 0.113422, -0.921418, 0.330518, 0.524038, -0.202959, -0.276929, 0.703234, 0.152639, -0.150140, -0.335962, 0.615230, 0.012355, 0.579484, -0.302267, -1.046685, -0.547216, -0.591418, -0.614364, 0.521252, -0.466182, -0.319283, -0.094656, -0.429723, 1.016990, -0.089616, 0.123757, 0.381219, -0.709073, -1.189142, 0.075187, 0.995032, 1.035147, -0.368875, 0.280116, -0.126523, -0.586377, 0.345523, -0.610596, 0.541882, 0.538945, -0.628406, 0.149729, 0.842542, 0.502292, -0.049365, -0.846468, -0.442457, 0.368644, 0.503363, 0.758328, 0.482295, 0.398672, 0.279225, -0.942436, 1.108203, 0.428892, 0.942731, 0.318995, 0.424403, -0.644520, 0.589622, 0.498568, 1.662237, -0.836125, 0.878860, -1.188315, -0.250122, 0.842502, -0.017560, -0.165781, 0.273265, -0.594432, -0.713105, -0.098282, 0.298790, -0.038883, -0.725637, -0.476791, -0.684660, 0.048656, 0.731505, 0.269044, 0.719811, -0.407876, 0.533627, 0.251148, -0.200377, -0.117310, 0.175507, 0.087029, -0.215345, 0.092087, 0.383485, -0.218613, 0.576540, 0.203153, -0.007101, -0.599355, -1.005941, 0.182979, -0.169039, 0.098931, 0.182646, -0.439735, 0.018218, -0.128983, 0.971033, -0.985819, 0.249615, -0.170151, -0.643338, 0.706232, -0.077294, 0.117519, 0.031765, 0.850002, -0.671014, -0.572267, -1.034134, 0.134681, 0.220031, -0.554438, 0.271118, -0.787600, 0.947423, 0.602213, -0.347585, 0.074696, -0.799582, 0.240539, -0.834090, -0.463773, 0.520940, 1.006449, 0.065952, -0.954932, 0.123526]
-,        [0.648221, -0.302963, -0.081383, -0.014153, -0.615575, -0.650434, 0.417368, -0.307274, -0.546734, -1.025014, -0.382546, -0.113726, -0.238127, -0.936854, -0.290864, -1.313992, 0.321714, -1.000993, -0.140364, 0.029303, 0.416519, -0.021769, -0.105792, 0.428645, 1.154558, -0.259627, -0.060427, -0.273027, -0.690886, 0.189304, -0.504510, -0.695648, -0.450787, -0.237054, -0.418293, 0.657751, 0.423548, 0.105401, 0.706689, 0.192250, 0.637914, 0.011887, -0.202246, 0.761265, -1.448677, 0.660735, 0.369553, -0.256622, -0.202687, 0.033529, 0.197774, -0.024214, 0.139643, -0.634499, -0.067231, -0.083333, -0.568419, -0.126611, -0.856085, -0.047613, 0.678006, -0.059237, -0.685299, 0.096827, -1.225190, 0.165570, -0.658096, -0.244485, -0.051141, -0.175053, -1.492475, 0.164483, -1.313502, 0.437020, 0.117164, -0.450167, -1.952562, 0.815105, -0.418607, 0.070161, 0.189809, -0.460352, -0.700845, -0.297941, 0.968986, 0.459700, -0.345869, -0.396510, -0.438371, 1.024661, -0.163753, 0.200959, -0.462935, -1.278881, -0.203705, -0.499402, -0.712827, -0.859739, 0.721160, 0.080545, -0.520257, -0.551895, -0.325784, -0.105976, -1.225497, 0.859397, -0.233503, -0.824048, -0.370857, 0.641776, 0.290294, -0.401288, 1.086129, 0.279195, -1.395348, -0.851635, -1.413566, 0.187730, -0.414643, 0.101524, 0.412158, -0.217199, -0.588906, 0.612488, 0.405562, 0.013521, -0.785618, 0.580112, 0.504647, -0.014496, -0.898918, -0.693285, 0.040029, -0.114449, 0.491028, 0.023036, -1.154036, -0.384314, 1.069482, 0.308740, -0.147658, -0.250965, -0.424597, -0.540806, -1.139815, -1.005494, 0.615356, -0.319511, 0.333980, -0.304499, -0.537379, -0.304067, -0.757734, 0.855306, -0.310892, -0.946178, 0.110191, -0.404740, -0.568570, 0.031870, 0.631619, -0.649206, -0.939219, 0.227876, 0.025796, -0.231073, 0.130045, 0.285498, -0.372080, 0.439953, 0.468807, 0.544854, 1.477044, -0.015992, -1.455607, -0.602795, -0.351628, 0.162259, -0.942215, -1.010250, 0.099153, 0.459028, 0.233512, -0.355820, 0.183731, 0.443765, -0.735146, 0.056811, -0.134459, 0.978390, 0.203821, 0.391153, 0.033392, 0.036931, 0.252350, 0.251543, -0.230662, 0.192295, -0.369632, -1.116957, -0.117516, -0.513048, 1.353153, -0.784206, 0.430653, 0.521830, 1.041938, -0.758325, -1.205541, -0.621521, -1.028718, -0.303567, -0.112012, 0.177298, 0.570024, 0.602062, -0.378258, -0.262609, 0.120060, 0.287286, -0.786317, 0.175802, -0.420633, -0.098734, -1.313929, 0.403251, -0.099914, 0.535408, -0.537850, -1.139876, 0.172484, -0.331624, 0.038917, -1.134671, 0.321654, -0.111950, -0.819307, 0.235163, 0.050880, 0.313074, 0.292084, 0.210257, -0.358718, 0.301340, 0.264863, 1.096847, -0.775104, -0.222382, -0.524078, -0.383954, -0.493598, 0.274234, 0.416008, -0.224922, -0.433338, 0.754269]
-,        [-0.224334, -0.245557, 0.238122, -0.042481, -0.236580, 0.041577, -0.013363, -0.312821, -0.107880, -0.407615, -0.045884, -0.107096, -0.206183, 0.189109, -0.083549, 0.289104, -0.224642, 0.296122, 0.238603, 0.230570, 0.467044, 0.000615, 0.219008, 0.264832, 0.120455, 0.055105, -0.328950, -0.107648, -0.147716, 0.302957, -0.032401, 0.023265, -0.010329, 0.022417, -0.266624, 0.133322, 0.055801, -0.204893, -0.041296, 0.001642, 0.331558, -0.034790, 0.078285, -0.023246, -0.023996, 0.083096, -0.290929, -0.354690, -0.025208, -0.122242, -0.241708, -0.129287, -0.398950, -0.103765, -0.243174, -0.095738, 0.195953, 0.100645, 0.123970, -0.041957, -0.191729, 0.339513, 0.032539, -0.138889, 0.051388, 0.228568, 0.077557, -0.066273, 0.211940, -0.263393, -0.521935, -0.386934, -0.195737, 0.203170, 0.165786, -0.105498, 0.357664, 0.213821, -0.456165, -0.045002, 0.100797, 0.515225, -0.145837, -0.120516, 0.288714, -0.056125, -0.343123, 0.138682, 0.103728, -0.174228, 0.265900, 0.016987, -0.132157, 0.023111, 0.020524, -0.104460, -0.346136, -0.262824, -0.042370, -0.312437, 0.052180, -0.166935, -0.010697, -0.092607, 0.282673, -0.018407, 0.207924, -0.050723, 0.212416, 0.085086, -0.015512, -0.220373, -0.030592, 0.248714, -0.238854, -0.123122, -0.083099, -0.118449, -0.177061, -0.079503, -0.099169, 0.130342, -0.115059, 0.162290, 0.190127, -0.029780, -0.453221, 0.194586, -0.232685, -0.012668, -0.076049, 0.040198, 0.022216, -0.338335, 0.513319, 0.608005, -0.103880, 0.192145, 0.031482, 0.243909, -0.142650, -0.224724, -0.003358, -0.219479, -0.053346, -0.036454, -0.432929, -0.009308, -0.193825, -0.043664, -0.196120, -0.532860, 0.011476, 0.119234, -0.165356, -0.277679, -0.220944, 0.396462, -0.099049, 0.096228, 0.206338, 0.059559, -0.064597, -0.041307, -0.172791, 0.015075, 0.054790, -0.330150, 0.139005, 0.074462, -0.063625, 0.209579, -0.147542, -0.310030, -0.026135, 0.088872, 0.025166, -0.206543, -0.661251, 0.222748, -0.021768, 0.228258, -0.003889, -0.125903, -0.076222, -0.008418, 0.305853, -0.344136, 0.139999, 0.168596, 0.041627, -0.055755, -0.199656, -0.110390, -0.347945, 0.000509, -0.204404, 0.031968, -0.504848, 0.083208, 0.010384, -0.270749, 0.478035, -0.196164, 0.072052, 0.248453, -0.331058, -0.354203, -0.397426, 0.066778, 0.355973, -0.390895, -0.242690, 0.310189, -0.264938, -0.229647, 0.293093, 0.117075, 0.151704, -0.187302, -0.163983, -0.298060, -0.094266, 0.215354, 0.108469, -0.069236, -0.259715, -0.172717, -0.036588, 0.165177, 0.076179, -0.423969, 0.007140, -0.044236, -0.104310, -0.194818, -0.001524, -0.087238, 0.066983, -0.340307, 0.181335, 0.033747, -0.141076, -0.031214, -0.261812, 0.177719, -0.078045, -0.271431, -0.034783, 0.061664, -0.131940, -0.323787, 0.055739, -0.137518, 0.048898, -0.178121]
-,        [-0.100967, -0.164140, -0.403329, 0.214825, -0.052845, 0.079846, -0.034590, 0.084412, -0.383314, 0.196595, -0.079148, -0.342561, 0.035857, 0.349144, -0.620480, 0.096010, -0.025866, 0.273512, 0.012971, -0.227710, -0.111944, -0.070800, -0.262551, 0.041481, -0.110935, -0.196099, -0.061240, 0.241674, 0.124873, 0.021397, -0.000171, 0.198321, -0.090673, -0.061078, 0.251327, 0.116724, -0.309172, 0.176483, 0.097338, -0.127164, -0.526298, -0.014465, 0.045104, 0.056400, 0.578416, -0.000420, 0.285221, -0.257921, -0.355859, 0.001437, 0.101333, 0.233908, -0.376561, -0.139775, -0.041280, -0.239046, 0.355519, 0.043664, 0.094493, -0.137602, 0.197212, 0.132881, -0.731297, -0.083636, 0.057197, -0.002322, -0.020731, 0.146148, -0.256496, -0.045683, 0.177430, -0.348212, -0.273972, -0.193464, -0.242698, 0.134027, 0.030485, 0.233684, 0.306266, -0.064181, -0.350743, -0.166261, -0.402374, -0.191179, 0.076316, 0.052122, -0.028356, 0.128587, 0.049098, 0.110629, -0.049019, 0.317490, 0.160754, -0.245192, -0.203877, 0.143306, 0.048382, -0.005098, -0.257582, 0.076963, -0.058166, -0.604459, -0.223987, -0.321707, -0.060580, -0.125434, -0.146781, -0.044746, 0.086063, 0.127959, -0.134724, -0.222649, 0.175726, 0.024305, -0.010190, -0.202988, -0.171691, -0.152271, -0.147580, 0.091441, -0.187784, 0.083041, -0.306931, -0.093575, -0.017117, 0.297853, -0.534162, 0.090440, -0.802236, -0.029903, -0.010982, -0.038094, 0.221188, -0.278470, -0.150837, -0.146352, -0.286122, -0.091380, -0.188006, -0.224721, 0.171345, 0.139925, -0.190045, -0.295670, 0.148047, -0.045564, -0.673831, -0.210290, -0.273026, -0.117559, -0.106315, -0.095383, 0.228794, -0.102963, 0.187892, 0.053905, -0.042780, -0.019209, 0.130038, 0.031954, -0.482378, -0.048807, -0.175516, 0.203533, -0.008435, -0.109249, -0.078274, -0.503453, 0.037126, -0.016372, -0.027773, -0.379248, -0.196688, -0.199189, 0.246049, 0.069704, -0.043947, -0.092047, -0.278227, -0.339223, -0.240427, 0.139012, -0.107549, 0.179461, -0.003295, 0.226494, -0.038411, -0.409172, 0.004184, -0.010049, 0.107769, -0.102369, -0.259505, -0.104220, -0.039536, -0.392279, -0.302282, -0.081051, 0.157475, 0.111605, 0.048991, -0.152294, 0.036458, -0.366390, -0.396505, -0.400710, -0.369394, -0.014614, 0.353493, -0.040862, -0.124033, -0.003673, 0.113469, -0.048503, -0.311402, 0.104503, 0.095882, 0.131004, -0.190446, 0.088662, -0.459437, -0.458278, 0.056934, -0.295459, -0.017866, -0.225626, -0.325181, 0.066267, -0.127983, 0.319762, -0.080445, -0.360605, -0.091447, -0.023990, -0.343236, -0.205181, -0.126351, -0.009875, -0.244173, -0.292543, 0.354843, -0.201043, -0.242187, -0.185706, -0.027394, 0.010536, -0.187632, 0.392962, 0.120227, 0.124336, -0.035163, -0.151036, -0.329702, -0.013143, -0.242404, -0.211411]
-,        [-0.112006, -0.470876, 0.080222, -0.368004, -0.059235, -0.282790, -0.540960, -0.487326, -0.025856, 0.046234, -0.236446, -0.144556, 0.301305, -0.118395, -0.115383, -0.187716, -0.052118, -0.150045, 0.264185, -0.223702, -0.059986, -0.125286, 0.183726, -0.208326, -0.320752, 0.115047, -0.079826, 0.221169, 0.369199, 0.197511, -0.089787, 0.077931, -0.194311, 0.014364, 0.074830, -0.105653, 0.088417, 0.114186, -0.036882, -0.088169, 0.175453, 0.189027, 0.278449, -0.049825, 0.094930, 0.294717, 0.142713, -0.106395, -0.106315, -0.305538, 0.242253, -0.198312, -0.295815, 0.148390, 0.506395, -0.304338, -0.028330, 0.017278, -0.202606, 0.130970, 0.095455, -0.228574, 0.136911, -0.068229, -0.099755, -0.017022, -0.289740, 0.251857, 0.222160, -0.291410, 0.376026, -0.536422, -0.022562, 0.082806, -0.228921, -0.495460, 0.083959, -0.093583, -0.045422, -0.238878, -0.569709, 0.117737, -0.150632, 0.155498, 0.048774, 0.283801, -0.077077, 0.178261, -0.013192, -0.033312, 0.161838, 0.246215, -0.355959, 0.461973, -0.018544, 0.068184, -0.393500, 0.057639, -0.007974, 0.207893, 0.270036, 0.044735, -0.199106, 0.235872, -0.028148, 0.045559, -0.170079, 0.054867, 0.082034, -0.079238, -0.444317, 0.099508, -0.068366, 0.034157, -0.473563, -0.180025, 0.453487, -0.183009, 0.029739, -0.040511, 0.147096, 0.001912, -0.190607, 0.237573, 0.027371, 0.248366, 0.082418, 0.019403, -0.289336, 0.168135, -0.336021, -0.110587, 0.002354, -0.030874, 0.038820, 0.098548, 0.194636, 0.209142, -0.413346, 0.297186, -0.075403, 0.095657, 0.156347, -0.047547, -0.192886, 0.005833, 0.027637, 0.041889, -0.291311, 0.622236, 0.141059, -0.097159, 0.284194, 0.159882, -0.001992, 0.041352, 0.082527, 0.404215, 0.049080, 0.077596, 0.009772, 0.023878, -0.175429, 0.200908, -0.116471, -0.012636, -0.144167, -0.329061, 0.162182, -0.013064, -0.258337, 0.164857, -0.148277, -0.477783, -0.126004, 0.065659, -0.320850, -0.133288, -0.169523, 0.154064, 0.329064, 0.219371, -0.175761, 0.028575, -0.182215, -0.031493, -0.098307, 0.062289, 0.456085, -0.217658, -0.055651, -0.211100, 0.228596, 0.061057, -0.214460, -0.162349, -0.129295, -0.025080, -0.154018, 0.264596, -0.234119, 0.105993, -0.023607, 0.102656, -0.113859, 0.226448, 0.229102, 0.048192, 0.121696, 0.131699, -0.731330, -0.077013, -0.226801, 0.338126, -0.036816, 0.039560, -0.518512, -0.205997, 0.058121, 0.044975, 0.137201, -0.122183, -0.194151, 0.079529, -0.211620, 0.245808, -0.037177, -0.111413, 0.094859, 0.083557, 0.096739, -0.300553, -0.106279, -0.094205, -0.057992, -0.117998, -0.108161, 0.271511, 0.113355, -0.392816, 0.235937, -0.146777, 0.277873, -0.233215, 0.121318, -0.066391, -0.183459, 0.083788, 0.261114, -0.261028, -0.173067, -0.539646, 0.094365, -0.312545, 0.261827, -0.007897]
-,        [0.007131, 1.944117, -0.245669, -0.379838, -0.808393, -2.326839, 0.133249, 1.518282, -0.744167, -0.034606, -3.297376, 0.512582, -0.006935, -0.943716, 0.159880, 0.119647, 0.253099, -0.036128, 0.235460, -0.828584, 0.095078, -0.125871, -0.034128, -0.505914, -0.487797, 0.354338, -0.532789, -0.375973, -0.783652, -0.389541, 0.088388, 0.473869, -0.677250, -0.261770, -0.014228, -1.029827, -0.175036, -0.717759, -0.182233, 0.882970, -0.155909, -0.212077, 0.287719, 0.098076, 0.268408, -0.475941, -0.306315, -0.265745, -0.584558, -0.412080, 0.298797, -0.145647, -0.097903, -0.452554, -0.664669, 0.058491, 0.060870, -0.156388, -0.933128, 0.226707, 0.183628, -0.529470, -0.333252, -0.288357, -0.591218, -0.097582, -0.721693, -0.208065, -0.221368, -0.180457, -0.014282, -0.922484, 1.919304, -0.228323, -0.889468, 0.117819, 0.119358, -0.111518, 0.011974, -0.124679, -0.267119, -0.042548, 0.159463, -0.137918, 0.145444, 0.221960, 0.072205, -0.128887, -0.083339, 0.343348, -1.867152, 0.020851, -0.667710, -1.002829, -0.206184, -0.654809, -0.316003, 0.463478, -0.517629, -0.531408, -0.258709, 0.021105, 0.210550, -0.636227, 1.473745, -0.194503, 0.015459, -0.303976, -0.863531, -0.126152, -0.359923, -0.465655, 0.004240, -0.185104, 0.498146, -0.129670, 0.027885, -0.061080, 0.416204, 0.559567, -0.157652, 0.476648, -0.515438, -0.590153, -1.369457, -0.248751, 0.161384, 0.118085, -0.697899, -0.596739, 0.062710, 0.241510, 0.189374, -0.382106, 0.396086, -0.373060, -0.539832, 0.208522, -0.472586, -0.597747, -0.149080, -0.686567, 0.431593, 0.775604, -0.009575, -0.807544, -0.485705, -0.453613, -1.213489, -0.518939, 0.092821, -2.737835, -0.269022, -0.192673, -0.916138, 0.136053, 0.716736, 0.088919, 0.770388, -0.607306, -0.260659, -1.751029, 1.041919, -0.351431, 0.572299, -0.283560, 0.843169, 0.268271, 0.227850, 0.027684, -0.632936, -1.012676, -0.804198, -0.060309, 0.226242, -0.099820, -0.542001, -0.315139, -2.643919, -0.887566, -0.467417, 0.080353, -0.030845, 0.010189, -0.254735, -0.221918, -0.477650, -0.500905, -0.298772, 0.378790, -0.196625, -0.998899, 0.612155, -0.108551, -0.432739, -0.467522, 0.172419, -0.127353, 0.776255, -0.912044, 0.258244, -0.132783, -0.423470, 0.211000, -0.154968, -0.735628, -0.204156, -0.184334, 0.737306, -0.222019, -0.197539, 0.889604, 0.015778, -1.033897, -0.450517, -0.269302, -0.570307, 0.759511, -0.863770, -0.179092, -0.549932, -0.390193, -0.361303, -0.269408, -4.576519, -0.164272, 0.012478, 0.593999, 0.135139, -0.562260, -0.484393, 0.062769, -0.005282, -0.436841, 0.175877, 0.187425, 0.380218, -0.894444, -0.214383, -0.319902, 0.061058, -0.161019, -0.701590, 0.112681, -0.687509, 0.177920, -3.136360, -0.149327, -5.993775, 0.671107, -0.822789, 0.546361, 0.089112, -0.483047, -0.272804, -0.456103]
-,        [-0.000864, -0.190002, -0.190026, 0.243944, -0.141104, 0.059416, -0.133260, -0.230136, -0.140684, -0.169018, -0.294519, -0.054454, -0.063029, 0.023362, -0.295895, -0.112504, 0.136522, 0.203020, -0.164790, -0.197620, -0.023705, -0.084132, 0.097840, 0.042903, 0.028747, 0.002570, -0.067691, -0.002337, -0.027919, 0.187683, 0.244588, -0.202269, 0.044843, 0.019172, 0.105786, 0.068741, -0.113851, -0.138297, -0.132165, -0.038996, -0.147907, 0.097537, 0.284701, 0.010390, -0.192899, -0.031436, 0.137939, -0.104047, -0.069801, -0.023318, -0.104676, 0.178280, -0.271902, -0.026551, -0.118648, -0.210791, 0.356063, 0.021190, -0.164981, 0.003094, -0.114804, 0.060463, 0.003994, -0.013772, -0.121515, -0.141010, -0.201759, -0.076742, -0.398271, -0.081469, -0.273213, -0.089253, -0.338655, -0.046072, -0.241332, 0.153054, -0.144759, 0.076608, -0.251867, 0.002905, -0.099900, -0.251928, 0.042746, -0.164784, 0.114034, 0.313662, -0.186969, 0.099197, -0.228630, -0.347880, -0.182387, -0.028047, -0.202592, -0.031815, -0.075849, -0.151535, -0.297105, 0.156667, -0.100115, -0.054462, -0.041001, -0.300684, -0.336604, 0.283044, -0.073122, 0.066297, -0.092543, 0.126020, -0.023515, 0.083830, -0.116621, 0.201069, 0.153505, 0.080442, 0.108920, -0.066790, -0.021827, -0.065932, -0.178316, -0.075613, 0.073357, -0.249766, 0.144449, 0.154058, 0.002822, -0.278783, -0.083388, -0.102816, -0.186551, -0.368318, -0.184515, 0.075803, -0.205529, 0.013862, 0.081794, -0.122009, -0.033058, -0.224012, 0.032931, -0.010780, 0.018128, -0.001147, -0.267789, -0.135037, -0.134847, 0.069068, -0.493433, -0.133325, -0.106154, -0.044708, -0.085426, -0.078280, 0.255519, 0.035243, -0.187746, 0.106892, -0.207889, 0.147587, -0.052755, -0.152521, -0.076790, 0.074336, -0.290629, -0.154368, 0.082606, 0.118038, 0.064506, -0.028778, -0.062256, -0.097275, -0.134241, 0.044954, -0.163754, 0.043898, -0.039197, 0.093378, -0.026767, -0.059435, 0.055331, 0.178507, 0.146940, 0.196798, -0.156961, -0.051486, -0.018141, -0.245253, -0.263942, 0.020415, 0.084396, -0.108674, -0.187814, -0.174691, 0.044774, 0.081522, -0.197665, 0.100963, 0.110695, -0.185989, -0.043483, 0.027452, 0.033883, -0.029654, 0.204231, 0.012220, -0.035444, -0.095964, -0.290082, -0.114222, 0.089415, -0.319320, 0.097379, 0.015515, 0.123129, 0.054411, -0.173032, -0.218275, 0.007711, -0.303291, -0.029148, -0.134281, 0.137276, 0.002916, -0.014602, 0.011082, -0.211970, 0.068148, -0.108702, 0.009307, -0.379074, 0.243780, -0.044699, -0.270315, -0.014013, -0.026971, 0.028778, -0.136378, -0.034438, -0.033412, 0.103794, -0.164566, -0.144122, -0.188068, -0.312284, -0.141784, -0.139689, -0.114722, 0.009940, -0.158443, 0.142887, -0.114786, 0.122695, -0.136367, -0.171264, -0.054166, 0.131362, -0.146157]
-,        [-0.097265, -0.093980, 0.045555, -0.065127, 0.018083, -0.169975, -0.139166, -0.120621, 0.012874, 0.088130, 0.223925, -0.229582, 0.121275, -0.051391, -0.224998, -0.033633, -0.154620, 0.081483, 0.126513, 0.353871, 0.175417, 0.069177, -0.059985, 0.214979, -0.358900, -0.179968, 0.061953, -0.143237, 0.230346, 0.116558, -0.075265, -0.032111, 0.135262, -0.250179, 0.031986, 0.205102, -0.115602, -0.039771, -0.084880, -0.056061, -0.066520, -0.034450, 0.187213, -0.032497, 0.148542, 0.154962, 0.065635, -0.151057, 0.058974, 0.013053, -0.157705, 0.205321, -0.271478, -0.200416, -0.019446, -0.025914, -0.296337, -0.223917, 0.126871, -0.151410, -0.104129, -0.362730, -0.349293, -0.527359, 0.145447, 0.115890, -0.038535, 0.028735, -0.012752, 0.031418, -0.015296, -0.081064, -0.021013, -0.152606, -0.345409, 0.029434, 0.119314, 0.060353, 0.015484, -0.298435, -0.058970, -0.101623, -0.024378, -0.058426, -0.009840, -0.076932, 0.108141, 0.106225, -0.040302, -0.001133, 0.042192, -0.022553, 0.245488, 0.031274, 0.149444, -0.167263, -0.334306, 0.114068, 0.040741, 0.006767, 0.029433, -0.159310, 0.039563, 0.048164, -0.281048, 0.038669, -0.018350, 0.041523, -0.030023, -0.005251, 0.052607, -0.221692, -0.059951, 0.039662, -0.151420, 0.110110, -0.075323, -0.356855, 0.273782, 0.085410, 0.129514, -0.057700, -0.099774, -0.061716, 0.170886, -0.200945, -0.021316, 0.014156, -0.166756, 0.120359, -0.253065, 0.021939, -0.137850, -0.050377, 0.188421, -0.022584, 0.129422, -0.190984, -0.118728, 0.351523, -0.148320, 0.036733, -0.120933, -0.328753, 0.111842, -0.263234, -0.081230, -0.023085, -0.034927, -0.032838, 0.128096, -0.065716, 0.149397, -0.043088, -0.306722, 0.123668, -0.170370, 0.247186, 0.155566, -0.311320, -0.063873, -0.093832, 0.030498, -0.236831, -0.015609, 0.163191, 0.075501, -0.173826, 0.007170, -0.101493, -0.135301, -0.175818, -0.446058, 0.041221, -0.171605, -0.202251, 0.035472, -0.190842, -0.041914, 0.064159, -0.124393, -0.127667, -0.092606, -0.334395, -0.117357, -0.267004, 0.074143, 0.200125, -0.096490, 0.060320, -0.037388, -0.056366, -0.081836, 0.065503, -0.242148, -0.058413, -0.028048, -0.090485, 0.142055, -0.216993, -0.223060, -0.140739, -0.006981, 0.236561, 0.025190, 0.150033, 0.002674, 0.120945, -0.055250, -0.044412, -0.057449, -0.255459, -0.171932, 0.262830, 0.185957, -0.245860, 0.176588, 0.220675, 0.044958, 0.081402, -0.411903, 0.126164, -0.068811, -0.187495, -0.227788, 0.201435, -0.122196, -0.074793, -0.081664, -0.117704, 0.024692, -0.027484, 0.020983, -0.036063, 0.198135, -0.124823, -0.026858, -0.004772, -0.086774, -0.080480, 0.028156, -0.048941, 0.097174, -0.153638, 0.206779, 0.058056, 0.249479, 0.006989, -0.233033, 0.059911, 0.407849, -0.132819, -0.248424, 0.056362, -0.053349, -0.008970]
-,        [-0.328718, 0.076825, 0.008990, -0.364181, -0.032416, -0.337027, -0.253278, -0.164964, 0.346185, 0.273470, -0.266986, -0.340128, 0.313045, 0.151654, -0.004152, -0.099436, -0.221386, -0.026139, -0.164250, 0.168077, -0.110704, 0.400221, -0.061783, -0.106827, -0.214443, -0.013768, 0.103745, -0.313664, -0.017062, -0.311312, 0.057327, -0.369750, 0.156661, -0.044366, -0.263077, -0.354603, 0.026878, 0.020524, -0.050306, -0.394255, -0.489916, 0.098202, 0.063483, -0.215294, 0.038250, 0.062964, 0.183998, -0.361351, 0.003797, -0.220849, -0.000774, -0.078262, -0.224323, 0.098620, 0.033099, -0.006926, -0.671599, 0.150540, 0.320931, -0.116969, -0.058726, -0.211304, -0.309615, 0.093164, -0.271341, 0.169156, -0.555046, 0.220971, -0.659194, 0.120010, 0.017719, -0.330120, -0.110145, -0.338506, 0.270741, -0.051972, -0.198324, -0.439714, -0.044998, -0.352213, -0.116519, -0.017590, -0.140301, -0.061846, -0.042565, -0.195962, 0.318856, -0.033178, 0.115359, 0.222257, 0.025196, -0.144262, 0.053396, 0.199509, 0.017532, 0.092675, -0.061071, -0.248626, -0.443292, -0.069241, -0.042235, -0.220443, -0.010265, -0.359937, 0.005284, 0.103476, -0.052792, 0.069545, -0.023392, 0.261975, -0.393385, 0.232052, 0.352582, 0.290743, 0.328159, 0.024763, -0.098496, -0.328313, -0.392569, -0.543261, -0.193624, -0.228598, 0.236456, -0.098070, -0.433981, -0.217066, -0.114419, 0.019802, -0.013127, -0.157831, -0.361212, -0.020059, -0.154357, -0.176591, -0.729265, -0.094729, -0.133277, -0.171224, -0.466218, -0.206230, -0.148205, 0.107186, -0.301098, -0.358793, -0.334977, 0.292538, -0.351508, -0.123327, -0.427620, 0.033843, -0.106157, 0.337876, 0.174928, -0.131798, -0.288484, 0.034904, -0.274849, -0.107901, -0.231777, -0.077198, -0.121999, -0.083677, -0.111851, 0.137138, -0.147180, 0.275165, -0.121449, -0.382470, -0.133345, -0.315664, -0.002348, -0.036448, -0.348796, -0.080852, -0.241292, -0.184932, -0.306953, -0.337259, -0.277244, -0.129218, -0.279876, -0.293041, -0.151849, -0.242410, 0.348901, -0.065425, -0.195057, -0.093549, -0.300268, 0.121016, -0.309498, -0.238197, -0.032869, 0.208426, -0.404858, -0.194233, -0.105868, -0.511898, -0.021215, -0.049410, -0.160360, -0.270507, -0.492828, -0.170855, 0.169054, -0.214664, -0.321046, -0.132711, 0.860542, -0.208172, -0.217808, -0.264616, 0.074626, -0.157399, -0.125941, -0.067010, -0.035574, -0.280142, 0.034468, -0.209253, -0.379001, -0.290628, 0.118434, -0.270142, -0.005005, -0.445049, -0.233523, -0.075447, -0.082251, -0.248636, 0.006232, -0.251362, 0.051205, -0.331161, -0.104363, -0.052159, 0.074772, 0.204873, -0.002847, -0.012420, -0.248980, -0.162840, -0.277533, -0.125270, -0.061125, 0.404474, 0.079104, -0.064852, 0.070409, 0.601890, -0.389006, -0.234537, -0.167623, 0.112871, -0.105854, 0.171286]
-,        [-0.173457, -0.052177, -0.167466, -0.045912, -0.148004, -0.043190, 0.162860, -0.055443, -0.034054, -0.329086, -0.123070, -0.051530, -0.119536, -0.190669, -0.208772, 0.190929, -0.050358, 0.007691, 0.234536, -0.135023, -0.177439, 0.038623, -0.197283, 0.132246, 0.082995, -0.000521, -0.068993, -0.221035, -0.184388, -0.140533, -0.127474, 0.024297, -0.067053, -0.165721, 0.005908, -0.021497, 0.012872, -0.005542, 0.018592, -0.327813, -0.157934, -0.035266, 0.184084, -0.055650, 0.064469, 0.007737, 0.016469, -0.037536, -0.048575, -0.130125, -0.219850, 0.033070, -0.241333, -0.002508, 0.368275, -0.016408, 0.009837, -0.098281, -0.066823, -0.066344, -0.117182, 0.149410, -0.050285, 0.208366, 0.054706, -0.063995, -0.239829, -0.211149, -0.131089, 0.077729, -0.117607, 0.092296, 0.099843, 0.091821, -0.123964, -0.241171, 0.096445, -0.265130, -0.105361, -0.074941, -0.170601, 0.145372, -0.189158, -0.182228, -0.160732, -0.132252, -0.137528, -0.124967, -0.073851, -0.050189, -0.205154, -0.030123, -0.022977, 0.169841, 0.101932, 0.013488, 0.000470, -0.050569, -0.171527, 0.040260, -0.097126, 0.134787, -0.156083, -0.279066, 0.120799, -0.055933, -0.038463, 0.015768, -0.109324, 0.084981, -0.105833, -0.056822, -0.056561, 0.101735, 0.025534, -0.100676, 0.028153, 0.026114, -0.239484, 0.024974, 0.042095, -0.163915, -0.365923, 0.146903, -0.104884, 0.005316, -0.027596, -0.137071, -0.002801, 0.016198, -0.020884, 0.062055, 0.165546, -0.098810, -0.022755, -0.277044, 0.050043, -0.152126, -0.229353, -0.178715, -0.063845, 0.078065, 0.143970, -0.231079, 0.046039, 0.000562, -0.085619, -0.147731, -0.190932, -0.078783, -0.026327, -0.048792, 0.135310, -0.121370, -0.140586, -0.233312, -0.111596, -0.108176, 0.074289, -0.161508, -0.147628, -0.124980, -0.071638, 0.038561, 0.064404, 0.007545, -0.161928, 0.108930, -0.015395, 0.238939, -0.050159, 0.068394, -0.045673, 0.021670, -0.165535, 0.070567, 0.084264, 0.055723, -0.163663, -0.152793, -0.024523, -0.212680, 0.056925, -0.093930, 0.062594, 0.129972, 0.235053, -0.051963, -0.023021, -0.128644, -0.049861, -0.112511, -0.034884, 0.029540, -0.000692, -0.173980, 0.040252, 0.114995, -0.167641, 0.041609, 0.030875, -0.159233, 0.013671, -0.069362, -0.135796, 0.050946, 0.074838, -0.030047, 0.052944, -0.077573, 0.155753, -0.067454, 0.166294, 0.185174, -0.163871, -0.076221, 0.065436, -0.044531, 0.049492, 0.032085, -0.016210, -0.218766, 0.034486, -0.134665, -0.085061, 0.046572, -0.338800, 0.081718, -0.497948, 0.161225, -0.211752, -0.242901, -0.078395, 0.012847, -0.121117, -0.156068, 0.119318, 0.020532, -0.112685, -0.331296, -0.021994, -0.259230, -0.106490, 0.096684, 0.098162, 0.052944, -0.088515, -0.074016, 0.178026, -0.131948, 0.084557, -0.016754, -0.166194, 0.093241, 0.133485, -0.242429]
-,        [-0.068019, 0.084197, -0.118572, 0.160449, 0.100469, -0.179749, -0.034623, 0.033364, -0.057923, -0.034684, -0.097899, -0.080603, 0.023238, -0.217173, 0.359285, -0.575287, -0.109037, 0.188819, -0.007876, -0.291041, -0.306240, 0.277042, -0.088944, -0.304881, 0.237947, -0.028890, -0.012244, 0.466317, -0.416483, 0.021838, 0.053729, -0.614304, -0.113037, -0.097464, -0.072716, -0.179884, -0.062623, 0.048194, -0.103210, 0.181292, -0.126398, -0.097937, 0.064701, -0.236717, -0.344261, 0.449299, 0.390355, 0.030037, -0.016484, 0.022456, -0.128632, -0.280529, -0.306774, 0.027519, 0.129524, -0.440660, -0.157077, -0.204346, -0.427599, -0.032200, 0.034020, 0.203704, 0.053947, -0.221884, -0.214428, -0.318767, -0.033149, -0.030692, -0.465664, 0.083791, -0.127998, -0.164632, -0.063590, -0.368442, -0.126180, 0.127571, 0.123808, -0.311267, -0.033147, -0.209725, 0.046256, -0.505579, -0.263133, 0.229425, 0.137134, 0.071614, -0.294536, 0.094472, 0.032370, -0.163408, 0.114768, 0.347478, -0.031810, -0.087054, -0.293639, -0.050675, 0.167830, 0.087786, 0.336721, -0.236061, -0.044648, -0.424457, 0.020758, 0.030040, 0.031024, -0.382629, -0.541550, 0.220729, 0.220861, -0.010187, 0.016571, -0.357726, -0.100076, 0.381463, -0.212646, 0.020224, 0.013942, -0.124579, 0.049872, 0.254416, 0.079888, -0.041186, -0.360736, 0.206050, 0.387341, 0.335599, -0.239387, -0.073569, -0.058110, 0.008575, -0.414889, -0.253979, 0.322994, 0.028740, 0.044862, 0.107173, 0.150145, -0.368736, -0.485758, 0.233356, 0.043176, -0.371811, -0.423696, -0.101226, -0.252525, 0.047812, -0.052523, -0.025525, -0.350724, -0.041506, -0.249645, -0.391208, 0.231068, -0.284989, -0.411951, -0.300194, -0.169221, -0.066054, 0.200026, 0.098834, -0.225924, -0.151265, -0.156215, -0.250257, 0.120186, -0.326914, 0.176668, 0.067043, -0.443555, -0.068451, -0.007256, 0.229349, 0.193601, -0.358332, -0.546580, 0.388458, -0.165006, 0.202056, -0.286386, -0.525863, -0.033402, 0.174029, -0.036419, 0.028476, 0.053597, 0.259646, -0.398903, -0.216094, 0.250921, -0.559874, -0.176057, -0.266256, 0.154696, -0.070086, 0.167384, -0.295802, -0.261640, -0.005716, -0.132250, -0.086590, -0.021641, -0.304077, -0.449596, -0.311771, -0.054048, -0.171129, -0.107823, -0.208406, 0.309043, 0.081032, -0.181387, 0.040668, -0.110709, -0.163318, -0.216288, -0.078642, 0.085991, 0.002452, -0.111740, -0.089111, -0.033528, 0.134028, -0.321396, -0.157704, 0.045967, 0.171237, -0.186406, -0.138398, 0.129075, -0.026565, -0.542442, -0.045699, 0.109536, -0.376419, 0.479739, -0.301739, 0.217432, 0.063457, -0.318313, -0.171629, 0.050375, 0.104345, -0.420791, 0.202670, -0.224487, 0.123484, 0.023097, -0.039693, -0.051631, -0.541206, -0.013365, 0.084421, -0.363084, -0.288492, -0.241380, 0.054040]
-,        [0.010281, -0.104326, -0.331742, 0.431077, 0.531314, -0.651294, -0.662521, 0.166352, 0.961375, 0.064892, 0.437248, -0.168280, 0.248765, -0.442272, -0.217651, -0.119998, -0.002059, -0.234024, -0.882121, -0.558211, -0.339088, 0.143694, -0.102833, -0.207034, 0.428711, 0.027523, 0.026983, -0.204781, -0.958731, -0.018613, -0.374710, 0.014085, 0.118100, -0.008389, -0.073502, -0.087045, -0.078481, 0.242016, -0.424111, -0.328547, -0.149766, -0.038156, -0.283832, 0.052346, 0.392775, -0.298019, -0.455504, 0.005242, -0.228168, 0.023582, -0.539999, 0.223713, -0.191212, -0.217244, -0.227810, -0.477282, 0.491765, 0.077017, 0.427699, 0.156155, -0.191398, -0.150849, -0.442589, -1.327815, -0.622091, 0.047621, -0.039314, -0.042061, -0.092507, -0.742507, -0.171141, -0.231673, 0.351273, -0.486757, 0.111233, -0.314057, 0.081885, -0.216850, 0.592621, -0.423429, -0.818602, 0.447292, -0.793755, -0.432272, -0.289591, 0.183561, 0.299470, -0.097373, -0.172176, -0.440608, -0.179584, -0.373784, -0.071692, 0.125470, 0.311777, 0.020583, 0.085470, 0.494738, -0.201275, -0.095688, -0.233245, 0.007992, 0.266859, 0.183788, 0.147202, -0.508252, -0.667996, -0.158847, -0.116152, -0.093206, -0.360104, 0.267956, 0.004693, 0.283945, 0.470411, 0.216705, -0.327701, -0.230404, 0.368865, 0.215865, -0.398070, -0.206894, -0.051706, -0.046349, -0.063518, 0.395556, -0.406340, -0.308088, -0.488257, 0.054009, -0.266598, 0.879718, -0.339812, -0.218589, -0.057522, -1.200006, -0.383155, 0.159582, -0.268059, 0.215115, -0.005737, 0.337551, -0.017876, -0.530602, -0.361576, -0.624768, -0.255905, -0.676516, -0.308535, 0.003324, 0.356102, -0.525178, 0.192962, -0.712616, 0.192364, 0.096669, 0.312147, 0.103200, 0.304597, -0.389555, 0.328867, -0.195766, 0.276694, -0.438243, -0.286271, -0.482568, -0.465470, -0.181645, -0.235744, 0.543406, -0.235295, 0.009375, -0.501730, -0.565815, 0.028496, 0.060130, -0.274872, -0.222161, -0.079309, -0.383565, -0.097956, -0.183931, 0.023921, -0.749442, -0.368096, -0.323210, -0.451542, -0.178293, 0.097932, 0.489665, -0.160110, 0.106074, -0.045877, -0.174366, 0.091377, -0.634846, 0.199641, -0.490028, 0.013809, -0.674447, -0.091033, -0.687990, -0.046815, 0.244757, -0.498488, -0.355021, -0.156419, 0.499878, 0.504771, -0.119471, 0.415208, 0.030793, 0.161234, -0.185504, -0.014920, -0.658468, -0.242351, -0.478486, -1.087363, -0.886768, 0.867785, -0.384524, -0.161986, -0.061660, 0.003920, -0.128348, -0.659931, -0.533338, -0.067487, 0.206001, -0.399624, 0.024564, -0.090197, -0.392282, -0.066687, -0.064258, 0.311009, 0.720762, 0.283146, -0.397292, -0.604130, -0.066758, -0.621683, 0.314175, -0.569048, -0.249388, 0.654342, 0.084481, -0.556567, -0.092160, -0.752027, -0.111205, -0.326952, 0.425692, 0.021708, -0.221414]
-,        [0.233275, 0.312939, -0.060741, 0.284496, 0.630768, 0.153423, -0.272378, -0.457297, -0.243040, 0.131666, -0.192430, -0.285445, 0.221750, -0.232338, 0.253190, -0.178209, -0.759927, 0.440615, 0.130673, -0.265927, 0.410039, 0.129104, -0.540434, -0.521094, -0.263642, 0.102046, 0.211938, 0.108615, 0.092839, 0.012188, -0.099720, 0.003979, -0.106780, 0.003967, 0.135255, -0.373809, -0.135552, 0.151486, -0.052547, 0.111890, -0.360284, -0.315777, 0.366327, 0.796128, 0.493183, 1.089049, 0.007951, 0.493844, 0.629523, 0.052291, 0.198615, 0.445145, -0.514441, 0.307273, -0.179194, -0.521471, 0.167739, -0.001249, -0.069665, 0.156534, 0.834123, 0.300755, -0.547909, 0.367617, 0.152714, -0.469396, -0.174736, -0.161839, -0.105472, 0.104353, 0.625264, -0.427923, -0.044761, -0.347936, 0.385482, -0.813246, 0.146014, 0.141830, 0.052181, -0.329043, -0.102656, -0.272239, 0.558176, 1.126662, 0.226703, 0.425192, 0.641115, 0.017005, 0.611776, 0.594847, -0.237408, 0.468103, -0.602780, 0.372869, -0.091811, 0.877240, -0.290042, 0.381898, 0.020808, -0.004688, 0.422719, 0.314700, 0.329194, 0.401810, 0.375503, -0.118453, 0.179387, -0.260421, -0.142860, 0.222062, 0.645626, 0.547055, 0.544282, -0.013457, -0.120807, 0.532974, 0.257482, 0.312349, 0.033214, 0.332161, -0.060824, -0.349013, -0.124028, 0.279531, -0.184358, 0.267712, 0.398930, 0.192490, 0.033801, 0.740949, 0.554667, -0.156970, -0.233851, 0.555372, -0.153335, -0.317784, -0.481218, 0.476986, -0.091595, -0.088394, -0.379973, 0.434777, -0.391861, 0.507475, -0.133730, 0.352299, -0.721247, -0.083715, -0.016678, -0.597261, -0.490171, -0.653298, 0.381742, 0.687912, 0.277790, 0.791153, 0.181425, 0.195374, -0.088915, 0.330152, -0.646683, 0.405053, 0.050841, 0.357274, 0.887821, 0.708090, -0.056333, -0.054415, -0.078222, 0.740516, -0.212208, -0.183585, 0.311088, -0.071219, -0.648859, 0.133460, -0.184070, 0.381012, -0.304182, -0.146116, -0.749999, 0.052993, 0.478636, -1.076025, 0.553076, -0.300863, -0.712213, -0.043810, 0.347746, 0.103011, 0.312302, 0.466622, 0.025951, -0.036245, -0.255021, 0.516361, -0.177868, -0.313465, -1.190804, -0.033070, -0.442576, -0.441811, 0.816244, -0.162039, 0.958035, -0.514377, -0.085403, 0.088478, -0.407873, 0.069963, 0.411372, 0.727428, -0.146044, 0.453327, 0.052982, -0.217682, 0.582836, -0.843389, -0.346149, 0.607133, 0.334593, 0.127833, -0.404392, -0.156495, 0.095432, 0.495830, -0.415430, -0.046268, 0.043019, -0.527632, -0.255562, -0.319088, 0.156372, 0.331603, 0.759720, -0.913872, -0.139947, -0.350104, -0.055064, -0.487503, -0.250249, 0.324765, 0.194152, -0.240278, -0.109090, 0.484603, -0.369487, -0.363463, -0.100371, -0.176255, -0.075654, 0.198923, 0.007776, 0.118739, -0.329511, -0.189189]
-,        [-0.528324, -0.064049, -0.523750, -0.039402, -0.099861, 0.076997, -0.019486, -0.270259, 0.152918, -0.431683, 0.501409, -0.116187, -0.224647, -0.049293, -0.289183, -0.513322, -0.343282, -0.025787, -0.173994, -0.371846, -0.100694, 0.002824, 0.061271, 0.117602, -0.331016, 0.089391, -0.258041, -0.185268, 0.375939, -0.191811, -0.276542, -0.143654, -0.352844, 0.218954, -0.149742, 0.060774, -0.631605, -0.281827, -0.025932, -0.390382, -0.223705, 0.167600, -0.044611, 0.154208, -0.312510, -0.143860, 0.191090, -0.504589, -0.486157, 0.233168, 0.124524, -0.443607, -0.329838, -0.106575, -0.171589, -0.123777, -0.168045, -0.134353, -0.100653, 0.263073, -0.440752, -0.147199, 0.344480, -0.218820, -0.086848, -0.028698, 0.034978, -0.059881, -0.147443, -0.102029, 0.388476, -0.090495, 0.346775, -0.056927, -0.093196, -0.330000, 0.019871, -0.211155, -0.032867, -0.611290, -0.036258, 0.030272, -0.920214, -0.155934, -0.625808, -0.043349, 0.446971, 0.017382, 0.111715, 0.355473, 0.118026, 0.216139, -0.716099, 0.069206, 0.175837, 0.265176, 0.153904, -0.185287, -0.083484, -0.131346, 0.086342, -0.221224, -0.478098, -0.214978, -0.050261, 0.164613, -0.301566, -0.078922, -0.091253, -0.016122, -0.001511, -0.200266, -0.056668, 0.097340, -0.154625, 0.205820, -0.120728, -0.018223, -0.253552, -0.321019, -0.019499, 0.073131, -0.376405, 0.291371, -0.337907, -0.276906, 0.313829, -0.446414, -0.054098, 0.072167, 0.185840, 0.006338, 0.348870, 0.098308, -0.239036, -0.258991, -0.288214, -0.064893, -0.323219, 0.125067, -0.113681, -0.651394, -0.197552, 0.182125, -0.480838, -0.093761, -0.173943, 0.041592, -0.211799, -0.121160, -0.723270, -0.350413, -0.353934, 0.167836, -0.331696, 0.133766, -0.427621, -0.433031, -0.270336, -0.042920, -0.125776, -0.188252, 0.211343, -0.126628, 0.016733, 0.267485, 0.095615, -0.029851, -0.047738, 0.306034, 0.329904, -0.092295, -0.027966, -0.357340, -0.190039, 0.109033, -0.170294, -0.386030, -0.626155, -0.008304, 0.103280, -0.146057, -0.473885, -0.101402, -0.564184, -0.094083, -0.607466, 0.071135, 0.157459, -0.179960, 0.039836, -0.107481, 0.504781, 0.048048, -0.143005, -0.219914, -0.453191, 0.354915, -0.003657, -0.046917, 0.214710, -0.070017, 0.111137, -0.481341, 0.083785, 0.016627, -0.293772, -0.357295, 0.559526, 0.185343, 0.037073, -0.315370, 0.078748, 0.083577, -0.186575, -0.332628, 0.006455, 0.130528, -0.371023, -0.294912, -0.226191, 0.000077, -0.251671, -0.124816, 0.431836, -0.080602, -0.139933, -0.060716, 0.143300, -0.338234, -0.520280, -0.179920, -0.128145, 0.181858, 0.011237, 0.178308, 0.108214, -0.038494, 0.058175, -0.125409, 0.383262, -0.069148, -0.111207, -0.431940, -0.289059, -0.228040, -0.221033, -0.434967, -0.348615, 0.105334, -0.096237, -0.019466, -0.320401, -0.199676, 0.084124, -0.032691]
-,        [-0.721493, -0.441079, -0.640182, 0.308243, -1.275177, -0.160704, -0.294369, -0.496500, -0.156445, -0.101802, 0.048672, 0.334469, -0.966824, 0.926796, 1.117488, -0.011231, 0.670040, 0.624819, -0.352018, 0.424593, 0.233241, -0.064274, -0.189639, -0.456474, -0.802482, -0.081744, -0.402594, -1.325296, 0.032570, 0.109035, 1.020770, -0.393493, 0.113768, 0.312066, 0.086586, 0.119236, -0.422733, 0.627140, -0.419809, -0.178899, 0.018568, 0.234116, -0.478183, 0.531651, 0.303177, 0.094211, 0.478315, -0.941298, 0.692428, 0.197974, -0.363631, -1.071461, -0.081117, 0.151574, -0.447358, 0.099076, -0.176052, -0.108142, -1.171234, -0.527521, -0.205319, -0.873507, -1.149819, 0.435535, 0.060902, -0.328716, 0.253305, 0.467481, -0.556617, -0.182289, -0.192228, -0.235072, -0.211636, 0.287782, -0.222182, -0.622273, -0.182103, -0.426495, -0.037144, -0.420783, -0.780824, -0.121836, 0.641292, 0.311339, 0.300085, -0.004764, 0.195656, -0.033485, -0.140178, -0.056643, 0.351187, -0.167379, 1.029256, -0.747599, -0.231866, -1.114424, -0.740329, 0.007543, -0.414899, -0.524100, -0.170881, -0.751635, 0.854669, -0.929130, 0.077797, 0.189846, -0.644762, 0.159187, -1.003292, -0.595532, -0.339381, 0.235636, -0.391512, -0.474823, -0.635231, 0.269547, -1.279451, 0.032510, -0.560370, -0.678927, 0.425838, 1.336435, -0.327037, -0.813491, -0.147632, -0.315590, -0.815517, -0.425970, -0.902942, 0.454212, 0.264102, 0.895816, -0.168228, 0.487308, 0.995856, -0.939468, -0.841372, -0.175448, -0.073619, 0.262105, 0.117219, 0.041888, -1.403233, -0.228994, -0.017034, -0.135775, -0.345285, 0.116200, 0.009436, -0.168342, -1.000623, 0.384355, -0.446069, -0.498234, 0.040594, 0.164273, -0.248829, 0.890506, -0.067210, -0.105462, -0.807485, 0.203052, -0.531529, -0.527746, 0.102390, -1.014681, -0.031323, 0.000491, 0.864050, -0.167238, -0.595571, -0.908326, -0.356602, -0.422195, -0.063149, 0.453163, 0.071339, 0.168306, -0.733152, -0.335725, -0.860517, -0.365688, -0.660206, 0.154043, 0.360047, 0.060658, 0.382483, -0.628478, -1.449049, -0.511932, -1.235745, 0.442572, 0.193901, -0.002503, -0.031955, -0.712489, 0.316465, 0.679659, -0.822682, -0.029680, 0.038416, 0.355567, -0.348223, -0.952393, -0.179428, 0.262268, -1.334198, -0.170336, -0.372946, -0.450743, 0.120647, -0.109317, -0.029756, -0.434335, -0.129778, 0.780600, -0.962135, 0.538752, -0.159607, -1.100493, -1.043632, -0.673590, -0.314147, -0.670610, 0.578474, -1.709928, -0.110052, -0.695099, 0.289846, 0.129049, -0.367660, -0.473695, 0.119796, -0.610993, -0.167669, -0.170564, -0.695743, -0.895343, -0.911139, -0.199553, -0.207714, 0.009900, -0.509781, 0.600573, 0.736913, 0.267446, -0.188336, -0.557794, 0.150368, -1.311938, -1.428565, -0.219545, -0.639576, 0.804780, -0.475269, 0.089902]
-,        [0.347443, -0.051653, -0.818670, 0.556344, 0.256038, -0.178259, -0.410440, -0.629517, -0.426789, 0.032648, -0.540160, -0.169827, 0.280267, 0.308492, -0.215632, 0.292136, -0.135694, 0.338751, 0.054513, 0.480530, 0.670957, 0.232289, -0.135253, 0.118397, -0.276586, -0.249125, 0.486271, -0.450345, 0.576586, 0.574426, -0.386042, -0.813792, -0.064523, -0.029829, -0.150057, 0.374630, 0.347384, -0.471730, 0.371709, 0.306152, -0.033522, 0.174614, 0.771216, 0.395448, 0.219539, 0.025629, 0.480642, -0.631213, -0.257519, 0.060928, -0.252805, -0.131480, -0.601652, 0.018826, 0.433003, -0.229893, 0.150946, 0.359728, 0.440890, 0.213169, 0.382792, 0.112662, 0.314418, -0.005041, -0.080033, 0.565220, 0.200233, 0.226565, -0.371450, 0.054166, 0.689164, -0.593449, -0.552796, 0.342515, 0.248069, 0.339427, -0.001638, 0.215038, 0.249092, -0.231860, -0.130178, -0.085284, 0.523669, -0.420388, -0.101081, 0.344767, 0.209296, -0.113380, -0.285055, -0.093573, 0.622756, -0.067411, -0.046867, 0.320542, -0.086943, -0.403459, -0.640548, 0.470499, -0.733371, 0.338044, -0.579480, 0.461558, 0.064476, 0.337525, -0.212661, -0.430063, -0.371924, 0.008888, 0.502903, -0.142129, 0.338173, 0.269509, -0.315200, 0.461707, -0.438417, 0.492103, 0.316994, -0.743275, 0.056651, -0.252739, -0.212471, -0.380275, -0.239459, -0.304600, -0.904249, -0.536211, 0.221001, -0.384854, -0.265291, 0.508015, 0.838708, 0.008428, 0.073914, -0.317176, 0.135187, 0.016750, -0.322933, 0.540389, 0.149838, 0.512112, -0.040872, 0.150001, -0.196256, 0.362662, 0.043034, -0.242208, -0.265839, 0.323412, -0.336435, 0.554821, 0.694195, -0.236724, 0.438971, -0.385320, -0.027576, -0.113974, -0.544445, -0.286663, 0.028682, -0.239977, 0.426295, 0.481734, 0.109590, -0.492396, 0.029959, -0.386002, 0.085823, -0.088065, 0.251239, 0.057231, -0.187806, 0.219760, 0.167995, 0.137244, -0.338485, 0.215637, 0.098197, -0.263613, -1.339540, -0.475453, -0.340200, 0.034593, -0.005824, 0.159442, -0.401139, -0.069764, -0.221933, 0.015279, -0.191985, 0.559030, 0.225279, 1.038370, 0.907022, -0.049067, -0.409200, 0.066055, -0.142111, 0.045968, -0.281609, -0.196871, -0.192318, -0.062323, -0.221673, 0.292049, 0.206824, -0.404551, -0.747189, 0.360776, 0.115229, -0.105814, 0.253188, 0.499926, 0.060019, 0.491262, 0.360939, 0.474228, -0.283284, -0.880688, 0.142616, 0.348167, -0.074720, -0.887605, 0.094821, 0.181902, -0.542053, -0.220391, -0.139936, 0.257748, 0.464008, 0.221953, 0.343933, 0.296179, -0.020425, -0.609482, 0.360764, -0.151106, 0.625827, 0.110654, -0.163540, -0.701373, 0.430153, -0.132529, 0.011940, -0.456260, 0.306717, 0.188746, 0.183378, -0.872260, -0.123807, -0.618595, -0.023386, 0.057130, -0.340288, -0.480555, 0.233669, 0.281051]
-,        [-0.148411, -0.136184, 0.117921, -0.266007, 0.095393, -0.047574, -0.092931, 0.215493, 0.138356, -0.135896, 0.089309, -0.211360, 0.000760, 0.039322, -0.429769, -0.310478, 0.101078, 0.001039, -0.102507, -0.197676, 0.002828, 0.061662, -0.057720, 0.002878, -0.198984, -0.001211, 0.185857, 0.252359, -0.103537, -0.155249, -0.058388, -0.067397, -0.201426, 0.116170, -0.116241, 0.070252, 0.029842, -0.183981, -0.358720, -0.179758, 0.124640, -0.009169, -0.140632, -0.057256, -0.118860, -0.064287, -0.305649, -0.168617, 0.146660, -0.270600, -0.185373, 0.039212, -0.297706, 0.066506, -0.197303, -0.170145, 0.160211, 0.144377, 0.210467, -0.096733, -0.083541, 0.042229, -0.207765, -0.002971, 0.166352, -0.009384, -0.212129, -0.052714, -0.175228, -0.239390, -0.094542, -0.198239, -0.155326, -0.245238, -0.156821, 0.161398, 0.049093, -0.128204, 0.227586, -0.124707, -0.137633, -0.187256, -0.052541, -0.310611, -0.143707, 0.001595, -0.068557, 0.088518, -0.131510, 0.432412, 0.014184, 0.080939, -0.157235, -0.131036, 0.176655, 0.016991, -0.199792, 0.059805, -0.118232, -0.168858, 0.007641, -0.216503, -0.082519, 0.032398, -0.010825, 0.029426, -0.007990, 0.089319, -0.002910, 0.091888, -0.140074, -0.048639, -0.118948, 0.005717, -0.558358, -0.291773, 0.092841, -0.026268, -0.246003, -0.186440, 0.103371, -0.142428, 0.101593, 0.139390, -0.140722, 0.121893, 0.195392, 0.020013, -0.233165, -0.080280, 0.133420, -0.257128, 0.075691, -0.093164, -0.292091, 0.027698, 0.165646, 0.007501, -0.140921, -0.005264, -0.146062, 0.222842, 0.221902, -0.076314, -0.153690, -0.109991, 0.321326, 0.289485, -0.144494, -0.014065, -0.191935, -0.016890, -0.534337, -0.382731, -0.084994, 0.189001, 0.136857, -0.031229, -0.027346, 0.019558, 0.175527, -0.243226, 0.039821, -0.030278, -0.110633, 0.085320, -0.269147, -0.419639, 0.146234, -0.120346, 0.037542, -0.234542, -0.034643, -0.151147, -0.123218, -0.062542, -0.208172, 0.119927, 0.142817, -0.051656, 0.089911, -0.139419, -0.025524, 0.380729, 0.106716, 0.006428, -0.367683, -0.341054, -0.029572, -0.216316, -0.084320, -0.158938, -0.144661, -0.502795, 0.210908, -0.193798, -0.095955, 0.359303, -0.118358, -0.555279, 0.149171, 0.339898, 0.030687, -0.139769, -0.047339, -0.064083, 0.211743, -0.245583, -0.229891, 0.011697, -0.348078, 0.031967, -0.144019, 0.423315, -0.164704, -0.347321, 0.025348, 0.016401, -0.116497, -0.064051, 0.123002, -0.009734, -0.066425, 0.165747, -0.021622, 0.100267, -0.240136, 0.015223, 0.027156, -0.243912, 0.009045, 0.133475, -0.130945, -0.267276, 0.058351, 0.031498, 0.241646, -0.271022, 0.163087, -0.224697, -0.043424, -0.216433, -0.210890, -0.050755, -0.151918, -0.011227, -0.267552, 0.383408, -0.088443, -0.185547, 0.196305, -0.209481, 0.019952, -0.055605, -0.302536, -0.170270]
-,        [0.089283, 0.028311, -0.094766, -0.106185, -0.024989, -0.015279, 0.071192, -0.110829, -0.199866, -0.003394, 0.157147, -0.179826, 0.005837, -0.097518, -0.020492, -0.028340, 0.057002, 0.025562, -0.070837, -0.103302, 0.009724, -0.118544, -0.043752, -0.046286, -0.189134, -0.130407, 0.066907, 0.022309, 0.045853, 0.115232, 0.050407, -0.220072, 0.043327, -0.065635, -0.082369, -0.066093, -0.148881, -0.183018, -0.131762, -0.147420, -0.313420, -0.018236, -0.018640, -0.107955, -0.034982, -0.069188, -0.006479, -0.268392, -0.167408, -0.183622, -0.029315, -0.114715, -0.180380, -0.101344, -0.094828, -0.118200, -0.438421, 0.000944, -0.042042, -0.126295, 0.072772, -0.268638, -0.048258, -0.101448, 0.134222, 0.019411, -0.023720, -0.030079, -0.229710, -0.165916, -0.164771, 0.052144, -0.104042, -0.032763, 0.049435, -0.096825, -0.267566, 0.030188, -0.076883, -0.073555, -0.032750, -0.156731, -0.021345, 0.106809, -0.055685, -0.046342, -0.119880, -0.106872, -0.058676, -0.043286, -0.144828, -0.055763, -0.026313, -0.024276, -0.079059, 0.197887, -0.229073, 0.062559, -0.050042, -0.060199, -0.193722, -0.155819, -0.015888, -0.199679, -0.265429, -0.087689, -0.053048, 0.101095, -0.104607, -0.088988, -0.131168, -0.261526, -0.034230, -0.132232, -0.086660, -0.132021, 0.016292, 0.035614, -0.076142, -0.055112, -0.008013, -0.153965, -0.188208, 0.119310, -0.008787, -0.047198, 0.033618, 0.138081, -0.042041, -0.181227, -0.099230, 0.124360, -0.062516, -0.051540, -0.227346, -0.075344, 0.008127, -0.192546, -0.050235, -0.007976, 0.113182, -0.019566, -0.187934, -0.011191, -0.081230, -0.105812, 0.094009, -0.021167, 0.021689, 0.071986, -0.138323, -0.257693, -0.050197, -0.217932, -0.047319, -0.047843, 0.118236, -0.075139, 0.200878, -0.134328, -0.095921, -0.134886, -0.151318, -0.097257, 0.241440, -0.214845, -0.245646, -0.122061, 0.072830, -0.063109, 0.047144, 0.022462, 0.015065, -0.190336, -0.063526, -0.115971, -0.176691, -0.145003, -0.192790, -0.104101, -0.212867, 0.110681, 0.005131, -0.050197, 0.011056, 0.016629, 0.030693, -0.075735, -0.235432, -0.188639, -0.109543, -0.130419, -0.051773, -0.313913, -0.254271, -0.175740, -0.078218, -0.232037, -0.136687, -0.146016, 0.060845, -0.010015, -0.075318, -0.089003, -0.054947, -0.222423, -0.048492, -0.131240, -0.111407, -0.205310, -0.066780, 0.024656, 0.009671, -0.227678, 0.004485, -0.184700, -0.197702, -0.074583, -0.083871, -0.033247, 0.126837, -0.206049, -0.001017, -0.113744, 0.080293, -0.132659, -0.015206, -0.022600, -0.212718, -0.083824, 0.096894, -0.182065, -0.026996, -0.297240, -0.087840, 0.197549, -0.003803, -0.068343, 0.078371, 0.011993, -0.000254, 0.010506, 0.004499, -0.025234, -0.246899, -0.103183, -0.274344, -0.067272, -0.072640, -0.039266, -0.201228, -0.180271, -0.070728, -0.281628, -0.149044, -0.062875]
-,        [-0.615910, -0.490184, -0.172733, 0.308697, -0.079529, -0.056034, -0.336832, 0.040853, -0.012621, 0.172242, -0.253760, -0.383337, -0.281606, -0.237576, 0.057631, -0.169912, -0.155718, -0.247245, -0.077055, 0.160848, 0.496463, 0.113463, -0.315622, 0.115443, -0.032069, -0.069312, -0.255503, 0.036575, -0.055145, -0.184067, 0.133441, -0.459690, -0.149984, -0.475312, -0.115889, -0.026726, 0.240019, -0.356975, 0.004811, -0.010503, 0.331045, -0.068365, 0.442393, -0.062397, -0.015297, 0.157649, 0.094368, 0.122932, 0.101329, -0.436977, 0.242691, -0.278850, -0.532369, -0.005914, 0.035903, -0.175492, 0.292134, 0.024867, -0.395637, -0.036713, -0.174337, 0.148269, -0.120631, 0.009567, 0.314827, -0.193126, 0.130680, -0.087942, 0.089047, -0.051999, 0.048870, -0.305655, 0.105372, -0.006577, 0.254396, 0.080502, 0.156579, -0.057373, -0.350163, -0.505370, -0.239123, -0.206601, 0.014106, -0.042757, 0.172381, 0.271333, 0.087279, -0.093718, -0.219626, -0.005249, 0.008539, 0.355242, -0.099058, -0.144492, -0.069778, -0.059100, -0.327140, -0.184148, 0.185706, -0.014860, -0.094646, -0.157423, 0.012504, 0.188581, -0.062769, 0.063099, 0.244354, -0.030680, 0.168676, 0.085881, -0.232592, -0.197216, -0.481432, -0.009203, -0.630765, -0.051269, 0.125967, -0.142263, -0.117647, -0.648924, 0.163881, -0.084632, -0.075792, 0.007003, -0.211274, 0.232616, -0.125953, -0.084965, -0.640485, -0.029875, -0.125681, 0.107702, 0.166448, 0.050987, -0.097132, 0.100212, -0.246573, -0.259523, 0.273949, -0.364020, -0.077720, -0.367458, -0.146225, -0.440972, -0.510124, -0.053713, 0.349534, -0.190372, -0.450857, -0.616716, 0.426225, -0.242024, -0.468201, -0.393041, -0.169291, -0.619920, 0.009583, 0.155632, -0.082874, 0.256448, 0.030031, 0.173533, 0.156348, 0.251373, -0.105680, -0.367180, -0.049660, -0.327673, 0.374733, 0.320137, -0.240708, -0.166728, 0.354177, -0.254509, 0.057132, -0.030052, -0.041343, -0.494152, -0.459791, -0.101254, -0.184086, 0.262638, 0.028549, 0.178217, -0.380678, -0.035525, 0.185886, -0.018452, 0.251151, -0.074377, -0.086664, 0.040323, 0.015181, -0.226652, -0.424627, -0.016930, -0.116028, 0.149512, -0.074590, -0.208165, -0.096939, -0.177641, 0.055461, 0.192122, -0.046945, 0.255676, -0.026055, -0.095318, 0.309791, 0.061559, 0.171186, -0.264909, -0.017238, 0.108447, 0.220187, 0.415135, -0.229428, -0.049071, 0.348360, 0.758409, -0.220843, -0.460045, -0.427372, 0.118138, -0.303124, 0.041312, -0.585351, 0.001942, -0.002651, 0.011426, 0.193097, -0.426314, -0.176555, -0.396100, 0.267774, -0.262500, -0.177157, 0.215002, -0.201658, -0.258723, 0.091558, 0.066294, 0.361861, -0.285293, -0.012365, 0.447192, -0.241937, -0.136822, 0.031115, 0.136943, 0.306796, -0.007260, 0.009292, -0.154868, -0.166485, 0.038165]
-,        [-0.011652, -0.012136, 0.193597, -0.335182, -0.488869, 0.110207, -0.131645, 0.273521, 0.252636, 0.127943, -0.311626, 0.044643, 0.336629, 0.088113, -0.569615, -0.128769, 0.021732, -0.213498, 0.067771, 0.822394, 0.497096, 0.023515, 0.295643, -0.309413, -0.404923, -0.279096, 0.224371, 0.059619, 0.193007, 0.837257, 0.167880, -0.310450, 0.198491, -0.085008, -0.047286, 0.194065, -0.099064, 0.317098, -0.615053, -0.711895, 0.133218, -0.140063, 0.235788, 0.453327, 0.141200, 0.141396, 0.202946, 0.860808, 0.198333, 0.221473, 0.157464, -0.184466, -0.319828, -0.041288, 0.620548, -0.803614, -0.279690, -0.461744, -0.590402, -0.635844, -0.489981, -0.211875, 0.063313, 0.340693, -0.650240, -0.323861, 0.303503, -0.354108, 0.051501, 0.270092, -0.426400, -0.259112, -0.222241, -0.390940, -0.195789, 0.368851, -0.200756, -0.167238, 0.054755, -0.341669, -0.501197, 0.051483, -0.187293, -0.068399, 0.260045, -0.710168, 0.115034, 0.031830, 0.213719, 0.210854, -0.202568, -0.018164, -0.335108, -0.470926, 0.244972, -0.458522, -0.213449, 0.075218, -0.092264, 0.146592, -0.607425, 0.208218, 0.377882, -0.572423, -0.453892, -0.419655, -0.414050, -0.585122, -0.116291, 0.323783, -0.148664, -0.123610, 0.131274, -0.005606, -0.484050, 0.105204, 0.715453, -0.344913, -0.179750, 0.172048, 0.098832, 0.396113, -0.471165, -0.314193, -0.343623, -0.449441, -0.190528, 0.056534, -0.328966, -0.083476, 0.207438, -0.150901, -0.140904, -0.251445, 0.481188, 0.075285, 0.001329, -0.228898, 0.023414, 0.391947, 0.078293, -0.332313, 0.221976, -0.162906, -0.129669, 0.263296, -0.475125, -0.099894, -0.263911, -0.061772, -0.955167, 0.148463, -0.103112, -0.441501, -0.231501, -0.011966, -0.514319, 0.246295, -0.414235, 0.095079, 0.049213, -0.195752, -0.277041, 0.629395, 0.124588, -0.574660, 0.361053, 0.026875, -0.013658, 0.352116, -0.153558, -0.163088, 0.694142, -0.054828, -0.681974, -0.553049, -0.217222, -0.024904, -0.622180, -0.059822, -0.537675, 0.563418, -0.933773, -0.447824, 0.262724, -0.324525, 0.068952, -0.009127, 0.494180, 0.103404, 0.175815, 0.679451, -0.132435, 0.002306, 0.049442, 0.376529, 0.034389, -0.226738, -0.292208, -0.281012, -0.048359, 0.082834, 0.061148, 0.462413, 0.269278, -0.327988, 0.246784, -0.169557, -0.161025, -0.254219, 0.261507, 0.246768, -0.116074, -0.164819, -0.173356, 0.036097, 0.120391, 0.288613, -0.098668, -0.144955, -0.360983, -0.341663, -0.522529, 0.418015, 0.138705, -0.426631, -0.551438, -0.261743, 0.182747, -0.253815, -0.459123, -0.240789, -0.032312, -0.752424, 0.100476, -0.667838, 0.130722, -0.307161, -0.333745, -0.420201, -0.018332, -0.265448, 0.148652, 0.217143, -0.024973, -0.518936, -0.575377, -0.445492, -0.516529, -0.450247, -0.406705, -0.479311, -0.512884, -0.242515, 0.020830, -0.098187]
-,        [-0.279055, 0.090364, -0.092309, 0.054074, -0.152665, -0.123899, 0.144111, 0.003001, -0.059406, -0.224007, -0.172571, -0.019035, -0.115063, -0.006244, -0.074083, -0.097032, 0.171218, -0.081721, -0.255427, -0.042862, -0.091319, -0.111530, 0.057923, -0.062168, -0.293245, 0.031325, -0.130706, -0.133829, -0.241114, -0.080428, -0.011422, 0.126181, 0.075988, 0.030188, -0.078200, -0.083218, -0.267464, -0.127258, -0.108191, -0.054471, -0.062748, -0.169031, -0.060680, -0.293282, -0.179148, -0.033589, -0.298743, -0.126868, -0.357888, 0.116293, -0.187554, -0.047740, -0.388085, -0.129845, 0.067108, -0.113925, -0.252130, -0.151463, 0.014046, 0.071363, 0.019924, -0.069135, 0.189901, -0.075873, -0.010914, 0.200357, -0.248103, 0.004861, -0.259164, 0.144970, -0.107900, -0.173948, -0.241309, 0.041416, -0.252151, -0.001560, -0.039765, -0.074460, -0.131717, -0.135763, -0.175319, -0.053800, -0.017115, -0.000878, -0.092103, 0.209258, 0.015949, 0.232537, 0.129530, 0.093530, 0.026810, -0.073667, -0.184678, -0.221119, -0.297111, -0.114395, -0.150823, -0.345999, -0.219210, 0.028025, -0.179030, 0.082395, 0.091962, -0.138116, -0.382816, -0.017546, 0.065164, -0.237188, 0.109506, -0.260975, -0.163817, -0.021980, -0.051221, -0.122994, 0.045239, -0.096265, -0.005428, 0.056267, -0.180153, -0.087500, 0.010875, 0.036667, -0.185476, -0.126917, 0.068750, 0.177426, 0.242994, 0.049296, -0.262763, -0.084033, -0.178279, -0.113235, -0.059115, 0.017960, -0.083991, 0.069313, -0.066846, 0.211937, -0.085000, -0.146913, 0.081531, 0.170667, -0.078290, -0.025107, -0.101055, -0.202703, 0.245786, -0.060973, -0.244342, 0.058690, 0.019783, -0.122612, -0.030891, 0.088621, -0.246693, 0.041410, -0.076843, -0.164113, -0.016549, -0.005403, -0.025596, -0.039154, -0.127130, 0.033198, -0.118248, -0.064307, -0.257867, -0.219118, 0.049275, -0.064908, -0.361975, -0.222835, -0.051600, 0.090709, -0.215122, -0.008615, -0.124134, -0.134319, 0.041659, 0.042563, 0.107527, 0.099741, 0.041594, -0.151764, -0.056970, -0.293597, -0.307599, -0.096991, -0.122636, -0.166184, -0.032394, -0.170590, -0.093627, -0.046221, -0.303505, 0.114090, -0.171942, -0.240618, -0.158599, 0.122805, 0.080781, -0.082480, 0.090055, 0.054237, -0.017522, 0.054142, -0.156250, -0.029627, 0.132224, -0.085515, -0.023915, -0.006140, -0.133246, 0.198586, -0.005455, -0.119576, 0.120265, -0.165973, 0.093862, -0.025725, 0.068603, -0.000151, -0.183116, 0.079102, -0.348571, 0.039019, -0.180370, -0.099655, -0.169271, -0.244377, -0.027840, -0.155656, -0.072756, -0.104534, -0.070506, -0.185279, 0.061583, 0.040263, -0.052223, 0.038786, -0.016173, -0.109509, 0.084289, -0.032113, -0.137525, -0.255004, -0.078115, -0.080756, 0.033670, -0.103646, -0.110680, -0.240193, -0.011424, 0.014800, -0.029840, -0.214383]
-,        [-0.422696, -0.067510, 0.182844, -0.658791, 0.048209, -0.045690, -0.227805, 0.246050, 0.007655, -0.099971, 0.082308, -0.444975, -0.034020, 0.321750, -0.150147, -0.323011, 0.078997, 0.074813, -0.411750, 0.535728, 0.046403, 0.131951, -0.110664, -0.111854, -0.149147, -0.314862, 0.486191, -0.380786, 0.181199, 0.055206, 0.174611, -0.275198, -0.077219, 0.037866, -0.327354, -0.098686, 0.340113, -0.066903, 0.108712, -0.006747, 0.061442, -0.041374, 0.222607, 0.005690, -0.135817, 0.156932, 0.149611, 0.083306, -0.250587, -0.338313, 0.277249, 0.316491, -0.339960, 0.229933, 0.033874, -0.046228, -0.281133, 0.066613, -0.400224, 0.137594, 0.033611, -0.006085, -0.211509, -0.051015, 0.048908, 0.017169, -0.046937, 0.203731, 0.222375, 0.258357, -0.031582, -0.270074, 0.258288, -0.146924, -0.608522, -0.523109, 0.047505, -0.310297, 0.333246, -0.832587, 0.104117, -0.171989, -0.125224, 0.306668, 0.315848, -0.314896, 0.362464, -0.105393, -0.237561, -0.031835, 0.200295, 0.057262, -0.160841, -0.169129, 0.105428, -0.152489, -0.030848, 0.082756, -0.506807, 0.117962, 0.079123, 0.004405, -0.102966, -0.419613, -0.118871, 0.087505, 0.309994, 0.355939, -0.286027, 0.468495, -0.247379, 0.232700, 0.126917, 0.042010, -0.746219, -0.057069, -0.303592, -0.187203, -0.080794, 0.302362, -0.044698, 0.005659, -0.115219, -0.011032, -0.183356, -0.463092, 0.230632, 0.060306, -0.129017, -0.195264, -0.561906, 0.066298, -0.212948, 0.057176, -0.082909, -0.326546, -0.558087, -0.055437, 0.347765, 0.059705, -0.042613, 0.143942, 0.263736, -0.159884, -0.346412, 0.048131, -0.446223, -0.034221, -0.203459, -0.379150, -0.512634, -0.291775, -0.217765, -0.127015, -0.097974, 0.221359, -0.580858, -0.089954, -0.045598, 0.342318, -0.279310, -0.133505, 0.154754, -0.229311, -0.264333, 0.094471, 0.172460, -0.013134, -0.014373, -0.214643, -0.199686, -0.311209, 0.355501, 0.006363, -0.056624, 0.455462, 0.023163, 0.223392, -0.364793, -0.145879, 0.059116, 0.608941, 0.006113, -0.104076, -0.365032, 0.224751, -0.288489, -0.056776, -0.172911, -0.369424, -0.466556, -0.038675, 0.050234, -0.132068, -0.026965, -0.576587, 0.029835, -0.055020, -0.349331, -0.134766, 0.225929, -0.549034, -0.240843, -0.180674, 0.458760, -0.477039, -0.655681, 0.091812, 0.641767, 0.013902, 0.017663, -0.448848, -0.020430, -0.117476, -0.153988, 0.123466, -0.664070, -0.190637, 0.101916, -0.057171, 0.164483, -0.274300, 0.094843, -0.213219, 0.139076, 0.543169, -0.702740, -0.011173, -0.212703, 0.080420, -0.605657, -0.392977, 0.014774, -0.055478, -0.201361, 0.029929, -0.284032, 0.193151, -0.056135, -0.465244, -0.254734, 0.031225, -0.135717, -0.238663, 0.037192, 0.014249, -0.424194, 0.380512, 0.044716, -0.538616, -0.071903, -0.030392, 0.410234, 0.417471, -0.661453, -0.531134]
-,        [-0.217111, -0.178871, -0.054648, 0.232927, 0.317009, -0.089766, 0.150417, -0.171588, 0.036717, 0.048291, 0.157599, -0.558046, 0.226143, -0.088325, 0.280431, -0.171585, -0.214948, 0.099673, -0.237922, 0.217661, 0.350026, 0.110595, 0.027976, 0.134141, -0.107574, -0.221282, 0.112320, -0.521670, 0.049520, -0.048873, -0.077301, -0.013838, 0.230615, -0.121747, 0.146018, 0.109767, -0.334179, -0.209121, -0.084720, -0.081154, -0.173007, -0.142261, 0.610010, -0.161685, -0.098539, 0.095226, 0.360863, 0.286081, -0.387216, 0.060031, 0.514651, 0.044465, -0.538456, 0.391486, 0.581506, -0.414661, 0.112503, 0.039540, -0.285485, -0.205913, -0.376102, -0.124148, 0.355838, -0.098296, -0.117524, -0.201465, -0.265314, 0.030258, 0.106242, 0.471452, 0.232158, -0.421283, 0.329730, 0.319679, 0.025751, 0.240659, -0.083302, -0.100425, -0.218807, 0.333033, 0.149268, 0.158769, -0.132616, -0.141765, 0.021225, 0.165008, 0.417343, -0.192255, 0.063366, 0.020282, -0.165046, 0.256986, -0.191265, 0.458838, 0.208593, -0.443191, -0.358818, 0.139111, 0.032191, 0.467088, 0.159184, 0.044604, 0.010789, -0.307925, -0.371100, -0.181340, 0.399273, -0.078166, -0.091947, 0.215171, -0.079639, 0.409175, 0.558431, 0.032451, -0.011148, -0.242129, -0.146817, -0.673252, 0.080808, 0.273027, -0.070489, 0.046207, 0.164425, 0.066724, 0.084330, -0.486158, -0.180805, -0.082594, -0.358794, -0.051743, 0.021028, 0.174781, -0.175966, -0.192826, -0.082998, -0.006742, 0.259772, 0.045372, 0.169474, 0.140476, -0.086664, -0.008958, -0.140679, -0.044021, 0.192272, -0.098311, -0.458465, -0.060400, -0.378509, -0.023445, -0.370061, -0.138561, -0.388962, -0.141265, -0.238792, 0.071690, -0.306952, -0.096667, -0.061247, -0.018083, -0.251009, -0.016556, -0.281098, 0.361175, 0.452987, -0.144799, 0.078812, -0.157904, -0.285474, 0.527119, -0.040768, 0.158513, 0.265168, -0.011864, -0.357077, 0.033743, 0.001557, 0.051819, -0.337278, -0.358402, 0.047144, 0.259551, -0.071528, -0.236211, -0.250146, -0.009491, 0.224023, -0.307421, 0.024383, 0.235249, 0.302716, 0.333445, 0.094892, 0.055503, 0.284260, 0.363483, -0.106707, -0.434362, -0.516238, 0.296497, -0.169792, 0.264711, 0.124678, 0.233316, 0.561701, 0.612720, -0.152748, -0.311091, 0.150661, 0.039466, -0.044721, -0.036930, -0.177734, 0.142509, -0.040750, -0.126298, 0.016064, -0.068769, 0.182616, -0.065338, 0.431906, 0.246753, -0.293785, -0.300929, -0.025091, -0.025955, -0.623662, 0.034175, -0.135646, 0.078490, 0.012982, -0.284606, -0.042882, 0.788687, 0.044171, -0.289640, 0.050227, 0.248057, 0.191239, -0.530481, -0.026304, -0.232997, -0.164199, -0.106389, 0.081368, 0.114362, -0.070596, 0.278793, 0.544087, 0.377963, -0.206978, 0.020617, 0.340738, -0.190248, 0.046649, -0.103638]
-,        [0.414400, -0.057532, -0.471631, -0.636375, 0.531732, -0.157267, 0.208704, -0.549325, 0.449565, 0.065078, -0.393445, -0.161646, -0.649791, -0.316348, 0.029842, -0.629888, 0.736856, 0.200865, -0.024507, -0.128024, -0.144528, 0.069708, 0.020763, -0.237591, 0.480137, -0.340547, 0.411826, 0.666632, 0.684844, 0.848550, -0.039868, -0.028607, 0.422632, 0.162460, 0.648947, 0.007060, -0.021331, 0.086148, -0.795393, 0.310718, -0.080153, -0.157903, 0.283595, -0.301850, 0.350045, 0.130531, -0.227287, -0.045541, 0.027761, 0.786063, -0.115778, -0.287527, -0.403872, -0.140371, 0.357864, -0.422233, -0.141585, 0.251603, 0.752343, -0.397957, 0.522382, -0.017950, 0.201871, 0.073050, -0.003637, 0.122238, -0.200237, 0.554846, -0.127615, -0.205105, -0.155396, -0.525138, -0.883213, -0.479861, 0.254404, 0.723937, -0.163353, -0.503261, -0.160714, -0.258082, -1.029014, -0.021827, 0.103031, -0.431236, 0.023820, -0.798876, -0.354819, -0.270049, 0.138845, -0.994168, -0.136230, -0.495994, 0.698043, 0.108163, 0.293267, 0.077386, 0.117687, 0.253192, 0.611347, -0.526158, 0.302590, -0.424491, 0.180945, -0.069088, -0.348706, -0.314417, 0.298760, 0.275630, 0.331404, -0.877414, -0.463272, 1.100016, -1.431210, -0.771090, -0.626924, 0.349444, 0.402202, -0.468459, -0.655682, -0.101367, -0.577956, 0.032833, 0.055155, 0.349380, 0.498747, -0.288236, 0.178245, -0.062562, -0.404503, -0.978987, -0.404162, 0.395221, 0.673979, -0.280567, -0.508740, 0.318597, 0.372967, -0.289056, -0.393115, 0.559503, 0.124917, 0.491908, 0.064350, -0.629454, 0.039563, -0.480270, -0.153888, -0.067918, -0.291471, -1.086070, -0.330927, -0.773558, -0.347193, 0.379828, -0.307547, 0.902264, 0.140358, -0.197587, -0.408019, 0.693181, 0.666782, -0.228332, -0.524103, 0.475752, -0.906239, -0.576781, -0.257444, 0.171244, -0.173446, 0.078508, -0.711378, 0.017864, -0.287763, -0.393512, -0.251220, -0.636215, -0.657005, -0.519674, -0.575342, -0.919883, 0.563108, -0.008874, 0.124774, -0.510225, 0.399435, 0.091471, 0.584771, 0.568656, 0.287983, 0.463330, -0.838839, 0.839221, -0.550750, -0.055788, -0.212182, -0.157239, -0.087128, 0.331694, 0.019500, -0.913663, 0.072557, -0.008831, 0.509594, 0.326497, 0.229381, -1.310936, 0.315869, 0.025307, -0.187508, 0.775977, -0.088859, 0.123296, 0.004988, 0.825950, -0.627760, -0.434195, 0.590417, 0.742639, 0.202011, -0.788332, -0.591677, 0.037770, -0.499422, -0.200562, -0.570156, -0.393757, -0.357333, -0.324913, 0.071038, 0.066732, 0.228368, 0.049221, 0.001500, 0.082003, 0.393353, 0.415135, -0.514889, -0.062294, -0.186612, -0.451687, -0.145605, 0.313058, 0.275570, -0.058440, -0.311672, -0.910342, -0.950060, -0.233149, -0.789300, 0.670764, 0.149126, -0.082957, -0.659202, -0.011125, -0.623303, -0.276534]
-,        [-0.454609, 0.206441, -0.297116, -0.547159, -0.182096, -0.736567, -0.351879, -0.127043, 0.080934, -0.282455, -0.186497, -0.121170, -0.068999, 0.025451, 0.103161, -0.471224, 0.296011, -0.130500, -0.402976, -0.005775, -0.123993, 0.007220, -0.056887, -0.164466, 0.045667, -0.096577, -0.148289, -0.065090, 0.351589, 0.491275, 0.010532, 0.529874, 0.091651, -0.125415, -0.427040, -0.015848, -0.345987, 0.282290, -0.432112, -0.039306, -0.073805, -0.243822, -0.088024, 0.342216, -0.395036, -0.072960, 0.316284, 0.647745, -0.011447, 0.335653, -0.279396, -0.026079, -0.292547, 0.218684, -0.049385, -0.196945, 0.050334, 0.006762, 0.154486, -0.342595, -0.221109, -0.155437, -0.309841, -0.099816, 0.346595, 0.055888, -0.041738, -0.118940, -0.303800, 0.128387, -0.106370, -0.409440, 0.178701, -0.078363, 0.058682, 0.088581, 0.039744, -0.484035, -0.225476, -0.467357, 0.091827, 0.315174, -0.166625, 0.343002, 0.088288, -0.440112, 0.189579, -0.216225, 0.114478, -0.307635, -0.201159, -0.095602, 0.317263, 0.143005, 0.072025, -0.078618, 0.142615, 0.217794, 0.221632, 0.173914, -0.347066, 0.034014, -0.339922, 0.075760, -0.110994, -0.207054, 0.389650, 0.324490, 0.233477, 0.203988, -0.235478, 0.044053, 0.004336, -0.229189, -0.440532, 0.499700, 0.539890, -0.188534, 0.196667, -0.244612, -0.306832, 0.516798, -0.128177, -0.345409, -0.167300, -0.734642, 0.157410, -0.454265, 0.392671, -0.125657, -0.040654, 0.230973, -0.044503, 0.270838, -0.169281, -0.117222, 0.194725, -0.263796, -0.112139, 0.139142, -0.364474, -0.122200, -0.200634, 0.115957, 0.253219, -0.009616, -0.433188, 0.307626, -0.110328, 0.052451, -0.553539, -0.297725, 0.189441, -0.328653, -0.265954, -0.169383, -0.085851, 0.412205, 0.221436, 0.204898, 0.175552, 0.211904, -0.165291, 0.005316, -0.110563, 0.171048, -0.021242, -0.327806, 0.112888, -0.079346, -0.530233, -0.297135, -0.467278, 0.151763, -0.311106, -0.232633, 0.098097, -0.453085, 0.178017, 0.169221, 0.212496, -0.480771, 0.196520, -0.222416, -0.528825, 0.097848, 0.343137, 0.252661, 0.121157, 0.162371, 0.150770, 0.722349, -0.128876, -0.162835, -0.154659, 0.200746, -0.122186, -0.370169, -0.618302, -0.518255, -0.004187, 0.000419, 0.043468, -0.386545, -0.356843, 0.114078, 0.158324, 0.191544, -0.129712, 0.220672, -0.117236, 0.234938, -0.029827, 0.099206, -0.096343, 0.097021, 0.304545, 0.379275, -0.107899, -0.232016, -0.323337, -0.170296, -0.211476, -0.062152, 0.040101, -0.134351, -0.730534, -0.289675, 0.009810, -0.389627, -0.203768, 0.186574, -0.118282, -0.187483, 0.147134, -0.297226, -0.112681, -0.020601, -0.434280, -0.231191, 0.106358, 0.133911, 0.168248, 0.235340, -0.170670, -0.026142, -0.090827, -0.270352, 0.243625, -0.046037, 0.239455, 0.087419, 0.328039, 0.270699, -0.207017, 0.109948]
-,        [-0.122726, -1.041539, 0.370323, 0.042544, 0.497180, 0.179640, -0.125954, -0.655352, -0.162825, 0.751574, -0.584793, 0.262499, -0.546405, 0.177419, 0.151537, 0.186652, 0.108065, 0.931541, 0.220073, 0.536005, -0.396887, -0.035966, -0.421469, 0.526739, 0.167297, -0.881069, -0.143269, 0.104245, -0.355882, 0.096952, -0.717913, 0.085509, 0.059976, 0.250168, -0.658465, 0.476082, 0.098975, -0.785191, -0.251664, -1.016271, 0.581041, -0.121746, 0.128170, -0.470810, 0.328395, 0.886393, 0.324252, 0.387590, 0.403379, -1.002469, -0.655717, 0.264068, -0.319850, -0.544083, -0.069306, -0.184900, 0.336846, -0.666456, 0.067951, -0.677730, 0.183459, -0.898300, -0.156408, 0.291281, -0.015714, 0.215457, -0.260635, 0.767459, 0.140892, 0.282423, 0.215061, -0.334335, -0.641407, 0.537945, -0.157457, 0.376201, 0.773681, 0.087183, 0.244251, 0.015137, 0.118994, -0.310296, 0.354573, 0.204327, -0.012331, 0.595620, -0.774057, -0.752313, -0.503910, 0.602100, 0.706000, -0.060071, -0.223310, 0.152943, 0.023091, -0.650780, -0.441484, -0.834590, 0.435695, 0.347465, -1.116842, -0.007815, 0.299068, -0.881054, 0.132876, 0.429871, 0.065268, -0.205287, 0.860781, -0.089684, -0.383595, 0.563351, 0.349610, 0.027537, 0.366343, 0.327004, 0.208911, -0.526140, -0.213434, -0.282999, -0.337377, -0.018196, -0.263848, -0.561636, -0.792989, -0.066332, -0.756619, 0.588208, -0.768271, -0.417407, 0.360079, -0.619083, -0.476908, -1.020349, -0.555667, 1.343688, -0.588478, 0.193496, 0.175211, -0.697620, 0.043945, 1.023910, 0.131783, 0.169752, 0.469323, 0.532064, 0.280829, -0.086912, 0.064669, 0.250889, -0.070287, 0.141145, 0.616399, 0.102800, -0.602041, -0.093206, -0.423849, -0.227275, -1.330726, -0.795348, -0.068429, 0.731918, 0.033421, -0.282787, -0.285059, 0.060783, 0.124617, 0.072757, 0.658928, -0.331812, 0.023252, 0.966268, -0.066215, -0.212682, -1.141924, -0.203685, 0.473988, 0.268615, -0.759621, -0.422687, -0.270745, -0.099584, -1.006584, 0.395839, 0.892376, 0.147781, 1.013793, -0.117259, -0.183991, 0.024636, 0.411986, -0.537793, -0.284817, -0.047913, -0.277072, 0.295561, 0.443275, -0.549004, -0.444137, -0.109852, -0.557532, -0.045568, -0.266987, 0.676334, -0.048478, 0.123182, -0.968599, -0.127387, 0.181455, 0.621649, 1.112653, -0.325853, 0.151062, -0.146788, -0.352952, -0.593028, -0.461692, 0.448461, 0.346172, 0.358443, -0.444692, -0.132630, -0.231056, 0.000440, -0.550523, -0.603052, 0.205461, 0.043600, 0.003934, 0.135755, 0.839330, -0.418505, 0.138706, 0.327616, -0.904308, 0.000284, 0.325945, -0.727893, -0.885375, -0.351218, -0.058632, -0.241177, 0.288333, -0.990572, -0.026300, -0.036074, -0.509776, 1.100536, -0.491113, 0.423017, -0.432701, 0.032359, -0.005390, 0.463404, -0.034024, -1.073755]
-,        [-0.179611, -0.122239, -0.148187, 0.101818, -0.144511, 0.048529, -0.166414, 0.155647, -0.002513, -0.063514, -0.064900, -0.215709, -0.148045, 0.120781, -0.185278, -0.032525, -0.025477, 0.197617, 0.074320, -0.012936, -0.015552, 0.091252, 0.045746, -0.091275, 0.086837, -0.035676, -0.112272, 0.042408, -0.135664, 0.006519, -0.219584, 0.047378, -0.032213, -0.040662, -0.132134, -0.140761, -0.066232, 0.100314, -0.053565, -0.267041, 0.023902, 0.193486, -0.018393, -0.166880, 0.050714, 0.058772, 0.119597, -0.090371, -0.234972, 0.029856, 0.031254, 0.130118, -0.042771, -0.224129, -0.049129, -0.022094, 0.117193, -0.180266, -0.091893, -0.008736, 0.098330, -0.070291, -0.001158, -0.115188, -0.035501, 0.121807, -0.173258, -0.032796, 0.184758, 0.083573, -0.052428, -0.201722, 0.027328, -0.043042, 0.115196, 0.079390, 0.205562, -0.053861, -0.137831, -0.181805, 0.056314, -0.036975, -0.066582, -0.126939, 0.049279, 0.020869, -0.101675, -0.044046, 0.019740, -0.160077, -0.078460, -0.124237, -0.039496, -0.043955, -0.110112, -0.144525, -0.062761, -0.095784, -0.195840, 0.232494, 0.085307, -0.089006, 0.155509, -0.080728, -0.264231, -0.093841, -0.064814, -0.015708, 0.007978, -0.015603, 0.007840, -0.001684, -0.069478, -0.174715, -0.145252, -0.049564, -0.054024, 0.062881, 0.156938, -0.064298, 0.089814, -0.257816, -0.296713, -0.125213, -0.015610, 0.105697, -0.145948, 0.070498, -0.147720, 0.067980, -0.054113, -0.067333, -0.056055, -0.166185, -0.229106, 0.003578, -0.003150, -0.131255, -0.035764, 0.126100, 0.067982, 0.173196, 0.036011, -0.028479, 0.154445, 0.023132, -0.102856, 0.141972, -0.282268, -0.051039, -0.070815, -0.014918, 0.052397, -0.361222, -0.047444, -0.115739, -0.057940, -0.051759, -0.005692, 0.027112, -0.213587, -0.134881, -0.162547, 0.007582, 0.049301, -0.142741, 0.021732, -0.192582, -0.025352, 0.024899, -0.116684, -0.091887, 0.175577, -0.171308, -0.175369, -0.200442, -0.014710, -0.011264, -0.139671, 0.038128, -0.093368, 0.237141, 0.072805, -0.036435, -0.071429, -0.061243, -0.132441, -0.189541, -0.188085, 0.204493, 0.171405, -0.088871, 0.024034, -0.003901, 0.026986, -0.019252, -0.063224, 0.096217, -0.074940, -0.196262, -0.026841, 0.136760, -0.116252, -0.201242, 0.058375, 0.163161, 0.036973, 0.053333, -0.066784, -0.216778, -0.059222, -0.069245, -0.035288, -0.002601, -0.151408, -0.157261, 0.066655, 0.007835, -0.144501, -0.014267, -0.034067, -0.021239, -0.186254, -0.106282, -0.001381, -0.047162, -0.214960, 0.155150, 0.009668, 0.017448, -0.039856, -0.103204, 0.170828, -0.072179, 0.040849, -0.052301, -0.024490, -0.159398, -0.067668, -0.170378, -0.114218, -0.073249, 0.014540, -0.067777, 0.122372, 0.065826, -0.177623, 0.150817, 0.162104, -0.089114, -0.129230, -0.067644, -0.112628, -0.008182, -0.135434, -0.232248]
-,        [0.116537, 0.425454, -0.246800, 0.246980, -0.241294, -0.254572, -0.178666, -0.024601, 0.407622, -0.094061, 0.941207, -0.521888, 0.172983, 0.047281, 0.234975, -0.799438, -0.393918, -0.024347, 0.766377, -0.351726, 0.272458, 0.372957, -1.280563, -0.430818, -0.443088, -0.186571, 0.187322, -0.440335, 0.105667, 0.056230, 0.017570, 0.538266, 0.155047, -0.141872, 0.388164, -0.749808, -0.693021, -0.373360, 0.303029, 0.695482, -0.269994, -0.736955, 1.299950, 0.525463, 0.590483, 0.697031, 0.296964, 0.191657, -0.215244, 0.030910, 0.005669, 0.346882, -0.397603, 0.552138, 0.387796, 0.100771, 0.470717, 0.788048, 0.452629, -0.299847, -0.015208, -0.024030, -0.328749, -0.094138, -0.688304, -0.016798, -0.328489, 0.001587, 0.283087, 0.045800, -0.106791, -0.230175, 0.201385, 0.871985, -0.482140, -1.330736, -0.303493, 0.248525, 0.366199, -0.000858, -0.469484, -0.634522, 0.570603, 1.750617, 0.547499, 0.217343, 0.592667, 0.460070, 0.507728, 0.921519, -0.476679, -0.129069, -0.365341, -0.097032, 0.308420, 0.866292, -0.297519, 1.000729, -0.716062, 0.234348, 0.410992, 0.211094, -0.139830, 0.184474, 0.402113, 0.470036, 0.952859, -0.096526, 0.496905, 0.350914, -0.685611, -0.549484, 0.598496, 0.467952, 0.209974, 0.222337, 0.195072, -0.473191, 0.503065, -0.254824, 0.091382, -0.335263, -0.805123, 0.056459, 0.017509, 0.117696, -0.173159, 0.774568, -0.431692, 0.418643, 0.412370, 0.306645, -0.040471, -0.170414, 0.454494, -0.284580, 0.215567, -0.290370, -0.210594, -0.824589, -0.162996, 0.282385, -0.155435, -0.082100, 0.363442, 1.150641, -0.304406, 0.556653, 0.182339, -0.254125, 0.051524, -0.744769, 0.462292, 0.288253, -0.350551, 0.072504, -0.204161, -0.261164, -0.031757, 0.427528, 0.154632, -0.365383, 0.031399, -0.113511, -0.591907, -0.133679, 0.178182, 0.055925, 0.583669, 0.887065, 0.331873, -0.215984, 0.391218, -0.099026, 0.170839, -0.235465, 0.207916, 0.210731, -0.550657, -0.737431, 0.151916, 0.255646, 0.887081, -0.275224, 0.412231, 0.336964, -0.772549, 0.300681, -0.483332, -0.480423, -0.132860, -0.547608, 0.972667, 0.059488, -0.880991, 0.669890, 0.301898, -0.172090, -0.541226, 0.173957, 0.109674, -0.131778, -0.010714, 0.698653, -0.230760, 0.649414, -0.082842, 0.075184, 0.216013, 0.444016, -0.928583, -0.125483, 0.045065, 0.499596, 0.283853, 0.091639, -0.249374, 0.208741, 0.620541, 0.195391, -0.078627, 0.144948, -0.442379, -1.433938, 1.175187, -0.009996, -1.356445, 0.085208, 0.370234, 0.039219, 0.313029, 0.062012, -0.205522, 0.285168, 0.703346, 0.169418, 0.068643, -0.071274, 0.640657, -0.460851, -0.095089, -0.176363, 0.473952, -0.529564, 0.120737, -0.685443, 0.233342, 0.481043, -0.249599, 0.087489, -0.441352, 0.087262, 0.023759, -0.117737, 0.427046, 0.171324]
-,        [-0.279913, 0.115701, -0.429691, -0.333749, -0.031783, -0.300435, 0.187409, 0.054629, 0.197880, -0.015176, 0.158329, -0.097710, 0.094382, 0.056832, -0.265777, -0.045957, 0.074423, -0.024933, 0.033842, 0.213953, 0.007677, -0.430640, -0.147885, -0.079974, -0.239365, 0.392402, -0.078752, -0.247079, 0.126894, -0.292366, -0.002459, -0.084914, -0.120356, -0.135045, -0.089562, -0.092053, -0.052582, -0.105873, -0.059547, 0.149967, 0.032306, -0.219786, -0.213891, -0.105261, -0.011280, -0.004054, 0.156897, -0.452157, -0.197974, 0.023186, -0.128940, -0.108584, -0.183693, -0.185852, -0.330596, -0.105365, -0.066600, -0.109758, 0.204102, -0.073260, -0.286565, -0.516135, -0.339468, 0.030092, 0.002184, 0.288675, -0.171665, 0.184696, -0.113368, -0.201835, -0.246474, -0.094670, -0.049750, -0.254482, -0.357081, 0.107764, 0.146420, 0.078741, -0.224587, -0.522265, 0.120844, 0.102340, -0.128347, -0.014725, 0.135025, -0.061915, -0.128026, -0.055913, 0.007064, 0.220802, -0.006018, 0.012417, -0.081900, 0.051249, 0.092551, -0.110023, -0.384322, -0.233187, 0.111826, -0.017851, -0.271098, -0.158869, 0.160829, -0.039381, -0.017767, -0.170066, -0.142927, 0.257214, 0.102240, -0.068326, 0.195776, 0.062771, 0.289131, 0.010357, -0.310642, -0.089606, -0.130611, -0.363512, 0.093358, -0.091972, -0.260881, -0.253548, 0.330197, 0.128485, 0.044468, -0.041216, -0.193452, -0.120158, -0.353096, -0.152623, -0.614395, -0.044257, 0.017486, -0.149388, -0.005356, -0.051575, -0.100598, -0.165252, -0.243223, 0.030134, 0.223794, 0.092425, -0.150264, -0.205044, -0.373392, 0.051476, 0.005364, -0.165889, -0.133837, 0.143731, -0.185616, -0.204029, 0.076020, -0.352959, -0.062070, 0.130896, 0.015172, -0.235147, -0.163739, -0.188461, 0.079418, -0.283594, 0.003518, -0.049633, 0.166407, -0.330597, -0.094607, -0.265997, -0.244646, 0.311190, 0.316765, -0.048048, 0.062014, -0.065488, -0.135043, -0.025908, -0.381796, -0.357659, -0.034143, -0.046723, -0.084477, -0.003620, -0.049654, 0.063619, 0.160869, -0.049306, -0.309829, 0.036952, -0.157425, -0.172616, 0.005778, 0.197899, 0.365206, -0.094041, 0.008443, -0.357975, -0.162933, -0.183944, -0.001462, -0.180719, -0.167445, -0.374428, 0.156967, -0.067536, -0.064582, 0.129646, 0.178248, 0.119998, 0.146465, 0.177715, 0.162437, -0.099343, -0.019914, -0.083363, 0.090021, 0.061100, 0.058046, -0.124546, -0.344322, -0.108417, 0.312623, -0.144947, -0.040519, -0.061394, 0.391987, -0.509792, -0.331297, 0.186729, -0.085810, 0.056668, -0.230980, -0.050291, -0.253951, 0.281159, -0.274416, -0.117253, 0.294880, 0.221463, 0.076885, -0.211564, -0.141635, -0.148703, 0.098607, -0.169573, 0.344634, -0.172213, 0.119999, 0.094768, -0.315671, -0.066731, -0.353437, 0.080353, 0.133882, -0.041855, -0.267902, 0.085581]
-,        [-0.049263, 0.259530, 0.432428, -0.479274, 0.053679, 0.050370, 0.409671, 0.086967, -0.416533, -0.177503, -0.233960, -0.232142, -0.091181, 0.186552, 0.565369, 0.207597, -0.056982, 0.240357, 0.053809, -0.533119, -0.060792, 0.026389, -0.728300, -0.374209, 0.302446, 0.163864, -0.097416, -0.411602, -0.350379, -0.139877, -0.106257, 0.497471, -0.089609, -0.246992, -0.032495, 0.306297, -0.408756, -0.105821, 0.015016, 0.128581, -0.323444, -0.984839, -0.071598, -0.192566, -0.066171, -0.327390, -0.356855, -0.280277, -0.141076, 0.274591, -0.338227, 0.161270, -0.314323, -0.040687, -0.295776, 0.044308, -0.243720, -0.228250, 0.037812, 0.186850, -0.123754, 0.184207, -0.487755, -0.379432, 0.316770, -0.059252, -0.237367, 0.307560, -0.382511, -0.083815, -0.296307, -0.382110, 0.336736, -0.180825, 0.013501, -0.467009, -0.177048, -0.162080, -0.140443, -0.309533, -0.866052, -0.483762, -0.409220, -0.049109, -0.451771, -0.391303, -0.139079, 0.004794, 0.094402, 0.156681, -0.160067, -0.125782, 0.259064, 0.116139, 0.140547, 0.036089, -0.189014, 0.170984, -0.156591, -0.314087, -0.461763, -0.029411, -0.226061, -0.606942, 0.497381, -0.345582, -0.280319, 0.081026, 0.173637, 0.000319, -0.383479, -0.048707, 0.021665, 0.094162, 0.163173, -0.043683, 0.171352, -0.028151, -0.340416, 0.388844, -0.508286, 0.187314, -0.148552, -0.012607, -0.110095, -0.092327, -0.105425, 0.329192, -0.353137, -0.558132, -0.407558, -0.127820, -0.129062, -0.163571, -0.254361, -0.453586, 0.125142, -0.072486, -0.088932, -0.143435, 0.146236, 0.151833, -0.093303, 0.047716, 0.004070, -0.110458, -0.359739, -0.112509, -0.194309, 0.163972, -0.040983, -0.570207, -0.115133, -0.144437, -0.298886, -0.328142, 0.155259, -0.473896, -0.024664, -0.163813, -0.403515, -0.140064, 0.071440, -0.033030, 0.513242, -0.310026, -0.180792, -0.258240, -0.147292, -0.064905, -0.169746, -0.473111, -0.359917, -0.284498, 0.406909, -0.419241, -0.026762, -0.392556, -0.245178, -0.287588, -0.118870, -0.001304, 0.061542, 0.056789, 0.044686, -0.074492, -0.281427, -0.131509, 0.151623, 0.226105, -0.112742, -0.524935, -0.064891, 0.171747, 0.103988, -0.486114, -0.192653, -0.407267, -0.206385, -0.106512, 0.143845, -0.030631, 0.133617, -0.522298, 0.017387, 0.165741, -0.491661, -0.014120, 0.276238, -0.353779, -0.102004, -0.178576, 0.229695, 0.237366, -0.157618, 0.185951, -0.393444, -0.447851, -0.519242, -0.710315, -0.381493, -0.078591, -0.148288, -0.586646, 0.015153, 0.073236, -0.266397, -0.075339, -0.015720, 0.006836, -0.117580, -0.095601, -0.128993, 0.039993, -0.073301, -0.017878, -0.273706, -0.607802, 0.180109, -0.000687, -0.606563, -0.338538, -0.228871, -0.313474, -0.034154, 0.489317, -0.073446, 0.169003, -0.008884, -0.263310, -0.399884, -0.286462, -0.126434, 0.114347, -0.408308, 0.242757]
-,        [0.075358, 0.115308, -0.062523, 0.384273, 0.393879, -0.355937, -0.162699, 0.315646, -0.057600, 0.289665, 0.094029, -0.422592, 0.361970, 0.212324, 0.067438, -0.202929, -0.170738, 0.353229, 0.026191, -0.450906, 0.173054, -0.177019, -0.621068, -0.752772, 0.157799, -0.031361, 0.250050, -0.657429, 0.028521, 0.017048, -0.074022, -0.146587, -0.014478, -0.119719, -0.025168, -0.187236, 0.091000, 0.144263, -0.480999, -0.082823, -0.124937, 0.179864, -0.284275, -0.469972, 0.069748, -0.054932, -0.117081, -0.473225, -0.191022, -0.111316, 0.005863, -0.430861, -0.241825, -0.047225, 0.095226, 0.148284, -0.353869, 0.071801, -0.189391, -0.097340, 0.398890, 0.147428, 0.211895, -0.305939, -0.217550, -0.269033, -0.863224, -0.353804, -0.141096, -0.019996, -0.273113, 0.009755, 0.012213, -0.349560, -0.336673, -0.039937, 0.330690, -0.014073, -0.028382, -0.010083, -0.398502, 0.414118, -0.171950, -0.313919, 0.228486, -0.405622, 0.473552, -0.057799, -0.312569, 0.265723, -0.433453, -0.399168, -0.045621, 0.020680, -0.232485, 0.174124, -0.171833, -0.217164, -0.287349, -0.263271, -0.534088, -0.385699, 0.209130, -0.297781, -0.211838, 0.136564, -0.314279, 0.025994, 0.571524, -0.317932, -0.603581, 0.021963, 0.486777, 0.313317, -0.177004, -0.086822, -0.074630, 0.148113, 0.065305, -0.242318, -0.742950, 0.225440, 0.023924, 0.005852, -0.098094, 0.191980, -0.128360, -0.239930, -0.425022, -0.460132, -0.430411, -0.121423, -0.098444, -0.826424, -0.165528, -0.068576, 0.055064, 0.385145, 0.190747, 0.017496, -0.117192, 0.180935, -0.484970, -0.046113, -0.191972, -0.438998, -0.150288, -0.035015, -0.127578, -0.129178, 0.050661, -0.082221, -0.236997, -0.412757, -0.237946, 0.504487, 0.293558, -0.094856, 0.101072, -0.609563, -0.144613, 0.451624, -0.217487, -0.373907, 0.068924, 0.236822, -0.077012, -0.178960, -0.025976, 0.020780, -0.656612, -0.205807, -0.190363, -0.449579, -0.153844, -0.167243, -0.043711, -0.386356, -0.288459, -0.132276, -0.229787, -0.262585, -0.074226, -0.356933, -0.050473, -0.247348, -0.149243, -0.108064, -0.371382, 0.318849, 0.433909, -0.468073, -0.223712, -0.107014, 0.261960, -0.314056, 0.595198, -0.402506, 0.478644, 0.313762, 0.046705, 0.293021, -0.181758, -0.569868, 0.395042, -0.548723, -0.131031, 0.340098, -0.001145, 0.176782, -0.436557, -0.510312, 0.112361, 0.586312, 0.019162, -0.326814, -0.685496, -0.470043, -0.171194, -0.190045, -0.201926, -0.299819, -0.249611, -0.134489, -0.173042, -0.052940, -1.043772, 0.087723, -0.257147, 0.368143, 0.131445, -0.223252, 0.094769, 0.123753, -0.175363, 0.004836, 0.047573, 0.183763, -0.935179, -0.288854, -0.145445, -0.013826, -0.060932, 0.054114, 0.005065, 0.033263, -0.199669, 0.149424, 0.101711, 0.737083, -0.423421, -0.357018, -0.081856, 0.272328, 0.183507, -0.074239]
-,        [-0.281747, -0.002207, 0.095263, 0.064921, -0.061432, -0.314717, 0.044285, -0.240785, -0.259254, -0.135092, 0.133850, -0.125789, 0.049572, 0.200044, -0.004308, -0.033027, 0.066292, 0.179152, -0.353192, 0.119060, -0.309631, 0.080436, -0.151094, 0.037819, 0.073183, 0.080197, -0.006971, -0.155653, 0.056640, 0.009071, 0.130109, -0.050218, 0.036793, -0.000610, 0.135805, 0.198886, -0.094498, -0.119498, -0.049410, -0.262760, -0.315049, -0.134727, 0.075381, 0.248262, 0.091632, 0.090551, 0.082703, -0.152156, -0.166695, -0.280909, 0.056731, 0.158399, -0.372142, -0.104415, 0.173896, -0.356888, 0.156802, 0.043006, -0.097424, 0.121946, 0.242548, 0.064459, -0.131123, -0.047164, 0.155390, -0.080042, -0.284195, 0.112314, -0.062413, 0.022868, 0.076431, -0.287083, -0.110279, -0.205686, 0.136280, -0.203604, 0.149403, 0.005266, -0.068153, -0.153162, -0.118229, -0.064659, -0.049397, 0.028003, 0.154015, 0.170121, 0.082534, 0.095369, -0.155902, 0.203890, -0.028865, -0.118026, -0.244501, 0.148583, 0.166219, 0.057515, -0.308398, 0.223744, -0.145299, -0.007707, -0.123985, -0.002629, 0.055016, 0.014113, 0.033704, 0.281941, -0.180022, 0.065678, -0.301517, 0.273140, 0.000607, 0.013846, -0.133649, 0.148040, -0.071630, -0.088684, 0.000884, -0.400944, 0.082927, 0.323476, -0.073727, -0.055858, -0.102153, 0.084031, -0.194165, 0.080554, 0.234011, 0.110978, -0.547956, -0.235771, -0.141712, -0.090255, 0.323234, 0.026252, -0.170974, -0.139550, 0.213803, -0.091016, 0.080293, 0.030790, 0.023077, 0.283347, -0.054171, -0.250142, -0.149320, 0.377332, -0.151927, -0.241084, -0.463750, -0.151181, -0.088845, -0.214440, 0.207836, -0.109376, -0.027065, 0.142242, -0.153870, -0.189712, 0.209532, -0.223714, -0.157537, -0.077184, 0.125715, -0.014055, 0.095902, 0.079517, -0.032777, 0.009931, -0.104709, 0.012255, 0.102890, -0.143699, -0.035414, 0.025823, 0.044554, -0.005523, -0.188404, 0.074072, -0.339458, 0.012786, -0.459816, -0.026910, 0.186240, -0.229159, 0.132515, -0.181408, -0.224719, -0.112571, -0.212123, -0.184810, 0.221801, -0.208775, 0.115870, -0.244800, -0.067186, -0.077022, -0.133094, -0.105626, -0.033951, -0.205490, -0.056575, -0.555697, -0.082117, -0.183322, 0.016255, 0.203775, -0.040583, -0.184314, 0.277954, -0.160122, 0.012980, -0.146906, 0.028856, 0.068059, -0.122629, -0.133339, -0.078395, -0.209499, 0.242035, -0.009830, 0.111727, -0.037575, -0.058886, -0.223658, 0.129246, 0.162997, -0.068671, 0.012425, 0.191637, 0.134558, -0.243030, -0.178845, -0.024618, -0.161004, 0.048749, -0.321007, 0.073674, -0.234404, -0.041908, -0.261412, -0.257185, 0.183350, -0.177260, 0.064337, 0.031979, -0.165907, 0.050982, 0.104234, 0.074406, -0.068811, -0.209342, -0.143810, -0.053939, -0.205625, -0.247218, -0.217959]
-,        [0.133286, -0.276201, -0.086195, -0.045704, -0.201370, -0.504529, -0.294914, -0.378934, -0.116763, -0.075481, 0.338235, -0.791381, -0.359880, 0.468906, -0.436351, 0.543442, 0.609902, -0.409101, -0.486336, 0.050275, -0.014446, 0.129021, -0.014692, -0.030785, -0.233544, 0.037040, 0.611280, 0.155753, 0.391209, 0.162942, 0.185179, 0.095921, 0.337120, 0.010586, -0.121522, 0.318083, 0.191110, 0.448074, 0.519942, 0.391766, -0.074713, -0.053046, -0.407096, 0.559949, -0.512071, 0.567733, -0.051452, 0.366687, -0.467481, -0.440670, -0.180632, 0.601489, -0.353881, -0.566223, 0.099369, -0.241874, 0.053117, 0.387770, -0.634764, -0.262613, -0.232362, -0.187554, -0.056187, -0.286614, -0.010293, -0.204191, -0.349004, 0.278882, 0.005255, -0.276064, 0.121357, -0.229733, -0.480435, -0.009161, 0.042037, -0.759606, 0.213106, -0.355355, -0.263168, 0.474284, -0.401741, 0.019344, 0.297311, 0.542771, 0.365596, 0.408888, -0.154495, -0.311236, -0.126716, 0.307758, 0.541499, 0.479485, 0.309068, 0.235659, 0.059621, 0.585791, -0.201758, -0.110336, -0.173211, 0.495518, 0.639363, 0.073007, 0.090053, 0.510065, 0.040042, 0.244939, 0.014029, -0.122033, -0.101565, 0.092142, -0.225246, 0.052970, -0.024759, 0.071744, -0.059748, -0.196878, -0.178355, -0.003387, -0.515930, -0.150418, 0.320099, -0.163287, 0.350110, 0.156045, 0.151049, -0.152276, 0.177647, -0.100140, -0.019617, 0.131550, -0.465104, -0.083572, 0.504794, 0.023168, -0.080745, 0.098712, 0.144165, -0.244689, 0.213418, -0.324076, 0.154108, -0.019308, -0.087251, -0.486129, 0.363232, 0.364543, 0.317344, 0.657850, -0.150874, -0.283816, -0.136455, -0.875603, 0.157669, 0.462332, -0.046811, -0.495379, 0.063050, -0.291209, -0.640223, -0.087168, -0.114405, -0.234879, 0.205918, -0.155879, -0.209066, 0.116524, 0.061306, -0.431683, 0.149089, 0.761576, 0.660286, -0.134233, 0.199734, 0.234669, -0.404240, 0.159232, 0.924728, 0.296612, -0.027450, 0.168104, 0.034851, -0.126180, 0.245889, 0.274715, 0.113965, 0.066970, 0.514436, 0.020790, 0.413839, -0.620002, 0.254555, 0.040515, 0.194702, 0.137604, -0.058427, 0.445761, -0.253365, 0.537256, -0.334114, 0.111883, -0.056023, -0.284858, 0.086325, -0.198742, 0.242690, -0.121623, -0.749163, 0.055056, -0.198154, -0.249974, 0.378841, -0.177988, 0.010200, -0.166182, 0.219152, -0.325748, -0.129291, -0.075794, 0.336127, 0.208083, -0.017033, 0.079239, -0.171323, 0.088716, -0.140992, 0.242120, -0.219859, -0.000599, 0.226142, 0.165936, 0.056769, -0.325357, -0.083095, 0.109985, -0.097721, -0.043173, 0.418205, -0.023197, -0.295415, -0.565778, 0.059613, 0.199681, -0.183958, 0.473316, 0.216252, -0.246547, -1.012686, 0.085324, 0.122549, 0.454247, -0.177482, -0.304795, -0.388180, 0.204640, -0.165564, 0.448890]
-,        [-0.216707, 0.159042, 0.092188, 0.020766, -0.125197, -0.253403, -0.035318, 0.068210, -0.020878, -0.358470, 0.218480, 0.251760, -0.113244, -0.279449, -0.103557, 0.064484, 0.081313, 0.159787, 0.137370, 0.100641, -0.087009, -0.183681, -0.000699, -0.198643, 0.059427, -0.200753, -0.156161, -0.019572, 0.061389, -0.012940, -0.053336, -0.391118, 0.093956, -0.205272, -0.039164, 0.069634, -0.100082, 0.060320, -0.106012, -0.111044, -0.175696, -0.455998, 0.167954, 0.290436, -0.204469, -0.036683, -0.076733, -0.017120, -0.221536, 0.189137, -0.027008, -0.359317, -0.151452, -0.125794, -0.279334, -0.084010, 0.200637, -0.061786, -0.027761, -0.053332, -0.366026, -0.134685, -0.053355, -0.417764, -0.279660, -0.073262, -0.015346, 0.095929, 0.108776, -0.057228, -0.109737, -0.026745, 0.019482, 0.127692, 0.001358, 0.023642, -0.041436, -0.227125, -0.260572, -0.106791, 0.023244, -0.047894, -0.135592, -0.048361, -0.021092, -0.297051, -0.102641, -0.044614, -0.144838, 0.062703, 0.158753, -0.038558, 0.014335, -0.091474, -0.050517, -0.060206, -0.302543, 0.027733, -0.349612, 0.090478, -0.058085, -0.049193, -0.113848, -0.022164, -0.032298, -0.154029, 0.070669, -0.038652, -0.079123, 0.111199, -0.052589, 0.076585, 0.081068, 0.057949, 0.040436, 0.054228, -0.092352, -0.173586, -0.136895, -0.309528, 0.092262, 0.074135, 0.053394, -0.216145, -0.066593, 0.072125, 0.114781, -0.013450, -0.186898, -0.036663, 0.111277, 0.170720, 0.035468, 0.053417, -0.265214, -0.281315, 0.228663, -0.178066, -0.176512, 0.060610, 0.012854, -0.036178, -0.042432, -0.081561, 0.005516, 0.139398, -0.082067, 0.005228, -0.005922, 0.157334, 0.030639, -0.031641, 0.076122, -0.103789, -0.115959, -0.257147, -0.082173, -0.167038, -0.193551, -0.204959, -0.034394, 0.097999, -0.258011, -0.414991, 0.000763, -0.011973, 0.171958, -0.304985, -0.238547, 0.069643, -0.218266, 0.117737, -0.494448, 0.044862, -0.052278, -0.086200, 0.081184, -0.113715, -0.255098, -0.174967, -0.148950, -0.001234, 0.037636, -0.361169, -0.165246, -0.018720, -0.235869, 0.020976, 0.064151, -0.203214, -0.048173, -0.141398, -0.041094, 0.049388, -0.068264, -0.375573, -0.027035, -0.323771, 0.168402, 0.320525, 0.040679, -0.273893, -0.372213, -0.209474, -0.242224, 0.158056, -0.141785, 0.028968, -0.027254, 0.005043, -0.048887, -0.120288, 0.151597, 0.085924, -0.008911, -0.149090, -0.139761, -0.117845, -0.366727, 0.102972, -0.163857, 0.150726, -0.068163, -0.410982, 0.092164, -0.070066, -0.128355, -0.022489, -0.022485, 0.129813, -0.170908, -0.194713, 0.034560, -0.121137, -0.066006, -0.434356, 0.182567, 0.072760, -0.044139, -0.324322, 0.042439, -0.064826, -0.339210, -0.054253, -0.163210, -0.129376, -0.008800, -0.200724, 0.012025, 0.009353, -0.037444, 0.062486, 0.040057, -0.164753, 0.081048, 0.061518]
-,        [-0.130661, 0.001892, 0.099130, -0.120616, 0.019422, 0.150616, 0.039223, -0.125701, 0.074490, -0.012863, -0.220144, 0.010708, -0.111411, -0.198913, -0.019859, -0.172940, -0.062288, -0.152453, -0.244262, -0.082000, -0.056700, -0.165909, -0.062678, -0.091574, 0.015652, -0.088858, -0.138264, -0.291565, -0.108864, 0.091493, -0.189972, 0.027287, -0.037214, -0.106304, 0.164208, -0.051723, -0.041156, 0.002363, -0.163810, -0.125577, -0.178354, 0.015863, -0.122883, -0.017299, -0.165463, -0.040364, -0.195436, -0.130271, 0.073521, -0.100774, 0.030459, -0.162237, -0.060095, -0.063608, -0.172775, -0.215702, 0.147339, -0.175290, -0.130476, -0.043825, -0.148475, -0.069898, -0.288943, -0.154213, -0.200520, -0.132317, -0.115956, -0.013592, -0.146996, 0.052798, -0.031523, -0.164053, -0.235543, 0.112676, -0.045591, -0.139323, 0.018886, -0.058861, 0.107078, -0.010765, -0.233610, -0.070527, -0.000423, 0.131664, -0.038170, -0.006646, -0.108634, -0.025078, 0.049421, 0.009175, 0.031220, 0.126744, 0.011810, -0.054358, 0.069119, -0.052508, 0.082351, 0.031918, -0.335485, 0.077212, -0.090457, -0.030172, 0.036442, -0.115993, 0.157341, -0.054114, -0.037474, -0.069415, -0.055994, -0.135708, -0.190365, -0.117652, -0.121716, -0.148371, 0.017131, -0.020200, -0.232126, -0.062020, -0.047391, 0.056264, -0.048919, -0.055980, -0.160721, 0.162607, 0.009534, -0.072912, 0.050253, -0.003814, -0.112069, -0.074347, -0.092642, -0.038502, -0.020136, -0.168271, -0.140487, -0.155814, -0.008015, -0.223863, -0.082364, -0.050610, -0.017435, -0.010947, -0.028760, -0.003499, -0.138737, -0.058660, -0.076066, -0.148341, -0.061343, -0.137680, -0.168069, 0.001140, 0.012332, -0.159179, -0.029060, 0.016034, 0.064364, -0.118337, -0.201136, 0.010918, -0.087559, 0.199714, -0.058142, 0.015842, 0.117602, -0.092899, 0.042059, -0.152625, 0.060378, 0.060800, 0.039507, 0.087138, -0.032038, -0.088217, 0.017857, -0.015739, -0.094362, 0.290590, 0.054464, 0.160086, 0.012747, 0.041105, 0.008969, 0.140421, -0.207428, 0.002824, 0.057370, -0.203691, -0.088969, -0.017010, -0.261343, 0.088055, -0.139518, 0.053337, 0.020614, -0.179004, -0.066584, -0.017003, -0.144680, -0.054057, -0.127775, 0.044403, -0.023105, -0.236955, 0.051606, -0.145057, -0.153962, -0.029344, 0.000645, 0.086493, 0.013726, -0.090975, 0.009471, -0.335542, -0.001392, -0.146856, -0.174327, 0.010527, 0.052752, -0.033899, -0.090130, -0.052937, -0.200263, 0.140023, -0.085163, -0.103066, -0.036601, -0.147051, -0.138135, -0.085484, -0.131804, -0.081568, 0.083587, 0.009801, -0.041665, -0.133147, -0.126755, 0.079244, 0.040868, -0.078117, -0.156904, 0.124461, 0.049725, 0.025116, -0.078888, 0.136196, -0.099542, -0.099995, -0.204553, -0.055415, -0.144412, -0.040538, -0.026918, 0.163436, 0.037112, 0.120591]
-,        [-0.037351, 0.221982, -0.184053, -0.175240, 0.133011, -0.192282, -0.159150, -0.282250, -0.072327, -0.009912, -0.022386, -0.231258, -0.150832, 0.121780, 0.049074, -0.186327, -0.129860, -0.216819, 0.017106, -0.171127, -0.023112, 0.046585, -0.016599, -0.072256, -0.284581, -0.090314, -0.261596, 0.087902, -0.091293, 0.075191, -0.053353, -0.038506, 0.181984, 0.136584, 0.121707, -0.058216, 0.116518, -0.165127, -0.261134, -0.108306, 0.149693, -0.006637, 0.062729, 0.095332, -0.002849, 0.203544, -0.006267, -0.006893, 0.014136, 0.094693, 0.057692, -0.144616, -0.183358, 0.050760, -0.179111, 0.051383, 0.123502, -0.018875, -0.093137, -0.110766, 0.069339, -0.102435, -0.014443, 0.016495, 0.066852, -0.151679, -0.105006, -0.080215, 0.138201, 0.008877, -0.070684, -0.285033, 0.028372, -0.159614, 0.034790, -0.332794, -0.212009, -0.093428, 0.044037, -0.023505, -0.105661, 0.094125, -0.199995, -0.091841, -0.086661, -0.004434, -0.158455, -0.120090, -0.041635, 0.076579, 0.077329, -0.185801, 0.005780, -0.215631, 0.023130, -0.112949, -0.108507, -0.120560, -0.118958, 0.116429, -0.290742, -0.136536, 0.014651, 0.067786, 0.072613, 0.075960, -0.099500, 0.208897, -0.121679, -0.000646, -0.164054, 0.074302, -0.063245, 0.006351, 0.077586, -0.102626, -0.143963, 0.123516, -0.138270, -0.256676, -0.131004, -0.054986, -0.146197, -0.003530, -0.141915, 0.070469, 0.080020, -0.001989, 0.083100, -0.261337, 0.071777, 0.246250, -0.015494, -0.145039, 0.006503, 0.132198, -0.049627, -0.095338, -0.074659, -0.022565, 0.193033, -0.052961, -0.164509, 0.147502, -0.044580, -0.150786, -0.053294, 0.142538, -0.276375, 0.092873, -0.100749, 0.119417, -0.153473, -0.091529, 0.096755, -0.151325, -0.034944, 0.088538, 0.135107, -0.095499, 0.049810, 0.037893, -0.344857, -0.193146, -0.095006, -0.188904, -0.014126, -0.108493, -0.037084, 0.010317, 0.024687, 0.011203, 0.003915, -0.014855, 0.036241, -0.196460, -0.149175, 0.082334, -0.039667, -0.183836, 0.032708, -0.079454, 0.124357, -0.134063, -0.380238, 0.032907, -0.228643, -0.083008, -0.138869, 0.027691, -0.066308, 0.028771, 0.057710, -0.139448, -0.096472, -0.028705, -0.077967, 0.241289, -0.269097, -0.187488, 0.059626, -0.207723, -0.098073, -0.169348, 0.039001, -0.115472, -0.079895, -0.237184, 0.168009, -0.254899, -0.087362, -0.159297, -0.148972, -0.301898, 0.169896, -0.003255, -0.121428, -0.043703, -0.012153, -0.212677, -0.150716, -0.053161, -0.059783, 0.091968, -0.054758, -0.147704, 0.006722, 0.111986, -0.141917, 0.050630, -0.019747, -0.119592, -0.072431, -0.000340, 0.050576, -0.212122, 0.077507, -0.064183, -0.089186, -0.224716, 0.122470, -0.058644, 0.079098, -0.092833, -0.078093, -0.029305, -0.185396, 0.055912, -0.049571, -0.172414, -0.168034, 0.012545, 0.011847, 0.062776, -0.153661, 0.142136]
-,        [-0.181917, 0.085636, -0.044128, 0.044107, -0.107696, -0.181501, -0.161281, -0.131915, -0.145579, 0.079477, 0.004231, -0.088337, -0.068325, -0.158248, -0.040375, 0.029475, 0.040847, -0.249153, -0.092114, -0.193194, -0.083964, 0.243683, 0.009260, 0.050685, 0.041836, -0.013814, -0.135400, -0.046851, -0.000369, -0.107433, -0.073107, -0.050729, 0.160758, 0.017585, -0.030903, -0.030080, -0.102527, -0.029392, -0.023198, -0.067064, -0.158562, -0.001591, -0.024607, -0.004297, -0.027904, 0.131463, 0.064112, -0.071999, -0.092187, -0.112092, -0.104572, 0.038478, -0.179138, -0.000661, -0.031744, -0.056743, -0.150104, 0.002832, -0.043548, 0.059166, -0.144504, -0.179041, 0.028814, 0.016257, -0.002396, 0.173166, 0.030584, 0.016003, -0.158759, 0.176613, 0.136575, -0.088783, 0.086092, 0.139571, -0.140974, -0.009560, 0.003283, -0.118787, -0.035912, -0.170315, -0.011605, -0.149469, -0.079688, 0.133752, 0.112032, -0.004435, -0.054693, -0.084352, -0.066607, -0.124722, 0.129342, -0.153175, -0.077875, 0.081601, -0.301574, -0.386756, 0.053109, 0.038854, -0.118277, -0.000252, -0.010421, -0.034340, 0.040865, 0.115230, -0.190748, -0.149639, -0.073794, -0.121313, 0.104275, -0.305375, 0.008388, -0.088218, -0.119796, -0.079025, -0.206795, 0.054384, 0.212677, -0.090910, 0.155796, -0.064886, -0.076839, -0.105323, -0.156067, -0.069224, -0.209660, 0.091121, -0.011569, -0.128290, -0.195484, -0.045550, -0.002922, 0.098606, -0.014365, 0.067306, -0.100463, -0.122750, 0.006781, 0.020622, 0.078727, -0.048197, 0.006310, -0.041763, -0.147316, -0.091522, -0.163260, -0.091128, -0.132299, 0.022459, -0.060833, 0.039299, -0.185018, 0.037041, -0.066723, -0.077313, 0.009197, 0.061714, -0.029042, 0.000903, -0.022209, -0.157378, 0.015543, 0.019592, -0.167900, -0.115363, -0.038963, -0.051423, -0.013125, -0.055602, 0.027427, -0.058470, 0.049293, -0.032062, 0.021826, -0.016312, -0.083914, -0.048176, 0.103834, 0.088267, -0.129421, -0.130249, -0.025328, -0.053649, -0.001593, 0.146007, 0.053011, 0.010005, -0.026006, 0.003682, -0.005914, -0.184196, 0.122196, -0.088866, -0.125316, -0.071085, -0.163291, -0.057247, 0.085795, -0.061560, -0.113535, -0.178579, -0.182949, 0.193919, -0.114694, 0.138462, 0.235483, -0.044147, -0.049037, -0.042321, -0.165882, -0.087067, -0.031885, -0.117422, 0.020271, 0.011228, -0.084199, 0.092105, 0.014109, -0.099897, -0.051470, 0.039095, 0.112394, -0.036569, -0.061039, 0.092397, 0.026036, 0.202248, 0.047943, -0.141717, -0.073202, 0.159992, 0.011740, 0.084565, -0.031294, -0.038243, -0.068728, -0.143201, -0.038929, 0.158224, 0.030712, -0.117082, -0.126152, 0.024082, 0.035284, -0.104329, 0.082679, 0.027374, 0.002919, -0.098317, -0.041628, -0.019713, -0.018848, 0.115478, -0.089578, -0.103019, 0.040516, 0.130495]
-,        [-0.203277, -0.679272, -0.238619, 0.001835, -0.705024, -0.165647, -0.383823, -0.418853, 0.279522, 0.170055, 0.279341, -0.349317, 0.129509, -0.041843, -0.003917, 0.295744, -0.386452, 0.218675, 0.803314, 0.462124, 0.139767, -0.398473, 1.000737, 0.650718, -0.275197, -0.117927, 0.578891, 0.417995, -0.171493, 0.465991, 0.161004, -0.723865, 0.019921, 0.158236, 0.387621, 1.086691, 0.549037, 0.367202, 0.500303, 0.904081, 0.559789, 0.154204, -0.149683, 0.484471, 0.303948, -0.693136, 0.956140, 0.337738, -0.727837, 0.108317, -0.852259, 0.847851, -0.471790, -0.436743, 0.693712, -0.014551, -0.233087, 0.686259, -0.305172, -0.290017, -0.056941, -0.024000, -0.361829, 0.130561, -0.291490, -0.485331, 0.022807, 0.101219, 0.136217, 0.657807, -0.458388, -0.167988, 0.366905, -0.000365, 0.211735, 0.750595, -0.758427, -0.082068, 0.140147, 0.528225, 0.198511, -0.276603, 0.237932, 0.282721, 0.632295, 1.235570, 0.342520, -0.010616, 0.506208, 0.689888, 0.660948, -0.362224, -0.037839, -0.324230, 0.051026, 0.248807, 0.228312, 0.406454, 0.039580, 0.649182, 0.022599, -0.007116, -0.240159, 0.423043, 0.477068, 0.568639, 0.581846, 0.077663, -0.432783, 0.570220, 0.369822, 0.046070, -0.031595, 0.649612, -0.125310, -0.520519, -0.115933, -0.671603, 0.085420, 0.131709, -0.055508, 0.347334, 0.088195, -0.115966, 0.228710, -0.169638, 0.077284, 0.306575, -1.037667, 0.559178, 0.016044, 0.069724, 1.048971, 0.661002, -0.198261, 0.358481, -0.201018, -1.134049, 0.037158, 0.601438, 0.094866, 0.297368, 0.160449, -0.678668, -0.103209, -0.215024, -0.255911, 0.202889, -0.545018, 0.286320, -0.558597, -0.057883, 0.369545, 0.193592, -0.140107, -0.190416, -0.237751, 0.922564, -0.061108, 0.210872, 0.814432, 0.729717, -0.367229, 0.160864, 0.457235, 1.033904, 0.422011, -0.045783, 0.024408, 0.172992, 0.049996, 0.417635, -0.173575, 0.033774, -0.558615, 0.226735, -0.248854, -0.756019, 0.176764, -0.307482, -0.650554, 0.733537, 0.480865, 0.563126, 0.190393, -0.272724, 0.364313, -1.174610, 0.774538, -0.147344, 0.243867, 0.127668, -0.431731, 0.001698, -0.102083, 0.147679, -0.357748, -0.041196, 0.193783, 0.658419, -0.224231, 0.961517, 0.338191, 0.000044, -0.539372, 1.063017, -0.003205, 0.097193, 0.371505, 0.338826, 0.282554, -0.865251, 0.077863, 1.239413, 0.073228, -0.053712, 0.539081, 1.022194, 0.116121, -0.181315, 0.467830, -0.493516, -0.310071, 0.807335, 0.748440, 0.409525, -0.960555, 0.106855, 0.246822, 0.071013, 0.225861, -0.152010, 0.108674, 0.361306, 0.583840, -0.610394, 0.207868, 0.270754, 0.507174, -0.701296, 0.053800, 0.003466, 0.089553, 0.116563, 0.308382, -0.128450, -0.121144, 1.004237, 0.122741, -0.448303, 0.423160, 0.289126, -0.082977, -0.136781, -0.794903, 0.437160]
-,        [-0.294758, 0.050849, -0.145719, -0.825773, -0.819907, -0.518281, -0.082794, 0.005250, 0.416958, -0.042912, 0.093919, -0.325158, 0.426771, 0.583673, 0.086588, -0.403807, 0.612333, 0.124967, 0.103898, 0.522436, 0.761498, 0.047775, -0.079165, 0.077135, -0.363114, -0.060526, -0.200532, -0.780903, -0.235358, 0.423530, 0.518892, -0.145214, 0.484672, 0.564321, -0.250856, 0.033728, -0.704811, 0.079077, -0.392644, 0.214370, 0.080270, -0.779862, -0.256145, -0.420002, -0.157146, -0.866434, -1.010791, 0.202137, -0.406460, -0.369800, -0.249086, 0.538901, -0.229164, 0.192322, -1.048024, -0.308020, -0.218191, 0.312481, -1.063409, -0.070099, 0.073995, 0.197095, 0.093005, 0.517655, 0.065413, 0.355301, -0.031788, -0.600561, 0.227174, -0.426220, 0.790792, -0.340305, 0.219269, 0.005963, -0.061838, -0.171887, 0.520709, -0.139493, -0.065708, -0.329211, -0.743960, 0.617143, -0.454292, -0.203056, 0.046745, -0.691383, 1.045750, -0.019821, 0.056243, -0.299338, -0.150438, 0.066845, -0.843871, 0.267079, 0.019958, -0.383621, 0.226847, -1.084003, 0.059182, -0.104395, 0.761621, -0.039968, 0.107575, 0.638337, 0.460148, 0.728050, -0.711016, 0.248310, -0.453288, -0.263272, 0.277469, -0.389661, -0.510166, -0.139277, -0.236628, 0.010383, 0.117703, 0.117545, 0.973616, -0.228054, -0.377751, -0.491429, -0.215730, -0.912357, -0.234601, 0.313985, -0.155247, -0.315789, -0.322774, -0.586397, -0.614715, -0.428805, -0.003922, -0.556567, -0.420397, -0.671886, -0.751706, 0.052376, 0.078732, -0.959303, -0.027292, -0.021449, -0.353153, -0.570989, -0.698826, -0.240489, -0.460672, 0.395916, -0.308265, 0.392689, -0.548638, 0.002513, -0.451227, 0.296544, -0.028859, 0.183491, -0.459816, -0.925379, -0.998148, -0.406661, 0.356626, -0.041166, -0.010256, -0.174096, 0.260187, 0.224610, 0.932875, -0.398650, -0.354828, -0.148262, -0.523675, -0.404788, -0.193974, 0.040772, 0.459561, -0.017024, -0.040697, -0.077641, -0.610628, -0.240863, -0.080141, 0.398978, -0.309619, 0.106084, -0.451104, -0.042319, 0.271037, 0.531936, -0.353890, -0.561076, 0.816268, 0.468800, -0.897266, -0.151195, -0.332234, -0.046396, -0.235269, -0.564798, -0.436814, -0.121121, -0.274575, -0.269072, 0.110608, 0.459039, -0.131426, -0.194637, -0.318130, -0.635921, 0.043357, 0.016699, -1.035743, -0.124910, -0.055772, -0.126186, -0.403522, -0.414793, -0.282447, 0.106591, -0.369415, 0.086902, 0.026888, -0.154207, -0.711867, -0.563647, 0.012094, 0.233798, -1.021184, -0.073297, -0.025920, -1.210163, 0.344718, 0.013104, -0.100638, 0.061390, -0.779442, -0.051042, -0.154089, -1.014226, 0.253056, -0.643083, 0.679194, -0.221379, -0.158223, 0.737522, -0.015713, -0.401097, -0.311317, -0.115712, 0.359708, -0.049570, 0.351118, -0.271492, -0.041072, 0.239392, 0.013046, -0.471417]
-,        [-0.407239, -0.001071, 0.196866, -0.379298, -0.117203, -0.289960, 0.338149, 0.082033, -0.416746, -0.016091, 0.132860, -0.168404, -0.146245, 0.514870, -0.132497, -0.486856, 0.124784, -0.187583, -0.607296, -0.270651, -0.353099, -0.322032, -0.521345, -0.601076, -0.358820, 0.044376, -0.111356, -0.284011, -0.178459, -0.418961, 0.270446, -0.457408, 0.213512, -0.257498, -0.200568, -0.289745, -0.039657, -0.270703, 0.000784, -0.073166, -0.376061, 0.108021, -0.077309, 0.129894, -0.229646, -0.291483, -0.314135, -0.468454, -0.322768, -0.119113, 0.236535, 0.105620, -0.258436, -0.024718, -0.186671, -0.215215, 0.044332, 0.153565, 0.241210, 0.088360, -0.472913, -0.067185, -0.459892, -0.489336, -0.697976, -0.038995, -0.244234, -0.252920, -0.015962, -0.103921, -0.319589, -0.468107, 0.352820, -0.566681, -0.460743, -0.058878, -0.325315, -0.367979, -0.270508, -0.047805, -0.451856, -0.328481, -0.040000, -0.207778, -0.453975, -0.082568, 0.083124, 0.356643, 0.031667, 0.215964, -0.360281, 0.037772, -0.147652, -0.000472, -0.014602, 0.253830, 0.225126, -0.211016, -0.078187, -0.254332, -0.400385, -0.295854, -0.279894, -0.203897, 0.052230, -0.086403, -0.195091, -0.361233, 0.389940, 0.337162, -0.280884, -0.137545, -0.009939, -0.009779, 0.423499, -0.248713, -0.308074, -0.125914, -0.078535, -0.062568, -0.755924, -0.090285, 0.213118, 0.008431, -0.107859, 0.008895, -0.034658, -0.225650, -0.542612, -0.064083, -0.246309, -0.390415, -0.370254, -0.581391, 0.046529, -0.210030, -0.021602, -0.354654, -0.246665, -0.157702, 0.244830, 0.561207, -0.293032, -0.709838, -0.307799, 0.367875, -0.353751, 0.096667, -0.374172, -0.014803, -0.013962, 0.096463, -0.247638, -0.181501, -0.069778, 0.063069, -0.301315, -0.628416, 0.161374, -0.062134, -0.086465, -0.474638, -0.003044, -0.061474, 0.060550, -0.277100, 0.145706, -0.426362, -0.387852, -0.440342, -0.186241, -0.326901, -0.197288, 0.151852, 0.038993, -0.323197, -0.212740, -0.173145, -0.362712, -0.293404, 0.262707, -0.211171, 0.068224, -0.388665, 0.227913, -0.060564, -0.347855, -0.179165, -0.429977, -0.135335, -0.242043, -0.361175, -0.095211, 0.038305, 0.119533, -0.018040, -0.162462, -0.734717, 0.002284, 0.353830, 0.491838, -0.378522, -0.307978, 0.201173, -0.788376, 0.065970, -0.235063, -0.141326, 0.118510, 0.061447, -0.160399, -0.021088, -0.103888, -0.023777, -0.295060, -0.296455, -0.563930, -0.075938, -0.094080, -0.163746, 0.151188, -0.425262, 0.094569, -0.233910, 0.432340, 0.116866, -0.711575, 0.012737, -0.194676, -0.265784, -0.486750, -0.263561, -0.045753, -0.024010, 0.168058, -0.372964, 0.206138, -0.101316, 0.003993, -0.367705, -0.318269, -0.076139, -0.452641, -0.475466, -0.065113, -0.248443, 0.235302, -0.071893, 0.231948, -0.207108, -0.313749, -0.045249, -0.293698, -0.060338, 0.019033, -0.315188]
-,        [-0.106776, -0.542032, 0.161205, -0.202012, 0.061249, -0.106074, -0.096688, 0.167001, -0.030413, -0.137183, 0.115139, -0.327177, 0.154180, -0.218604, 0.114790, -0.269368, 0.164316, -0.050281, -0.044506, 0.135460, 0.122093, -0.095964, -0.115862, 0.340261, -0.355689, 0.035503, -0.341789, 0.201919, 0.378332, 0.647766, 0.353593, 0.262970, -0.109551, 0.350937, 0.057615, -0.002800, 0.334106, -0.088695, -0.142564, 0.044223, 0.092498, -0.387520, -0.271401, 0.613968, 0.111828, 0.153223, -0.141044, -0.194088, -0.384821, 0.037469, -0.220803, 0.588696, -0.243530, -0.121769, 0.029589, -0.334121, 0.034159, 0.159608, 0.199091, -0.080976, 0.295896, 0.144742, -0.061428, -0.217633, -0.014714, 0.254695, 0.107719, 0.114093, 0.088391, 0.084978, 0.241107, -0.526062, -0.151379, 0.229953, -0.287874, 0.404975, 0.250352, -0.123034, -0.336204, -0.432687, -0.352891, 0.417830, 0.121055, 0.146619, 0.273982, -0.041229, -0.309253, -0.042448, -0.620086, 0.047229, 0.141491, 0.580032, -0.516210, -0.541609, -0.248260, 0.074775, -0.157278, 0.343850, -0.143359, 0.248687, 0.209703, 0.130789, -0.176700, 0.016238, -0.354379, -0.152861, -0.323112, 0.059594, -0.159167, -0.188608, -0.446087, -0.219416, -0.135589, -0.153249, -0.347713, 0.407278, 0.008596, 0.232247, -0.202650, -0.399641, -0.026970, 0.264791, 0.130380, -0.243669, 0.128068, 0.268165, 0.494182, -0.138787, -0.005649, -0.042381, -0.622575, 0.029831, 0.179328, -0.256628, 0.302405, -0.108385, 0.119530, 0.000930, 0.030237, 0.180334, 0.084703, 0.428050, -0.111301, -0.199967, 0.100321, 0.121521, -0.169109, -0.112444, -0.244057, 0.370675, -0.315449, -0.486605, -0.146238, 0.290517, -0.237365, 0.658584, -0.260628, 0.073276, 0.182985, 0.404639, 0.618263, 0.086675, 0.429981, 0.252990, -0.236321, -0.102402, 0.094431, -0.244912, 0.029541, 0.225834, 0.042395, -0.228658, 0.194480, -0.165435, -0.131909, -0.141494, 0.226374, -0.146411, -0.476502, 0.017054, 0.017014, -0.387160, -0.304620, -0.449872, 0.245381, 0.108281, 0.314410, -0.255228, 0.372706, -0.571435, -0.004889, 0.102610, -0.147139, 0.346021, -0.562159, 0.068940, 0.254157, -0.322623, -0.198164, -0.164484, -0.092515, 0.142374, 0.113349, -0.212686, 0.084138, 0.149955, 0.473270, 0.214167, -0.113594, -0.062402, 0.394952, 0.267870, -0.105203, -0.279025, 0.196709, -0.216709, -0.355372, -0.056967, 0.032388, 0.136319, 0.058155, 0.157341, -0.237153, 0.111889, -0.099825, 0.136586, -0.510891, -0.161357, -0.001430, -0.190528, -0.459292, -0.093196, 0.000278, 0.023869, -0.724043, -0.132436, -0.135867, -0.164239, 0.490951, -0.363472, 0.294505, 0.089028, -0.474118, -0.122907, 0.324512, -0.170913, -0.201078, 0.159510, -0.290207, 0.106487, 0.277729, -0.290391, -0.403151, -0.052735, 0.478421, 0.265440]
-    ],
-    "trunk.2.bias": [-0.236383, -0.123279, -0.326191, -0.137728, -0.579530, -0.611833, 0.034507, -0.654366, -0.624324, -0.183554, -6.876711, -0.119661, -0.210804, -0.165314, -0.205506, -0.168917, -0.451576, -0.445496, -0.618294, -0.074000, -0.011628, -0.502811, -0.121841, -0.073717, -0.285747, -0.050216, -0.186146, -0.487869, -0.506045, 1.025003, 1.239032, -0.369517, -0.139358, -0.264018, -0.325464, -0.085909, -0.107490, -0.242510, -0.251990, -0.118881, -0.340788, -0.237001, -0.054664, -0.062751, -0.176497, -0.345007, -0.482011, -0.140404, -0.393603, -0.617853, -0.216014, -0.353681, -0.270345, -0.308106, -0.257106, -0.209622, -0.217259, -0.292140, -0.176557, -0.076412, -0.328886, -0.329831, -0.117546, -0.161892, -0.081301, -0.084355, -0.224790, -0.346676, -0.355237, 2.296404, -0.428361, -0.345113, -0.109830, -0.220896, -0.448166, -0.570363, -0.303776, -0.281817, -0.475592, -0.125629, -0.209236, 0.667287, -0.088430, -0.360054, -0.131227, -0.510106, -0.283692, 0.302572, 0.444497, -0.331370, -0.091312, -0.303900, -0.724572, -0.092422, -0.146514, -0.068135, -0.000523, -0.163543, -0.236639, -0.456927, -0.257558, -0.409545, -0.613885, -0.238042, -0.115803, -0.420303, -0.441081, -0.075761, -0.279929, -0.447182, -0.373813, -0.512036, 0.053507, -0.054920, 0.102512, -0.141429, -0.276321, -0.190274, 0.067471, -0.508480, -0.182190, -0.088917, -0.154654, -0.110129, -0.054243, -0.301560, -0.254332, -0.320699],
-    "play_head.weight": [
-        [-0.514739, 0.175985, 0.264929, -0.137697, 0.153968, -0.578798, -0.911642, -0.379274, 0.912162, 0.152111, -0.181060, -0.083554, -0.059010, -0.048214, -0.053024, -0.074534, -0.460640, 0.242901, -0.199956, -0.100913, -0.416458, -0.087576, 0.149839, -0.026306, 0.128729, 0.283571, 0.162488, -0.006120, -0.184850, -0.339778, -0.816443, -0.187968, -0.059348, 0.040348, 0.008102, 0.101261, -0.179656, -0.024518, -0.234514, 0.817281, 0.536508, -0.117636, -0.010986, 0.224689, 0.038805, 0.330335, -0.628388, 0.133353, -0.094665, -0.376168, 0.108380, -0.122117, 0.156275, 0.152186, -0.119201, 0.024939, 0.198483, -0.176117, -1.132594, 0.051533, 0.889016, 0.085256, 0.018984, -0.177964, -0.170321, 0.153811, -0.005563, 0.243810, -0.302742, -0.820325, 0.798747, -0.014138, -0.647895, -0.175161, -0.125161, 0.339981, -0.237157, -0.304472, 0.384664, -0.139031, -0.235615, 0.306879, -0.014734, 0.448806, 0.324047, -0.160412, 0.164342, 0.516448, -1.172216, 0.128941, -0.092886, 0.087949, -0.462021, 0.102838, 0.227325, 0.175501, 0.179965, -0.074556, 0.598267, 0.423845, -0.310226, 0.655243, 0.104145, 0.083481, 0.234186, -0.106421, 0.090644, -0.277948, -0.413263, -0.339156, -0.170689, -0.341980, 0.253171, -0.006871, 0.099317, 0.098889, -0.091203, 0.591639, 0.074491, 0.084843, 0.028762, -0.138437, -0.064979, 0.033790, -0.035310, 0.416446, 0.407077, -0.421713]
-,        [-0.562354, -0.100056, 0.549479, -0.278058, 0.040529, -0.280120, 0.242118, 0.189747, -0.118898, -0.142814, 0.215438, 0.087318, -0.456451, -0.319808, -0.066532, 0.313850, 0.049555, 0.018254, -0.930443, -0.052476, -0.071120, -0.026526, 0.152676, -0.165533, -0.110729, -0.232185, 0.504652, 0.341815, -0.405356, 0.895008, -0.220634, -0.123123, 0.187527, -0.081190, 0.295025, -0.234895, -0.345966, 0.268248, 0.186546, -0.162055, -0.297657, -0.026247, -0.114065, 0.242110, 0.098543, 0.207853, 0.186588, 0.082881, 0.044045, -0.510363, 0.189206, 0.173364, 0.219504, -0.037882, -0.093026, 0.089311, -0.435339, 0.293731, -0.115035, 0.014655, 0.124959, 0.130307, 0.092369, 0.550331, 0.023435, -0.055265, -0.005642, 0.002069, -0.174780, -0.015387, -0.599458, -0.231633, -0.370672, 0.077846, -0.435613, -1.110619, -0.073578, -0.371230, -0.255799, 0.097276, 0.189602, -0.119348, 0.014939, -0.058736, 0.412030, -0.112077, -0.229386, 0.111156, -0.830212, -0.231749, -0.033879, -0.281431, 0.134985, -0.155720, -0.001463, 0.049655, -0.293282, 0.042619, 0.442820, -0.467628, 0.292148, 1.054978, -0.387363, 0.189495, -0.021695, -0.395348, -0.311241, -0.619256, -0.773595, -0.260402, -0.135581, 0.357563, -0.510712, 0.066240, -0.320893, 0.112024, 0.110058, -0.388523, -0.512017, 0.411691, -0.040495, -0.121412, -0.102704, 0.035484, -0.720669, -0.463099, -0.023175, -0.449848]
-,        [0.454503, 0.150562, -0.028372, -0.299159, -0.038720, -0.480816, -0.924233, -0.285345, 0.496680, 0.395325, 0.579025, 0.127348, -0.215128, -0.186312, -0.317192, -0.410209, -0.076809, -0.116938, 0.588104, -0.095340, -0.076071, -0.064803, -0.022921, -0.068400, -0.352633, 0.219232, -0.833091, -0.502733, -0.008698, 0.576223, -0.808485, -0.246539, 0.075979, -0.037694, 0.097082, 0.060192, 0.115013, 0.123081, -0.273286, -0.283236, -0.298678, -0.758861, 0.150947, 0.069838, 0.006216, -0.321373, 0.418712, -0.045691, -0.083270, -0.233517, -0.165143, -0.160174, 0.109656, -0.109990, -0.029874, -0.047473, -0.075904, 0.196036, 0.993123, 0.015392, 0.188303, -0.048643, -0.041329, -0.560991, -0.083567, 0.110707, -0.062992, -0.337910, -0.150351, -0.669330, 0.378897, -0.248164, -0.214993, 0.236158, 0.371156, 0.376581, -0.285876, 0.061946, -0.088393, 0.125163, -0.128759, -0.164381, -0.076057, -0.550314, 0.001738, -0.090426, 0.579758, 0.209060, 1.327162, 0.152266, -0.057413, -0.053823, -0.230555, -0.163864, -0.010773, -0.600877, 0.067615, 0.189858, 0.074560, -0.497465, 0.052012, 0.245240, -0.052911, 0.214105, -0.210591, -0.866432, -0.214897, 0.125711, -0.616680, -0.039550, 0.928535, -0.105974, -0.500419, -0.240232, 0.612433, 0.502567, 0.003602, -0.370450, 0.079597, 0.466534, 0.391764, -0.225579, 0.058452, -0.052266, 0.327981, 0.686852, -0.053318, -0.568878]
-,        [-0.492639, 0.237160, 0.337100, -0.252455, -0.394909, -0.147054, 0.348162, 0.318143, -0.615791, -0.571913, -0.623033, 0.310395, -0.041218, -0.139423, 0.064944, 0.893326, -0.148519, -0.106434, -0.142293, -0.112558, -0.002071, 0.057746, -0.102782, -0.064427, 0.291287, -0.096218, -0.242923, 0.319870, 0.259845, 0.375965, -0.583643, 0.049842, -0.114168, -0.202992, 0.111923, -0.172867, 0.433969, 0.439875, 0.330500, -0.462608, -0.064957, -0.092877, -0.309304, 0.015236, 0.053570, -0.437668, 0.347159, 0.029462, 0.329309, 0.156179, 0.505878, -0.160118, 0.011927, -0.227684, -0.010496, -0.275789, -0.204292, 0.478200, -0.501459, -0.098158, -0.229432, 0.807229, -0.029697, -0.127664, -0.106664, -0.223549, 0.090987, 0.157166, 0.370951, -0.611386, -0.294806, 0.305293, 0.392054, 0.026044, 0.521560, -1.097408, 0.188519, -0.224793, 0.109841, -0.015556, -0.174518, 0.156290, -0.071377, -0.086082, 0.071533, -0.696379, -0.410697, 0.513433, 0.066287, -0.424639, 0.014657, 0.050176, -0.129403, -0.085272, -0.145575, 0.548772, -0.096370, 0.174491, 0.009201, -0.530326, 0.224164, 0.385506, -0.262387, -0.308236, -0.156196, 0.170171, -0.214010, -0.106274, -0.003411, 0.130749, 0.192729, -0.198042, -0.398309, -0.019434, 0.172045, 0.053950, -0.017916, 0.029577, -0.155828, 0.045962, 0.106725, -0.172237, -0.119220, -0.096435, -1.193064, 1.144510, -0.219314, -0.359784]
-,        [0.267247, -0.065896, 0.227796, -0.046299, 0.075446, -0.138804, -0.091036, -0.580976, 0.169862, 0.382383, 0.105803, 0.002974, 0.075160, 0.152992, -0.076839, -0.317824, -0.025027, 0.027529, -0.116322, -0.159652, -0.047489, 0.034166, -0.047239, -0.004242, 0.104623, -0.073385, -0.023411, -0.256184, 0.055440, -0.379602, 0.775076, -0.258923, -0.386505, -0.034905, 0.331755, 0.083891, -0.178541, 0.062453, -0.094319, 0.070850, -0.168922, -0.113803, 0.222663, -0.005100, -0.160735, -0.011754, 0.868985, -0.148175, -0.407000, 0.197298, -0.062329, 0.353669, 0.191143, 0.293047, -0.070164, -0.143430, -0.261883, -0.045751, 0.717603, -0.103591, 0.582773, 0.191425, 0.099399, 0.347047, 0.116628, -0.131799, 0.009932, 0.219881, -0.228395, -0.912751, 0.051130, -0.298668, -0.561299, -0.165106, 0.098660, 0.756517, -0.000277, -0.198120, 0.009335, 0.079467, -0.380577, 0.064078, 0.090476, -0.097028, 0.027335, -0.142077, 0.099484, -0.701379, 0.066888, -0.237564, 0.052530, 0.022769, -0.071660, 0.179703, -0.109506, 0.391680, -0.015410, -0.258414, 0.156911, -0.514323, 0.175939, 1.136591, -0.123924, -0.095193, -0.109628, 0.019630, -0.537035, 0.204667, 0.049501, 0.037044, 0.252037, -0.049969, 0.765431, 0.115218, -0.403059, 0.108581, 0.243877, 0.005688, 0.083184, 0.403810, 0.199695, 0.185969, -0.144361, 0.046825, -0.274651, -0.264843, 0.445144, 0.037015]
-,        [0.430366, -0.029411, -0.970694, -0.344492, 0.140812, -0.100829, 0.300939, 0.358620, -0.146114, 0.174604, 0.215029, -0.021786, 0.151083, 0.085562, 0.629516, -0.195696, -0.003897, 0.153936, -0.076941, 0.113441, -0.509287, 0.368297, 0.179875, 0.036810, 0.494840, -0.129643, 0.356940, -1.211065, 0.352334, 0.317993, -0.252106, 0.020864, -0.693529, -0.051287, -0.028354, -0.285646, 0.257641, -0.121850, 0.186625, -0.101277, -0.128581, 0.057213, 0.002477, 0.001229, 0.191615, -0.011984, 0.362499, 0.003028, 0.297334, 0.148777, -0.025739, 0.287766, -0.082147, 0.013872, 0.032366, 0.231825, 0.058063, 0.395761, 0.706338, 0.071046, 0.367981, -0.197481, -0.081853, -0.078320, -0.007463, 0.153681, -0.017871, -0.035246, -0.189282, 0.079599, -0.259626, 0.150353, -0.085896, 0.037420, -0.268570, 0.419848, 0.350853, -0.176749, 0.275300, -0.100404, 0.133192, 0.378750, 0.118429, 0.203375, 0.035724, -0.142328, 0.260268, -1.148099, 0.205265, -0.334878, -0.504517, 0.023848, 0.297180, 0.044575, 0.298473, 0.305693, 0.164926, -0.113040, 0.479536, 0.245372, 0.083266, -0.054581, -0.097576, 0.051339, 0.071550, -0.104436, -0.047424, 0.268117, 0.266527, 0.045993, 0.674429, 0.077134, -1.022502, 0.182298, -0.433958, -0.083424, -0.297943, -0.017132, 0.043757, 0.184988, -0.318258, 0.413796, 0.047340, 0.148412, 0.205028, 0.348792, 0.076368, -0.130535]
-,        [0.586514, 0.032358, 0.264269, 0.082985, -0.116653, 0.186030, 0.019193, -0.067562, -0.243833, -0.343721, 0.128061, 0.172463, -0.087726, -0.179237, -0.302883, 1.815635, -0.131181, 0.118519, 0.133637, 0.009608, 0.215167, 0.074642, -0.247142, 0.136544, -0.208528, -0.092983, 0.050160, 0.388013, -0.053197, 0.246928, -0.146414, 0.313862, 0.144699, -0.256746, -0.315028, 0.099863, 0.372301, -0.073765, 0.316543, -0.094017, 0.276260, 0.322517, -0.246547, 0.010603, -0.052604, 0.134730, 0.041997, -0.014539, 0.307393, 0.029926, 0.337636, -0.195085, 0.074009, -0.351114, -0.163213, 0.106802, -0.101381, 0.030393, 0.672034, -0.009079, -0.255102, 0.331383, 0.027541, -0.085922, -0.126386, -0.163541, 0.157321, 0.086350, 0.149429, -0.015821, -0.420069, 0.272553, 0.365461, 0.209886, 0.338094, 0.434059, 0.325622, 0.027602, 0.151418, -0.137923, 0.243210, -0.157052, -0.120118, -0.159431, 0.121404, 0.451491, -0.324284, -0.314295, 0.255540, -0.087131, 0.184282, 0.334781, -0.019326, 0.189722, 0.168348, -0.302752, -0.059985, 0.269836, -0.037534, 0.284707, 0.032631, -0.200056, 0.041765, 0.172813, 0.007548, -0.099705, 0.092547, -0.116328, 0.155375, 0.310043, 0.196041, -0.054898, 0.101730, 0.109179, 0.181734, 0.470957, -0.329635, -0.011558, 0.009500, -0.544297, -0.084395, 0.083503, -0.157130, 0.018266, -0.463488, -0.394598, 0.325024, 0.011507]
-,        [0.155547, -0.031211, -0.309268, -0.107577, -0.073934, -0.106908, 1.750003, 0.456347, 0.129517, -0.162006, 0.672834, -0.238321, 0.481440, 0.121331, 0.214389, 0.017651, -0.172223, -0.015685, -0.217345, -0.055132, -0.105424, -0.257350, 0.098267, 0.177732, 0.043209, 0.062928, 0.560866, 0.153725, -0.260529, -0.154512, 0.200000, 0.266196, 0.346935, 0.139488, -0.260067, -0.106274, 1.345743, -0.035827, 0.091923, -0.446719, -0.303821, -0.273006, -0.034236, 0.012250, 0.434968, 0.207609, 0.353829, 0.120312, -0.203028, 0.017808, 0.212853, 0.435882, -0.287962, 0.111905, -0.035389, -0.177414, 0.044726, -0.226629, -0.059292, 0.032232, 0.214501, 0.631978, 0.169189, -0.029686, -0.043109, -0.185269, 0.339532, 0.121168, 0.358381, 0.802009, -0.446211, -0.056492, 0.022400, -0.278635, 0.447437, 0.593939, -0.073278, -0.081785, -0.106811, -0.009340, -0.192002, -0.322913, 0.203976, 0.137175, -0.169731, -0.684961, -0.353162, 1.159622, 0.090475, -0.006341, 0.095564, -0.165544, 0.303524, 0.154178, -0.110968, -0.246574, -0.219478, 0.103108, 0.124201, 0.029133, -0.121306, 0.137836, 0.328919, 0.298983, 0.049049, 0.014133, -0.162734, 0.131965, -0.521864, -0.035751, -0.654834, -0.322780, 0.329503, -0.033521, -0.525453, 0.105437, 0.006339, 0.030812, -0.149874, 0.499000, -0.233326, 0.051202, 0.010687, 0.005310, 0.425537, 0.099763, -0.305852, 0.048718]
-,        [0.364042, -0.151193, -0.100685, -0.054290, 0.118309, -0.229465, -0.676571, 0.323224, -0.211781, 0.033912, -0.135230, -0.175694, 0.023456, -0.055299, -0.729461, -1.432282, 0.096208, 0.078390, -0.464836, -0.041045, -0.039086, 0.054295, -0.012943, 0.088810, 0.380484, -0.364126, -0.442152, -0.603487, 0.289235, -0.044385, -0.344361, -0.108835, -0.196164, -0.504870, 0.182692, 0.140617, 0.437167, -0.207786, 0.376688, -0.019698, -0.218444, -0.288356, 0.290286, 0.095125, -0.185849, 0.104018, 0.241135, -0.086917, -0.005210, 0.274281, -0.014273, -0.025730, 0.070869, -0.254486, 0.049260, 0.250773, -0.039438, 0.391968, -0.109243, -0.125334, 0.034360, -0.199844, 0.348750, -0.335523, 0.007316, -0.105310, 0.014220, -0.032141, 0.691565, -0.264625, 0.346157, -0.017774, 0.233878, -0.249984, -0.450115, 1.181592, -0.068534, 0.112960, 0.178168, 0.087464, 0.042463, -0.124846, 0.043100, -0.198095, -0.321496, -0.069470, 0.688255, 0.672569, -0.569259, -0.184470, 0.191634, 0.310898, -0.622882, 0.074752, 0.224740, 0.383701, -0.055248, 0.191549, -0.737527, 0.307548, -0.104756, 0.688290, -0.480869, 0.000482, 0.003928, 0.015028, 0.188937, 0.112807, -0.001068, -0.207551, -0.683943, 0.216879, 1.279605, -0.142047, 0.240229, 0.077005, 0.250750, 0.083713, 0.196762, -0.305132, -0.288787, -0.011449, 0.165119, 0.280323, -0.171733, -0.110054, 0.040732, -0.196549]
-,        [0.000535, -0.121010, -0.035780, -0.151139, -0.012206, -0.160897, -0.015247, -0.364506, 0.128276, 0.471661, 0.034005, 0.151727, 0.031660, -0.254715, 0.237041, 0.669922, 0.190656, 0.098706, 0.211527, -0.085564, -0.142858, -0.215460, 0.016113, 0.101897, 0.049183, 0.158536, 0.750621, -0.074734, 0.291110, 0.232416, -0.607101, 0.279572, 0.157247, 0.241235, 0.137962, 0.123188, 0.304184, 0.012334, -0.207439, -0.170792, -0.175427, 0.247347, 0.059301, 0.146927, -0.250234, 0.168755, 0.188479, 0.034443, -0.454089, 0.094781, 0.093282, 0.266980, 0.468110, -0.048307, 0.079322, -0.073180, 0.478174, 0.170429, 0.287481, 0.073111, 0.401684, -0.808984, -0.020592, -0.267332, 0.140824, -0.064028, -0.079481, -0.009224, 0.123603, -0.257427, -0.326067, 0.348666, -0.591296, -0.217629, 0.074357, -0.132151, 0.087802, -0.130986, 0.029718, -0.428114, -0.063672, -0.270718, -0.241851, -0.062707, -0.301760, -0.446120, -0.131067, -1.283218, 1.241349, -0.122641, 0.033010, -0.119557, -0.103681, 0.220185, 0.193695, -0.415881, -0.052292, 0.286073, 0.011957, 0.404071, -0.043534, 0.254760, 1.098122, 0.024305, -0.051385, 0.516091, 0.167437, -0.250641, 0.191100, 0.011545, -0.340387, -0.062427, -0.467311, -0.112242, -0.098364, 0.085273, -0.256538, 0.095122, 0.135268, 0.611936, 0.266065, -0.112888, -0.079096, 0.011596, -0.056769, -0.043248, -0.170165, 0.014954]
-,        [0.267059, -0.004054, -0.063195, -0.295109, 0.044737, -0.361188, 0.134882, -0.261484, -0.819447, 0.138620, -0.060964, 0.234009, 0.355936, 0.008478, -0.573514, 0.906172, 0.000576, 0.150421, 0.433950, -0.070043, 0.011437, 0.173174, -0.294955, -0.169757, -0.084831, 0.062381, -0.271428, 0.197475, -1.564961, -0.137501, 0.671955, -0.216404, -0.115444, -0.091301, 0.249377, -0.300696, -0.504548, -0.017221, 0.135403, -0.063967, 0.254942, -0.034148, -0.060249, -0.273060, 0.202144, -0.012886, -0.988678, -0.009650, -0.258110, -0.162355, 0.021520, -0.197977, -0.815320, 0.024015, 0.225966, 0.081709, -0.059633, -0.250466, 0.371671, -0.082786, -0.369226, 0.273308, -0.038836, -0.423173, 0.051428, -0.319713, -0.093989, 0.200382, 0.116961, 0.876680, 0.069955, 0.098157, -0.151504, -0.240862, -0.308131, 1.431504, -0.020489, 0.040201, 0.042070, 0.621501, -0.064169, -0.249545, 0.165968, 0.104908, -0.049470, -0.032261, 0.256008, -0.191521, 0.737458, 0.234940, -0.239935, -0.204335, -0.136255, -0.120669, -0.005137, -0.062676, -0.036943, -0.114740, -0.640827, 0.307151, -0.299778, -1.116454, -0.676512, -0.233827, -0.118420, -0.276039, -0.467975, -0.060454, 0.038203, -0.121248, 0.397283, 0.045811, -0.363258, 0.002184, 0.036225, 0.207248, -0.019433, 0.130723, -0.014364, 0.005786, -0.133857, 0.023534, -0.035341, 0.283533, -0.086255, 0.079978, -0.272890, -0.401857]
-,        [-0.133087, 0.055988, 0.510287, 0.015429, 0.571434, -0.542623, 0.421899, 0.509764, 0.357110, -0.247603, -0.756553, 0.177722, -0.773058, 0.064565, 0.087496, 0.458243, -0.031436, 0.430725, -0.048545, 0.033372, 0.002430, -0.006795, -0.114269, 0.233419, -0.299656, 0.144946, -0.311184, 0.155057, 0.684654, -0.205319, -0.439045, -0.444337, -0.325781, 0.446052, 0.357413, 0.025513, 0.074389, -0.107384, -0.094307, 0.142945, 0.245223, 0.014623, 0.198668, -0.000208, 0.166306, 0.028470, 0.562094, -0.022165, 0.070643, 0.060766, -0.202996, 0.155812, 0.620505, 0.487880, 0.097792, -0.186276, -0.057581, 0.570460, 0.129208, 0.055310, 0.475139, 0.616369, -0.134597, 0.097947, 0.239522, 0.023705, -0.044328, -0.142360, 0.239175, 0.143092, 0.905645, -0.023689, 0.043271, -0.218357, 0.003515, -1.350817, 0.234474, -0.188820, -0.415218, -0.039109, 0.113399, 0.415709, -0.164240, 0.238350, 0.119474, 0.508121, -0.235354, -0.028060, -0.316729, 0.059597, -0.220665, 0.086624, 0.753708, -0.105908, -0.124842, -0.004651, -0.234389, -0.198168, -0.574365, 0.153565, 0.014591, -0.512852, 0.383978, -0.100757, -0.045339, -0.049888, 0.391519, 0.176861, -0.739043, 0.159010, -0.043046, -0.358880, -0.119299, 0.112983, -0.276708, -0.270322, 0.195822, 0.387350, -0.031612, -0.214894, 0.002470, -0.145947, 0.081195, -0.264765, 0.384116, 0.524647, 0.090825, 0.231416]
-,        [0.078968, 0.020814, -0.153764, -0.490171, -0.225466, -0.079536, -0.500877, -0.217689, -0.204673, 0.079844, 0.152170, -0.041402, -0.057618, 0.438330, -0.994124, -1.131386, -0.134394, 0.033841, 0.153311, 0.019311, -0.013439, 0.407786, 0.098335, 0.094604, 0.308150, 0.108032, 0.006566, -0.122134, 0.030806, -0.196008, -0.133987, 0.795784, -0.170453, 0.175012, 0.290050, -0.062653, -0.623919, -0.310074, 0.007829, 0.456002, 0.531452, -0.245136, -0.215494, 0.244722, -0.063139, -0.024585, 0.362433, 0.166488, 0.057428, -0.364096, 0.034500, -0.048562, -0.073588, 0.246213, -0.219478, 0.352891, -0.302658, -0.054330, -0.223257, 0.049534, 0.032647, -0.876259, 0.163346, -0.622353, 0.155764, -0.108475, 0.067042, -0.208195, -0.009172, 0.990235, 0.211547, -0.000005, -0.068162, -0.166037, -0.211315, 0.482805, 0.084706, -0.028459, -0.078019, 0.399165, -0.131921, 0.313325, 0.120308, -0.256085, -0.282485, 0.409105, 0.929410, 0.546965, -0.561235, 0.065305, 0.246351, -0.474322, -0.113010, 0.110724, 0.105735, 0.119996, 0.105938, 0.378457, 0.997509, -0.459343, -0.382076, 0.820457, 0.122148, 0.104496, 0.001503, -0.040603, -0.707896, 0.035747, -0.118845, 0.014878, 0.240435, 0.336977, 0.905797, 0.194752, -0.154704, 0.024848, 0.363029, 0.149333, 0.321151, -0.159514, -0.151997, -0.058035, 0.191041, -0.171949, -0.317419, 0.028769, 0.058892, 0.022705]
-,        [-0.645832, 0.034113, 0.118625, 0.256865, 0.064991, -0.048336, -0.379826, -0.730929, 0.021083, 0.265464, -0.255681, -0.121917, -0.076907, 0.049671, 0.047128, -0.513940, -0.271287, -0.236079, -0.339637, 0.246693, -0.039330, 0.029261, -0.028721, -0.215462, 0.159422, -0.041144, 0.134437, 0.064648, -0.027417, 0.683075, 0.067459, -0.174811, -0.249691, -0.212957, -0.223081, -0.028581, -0.523806, -0.027595, 0.006835, 0.464101, -0.047333, 0.321109, -0.029306, -0.533737, -0.258289, 0.185867, -0.434704, -0.048149, -0.088928, -0.177922, 0.178967, -0.245178, 0.113961, -0.213033, -0.221413, 0.049973, 0.154589, 0.172290, -0.265279, 0.110872, 0.098698, 1.016583, -0.181084, 0.298533, -0.068506, -0.080775, -0.005502, 0.158266, -0.462062, -0.658761, 1.023786, 0.138129, -0.097444, 0.017014, 0.221834, 1.328558, -0.224107, 0.214869, 0.185696, 0.070484, 0.220094, 0.242344, 0.353892, 0.314595, 0.350983, -0.252809, 0.001860, -0.702279, -0.474474, 0.048226, 0.305356, 0.050039, 0.002781, -0.443560, 0.316526, 0.320771, -0.142502, -0.277783, 0.441346, 0.240446, 0.093889, 0.214228, -0.428248, 0.183164, -0.060203, 0.183439, 0.268669, 0.068377, -0.036093, -0.081142, 0.815707, -0.188871, -0.159276, 0.081841, 0.612966, 0.035632, -0.145856, 0.280779, -0.055503, 0.607907, -0.096316, -0.112141, 0.253064, -0.032435, 0.127932, 0.315587, -0.177071, 0.104857]
-,        [0.239959, 0.088250, 0.463835, -0.092056, 0.146520, -0.046842, 0.067209, 0.008655, 0.186483, 0.134621, 0.115857, 0.307011, 0.373083, 0.250432, 0.042397, -0.640499, 0.204951, 0.074084, -0.239480, -0.070190, -0.155085, -0.320982, 0.166097, -0.078115, 0.237826, 0.165270, -0.624318, -0.105921, -0.425050, -0.321689, -0.809713, 0.449926, 0.113577, -0.009454, -0.000718, 0.027451, -0.574147, 0.050111, -0.033374, 0.565797, -0.126506, -0.449805, 0.036101, 0.054140, -0.148017, -0.521647, 0.119854, 0.008870, -0.507607, -0.311483, 0.302339, 0.041211, -0.078001, 0.011522, 0.226746, -0.022791, -0.330734, -0.036413, 0.294329, -0.208774, 0.268045, -0.754494, -0.323047, 0.293598, -0.030062, 0.097819, -0.042451, 0.015141, 0.078074, -0.453502, 0.262777, -0.211025, -0.303420, 0.260594, -0.293386, 0.845976, -0.109190, -0.045493, 0.038406, -0.112970, 0.094255, -0.080917, 0.273077, 0.045715, 0.124306, 0.288394, -0.857947, -0.574448, 0.921507, 0.071786, -0.299433, -0.093504, -0.555573, 0.137364, -0.152411, 0.067211, -0.135095, 0.016644, -0.198421, 0.141423, -0.137053, -0.925975, -0.164880, 0.062118, 0.131487, -0.247538, -0.160582, 0.197030, 0.338538, -0.070110, -0.033947, -0.128814, 0.264733, -0.056057, 0.507252, -0.194489, 0.096806, -0.157137, -0.034626, 0.399568, -0.185559, 0.074553, 0.113281, 0.002557, -0.746979, -0.816226, 0.306336, -0.337253]
-,        [0.150984, 0.002247, 0.256816, -0.121493, 0.248475, 0.012233, 0.876566, 0.453777, 0.292204, 0.373620, 0.027239, -0.124151, 0.222899, 0.030718, 0.045166, -0.448819, 0.379900, 0.197737, 0.020326, 0.306648, 0.005419, 0.160115, 0.026475, -0.242147, 0.169075, -0.029307, -0.347282, -0.075986, -0.065622, -0.826014, 0.668737, 0.097138, -0.465760, -0.100866, 0.833623, -0.264126, -0.346720, -0.189767, 0.149322, 0.178773, -0.161747, -0.526169, 0.194450, 0.007829, 0.045110, -0.129032, 0.157490, 0.022348, 0.214802, -0.067588, 0.350858, 0.401256, 0.228043, -0.236279, 0.101012, -0.058415, -0.341240, -0.263492, -0.495005, -0.093456, -0.079360, -0.038851, 0.117808, 0.223837, -0.150162, 0.165970, -0.018419, 0.197372, 0.048031, -0.031320, 0.100936, 0.065639, 0.217856, -0.066260, 0.333414, -1.395062, 0.023748, 0.135481, -0.382454, 0.079521, -0.042045, 0.215919, 0.260926, 0.150563, 0.170417, -0.236567, -0.510739, 0.850094, -0.135536, -0.023578, 0.072947, -0.169263, -0.621912, 0.226524, -0.172558, -0.163938, 0.071416, -0.164076, 0.198957, -0.532774, 0.355095, -0.038166, -0.339429, -0.069611, -0.134647, -0.123590, -0.227955, 0.022226, 0.414639, 0.183336, 0.237831, 0.229316, -0.172904, 0.153208, 0.633460, 0.047445, 0.434824, 0.593731, 0.032367, 0.172798, 0.068343, -0.043255, -0.013841, -0.087420, -0.818994, -0.821711, 0.339129, -0.055400]
-,        [-0.689766, -0.079069, 0.816883, 0.202423, -0.015719, -0.162830, -0.744725, -0.154817, -0.152477, -0.073406, 0.289579, -0.032316, 0.000835, 0.115697, 0.046355, -0.780878, 0.256624, -0.028915, 0.576622, -0.000462, -0.113414, -0.323934, -0.050016, 0.071471, -0.243092, -0.137707, -0.264316, -0.034744, -0.042287, -0.232310, 0.557337, -0.085080, -0.379720, -0.188452, -0.366778, 0.351658, 0.096625, 0.101373, 0.137451, 0.340929, -0.192882, 0.730520, -0.290612, 0.068265, 0.122780, -0.079967, 0.078933, -0.024873, -0.655521, -0.503987, 0.044013, 0.276260, -0.047872, 0.075136, 0.003223, 0.111840, -0.505412, -0.145643, 0.174068, 0.064350, -1.173593, 0.164651, 0.032268, 0.445493, -0.090944, 0.075063, -0.121217, -0.130808, -0.165111, 0.123859, -0.038999, -0.096028, 0.394376, 0.209189, -0.172788, 0.457566, 0.011304, -0.140797, 0.070660, -0.195274, 0.034219, 0.209476, -0.127275, 0.054578, 0.123321, 0.191715, 0.250392, 0.170453, -1.047069, 0.069651, 0.147999, 0.270105, -0.397604, 0.396387, -0.087531, -0.549267, 0.033284, 0.351870, -0.539842, 0.195465, -0.182255, 1.518502, -0.190754, 0.029047, 0.036450, 0.287747, 0.764141, -0.206455, -0.553972, -0.005337, -0.795227, -0.121560, 0.139933, 0.089721, 0.258445, -0.547401, -0.073850, -0.263033, 0.194580, 0.471465, -0.153179, 0.001154, -0.084802, -0.134518, 0.324118, -0.139551, 0.001133, 0.046984]
-,        [0.175397, -0.147032, 0.238539, 0.090349, -0.337740, 0.189533, 0.637332, 0.040507, -0.274767, 0.199843, 0.312665, 0.162238, 0.575363, 0.164750, 0.099094, 0.067912, -0.172253, -0.216869, 0.066420, -0.044037, -0.128799, 0.073716, -0.122027, 0.176536, -0.488800, -0.287011, 0.179939, 0.115674, -0.143184, 0.375017, 0.564391, 0.103134, 0.371470, 0.048084, -0.303810, -0.094385, 0.388804, 0.206727, 0.410797, -0.236388, 0.215975, 0.579720, -0.103450, 0.034077, 0.204642, -0.014995, -0.481027, -0.080709, 0.061857, 0.113669, -0.010168, -0.112461, -0.316001, 0.434871, -0.106042, 0.142320, -0.108723, -0.189284, -0.180966, -0.100878, -0.265263, 0.321562, 0.054277, 0.105492, -0.123504, 0.245439, 0.043712, 0.276045, 0.828300, -0.236676, 0.012683, 0.178213, -0.021355, -0.230072, -0.414823, -0.628735, 0.248310, 0.154103, 0.291160, 0.287333, -0.015012, 0.016274, -0.053212, 0.293053, 0.017256, 0.229147, 0.990582, -0.472954, -0.311451, 0.239765, 0.323687, -0.204035, 0.659225, 0.003534, -0.318088, -0.009535, 0.084349, 0.069328, -0.063831, 0.067852, -0.077169, -0.697300, 0.140865, 0.160394, -0.349815, 0.426399, 0.515018, 0.056288, -0.330453, 0.154847, 0.304802, -0.269855, -0.665318, -0.099268, -0.349801, -0.119797, -0.266164, -0.164619, -0.007514, -0.405038, -0.170151, -0.119352, -0.055475, 0.012963, -1.020850, -0.378783, 0.163580, 0.019164]
-,        [0.513681, -0.072390, -0.184505, 0.267485, 0.079261, 0.221067, -1.248236, -0.047636, -0.266938, -0.134495, -0.671320, -0.191780, -0.056571, 0.093129, 1.001515, 0.147439, -0.217894, -0.117800, 0.403361, 0.068515, 0.065834, -0.068287, -0.270831, 0.081156, 0.016453, -0.053075, 0.513286, -0.290755, -0.499994, 0.008737, -0.396575, 0.247814, 0.096484, -0.061875, -0.141083, 0.084782, -0.185275, -0.033369, -0.649615, 0.099870, 0.071671, -0.009800, 0.130888, 0.296624, 0.089033, -0.124228, -0.019602, 0.013738, -0.130186, -0.084967, -0.159044, 0.593086, -0.216242, 0.044486, -0.085401, 0.241355, 0.157477, -0.611583, 0.855957, 0.108447, 0.425692, -0.439302, -0.174321, 0.153888, -0.028053, 0.017641, 0.235156, -0.048190, 0.202714, -0.601363, 0.179136, 0.239384, 0.450643, 0.216942, -0.086684, 0.240823, 0.527362, -0.153092, 0.024156, -0.093062, 0.144235, -0.088643, -0.139099, 0.475047, -0.679325, -0.337399, 0.058032, -0.245937, 0.624934, 0.427503, -0.254022, 0.099181, 0.008214, 0.148310, 0.007949, -0.118906, -0.077914, 0.072737, -0.070373, -0.199781, 0.491570, -1.624954, -0.146175, -0.164302, 0.060716, -0.096201, -0.111259, 0.194821, 0.152138, 0.001455, 1.052010, 0.162943, -0.936609, -0.023509, 0.248461, 0.390693, -0.064209, -0.147684, 0.111585, 0.139014, -0.110474, -0.153746, 0.303546, -0.061702, -0.516253, 0.797063, -0.051110, -0.125665]
-,        [-0.332540, -0.045945, -0.111574, -0.169095, 0.075279, 0.370336, 0.039508, -0.380325, -0.559343, 0.194336, 0.064339, 0.001469, -0.219170, -0.337830, 0.193571, -1.033151, -0.008870, -0.260587, -0.396157, -0.275728, -0.030593, 0.071210, 0.008523, -0.060011, 0.320638, -0.288921, 0.433896, -0.335545, 0.608787, 0.006560, 0.225952, 0.095232, -0.214502, 0.148147, -0.334549, -0.025610, -0.415229, -0.121154, -0.219538, 0.155384, -0.190317, -0.150639, -0.046868, 0.062772, -0.365827, -0.428054, -0.224410, -0.025399, 0.140641, 0.601448, -0.416694, -0.270798, 0.314362, -0.192271, -0.019954, -0.244254, -0.041002, 0.011087, -0.100688, 0.038672, -0.177531, -0.264688, 0.093200, 0.357659, 0.083317, -0.025007, -0.101918, -0.108635, -0.322839, 0.600619, -0.033209, -0.146179, 0.180454, 0.119220, 0.128308, -0.927776, -0.297160, -0.100323, -0.185992, -0.160427, -0.165113, 0.380488, -0.039688, 0.391034, 0.599071, 0.148678, 0.893389, 0.201592, -0.476685, -0.230547, 0.145968, 0.057878, 0.118490, -0.017992, 0.033255, -0.246883, -0.058370, -0.304054, 0.414423, -0.415479, -0.093509, -0.328114, -0.460876, -0.093961, 0.085750, 0.142102, -0.332938, -0.266464, -0.114542, 0.045559, 0.309969, -0.332884, 1.548729, 0.039986, -1.088366, 0.121684, 0.199470, 0.880508, -0.044658, 0.102576, 0.038101, 0.094778, -0.004382, -0.107639, 0.209846, -0.704912, 0.305122, 0.221318]
-,        [-0.120145, -0.002666, 0.214073, -0.203537, -0.152125, -0.101471, -1.493974, -0.256523, -0.006576, 0.097863, 0.408497, -0.115892, -0.025330, -0.352564, 0.302708, -0.173161, 0.404324, 0.236658, 0.096267, 0.113284, -0.171820, 0.235310, 0.029717, -0.054382, 0.130379, -0.021181, -0.507454, 0.015156, 0.248559, 0.078472, -0.153525, 0.099196, 0.406724, 0.194470, -0.421891, 0.089263, 0.293578, 0.015616, 0.498865, -0.224307, -0.410967, 0.082690, -0.182301, 0.068192, 0.180866, 0.253442, 0.154223, -0.051654, 0.671231, 0.535983, 0.053225, 0.074712, -0.114936, -0.147306, 0.123239, -0.208385, 0.022044, 0.223600, 0.024839, 0.096392, -0.001141, -0.226726, 0.201181, -0.047536, -0.055270, -0.128393, -0.085603, -0.097061, 0.403087, 0.683339, 0.900363, 0.259554, -0.086303, 0.369914, 0.494767, -1.037935, 0.357000, 0.017460, -0.129657, 0.401411, -0.031837, 0.522287, 0.015781, -0.071437, 0.085359, -0.252995, 0.474628, 0.131782, -1.037642, -0.119092, -0.219536, 0.128549, 0.129649, -0.102087, -0.084548, 0.106555, -0.084235, -0.217487, -0.149077, -0.327555, 0.440544, -0.053108, -0.035001, 0.250996, -0.168991, 0.142160, -0.146663, -0.018049, 0.403989, 0.149607, -0.537843, 0.000077, 0.986533, -0.152865, 0.725235, -0.424301, 0.087729, -0.084304, -0.022991, 0.164452, 0.183198, -0.017203, 0.086635, -0.146875, -0.083812, -0.406875, 0.023538, -0.300319]
-,        [0.784176, -0.012726, -0.044023, -0.209158, 0.339354, 0.249051, 0.125248, 0.608158, -0.182778, 0.087504, 0.143960, 0.080436, 0.148047, 0.030231, 0.297400, -0.413529, -0.303451, 0.220220, 0.362203, 0.268281, -0.088608, 0.331196, -0.068620, 0.050933, 0.246036, 0.202242, 0.443328, 0.088466, -0.415885, 0.872846, -0.834871, 0.268760, 0.078305, -0.204000, 0.316625, -0.058950, 0.586034, -0.414377, -0.114070, -0.247150, 0.356845, -0.385021, -0.046552, -0.071320, 0.185583, -0.014783, -0.011987, -0.089482, 0.291532, -0.458667, 0.095733, -0.406753, 0.253703, -0.466925, 0.058780, -0.181302, -0.156709, -0.034075, 0.456673, 0.230466, -0.290150, 0.411395, 0.197515, -0.192674, -0.037945, 0.112889, 0.016961, -0.111281, -0.410663, 0.620803, -0.604039, -0.084736, -0.042257, -0.096371, -0.038506, 0.170227, -0.114878, -0.059979, 0.039822, -0.334511, 0.080457, 0.122140, -0.195481, -0.425630, 0.318164, -0.249957, 0.020863, -0.418611, 0.561271, -0.202106, 0.227925, 0.142579, -0.351849, 0.214828, 0.175515, -0.010753, -0.188085, -0.031078, -0.184661, 0.241220, 0.059865, 0.138561, -0.377538, -0.238869, -0.023617, 0.175486, -0.500070, 0.181894, 0.071708, -0.113402, -0.306988, -0.090792, -0.504698, -0.191521, -0.113302, -0.012648, -0.005567, -0.222149, -0.132247, 0.106948, 0.005486, 0.098947, -0.056062, -0.029444, -0.449737, 0.651060, 0.181542, -0.013850]
-,        [-0.198414, -0.026103, -0.406552, 0.129303, -0.029224, 0.428567, 0.716078, -0.290661, -0.755323, 0.134361, -0.325280, 0.013011, 0.283151, -0.021064, 0.142192, -0.190333, 0.288792, 0.107608, -0.104188, 0.126051, 0.076532, -0.241051, -0.004515, 0.098222, 0.382500, 0.127185, 0.098970, -0.094536, -0.769476, 0.215670, 0.076315, -0.136864, 0.349178, 0.158355, -0.388401, -0.086370, -0.138616, 0.107277, 0.589552, 0.305694, -0.231687, -0.139319, -0.012600, -0.282493, 0.278993, -0.019079, 0.215582, -0.364015, 0.261094, -0.660072, 0.224724, -0.327115, -0.527090, 0.216739, 0.052257, -0.194306, 0.545246, 0.007399, 0.285942, -0.000428, -0.449992, -0.199042, 0.051607, -0.437313, 0.068087, -0.063550, 0.128613, 0.154959, -0.053907, 0.312194, -0.160246, -0.385179, -0.069888, -0.097614, 0.262488, 0.313006, 0.108765, 0.338638, 0.424302, 0.001402, -0.246876, 0.058399, -0.081083, 0.420425, 0.082905, -0.314675, -0.303135, -1.360646, 0.407979, 0.282460, -0.008033, -0.078675, -0.258189, 0.039853, 0.150594, 0.359739, -0.065757, -0.383276, -0.215450, -0.533833, -0.294767, 0.313109, -1.213028, 0.015295, 0.034786, 0.329947, -0.565918, -0.117662, 0.269638, 0.512301, 0.350423, 0.094585, -0.791779, 0.083920, -0.406991, -0.167248, -0.200238, 0.229787, 0.028893, 0.228721, -0.115816, -0.203889, -0.148166, -0.118366, 0.192689, 0.144962, 0.302247, 0.224716]
-,        [-0.261705, 0.066760, 0.232024, 0.045887, 0.337628, 0.159913, 0.450219, -0.104661, -0.020517, 0.317830, 0.014168, -0.145112, 0.166779, -0.275694, 0.404186, 0.615129, -0.109888, -0.000764, 0.646375, -0.197018, 0.018414, -0.069795, 0.027912, 0.257882, -0.070516, -0.103005, -0.177184, 0.315026, 0.067029, -0.603533, -0.019805, -0.177709, -0.551580, 0.473787, -0.475822, -0.294128, 0.138714, -0.247173, 0.501696, 0.309832, -0.415247, 0.615637, -0.098289, -0.030089, 0.106274, -0.148894, 0.092193, 0.008869, -0.182978, -0.571694, 0.516527, 0.195607, -0.006486, -0.203301, -0.047820, 0.003105, 0.052423, 0.161428, -0.106868, -0.025250, -0.445478, 0.028905, 0.094934, -0.066620, 0.183979, 0.016160, -0.010214, -0.022517, 0.661982, -0.563835, -0.334914, 0.060073, -0.476725, 0.143680, 0.572437, -0.139400, 0.096284, -0.527189, 0.503367, 0.093718, -0.015505, -0.134591, 0.007638, -0.166006, -0.047034, 0.632929, 0.637825, 1.979965, -0.443544, -0.072629, -0.247905, -0.253906, -0.098497, 0.059576, 0.078422, 0.421998, 0.021313, 0.281061, 0.170648, -0.343371, 0.993476, 1.114293, 0.361818, 0.012003, 0.179719, 0.537506, 0.603310, -0.074875, 0.265460, 0.117395, 0.048224, 0.202896, 0.967553, -0.057566, 0.687959, 0.150054, 0.691304, 0.141109, -0.123679, -0.178432, 0.049966, 0.176433, 0.040509, -0.049564, -0.096617, 0.805727, 0.022476, 0.169453]
-,        [-0.792983, 0.122891, -0.162382, 0.224213, -0.165091, -0.278692, -0.307804, -0.642667, 0.585878, -0.276818, -0.314836, 0.058131, -0.387623, -0.032751, -0.182042, -0.742530, -0.152845, 0.025779, 0.102749, 0.010879, -0.137906, 0.313907, 0.114336, 0.150668, -0.567432, -0.160307, 0.086744, -0.143813, -0.268140, 1.067453, -0.214496, 0.274819, 0.149155, -0.095004, 0.000104, -0.215561, 0.354569, 0.042822, -0.092058, -0.313457, 0.060220, -0.949290, -0.178376, -0.122290, -0.120768, -0.165026, -1.634308, -0.155797, -0.082496, 0.727288, 0.326575, -0.181754, 0.084878, -0.216447, -0.067320, 0.054755, 0.279024, 0.152457, -0.120120, 0.105699, 0.528615, 0.273846, 0.290979, -0.624018, -0.172540, -0.145312, 0.095935, 0.154530, 0.110537, -1.899442, -0.228085, -0.035653, 0.385168, -0.120887, -0.032001, 0.437194, -0.312344, 0.175793, -0.083575, 0.168645, 0.457654, -0.403307, 0.323735, -0.479402, -0.659065, -0.088683, 0.105372, 0.238295, -1.635840, 0.290312, -0.093096, 0.210327, -0.225520, -0.005120, -0.081635, -0.145407, -0.034064, 0.076237, -0.912011, 0.226787, -0.317299, -0.931419, 0.029306, -0.142699, -0.129032, -0.205122, -0.285393, -0.070657, -0.436419, 0.241860, -0.001330, 0.105588, -0.277083, -0.109900, 1.026496, -0.053754, -0.823837, -0.127078, -0.090173, -0.218755, -0.327083, -0.182625, -0.059921, -0.107926, 0.401146, -0.198375, -0.402725, -0.026786]
-,        [-0.774788, -0.137259, 0.162932, -0.156303, -0.030719, -0.162363, 0.290099, -0.210325, -0.165330, -0.099069, 0.106831, 0.059358, -0.499518, -0.149905, -0.259303, 0.087077, -0.138297, -0.059847, -0.173472, -0.174219, -0.133378, 0.126980, 0.075111, 0.056444, 0.020919, -0.113292, -0.017064, -0.498464, 0.403057, 1.181871, -0.796539, -0.090532, -0.243482, -0.101614, 0.110159, 0.107308, 0.576734, 0.063357, -0.299688, 0.075272, -0.069617, -0.407786, 0.364017, -0.124038, -0.257507, -0.152896, -0.935739, 0.084858, 0.547316, 0.006019, 0.206938, -0.115290, 0.077877, -0.166808, -0.166628, -0.098623, 0.051471, -0.158599, 0.355738, 0.132924, -0.034756, 0.501694, 0.046819, 0.030686, 0.023655, 0.161619, 0.179850, -0.116196, -0.452179, -0.610009, 0.029602, 0.228770, -0.065830, 0.221262, -0.455966, 0.002103, 0.358786, 0.646935, 0.325503, 0.088445, 0.107462, -0.924320, 0.002026, -0.208366, 0.118429, -0.191485, 0.224866, -1.329518, -1.083067, 0.431198, 0.027930, 0.039850, -0.286668, -0.215280, -0.062997, -0.191712, 0.030256, 0.594801, 0.030330, -0.168137, -0.173212, -0.773854, 0.556243, -0.380656, -0.027986, 0.176770, -0.969247, 0.034528, -0.792717, 0.071284, 0.026781, -0.020276, -1.389448, 0.250089, 0.075841, -0.035416, -0.135844, -0.070952, 0.121491, -0.302151, 0.043738, 0.059590, 0.088163, 0.085904, 0.200927, -0.072282, -0.027230, -0.110400]
-,        [-0.908423, 0.056800, 0.972074, 0.101662, -0.905653, 0.165300, -0.301095, -0.002335, 0.512300, -0.236975, 0.113765, -0.248331, -0.497367, 0.471274, 0.022963, 0.215662, -0.547938, 0.383933, 0.042524, 0.068447, -0.136138, -0.112532, 0.133087, -0.297731, -0.298315, -0.027310, 0.020616, -0.723225, -0.309779, 1.432055, -0.815708, -0.271201, 0.187253, -0.195087, -0.251510, 0.027865, 0.150653, -0.081880, 0.421061, -0.296905, -0.224348, -0.728168, 0.231309, -0.088103, 0.126146, -0.059264, -0.883206, 0.044789, -0.045776, 0.263766, -0.603512, 0.014055, -0.044022, -0.040717, -0.046841, 0.061508, 0.336709, -0.080139, 0.576306, -0.007214, 0.113963, -0.715215, 0.219619, 0.813180, 0.095705, -0.023590, -0.032712, -0.137287, -0.149926, -1.358505, 0.403357, -0.128828, -0.200070, 0.006633, -0.141730, 0.661538, -0.135118, -0.171469, 0.044877, -0.010853, 0.078132, -0.909123, -0.125541, -0.226862, -0.582444, 0.063872, -0.137624, -0.786372, -0.003479, -0.029426, -0.186890, 0.165884, -0.087390, -0.351671, 0.009341, -0.155175, -0.111955, 0.078997, -1.104679, -0.374923, 0.062371, -1.471680, -0.705047, 0.024142, -0.145407, -0.018814, -0.325081, 0.167710, -0.196688, -0.014826, 0.298637, -0.623047, -1.084236, -0.118762, 0.788602, -0.124828, -0.322520, -0.358816, -0.174781, -0.342834, -0.290458, 0.198747, -0.045086, -0.204719, 1.185210, 0.267514, -0.185279, -0.164178]
-,        [-0.454210, 0.050751, -0.401046, -0.129315, -0.845254, 0.276182, 2.130353, 1.209837, 1.045959, -0.073443, 0.117532, 0.169762, -0.484775, 0.261652, 0.029214, -0.108771, -0.545567, 0.120784, 0.020437, -0.075824, 0.024817, -0.153506, -0.165282, 0.073379, -0.104618, -0.494282, -0.291810, -0.381955, -0.502584, 0.255680, -0.797523, -0.423258, 0.141719, 0.341093, -0.134877, -0.138879, 0.265988, -0.223433, -0.161161, -0.030345, -0.148282, -0.467813, 0.054018, 0.014864, 0.022043, 0.352313, -0.665591, -0.060871, 0.407365, -0.286955, -0.197362, -0.011022, -0.089043, 0.021748, -0.049162, 0.003718, 0.197092, 0.070378, -0.505262, 0.174031, 0.158545, 0.317676, -0.148132, 0.235979, -0.078121, -0.162154, -0.116565, 0.111584, -0.238018, -1.813879, -0.243006, 0.032309, 0.045031, -0.297075, -0.135699, -0.173434, -0.011430, 0.502336, 0.137336, 0.000984, 0.064710, -0.709490, -0.015139, -0.616104, -0.290112, -0.182606, 0.066025, 0.776177, -0.856791, -0.161461, -0.086715, 0.198051, -1.063779, -0.011742, 0.116817, -0.068800, 0.065787, -0.143807, 0.446197, 0.303090, 0.085546, -1.780450, -0.014052, 0.021366, 0.005965, 0.459562, 0.045322, -0.008560, -0.103460, 0.110769, -0.141215, -0.058899, -0.439323, 0.027181, 0.063334, 0.162396, -0.471473, 0.162892, 0.044697, -0.168790, -0.302609, -0.014661, -0.169297, 0.159951, 0.749775, 0.090182, -0.467287, -0.142288]
-,        [-0.513942, 0.103035, -0.278817, -0.321913, -0.104267, -0.126639, -0.054014, 0.289680, -0.344029, 0.485321, -0.453449, 0.141225, -0.070341, -0.163053, -0.111660, -0.966867, -0.035348, -0.417324, -0.078641, 0.191744, 0.094381, 0.052545, -0.107097, 0.147498, 0.114692, 0.493949, 0.413138, -0.328221, 0.783841, 0.550099, -0.651512, -0.101587, -0.117995, 0.266466, 0.150847, -0.067341, 0.318360, -0.013041, -0.587368, 0.065387, 0.139112, -0.576873, -0.043178, -0.133809, -0.271687, 0.088230, -0.217139, -0.095916, -0.428751, 0.253268, 0.038380, 0.361944, -0.031527, 0.029250, -0.062669, 0.123018, 0.174998, 0.050868, -0.104331, -0.021637, -0.520400, 0.570300, -0.246099, 0.293637, 0.096896, -0.066370, 0.021372, -0.580425, 0.702661, -0.872041, 0.035189, 0.262988, 0.459885, 0.124356, -0.469101, -0.085216, 0.055499, 0.156648, 0.137886, -0.422048, 0.043592, 0.707326, -0.250007, -0.409511, 0.282448, -0.475000, -0.006360, 0.560007, 0.034244, 0.255256, -0.224154, -0.265370, -0.168390, -0.068029, -0.154473, -0.041806, 0.194785, 0.554196, 0.234080, -0.694925, 0.226164, 0.305296, 0.628870, 0.074077, 0.127007, -0.017771, 0.462561, 0.180425, -0.324893, 0.244173, 0.723023, 0.317902, 0.687268, -0.072299, -0.968474, -0.198379, -0.084981, 0.087718, -0.092472, -0.087295, 0.158490, 0.062380, -0.010469, -0.066242, -0.700328, -0.872025, 0.326321, -0.255523]
-,        [-0.608707, 0.050765, -0.357159, -0.266359, 0.174597, 0.493909, 0.320642, -0.029294, 0.367385, -0.084252, 0.333131, -0.152386, -0.341823, 0.552941, 0.042373, 0.332576, -0.212161, 0.095240, 0.446055, 0.001838, -0.074437, 0.211399, -0.061856, -0.087100, -0.222978, -0.155743, -0.192325, 0.450286, 0.272340, 0.448690, 0.664663, -0.155909, -0.427199, 0.216862, 0.124601, 0.074972, 0.025659, -0.202001, -0.639686, 0.254715, 0.094596, 0.019895, 0.117549, 0.174232, -0.263118, -0.439794, -0.079978, 0.201917, 0.274593, -0.305970, -0.082795, -0.221902, 0.270942, -0.119552, 0.121023, 0.003033, -0.057852, -0.159154, -1.100745, -0.155052, 0.017719, 0.110275, 0.346671, 0.382689, 0.231166, -0.006521, -0.089460, -0.613950, -0.130411, 0.149116, 0.305970, -0.454090, 0.184706, 0.155502, 0.067994, 0.239178, 0.309579, 0.065405, -0.444951, 0.375753, -0.064580, -0.231917, -0.116616, 0.016841, -0.137819, -0.375323, 0.396432, -0.105569, -0.242586, 0.153583, 0.434510, -0.286377, -0.410739, 0.049678, -0.123316, 0.034279, -0.086657, -0.069968, 0.350296, -0.053923, 0.369065, 0.591720, -0.019387, -0.201897, -0.097551, 0.012648, 0.104121, 0.036402, -0.173492, 0.084851, 0.618202, -0.069432, 0.793073, -0.226738, -0.090649, -0.122695, 0.296522, 0.253813, -0.162380, -0.197385, -0.056323, -0.092545, -0.061779, 0.128962, -0.164774, -0.861706, 0.073619, 0.217173]
-,        [-0.033165, 0.027514, 0.098019, 0.039396, 0.094044, 0.043604, -0.330600, -0.007297, -0.082847, -0.153545, -0.703315, 0.010938, -0.278862, -0.130308, 0.023813, -0.451404, -0.388065, -0.128161, -0.459321, 0.254546, 0.148800, 0.160450, 0.064295, 0.204069, -0.307193, -0.065091, 0.497654, -0.279294, -0.607814, -0.117220, 1.350954, 0.122228, 0.086737, -0.019906, 0.274642, 0.131507, 0.794753, 0.055780, -0.274532, -0.610550, -0.030680, 0.250843, 0.124948, -0.085683, -0.323694, -0.442161, -0.387328, -0.093439, -0.113981, -0.946794, -0.287453, 0.316586, -0.432935, -0.001270, 0.199885, 0.010618, -0.265120, -0.252276, 0.031380, 0.207070, -0.030126, 0.615407, 0.036107, -0.010479, -0.103293, 0.076931, -0.031273, 0.041326, 0.076476, -0.111379, -0.003612, -0.222552, -0.397748, 0.018123, 0.342974, 0.724012, 0.372158, -0.173324, -0.331169, -0.132253, 0.114147, -0.513938, 0.057158, -0.051441, 0.563003, -0.448972, -0.843311, -0.983409, 0.782240, -0.098308, -0.188478, -0.250841, 0.244945, -0.051302, -0.093915, 0.073573, 0.241063, 0.194300, 0.258795, -0.722363, -0.052840, -0.318828, -0.186148, 0.117134, 0.113722, 0.073796, 0.607549, -0.088544, 0.336405, 0.227216, 0.373892, 0.065309, 0.770562, -0.054318, -0.450837, 0.134589, 0.015119, -0.056765, -0.029448, -0.173786, 0.106419, -0.081709, 0.010173, 0.330574, -0.997026, -0.041137, 0.075191, -0.158462]
-,        [0.570594, -0.264181, 0.849960, -0.242938, 0.373774, -0.138037, 0.345926, -0.322413, 0.258330, 0.107547, 0.452213, -0.063741, 0.337544, 0.083519, 0.102716, -0.152716, -0.354626, 0.018815, 0.335441, 0.363207, 0.266677, 0.212015, 0.351478, 0.044777, 0.466002, 0.005263, -0.067768, 0.192973, 0.468691, -0.435193, 0.430920, 0.281331, -1.286103, 0.013164, 0.242797, 0.341887, 0.086358, 0.266614, -0.286589, -0.194689, -0.175148, 0.102908, 0.032817, 0.156428, -0.182163, -0.131084, 0.045681, -0.080175, -0.000801, 0.566446, -0.060113, -0.107425, 0.133557, 0.155982, 0.005824, 0.119161, 0.124405, 0.070158, -0.095195, 0.041876, -0.230670, 0.413171, -0.095518, -0.337408, 0.069096, -0.013337, -0.066875, -0.260636, 0.095540, -0.148452, -0.274515, -0.100611, -0.208665, -0.264472, 0.239390, -1.501351, 0.275252, 0.018117, -0.559879, -0.076857, 0.079531, 0.547400, -0.115982, -0.071143, -0.649833, -0.407662, 0.295595, 1.771211, 0.080039, -0.110591, -0.102629, -0.351052, -0.026277, -0.168410, -0.046659, -0.092356, -0.100231, 0.286745, -0.408503, -0.125877, -0.027339, -0.670358, -0.159617, -0.155245, 0.078791, 0.104668, -0.243330, -0.106717, 0.049911, -0.010249, -0.684839, 0.033649, -0.163486, -0.152474, -0.868730, -0.166259, -0.328459, 0.074542, -0.298293, -0.597279, 0.227652, 0.077747, 0.214199, 0.006399, 0.401552, -0.611077, -0.224224, -0.036766]
-,        [-0.244557, -0.006127, 0.393858, -0.168971, 0.222908, 0.210944, 0.291683, -0.200399, -0.593036, -0.258962, -0.159603, -0.114945, 0.593076, 0.141903, 0.055132, 0.771838, -0.196862, -0.254105, -0.156355, 0.162658, 0.171942, -0.284013, -0.081320, -0.113877, 0.098067, 0.111349, -0.446595, 0.011112, -0.070945, -0.123741, -0.952732, 0.062086, 0.144632, -0.103002, -0.377953, 0.092591, 0.050766, 0.041914, -0.316681, -0.370524, -0.030746, 0.008649, -0.289017, 0.145983, 0.256466, 0.265097, -0.439294, -0.117126, 0.250399, 0.322418, -0.000887, -0.133547, -0.534140, 0.170882, 0.074709, 0.063057, 0.180127, 0.115196, 0.397888, -0.090168, 0.060123, 0.107903, -0.056470, 0.114524, -0.044152, -0.103257, 0.015068, 0.292738, -0.215316, 0.928664, 0.524516, -0.088588, -0.271697, 0.098871, 0.253815, 1.144219, 0.036987, -0.030862, -0.006198, 0.165396, 0.061776, -0.015340, 0.341733, 0.398319, 0.201002, -0.056436, -0.925030, 0.107737, -0.659938, 0.153507, -0.068910, 0.099741, -0.063151, -0.042283, -0.378214, -0.067208, 0.118665, 0.033049, 0.385319, 0.084744, -0.119125, -0.425687, -0.242535, -0.459845, 0.025941, 0.085822, -0.356731, -0.066824, -0.167614, -0.027784, -0.456918, 0.186574, 0.264950, -0.055328, -0.563041, 0.014457, -0.128430, -0.107755, 0.043204, -0.208758, 0.005904, 0.042322, -0.139703, -0.081549, 0.350765, 0.222492, -0.226557, -0.256040]
-,        [0.329418, -0.077287, 0.415934, 0.297706, -0.155665, 0.235564, 0.417058, -0.057186, -0.475818, 0.055503, 0.389920, 0.159723, -0.090851, 0.242830, -0.383191, -0.319205, -0.044575, -0.245017, 0.229716, -0.208154, -0.139819, 0.264735, -0.096209, 0.008948, -0.170490, -0.019481, 0.127963, -0.472199, 0.165408, 0.129050, 0.215019, 0.006389, 0.137422, 0.099298, 0.485300, 0.279151, 0.321405, 0.125491, 0.243495, -0.153639, 0.131063, -0.056754, -0.123561, 0.452102, -0.324781, 0.131160, 0.218287, 0.006335, 0.236642, -0.292885, -0.394572, -0.217047, 0.401184, -0.336477, 0.109412, -0.030113, 0.375156, 0.153056, 0.583256, -0.165217, 0.036442, 0.132244, -0.076150, 0.049604, 0.290821, -0.240801, -0.135771, 0.282281, -0.643718, 0.535888, -0.256404, 0.081204, -0.104708, 0.208011, -0.392235, -0.162286, -0.066425, -0.006993, 0.003286, -0.078027, -0.057948, 0.132844, 0.146684, -0.164601, 0.724668, 0.241815, -0.308257, -0.327449, 0.592554, 0.310231, 0.077127, -0.475701, 0.163818, 0.333588, -0.112836, -0.276224, -0.014508, 0.145417, 0.026589, 0.099822, 0.194615, -0.720614, 0.304289, 0.352291, -0.017873, 0.118193, 0.424366, 0.200394, 0.293279, -0.094643, 0.461853, -0.232420, -0.517895, 0.136247, -0.771414, -0.083884, -0.172367, -0.156301, 0.010440, 0.190096, -0.041661, 0.034400, 0.216016, -0.206404, 0.578997, -0.425009, 0.161899, -0.630175]
-,        [0.088102, 0.123735, -0.695318, -0.053262, -0.110046, -0.567377, -0.067967, 0.133439, -0.218989, 0.089708, 0.359869, 0.115584, -0.019501, -0.392953, 0.506994, 0.588530, -0.167739, -0.041112, -0.495268, 0.102290, 0.344848, 0.176261, 0.027925, -0.057822, 0.488602, 0.065882, 0.143571, 0.036140, -0.378567, 0.657943, 0.207208, -0.373784, 0.066765, -0.140014, 0.294216, 0.055785, 0.071293, -0.238863, -0.499440, 0.557616, 0.206369, 0.111235, 0.205744, -0.154387, -0.091092, -0.178663, -0.203609, 0.305283, 0.701945, -0.068870, 0.053007, -0.141234, -0.147006, 0.216244, -0.331103, 0.038660, -0.197429, -0.137905, 0.629765, 0.127764, 0.682359, -0.094598, -0.064637, -0.788864, 0.204291, 0.149519, -0.154626, -0.285905, -0.154443, 0.688429, 0.486802, -0.006112, -0.072891, -0.114007, 0.010057, -0.573278, -0.163345, 0.203511, -0.200230, 0.093856, -0.108872, -0.592515, 0.074877, -0.271238, 0.364227, -0.095744, -0.191811, 0.379305, 0.431314, -0.317358, 0.449026, -0.179882, -0.120977, -0.069342, -0.171688, -0.300596, -0.024958, 0.005611, -0.558956, -0.147487, -0.063383, 0.197680, 0.245303, -0.213014, -0.154621, 0.016716, 0.138535, -0.019647, 0.470015, 0.289840, 0.090031, -0.070947, -0.831628, -0.119236, -0.478678, 0.064025, 0.203556, 0.176804, -0.061916, -0.231462, -0.239921, -0.126778, 0.131818, -0.101291, 0.203666, 0.299809, 0.712130, -0.350801]
-,        [-0.490897, -0.018650, 0.182493, -0.041432, 0.595433, -0.414626, 0.587594, 0.276372, 0.463929, -0.346657, 0.603340, 0.103686, -0.030325, -0.024082, 0.133866, -0.301214, 0.013563, 0.145683, -0.386796, -0.195624, -0.185913, 0.036040, -0.011645, -0.233364, 0.330474, 0.324382, -0.446524, 0.706912, 0.512423, -0.219031, 0.065183, 0.155400, 0.845661, 0.078215, 0.218635, 0.033568, -0.175591, 0.066661, 0.123708, 0.388614, -0.162711, 0.842276, -0.049564, -0.164975, 0.128327, 0.034613, 0.710539, 0.049064, -0.353327, 0.334217, 0.007798, -0.022481, -0.527802, 0.053014, -0.102755, -0.128459, 0.173668, -0.512029, -0.525761, -0.239056, 0.551784, -0.648659, -0.288681, 0.313740, 0.214964, -0.130824, 0.168906, -0.224643, -0.127432, 0.574455, 0.583833, 0.403408, -0.101191, 0.063563, -0.102508, 0.751896, 0.181347, -0.090312, 0.285881, -0.074495, 0.070531, 0.320624, -0.134646, 0.369661, 0.022139, -0.300725, 0.062909, 1.051974, -0.668160, 0.028524, 0.503121, 0.082905, 0.232646, 0.145632, -0.168873, 0.054150, 0.142128, -0.200786, 0.054619, -0.258210, -0.627380, -0.087998, 0.060494, 0.175511, -0.042768, -0.243404, -0.692551, 0.108309, 0.803603, 0.149310, -0.138277, 0.506334, -0.284899, -0.083084, -0.530881, 0.056029, 0.316631, 0.376762, -0.098037, -0.072846, 0.142925, 0.058028, 0.096779, 0.057024, -1.182858, 0.558191, 0.087808, -0.115591]
-,        [0.293053, -0.146188, 0.045174, -0.020104, 0.197011, -0.179689, -0.337942, 0.397756, 0.302830, 0.192116, -0.004677, 0.089860, -0.017634, 0.135471, 0.063075, 0.202911, -0.061987, -0.391485, -0.301074, 0.047832, 0.076171, -0.134571, 0.070214, 0.083887, 0.056005, -0.347546, -0.591293, 0.661299, 0.404409, -0.872370, -0.010024, 0.319190, 0.095798, 0.199154, -0.322714, -0.395333, 0.277097, -0.083821, 0.827889, -0.054100, 0.128349, 0.201545, 0.260364, -0.018243, 0.288531, 0.136339, 0.051308, 0.207398, -0.188048, 0.606023, 0.068618, -0.003458, -1.037125, -0.208153, 0.123620, -0.031942, 0.139754, -0.244945, 0.013140, 0.221489, -0.295094, 0.165336, -0.047957, -0.569877, 0.043276, 0.039664, 0.060357, 0.168687, 0.375053, 0.416602, 0.852211, -0.302603, -0.223083, -0.212512, 0.164242, -0.243591, 0.096590, -0.030410, -0.862593, 0.004129, 0.074901, -0.263422, -0.155384, 0.245996, -0.466411, 0.074985, 0.758219, 0.010026, 0.711224, 0.060191, 0.068030, -0.294833, 0.271521, 0.170783, -0.152107, 0.048728, -0.213505, -0.003449, -0.120162, 0.775707, 0.461016, 0.655889, 0.460636, -0.309916, 0.080657, 0.073488, 0.689027, 0.189794, 0.128462, 0.015316, -0.635867, -0.363693, 1.297910, -0.099752, 0.203190, -0.043161, -0.074794, 0.120941, -0.279982, -0.136541, 0.181246, 0.000423, -0.007869, -0.246202, -0.055718, -0.168787, -0.131383, -0.000660]
-,        [-0.014930, 0.149647, -0.601156, -0.045088, 0.335101, 0.285215, 0.808361, 0.359417, 0.607082, 0.162492, -0.471572, -0.174179, 0.015379, -0.338947, -0.006012, -0.507948, -0.152102, 0.440947, 0.326109, 0.050285, -0.016006, -0.208409, -0.064798, 0.101253, 0.267752, 0.015679, -0.198585, -0.508414, -0.222858, 0.056982, 0.392331, 0.017106, -0.463188, -0.012784, 0.078042, 0.284689, 0.021143, 0.299725, 0.217076, 0.047284, -0.062470, -0.030278, -0.264278, -0.148618, -0.216714, 0.692703, 0.187151, 0.131400, -0.050993, 0.351823, 0.132752, 0.138033, 0.197962, 0.084513, 0.282809, 0.009054, -0.068625, 0.261939, -0.126892, 0.151901, 0.143688, -0.178460, -0.264908, -0.060444, 0.097690, 0.188039, 0.041804, 0.033559, -0.262589, -0.387907, -0.303202, -0.246028, 0.261832, -0.180254, -0.497504, -0.214397, 0.014489, -0.373263, 0.265775, 0.176455, 0.023895, -0.318157, 0.184535, 0.218841, -0.077206, 0.339925, 0.003896, -1.216497, 0.239530, -0.126252, -0.004032, -0.127791, -0.781549, -0.086873, -0.013969, 0.347881, -0.453038, 0.436763, 0.142969, -0.292053, 0.014355, 0.207197, 0.052491, -0.073944, -0.165597, -0.222936, 0.568707, -0.164815, 0.065705, 0.025557, 0.279109, -0.308788, 0.279782, 0.000402, 0.608372, -0.246984, 0.161953, -0.285628, -0.107585, -0.235035, 0.054371, -0.109970, 0.205455, 0.064437, 0.418139, -0.042289, 0.026866, -0.293076]
-,        [0.611954, -0.037443, -0.127660, -0.037460, -0.224724, -0.362696, -1.154961, -0.211716, 0.156275, -0.000180, -0.152440, -0.135873, 0.337230, 0.245975, -0.131617, 0.534478, 0.359721, 0.429421, -0.555709, -0.154525, 0.163259, 0.105620, -0.243782, 0.041120, 0.014077, -0.218244, -0.399136, -0.238385, 0.926072, -0.564453, 0.252307, 0.055486, -0.352104, 0.061793, 0.151754, -0.074463, -0.358820, 0.179677, -0.394713, 0.459437, 0.003321, 0.417728, -0.186173, -0.016702, -0.013831, 0.214329, 0.562254, -0.345093, 0.110384, 0.296075, -0.120998, -0.126967, 0.621782, 0.002247, -0.276916, 0.192103, -0.051507, -0.165502, 0.395571, -0.065493, -0.017389, -0.636952, 0.379496, 0.133338, -0.229350, 0.116054, 0.061459, 0.048678, 0.065866, -0.518943, -0.679156, -0.026858, 0.505118, 0.164284, 0.063953, 0.656737, -0.120548, 0.115944, 0.366140, 0.074111, -0.095590, -0.628998, 0.175570, 0.172939, -0.189685, 0.132963, -1.336600, 0.176715, 1.074600, 0.100740, -0.078097, -0.002264, -0.025475, 0.327674, -0.026990, -0.023396, 0.084699, -0.576118, -0.176379, 0.578489, 0.338250, 0.190647, 0.380874, 0.020777, 0.125605, 0.219921, 0.123016, -0.023385, -0.289106, -0.014215, -0.205695, 0.117571, 0.277509, 0.127252, 0.360268, -0.026278, 0.247560, 0.136051, -0.122600, -0.077702, 0.336989, 0.114093, 0.037673, 0.007892, -0.312751, -0.209548, 0.157477, 0.216425]
-,        [0.011473, -0.025075, -0.370036, 0.141712, 0.095528, 0.082894, -0.272002, 0.333850, 0.117317, 0.366092, 0.106421, -0.139171, 0.175107, 0.000990, -0.222184, -0.423348, 0.077821, -0.047345, 0.245217, -0.179773, -0.117885, -0.071133, 0.036318, -0.132398, 0.174282, 0.175323, -0.127840, -0.346802, -0.317578, -0.718060, 0.051093, 0.040780, 0.065519, -0.174897, -0.067182, 0.032865, 0.055365, -0.152501, 0.513046, -0.035390, 0.138433, 0.449201, 0.366662, -0.132534, 0.007702, 0.265466, -0.486664, 0.002453, -0.500899, -0.602364, -0.254078, 0.059746, -0.165630, 0.201943, -0.030074, 0.340763, -0.105672, 0.214619, 0.023490, 0.030050, 0.307605, -0.384011, -0.033090, -0.374799, -0.222847, -0.074625, -0.026553, -0.395709, -0.411171, 0.000571, -0.634874, 0.102978, 0.033150, -0.183039, -0.206470, -0.861045, 0.182610, 0.344263, 0.142092, 0.002211, 0.138301, 0.395010, -0.142729, 0.123571, 0.664541, -0.007369, 0.425006, 1.452068, -0.046595, -0.218496, 0.388080, -0.349236, 0.420849, 0.059306, -0.154924, 0.124990, -0.321684, -0.013656, 0.442414, 0.039073, -0.242248, 0.197413, 0.030485, -0.397456, 0.060298, 0.363221, -0.792873, 0.165735, -0.103408, 0.090403, -1.058768, -0.103851, -0.228291, 0.070869, -0.078386, -0.211956, 0.141098, 0.128485, 0.196775, 0.298432, 0.132518, 0.029494, 0.114334, 0.083134, 0.245296, 0.112674, 0.031782, -0.603264]
-,        [0.118266, -0.156445, -0.064689, -0.043840, -0.329760, 0.212777, 0.319123, -0.336010, -0.055269, 0.146186, 0.651390, 0.143837, 0.577110, -0.019512, -0.309213, -0.346972, -0.276566, -0.180488, -0.171876, 0.142808, 0.023832, 0.116057, -0.221116, 0.128058, -0.072619, 0.121579, -0.512959, 0.105156, 0.118349, 0.166327, -0.432805, 0.303698, 0.319773, -0.024271, -0.062191, -0.027124, 0.427637, 0.337689, -0.056511, -0.005406, -0.448526, -0.341718, -0.123832, 0.115705, 0.190325, -0.221120, -0.326137, 0.054319, 0.266069, -0.179200, -0.275277, 0.180098, -0.098144, -0.212471, -0.157090, 0.160706, 0.082561, -0.558153, 0.188864, 0.116565, -0.193253, 0.262906, 0.030136, 0.613950, 0.028051, -0.020090, -0.238778, -0.203317, -0.380358, -0.668016, 0.088145, 0.088212, 0.400065, 0.066790, -0.416983, -0.543346, 0.085918, -0.027577, 0.227642, 0.149735, -0.154294, 0.496434, -0.089521, 0.251080, -0.258548, -0.349202, 0.045841, -0.445537, -0.495218, -0.111459, -0.201295, 0.253345, 0.025466, 0.028913, 0.136319, 0.249755, 0.314822, -0.434716, -0.327034, 0.723645, -0.071692, 0.323239, 0.118313, -0.100924, 0.096705, -0.057497, -0.308969, -0.131086, 0.123175, 0.184964, -1.020850, -0.000944, -0.108386, 0.134801, -0.676820, 0.027695, -0.157948, -0.121530, 0.110084, 0.079839, 0.317192, -0.108870, 0.005620, -0.039222, 0.605465, 0.096567, 0.331377, -0.258318]
-,        [-0.030347, -0.131022, -0.391546, -0.016117, 0.143530, 0.053373, 0.289758, -0.457140, 0.526344, -0.364949, 0.391606, -0.108156, -0.389764, 0.080216, 0.064370, 0.200020, -0.114399, -0.076523, 0.608215, 0.093967, 0.179648, -0.085176, -0.059540, 0.028029, 0.407776, 0.145816, 0.169003, 0.184440, 0.123838, 0.853592, 0.184923, -0.024561, 0.036531, -0.000301, -0.046208, -0.062290, 0.154571, -0.108056, -0.057606, 0.073916, -0.176105, 0.438815, -0.050850, 0.080422, -0.485033, -0.136613, 0.359091, -0.170161, 0.314588, 0.203244, -0.256353, 0.036541, 0.024439, -0.028107, 0.144045, 0.114557, 0.010197, 0.041406, 0.208052, -0.042596, -0.347831, 0.395708, 0.054126, 0.702391, -0.029837, -0.093579, -0.256413, 0.014116, 0.295906, -0.084785, -0.069504, 0.612803, 0.000308, -0.132294, 0.299633, 0.147369, 0.262900, -0.212245, 0.208695, -0.066585, -0.205046, 0.553977, 0.056612, 0.531491, -0.003612, 0.009034, 0.231870, -1.249884, -0.397126, -0.181221, -0.151726, 0.097437, -0.194783, 0.256459, -0.157007, -0.029050, 0.065067, -0.138437, 0.351784, 0.362180, -0.206729, 0.126545, -0.356485, 0.107956, -0.183117, -0.017699, -0.160299, 0.038220, 0.063729, 0.131637, 0.272374, 0.180169, 0.202972, 0.244622, 0.364850, 0.300070, 0.349619, -0.117802, -0.020202, 0.098518, 0.196122, -0.142825, -0.020507, 0.002288, 0.640319, 0.602893, 0.438297, 0.075720]
-,        [0.198230, 0.070374, 0.155175, -0.005693, 0.226227, -0.014721, -1.168679, 0.340539, -0.077696, -0.060910, 0.641940, -0.028966, -0.250130, -0.053382, 0.147862, 0.927754, -0.204609, 0.195343, 0.498537, -0.048412, -0.195078, 0.164454, 0.096200, 0.039966, -0.462537, 0.020423, 0.421042, 0.356414, -0.043938, 0.385616, 0.466539, 0.154348, -0.036515, -0.034890, 0.035878, 0.034711, -0.198058, -0.010547, 0.825003, 0.190243, 0.042269, 0.396741, 0.174951, 0.256610, 0.093991, 0.132321, 0.945699, 0.108378, 0.165516, -0.128451, -0.137388, -0.107677, -0.433840, -0.061271, -0.143054, -0.381912, 0.142728, 0.070915, -0.006297, -0.165602, -0.152735, -1.039889, -0.129415, -0.271393, 0.040762, 0.046951, -0.070300, -0.081479, 0.081748, 0.138836, 0.039291, -0.141596, 0.182922, -0.010746, 0.063010, -0.371559, -0.173762, -0.188767, 0.415845, 0.115119, -0.270663, -0.238650, 0.014861, -0.809925, -0.139478, 0.383766, -0.234593, -0.778437, 0.369209, 0.076042, 0.069555, -0.363032, -0.429782, -0.098514, 0.152271, 0.094725, 0.265553, -0.201867, -0.827291, 0.760190, 0.216985, -0.155852, 0.003185, -0.335658, 0.029853, -0.070778, -0.242075, -0.324011, 0.168285, -0.066415, -0.358349, 0.188355, 0.094642, 0.019466, 0.118566, 0.040243, 0.177118, -0.168314, 0.058247, 0.093715, -0.022434, 0.179371, -0.027912, -0.091222, 0.420792, 0.252511, 0.000495, 0.278119]
-,        [0.022808, 0.016543, 0.216368, -0.051617, 0.568283, 0.239247, 0.112489, 0.162134, -0.629426, 0.425641, 0.195481, 0.113793, 0.383526, 0.296379, 0.388221, 0.786298, 0.560119, -0.002127, -0.527837, 0.199381, -0.001169, -0.191649, -0.047838, 0.118522, 0.050356, 0.074192, -0.076182, -0.318745, -0.523894, -0.119539, -0.382354, -0.188893, 0.121211, 0.006420, -0.124036, 0.299392, -0.673661, 0.076611, -0.231041, -0.144272, 0.215310, -0.239623, 0.079418, 0.234536, 0.017446, 0.237374, 0.557871, 0.064846, -0.028783, 0.337697, 0.105774, -0.238447, -0.138190, 0.103355, 0.133550, 0.059071, -0.265627, 0.023214, -0.110703, -0.100284, 0.005531, -0.636857, -0.150524, -0.473778, 0.042186, 0.031200, 0.079468, 0.567337, -0.014177, 0.448204, 0.255148, 0.088008, -0.327814, 0.305763, -0.640311, -0.139510, 0.100871, -0.137151, 0.225586, 0.322500, -0.028575, -0.122792, -0.048938, -0.290091, -0.125468, 0.786086, 0.468460, 0.931903, 0.031473, 0.055338, 0.005973, 0.393090, -0.257417, 0.176619, -0.133472, -0.174125, -0.024098, -0.158964, -0.444880, -0.526961, -0.344706, -0.376460, 0.772774, -0.121595, 0.133405, -0.165399, -0.184511, 0.230309, 0.179585, 0.011159, -0.974659, -0.006608, 0.151443, 0.116893, -0.558704, 0.256455, -0.574462, -0.341840, -0.035619, -0.104377, 0.212586, -0.145202, -0.136627, 0.056094, -0.694518, -0.500043, -0.002693, 0.245271]
-,        [-0.330975, 0.135302, -0.304634, -0.024846, -0.141038, 0.319981, -0.903774, 0.533909, -0.022846, -0.090718, -0.140614, -0.046884, -0.304894, -0.002555, -0.226097, -0.574103, 0.112768, -0.198592, 0.134663, -0.068910, -0.108763, -0.142054, 0.125731, 0.204748, 0.002173, 0.144402, 0.651706, 0.397803, -0.002762, -0.437534, 0.107108, -0.512225, -0.517741, -0.023538, 0.244710, 0.210415, -0.242085, 0.176464, -0.239457, -0.457991, -0.025383, -0.361572, 0.489117, -0.080122, 0.309791, -0.305669, 0.367811, 0.083966, 0.187807, 0.431791, 0.069534, 0.145603, 0.616620, 0.297866, 0.073510, 0.102655, -0.162999, 0.325180, -0.193775, 0.185299, -0.132156, 0.200958, -0.052132, 0.170044, -0.034601, 0.004360, 0.307018, 0.056782, 0.147660, 0.849743, 0.527718, -0.422411, -0.053623, 0.051867, 0.198707, 0.838964, -0.354768, 0.091584, -0.353560, 0.035851, 0.051291, -0.507581, -0.103297, -0.110411, -0.094718, 0.066932, 0.343318, 0.549256, -0.419604, -0.122961, -0.076139, -0.135443, 0.130128, -0.015127, -0.170255, 0.176761, 0.089668, -0.079225, 0.059804, -0.113071, -0.348400, 1.576025, -0.137884, -0.127803, 0.082942, -0.073140, 0.448883, -0.085013, 0.169524, 0.228002, -0.175048, -0.170588, 0.224432, 0.099525, 0.061370, 0.397127, -0.374436, 0.192740, -0.052554, -0.292187, -0.097597, -0.152519, -0.020649, -0.076253, 0.197891, 1.389143, 0.070236, -0.233437]
-,        [-0.920987, 0.046830, 0.114670, 0.061768, -0.347026, -0.117424, 0.217590, 0.437538, -0.052421, -0.447150, -0.617074, -0.120001, -0.079015, 0.051515, -0.072887, -0.228894, 0.217918, 0.339822, 0.153634, 0.129482, 0.008047, -0.121879, -0.119770, 0.099550, -0.047784, 0.024425, 0.161179, 0.544998, -0.671174, 0.158512, -0.409032, 0.002441, 0.187357, 0.146365, -0.381540, -0.070326, -1.169841, 0.054750, 0.100856, 0.413077, -0.576189, 0.734485, 0.108371, -0.192557, 0.124508, -0.087451, 0.534544, 0.052731, 0.088709, -0.773592, 0.162835, -0.489496, -0.380894, -0.069037, -0.098202, 0.218232, -0.133206, 0.460869, -0.225160, -0.215903, -0.189836, 0.178248, 0.038053, 0.398714, 0.018776, -0.083475, -0.193673, -0.359640, 0.404502, -0.181867, 0.361915, -0.001330, -0.129002, -0.262481, -0.228835, 0.047552, -0.047125, 0.286354, -0.125676, -0.208538, 0.093206, 0.388134, 0.216047, 0.393006, 0.027253, 0.622350, -0.078199, -0.563329, 0.192309, 0.097659, -0.140522, 0.383340, 0.261979, -0.227026, 0.086719, -0.489962, 0.074644, 0.129508, 0.717357, 0.674174, 0.090160, 0.326227, 0.568106, 0.221171, -0.141218, 0.205043, -0.045428, -0.184419, 0.252427, -0.066047, 1.113886, 0.537268, -0.598034, -0.041117, 0.608880, 0.098823, 0.023483, -0.366400, -0.015759, -0.060674, -0.072975, 0.278837, -0.036613, -0.044528, -0.953022, 0.283470, 0.092562, 0.430073]
-,        [0.249762, 0.048679, 1.053536, -0.030284, 0.291329, -0.287918, -0.952278, 0.056497, -0.254553, 0.117357, -0.484462, 0.056219, -0.230377, -0.280808, 0.412150, -0.138143, 0.051461, 0.019569, -0.307967, 0.306406, 0.017408, 0.059176, -0.037106, -0.108233, 0.058590, 0.193668, 0.276462, -0.152053, 0.026012, -0.540160, -0.475504, 0.186292, 0.361485, -0.211106, 0.206720, 0.186871, 0.194348, 0.049673, -0.078265, -0.151021, 0.169548, 0.117499, 0.188038, 0.271209, 0.500694, 0.011412, 0.281830, -0.194832, -0.158229, 0.502501, -0.229816, -0.281520, 0.245966, 0.097130, -0.236074, 0.150378, -0.165382, -0.094728, 0.706077, 0.062524, 0.260514, -0.495613, 0.178890, -0.212613, 0.078498, 0.099664, -0.095102, 0.623250, 0.086669, -0.323316, -0.370940, 0.271732, 0.222690, -0.059788, -0.364285, -0.159517, 0.225978, 0.083862, 0.280317, -0.311058, -0.317280, 0.084179, 0.090716, 0.036716, -0.144650, 0.073411, 0.038594, -0.152952, 1.440602, 0.183145, -0.101151, -0.012966, -0.493416, 0.087878, -0.131576, -0.183554, -0.052529, 0.312080, -0.452314, -0.072187, -0.014788, -0.752089, -0.156883, -0.108266, 0.284915, -0.274608, 0.480412, -0.022875, 0.329929, 0.237020, -0.377875, 0.093550, -0.673781, -0.049416, -0.537024, -0.291622, -0.129406, -0.180102, -0.170871, 0.143301, 0.340673, -0.005923, -0.260256, -0.137533, 0.056992, 0.441241, -0.204732, -0.042281]
-,        [-0.425118, 0.140251, -0.296585, -0.098757, -0.066643, -0.075846, 0.486095, -0.217028, 0.000842, 0.428190, -0.077650, -0.144550, 0.009077, 0.243487, -0.396793, 0.487261, 0.201310, -0.249025, -0.631792, 0.093581, 0.197097, -0.151951, 0.071982, 0.294141, -0.152912, -0.375566, 0.133728, 0.287758, 0.134178, -0.889150, 0.226683, -0.104184, 0.056792, 0.076873, 0.396308, 0.012986, -0.155311, -0.073675, -0.021786, -0.140897, 0.169705, 0.000546, -0.038335, 0.013828, -0.240727, -0.184615, 0.200154, -0.107444, 0.230761, -0.453356, 0.020090, 0.030954, 0.410774, -0.193307, -0.075162, -0.218270, 0.129128, -0.149071, -0.014557, -0.067054, 0.784106, 0.493828, 0.061981, 0.131068, -0.251843, 0.138708, -0.135812, -0.278471, 0.060515, -0.744835, -0.666607, 0.095962, -0.061720, -0.365309, -0.310637, 0.026963, 0.137560, -0.383717, -0.052008, 0.106268, -0.166096, 0.009607, -0.160712, 0.047270, 0.400991, -0.040274, 0.398012, 0.224943, 0.660323, 0.180992, 0.169928, 0.322001, -0.397808, 0.130959, -0.036922, 0.039076, 0.033740, 0.227851, -0.087064, 0.508901, -0.497136, 0.633794, 0.402153, 0.301574, 0.412847, 0.034387, 0.274455, 0.236939, -0.096830, -0.074409, -0.624931, -0.053594, 0.466797, -0.154880, 0.466228, -0.271837, 0.312570, 0.269301, -0.030001, 0.072163, -0.399286, -0.100047, -0.051530, -0.173948, -0.875951, -0.457626, -0.093869, -0.007888]
-,        [0.638487, 0.143523, 0.678995, -0.037127, 0.319974, -0.046251, -0.725897, 0.069912, -0.265814, -0.220795, -0.481389, -0.255599, -0.025631, -0.192423, 0.085568, -0.430116, 0.415272, 0.023330, -0.211151, -0.320378, 0.063250, 0.190535, -0.043646, 0.072724, -0.578424, 0.215274, 0.195334, -0.199301, -0.230990, -0.010165, 0.055762, -0.083299, 0.175122, -0.159048, -0.088146, -0.253667, -0.577648, -0.123130, 0.009645, -0.126025, 0.127380, 0.355637, -0.294140, 0.242377, -0.343909, -0.167724, -0.539452, 0.086739, 0.112772, 0.538626, -0.121594, 0.256195, 0.372183, 0.163736, 0.266532, -0.022051, 0.070907, 0.125563, -0.379710, -0.000844, 0.158755, -0.147750, -0.112138, -0.338631, 0.056047, -0.011820, 0.002224, -0.098184, -0.306023, 0.459653, -0.105770, -0.374667, -0.250840, -0.531626, 0.311771, -0.064655, 0.184743, 0.213536, -0.162045, -0.014858, -0.017401, 0.963252, -0.083712, 0.079195, -0.239081, -0.362285, -0.008807, 0.374317, -1.030592, 0.244174, -0.049287, -0.019188, -0.082272, -0.171920, 0.040625, 0.321594, 0.153772, -0.186845, -0.473188, -0.393334, 0.543155, 0.176420, 0.345044, 0.219153, -0.001022, -0.391713, 0.234630, 0.086572, 0.747131, -0.071519, -0.696962, -0.176688, -0.030282, 0.234175, -0.068892, -0.192259, 0.090418, 0.373416, 0.238481, 0.362743, 0.109396, -0.145655, -0.027388, 0.059040, -0.034243, 0.073552, -0.252381, -0.026626]
-,        [-0.280804, 0.104607, -0.101397, 0.053087, 0.043543, 0.111424, 0.962974, -0.374736, 0.450855, -0.357878, 0.177787, 0.029160, 0.500895, 0.411040, 0.058785, -0.492934, -0.312174, -0.041331, -0.287172, -0.122655, 0.059167, -0.000037, 0.083348, 0.117373, 0.499344, 0.333567, 0.490841, -0.012846, 0.146377, 0.192827, -0.343953, -0.199940, 0.481803, 0.213005, -0.030009, 0.064417, -0.524601, -0.277705, 0.151566, 0.464198, -0.086637, 0.463454, -0.001835, -0.021626, 0.555385, -0.282214, -0.137715, 0.084046, -0.101419, 0.112628, -0.297709, 0.050580, 0.085497, -0.230804, -0.021511, 0.160166, 0.065047, 0.183182, 0.289750, -0.282537, -0.390727, 0.809668, 0.141749, 0.332038, -0.198631, -0.041048, 0.120652, 0.310523, -0.138034, -0.063433, -0.014590, 0.090876, -0.236167, -0.228002, 0.419597, -0.680343, 0.358037, -0.017140, -0.338289, -0.108463, 0.028281, -0.410969, 0.218255, -0.075335, -0.139316, 0.214716, -0.382891, -0.309352, 1.028144, -0.045097, -0.334725, 0.103865, 0.606845, -0.194565, -0.131979, 0.026175, -0.112550, 0.068768, -0.508385, 0.352966, -0.272047, -0.063203, 0.546295, -0.121109, 0.023884, 0.040528, 0.814673, 0.084001, 0.032651, -0.011303, 0.931548, 0.127035, 0.608275, 0.201373, 0.293666, -0.058783, -0.103780, 0.008285, -0.114105, -0.029507, 0.352435, -0.253810, 0.292479, 0.022843, -0.137346, -0.469052, -0.055345, 0.340311]
-,        [0.320558, 0.033593, 0.224812, -0.123240, 0.061316, -0.119025, 0.113625, -0.735885, 0.735543, -0.119934, -0.136398, -0.065225, -0.290301, 0.029821, 0.062311, -0.507651, 0.173955, 0.011185, -0.325291, 0.108854, 0.241909, -0.072930, 0.092319, 0.191376, 0.276161, -0.026498, 0.178610, 0.091403, 0.132787, -0.211888, -0.106202, -0.187890, 0.255130, 0.214081, -0.214229, -0.018945, -0.510710, 0.004095, 0.282197, 0.373362, -0.067458, -0.182273, -0.018070, -0.020468, -0.174656, -0.618763, 0.683532, 0.121681, -0.383811, -0.236998, -0.321565, -0.147288, -0.006103, -0.355249, 0.005208, 0.142767, 0.128820, 0.077836, 0.524290, 0.111664, -0.276750, 0.416473, -0.180509, 0.146483, -0.046629, -0.156341, -0.293246, -0.112402, 0.472263, 0.124530, 0.727026, -0.131290, 0.232914, -0.120292, 0.044231, 0.474258, 0.318262, -0.062846, 0.090888, -0.253536, 0.042888, -0.534394, 0.146154, -0.307144, -0.250128, 0.345303, -0.007372, -0.369177, 1.319625, -0.316174, -0.057575, -0.415153, -0.319729, -0.061419, -0.304163, -0.568056, 0.211572, 0.053837, -0.201278, 0.008334, -0.182843, -0.955541, -0.896387, 0.345048, -0.025039, -0.300002, 0.181867, -0.275252, 0.226431, -0.274753, 0.449667, -0.107370, -0.702907, -0.020652, 0.011224, 0.015470, -0.239082, -0.294484, 0.126525, -0.078072, 0.391011, 0.045836, -0.245131, 0.185227, -0.104781, 0.479467, -0.078328, -0.125230]
-,        [-0.182898, -0.052582, -0.306664, -0.140690, -0.666110, -0.307209, 0.325891, -1.057382, 0.717436, 0.256164, 0.097710, -0.105697, 0.021838, -0.085565, -0.071785, 0.739217, 0.196588, 0.188600, 0.038635, 0.248953, -0.084710, 0.126424, 0.026010, 0.100888, -0.010262, 0.128991, 0.400122, 0.327557, 0.748330, -0.472187, 0.387493, -0.499033, 0.473763, -0.038984, -0.128738, 0.311765, -0.583558, 0.128051, -0.413962, -0.049605, 0.202289, -0.761666, -0.325511, 0.242974, 0.326802, -0.217770, -1.156994, -0.043995, 0.179847, 0.206208, -0.120879, 0.402757, 0.598193, -0.012143, -0.137851, 0.172476, 0.129038, -0.329298, 0.147281, 0.236047, -0.338892, -0.320402, -0.099993, 0.690594, -0.058130, -0.133600, -0.008902, 0.072657, -0.027256, -0.555105, -0.018617, -0.250451, -0.051765, 0.170564, 0.285106, -1.373554, -0.233533, -0.185352, 0.459174, -0.000201, -0.360591, 0.422838, -0.051986, 0.119413, 0.166183, -0.310811, 0.407700, 0.719747, 0.224959, 0.045008, -0.062171, 0.141415, 0.460185, -0.123281, -0.183112, 0.105480, 0.200653, 0.451871, 0.461608, 0.436536, 0.221739, -0.978428, 0.225303, -0.142270, -0.059489, -0.081552, -0.506421, 0.187886, 0.096248, -0.060928, -0.951757, -0.517548, 0.364438, 0.310452, -0.334013, -0.123807, -0.036834, 0.074486, -0.185824, 0.214675, -0.175668, -0.223997, 0.363707, -0.028896, 0.106567, -0.082487, 0.171015, 0.350688]
-,        [-0.850305, 0.003115, -0.359239, 0.093182, -0.611663, 1.045809, -0.320546, -0.034976, 0.662990, -0.605466, -0.464665, -0.059806, -0.037915, -0.012303, -0.034292, -0.052816, 0.015233, -0.160831, 0.386974, -0.127239, -0.218969, 0.044042, -0.495995, -0.181389, -0.400405, -0.333328, 0.010486, 0.735185, -0.614178, -1.024673, -0.221882, -0.057562, 0.393993, 0.004977, -0.232671, 0.077700, -0.320825, -0.072012, -0.110879, -0.259720, 0.122366, 0.399759, -0.332559, -0.376753, 0.051940, 0.910295, -0.164613, 0.266407, 0.075771, -0.025383, 0.144543, -0.522838, -0.431918, 0.397756, 0.001139, -0.269837, 0.184732, -0.632000, -1.003555, 0.174718, -0.248598, -0.025730, -0.357354, -0.575225, -0.040212, 0.006663, -0.321170, 0.222533, -0.076504, 0.653286, 0.520046, 0.601763, -0.437712, 0.215643, 0.065286, -1.272661, -0.111388, 0.330718, 0.160384, 0.088937, 0.022895, -1.448662, -0.054975, -0.048305, 0.155641, 1.086483, -0.304876, -1.183725, -1.371350, 0.133744, -0.242955, 0.177099, 1.683534, -0.478006, -0.022839, -0.752371, -0.015283, -0.389536, -0.501995, -0.000659, 0.396113, -0.670487, -0.733406, 0.243848, 0.153586, -0.202950, 0.051148, -0.166166, 0.304836, -0.244313, -0.386154, 0.201490, -1.339835, 0.052327, -0.241138, -0.004122, -0.449081, -0.529734, 0.141126, 0.455125, 0.160095, -0.018237, 0.073214, 0.066540, 0.131906, -0.545392, -0.609755, 0.645898]
-    ],
-    "play_head.bias": [0.099277, -0.106306, 0.713719, 0.291735, 0.293751, 0.641781, -0.036490, -0.226107, 0.162656, 0.522893, -0.034252, 0.045967, 0.265685, 0.600984, -0.360950, -0.597196, -0.145373, 0.228693, -0.484538, 0.043320, 0.085593, 0.501777, -0.237420, 0.173257, 0.420734, 0.349173, -0.178274, -0.826865, 0.977609, 0.047071, -0.200717, 0.024798, -0.219008, 0.479205, -0.030946, -0.305356, -0.099484, 0.044971, -0.086850, -0.471881, -0.271802, 0.926279, -0.203665, -0.222024, -0.113895, 0.192596, -0.263264, -0.226201, 0.658945, 0.577768, -0.073713, -0.050073, -5.039493],
-    "jump_head.weight": [
-        [-0.592975, -0.000044, -0.398922, -0.064022, -0.237337, -0.049262, -0.876935, -0.215701, -0.188580, -0.055840, -0.055035, 0.000281, -0.291186, -0.057001, -0.099072, -0.375079, -0.004264, -0.115482, -0.009275, -0.124154, 0.156568, -0.207084, -0.057525, 0.122800, -0.449824, -0.110801, -0.028491, -0.116249, -0.587386, -1.329387, -0.225950, 0.020029, -0.132979, -0.174207, -0.067491, -0.108976, -0.347566, 0.054988, -0.345095, -0.112763, 0.074880, -0.305198, 0.164911, -0.151764, -0.066532, -0.511967, -0.106161, 0.050901, -0.014909, -0.364238, 0.177012, 0.140278, -0.203979, -0.225130, -0.060176, -0.075700, -0.011007, -0.134739, -0.161187, -0.165340, -0.461017, -0.737038, -0.009315, -0.080643, 0.026484, 0.031165, 0.154675, -0.490129, -0.092571, -0.150716, -0.615046, 0.104924, -0.457701, -0.060244, -0.151780, -0.973038, 0.314201, -0.214088, 0.065499, -0.417845, -0.216971, -1.742460, -0.053203, -0.295212, -0.458188, -0.235894, 0.073172, -1.539282, -1.122638, 0.052104, -0.239760, 0.187609, -0.156189, -0.006790, 0.100458, -0.516883, -0.073139, -0.132611, -0.509118, -0.111227, -0.017758, -0.790227, -0.144901, -0.208751, -0.040083, -0.101979, -0.104834, 0.104780, -0.233359, 0.055489, -0.908671, -0.296029, -1.627076, 0.166699, -1.115072, -0.089019, 0.092663, -0.491461, -0.149059, -0.156438, -0.257359, 0.152541, 0.123088, 0.006815, -0.042512, -0.301073, -0.128089, -0.017728]
-,        [-0.826306, -0.257543, -0.459053, -0.019839, 0.106344, 0.142101, -1.163038, -0.747897, 0.141073, -0.032083, 0.228565, 0.141173, -0.159567, -0.044409, 0.027600, -0.825340, -0.457976, -0.091056, -0.528013, -0.111000, -0.000094, -0.063343, 0.090976, 0.120010, -0.137092, -0.101279, -0.559501, 0.097629, -0.977108, -1.929962, -0.544625, 0.173965, -0.002540, 0.020598, -0.258761, 0.113244, -0.306973, -0.133414, -0.079041, -0.113506, -0.032395, -0.280972, -0.149705, -0.199268, -0.066814, -0.210080, -0.478688, -0.128514, -0.011623, -0.080439, 0.288471, -0.113537, -0.313491, -0.143390, 0.059056, -0.051072, -0.060230, -0.170637, -0.791645, 0.023097, -0.271134, -0.639140, 0.144385, -0.350427, 0.091724, 0.253487, -0.033116, -0.058209, -0.196799, -0.452115, -0.296949, 0.155843, -0.108605, -0.169402, -0.225546, -1.537676, -0.035248, -0.339027, -0.237780, 0.045813, -0.193394, -2.229362, 0.318289, -0.148351, -0.164197, -0.319253, -0.627233, -0.715812, -2.153054, 0.131652, -0.031030, 0.083032, -0.407267, 0.017305, -0.032169, -0.320393, -0.055901, -0.491720, -0.577848, -0.085765, -0.273228, -1.367818, -0.664461, -0.063483, -0.137574, -0.052139, -0.451967, -0.085992, -0.230614, -0.079295, -1.233014, -0.280830, -1.536339, -0.073363, -0.320138, -0.087369, -0.515224, -0.028097, -0.024273, -0.049489, -0.022961, 0.051735, 0.202324, 0.197213, -0.336942, -0.892649, -0.173993, -0.052188]
-,        [-0.321788, 0.010091, -0.029934, 0.014277, 0.046059, -0.106795, -0.721653, -0.067839, -0.215426, -0.159234, -0.183781, -0.117483, -0.479883, 0.202728, 0.076438, -0.677959, 0.107255, 0.112777, 0.073256, -0.271021, 0.308744, 0.095309, -0.166998, 0.072848, -0.447001, -0.083251, -0.165535, -0.260657, -0.750205, -0.673946, -0.100353, 0.187054, -0.219644, -0.033793, 0.117566, 0.000117, -0.580300, -0.148550, 0.112126, -0.069221, 0.054153, -0.048967, 0.188281, 0.045489, -0.102242, 0.116858, -0.169654, -0.295050, -0.084770, 0.175930, 0.103539, 0.048772, 0.083506, 0.048392, -0.083832, -0.083097, -0.040807, -0.102063, -0.224283, 0.050512, -0.248023, -0.133396, 0.005845, -0.470875, -0.022255, 0.054308, 0.076858, 0.139836, -0.381913, -0.047467, 0.217822, 0.041166, -0.029121, 0.068389, -0.183166, -0.773137, 0.309933, 0.035949, -0.197167, 0.020057, -0.119879, -1.039065, -0.039645, 0.042481, 0.004540, 0.010378, -0.478707, -0.667278, -0.605237, -0.154197, -0.019690, -0.199739, 0.045471, -0.053229, 0.017433, -0.262739, -0.002661, -0.259716, -0.156618, -0.010641, -0.191128, -0.738264, -0.485538, -0.057135, -0.116634, -0.106817, 0.005495, 0.030119, -0.011676, 0.068228, -1.093127, -0.198661, -0.932333, 0.019408, -0.157803, -0.155735, -0.151276, 0.079826, -0.076791, -0.239931, -0.153356, 0.060159, -0.127958, -0.007251, -0.019613, -0.445441, -0.373980, -0.177287]
-,        [-1.020147, -0.199113, -0.730807, -0.093360, 0.040560, -0.295495, -1.700760, -0.615227, -0.060903, -0.306374, -0.117457, 0.135878, -0.409065, -0.046416, 0.208190, -0.814265, -0.185001, -0.016680, -0.231437, 0.153871, -0.002545, -0.267925, -0.091784, -0.091213, -0.666604, -0.260163, -0.677336, -0.670099, -1.136330, -1.543151, -0.968860, -0.333041, -0.508016, 0.278865, -0.373531, 0.045922, -0.908136, -0.034242, -0.565126, -0.424681, -0.073029, -0.551454, -0.248930, -0.136633, -0.096244, -0.084115, -0.368591, 0.071464, -0.343797, -0.077066, -0.197119, 0.124316, -0.570850, 0.017694, 0.063514, -0.035360, -0.092616, -0.243314, -0.947254, 0.008728, -0.503032, -0.687390, 0.069830, -0.358439, -0.254875, -0.134851, 0.218097, 0.183688, 0.325237, -0.496252, -0.768287, 0.042475, 0.037708, -0.187880, -0.340118, -1.564890, -0.043224, -0.349106, -0.112430, -0.310416, 0.126106, -2.149866, 0.001690, -0.664630, -0.366667, -0.278380, -0.204409, -1.822151, -2.229864, -0.179243, -0.201427, 0.410056, -0.624734, 0.200430, -0.079546, -0.014514, 0.010646, -0.135565, -0.540012, -0.161812, -0.093120, -1.772203, -0.550416, -0.252320, 0.147125, -0.316614, -0.300927, 0.042982, 0.184451, -0.150101, -1.351960, -0.195612, -1.593814, -0.003043, -0.445213, -0.324559, -0.341975, -0.359122, -0.147184, -0.457454, 0.161919, -0.224918, -0.145779, -0.174256, -0.213358, -1.252067, -0.236596, 0.030604]
-,        [-0.969767, 0.077838, -0.562256, -0.017660, -0.000541, -0.209219, -1.411890, -0.794211, -0.047873, -0.246703, -0.353812, -0.134165, -0.235029, -0.185224, -0.057110, -0.939984, -0.181943, -0.150405, 0.062025, -0.199250, 0.222351, -0.008571, -0.161800, 0.113218, -0.516568, -0.371043, -0.341613, -0.549820, -0.719395, -1.594420, -1.651722, -0.196347, -0.461868, -0.168910, -0.039837, -0.003968, -0.227473, -0.010617, -0.188324, -0.679284, -0.384193, -0.430601, 0.146154, -0.067995, -0.283284, -0.151776, -0.251776, 0.454892, -0.308040, -0.417283, -0.057241, 0.016663, -0.694170, -0.008333, 0.013474, -0.273626, -0.067532, 0.346982, -0.421581, -0.117935, -0.738818, -0.911901, -0.025719, -0.455644, 0.166011, -0.114042, -0.266058, -0.204691, 0.032455, -0.241443, -0.584634, -0.146644, 0.329904, -0.284572, -0.177303, -1.616349, 0.327710, -0.563744, -0.228296, -0.245690, -0.094365, -2.060108, -0.002458, -0.579998, -0.530106, -0.434917, -0.719495, -1.648788, -2.274491, -0.216301, -0.334474, 0.059081, 0.136240, -0.213494, -0.226850, -0.159408, -0.194531, -0.073262, -0.966502, -0.126297, -0.031965, -1.583883, -0.660270, -0.029933, 0.020191, -0.194911, -0.730840, -0.068709, -0.188653, 0.239749, -1.685522, -0.607623, -1.813690, -0.083044, -0.442778, -0.203393, -0.712879, -0.406246, -0.136460, -0.497021, 0.007358, 0.096252, -0.114974, 0.029147, 0.065283, -0.686060, -0.488404, 0.148403]
-,        [-0.630976, -0.022813, 0.084195, 0.322083, 0.056663, -0.412786, -0.828180, -0.434379, -0.005699, -0.418626, -0.346755, -0.132568, 0.075645, -0.285744, -0.052339, -0.606660, -0.262141, -0.124174, -0.087702, -0.019166, 0.070931, 0.070746, 0.059232, 0.163846, -0.346995, 0.133522, -0.026567, -0.506661, -0.571312, -1.863717, -0.446987, 0.053760, -0.437436, -0.093385, -0.310863, -0.086112, -0.180810, 0.238413, 0.006214, -0.556037, 0.077290, -0.332912, -0.281443, 0.219996, 0.029531, -0.182586, -0.242343, 0.068790, -0.331402, -0.511166, -0.244502, -0.019760, -0.898364, -0.153347, 0.066860, -0.126159, 0.209201, -0.083982, -0.871629, 0.017668, -0.545465, -0.908784, -0.158236, -0.039328, -0.035705, -0.068131, -0.020466, -0.159034, 0.176538, -0.583280, 0.165819, 0.186570, 0.072127, -0.267963, -0.087945, -1.469651, 0.242549, -0.110093, -0.075691, 0.037255, -0.172617, -2.222965, 0.098065, -0.444070, -0.414265, 0.006411, -0.511331, -0.975110, -2.060983, -0.125647, -0.076115, -0.205426, 0.130275, -0.045075, -0.291822, -0.207760, 0.089775, -0.208026, -0.433984, -0.270543, 0.334581, -1.018605, -0.449365, -0.138739, -0.130785, -0.150904, -0.304230, -0.195649, -0.542518, 0.021034, -1.576362, -0.004436, -1.703727, 0.028005, -0.364138, -0.256550, -0.488304, -0.290720, -0.110647, 0.035970, -0.041421, 0.002014, -0.187644, -0.104616, -0.402726, -0.905558, -0.505033, 0.013060]
-,        [-0.831831, -0.082317, -0.102764, 0.087534, -0.188434, -0.343047, -1.132113, -0.366781, -0.586504, -0.249436, -0.275907, -0.198725, -0.303296, 0.065148, -0.249616, -1.037059, -0.179360, 0.024344, -0.485554, 0.191794, 0.043190, 0.092638, -0.039506, -0.105017, -0.804464, -0.387722, -0.615806, -0.218309, -1.086830, -1.491580, -0.687121, -0.010019, -0.688151, -0.102200, -0.309486, -0.177604, -0.785203, -0.112499, -0.428708, -0.610387, -0.343956, -0.128923, -0.024550, -0.173263, 0.095939, -0.299337, -0.492250, 0.321571, -0.024575, -0.646625, 0.040049, 0.035315, -0.945323, -0.356947, 0.018895, 0.060330, -0.234308, -0.211850, -1.271692, 0.092443, -0.777966, -0.907805, 0.072313, -0.627779, 0.146220, -0.080013, 0.012367, -0.290369, 0.284806, -1.054876, -0.880391, 0.036634, -0.071281, -0.561373, -0.329053, -1.551174, 0.048085, -0.105230, -0.275017, -0.197642, -0.101131, -1.836487, -0.138279, -0.407571, -0.747656, -0.547474, -0.437068, -1.561088, -2.437590, -0.251922, -0.100979, -0.150035, -0.255211, 0.219903, -0.606251, -0.333795, 0.064354, -0.170918, -1.438227, -0.218979, -0.755291, -1.447002, -0.278284, 0.082482, 0.104130, 0.152350, -0.598940, -0.268285, -0.129348, 0.352572, -1.495625, -0.183954, -2.057171, -0.220162, -0.159017, 0.028093, -0.202006, -0.498098, 0.034861, -0.396081, -0.034177, 0.073441, -0.173300, 0.142955, 0.003221, -0.928636, -0.757198, -0.106043]
-,        [-1.183445, -0.036243, -0.270901, -0.236160, -0.000057, -0.131393, -1.575287, -0.220435, -0.803839, -0.577274, -0.741329, 0.067892, -0.266361, -0.338924, -0.228608, -0.895329, -0.252233, -0.398564, 0.051212, -0.073414, 0.015666, -0.207572, 0.065176, -0.033645, -0.348108, -0.116348, -0.549092, -0.735090, -0.943375, -1.867371, -1.996035, -0.111123, -0.810834, -0.039045, -0.712258, -0.096306, -0.863113, -0.061452, -0.359021, -0.803881, 0.045973, -0.535843, -0.095622, 0.076798, -0.063681, -0.551299, -0.236485, 0.069225, -0.310489, -0.408807, -0.336485, -0.162385, -0.549264, -0.084948, -0.014870, -0.203371, -0.200988, 0.031607, -1.168473, 0.097737, -0.822621, -0.807614, -0.078415, -0.556297, 0.082370, 0.034392, 0.148410, -0.303079, 0.000238, -0.762052, -0.315628, -0.082464, 0.131868, -0.265210, -0.411180, -1.340206, -0.063516, -0.427772, -0.253570, -0.205321, -0.016805, -2.350554, -0.011786, 0.052441, -0.240462, -0.331936, -1.092967, -1.934593, -2.534696, 0.105653, -0.482843, 0.008967, -0.653873, 0.056454, 0.098015, -0.411026, 0.060527, -0.298473, -0.944691, -0.517039, -0.447076, -1.769940, -0.420500, -0.163383, 0.225787, 0.344214, -0.738916, -0.052494, 0.057559, 0.034749, -1.283708, -0.566245, -1.858303, -0.064801, -0.269422, 0.048418, -0.378389, -0.469524, 0.111288, -0.421750, -0.232271, 0.188863, -0.109319, -0.274693, -0.037013, -1.315774, -0.506460, -0.183764]
-,        [-0.449405, 0.114339, -0.180431, -0.082322, 0.209050, -0.164244, -0.849676, -0.090341, -0.259331, -0.342760, -0.051108, -0.002207, -0.095767, 0.136565, 0.176868, -0.326590, 0.099196, 0.173488, -0.477496, 0.143665, -0.071788, 0.211413, -0.037711, -0.020669, -0.016611, 0.226441, -0.195153, 0.046870, -0.667176, -1.279535, -0.117397, -0.001843, -0.198452, 0.181075, 0.028259, 0.168380, -0.057083, -0.103804, -0.220562, 0.251627, -0.092519, -0.155292, 0.085193, 0.202563, 0.015246, 0.153596, 0.148799, 0.032264, 0.015056, -0.361584, -0.019830, -0.311548, -0.177017, -0.132683, 0.144337, -0.113359, -0.016861, -0.158131, -0.674653, -0.099783, -0.286875, -0.525469, 0.125414, 0.179508, -0.017726, -0.157865, 0.070477, 0.026907, 0.131997, -0.157015, -0.275920, -0.131763, -0.037619, -0.256085, 0.087524, -1.354401, 0.171830, -0.004480, -0.152682, -0.116144, 0.086910, -1.176894, 0.160203, -0.004826, -0.396845, -0.072742, -0.215704, -0.444331, -1.688693, 0.082989, 0.087092, -0.051009, -0.026736, -0.140793, 0.113024, -0.052534, 0.113667, -0.183035, -0.430578, -0.193038, 0.056015, -0.638397, -0.345481, -0.007740, -0.002121, -0.067540, -0.258340, 0.087547, 0.259976, 0.020744, -1.093203, -0.116713, -0.694168, -0.369340, -0.347689, 0.170731, -0.082421, -0.371326, 0.133396, -0.477516, 0.046712, 0.108890, 0.147745, -0.083649, -0.438305, -0.550631, -0.101879, -0.232142]
-,        [-1.626999, -0.087316, -0.245697, -0.171688, -0.119870, -0.351486, -1.545662, -0.804647, -0.354636, -0.381739, -0.364801, -0.073950, -0.157778, -0.349272, -0.085727, -0.536363, -0.497113, 0.110080, -0.806103, 0.344052, 0.037056, 0.075358, -0.208598, 0.102318, -0.390875, -0.250696, -0.479873, -0.560055, -1.001259, -1.295550, -0.762820, -0.323857, -0.240459, 0.137594, -0.202080, 0.217326, -0.498794, 0.050240, -0.136228, -0.606882, 0.139574, -0.734344, -0.038595, -0.110309, -0.214355, -0.083390, -0.606992, 0.021751, -0.534322, -0.059476, -0.303298, 0.001115, -0.717806, -0.190688, -0.152692, 0.080435, 0.095939, -0.129067, -1.265561, -0.010151, -0.610767, -0.506810, 0.134657, -0.165845, 0.040754, 0.119768, -0.323313, 0.031107, -0.342612, -1.066314, -0.187742, 0.118411, 0.046466, -0.152862, -0.129767, -1.614876, 0.197753, -0.336894, -0.225010, 0.148289, -0.026659, -2.384467, 0.094295, -0.663687, -0.361715, 0.106055, -0.753442, -1.602791, -1.705875, -0.064198, -0.069216, 0.226439, -0.723849, -0.132988, -0.140480, -0.182648, -0.094353, -0.393868, -1.075402, -0.425107, -0.066280, -1.211184, -0.315940, -0.194763, 0.103890, -0.263410, -0.219481, 0.027023, -0.576141, 0.207852, -1.194152, -0.639567, -1.630898, -0.024559, -0.326042, -0.392777, -0.120062, -0.714523, 0.079047, -0.482824, -0.176089, -0.051520, -0.146479, -0.022596, -0.170552, -0.623338, -0.324407, -0.080935]
-,        [-0.877383, -0.078040, -0.381556, -0.057647, -0.195397, -0.085729, -0.751127, -0.420914, 0.110164, -0.411152, -0.438196, 0.330333, -0.020845, -0.054455, -0.090036, -1.144708, -0.009780, 0.099930, -0.173590, -0.106545, -0.219762, 0.061104, -0.085200, 0.074124, -0.510731, -0.214259, -0.071746, -0.516396, -0.787469, -1.770082, -0.671669, 0.010626, -0.031130, 0.093372, -0.728263, -0.034555, -0.136760, -0.052020, -0.150401, -0.602891, -0.041325, -0.276691, -0.081416, -0.155436, -0.096352, 0.024341, -0.478458, 0.056723, 0.267163, -0.256677, -0.114649, -0.116958, -0.352381, -0.011705, -0.140006, 0.000777, 0.192052, 0.053078, -0.683809, -0.009598, -0.713088, -0.989348, 0.280430, -0.420048, -0.115020, 0.055035, 0.014598, -0.220904, -0.005243, -0.551266, -0.460364, 0.162635, -0.134006, 0.263742, -0.111239, -1.497498, -0.190832, -0.305565, 0.080664, 0.134630, -0.017427, -1.971882, -0.181156, -0.130784, -0.231594, -0.255785, -0.184737, -1.797036, -1.393406, -0.062835, -0.110343, -0.073380, -0.125313, -0.274702, -0.322627, 0.159045, -0.007697, -0.210542, -0.498922, -0.119212, -0.226539, -1.143358, -0.502663, 0.246799, 0.002910, -0.233608, -0.362683, -0.042058, -0.258806, 0.192999, -1.539964, -0.393336, -1.650994, -0.036500, -0.395846, -0.020610, -0.604686, -0.440522, 0.074624, 0.090487, -0.016242, -0.143274, -0.302079, 0.007556, 0.578254, -1.130617, -0.219593, -0.238339]
-,        [-0.881669, -0.048560, -0.213502, -0.065950, -0.152555, -0.101000, -1.591186, -0.141577, -0.480189, -0.371032, -0.262371, -0.248363, -0.540886, -0.279646, -0.213628, -1.286960, -0.291146, -0.024702, -0.207423, 0.263984, -0.179797, -0.118997, 0.047183, -0.053088, -0.753267, -0.318647, -0.319978, -0.640076, -0.479347, -1.357912, -0.623279, -0.114514, -0.163866, -0.042956, -0.343014, -0.006029, -0.508579, 0.044542, -0.483624, -0.598909, -0.036989, -0.225885, 0.146956, -0.140596, -0.123964, -0.151584, -0.347274, 0.069268, -0.326485, -0.553470, -0.129547, 0.092696, -0.465469, 0.018471, -0.198672, 0.039370, 0.051228, -0.171126, -1.004432, 0.010259, -0.235490, -1.240596, -0.213804, -0.215645, 0.022738, 0.065578, 0.245019, -0.115317, -0.417933, -0.167202, -0.684370, -0.355573, -0.168464, -0.049556, 0.068428, -1.359251, -0.053283, -0.287530, -0.167154, 0.002943, 0.088230, -2.052840, 0.091115, -0.320616, -0.299910, -0.431284, -0.421657, -1.830588, -2.050480, 0.067464, -0.152268, 0.180471, -0.104682, -0.024478, -0.224407, -0.083359, -0.147398, -0.278199, -1.107826, -0.184052, 0.176028, -1.652311, -0.557277, 0.110247, 0.125114, -0.413198, -0.417790, -0.232750, -0.442292, -0.080464, -1.490476, -0.064569, -1.319894, 0.056742, -0.324566, -0.180816, -0.370530, -0.562606, 0.122794, -0.495485, -0.277389, 0.207503, -0.138886, -0.103964, -1.025113, -0.713071, -0.165414, -0.185664]
-,        [-0.851328, -0.073519, -0.495109, 0.002429, -0.212731, 0.214159, -1.073892, -0.726912, 0.192055, -0.612208, -0.405595, 0.105727, -0.079192, -0.006669, -0.266896, -0.689748, -0.093921, 0.053356, 0.008805, 0.025230, -0.059210, 0.191750, -0.153948, 0.151543, -0.730129, -0.059885, -0.567617, -0.138686, -1.280319, -1.319706, -0.730500, -0.348680, -0.509802, 0.005250, -0.320223, 0.004683, -0.607872, -0.122331, -0.424915, -0.413469, -0.364413, -0.221337, 0.075438, -0.029911, -0.294830, -0.180042, -0.041241, -0.060566, -0.257411, -0.063109, -0.148910, 0.190993, -0.520670, -0.238072, -0.052233, -0.014445, -0.263635, -0.196156, -0.795119, -0.108623, -0.340934, -0.942248, -0.081505, -0.585718, -0.242544, -0.079610, 0.042016, -0.055346, -0.157640, -0.060996, -0.291327, -0.030640, 0.148234, -0.189486, -0.181208, -1.029677, -0.084323, 0.032378, -0.077516, -0.271671, -0.025229, -1.478662, 0.039320, 0.038253, -0.311321, 0.258505, -0.480939, 0.112776, -1.386264, -0.054234, -0.359369, 0.208400, -0.009766, 0.089381, -0.081983, -0.201115, 0.090208, -0.260842, -0.758852, -0.115877, -0.431881, -0.882083, -0.139485, -0.175344, 0.079056, -0.658307, -0.315524, -0.087554, 0.112935, 0.072262, -1.408337, -0.339537, -1.351575, -0.057247, -0.317150, -0.005421, -0.654190, -0.367294, 0.191038, -0.274811, -0.256000, -0.143398, 0.221990, 0.175337, 0.226613, -0.787494, -0.195075, -0.023928]
-,        [-0.109064, 0.041693, 0.172128, 0.073966, -0.094220, -0.070762, -0.088662, -0.034517, 0.045466, -0.297543, -0.145246, -0.138786, -0.038540, 0.009912, -0.128422, 0.023082, -0.021881, 0.013990, 0.036636, 0.056934, -0.057143, -0.076086, 0.062709, -0.025714, 0.056041, 0.208621, -0.163216, -0.280257, -0.112618, -0.219633, 0.042630, -0.016469, -0.172552, -0.093422, 0.109604, -0.090053, -0.098850, 0.098845, 0.205762, 0.169345, 0.088797, -0.125556, -0.123854, 0.080244, 0.042969, -0.086528, 0.192970, 0.036814, 0.227537, 0.092536, 0.101754, -0.063637, -0.186038, 0.212557, -0.122552, 0.062053, 0.018963, 0.041848, -0.306082, 0.104431, 0.060594, -0.071848, 0.138073, -0.043791, -0.100918, -0.237754, -0.145950, 0.108198, -0.293657, 0.125773, -0.159353, 0.025985, -0.040867, -0.113606, -0.144087, 0.070610, -0.054017, 0.240986, 0.093550, -0.003589, 0.133789, -0.210456, 0.029127, 0.077559, -0.098798, 0.069603, 0.139769, -0.257221, -0.231467, 0.095719, 0.089426, 0.164816, -0.031465, 0.058914, -0.085651, 0.033846, 0.116235, -0.077580, 0.124579, -0.096452, -0.090884, -0.151345, -0.014344, -0.059561, -0.044937, 0.080579, -0.047108, 0.124499, 0.121549, 0.152700, 0.009085, -0.074193, -0.083185, -0.061911, 0.384383, 0.156966, -0.249421, 0.016383, -0.169586, -0.094844, 0.195645, -0.017895, 0.022030, 0.066091, 0.225199, -0.022245, 0.196460, 0.092480]
-,        [-1.418024, -0.222587, -0.470369, 0.088041, -0.472962, -0.126613, -1.784576, -1.033004, -0.848074, -0.261800, -0.859143, 0.164518, -0.104634, -0.057822, -0.026203, -0.987057, -0.640125, -0.124569, -0.028452, 0.034170, 0.159362, 0.029462, 0.248149, 0.124316, -0.590325, -0.094096, -0.537544, -0.430996, -0.734848, -2.212407, -0.697803, -0.184027, -0.450771, -0.616097, -0.380313, -0.222105, -0.066083, 0.018215, -0.455625, -0.978103, -0.195384, -0.492355, -0.106966, 0.047083, -0.217948, -0.030653, -0.016815, -0.009354, -0.228825, -0.406260, -0.016108, 0.140450, -0.656034, -0.237238, 0.076941, -0.146238, -0.021032, -0.052336, -0.905091, -0.027789, -0.756019, -0.682936, 0.272647, -0.299975, 0.150549, 0.036011, 0.149695, -0.157228, -0.170598, -1.611796, -0.469312, -0.121460, 0.221934, -0.259149, -0.175630, -1.724564, 0.107678, -0.201673, -0.038863, -0.187253, -0.225000, -2.459052, 0.084741, -0.357265, -0.354865, -0.153201, -0.435289, -1.800977, -2.345747, 0.044343, -0.119620, 0.017187, -0.206556, -0.219970, -0.031243, -0.136564, -0.092715, -0.082235, -0.939495, -0.222841, -0.265299, -2.048079, -0.380842, -0.152648, -0.051794, 0.020773, -0.850114, 0.016796, -0.169460, -0.112834, -1.408474, -0.105547, -1.606205, -0.212677, 0.099974, -0.013329, -0.341080, -0.831237, 0.176899, -0.321624, -0.101272, 0.072981, -0.349327, -0.275975, -0.286507, -0.304738, -0.617239, -0.210214]
-,        [-1.287176, -0.090610, -0.050379, 0.077480, -0.510471, -0.018786, -1.342925, -0.410217, -0.538182, -0.511793, -0.350584, -0.061638, -0.174805, -0.169452, -0.227932, -0.980020, -0.557497, -0.510119, -0.154131, 0.204060, -0.034531, 0.046556, -0.097435, 0.091500, -0.432819, -0.457335, -0.648844, -0.679301, -0.566105, -1.744973, -0.962063, -0.287787, -0.739643, 0.061734, -0.524620, 0.072790, -0.494388, -0.011091, -0.236431, -0.068808, -0.390481, -0.460807, 0.078160, -0.361437, -0.151310, -0.284600, -0.854099, -0.072969, 0.319621, -0.538722, -0.156122, -0.179027, -0.291189, -0.266770, 0.095037, -0.105174, -0.125728, -0.424635, -1.449431, -0.144667, -0.805253, -1.237765, -0.194838, 0.025215, -0.120526, -0.076721, -0.080927, 0.312384, -0.101093, -0.255158, -0.665231, 0.105084, -0.089213, 0.003336, -0.300173, -1.720364, 0.017282, -0.104539, -0.034542, -0.128563, 0.048115, -2.220323, 0.083548, -0.095811, -0.843656, -0.082808, -0.847266, -1.940252, -2.153684, 0.083243, -0.220937, -0.133451, -0.208636, -0.094110, -0.328767, -0.244874, 0.003217, 0.190323, -0.715228, -0.253463, 0.035677, -1.843678, -0.264066, 0.009130, 0.086185, 0.124994, -0.706485, -0.060778, -0.431685, -0.357088, -1.283648, -0.149654, -1.171552, 0.147918, -0.214319, 0.034012, -0.327041, -0.771783, 0.045162, -0.734483, -0.122479, 0.107020, -0.164667, 0.170476, -0.003741, -0.874697, -0.321297, -0.341199]
-,        [-1.257102, -0.001411, -0.531543, 0.192850, 0.195104, -0.092959, -1.341382, -0.687269, -0.778754, -0.698622, 0.166253, -0.138785, 0.003735, -0.139918, -0.482052, -1.161751, -0.276962, -0.206063, -0.067410, 0.095340, 0.061155, -0.056874, -0.092809, 0.051636, -0.006859, -0.258735, -0.814630, -0.322295, -1.061247, -1.344473, -1.352385, -0.146275, -0.281288, -0.308274, -0.268520, 0.219428, -0.520216, 0.047566, -0.807722, -0.425958, -0.144822, -0.689787, -0.002379, -0.141071, 0.057823, -0.392555, -0.273445, -0.059035, -0.068789, -0.290875, -0.140484, -0.339441, -0.875321, -0.183917, -0.178795, -0.051453, -0.019446, 0.314016, -0.771545, 0.138434, -0.824644, -0.942537, 0.107220, -0.134102, 0.129662, 0.068976, 0.027617, -0.297967, 0.028432, -0.079318, -1.020370, -0.191663, 0.207649, -0.134126, -0.114531, -1.498021, -0.054869, -0.194418, -0.123342, -0.061502, 0.134230, -2.746682, -0.220805, -0.332703, -0.844224, -0.118491, -0.500877, -2.100297, -2.065443, 0.093182, -0.210698, -0.205060, -0.122162, -0.100202, -0.081959, -0.264642, 0.001699, -0.146457, -0.910707, -0.242731, -0.197367, -2.263575, -0.626912, -0.122479, -0.017992, 0.104409, -0.195227, -0.092705, -0.727861, -0.062331, -1.456126, -0.367450, -1.553893, -0.080635, -0.161219, 0.137060, -0.794216, -0.696048, 0.021988, -0.514888, -0.023437, -0.156022, -0.093263, 0.090804, -0.652255, -0.897761, -0.658351, -0.318809]
-,        [-1.553559, -0.221649, -0.366297, -0.048921, -0.184032, -0.123397, -1.468617, -0.313225, -0.253670, -0.126758, -0.537659, -0.225719, -0.619610, -0.367506, -0.232443, -0.369056, -0.856607, 0.274595, 0.064773, -0.101735, -0.089045, 0.177185, 0.069067, 0.195445, -0.733272, -0.130177, -0.362751, -0.431744, -1.353259, -1.307036, -0.731435, -0.464943, -0.367971, -0.157640, 0.048481, -0.195194, -0.442818, 0.055492, -0.510630, -0.761721, -0.227936, -0.598074, -0.079603, -0.064791, -0.271735, -0.184773, -0.088537, -0.088366, -0.299542, 0.134259, 0.051574, 0.117560, -0.484403, -0.301795, -0.028033, -0.051944, -0.125983, 0.065927, -1.116737, 0.127158, -0.273991, -0.714143, 0.006037, 0.270691, 0.049790, 0.056154, -0.187789, -0.409055, -0.003803, -1.018541, -0.906692, -0.233346, -0.145320, -0.097551, -0.087654, -1.233358, 0.018234, -0.191777, 0.082190, -0.382499, 0.026906, -2.053227, 0.138009, -0.683321, -0.430875, -0.253697, -0.263400, -1.432926, -1.934446, 0.002576, -0.085719, -0.237302, -0.808599, 0.168790, 0.215702, -0.336763, 0.071532, -0.150198, -1.002707, -0.218867, -0.161459, -0.950449, -0.754857, -0.225928, 0.135457, -0.153776, -0.246555, -0.204645, -0.256900, -0.096992, -1.272238, 0.199951, -2.186738, 0.044345, -0.003347, 0.443492, -0.182224, -0.205989, -0.159197, -0.238612, -0.073557, -0.094365, 0.113236, -0.170587, -0.570144, -0.446899, -0.303791, -0.333608]
-,        [-0.989479, -0.002214, -0.205714, -0.069014, -0.145553, -0.316604, -0.837563, -0.594061, -0.496744, 0.049252, -0.791097, -0.082477, 0.001035, 0.061280, -0.176891, -0.586447, -0.370092, -0.091220, -0.101950, -0.005179, -0.140073, 0.045885, -0.085790, 0.030586, -0.422940, -0.137997, -0.543664, -0.260069, -0.902405, -1.858192, -1.271384, 0.106470, -0.095954, 0.164437, -0.265229, -0.147306, -0.230633, -0.070906, -0.269992, -0.444462, -0.221710, -0.347035, 0.261716, -0.010816, 0.149445, -0.165080, -0.134115, 0.008990, -0.137959, -0.018598, -0.335730, -0.030137, -0.591008, -0.075670, 0.039851, 0.023316, 0.135662, -0.177288, -1.036117, 0.265917, -0.755721, -0.667906, 0.083718, -0.517707, 0.073847, 0.052047, 0.184097, -0.160435, 0.030091, -0.829338, -0.435866, -0.138812, 0.050156, 0.008717, -0.288470, -1.400425, -0.240098, -0.374282, 0.123169, -0.071983, -0.019654, -2.681611, 0.160510, -0.292677, -0.269211, -0.325346, -0.169191, -1.845575, -2.282368, -0.104439, 0.299536, 0.008575, -0.021140, -0.288033, -0.189212, -0.175752, -0.059649, -0.226103, -0.845107, -0.342279, -0.186891, -1.347272, -0.688641, -0.276774, 0.056201, -0.106054, -0.513937, 0.263996, -0.211465, 0.348239, -1.280066, -0.196691, -1.568023, 0.075401, -0.272796, -0.139252, -0.537598, -0.266393, -0.165621, -0.412973, 0.053694, -0.144143, 0.101140, -0.001385, -0.153619, -0.834601, -0.392318, -0.329103]
-,        [-0.607664, -0.081165, 0.300748, -0.104022, 0.036269, 0.008683, -1.369282, -0.265972, -0.356469, -0.352091, -0.342507, -0.077740, 0.163436, 0.129012, -0.378637, -0.256142, 0.062282, -0.011072, -0.212098, 0.013335, 0.239463, -0.244053, -0.026906, 0.191739, -0.369967, -0.188679, -0.258371, 0.034990, -0.723125, -1.051563, -0.293923, -0.191861, -0.441121, -0.059067, 0.052252, -0.000376, -0.023709, -0.265182, -0.017605, -0.138705, -0.304384, -0.228646, -0.217210, 0.051680, 0.044889, -0.153191, -0.056567, -0.009574, -0.029597, -0.001215, -0.237815, -0.430701, -0.341846, -0.157285, -0.221917, -0.012213, -0.054850, -0.252929, -0.618458, -0.208201, -0.314673, -0.670833, -0.046629, -0.371346, 0.062370, 0.076363, -0.066115, -0.104216, 0.122408, -0.015599, -0.298106, -0.136028, -0.043214, -0.034426, -0.413344, -1.199994, -0.095548, -0.157881, -0.281531, 0.074457, -0.041670, -1.274669, -0.252679, -0.569968, -0.208394, -0.102902, -0.474878, -0.096753, -0.379023, 0.040309, -0.064346, 0.155226, -0.009627, -0.192248, -0.119404, -0.183234, -0.037825, -0.090716, -0.791397, -0.523222, -0.335598, -0.467226, -0.176999, -0.024960, 0.095010, -0.147611, -0.083095, -0.117265, -0.002747, 0.117046, -0.847159, 0.087601, -1.100208, 0.114661, -0.139930, -0.236532, -0.269447, -0.397052, 0.065893, 0.151020, -0.019289, 0.093450, 0.080434, -0.184868, -0.022978, -0.137181, -0.431950, -0.042592]
-,        [-0.064119, -0.173086, 0.034082, 0.028809, -0.200030, 0.018669, -0.637468, -0.133585, 0.069895, 0.235259, -0.089000, -0.124551, 0.010126, -0.195184, 0.178354, 0.061832, -0.060042, -0.032799, -0.179336, 0.010624, -0.117876, 0.243859, -0.131100, -0.064654, 0.253257, 0.030005, -0.170817, 0.041959, -0.068155, -0.877473, -0.089796, -0.196171, 0.062725, 0.021602, -0.068512, 0.002020, -0.065276, -0.103780, -0.057311, 0.083319, -0.040021, -0.018468, -0.048220, 0.160019, 0.032921, -0.188019, 0.026453, -0.048444, -0.265119, -0.120326, 0.018560, 0.035741, 0.061994, 0.087480, -0.053735, -0.233768, -0.005149, 0.011324, 0.080342, 0.108984, -0.017308, -0.216704, -0.167632, -0.186734, 0.075220, 0.119291, -0.105847, -0.231418, -0.079965, -0.119612, -0.108474, -0.018046, 0.054349, -0.174745, -0.005695, -0.695295, 0.120813, -0.024712, 0.079129, 0.101418, -0.026702, -0.372743, -0.057972, 0.175455, 0.064532, 0.036764, -0.257866, -0.180614, -0.746911, 0.015052, 0.232184, -0.171532, 0.049406, 0.048343, -0.177260, -0.065837, 0.171651, 0.067392, -0.041579, -0.014229, -0.032406, -0.519189, -0.361759, 0.410426, -0.079589, 0.021660, -0.281098, 0.026260, -0.016504, 0.005604, -0.282207, 0.092372, -0.181205, 0.140352, -0.475282, 0.113243, -0.188699, -0.084671, 0.155366, -0.154515, 0.015951, -0.124198, -0.099646, -0.034940, -0.362877, -0.253141, 0.161134, -0.064168]
-,        [-0.901818, -0.141015, -0.186993, -0.243589, -0.118332, 0.219002, -1.413844, -0.181335, -0.441646, -0.460204, -0.298282, -0.079175, -0.201126, -0.124809, -0.442360, -1.196514, -0.253332, -0.057128, -0.139265, -0.003330, -0.034478, 0.319685, 0.099295, -0.042995, -0.217385, -0.075635, -0.219468, -0.547125, -0.697558, -1.610704, -1.101898, 0.030671, -0.540609, -0.116055, -0.673301, -0.077979, -0.266998, -0.023253, -0.276204, -0.328571, -0.216485, -0.536631, -0.152454, -0.007439, 0.016398, -0.239730, -0.270693, 0.099221, -0.145334, -0.203306, 0.116158, -0.217545, -0.613901, -0.032646, -0.049013, -0.269895, -0.124071, 0.030618, -0.727913, 0.085716, -0.212220, -0.703930, 0.001582, -0.304244, 0.055914, -0.142995, 0.014634, 0.046398, -0.059028, -0.933253, -0.508427, 0.159179, 0.006785, 0.041900, -0.369641, -2.087464, -0.049877, -0.358126, -0.128650, -0.079385, -0.406454, -1.859214, -0.158767, -0.750587, -0.521194, -0.068519, -0.281944, -1.421774, -2.545150, -0.087413, -0.263649, -0.111525, -0.603043, -0.149780, -0.169703, -0.255009, -0.073409, -0.458334, -0.787080, -0.172426, -0.220713, -1.952877, -0.433253, -0.059821, 0.066907, -0.195275, -0.723034, 0.190234, 0.091008, 0.115355, -0.973112, -0.215393, -1.109725, 0.161236, -0.038486, 0.070997, -0.609775, -0.540019, -0.171550, -0.897245, -0.203195, -0.041912, -0.043398, 0.023616, -0.624914, -0.741899, -0.336293, -0.007330]
-,        [-0.312862, 0.136314, -0.330465, 0.033117, -0.161191, -0.072533, -1.369894, -0.762443, -0.545892, -0.250472, -0.443905, 0.178155, -0.450724, 0.097196, -0.273207, -0.687276, -0.460599, -0.071556, -0.147400, 0.067143, -0.026040, -0.111389, 0.115626, -0.021857, -0.465823, 0.146956, -0.415352, -0.311390, -0.997717, -1.724413, -0.257284, -0.113524, -0.718502, -0.241657, -0.311410, 0.186355, -0.380461, -0.188854, -0.170299, -0.773671, 0.203160, -0.192563, -0.061057, -0.065922, -0.092844, -0.241562, -0.371879, 0.225782, 0.058800, -0.120381, -0.143114, 0.130080, -0.087032, 0.002201, -0.143610, 0.053206, 0.065638, -0.094554, -1.317885, 0.255434, 0.020603, -1.056261, 0.004982, -0.146435, 0.024166, -0.005767, -0.042666, -0.133382, -0.097703, -1.061066, 0.162205, 0.162118, 0.017146, -0.037399, -0.444812, -1.181614, -0.149003, -0.036125, -0.090102, -0.189605, -0.073256, -1.262672, -0.031030, -0.603241, -0.505492, 0.277048, -0.501872, -1.137138, -1.737521, 0.105420, -0.120545, -0.071399, -0.039940, 0.085168, 0.040525, -0.434236, 0.015819, 0.188696, -0.776034, -0.146747, -0.225156, -1.665811, -0.418099, 0.134726, 0.105953, 0.147573, 0.155275, 0.028521, -0.304178, -0.158638, -0.989537, -0.385015, -1.279950, -0.253502, -0.499342, 0.091172, -0.327524, -0.534646, 0.233579, -0.483743, -0.250860, 0.013792, -0.017494, -0.131580, -0.670884, -0.457613, -0.568134, 0.087021]
-,        [-0.620977, 0.020942, -0.591125, -0.033951, -0.114862, -0.033335, -1.054438, -0.664983, -0.343880, -0.470238, -0.174595, -0.070414, -0.165080, -0.236684, 0.015463, -1.063060, 0.039280, -0.257260, -0.440003, -0.025988, 0.095748, -0.006784, 0.018035, -0.094216, -0.155472, -0.099508, -0.430502, -0.426782, -0.846907, -1.933009, -0.268079, 0.136397, -0.281620, 0.070757, -0.309728, 0.023508, -0.482606, 0.066558, -0.069035, -0.411094, -0.363099, -0.783502, 0.186652, -0.003143, -0.122063, 0.062690, -0.576342, -0.022884, -0.127062, -0.253038, -0.077004, -0.170034, -0.335627, -0.115558, -0.214509, 0.183437, -0.009751, 0.004145, -0.590093, 0.081981, -0.284942, -0.886838, 0.036076, -0.099457, -0.132897, -0.227956, 0.015252, -0.126894, 0.105177, -0.312948, -0.081024, 0.108118, -0.300158, -0.037377, -0.403620, -1.395752, -0.103507, -0.410489, 0.013207, -0.269604, 0.002892, -2.446540, -0.015260, -0.175755, -0.193316, -0.106029, -0.428165, -2.032438, -2.655916, 0.176624, -0.033360, 0.054828, -0.246589, -0.144871, -0.127201, -0.246792, -0.238851, -0.018604, -0.667383, -0.017459, -0.076653, -1.898071, -0.275216, 0.147753, 0.121407, -0.150694, -0.677472, -0.043678, 0.191012, 0.015512, -1.865755, -0.120142, -1.717439, 0.131272, -0.633392, -0.194067, -0.318349, -0.061713, 0.111925, -0.232532, -0.303679, -0.020179, -0.011795, -0.144064, -0.743118, -1.217974, -0.283366, -0.438353]
-,        [0.178859, -0.150839, 0.053943, -0.256094, 0.168971, -0.182784, 0.159289, 0.122123, -0.057685, 0.090492, -0.072617, 0.001281, -0.030581, -0.050631, 0.180311, -0.261751, 0.029510, 0.035530, 0.138314, 0.026162, 0.066967, 0.073091, -0.019252, -0.125005, 0.206957, 0.042228, 0.015753, 0.220575, 0.253350, -0.506725, -0.050272, 0.101326, 0.005989, -0.045534, -0.017085, 0.105088, 0.302372, 0.050523, 0.148003, 0.069541, 0.051759, 0.174316, -0.112874, -0.023326, 0.161609, 0.005183, -0.168268, 0.051059, 0.163129, -0.072434, 0.087928, 0.058380, -0.093580, -0.161412, -0.064275, 0.025365, 0.028649, 0.078446, -0.089085, 0.202601, 0.208291, 0.105872, -0.003163, 0.296054, -0.052782, -0.237975, -0.133454, 0.051700, -0.127586, -0.065084, 0.036030, -0.035329, 0.218216, 0.046720, 0.060056, -0.288867, 0.222095, -0.161723, 0.112294, 0.004138, -0.004622, -0.313272, -0.244282, 0.081228, 0.176895, -0.023710, 0.270578, 0.096937, 0.350578, 0.032927, 0.031561, 0.008479, -0.402018, -0.040566, 0.033350, 0.028023, -0.160417, 0.016119, -0.109419, -0.198606, 0.172675, -0.008153, -0.206256, 0.110250, -0.034629, 0.087559, 0.036069, -0.242873, 0.015273, 0.124244, -0.008114, 0.318955, -0.394321, 0.147697, -0.283973, 0.030574, -0.048989, 0.075101, -0.068141, -0.331215, 0.002279, 0.148408, 0.110975, 0.086788, 0.226468, 0.037291, -0.020933, -0.070487]
-,        [-0.154447, 0.139714, 0.238843, -0.112852, 0.150815, -0.165040, 0.001594, -0.260609, 0.192546, -0.010092, -0.085778, -0.063065, -0.042651, -0.041313, 0.010444, -0.049059, -0.132037, 0.129999, -0.128391, 0.099130, 0.032848, -0.023157, 0.065695, -0.097118, 0.158680, 0.081402, -0.064331, -0.100696, -0.453518, -0.235227, -0.039158, 0.232401, -0.030526, 0.064664, -0.080894, -0.052734, -0.118897, -0.217231, 0.164344, 0.072307, -0.397593, -0.148206, -0.081966, -0.146973, 0.046351, -0.171401, -0.076728, 0.113908, -0.029981, -0.118615, -0.199628, -0.074551, -0.066171, -0.086432, -0.222684, 0.019012, 0.037323, -0.151957, -0.093793, -0.023626, -0.065309, -0.224427, -0.022122, -0.314788, -0.047856, -0.012676, 0.020290, -0.115280, -0.061485, 0.102486, 0.080425, -0.030164, -0.101276, -0.046481, -0.509305, -0.996063, 0.256521, -0.328476, 0.015958, -0.126129, -0.201932, -0.509104, 0.232616, -0.120959, 0.152549, -0.093327, -0.050806, -0.013984, -0.420806, -0.048773, 0.079539, -0.201712, -0.362458, -0.047019, 0.211918, 0.024975, -0.038917, 0.082571, -0.103499, 0.296816, 0.136437, -0.298112, -0.127742, -0.006303, -0.049625, -0.089250, -0.003254, 0.062808, -0.151730, -0.058273, -0.099271, -0.106703, -0.193795, -0.073709, -0.122151, 0.108841, -0.051922, -0.127074, 0.027138, -0.433490, 0.194141, -0.146906, -0.091822, 0.245983, -0.036211, -0.148170, 0.313771, -0.090076]
-,        [-0.020714, 0.003461, 0.023210, 0.038968, -0.275491, -0.129867, 0.007724, 0.225943, 0.036614, -0.016284, 0.366192, 0.048745, 0.253925, 0.158039, 0.130049, -0.551476, -0.182661, 0.073006, 0.000467, -0.171358, -0.041659, -0.133612, 0.142126, 0.119707, -0.019724, -0.091790, 0.157454, -0.086995, -0.051638, 0.063468, 0.086137, -0.113102, 0.091896, -0.101446, -0.005527, -0.217901, -0.412761, -0.045466, 0.045924, 0.204479, 0.139115, 0.027815, 0.154746, -0.099399, 0.169529, -0.002481, 0.161046, -0.242626, 0.075699, -0.163015, -0.197190, -0.149924, 0.079047, 0.181368, -0.030633, -0.055253, -0.117983, 0.224022, -0.087482, 0.033996, 0.121042, 0.145549, -0.156361, 0.079896, -0.086988, 0.258502, 0.034747, -0.064120, -0.062192, -0.140084, 0.026496, -0.289483, 0.154418, -0.215176, -0.276514, -0.085507, -0.017734, 0.091378, 0.092121, -0.093816, 0.049436, -0.064778, -0.216681, 0.079368, 0.079225, -0.019386, -0.002031, -0.128312, -0.196677, 0.085821, 0.168472, 0.014704, -0.127656, -0.275636, 0.031650, 0.138048, 0.119470, -0.096548, 0.114234, -0.097698, 0.301920, -0.203800, 0.048183, 0.063209, 0.178311, 0.051331, 0.065248, 0.010637, 0.164633, -0.064576, 0.181325, 0.066345, 0.098723, -0.006503, -0.299132, -0.140471, 0.069876, 0.060105, -0.173885, -0.046894, -0.044546, 0.114625, 0.107640, 0.103025, -0.111192, -0.030185, 0.110287, -0.022842]
-,        [-0.131195, -0.032398, -0.232282, -0.125893, -0.032684, -0.285717, -0.328384, -0.496607, -0.039080, -0.075881, 0.076419, 0.053887, 0.173361, -0.107664, -0.171898, -0.429690, -0.335441, 0.026612, -0.463198, -0.001245, -0.125224, -0.170086, 0.057989, 0.095819, -0.016638, 0.298611, 0.064687, -0.118598, -0.103049, -0.176070, -0.000047, -0.132259, -0.277272, -0.392913, 0.000097, -0.024766, 0.066353, -0.044345, -0.155768, 0.231684, -0.015240, -0.104499, 0.234842, 0.068033, -0.123354, 0.000905, -0.238384, 0.041835, -0.162842, -0.088314, 0.047849, -0.028043, 0.250221, -0.056305, -0.320409, 0.053081, 0.016054, -0.410431, -0.205548, 0.272543, -0.169486, -0.100448, 0.127782, -0.028379, 0.082691, -0.020398, -0.248642, 0.132887, 0.095027, 0.133169, -0.239352, -0.104132, -0.033319, -0.212663, 0.075468, -0.639298, -0.019337, -0.178695, 0.071707, 0.032741, -0.014982, -0.749279, 0.040220, 0.166067, -0.256971, 0.028583, -0.296861, -0.687573, -0.348138, -0.266965, -0.015752, -0.111999, -0.015642, -0.144309, 0.020240, -0.035354, 0.144148, -0.060292, 0.071239, -0.260035, -0.319599, -0.471380, -0.238990, -0.018995, 0.009522, -0.430633, -0.115325, 0.047680, 0.265239, 0.093041, -0.229251, -0.006711, -0.929640, 0.149527, -0.452444, -0.018921, 0.217259, 0.099508, 0.199450, -0.337418, 0.246661, -0.010786, -0.162951, -0.036654, -0.093279, -0.247168, 0.023316, 0.059302]
-,        [-1.039113, 0.228278, -0.330955, -0.156513, 0.026157, 0.042799, -1.424525, -0.583181, -0.039631, -0.022041, 0.051390, -0.011666, -0.191215, -0.108654, 0.118970, -1.260246, -0.020832, -0.219638, -0.300142, 0.033242, -0.009631, -0.056823, 0.237797, -0.069602, -0.437198, -0.316016, -0.122928, -0.261959, -0.963010, -1.541677, -0.796063, -0.087012, -0.864873, -0.141603, -0.121521, 0.116360, -0.653833, -0.064276, -0.373146, -0.545253, 0.049990, -0.755257, -0.412828, 0.178941, -0.103493, 0.084285, -0.277873, -0.036314, -0.062815, -0.392495, -0.019005, 0.205567, -0.626457, -0.082414, -0.201804, 0.012665, 0.032621, -0.329504, -0.715498, 0.234371, -0.545781, -0.487229, -0.146937, -0.480944, -0.086832, -0.044920, -0.149380, 0.197139, 0.056870, -0.242221, -1.004881, -0.148922, -0.016357, 0.206650, -0.097219, -1.637003, 0.147449, -0.060635, -0.066656, -0.145663, 0.099528, -2.824703, 0.092513, -0.132206, -0.176142, 0.233790, -0.520261, -1.971682, -2.546704, -0.249702, -0.109915, -0.023682, 0.247911, -0.040212, -0.111684, -0.531220, -0.065191, -0.155378, -0.789564, -0.043394, 0.075176, -1.777138, -0.368751, -0.046157, -0.067608, -0.083447, -0.469472, 0.022645, -0.033610, -0.196527, -1.233886, -0.323130, -1.280568, 0.111229, -0.130822, -0.013344, -0.104630, -0.556895, -0.223063, -0.285533, -0.099953, 0.005993, 0.041507, 0.106433, 0.127939, -1.410071, -0.603685, -0.155070]
-,        [-1.622663, 0.102702, -0.822566, -0.173331, 0.119374, -0.067712, -1.643013, -0.461686, -0.251420, -0.521150, 0.182732, -0.173240, -0.585371, 0.029518, 0.093401, -0.827661, -0.361308, -0.072466, 0.071328, -0.104115, -0.110889, -0.122560, 0.052645, 0.073713, -0.225217, -0.302672, -0.397339, -0.487122, -1.243075, -1.073732, -0.943122, -0.036379, -0.645105, -0.431178, -0.430872, -0.027220, -0.410726, -0.112950, -0.287014, -0.870147, -0.166829, -0.960039, -0.058041, 0.158591, -0.055690, -0.139292, -0.534333, 0.123305, -0.440124, -0.267758, -0.021578, 0.025746, -0.686129, -0.143383, -0.272456, -0.274984, -0.316363, 0.024004, -1.258381, -0.014021, -0.270205, -1.016693, 0.074334, 0.193616, -0.310975, 0.203985, 0.210259, 0.161594, -0.050547, -0.574861, -0.769222, -0.151835, -0.496446, -0.067429, -0.212410, -1.793721, 0.169132, 0.040380, 0.037050, -0.108813, -0.310581, -2.116465, -0.060758, -0.319512, -0.613947, 0.012114, -0.811736, -2.043928, -2.156103, -0.067407, 0.048456, -0.115354, -0.321227, -0.009721, -0.154404, -0.684627, 0.163323, -0.307219, -0.635510, -0.598083, -0.447384, -1.824455, 0.076285, -0.103312, 0.015877, -0.043319, -0.812164, -0.015684, -0.485322, 0.054741, -1.317927, -0.439998, -1.661120, -0.160840, -0.343232, -0.444305, -0.597692, -0.545862, -0.012349, -0.491642, -0.071957, -0.139948, 0.013686, 0.225829, -0.246244, -0.601331, -0.348557, -0.319609]
-,        [-1.152890, -0.090754, 0.153650, -0.166575, -0.049646, -0.289853, -1.810723, -0.673297, -0.006300, -0.189100, -0.961181, 0.177828, -0.026097, -0.074436, -0.226071, -1.044142, -0.467243, 0.119488, -0.031295, 0.007057, -0.080054, -0.017002, 0.092718, 0.166885, -0.379700, 0.008195, -0.489226, -0.254352, -1.310396, -1.790037, -1.509171, -0.115223, -0.791572, 0.149458, -0.103080, 0.190305, -0.490966, -0.189391, -0.258131, -0.298177, -0.203843, -0.289768, -0.210772, -0.125699, -0.050321, -0.070082, -0.658106, -0.031925, 0.110600, -0.485671, -0.233911, 0.009477, -0.338209, -0.081583, -0.073451, -0.275843, -0.024163, 0.045501, -0.810293, 0.044591, -0.277668, -0.624786, 0.166889, -0.236937, 0.052433, -0.024054, -0.025344, -0.252540, 0.039306, -1.409863, -0.912843, -0.019371, -0.316036, 0.050742, -0.023300, -1.643922, -0.013820, -0.102022, -0.252472, -0.289621, -0.129275, -2.488462, -0.009812, -0.254430, -0.085850, -0.166220, -0.770287, -1.794679, -2.196900, 0.196114, -0.249011, 0.075746, -0.027368, -0.121842, -0.095150, 0.146165, 0.227213, 0.210338, -0.940203, -0.794089, -0.109333, -1.599076, -0.294929, 0.100684, -0.047073, -0.267295, -0.282552, 0.000324, 0.239010, -0.189068, -1.007142, -0.406840, -1.729293, 0.346714, -0.317050, -0.241154, -0.073047, -0.265940, 0.029434, -0.429183, -0.222454, 0.176966, -0.223467, 0.127042, -0.208413, -0.845678, -0.148611, -0.114458]
-,        [-1.282983, 0.022196, -0.215295, 0.000161, 0.235912, -0.019186, -1.648683, -0.304700, -0.012309, -0.396260, 0.187911, -0.034225, -0.051861, 0.186458, -0.550412, -1.600707, -0.159497, -0.021598, -0.429468, 0.294375, -0.037215, -0.070106, -0.236349, 0.035989, -0.336987, -0.139142, -0.401820, -0.257766, -0.906846, -1.698825, -0.851046, 0.012824, -0.103183, -0.021939, 0.042307, -0.106488, -0.791285, -0.067228, -0.485209, -0.428410, -0.123672, -0.157144, 0.256969, -0.046513, 0.031657, -0.043623, -0.621531, -0.274212, -0.321907, -0.312506, -0.023881, 0.052481, -0.442811, -0.112390, -0.122733, -0.143412, 0.219022, 0.019230, -1.034762, 0.107275, -0.688987, -0.946973, -0.108323, -0.045191, -0.179851, -0.031782, -0.052619, -0.523225, 0.088342, 0.153550, -1.104072, 0.129069, 0.158956, 0.066270, -0.218594, -1.229080, 0.041551, -0.195414, 0.102823, -0.132159, 0.080321, -2.795670, 0.062651, -0.215904, -0.167482, -0.392588, -0.429005, -1.353335, -2.823890, -0.161645, 0.096724, -0.235696, -0.255604, 0.095348, 0.064736, -0.274695, 0.067790, 0.162740, -0.486467, -0.079363, -0.418313, -1.702227, -0.318319, -0.001308, -0.060665, -0.087333, -0.585737, -0.024703, -0.173054, -0.177630, -1.786881, -0.022119, -1.317832, -0.055287, -0.577515, 0.033056, -0.359205, -0.262649, 0.002253, -0.776097, 0.160446, 0.268127, -0.191675, 0.034610, 0.011103, -0.931412, -0.388323, 0.323236]
-,        [-0.933399, -0.048348, -0.119418, 0.127879, -0.006813, -0.086181, -1.248091, -0.114744, -0.325609, -0.403536, -0.084048, -0.032723, -0.259317, 0.191356, -0.139791, -0.912589, -0.528831, -0.276442, -0.552605, 0.064273, 0.020181, -0.079608, -0.070038, 0.146785, -0.384866, -0.044698, -0.442298, -0.367859, -1.037370, -1.502924, -0.840060, -0.229448, -0.081870, 0.008958, -0.072123, -0.063230, -0.196534, -0.208432, -0.150486, -0.039130, -0.173857, -0.404100, -0.180270, -0.097098, -0.172939, -0.126096, -0.114324, -0.040999, -0.072488, -0.361864, -0.264767, -0.249460, -0.469952, -0.242010, -0.117003, -0.074354, 0.062514, -0.208953, -1.108630, -0.253636, -0.369936, -0.995308, 0.110581, -0.096802, 0.181250, 0.042110, -0.244040, 0.164808, 0.199622, -0.429810, -0.804475, 0.022233, -0.158488, 0.066264, -0.035096, -1.348374, 0.208863, -0.044440, 0.034798, -0.231497, -0.071507, -1.930548, -0.032120, 0.047689, -0.189833, -0.335354, 0.041416, -0.953173, -2.308453, -0.201154, 0.000287, -0.000168, 0.064867, -0.085120, 0.079476, -0.202439, 0.015968, -0.222555, -0.249497, 0.078125, -0.185115, -1.163580, -0.769978, -0.136167, 0.062020, -0.271910, -0.551243, -0.053145, 0.020937, 0.229894, -1.085748, -0.361876, -1.594522, -0.143696, -0.333610, -0.126452, -0.316629, -0.042229, -0.013892, -0.627457, 0.006467, 0.101585, 0.063620, -0.273813, -0.234608, -1.015571, -0.038644, -0.358327]
-,        [-1.534252, 0.150651, -0.493408, -0.084115, 0.259706, -0.518915, -1.558273, -0.235614, 0.051946, 0.126431, -0.293088, -0.099982, -0.063799, 0.000557, -0.100599, -0.509769, -0.465394, 0.062142, -0.749108, -0.072539, 0.047633, 0.051174, 0.045573, 0.036152, 0.042319, -0.228167, -0.764232, -0.162530, -1.268009, -1.848968, -0.892142, -0.100255, -0.630446, 0.152599, -0.582602, -0.229763, -0.784498, 0.003438, -0.277928, -0.558015, -0.242719, -0.987677, -0.168618, -0.513093, -0.051739, -0.043843, -0.371127, 0.006487, -0.391112, -0.244406, -0.022872, -0.321963, -0.465951, 0.152371, -0.241392, -0.208483, -0.010890, 0.005044, -1.132103, -0.247952, -0.666241, -0.621508, -0.114941, -0.034244, -0.099346, -0.214309, -0.045895, -0.434661, 0.421014, -1.189462, -0.424617, -0.044996, 0.210714, -0.016755, -0.325146, -1.881722, 0.016860, -0.211780, 0.048452, -0.239930, -0.055951, -2.373402, -0.025075, -0.431402, -0.506340, -0.435372, -0.497368, -1.424998, -2.481200, -0.057590, -0.349520, -0.018753, -0.262410, -0.173735, -0.118157, -0.430115, 0.102870, -0.381045, -0.565232, -0.314795, -0.435176, -0.791945, -0.738990, 0.037333, -0.046062, -0.050764, -1.277702, -0.337207, -0.311888, -0.037556, -1.288142, -0.626854, -1.558528, 0.262157, -0.637685, -0.019081, -0.252907, -0.194825, -0.292684, 0.166177, -0.220053, -0.078208, -0.118376, -0.068605, -0.560058, -0.728899, -0.525591, 0.098169]
-,        [-0.006725, -0.259550, -0.101202, 0.006066, 0.032826, -0.243608, -0.269157, -0.240181, -0.349513, -0.007818, 0.006872, -0.161094, -0.026326, 0.041118, -0.262335, -0.240093, -0.074959, -0.074250, 0.134217, -0.010968, 0.136096, 0.104989, 0.056079, -0.140278, -0.173063, -0.167103, -0.386437, 0.106979, -0.059018, -0.901908, -0.236364, 0.350352, -0.091566, -0.065347, -0.204744, 0.125318, -0.146245, -0.047421, -0.110839, -0.292643, 0.224590, 0.040883, 0.109512, 0.084135, -0.119706, -0.185081, -0.199884, 0.005257, 0.152867, -0.032198, 0.152554, -0.136138, -0.022681, -0.161236, 0.169115, 0.039861, 0.103847, 0.099962, -0.031312, -0.267594, -0.189784, -0.116456, -0.179429, -0.128727, -0.006996, -0.146243, -0.162125, 0.015592, -0.039781, 0.048589, 0.199044, -0.280687, -0.141111, -0.289393, -0.038221, -0.387753, 0.069811, -0.161416, 0.003762, -0.152503, 0.116110, 0.080189, -0.080101, -0.007186, 0.013933, -0.041861, -0.003556, -0.304890, -0.439994, -0.098295, 0.004822, -0.072895, 0.038872, -0.032945, 0.102011, -0.059463, 0.140849, -0.273324, 0.120411, -0.137137, -0.017549, -0.212596, -0.128352, -0.101665, 0.213051, -0.164958, -0.279532, -0.064015, 0.062656, 0.087329, -0.317612, -0.045135, -0.321621, 0.182181, -0.202233, -0.136790, -0.107227, 0.036489, 0.124782, 0.131301, 0.036457, -0.059215, 0.166166, 0.029271, -0.286296, -0.163278, 0.098016, -0.012891]
-,        [-0.027806, -0.001383, -0.103083, 0.338506, -0.167537, -0.044204, 0.106341, -0.123869, 0.057995, 0.267998, 0.175441, 0.281630, -0.059309, 0.162000, 0.069042, -0.163604, 0.164254, 0.191019, -0.043056, 0.259786, 0.081604, 0.040584, 0.058793, -0.065200, -0.004563, 0.180402, 0.069144, 0.040725, -0.089855, -0.177715, 0.147421, 0.065595, 0.070718, 0.193057, 0.007780, 0.073154, 0.075983, 0.213541, 0.190661, -0.002906, 0.061094, 0.186782, -0.025423, -0.082760, 0.102395, -0.141752, -0.204172, 0.236034, -0.138929, 0.197092, 0.204603, 0.027871, 0.010896, -0.100480, -0.200276, 0.008811, -0.140670, 0.090418, 0.211620, 0.258826, 0.098538, 0.172692, -0.071397, 0.069873, 0.136732, 0.016342, -0.166925, -0.108502, -0.058303, -0.009557, -0.103291, 0.020735, 0.068150, 0.000408, -0.189611, -0.084301, 0.146462, -0.171107, 0.172839, 0.287127, 0.006960, -0.045734, 0.044444, 0.197549, 0.176984, -0.034728, -0.003204, -0.250069, -0.053550, 0.097670, 0.187698, -0.058142, 0.214886, 0.036340, 0.151005, 0.060580, -0.072059, 0.038669, 0.057558, -0.174828, 0.108202, -0.093795, -0.085018, -0.114616, 0.145125, 0.002821, 0.129383, 0.013037, 0.391177, 0.053267, 0.058490, -0.061130, -0.077580, -0.096143, 0.068192, -0.097725, -0.047009, 0.006015, 0.017706, 0.087836, -0.008832, -0.051381, 0.205091, 0.107865, -0.313782, -0.265347, 0.036601, 0.008449]
-,        [-1.006134, 0.017618, -0.266087, 0.004571, -0.172021, -0.079771, -0.782109, -0.356625, -0.403827, -0.385540, -0.254773, -0.191297, -0.594261, 0.012164, -0.164249, -0.449709, -0.233326, 0.046115, 0.015056, 0.131066, 0.082034, -0.047762, -0.132358, 0.032057, -0.221250, -0.072522, -0.794760, -0.335186, -0.902372, -1.235010, -1.119711, -0.254285, -0.412445, 0.175469, -0.001800, 0.126296, -0.268146, 0.052736, -0.514135, -0.270447, -0.001029, -0.390969, -0.076890, -0.332147, -0.038130, -0.032654, -0.434110, -0.079904, 0.068142, -0.497366, 0.141879, 0.513971, -0.058876, -0.378460, 0.172703, 0.255211, 0.093714, 0.328566, -0.851754, -0.018065, -0.697097, -0.661648, -0.226461, -0.481387, 0.079300, 0.237264, 0.101598, -0.265601, 0.203504, 0.308706, -0.675926, -0.080627, 0.033279, 0.030665, 0.093923, -1.805996, -0.311610, -0.098918, -0.015739, -0.067945, -0.056587, -2.285501, -0.013626, -0.112096, -0.100042, -0.309238, -0.671544, -2.304250, -1.699981, -0.063090, 0.075545, 0.168679, -0.198113, -0.405425, 0.055365, -0.489389, -0.074457, 0.004392, -0.705246, -0.270465, -0.033355, -0.943204, -0.417588, 0.156349, -0.192127, -0.225192, -0.192442, -0.041054, -0.150054, 0.173010, -1.313291, -0.015306, -1.191665, -0.019931, -0.289472, -0.135478, -0.389076, -0.699763, 0.099165, -0.424963, -0.166674, 0.179271, 0.231278, -0.014498, -0.207532, -0.835388, -0.311632, -0.066003]
-,        [-0.428296, 0.122201, -0.570064, -0.213635, -0.173713, -0.035439, -0.888624, -0.619821, -0.364789, -0.250485, 0.032151, -0.096807, 0.081543, 0.042254, -0.039463, -1.164634, -0.037825, 0.056397, -0.354548, -0.033997, -0.100450, 0.164777, -0.136101, -0.036417, -0.051571, -0.085462, -0.796517, -0.252214, -0.755308, -1.483884, -0.123390, -0.072649, -0.423623, -0.084502, -0.276608, 0.278872, 0.125957, 0.035099, -0.133649, -0.280148, 0.210609, -0.276961, -0.101526, -0.028546, -0.058571, -0.032604, -0.440615, -0.079770, 0.004249, -0.264817, 0.028744, -0.152292, -0.347095, -0.180322, 0.005444, -0.012608, -0.016463, 0.109010, -0.645063, -0.067598, -0.177706, -0.772866, -0.238581, -0.086008, 0.017568, 0.174677, -0.138445, 0.041080, -0.105544, -0.210529, -0.628269, 0.428651, -0.190696, -0.029359, -0.398025, -1.628947, -0.037325, -0.099068, -0.111889, -0.401733, 0.127549, -1.820370, 0.332651, -0.325739, 0.185069, -0.064529, -0.653750, -0.850841, -1.642644, -0.018551, -0.120196, -0.077052, -0.076225, -0.100758, -0.163192, 0.045311, 0.094186, -0.221595, -0.475741, -0.246119, 0.013662, -0.591456, -0.392839, -0.031589, -0.017838, 0.148605, -0.494266, 0.070286, -0.216307, -0.065040, -1.121700, -0.334415, -1.340914, 0.108540, -0.100395, 0.096746, -0.130927, -0.396499, 0.133930, -0.289653, -0.113405, -0.148802, 0.109376, -0.027487, -0.317649, -1.054696, 0.079473, 0.281591]
-,        [-0.921448, -0.105300, -0.043420, 0.112736, -0.327589, -0.183606, -1.296914, -0.102847, 0.022556, -0.582745, 0.129030, 0.078632, -0.270863, -0.150548, -0.260648, -1.219702, -0.461734, 0.071747, -0.288227, -0.006495, 0.089796, 0.261500, -0.256490, -0.116042, -0.569391, -0.300175, -0.321214, -0.288923, -1.300542, -1.699517, -0.789828, -0.272316, -0.974881, -0.100955, -0.441416, -0.292991, -0.294679, 0.292665, -0.439821, -0.827979, -0.041415, -0.458726, -0.026273, -0.205786, -0.123663, -0.065820, -0.230029, 0.174584, -0.128632, -0.273566, -0.618531, -0.398599, -0.582081, -0.186554, 0.009139, -0.222744, -0.096629, -0.207150, -0.949667, -0.118392, -0.504149, -1.294145, 0.076363, -0.404386, 0.088718, 0.004304, 0.117150, 0.303740, 0.103953, -1.161141, -0.829636, -0.006784, 0.069411, -0.174601, -0.337697, -1.600966, -0.108123, -0.195799, 0.026143, -0.184614, -0.188534, -2.516039, 0.173930, -0.394946, -0.556899, -0.325120, -1.206691, -1.766417, -2.221503, -0.161611, -0.264300, 0.064580, -0.104985, -0.253150, 0.061120, -0.392553, -0.031579, -0.305622, -0.618035, -0.744293, -0.322188, -2.111752, -0.829480, -0.269414, -0.173467, -0.199246, -0.599400, 0.061106, -0.479396, 0.178683, -1.497424, -0.082846, -1.905987, -0.077447, -0.166690, -0.168097, -0.607808, -0.326867, 0.221089, -0.161026, -0.534000, -0.180801, 0.101163, 0.216189, -0.252001, -0.539531, -0.617285, 0.004978]
-,        [-1.257584, -0.006502, -0.675399, -0.031093, 0.024286, 0.049413, -1.615770, -0.539486, -0.258870, 0.025829, 0.025090, 0.142266, 0.284495, 0.121507, -0.136736, -0.967265, -0.223831, -0.081232, -0.492183, 0.190358, 0.243917, -0.096111, 0.325963, 0.107464, -0.264812, -0.040714, -0.393416, -0.042713, -0.688917, -1.785080, -0.887213, -0.120314, -0.659270, 0.002018, -0.412238, 0.063827, -0.455605, -0.090389, -0.166975, -0.358823, -0.206202, -0.196534, 0.156300, 0.116595, 0.086145, 0.080271, -0.386326, 0.056481, -0.082970, -0.443084, 0.060254, 0.045064, -0.303145, -0.106331, 0.183071, -0.189309, -0.056172, 0.277189, -0.839321, -0.031214, -0.486821, -1.132978, 0.037648, -0.098932, 0.075150, 0.166135, 0.016551, -0.059922, -0.051350, 0.003349, -0.851617, -0.011206, -0.118819, -0.090484, -0.111605, -1.254382, 0.297139, -0.170786, 0.281761, -0.062712, 0.168269, -1.996092, -0.119387, -0.342943, -0.265742, -0.356320, -0.807892, -1.351463, -2.451892, -0.035862, 0.203375, 0.074599, -0.332441, 0.044885, -0.129170, -0.185521, 0.024160, -0.198492, -1.067603, 0.095835, -0.566804, -2.082655, -0.667526, -0.051454, -0.138626, -0.091738, -0.308106, 0.034789, 0.100303, 0.125257, -1.181011, -0.376741, -1.886039, 0.068347, -0.261207, 0.075196, -0.451378, -0.206560, 0.205366, -0.247744, -0.332411, -0.056831, 0.097926, -0.171964, 0.399035, -0.694934, -0.230583, -0.358173]
-,        [-1.494385, 0.013000, -0.468391, 0.013311, 0.128291, 0.108778, -1.092580, -0.172303, 0.019095, -0.152934, -0.739303, -0.001798, -0.335131, -0.117572, 0.021848, -0.575767, -0.508273, 0.012255, -0.171688, 0.048434, 0.155948, -0.225041, 0.121636, 0.063876, -0.304426, 0.029928, -0.479938, -0.378985, -0.380865, -1.487327, -0.887596, -0.058973, -0.505080, 0.040641, -0.036199, -0.018665, -0.519258, -0.019913, -0.425958, -0.464976, 0.244931, 0.017552, 0.086801, 0.087065, 0.354311, -0.189456, -0.198087, 0.230170, -0.206840, -0.193799, 0.077820, -0.225143, 0.138695, -0.198667, 0.060009, -0.039440, -0.019684, 0.039384, -0.820851, 0.003951, -0.474780, -1.485048, -0.048692, 0.184028, -0.088984, 0.272278, 0.144551, -0.181893, -0.095216, -0.673322, -0.621292, 0.001676, 0.199136, 0.238015, -0.342863, -1.451319, -0.065741, 0.131298, -0.036874, -0.126391, 0.034554, -2.243056, 0.042895, -0.064737, -0.309064, 0.002367, -0.942939, -1.025221, -1.591413, -0.176680, 0.138695, 0.046121, -0.003763, -0.149745, -0.188426, -0.094823, 0.041224, -0.188591, -0.538544, -0.185499, -0.399222, -1.638280, -0.228707, -0.167742, 0.009690, -0.108090, -0.075878, -0.068994, -0.492242, 0.083611, -1.444492, -0.014223, -1.575736, -0.149652, -0.359574, 0.078211, -0.125666, 0.028394, -0.020507, -0.505306, 0.079400, 0.159807, -0.266927, 0.310755, -0.076998, -0.671679, 0.139697, 0.032501]
-,        [-1.133987, -0.079149, -0.601958, -0.086053, -0.079353, 0.061527, -1.610917, -0.335533, 0.231786, -0.237695, 0.063619, 0.149274, -0.716023, 0.030511, -0.220296, -0.737104, -0.341254, -0.125134, -0.452641, -0.006077, -0.211501, 0.009341, -0.054970, -0.104798, -0.516096, -0.073552, -0.279242, -0.351333, -0.647215, -2.035964, -0.676957, 0.062433, -0.806899, 0.023767, -0.550596, -0.410630, -0.326833, 0.172712, 0.084515, -0.594092, 0.109845, -1.327471, -0.126409, -0.103951, -0.096964, -0.224368, -0.848449, 0.064677, -0.375050, 0.013742, 0.012220, -0.446678, -0.651865, 0.032862, -0.219523, -0.018717, 0.000302, 0.146180, -1.118674, -0.194828, -0.602750, -0.793685, 0.187772, -0.386471, 0.224664, 0.095764, -0.012569, -0.420429, 0.009622, -0.356519, -0.422230, -0.312163, 0.169109, -0.162158, -0.490232, -1.731126, -0.169256, 0.068802, 0.046079, 0.128286, -0.038646, -2.763210, -0.034649, -0.054384, -0.468860, -0.200013, -0.261566, -1.119786, -2.095116, 0.005542, -0.243085, -0.233396, -0.643795, -0.223074, -0.099345, -0.193568, 0.000716, -0.046650, -0.741733, -0.575354, -0.210342, -1.274155, -0.348608, -0.042870, -0.215310, -0.250207, -0.338124, -0.008254, -0.455475, -0.111878, -1.471144, -0.002377, -1.138333, -0.019970, -0.216096, -0.033418, -0.261120, -0.590424, 0.036533, -0.467342, -0.197489, -0.003444, 0.000871, -0.229349, -0.133291, -0.119465, -0.556016, -0.189602]
-,        [-1.097569, -0.149663, -0.626458, 0.117946, -0.337745, -0.413363, -0.625370, -0.562208, -0.607446, -0.135248, -0.634429, -0.150740, -0.391018, -0.128558, 0.126281, -0.514793, -0.850565, -0.198033, -0.272673, -0.240204, -0.187564, 0.038120, 0.030843, 0.085722, -0.152553, -0.235963, -0.924616, -0.505789, -0.583650, -1.750461, -0.646026, 0.157684, -0.661797, -0.357111, -0.368484, -0.011525, -0.338466, -0.036484, -0.222392, -0.514222, 0.195855, -0.652996, 0.201903, -0.196506, -0.315160, -0.456005, -0.099626, -0.036333, -0.421858, -0.434575, 0.003747, -0.098593, -0.322671, -0.112722, 0.105605, -0.032012, 0.001282, -0.174650, -0.847757, -0.053264, -0.585495, -1.075170, 0.153174, 0.081654, -0.141623, -0.108543, -0.017203, 0.074197, -0.102200, -0.882398, -0.731784, 0.096781, 0.453325, -0.302094, -0.651422, -1.757855, -0.032228, -0.128802, -0.491241, 0.101225, -0.159086, -1.400383, 0.261574, -0.402552, -0.136200, 0.135563, -1.196769, -1.822231, -2.004300, 0.005734, -0.282038, -0.149347, -0.130381, -0.196583, -0.404273, -0.180086, 0.133211, -0.251254, -1.341620, -0.419530, -0.130834, -1.430495, -0.406444, -0.072660, 0.001514, -0.376756, -0.215268, 0.170436, -0.201540, -0.016658, -1.646448, -0.007322, -1.678861, -0.097008, -0.087039, 0.084009, -0.522959, -0.619396, 0.200044, -0.300046, -0.179683, 0.049071, 0.034330, -0.123382, -0.586001, -0.415993, -0.405897, -0.099942]
-,        [-1.004019, 0.170873, -0.104499, -0.405137, -0.442570, -0.181377, -1.510494, -0.735828, -0.518467, -0.295387, -0.353489, -0.187612, 0.128381, -0.243685, -0.159136, -0.902149, -0.253410, -0.303505, 0.080360, 0.036885, 0.104263, 0.167153, -0.079963, 0.077103, -0.656721, 0.068777, -0.220579, -0.680044, -1.068266, -0.994498, -0.825751, 0.037972, -0.155937, -0.359380, -0.242215, 0.070994, -0.470685, -0.017083, -0.537173, -0.601544, -0.302128, -0.163876, 0.002289, -0.236980, -0.124521, -0.191632, 0.069604, 0.087037, -0.265089, -0.365391, -0.305428, -0.275314, -0.503280, 0.071113, -0.118750, -0.002317, -0.359381, 0.051724, -0.384306, -0.161851, -0.670507, -0.952589, -0.220388, -0.079802, -0.046994, -0.027619, -0.201649, -0.223059, 0.194760, -0.348776, -0.941723, 0.046817, -0.443303, 0.042804, -0.058786, -1.482807, -0.115392, -0.168108, -0.217973, -0.256460, 0.017054, -1.749063, 0.124694, -0.362470, -0.528740, -0.458270, -0.890208, -1.770242, -1.265114, -0.185805, -0.295953, 0.203927, -0.716232, 0.053452, -0.435573, -0.444534, -0.258442, -0.225930, -0.625602, -0.312395, -0.012508, -1.801702, -1.055233, -0.018333, 0.027681, -0.435009, -0.349132, -0.004682, 0.055120, -0.204211, -1.141200, 0.015218, -1.343292, 0.242746, 0.055384, -0.116290, -0.578793, -0.781298, 0.079062, -0.085442, -0.193586, 0.004396, 0.027727, -0.076098, -0.396947, -0.665274, -0.614813, -0.252002]
-,        [-1.443828, 0.074067, -0.744901, -0.191921, -0.446738, -0.178534, -1.372716, -0.739042, -0.458665, -0.428691, 0.075042, 0.044806, -0.267286, 0.088620, -0.138659, -0.716337, -0.308251, 0.077316, -0.199981, 0.216547, 0.069986, -0.037086, -0.071251, -0.216584, -0.403992, 0.024496, -0.562039, -0.591273, -1.256553, -1.781632, -0.581728, -0.201351, -0.580830, -0.271109, -0.179037, -0.243957, -0.828410, -0.209559, -0.245993, -0.739953, -0.228853, -0.570057, -0.126780, -0.005486, -0.208230, -0.032941, -0.422727, -0.016507, -0.077076, -0.518535, 0.022816, -0.355274, -0.366305, 0.066456, 0.008066, -0.044854, -0.181936, -0.325713, -1.197208, 0.077407, -0.537757, -1.357390, 0.061049, -0.185483, 0.161700, 0.107944, 0.226422, 0.029392, 0.170882, 0.486540, -0.842532, 0.026280, -0.220647, -0.118267, -0.329936, -1.417642, 0.014651, -0.291131, -0.327057, 0.056304, 0.050351, -2.630824, -0.066638, -0.343583, 0.065395, -0.252685, -0.310092, -1.614390, -2.157798, -0.116397, -0.128832, -0.037984, -0.209092, 0.010991, 0.089450, -0.376508, 0.085837, -0.070203, -0.439780, -0.736697, -0.533011, -1.379925, -0.460975, -0.093271, -0.174246, -0.219130, -0.325979, 0.039904, -0.333677, -0.002705, -1.543931, -0.445984, -0.830674, 0.185648, -0.208151, -0.073177, -0.460657, -0.345722, -0.136875, -0.082751, -0.287111, 0.018610, 0.013113, -0.104456, -0.593996, -0.645167, 0.073969, -0.213522]
-,        [-0.807937, -0.061270, -0.677210, -0.174344, 0.413180, -0.088853, -1.913445, -0.345932, -0.366886, -0.036636, -0.495316, -0.114676, -0.418575, -0.235789, -0.030640, -0.627694, -0.387333, -0.178455, 0.286730, 0.118673, 0.090586, 0.116587, 0.097828, -0.013305, -0.651798, -0.012018, -0.551690, -0.481022, -1.176308, -1.554694, -1.193510, -0.011718, -0.592816, 0.126867, -0.218016, -0.254981, -0.808387, -0.201575, -0.401907, -0.760788, 0.046629, -0.043891, 0.047870, 0.122855, -0.172287, -0.321231, -0.291769, 0.114885, -0.256284, 0.141562, -0.208412, -0.298719, -0.252685, -0.195985, -0.108910, 0.008347, -0.021274, -0.357366, -0.778503, -0.033390, -0.333238, -0.649174, -0.042681, -0.180965, -0.074563, -0.142825, 0.128095, -0.168207, 0.039127, -1.246868, -1.048544, -0.119933, -0.126104, -0.132793, -0.214616, -1.459583, 0.342627, -0.199656, -0.012790, -0.102344, -0.064276, -1.820805, 0.072404, -0.199864, -0.805599, -0.062355, -0.661186, -1.908178, -1.754087, 0.188401, 0.058189, -0.029624, -0.773545, -0.160452, -0.045684, -0.229502, 0.033282, -0.419475, -0.905060, -0.344492, -0.369094, -2.036155, -0.586804, 0.160698, 0.013817, 0.049324, -0.193480, -0.170378, -0.480843, -0.172637, -1.197543, -0.445199, -1.278980, 0.147250, -0.096463, -0.232194, -0.507477, -0.659226, -0.117318, -0.629048, 0.004692, -0.031589, 0.219028, -0.156566, -0.718345, -0.815790, -0.096946, -0.013773]
-,        [-0.879721, 0.223417, -0.301637, 0.311264, 0.122164, -0.004262, -1.527035, -0.473753, -0.405984, -0.108046, 0.028262, -0.237699, -0.593650, 0.001579, -0.351386, -0.926171, -0.408086, 0.132950, -0.155679, -0.255788, 0.165730, 0.011938, -0.017388, -0.028487, -0.617472, -0.129255, -0.475456, -0.426240, -1.002098, -1.612239, -0.891076, -0.364570, -0.345204, 0.039421, -0.550811, -0.086783, -0.742353, 0.006677, -0.209296, -0.517970, -0.334654, -0.635497, -0.023649, 0.263478, -0.148757, -0.435785, -0.235481, -0.006922, -0.009179, -0.509034, -0.007523, -0.082322, -0.393353, -0.138625, 0.102033, -0.000299, 0.028137, -0.342927, -1.098770, 0.307115, -0.288657, -0.770945, 0.082664, 0.034488, 0.038874, 0.001633, 0.014218, -0.326253, 0.343605, -0.101604, -0.680699, -0.219280, -0.091778, 0.037289, -0.091871, -2.004026, -0.207046, -0.017600, -0.158888, -0.273380, 0.046243, -2.580017, 0.222165, -0.126483, -0.694374, -0.357504, -0.437610, -1.867589, -1.838638, -0.020626, -0.188758, -0.137340, -0.018045, -0.150146, -0.231346, -0.356482, 0.164259, -0.194205, -0.533816, -0.297925, -0.309087, -2.178169, -0.222665, -0.086533, 0.104873, -0.449944, -0.387214, -0.016663, -0.422330, 0.169313, -1.455187, -0.568822, -1.729240, -0.037146, -0.088830, -0.018953, -0.511101, -0.530901, -0.062146, -0.655836, -0.060066, -0.068391, -0.049522, -0.063216, -0.422258, -0.422460, -0.223065, -0.082440]
-,        [-0.728833, 0.057015, -0.416046, -0.028993, -0.274562, -0.256742, -1.805433, -0.489461, -0.496185, -0.055508, -0.089297, -0.044576, -0.188723, 0.153085, -0.035379, -1.043132, -0.348404, 0.202882, -0.220711, 0.090412, -0.006841, -0.173425, -0.058046, 0.048991, -0.224243, -0.072710, -0.491980, -0.870059, -0.939446, -1.641767, -1.009772, 0.012396, -0.583137, 0.045822, 0.127208, -0.007094, -0.819876, -0.065820, -0.509324, -0.514044, 0.112131, -0.849083, -0.307653, -0.031998, -0.194789, 0.048514, -1.058196, 0.091881, -0.074334, -0.222405, -0.015525, 0.134627, -0.417024, 0.326294, 0.024295, -0.181543, 0.114995, 0.269705, -1.022313, 0.041181, -0.628818, -1.226871, -0.045075, -0.421052, 0.030671, -0.031605, 0.111278, -0.043381, -0.135139, -0.865440, -0.741429, -0.155193, -0.126923, 0.024644, -0.260435, -1.274426, 0.231082, -0.123805, 0.021619, -0.134516, 0.048806, -2.355419, 0.124448, -0.419646, -0.665537, 0.090381, -1.161629, -1.909044, -2.203178, 0.173930, -0.255678, -0.345539, -0.731004, -0.347816, -0.140882, -0.226745, 0.070344, 0.272477, -0.815778, -0.165448, -0.390180, -1.346034, -0.935168, -0.109477, 0.187617, -0.008184, -0.323701, -0.248758, -0.113845, 0.278069, -1.420032, -0.129042, -1.402701, 0.206835, -0.582577, -0.010724, -0.568007, -0.507949, -0.089339, -0.423734, -0.286924, 0.139345, -0.037929, 0.080873, -0.399613, -1.408226, -0.551846, -0.276409]
-,        [-1.362430, 0.066501, -0.233035, 0.030430, 0.239617, -0.231580, -1.507515, -0.407068, -0.522865, 0.013198, -0.185568, -0.127312, -0.016610, 0.201661, -0.361094, -0.750788, -0.457352, -0.088888, -0.125001, -0.120181, 0.056602, -0.231785, 0.004842, 0.043720, -0.430612, -0.042933, -0.200922, -0.718204, -0.914504, -1.654752, -0.783409, 0.054225, -0.301320, -0.266637, -0.398546, 0.049341, -0.455259, 0.166668, -0.802715, -0.536063, 0.102248, -0.520092, -0.058715, 0.028025, 0.081584, -0.219311, 0.028458, 0.098110, -0.277153, 0.217835, -0.200554, 0.104977, -0.539160, 0.049441, 0.118299, 0.008039, -0.175102, -0.233112, -1.002355, -0.153936, -0.500806, -0.637715, -0.047110, -0.244741, -0.050225, -0.000022, -0.182497, 0.226956, 0.053208, 0.003338, -0.390359, 0.014727, -0.062452, 0.004670, -0.116782, -1.657549, 0.267437, -0.266135, -0.010798, -0.167961, 0.186319, -2.270594, 0.053485, -0.430545, -0.494343, 0.097485, -0.417537, -1.107285, -2.259131, -0.124878, 0.108277, 0.327978, -0.092661, -0.186226, 0.048270, -0.458646, -0.030730, -0.015344, -1.349009, -0.209263, -0.262061, -1.419724, -0.232079, -0.020162, -0.245256, 0.055086, -0.036132, 0.249642, -0.193123, -0.056031, -1.881496, -0.099710, -1.311759, 0.208290, -0.551594, 0.037522, -0.619464, -0.249975, 0.202126, -0.621159, -0.108723, -0.202751, -0.142772, -0.010638, -0.124083, -0.814473, -0.512576, -0.182833]
-,        [-0.827830, 0.226457, 0.112066, -0.339603, -0.803669, 0.033999, -1.724661, -0.075583, -0.193888, -0.276448, -0.548442, 0.063771, -0.490549, -0.197688, -0.367023, -0.653534, -0.230132, -0.171956, -0.107795, 0.004000, -0.072848, 0.171043, 0.092038, 0.203873, -0.477892, -0.184758, -0.496856, -0.132976, -0.817956, -1.510441, -0.765363, -0.164661, -0.806214, 0.053397, -0.308310, 0.134109, -0.664707, 0.054449, -0.391830, -0.527517, -0.146036, -0.820894, -0.144162, -0.254033, -0.162369, -0.227144, -0.175738, 0.294455, -0.066202, -0.141521, -0.355909, -0.343298, -0.637109, -0.113062, 0.126018, 0.019297, 0.255260, 0.070375, -0.685803, 0.065300, -0.654198, -1.019832, 0.133407, -0.668551, -0.078827, 0.088834, -0.043139, -0.291712, 0.036814, -1.169998, -0.247147, 0.133926, -0.102370, -0.553524, -0.502103, -1.999476, -0.026048, -0.061840, -0.116036, -0.272243, -0.090196, -2.033883, -0.036395, -0.341463, -0.708234, -0.865846, -0.535775, -1.454491, -1.576928, 0.134713, -0.649821, -0.022289, -0.247631, -0.151575, -0.607344, -0.294162, -0.100094, -0.639491, -0.711285, -0.376851, -0.353927, -1.688590, -0.650991, 0.008753, -0.049901, -0.242915, -0.421128, -0.086070, -0.656285, 0.055270, -1.643460, -0.307560, -1.438354, 0.159232, -0.541878, -0.156269, -0.415933, -0.568828, -0.057668, -0.593180, -0.390874, 0.115077, 0.060077, -0.062625, 0.150645, -0.278854, -0.645142, 0.022958]
-,        [-1.500407, -0.008840, -0.513237, 0.304236, -0.103354, 0.060599, -1.239341, -0.191570, -0.017376, -0.756252, -0.025655, -0.010483, -0.595325, 0.081763, -0.194452, -0.962141, -0.639870, 0.051804, -0.034025, 0.008887, 0.023604, -0.101501, 0.027005, -0.176795, -0.857258, 0.144650, -0.498873, -0.440561, -1.111690, -1.235916, -1.033689, -0.139424, -0.712066, -0.172697, 0.027189, -0.040674, -0.485197, -0.154566, 0.017759, -0.483571, -0.113423, -0.649060, 0.065344, -0.036834, 0.157067, -0.421350, -0.375375, -0.013146, -0.242847, -0.155731, -0.031149, 0.218246, -0.292049, -0.002175, 0.022526, 0.243952, -0.034982, -0.051815, -0.799580, 0.081022, -0.582897, -0.967382, -0.101239, -0.182399, -0.019675, 0.057980, 0.002944, 0.286571, -0.280253, -0.819148, -0.822481, 0.030288, -0.109959, -0.095280, -0.485548, -1.140482, -0.079719, 0.014529, 0.195727, 0.026437, 0.063212, -2.159726, 0.363281, -0.089764, -1.011991, -0.420367, -0.744944, -1.876587, -2.549993, 0.064579, -0.072418, 0.252803, -0.263412, -0.144754, 0.080451, -0.376504, 0.016509, 0.081325, -0.965056, -0.535850, -0.344961, -1.359483, -0.306681, 0.147481, 0.127452, -0.016999, -0.709132, -0.094618, -0.530507, -0.174315, -1.355546, 0.192359, -1.548421, -0.006642, -0.188620, -0.015065, -0.242526, -0.239584, -0.036463, -0.736889, -0.037729, 0.043622, 0.130689, -0.052687, 0.053478, -1.439746, -0.156763, -0.539449]
-,        [-0.988193, -0.053110, -0.835144, 0.181948, -0.110908, -0.209568, -1.340915, -0.586977, -0.568913, -0.503477, -0.279354, 0.089111, -0.404717, 0.149920, -0.008177, -1.177282, -0.257335, -0.137627, -0.078961, -0.065321, 0.205394, 0.090379, 0.040910, -0.028934, -0.410210, -0.239508, -0.639146, -0.816033, -1.124159, -1.231782, -0.455296, -0.085572, -0.050417, 0.078988, 0.165579, -0.093953, -0.283030, 0.257470, -0.276693, -0.677016, -0.146708, -0.890151, -0.021409, -0.314562, -0.053713, -0.074613, -0.535513, 0.046161, -0.114389, -0.370405, -0.243316, 0.158278, -0.485067, 0.086911, -0.095072, -0.088351, -0.098227, 0.098488, -1.242593, 0.296618, -0.147954, -0.324143, 0.027880, -0.359762, -0.174887, -0.022373, 0.119528, -0.376317, 0.254380, -0.148826, -1.316146, -0.072318, -0.032380, -0.265120, -0.291694, -1.677536, -0.000528, -0.438885, -0.118230, -0.133678, 0.074755, -2.411612, -0.133362, -0.307596, -0.453860, -0.368955, -0.370523, -1.794817, -2.328053, -0.295530, -0.283789, 0.133490, -0.666856, -0.401569, -0.015294, -0.349073, 0.043312, -0.074722, -1.123188, -0.363848, -0.726195, -2.178799, -0.423273, -0.084396, 0.057086, 0.011722, -0.475768, 0.000311, -0.553222, 0.054473, -1.749267, -0.554609, -1.572014, 0.037298, -0.240253, -0.142397, -0.438611, -0.323894, 0.418239, -0.593923, 0.121303, 0.024192, 0.018686, -0.015573, -0.442054, -0.356865, -0.542741, -0.279852]
-,        [-1.502285, 0.054984, -1.162414, 0.211412, -0.788549, 0.396280, -0.702945, 0.006597, 1.022969, -0.278707, -0.075898, 0.092893, -0.584683, -0.132454, -0.518879, -0.551178, -0.401315, 0.738872, -0.566673, -0.068862, 0.152234, 0.082510, -0.114886, 0.232061, -1.093336, -0.093399, -0.693395, -0.534998, -1.047241, -2.016685, -0.966613, -0.200914, -0.284411, 0.239898, -0.353657, -0.001792, -0.082655, -0.347495, -0.535133, -0.651785, 0.029275, -0.535225, 0.006853, 0.131104, 0.183681, 0.006204, -0.360039, 0.128555, 0.453958, -0.051337, 0.117169, -0.277226, -0.420894, -0.130797, 0.195911, -0.103105, -0.161338, -0.456398, -0.516547, 0.004585, -0.449159, -0.898927, -0.115551, 0.359893, -0.002958, 0.224246, 0.054397, -0.008708, -0.222280, -0.622663, -0.390311, -0.128909, -0.171030, 0.391250, 0.103602, -1.260977, -0.157427, 0.318560, 0.417324, -0.086388, 0.037084, -3.940500, -0.098762, -0.440857, -0.137530, 0.229160, -0.359737, -1.659061, -3.496779, 0.280326, -0.239002, 0.006752, 1.759475, -0.109721, 0.211205, -0.275894, -0.131041, 0.030391, -0.768112, -0.181352, 0.362726, -1.849629, -0.147153, 0.062574, -0.037239, -0.015754, -0.046814, -0.159232, -0.078931, -0.087376, -1.041418, -0.231561, -2.008603, -0.174659, -0.440614, 0.280201, -0.846116, -0.159628, 0.337935, 1.227629, -0.323392, -0.248937, 0.142452, -0.065589, 0.627418, -0.455594, -0.586392, 0.393806]
-    ],
-    "jump_head.bias": [-1.278037, -1.949524, -0.929046, -1.419894, -1.618562, -1.507245, -1.502128, -1.426574, -1.542195, -1.310671, -1.320993, -1.241476, -1.410318, 0.003187, -1.838961, -1.524282, -1.427033, -1.116136, -1.834567, -1.359489, -0.744577, -1.559718, -1.466090, -1.866294, -0.427053, -0.769026, -0.320100, -0.667000, -1.664889, -1.452322, -1.589892, -1.999026, -1.100115, -2.005131, -0.735220, -0.219105, -1.146572, -1.620977, -1.327382, -1.245925, -1.564087, -1.711069, -1.170056, -1.169838, -1.212176, -0.771995, -1.105045, -1.325210, -1.861241, -1.483897, -1.257496, -1.323206, -5.665954],
-    "discard_head.weight": [
-        [-0.299513, 0.010544, 0.036885, -0.086475, -0.107820, -0.059580, -0.084722, 0.087047, -0.046204, 0.043090, 0.014334, 0.180651, 0.114584, -0.109312, 0.034400, -0.180912, -0.076191, -0.270252, 0.042115, 0.148523, -0.022558, 0.206153, 0.090816, 0.145752, -0.053505, -0.117509, 0.082160, -0.147914, 0.151920, 0.178946, -0.028038, -0.158991, -0.040615, -0.042778, 0.152528, 0.044782, -0.189423, 0.033525, 0.181059, -0.156320, -0.077078, -0.001510, 0.243855, -0.014589, 0.028584, 0.014567, 0.041778, 0.114039, 0.035719, -0.217173, 0.173225, 0.098979, -0.081789, -0.105082, -0.235899, 0.229509, -0.099130, -0.091653, -0.118357, 0.011567, 0.004951, -0.169693, -0.033379, 0.014124, -0.105749, 0.000222, 0.000173, -0.030028, 0.046332, 0.102092, -0.106758, -0.128070, 0.233503, -0.096882, -0.145809, -0.324612, 0.067077, 0.022677, 0.027076, 0.123441, 0.133237, -0.120919, 0.040103, -0.098566, -0.235680, -0.259708, 0.123095, -0.132022, -0.147372, 0.227211, -0.163208, 0.033794, -0.252966, -0.005950, 0.074945, 0.002192, -0.048365, -0.000043, -0.056602, 0.022482, -0.001660, 0.140965, 0.112170, 0.128656, -0.097829, -0.049766, 0.115424, -0.225936, 0.322156, 0.076401, -0.177673, 0.026355, -0.409674, -0.119893, 0.071447, -0.078729, -0.158899, -0.260827, -0.022394, -0.030505, 0.119495, -0.034366, -0.050366, 0.037390, 0.190209, -0.039454, 0.067593, -0.119017]
-,        [0.015990, 0.092599, -0.173563, 0.095558, 0.373660, -0.046545, -0.090103, 0.244933, 0.031799, -0.089482, 0.074070, -0.168384, 0.117723, 0.055059, 0.125474, 0.024295, 0.045687, -0.128350, -0.026517, -0.039055, -0.047194, 0.047512, 0.271054, -0.138682, 0.238395, -0.080946, -0.159786, -0.113084, 0.190044, -0.214827, -0.085229, 0.038302, 0.110376, 0.022412, -0.055475, -0.081971, -0.090295, 0.070854, 0.072196, -0.099249, -0.217438, 0.061731, 0.014249, -0.149366, 0.030875, -0.180725, -0.123589, 0.144682, -0.039334, -0.021696, -0.302955, 0.125387, 0.085635, 0.028294, 0.015703, -0.054807, 0.075931, -0.096698, 0.010749, -0.136598, -0.228176, -0.099583, 0.032593, -0.026711, -0.012933, 0.068174, -0.071397, -0.055645, -0.062875, -0.169136, -0.014546, 0.139069, -0.036434, 0.275085, 0.009140, 0.085021, 0.125583, -0.078297, -0.198649, -0.097079, 0.116905, -0.181025, 0.088852, 0.006804, -0.079779, -0.276524, -0.173593, -0.067275, -0.021669, 0.133078, -0.122933, 0.158970, -0.004204, 0.156469, 0.132352, -0.056509, -0.009556, -0.158623, 0.172753, -0.004227, -0.145109, 0.019753, 0.142612, 0.142258, 0.022697, -0.021571, -0.096971, 0.163085, -0.049933, -0.155759, -0.041921, -0.097402, -0.287811, 0.237142, -0.022497, 0.140073, -0.020556, -0.017247, -0.078327, -0.054058, 0.062070, -0.101364, 0.164393, -0.013342, -0.074246, 0.028437, 0.304821, 0.068381]
-,        [-0.072491, 0.097075, 0.056276, -0.012306, 0.025404, 0.061946, -0.039365, -0.028564, -0.003268, 0.120252, -0.182440, 0.047506, 0.011679, 0.003068, 0.186812, -0.003024, 0.078804, -0.102776, 0.105873, 0.166680, 0.150864, 0.163592, -0.065094, 0.026879, -0.022223, -0.142795, -0.229267, 0.302794, -0.007325, -0.049646, -0.027557, 0.073793, -0.064333, 0.063310, -0.048525, -0.023197, -0.103931, 0.000689, 0.060992, 0.032361, 0.028860, 0.291764, 0.027646, 0.082336, 0.238866, 0.033765, -0.214405, -0.167640, 0.294226, 0.097336, 0.118790, 0.200418, -0.023099, -0.065510, -0.167483, 0.152628, 0.020678, 0.016305, 0.084247, -0.011884, 0.030806, -0.047771, -0.234574, 0.156202, 0.233440, 0.278319, -0.137178, -0.131824, 0.124420, 0.128071, 0.113480, 0.245487, -0.114339, 0.193462, -0.032470, 0.188439, 0.054027, 0.074150, 0.056352, -0.204778, 0.089171, 0.000996, -0.242686, -0.067400, 0.030250, 0.029510, -0.049193, 0.012995, 0.061545, 0.172080, -0.276563, 0.050275, -0.160877, -0.002625, 0.034477, -0.114677, -0.183038, -0.023764, 0.108440, 0.102049, -0.226866, -0.259125, -0.152908, 0.163094, 0.012687, -0.001535, -0.118113, 0.099429, -0.009715, 0.077970, 0.102745, 0.205071, 0.083305, -0.165182, 0.053966, -0.255599, -0.029571, 0.002840, -0.055464, -0.124689, 0.007432, 0.240309, -0.015607, -0.009397, -0.150199, 0.061359, -0.050597, -0.111615]
-,        [-0.104216, -0.124692, 0.070096, 0.316217, -0.196390, -0.060683, -0.059623, 0.074746, -0.027739, -0.023719, 0.145472, -0.138446, 0.112645, -0.049488, -0.058271, 0.051984, 0.176762, 0.009685, 0.097353, 0.049575, -0.074387, 0.256378, -0.088822, -0.296004, -0.046987, -0.107888, -0.196329, -0.000764, 0.139453, 0.016158, 0.082853, 0.153861, 0.074600, -0.082992, 0.100676, 0.090789, 0.100758, 0.034314, -0.256028, 0.142815, 0.017214, 0.089112, 0.146921, -0.106859, 0.008243, 0.083035, -0.223546, 0.024314, -0.012075, 0.068428, 0.061692, -0.056282, 0.008207, 0.034006, 0.020709, -0.060675, -0.065407, -0.085606, 0.006123, -0.077436, 0.131500, 0.006177, 0.057799, 0.154600, -0.188432, -0.149727, 0.115750, -0.204998, -0.047600, -0.329139, 0.079663, -0.116369, 0.068923, 0.225703, -0.131777, 0.025473, 0.112299, 0.126636, 0.133935, 0.236797, 0.243885, 0.057627, -0.213671, -0.025968, 0.115260, -0.170673, 0.070862, 0.112649, 0.056237, 0.050211, 0.037216, -0.144116, -0.079428, 0.160534, 0.154461, 0.124461, 0.011803, -0.074671, -0.232734, -0.159098, -0.093749, -0.238861, -0.026896, -0.045242, -0.085819, 0.074212, -0.217823, -0.148402, -0.073169, -0.054220, -0.068636, -0.000291, 0.023655, 0.071117, -0.136515, -0.029447, -0.099557, 0.019307, 0.001106, 0.006080, 0.250024, 0.130340, -0.016514, 0.111008, 0.004760, -0.258217, -0.064797, 0.208720]
-,        [0.052683, 0.146409, -0.099307, 0.191909, -0.119522, -0.163043, -0.068878, -0.136794, 0.194742, 0.235482, -0.097947, -0.067142, 0.023571, 0.023786, 0.135574, -0.106503, -0.050348, -0.160673, 0.201445, -0.078419, 0.122259, -0.114809, 0.085752, -0.054708, -0.035794, 0.268135, 0.058180, -0.013066, -0.226708, -0.048614, 0.110596, -0.150558, 0.068712, -0.212829, 0.004179, -0.027900, 0.033290, -0.190785, -0.003333, 0.015546, -0.092686, 0.065184, -0.022391, 0.168239, 0.001861, 0.066013, 0.299142, 0.123756, -0.113168, -0.120438, 0.131886, -0.115486, -0.031609, 0.045430, 0.041984, 0.011557, -0.067745, -0.032571, 0.141111, 0.205775, -0.074821, 0.172360, -0.108535, 0.093801, 0.006451, 0.137435, 0.004882, 0.129162, -0.186418, -0.030502, -0.085060, 0.013808, 0.191773, 0.049188, 0.196795, 0.075414, 0.358645, -0.009124, -0.116369, 0.085997, 0.039874, 0.098191, 0.118346, -0.024950, 0.031801, -0.340886, 0.348394, 0.041160, -0.005761, 0.126721, 0.126200, 0.230575, -0.030911, -0.001159, -0.214664, -0.023872, -0.080982, 0.138079, 0.010533, 0.064379, -0.136881, 0.173237, -0.114821, -0.040925, 0.217365, 0.018913, 0.039682, 0.081204, 0.152921, -0.161788, 0.191242, -0.114517, 0.027248, 0.062341, 0.078562, -0.309129, 0.204251, -0.000650, 0.116126, -0.146761, 0.074497, 0.067388, -0.034366, -0.152732, -0.089306, -0.148194, 0.240013, 0.050128]
-,        [0.012526, -0.055455, 0.142002, -0.026106, 0.011125, -0.060685, -0.216230, 0.025433, -0.389043, -0.058357, -0.079802, -0.143798, 0.338993, -0.280293, 0.196136, 0.195618, -0.056537, 0.057509, -0.156950, 0.100286, -0.018313, -0.017942, 0.026230, -0.287201, -0.083774, 0.069000, -0.009910, 0.043406, 0.062103, -0.106970, -0.055749, -0.017247, -0.119819, -0.039350, -0.023802, 0.037030, 0.008824, 0.095702, -0.017255, 0.093820, -0.010207, -0.074428, -0.064881, 0.028574, 0.048571, 0.018797, 0.081981, 0.006966, -0.160091, 0.060933, 0.156348, -0.071654, -0.170292, -0.170550, 0.031293, 0.147844, -0.020774, -0.070929, 0.155551, -0.049221, -0.240718, 0.092075, 0.203933, 0.219940, -0.048987, -0.125483, -0.172505, -0.216943, 0.067124, 0.083336, -0.121018, 0.128039, 0.092133, -0.121634, -0.006353, -0.190501, -0.105956, -0.086790, -0.021575, 0.087308, -0.016628, -0.124410, 0.057156, -0.012751, -0.101496, 0.224196, 0.058369, 0.050275, -0.052171, 0.224263, -0.219005, 0.241262, -0.032349, -0.211282, 0.112885, 0.290903, 0.019750, 0.052142, -0.160142, 0.106959, 0.000530, 0.027449, -0.199444, -0.058368, -0.001054, -0.004335, -0.069555, 0.089726, 0.026068, 0.043944, -0.061360, 0.001012, 0.202530, 0.198424, 0.180034, -0.113112, -0.037069, -0.031232, 0.067014, -0.090224, 0.087611, -0.081313, 0.038240, 0.145278, 0.097779, 0.184710, 0.041523, 0.141860]
-,        [0.184852, -0.127317, 0.016067, 0.174232, 0.214200, 0.320055, -0.010180, 0.088038, 0.086130, -0.013963, 0.048005, -0.013403, -0.072319, 0.258173, -0.109534, -0.000638, 0.185623, 0.135230, -0.044348, -0.155003, -0.227773, 0.072188, -0.031000, -0.004331, 0.015495, 0.156937, 0.065355, -0.094685, 0.059564, 0.150121, -0.049844, -0.066263, -0.301787, 0.010655, -0.027217, -0.092139, -0.118308, 0.019836, -0.010254, -0.039159, -0.042245, -0.009923, -0.011383, -0.043699, -0.023651, 0.061191, 0.138555, 0.066075, 0.118140, -0.051196, -0.037883, -0.119128, 0.130053, -0.033225, 0.063863, 0.157301, -0.122008, -0.167766, -0.079493, 0.188429, -0.063653, -0.030148, 0.030226, 0.026886, 0.030258, 0.066669, 0.032350, 0.171039, -0.111884, 0.127464, 0.134025, 0.239612, 0.148593, 0.065768, -0.076417, -0.161730, 0.210193, -0.064224, 0.015264, -0.034677, 0.025531, 0.161130, -0.229236, -0.333388, 0.127157, -0.175492, -0.119197, -0.195517, -0.125881, -0.035084, -0.055376, 0.087047, -0.024526, 0.012862, 0.191792, 0.010979, -0.340459, 0.137597, -0.287610, 0.041084, 0.196635, 0.069332, -0.007772, -0.116238, -0.075541, 0.105966, -0.242582, 0.019522, -0.263550, 0.059382, -0.061850, -0.056822, -0.097525, -0.034010, 0.248785, -0.056643, 0.112865, 0.027991, 0.061572, -0.081959, 0.045632, -0.136851, -0.098589, 0.214710, -0.007522, 0.037356, -0.204654, -0.172870]
-,        [0.096337, -0.202334, -0.129525, 0.119225, 0.158527, 0.018617, -0.113723, 0.044169, -0.115005, -0.139084, 0.118843, -0.091810, 0.031831, 0.041640, -0.004230, 0.130244, 0.048937, -0.237610, 0.047015, 0.169491, -0.052202, -0.110368, 0.054130, 0.141104, 0.162724, 0.077302, 0.066602, -0.019985, 0.080380, -0.063480, 0.137754, 0.020014, -0.020710, -0.016570, 0.163107, 0.016510, -0.073509, 0.131526, 0.033925, 0.028869, -0.131579, 0.066234, 0.078319, 0.068022, 0.012350, 0.028638, 0.055763, -0.086470, -0.003168, 0.086005, -0.127419, 0.249569, 0.170088, 0.079450, 0.098307, -0.047465, 0.038319, -0.174703, 0.071241, -0.051041, 0.361091, -0.177457, -0.255743, -0.069479, 0.007318, -0.143058, -0.030989, -0.074541, 0.060116, 0.116512, 0.254897, 0.206813, 0.003123, 0.192738, 0.256886, -0.024673, -0.064632, -0.075880, -0.067851, 0.032404, -0.029927, 0.088634, -0.011410, 0.067950, 0.103418, 0.240739, 0.411755, 0.032260, 0.037538, 0.119218, 0.056500, 0.183433, -0.076908, 0.203991, -0.178696, 0.124893, 0.072449, 0.118127, -0.434608, 0.032103, -0.047983, -0.065079, 0.081345, 0.047497, 0.008905, 0.071908, 0.345312, -0.114261, 0.099362, 0.084180, 0.100986, 0.252172, 0.209050, -0.014048, 0.044424, -0.008811, 0.013253, 0.355716, 0.079686, 0.027133, -0.199236, -0.111589, 0.123739, -0.336348, 0.060685, -0.000232, -0.055091, 0.108141]
-,        [0.179861, 0.099279, -0.075647, -0.029669, 0.115784, -0.106920, 0.138423, -0.027702, -0.090541, -0.166260, -0.141073, 0.263023, 0.135187, -0.172696, -0.013875, 0.070202, 0.200196, 0.066666, -0.131607, 0.083563, 0.092973, 0.055791, 0.153680, -0.025000, -0.149009, 0.117916, -0.058628, 0.046232, 0.024340, 0.015351, -0.105945, -0.117144, -0.124530, 0.183833, 0.087020, 0.067464, 0.112129, 0.104067, -0.283943, 0.092548, 0.006586, -0.047303, 0.147683, 0.204640, -0.187043, 0.215945, 0.082880, -0.141624, 0.029800, -0.022120, -0.050974, 0.188280, 0.000873, 0.320169, -0.154717, 0.106075, 0.313055, 0.099892, -0.272889, 0.310240, 0.118954, 0.183152, 0.014887, -0.115084, -0.008292, 0.010466, -0.103582, 0.075118, 0.084821, -0.177707, -0.017477, 0.006401, 0.038492, 0.014760, -0.058086, -0.097803, -0.014161, 0.078832, 0.095724, 0.018126, 0.015837, -0.100300, 0.095734, -0.127054, -0.170187, -0.041671, 0.066101, 0.160369, 0.033406, 0.138816, -0.024115, -0.199174, -0.072441, 0.032719, -0.085521, 0.019926, -0.045946, -0.059563, -0.049864, 0.078798, -0.061031, -0.100543, 0.015581, -0.110386, 0.143960, -0.069990, -0.237405, 0.020995, -0.034135, 0.005222, 0.070025, 0.070376, -0.264035, 0.122935, 0.154967, 0.251466, 0.183648, 0.179864, -0.229599, 0.235715, 0.114844, 0.062427, -0.188659, -0.079219, 0.068174, 0.004905, -0.020937, 0.001563]
-,        [0.027538, 0.257530, 0.066675, -0.096621, 0.075170, 0.054988, 0.127845, 0.134056, 0.019004, 0.242489, -0.004263, 0.054425, 0.013133, -0.102150, -0.022917, 0.089480, 0.390668, -0.085285, -0.056325, 0.086947, -0.016118, -0.073732, -0.027083, 0.161673, -0.136470, -0.001081, 0.130187, -0.356286, -0.102768, -0.009160, 0.215613, -0.026245, 0.058173, -0.016080, -0.070085, 0.030890, 0.025372, -0.131003, 0.072101, 0.135256, 0.007424, 0.214326, 0.014883, 0.151753, -0.254032, -0.049191, -0.097364, 0.123208, 0.062311, -0.093554, -0.204111, -0.058203, -0.414904, 0.178003, -0.054114, 0.134550, -0.197604, -0.025005, 0.114854, -0.086152, 0.121969, -0.027964, 0.152814, 0.057082, -0.101862, 0.003443, -0.009350, -0.107384, -0.035323, 0.109946, -0.022267, 0.143396, -0.057706, 0.037270, 0.065484, -0.206011, 0.019068, -0.096293, 0.091665, 0.151218, 0.090928, 0.089883, -0.213890, -0.057262, 0.045707, 0.218102, -0.039282, 0.200212, -0.139912, 0.034792, 0.043645, 0.143921, -0.057106, 0.135578, -0.108374, -0.112179, 0.097067, -0.062563, 0.195087, 0.115279, -0.080873, 0.079520, 0.172962, -0.102554, -0.033399, 0.027919, -0.125416, -0.034036, -0.094155, -0.184267, 0.090560, 0.158692, -0.138706, -0.054480, -0.190650, 0.021484, -0.062004, 0.106360, 0.141990, 0.084416, -0.033210, 0.127410, -0.092294, -0.024846, 0.016887, 0.261296, -0.010516, 0.294676]
-,        [-0.028310, -0.014925, 0.007545, -0.203638, -0.014663, 0.020186, 0.140941, -0.206861, -0.041868, -0.331271, -0.068376, 0.170682, 0.002182, 0.113883, 0.197893, -0.068881, -0.142168, 0.036011, -0.125142, 0.012862, -0.272020, 0.048845, -0.063891, -0.123246, 0.006713, -0.036614, 0.136324, 0.026529, 0.044844, 0.066495, 0.118631, -0.078429, 0.410997, -0.041359, -0.054931, 0.157990, 0.094981, -0.044957, 0.089407, 0.137556, 0.055548, -0.203385, -0.037682, 0.065736, -0.094425, -0.032684, -0.129873, -0.105557, -0.184044, -0.209046, -0.077145, -0.004771, 0.098609, -0.059489, 0.253637, -0.004294, -0.011326, -0.111327, 0.159781, -0.114619, -0.250001, -0.130515, 0.036759, -0.164227, -0.087561, -0.074280, -0.028033, 0.006461, 0.206395, 0.057759, 0.120417, -0.039158, 0.071856, 0.170148, -0.156895, 0.079690, 0.121439, -0.035195, 0.067998, -0.179670, 0.030928, 0.230978, -0.018050, 0.041456, 0.183703, -0.056751, 0.059054, 0.171928, 0.010424, -0.011594, -0.205938, -0.124016, -0.034415, -0.129707, 0.055974, 0.035352, 0.013285, -0.037120, -0.010053, 0.261120, -0.008487, 0.010448, 0.092736, 0.152408, 0.204800, -0.170643, -0.070277, -0.192097, -0.008053, -0.274405, 0.011403, 0.025660, -0.016488, -0.150477, 0.175733, 0.003227, -0.074250, -0.147507, -0.046990, 0.030833, -0.173540, 0.028218, 0.045219, 0.067626, -0.372550, 0.153631, -0.074195, 0.136871]
-,        [0.129720, 0.054131, -0.088762, 0.214049, 0.209990, -0.078234, -0.103724, 0.076123, -0.255712, -0.001670, 0.068510, -0.122790, -0.096100, 0.011337, 0.073456, -0.213175, -0.236049, 0.036880, 0.165393, 0.042243, 0.061046, -0.024385, 0.002920, -0.046372, -0.103181, -0.150952, 0.012437, -0.127738, 0.091543, 0.025760, 0.196447, -0.144943, 0.038492, 0.125397, -0.115104, -0.053961, 0.101631, -0.077304, -0.026846, 0.040802, 0.195331, -0.001882, 0.337029, 0.098256, 0.400495, -0.013852, 0.130650, 0.046575, -0.161651, -0.041914, 0.041865, -0.038866, -0.019680, 0.303381, -0.006647, 0.023193, 0.001822, 0.137115, -0.232823, -0.103863, 0.010485, -0.128186, 0.096557, 0.062944, 0.085556, -0.143305, -0.083977, -0.093956, 0.093677, 0.043820, -0.007469, -0.280885, 0.096498, -0.018889, -0.007928, -0.079129, -0.113685, 0.027902, 0.008086, -0.073830, -0.059193, -0.051529, -0.243974, 0.026410, -0.096072, -0.192588, -0.177173, 0.000908, -0.119302, -0.076104, -0.024252, 0.208336, -0.201718, 0.050949, 0.015920, -0.130497, -0.032123, 0.290574, 0.072322, 0.098544, -0.080341, 0.036129, -0.220912, 0.083547, -0.095089, -0.031955, -0.136805, -0.040524, -0.139711, 0.021708, 0.013445, -0.007690, 0.172271, 0.106046, -0.276193, -0.144380, 0.190665, 0.115840, 0.005305, 0.333619, -0.203494, 0.092697, -0.185192, -0.025501, -0.038205, -0.010328, -0.076455, -0.040232]
-,        [-0.111840, -0.203882, -0.105223, -0.125904, -0.037630, 0.042269, 0.112860, -0.146591, -0.014791, 0.011871, -0.039906, 0.173078, 0.132755, -0.124380, 0.191440, 0.072274, 0.047697, 0.135187, 0.034340, -0.117606, -0.219182, -0.004799, -0.157834, -0.097274, 0.174058, 0.103968, 0.119655, -0.074021, 0.071760, 0.032232, -0.076304, 0.075139, -0.169626, 0.112192, 0.030170, -0.009964, 0.050144, -0.331393, 0.133805, -0.228320, -0.204221, 0.212844, -0.297584, -0.268184, -0.090228, 0.195750, 0.037060, -0.207648, 0.096843, -0.110085, 0.124701, 0.029366, 0.299422, 0.237340, -0.055995, 0.125682, 0.007611, -0.029624, 0.015706, -0.133407, 0.019766, -0.069101, 0.045068, 0.156996, 0.024223, -0.072374, 0.034375, -0.224483, 0.001035, 0.061810, -0.055188, -0.138390, -0.007514, -0.030324, 0.067980, -0.116817, 0.243062, 0.002773, -0.124594, 0.170698, -0.103675, -0.094001, -0.135467, 0.108951, 0.323091, 0.052688, -0.046555, 0.330298, 0.216357, 0.120800, 0.011409, 0.059921, -0.206135, 0.082676, -0.092700, -0.018464, -0.035442, -0.009662, 0.105692, -0.055584, -0.044435, -0.076956, 0.036968, -0.014232, -0.055111, -0.125977, -0.039363, 0.202200, 0.200220, -0.104333, 0.267881, 0.013543, 0.111277, 0.026050, 0.010858, 0.059891, 0.245186, 0.114614, 0.140468, 0.104941, -0.061593, -0.070379, -0.024981, 0.068117, 0.060117, -0.047720, 0.111756, -0.046637]
-,        [0.004576, 0.070962, -0.060515, 0.150092, -0.065921, -0.024624, 0.122878, 0.060530, 0.008068, 0.129146, 0.120720, -0.040711, 0.033278, -0.049153, -0.129366, -0.236193, -0.063829, -0.053548, -0.020437, 0.030696, -0.064343, 0.357520, -0.247979, 0.016038, -0.077166, 0.200553, 0.157336, -0.001208, -0.037594, 0.038175, 0.035986, -0.283949, 0.167378, 0.024491, -0.155786, 0.111400, -0.203046, -0.246714, 0.134075, 0.062207, 0.062631, -0.164954, -0.214248, 0.029194, -0.166936, 0.030960, -0.086517, 0.167560, 0.030116, 0.136047, -0.002151, 0.227924, 0.004574, -0.140324, 0.058286, 0.051235, -0.057347, -0.161554, -0.044509, -0.041826, 0.043180, 0.069229, 0.111073, -0.173647, -0.011490, -0.212475, -0.028249, -0.113863, 0.100449, 0.100165, -0.028356, -0.216004, -0.118219, 0.164956, -0.100377, 0.249444, 0.128448, 0.166296, -0.069854, -0.019801, 0.140643, -0.145186, 0.076025, 0.049476, -0.294298, 0.079282, -0.219017, 0.043893, -0.126384, -0.029304, 0.116974, 0.266657, 0.050585, -0.022499, 0.201146, 0.036154, -0.108804, -0.008695, -0.099548, 0.043873, 0.101402, -0.220931, 0.047315, -0.123550, 0.090326, 0.248982, -0.060553, 0.170177, -0.020334, 0.234454, 0.126138, 0.121457, -0.093000, 0.051005, -0.007400, 0.119396, -0.027157, 0.193192, 0.055014, 0.100457, -0.054471, 0.092354, -0.191449, -0.093486, 0.028948, 0.096724, 0.105081, -0.138895]
-,        [0.115975, -0.350452, 0.200005, 0.080647, 0.008140, -0.042205, 0.096419, -0.051430, -0.048106, 0.007679, 0.076771, -0.007658, 0.047425, -0.043480, 0.023751, 0.265321, 0.116267, 0.104055, -0.021864, -0.061440, -0.068550, 0.087726, -0.198668, 0.183046, 0.098222, -0.220729, -0.037846, 0.000717, -0.055802, 0.051856, -0.142200, 0.113298, -0.060830, -0.092536, -0.033607, -0.101517, 0.023626, -0.040044, 0.134563, -0.228176, -0.066860, -0.128704, 0.015972, 0.080689, 0.217585, -0.124710, 0.039633, -0.227486, -0.031724, 0.073842, 0.051734, -0.001826, 0.002573, -0.019286, -0.105956, -0.156237, -0.031984, 0.220525, 0.075070, -0.016406, -0.008680, -0.024544, 0.088184, -0.197456, 0.089270, -0.013946, -0.211409, 0.365632, -0.218804, -0.026984, -0.224843, -0.187341, -0.028000, 0.068605, 0.013646, 0.060788, 0.163364, 0.127287, 0.050446, -0.085260, -0.056752, 0.171370, -0.049306, -0.083533, -0.211126, 0.108774, -0.260641, -0.037755, -0.057975, 0.210146, 0.165410, 0.025791, -0.145976, 0.069644, -0.122942, 0.218639, -0.037926, -0.031819, -0.076011, -0.055389, -0.036026, -0.171128, 0.089529, 0.260816, 0.148366, -0.021017, -0.078897, -0.219748, 0.216223, -0.083879, -0.000633, -0.118590, -0.011195, -0.031220, 0.027982, -0.006896, -0.059756, 0.165841, 0.123520, 0.013290, 0.094989, 0.113200, 0.079054, -0.006178, -0.092428, 0.177744, 0.125831, 0.151474]
-,        [0.025983, -0.123873, 0.014955, 0.085545, 0.125220, -0.231461, 0.115670, -0.080968, 0.126639, 0.037523, 0.066664, 0.032492, -0.193313, -0.024670, -0.027573, -0.015125, -0.167761, 0.129178, -0.081327, -0.079919, -0.103750, 0.143028, 0.033473, -0.005836, 0.103545, 0.075916, -0.083770, 0.006319, -0.031839, 0.090616, 0.002599, 0.103666, -0.213050, -0.130158, 0.040468, 0.219563, 0.076662, -0.085959, -0.166887, 0.374090, 0.017203, 0.013582, 0.080733, 0.221080, -0.020394, -0.008494, 0.378356, 0.227364, 0.127428, 0.301207, -0.035636, 0.040271, -0.008184, 0.131859, -0.096903, 0.240133, -0.143078, 0.035671, -0.009444, -0.005791, -0.053163, -0.244950, 0.160089, 0.031740, -0.011055, 0.037084, -0.173516, -0.001902, -0.129968, 0.038747, -0.134821, -0.015172, 0.094129, -0.052287, -0.080265, 0.071668, 0.065866, -0.065336, -0.125466, 0.033390, -0.035240, 0.102902, 0.026925, -0.105348, 0.264122, 0.106745, -0.060283, -0.079508, -0.057157, 0.144077, 0.094075, -0.142350, -0.274325, -0.015126, 0.215326, 0.180395, 0.103951, -0.052897, 0.046502, 0.179334, 0.166098, -0.125264, 0.085924, 0.051133, 0.126298, -0.059079, 0.255725, 0.175385, -0.184132, 0.066034, 0.018554, 0.082133, -0.111944, 0.008291, -0.160558, -0.146454, 0.110551, -0.139800, -0.147105, -0.234921, 0.029416, -0.007631, 0.266503, -0.204822, 0.076398, 0.059566, 0.040878, -0.025580]
-,        [0.115620, 0.076293, -0.234534, 0.103735, -0.018816, -0.022519, -0.001878, 0.001330, 0.209502, 0.143693, -0.212120, 0.111412, -0.011969, -0.005534, 0.174619, -0.090617, -0.088139, 0.150850, -0.182985, 0.036520, -0.011576, 0.101184, 0.073038, 0.041308, 0.075697, 0.055711, 0.002598, -0.075449, -0.068585, 0.112604, -0.006144, 0.154914, -0.052581, -0.010667, 0.046334, -0.129927, 0.195887, 0.270088, 0.014795, -0.187894, 0.100147, -0.148632, -0.275226, 0.231933, 0.014890, 0.007313, -0.115031, 0.120789, -0.181353, 0.109571, -0.187604, -0.196871, -0.111586, -0.052925, 0.065251, 0.061576, 0.065562, 0.144136, 0.053285, 0.004721, -0.107858, -0.119889, 0.108133, -0.023958, 0.155484, 0.014314, -0.013925, 0.019191, 0.188161, -0.228743, -0.111611, 0.035894, -0.055363, -0.056572, 0.021879, -0.058107, -0.187342, 0.343209, -0.134436, 0.100945, 0.097343, -0.072989, -0.159711, 0.078321, 0.040084, -0.298853, 0.126488, -0.023938, -0.154819, -0.142759, -0.113977, 0.068253, -0.047075, 0.193803, -0.042293, -0.055261, -0.066972, 0.065624, -0.249236, -0.069501, 0.175141, -0.362284, 0.089837, 0.039346, -0.126184, -0.193988, 0.159147, 0.124032, 0.162712, -0.116932, -0.107050, 0.112208, -0.026266, 0.030581, -0.072784, -0.055240, -0.105507, -0.070580, 0.028784, -0.112948, -0.127010, 0.118088, -0.214560, 0.080114, 0.047448, 0.077508, -0.130186, -0.028396]
-,        [0.020237, 0.155872, 0.198755, -0.077012, -0.032754, 0.261911, -0.078414, -0.046918, 0.091895, -0.027501, -0.081484, 0.176442, 0.043398, 0.107336, -0.108701, 0.075150, -0.075573, 0.014570, 0.156980, -0.031606, -0.070284, -0.040636, -0.276399, 0.006346, 0.056550, -0.092223, -0.056040, -0.050240, 0.001087, -0.021549, -0.139607, 0.108994, 0.214058, 0.075445, -0.077522, 0.122094, 0.152223, -0.039472, 0.111144, -0.046776, -0.273385, -0.061374, -0.106968, -0.012187, 0.060271, -0.112112, 0.038559, -0.063089, 0.050887, -0.026985, 0.082731, -0.000419, -0.289251, 0.355374, 0.103730, -0.019786, 0.097986, 0.029724, -0.023405, -0.036345, 0.062726, -0.131720, -0.002537, 0.240673, 0.040329, -0.057388, -0.169220, 0.058298, 0.130710, 0.084744, 0.004489, 0.029672, -0.010398, 0.087769, 0.171395, -0.064387, 0.013784, 0.039961, -0.189492, -0.052474, 0.185739, 0.177056, 0.198733, 0.036731, -0.062950, -0.137097, 0.164932, -0.197429, -0.126002, 0.073705, 0.079652, -0.000176, -0.029595, 0.040029, -0.049623, 0.015997, 0.045220, -0.161180, -0.102977, 0.113952, 0.099604, 0.016044, -0.178193, -0.136615, 0.003978, 0.022947, -0.102483, -0.024584, -0.112313, 0.113408, 0.174444, 0.126287, 0.090648, 0.454765, 0.005839, -0.102868, -0.229784, -0.201865, -0.184765, 0.212457, -0.101985, -0.016513, 0.172234, 0.055001, 0.125294, -0.128326, -0.038889, -0.072317]
-,        [0.031395, 0.036998, 0.094133, 0.053948, 0.243366, -0.021584, -0.091164, 0.143567, -0.040631, 0.173989, -0.086025, 0.214733, -0.284333, -0.183973, -0.172284, 0.167801, -0.072819, -0.149964, -0.084200, 0.174647, 0.131058, 0.067123, -0.049555, -0.149152, -0.069179, -0.044116, -0.050327, 0.094198, 0.003648, 0.033164, 0.020086, 0.094202, 0.096576, 0.008877, 0.001881, -0.097184, 0.154634, 0.060187, 0.328556, 0.123959, -0.029977, 0.169565, 0.025506, 0.181356, -0.104587, 0.108833, 0.225152, -0.011066, -0.008850, -0.241627, -0.132764, 0.081295, 0.240986, -0.132216, 0.011071, 0.077232, -0.198905, -0.062078, 0.043519, 0.060832, 0.003493, 0.153283, 0.154304, 0.006077, -0.016296, -0.020207, 0.127890, -0.144237, -0.106518, 0.028626, -0.007382, 0.071801, 0.114511, 0.274397, -0.158218, -0.280914, -0.061319, 0.011393, -0.204334, -0.152464, 0.051575, -0.044846, 0.034378, 0.024960, 0.103629, -0.091479, -0.077253, 0.024340, 0.104791, -0.120413, 0.344413, -0.001099, -0.168177, -0.057407, 0.099577, -0.052634, 0.059218, -0.007900, 0.188439, -0.036720, 0.119181, -0.293347, -0.093653, 0.133233, 0.005496, 0.018514, 0.067842, -0.190861, 0.144397, 0.006959, -0.110011, -0.075791, 0.120370, 0.059133, 0.102367, 0.048219, 0.107363, -0.013869, 0.149179, 0.157651, 0.006399, -0.061024, 0.014590, 0.211622, 0.139909, -0.203825, -0.132043, -0.117336]
-,        [-0.189045, -0.132993, 0.066464, -0.062370, 0.050047, -0.090807, 0.096084, 0.073288, -0.117082, -0.043206, 0.002092, 0.038810, 0.161220, 0.057168, -0.074435, -0.171212, 0.091531, 0.185939, -0.179960, -0.149675, 0.022167, -0.007736, -0.162727, -0.254927, 0.249851, -0.206286, 0.097328, -0.058777, -0.164002, 0.134041, -0.067606, 0.230849, 0.094523, -0.000924, 0.001476, 0.066304, -0.304817, -0.027581, -0.198224, 0.157824, 0.159015, -0.272428, 0.063933, 0.066360, -0.029632, -0.094916, -0.074995, 0.112809, 0.256383, -0.019492, 0.041988, 0.098039, -0.107088, 0.049222, -0.131422, -0.034186, -0.047562, -0.285245, 0.166351, 0.036600, -0.023578, 0.024456, 0.048830, 0.051974, 0.058118, 0.013253, 0.220084, -0.063700, -0.058565, -0.021563, -0.091900, 0.147947, 0.036593, 0.156314, -0.001826, -0.051121, 0.170431, -0.134539, 0.042462, 0.071517, -0.205113, 0.264537, 0.106895, -0.037133, -0.247913, -0.149853, 0.125185, -0.151107, 0.104500, -0.140231, 0.065472, -0.015469, -0.176866, 0.108524, -0.093276, 0.064717, 0.224590, 0.063810, 0.070617, -0.070052, -0.056626, 0.083012, 0.043528, 0.185705, 0.007873, 0.174244, -0.087610, 0.235910, 0.172471, -0.095529, -0.121918, -0.058999, 0.192349, 0.032305, 0.015225, 0.015257, 0.076343, -0.003788, -0.134482, 0.041056, -0.220698, 0.003798, -0.170744, -0.066920, 0.055119, 0.288549, -0.112699, -0.246780]
-,        [-0.129105, -0.075395, 0.235898, 0.146634, 0.160696, -0.134581, -0.089618, -0.136221, 0.206723, 0.027916, 0.074542, -0.104769, -0.098095, -0.122854, 0.183063, -0.138524, -0.175539, -0.056624, -0.070322, -0.008975, 0.121871, 0.007038, -0.197876, -0.005928, 0.235409, 0.271792, 0.089426, -0.081564, 0.137263, 0.067717, 0.267797, 0.022743, -0.134715, 0.083789, 0.160860, 0.055368, -0.212794, 0.061273, 0.149375, -0.055410, -0.006255, -0.263973, 0.122006, 0.193600, -0.175027, 0.003672, 0.087950, -0.013962, 0.161672, -0.021884, -0.133923, 0.077983, -0.019637, 0.075344, -0.078761, 0.071421, -0.015483, 0.003594, 0.166932, -0.037781, 0.172155, 0.041937, 0.038292, 0.047806, 0.120624, -0.175384, 0.022608, 0.185597, -0.137840, -0.104963, 0.004647, 0.091790, 0.075443, -0.196040, 0.154197, -0.045739, -0.014374, 0.081062, -0.073573, 0.055959, -0.127601, 0.254462, -0.090050, -0.014259, 0.173386, -0.067702, 0.074706, 0.144077, 0.091675, 0.125742, -0.228657, -0.142161, 0.292212, -0.078954, 0.041812, -0.071538, -0.180533, -0.144747, 0.188911, 0.265194, -0.078147, 0.094092, 0.020469, -0.032485, -0.093921, -0.022224, -0.154139, 0.069645, 0.050108, -0.004066, 0.122871, -0.083701, 0.212547, 0.018092, 0.125769, 0.180052, -0.364308, -0.055745, 0.171039, 0.334498, 0.006361, 0.144925, -0.022328, 0.000311, 0.003628, -0.076322, 0.049147, -0.066070]
-,        [0.209639, 0.071363, 0.017678, -0.094304, -0.084978, -0.155815, -0.053954, 0.137906, -0.192829, 0.146276, 0.290804, -0.046243, -0.337218, -0.079897, 0.148929, 0.003103, -0.241118, 0.075865, 0.287183, -0.111166, 0.093229, -0.144673, 0.101781, 0.060972, 0.189546, -0.001599, -0.106859, 0.062197, 0.005642, -0.063706, -0.129650, 0.184717, -0.049512, 0.189153, 0.130856, 0.148909, -0.098344, -0.123609, -0.084200, -0.085403, -0.243917, -0.072225, 0.006649, -0.049844, -0.164646, 0.175205, -0.076401, 0.098705, -0.179502, 0.098050, -0.081847, -0.072637, 0.000483, 0.154272, -0.124847, -0.145056, 0.052649, -0.164906, -0.073745, 0.229394, 0.087410, 0.084982, 0.003883, -0.197994, 0.043079, 0.128768, 0.042197, -0.179654, -0.000699, 0.206638, -0.200233, 0.022744, -0.066145, 0.135358, -0.302148, 0.220018, -0.031762, 0.002501, 0.199336, 0.051655, 0.172757, 0.061752, -0.092217, -0.021601, 0.124174, 0.094670, -0.007598, 0.072133, -0.199919, -0.047899, -0.178933, -0.049760, -0.102732, -0.064654, 0.016903, -0.023737, -0.256717, 0.051249, -0.027881, -0.073219, 0.086327, 0.119429, -0.181417, 0.045963, 0.098335, 0.156267, 0.118611, -0.106576, 0.129634, -0.097082, 0.079326, -0.048666, -0.057329, 0.232048, 0.027956, 0.114957, -0.133584, -0.068107, 0.130621, -0.219423, -0.137148, 0.100552, -0.018764, 0.091524, -0.078758, -0.038324, -0.051479, 0.080186]
-,        [0.018751, 0.126179, 0.058134, 0.150943, -0.200626, 0.119646, 0.036526, 0.174584, 0.110688, -0.011092, 0.199567, 0.097237, -0.024260, -0.297646, 0.049387, 0.014857, -0.190340, -0.107770, -0.182721, 0.087876, -0.142800, 0.049763, -0.183844, 0.057581, -0.005692, -0.013219, -0.129549, -0.074797, 0.102834, 0.197814, -0.118647, -0.189148, 0.109944, -0.148774, -0.058746, -0.005738, -0.008087, 0.147382, -0.185224, -0.108644, 0.026942, -0.244295, -0.107385, -0.182971, 0.250658, 0.213462, -0.093877, 0.354888, -0.063399, -0.009408, -0.039353, -0.122831, -0.186828, 0.036830, 0.002897, 0.068181, -0.190924, -0.017364, -0.067953, -0.218164, 0.087350, -0.058828, -0.285722, -0.055432, 0.094323, 0.020881, 0.097041, 0.039062, -0.263387, -0.002328, 0.010073, 0.066624, -0.034898, -0.004113, -0.182173, -0.072340, -0.103725, -0.050582, 0.134555, -0.153326, 0.190896, 0.055015, 0.030558, 0.064917, 0.029782, -0.021049, -0.087428, 0.174060, 0.182585, 0.130975, -0.042178, -0.096849, -0.053592, -0.153219, -0.236417, 0.029543, -0.149358, 0.031031, 0.171310, -0.153794, -0.007737, 0.023165, 0.039798, 0.212128, 0.146593, -0.062442, 0.001545, 0.164720, -0.229273, -0.099422, 0.036322, -0.048336, 0.096291, -0.059650, 0.170127, -0.042848, -0.024440, 0.224935, -0.071411, 0.075980, -0.031269, -0.048707, 0.028837, -0.052486, 0.268900, -0.099188, 0.061845, -0.016257]
-,        [-0.122511, -0.074399, -0.041037, -0.111477, 0.085667, 0.063174, -0.140160, -0.041854, -0.208882, 0.020427, -0.137054, -0.197603, 0.246911, -0.179475, -0.283447, 0.126660, -0.051016, 0.177157, -0.057885, 0.093080, 0.149912, -0.257645, 0.008912, 0.042296, -0.107000, 0.019190, -0.004973, -0.069902, 0.243038, 0.169422, -0.035381, 0.062202, 0.073999, -0.050098, 0.222544, 0.100260, -0.218929, -0.224782, 0.122859, -0.163354, -0.065933, -0.132813, 0.026895, 0.113826, 0.099201, 0.077746, -0.122705, 0.151472, -0.026404, 0.038870, -0.012531, 0.064030, 0.079882, 0.057199, 0.230101, -0.072955, -0.143577, -0.170228, -0.092164, 0.124070, 0.022317, -0.094348, 0.124139, 0.050912, 0.033987, 0.194696, 0.013547, 0.029087, 0.077378, 0.074134, 0.199873, 0.048006, 0.077881, -0.230076, -0.040589, 0.376793, 0.174681, 0.153992, -0.261040, -0.064690, 0.044618, 0.160602, -0.112466, -0.126027, 0.105750, -0.115861, -0.046812, -0.178504, -0.137772, -0.010722, -0.103477, -0.144899, -0.168958, -0.325724, -0.140006, -0.083360, 0.201666, -0.125134, 0.086353, 0.014167, -0.007925, -0.090694, -0.138911, -0.021272, 0.092331, 0.165344, 0.014100, 0.080687, 0.013314, -0.028598, -0.011920, -0.129893, 0.037499, -0.093671, -0.079310, 0.035059, 0.061175, 0.117040, -0.096954, -0.065081, -0.154917, 0.148272, -0.129060, 0.038351, 0.040307, -0.086353, 0.046519, 0.220379]
-,        [-0.164522, -0.020869, 0.219709, 0.047325, -0.134970, 0.147517, 0.098520, -0.145932, -0.150982, -0.005716, -0.084949, -0.274294, -0.146732, -0.089262, -0.065222, 0.029659, 0.006684, 0.025878, 0.075438, -0.198739, -0.056769, -0.094203, -0.132198, 0.102285, 0.190050, 0.190058, 0.079029, -0.138316, -0.196761, -0.016544, -0.113046, -0.057563, 0.240462, -0.078830, 0.024810, -0.198861, 0.124742, 0.183146, -0.032008, 0.140184, 0.131956, 0.263771, 0.222425, 0.020504, 0.057017, 0.136348, 0.011001, -0.066548, -0.069267, 0.330635, -0.039717, 0.213064, -0.066363, -0.021225, -0.036157, -0.002611, -0.078996, 0.125868, 0.014495, 0.040547, 0.012989, -0.176464, 0.046879, -0.093201, -0.051654, 0.238142, 0.193662, 0.163319, 0.308923, -0.104993, 0.189366, 0.072674, -0.071129, -0.080688, -0.126106, -0.008779, -0.139743, 0.016192, -0.291069, 0.005946, 0.057993, -0.115044, -0.120686, 0.042302, -0.000227, -0.019516, -0.125319, 0.178317, 0.077738, 0.018965, -0.044125, 0.160954, -0.137388, 0.142276, 0.025145, 0.172834, -0.040273, 0.042061, -0.002817, 0.206204, 0.077168, 0.117080, 0.205530, 0.142486, 0.078052, -0.054929, 0.003957, -0.037162, 0.109286, 0.000511, 0.147483, 0.041766, 0.029940, 0.161722, 0.170117, 0.223573, 0.246931, -0.121976, -0.086676, -0.169584, 0.000015, 0.068546, -0.102976, 0.050855, -0.195140, -0.099520, 0.108355, -0.019477]
-,        [0.004820, 0.070205, 0.111848, -0.003285, 0.069183, -0.236939, -0.139673, 0.066194, -0.016224, 0.162075, 0.059433, -0.172213, -0.123424, -0.027837, 0.079122, 0.006877, 0.234373, -0.095852, 0.002446, 0.047664, -0.099182, -0.078095, -0.097720, 0.071215, -0.231209, 0.312358, 0.148700, 0.129955, -0.013329, -0.038865, 0.077615, 0.087467, -0.132127, 0.199391, -0.153924, -0.175969, -0.190284, 0.019146, -0.230648, -0.200238, -0.017728, 0.025225, -0.143094, -0.167626, -0.166037, 0.028451, 0.242218, -0.054251, 0.059026, 0.111735, 0.014265, -0.013331, -0.012167, -0.130973, 0.094213, -0.067046, 0.096974, 0.005904, 0.035699, -0.105410, -0.043013, -0.285349, 0.326363, -0.174798, -0.086854, -0.006192, -0.036891, -0.079652, -0.062576, -0.010404, 0.136339, -0.001099, -0.028300, 0.097551, -0.027206, 0.003163, 0.118543, -0.168989, 0.044692, -0.110175, -0.071066, 0.060370, -0.038561, 0.062651, -0.172512, -0.139268, 0.305874, 0.131623, -0.085886, 0.234959, -0.025395, -0.075599, -0.016509, -0.074555, -0.175874, -0.071551, 0.165240, -0.151524, 0.015094, -0.063217, 0.083196, -0.033936, 0.029862, 0.151571, 0.047876, -0.125084, -0.038328, -0.239541, -0.171013, -0.000332, -0.078712, 0.015734, 0.054322, -0.015011, 0.020533, -0.045505, 0.059967, -0.154951, -0.163226, 0.192615, -0.272049, 0.061203, -0.144238, 0.094269, 0.211282, -0.211492, -0.004018, -0.100139]
-,        [-0.032431, -0.066136, -0.195255, 0.218684, -0.080005, 0.023423, -0.121837, 0.227906, -0.146956, -0.201947, -0.026049, 0.030633, 0.080435, -0.024183, 0.017147, 0.177052, -0.069350, 0.055001, 0.175831, 0.066580, -0.023178, -0.089417, -0.016670, 0.027511, 0.113078, 0.047973, -0.021608, 0.079311, -0.076178, -0.007821, 0.028941, -0.018723, -0.129752, 0.051118, -0.623758, -0.078634, -0.072281, -0.076536, 0.242377, 0.175932, 0.013395, -0.065010, -0.152902, 0.264430, -0.149128, -0.119897, 0.166474, 0.042136, -0.024882, 0.188439, 0.063970, 0.078125, 0.049887, 0.180363, -0.012250, -0.084940, -0.062700, -0.201321, 0.072866, 0.084736, 0.009549, 0.132385, -0.117897, 0.036954, -0.113212, 0.061601, 0.107672, -0.079771, -0.011361, 0.092722, 0.111580, -0.027298, 0.013961, -0.145289, -0.000391, 0.044655, -0.088218, 0.064704, 0.244832, -0.103226, 0.010542, 0.206741, -0.027736, 0.013338, 0.051499, 0.083007, -0.071526, 0.078077, -0.063857, -0.088490, 0.051266, -0.279472, 0.011789, 0.124720, -0.257510, 0.022600, -0.113546, -0.072698, -0.099185, 0.000728, 0.007596, 0.011261, -0.024795, 0.104794, -0.170828, -0.108999, 0.032248, 0.052025, 0.102151, -0.214763, -0.014823, -0.066809, -0.202298, -0.088666, 0.091146, -0.102423, 0.029188, -0.230799, -0.096928, 0.191330, 0.357335, -0.034382, -0.135659, -0.011655, -0.016238, -0.039785, 0.146643, -0.058774]
-,        [0.128831, -0.116766, 0.022270, -0.076539, 0.093438, 0.034547, 0.086547, 0.064491, 0.143412, 0.076604, -0.229920, -0.082790, 0.140185, 0.048524, -0.076346, -0.092829, -0.254133, 0.189703, 0.014207, -0.089991, -0.024351, -0.188635, -0.078210, 0.370176, -0.000831, -0.011269, -0.209095, 0.268844, 0.008591, -0.131243, 0.020921, 0.084004, 0.097145, -0.035149, -0.211397, 0.233509, 0.163092, -0.076643, 0.150489, -0.047302, 0.077583, 0.242059, 0.159464, -0.136197, -0.138098, 0.062567, -0.117509, -0.040588, -0.121965, -0.180741, 0.017056, 0.122635, -0.175202, -0.122980, 0.085612, 0.255534, -0.084004, -0.041612, -0.053934, 0.029418, 0.020306, 0.055798, 0.152636, -0.090305, -0.061614, 0.061692, 0.159522, -0.012933, -0.285735, -0.250205, -0.093297, 0.050278, 0.073110, 0.154202, 0.053495, -0.031576, 0.007490, 0.172719, 0.053343, 0.178075, -0.213134, -0.114723, -0.083302, -0.153555, -0.042226, 0.039534, 0.114495, 0.195422, 0.209840, 0.010108, -0.066037, -0.071530, -0.168542, -0.143819, 0.192146, 0.034735, -0.011878, -0.091817, -0.113259, 0.085267, 0.058200, 0.214543, -0.012060, 0.022571, -0.161016, -0.115070, 0.244791, 0.080523, 0.019789, -0.086012, 0.106611, 0.148013, 0.086750, 0.012158, 0.177682, 0.065588, 0.056068, 0.193643, -0.028874, 0.180014, 0.063396, 0.081155, 0.056321, -0.028750, -0.100926, -0.150407, 0.091523, -0.046123]
-,        [0.077705, 0.124402, -0.015508, -0.016091, -0.021731, -0.209236, -0.019718, -0.069779, 0.062956, -0.134519, -0.069550, -0.183122, 0.125995, 0.023146, 0.076293, 0.042108, 0.034408, 0.054258, 0.086085, -0.028960, -0.165365, 0.334675, 0.051417, -0.030551, -0.036355, 0.134207, -0.137386, -0.057380, 0.120151, 0.075721, -0.102256, 0.260765, 0.073045, -0.035030, -0.187826, 0.295319, 0.236149, -0.090151, -0.013019, -0.045879, 0.028544, -0.098604, -0.200746, 0.100422, -0.081983, -0.114778, -0.146290, -0.021178, 0.153567, 0.074584, 0.083789, 0.071589, 0.041584, -0.116711, -0.118219, -0.125638, -0.281180, -0.059586, -0.005600, 0.087373, -0.076272, 0.031500, 0.079860, 0.161900, 0.189000, -0.031150, -0.117067, 0.052943, 0.152933, 0.220192, 0.009660, 0.067714, 0.159429, -0.224559, -0.044960, 0.041050, -0.257599, -0.153267, -0.048793, 0.110759, 0.021132, -0.103402, -0.046188, 0.089198, 0.060314, 0.003451, 0.087107, -0.156367, 0.132860, 0.003052, 0.113615, 0.231658, -0.118462, 0.068750, -0.096681, 0.009405, -0.105613, 0.013178, 0.139161, -0.053873, -0.005166, 0.254039, -0.002286, -0.001563, -0.018583, -0.069555, 0.019768, -0.334061, -0.180768, -0.107613, -0.140458, 0.028895, 0.114605, -0.056661, 0.349371, 0.194040, 0.054805, 0.144071, 0.035448, 0.191214, -0.140089, 0.110735, 0.030311, -0.034823, 0.053383, -0.130601, -0.039281, 0.065529]
-,        [-0.029417, -0.036645, 0.072771, 0.091306, 0.099639, -0.006417, 0.131735, -0.006501, -0.117202, 0.202894, -0.081435, 0.047790, 0.052087, 0.106335, -0.082240, 0.008240, -0.080026, -0.048572, -0.058705, 0.078702, -0.010414, -0.190291, 0.018691, 0.026682, -0.140508, -0.096772, -0.254279, -0.002676, 0.110471, 0.117396, -0.116403, -0.163783, -0.049710, 0.007478, -0.129722, 0.094248, 0.206642, -0.193307, -0.285027, 0.064405, -0.124754, -0.155446, -0.024687, -0.226736, -0.112786, 0.005993, 0.070133, -0.184466, -0.067792, -0.146427, -0.147337, -0.157135, 0.172981, -0.029218, 0.001222, -0.149530, -0.141653, -0.038188, 0.066145, 0.126893, 0.149234, 0.055680, -0.012272, -0.117956, 0.185955, -0.013439, -0.002772, -0.039751, -0.037709, -0.244276, 0.367932, -0.142430, 0.187266, -0.102097, 0.091611, -0.056392, -0.079522, -0.314513, 0.183876, 0.079771, 0.323093, 0.112284, -0.131224, -0.132085, -0.055153, 0.085465, 0.026355, -0.090727, -0.056344, 0.084516, -0.126778, 0.265031, 0.127430, -0.052650, -0.063400, 0.089676, 0.036792, 0.015547, 0.084562, 0.073039, 0.104713, -0.155396, 0.203839, 0.073208, -0.115924, 0.017542, -0.039351, 0.207273, 0.187231, 0.128579, -0.013546, -0.091138, -0.024871, -0.058689, 0.071224, -0.026414, 0.061139, -0.282567, 0.013059, 0.108999, -0.110107, 0.323081, 0.115947, -0.102564, 0.021326, -0.000899, 0.075371, -0.121115]
-,        [0.148686, -0.046054, 0.158853, 0.157814, 0.078155, 0.061239, 0.000041, 0.213974, -0.017948, 0.170863, -0.047898, -0.041687, 0.003191, -0.033891, 0.087680, -0.059272, 0.202348, 0.050117, 0.108165, 0.142023, -0.094843, 0.190906, -0.041622, 0.046210, 0.216353, -0.037866, -0.172556, 0.150815, -0.078298, -0.034863, -0.031891, 0.169075, 0.001507, -0.111880, -0.008677, 0.205707, 0.199738, 0.096311, 0.157838, -0.155645, 0.030456, -0.063146, -0.006914, 0.180665, 0.123664, -0.021268, 0.182690, 0.053045, -0.127354, -0.102886, 0.056551, 0.000734, 0.081488, 0.020626, 0.338689, 0.003285, -0.070642, -0.004570, 0.050322, 0.038686, 0.141869, 0.081072, -0.084169, 0.108994, 0.089639, 0.039412, 0.155741, -0.108182, -0.206956, 0.142820, 0.001161, -0.181795, -0.099318, -0.225504, -0.203364, 0.060911, 0.205971, -0.042361, 0.137502, 0.093886, 0.100828, 0.258580, 0.010924, 0.038571, 0.008776, 0.038922, -0.096960, 0.115457, 0.060515, -0.047587, -0.230029, 0.015720, 0.085785, 0.080513, 0.095223, -0.146220, 0.177516, -0.187000, 0.018799, -0.030167, -0.012124, 0.365263, 0.291224, -0.093274, 0.000965, -0.164525, -0.154960, -0.045425, 0.107334, 0.360405, 0.071535, 0.326148, 0.101008, -0.031675, -0.064792, 0.145045, 0.118716, -0.032984, -0.158604, -0.237373, -0.202119, -0.155963, -0.157283, -0.075804, -0.015380, 0.209087, 0.131266, -0.047697]
-,        [0.035189, -0.076733, 0.020007, 0.050896, 0.143066, 0.117423, 0.051345, 0.273105, -0.117558, -0.101359, -0.029714, 0.049072, 0.038538, 0.086239, 0.008627, -0.259727, -0.157214, 0.018058, 0.117698, 0.218486, -0.271351, -0.027648, 0.074012, -0.062991, 0.152641, 0.098445, 0.055142, 0.045349, 0.019238, -0.069923, -0.106188, 0.098375, 0.231927, 0.020715, -0.037268, 0.034141, 0.292871, -0.144543, -0.113956, 0.207742, 0.026705, 0.154362, -0.088644, 0.144984, -0.143133, 0.104937, -0.137537, 0.124170, 0.148341, -0.020803, -0.015230, -0.060271, -0.043692, 0.106525, 0.064786, 0.207676, 0.230000, 0.348696, 0.032435, 0.127710, 0.135790, 0.248808, 0.163258, -0.099734, -0.008089, 0.283231, 0.049738, 0.049275, -0.208170, 0.206838, 0.194336, -0.038586, -0.212802, -0.152667, 0.160852, 0.114404, 0.069704, 0.038371, -0.084550, 0.051393, -0.013493, -0.204679, -0.047005, 0.094373, 0.067916, -0.097756, 0.169247, -0.027012, -0.100852, 0.184761, 0.027961, 0.215157, 0.119551, -0.056242, 0.067925, -0.004900, 0.037665, -0.098282, -0.023975, -0.254902, 0.031449, 0.030822, 0.096208, 0.379021, 0.084777, 0.245933, -0.080808, -0.070905, 0.045711, 0.057202, 0.016241, -0.152677, 0.120684, -0.090962, -0.174865, -0.107764, -0.131432, -0.056564, 0.236662, 0.040801, 0.069482, -0.083832, 0.009978, 0.067472, 0.022750, 0.097758, -0.056190, 0.018120]
-,        [-0.036041, 0.013104, -0.070107, 0.072042, 0.225909, -0.134375, 0.128427, -0.181146, -0.014038, -0.031452, -0.011607, 0.041703, 0.181803, -0.107216, 0.089561, -0.017453, -0.011265, -0.204324, 0.111381, -0.008781, -0.311113, 0.151453, 0.111860, -0.038691, -0.258572, -0.000468, 0.052805, 0.102262, -0.071791, -0.011047, -0.082398, 0.273691, 0.062390, 0.209828, 0.116633, 0.109179, -0.053500, 0.044466, 0.092790, 0.004518, -0.211909, 0.062410, 0.008920, -0.046265, 0.014868, -0.070080, 0.188734, 0.098912, -0.160516, -0.070324, 0.139909, 0.030521, -0.368727, -0.025192, -0.012712, -0.261247, -0.257991, 0.198942, -0.015108, -0.044338, 0.060231, 0.076964, -0.195749, -0.103447, -0.003882, 0.040678, 0.159401, 0.058680, 0.056895, -0.014779, 0.250995, 0.073555, -0.265779, -0.020549, 0.030608, -0.036249, -0.068507, 0.241602, -0.026409, -0.110733, -0.183306, 0.066860, -0.169575, -0.110908, -0.111697, 0.099375, 0.048791, -0.012060, -0.016598, 0.018852, -0.008961, -0.035797, 0.058942, -0.039470, 0.149625, 0.222161, 0.024402, 0.055845, 0.074649, -0.105537, -0.061223, -0.010279, -0.075639, -0.196075, -0.013143, 0.109747, -0.090524, 0.195117, 0.171222, -0.093165, -0.154058, -0.140830, -0.142089, 0.121240, -0.014940, -0.119899, 0.002806, -0.032189, 0.007588, 0.143930, -0.066907, -0.254354, -0.148044, -0.166956, -0.012347, -0.171381, 0.112034, -0.132809]
-,        [0.005785, -0.005227, 0.044764, 0.154090, -0.131999, -0.128277, 0.014889, 0.202945, -0.010036, 0.186760, -0.062784, -0.046967, 0.068493, -0.162333, -0.056254, -0.191698, -0.170912, -0.104942, -0.081032, 0.181019, 0.070124, -0.298204, 0.095996, 0.167271, 0.024563, -0.046642, 0.245234, -0.094644, -0.192541, -0.148415, -0.176688, 0.280721, 0.016076, 0.080069, 0.119101, -0.126394, 0.056795, -0.111211, 0.183871, -0.071109, 0.230142, -0.059451, 0.142439, -0.089518, 0.044360, 0.101417, -0.148773, 0.000178, 0.004711, -0.113546, 0.050025, 0.007515, -0.049315, 0.174938, -0.116048, -0.059546, -0.050190, 0.047523, -0.029323, 0.109684, -0.168177, -0.038156, 0.158178, 0.235124, -0.167672, -0.320404, -0.197073, 0.193527, -0.050579, 0.031913, 0.240592, -0.100257, -0.072310, 0.113665, -0.090961, 0.278878, 0.018971, -0.097898, 0.094916, -0.058438, -0.000012, 0.099600, 0.121748, -0.104678, 0.176870, -0.012220, -0.040610, 0.055623, 0.079676, -0.132478, -0.143106, 0.084779, 0.176111, 0.183805, 0.019612, 0.225318, -0.037176, -0.023266, 0.021203, 0.048718, -0.114868, -0.153200, 0.073719, 0.058613, -0.095217, 0.092008, -0.077704, -0.066444, -0.044491, -0.040335, 0.189957, 0.123831, -0.103416, -0.107459, 0.260101, -0.153509, 0.169374, 0.081400, -0.164387, -0.035945, -0.148320, -0.090830, 0.179016, 0.154355, 0.162761, 0.052772, -0.154874, -0.128145]
-,        [0.105226, 0.004761, -0.176346, 0.121291, 0.042359, 0.008319, -0.112952, 0.036086, -0.226355, 0.171378, -0.215840, 0.114309, 0.080163, -0.055562, 0.182442, 0.126392, 0.132343, 0.025500, 0.004401, -0.131785, -0.109597, 0.038401, -0.084914, 0.244698, -0.108232, 0.144162, 0.089523, 0.019501, -0.025062, 0.294641, -0.006955, -0.181983, 0.366733, -0.083152, 0.136965, 0.019790, -0.148530, 0.135923, 0.038370, 0.053181, 0.059041, -0.019893, -0.077180, -0.016353, -0.052952, -0.282814, 0.065896, 0.134195, 0.072487, -0.010604, 0.080251, -0.055132, 0.225077, 0.085915, -0.364054, -0.006832, 0.226638, 0.060081, -0.068053, -0.091693, 0.091548, 0.013001, 0.038840, 0.016428, 0.238402, 0.026753, 0.038001, 0.011402, -0.082943, 0.035974, 0.071414, -0.004339, -0.251477, -0.095199, -0.028398, -0.054910, 0.151588, -0.088053, -0.053387, 0.040963, 0.287852, 0.285389, -0.207985, 0.012444, 0.186447, -0.017925, 0.068068, -0.006582, 0.238888, -0.153001, 0.026540, -0.031496, 0.214347, 0.074168, 0.058743, 0.145172, 0.198128, -0.041219, -0.098367, 0.092566, -0.042814, 0.232730, -0.389771, 0.196023, -0.060809, -0.115401, 0.204302, -0.051708, 0.002122, -0.112066, 0.072908, 0.107446, 0.078877, 0.047236, 0.046372, 0.193766, 0.019683, 0.067906, -0.002781, 0.142620, 0.105584, 0.008554, 0.123703, 0.020506, -0.092729, 0.035842, 0.039862, -0.209661]
-,        [0.193625, 0.265134, -0.033143, -0.183253, 0.092177, -0.146570, 0.067638, -0.204819, 0.210062, -0.000077, 0.109793, -0.087087, 0.157249, -0.069532, -0.005764, -0.000719, 0.103683, 0.026798, -0.057176, -0.197865, -0.145998, -0.108880, -0.081093, 0.068683, 0.004513, 0.046107, -0.106756, -0.026899, 0.054725, 0.194713, -0.143878, 0.018729, 0.032262, 0.010509, -0.026972, -0.423916, 0.072721, 0.016238, 0.229257, 0.114015, 0.217928, -0.084643, -0.045633, 0.171041, -0.022499, 0.129622, -0.051502, -0.092536, 0.031557, -0.131288, 0.210669, -0.144257, 0.130653, -0.067906, -0.210865, -0.117874, 0.250914, -0.242719, -0.138167, -0.073912, 0.091209, -0.058750, -0.057695, 0.037946, -0.203208, 0.184611, 0.026054, -0.214992, -0.203572, 0.054759, 0.145942, 0.091877, 0.217854, 0.042403, -0.029725, -0.027979, -0.061540, 0.113579, 0.189120, 0.038538, -0.088708, 0.194190, -0.034487, -0.009737, 0.156048, -0.214576, -0.124778, 0.090318, -0.235941, 0.212482, 0.205165, 0.117232, 0.121020, -0.041721, 0.101152, 0.227798, 0.110709, 0.036391, 0.086945, 0.006076, 0.019517, 0.159651, 0.084403, -0.056518, -0.037283, 0.041875, 0.035431, -0.003961, 0.040281, 0.145615, -0.115258, 0.252337, 0.043332, 0.165713, 0.031695, -0.045461, -0.100135, -0.027390, 0.098409, -0.005451, -0.036072, 0.137127, 0.014198, -0.017921, -0.021755, -0.066610, 0.210320, 0.028412]
-,        [0.130444, -0.018688, -0.186854, 0.131928, -0.140243, 0.069116, 0.125628, 0.088233, -0.236398, 0.016474, 0.068463, 0.036835, -0.008266, 0.009863, -0.126954, 0.003169, -0.173183, -0.147387, -0.039481, -0.074295, -0.114111, 0.084771, 0.089192, 0.115303, 0.279569, 0.178756, -0.039411, 0.141480, 0.034924, -0.139353, 0.026881, 0.061461, 0.129191, -0.028866, -0.095083, -0.009950, 0.012015, 0.042353, -0.020735, -0.108600, 0.081482, 0.042713, 0.010236, -0.127053, 0.041717, -0.183795, 0.012767, 0.032909, 0.155993, 0.023283, -0.225502, -0.164187, 0.112188, -0.201320, -0.036174, -0.015944, 0.169577, -0.272263, -0.040933, 0.153679, 0.096749, 0.069414, 0.237651, 0.073094, 0.038792, -0.087404, 0.068126, 0.272544, 0.284795, -0.009389, 0.050377, -0.020273, 0.095737, -0.044523, -0.105938, 0.013641, -0.228589, 0.130558, -0.134035, 0.138310, -0.143713, 0.428378, 0.122530, -0.154361, 0.043332, 0.150883, 0.139736, 0.123098, 0.133250, 0.354833, -0.032990, 0.060393, -0.033158, 0.047597, -0.204475, -0.063299, 0.009035, 0.050249, 0.284945, -0.090752, -0.186748, -0.103892, -0.179621, -0.058923, 0.154854, -0.056153, -0.060251, 0.048991, 0.081262, 0.074609, -0.044242, 0.083056, 0.046605, -0.027761, -0.309772, -0.075808, -0.105840, 0.089171, -0.014203, 0.075646, 0.066258, -0.099536, -0.021936, 0.126547, 0.008103, 0.113383, 0.019452, -0.181317]
-,        [-0.136595, -0.000385, -0.043810, -0.023592, 0.125231, 0.042002, -0.014276, -0.192086, 0.100505, 0.018961, -0.239834, -0.067093, 0.089981, -0.132244, 0.192962, 0.048104, -0.121289, 0.130868, -0.138362, 0.150172, 0.054504, -0.055962, 0.207862, -0.053796, 0.233201, -0.098656, 0.015340, 0.261919, -0.175937, 0.065915, -0.094656, -0.323336, -0.007990, 0.003308, -0.006019, -0.045120, 0.029042, 0.112115, -0.013259, -0.183002, -0.011768, -0.051353, -0.233041, 0.177103, 0.076950, 0.110275, -0.031428, 0.014815, 0.169106, 0.216339, -0.013060, 0.161442, 0.123080, 0.105898, -0.171990, -0.064712, -0.313057, 0.237042, 0.150480, 0.021665, 0.193278, -0.094224, 0.152399, 0.049210, -0.247818, -0.023429, 0.039079, 0.069074, -0.058536, -0.169870, -0.005708, 0.095750, 0.055328, 0.149424, -0.125444, 0.022020, 0.161896, -0.079593, 0.223104, 0.055916, -0.058161, 0.200600, 0.115404, 0.125437, 0.037261, 0.195917, 0.009020, -0.205075, 0.271137, 0.030322, 0.084727, 0.129362, 0.046570, -0.025249, 0.075093, -0.061036, -0.101707, 0.034186, -0.066476, -0.001726, 0.296055, 0.272162, -0.047596, 0.024250, 0.102534, -0.001413, -0.200320, -0.207385, 0.045011, -0.055342, 0.000829, 0.010936, -0.067436, 0.164640, -0.332016, -0.061449, -0.084709, 0.030493, -0.031188, 0.080128, -0.108739, -0.125525, -0.087282, 0.074771, -0.054162, 0.026200, 0.093431, -0.014191]
-,        [0.124830, 0.128710, 0.009075, 0.070093, -0.028428, 0.100157, -0.179823, 0.035585, -0.191203, 0.003936, -0.136635, -0.043392, -0.037553, 0.114080, -0.127878, -0.161144, -0.167727, -0.242377, -0.159853, 0.184489, -0.236554, -0.132378, -0.046805, -0.302960, 0.006678, -0.002465, -0.208113, 0.105819, 0.036107, -0.067897, -0.146668, 0.013269, -0.120579, -0.077486, 0.104483, -0.145693, -0.288315, -0.157777, -0.067540, -0.063582, 0.080210, -0.163919, -0.096162, -0.175091, -0.300585, -0.009394, 0.025676, -0.066579, -0.038245, 0.148101, 0.022683, -0.035275, -0.120259, -0.145176, 0.099037, -0.021028, -0.098430, 0.103300, -0.034264, -0.076384, 0.044528, -0.233251, 0.005774, -0.017339, 0.093535, 0.108960, -0.217020, -0.060520, -0.038432, 0.176558, -0.177864, 0.006553, -0.062935, 0.021815, -0.052349, -0.247949, -0.123617, 0.343495, 0.158267, 0.120664, -0.016808, 0.121685, 0.093309, -0.069188, 0.158248, -0.063993, -0.051626, -0.220672, 0.096089, -0.086414, 0.157018, -0.015934, 0.071073, 0.091200, -0.132559, -0.134348, 0.130423, -0.221648, 0.149058, 0.344053, -0.148129, 0.079377, 0.121317, 0.089110, 0.130641, -0.070544, 0.063307, 0.055766, 0.207380, 0.027128, 0.116403, 0.032533, -0.036246, 0.032182, -0.085666, 0.022120, 0.152763, 0.176123, 0.064802, -0.085191, 0.115311, -0.046057, -0.135635, -0.050516, -0.146131, -0.136281, -0.135149, 0.162543]
-,        [0.128794, 0.043552, 0.093138, 0.129083, 0.184813, 0.093594, -0.063605, -0.131920, -0.059584, 0.031966, 0.169022, 0.035462, 0.281029, -0.086441, -0.083832, -0.113091, -0.080825, -0.002214, 0.229110, 0.104648, 0.058345, -0.115653, 0.064383, -0.088436, -0.093531, -0.020503, -0.162046, 0.032468, -0.042336, 0.002530, -0.163226, -0.024401, -0.181763, -0.001264, 0.038924, 0.069623, -0.075843, -0.284426, -0.085601, 0.020498, 0.083204, 0.334138, -0.179632, 0.069287, 0.013439, -0.168078, -0.094361, -0.042429, 0.025046, -0.066879, -0.204215, 0.076865, -0.076594, -0.154863, -0.216931, 0.000149, 0.110211, -0.135124, 0.046450, -0.009963, 0.008975, -0.128447, -0.082881, -0.016663, 0.148837, -0.397588, 0.229012, 0.269026, -0.021457, -0.081954, 0.103666, -0.067793, -0.051372, -0.126951, 0.023999, -0.214474, 0.047336, 0.090899, 0.046991, -0.264666, -0.083281, -0.139411, 0.019421, 0.232912, 0.053690, -0.006745, -0.005106, -0.166706, -0.110062, -0.186787, 0.156160, -0.035462, -0.182729, -0.097095, 0.135905, 0.035710, -0.048258, -0.109489, -0.035391, 0.010939, -0.125754, 0.094200, 0.228180, 0.186767, 0.172676, -0.172015, 0.079531, -0.049515, -0.006707, -0.147195, 0.165894, 0.098050, 0.093602, 0.050897, -0.101935, 0.030618, -0.131847, -0.066569, 0.027857, -0.299384, 0.015091, -0.005511, -0.218553, 0.126429, 0.136072, 0.006908, 0.105499, 0.074202]
-,        [-0.021891, -0.165191, 0.064437, 0.232281, -0.038507, 0.100709, 0.005568, -0.029542, 0.198413, 0.082555, 0.035748, 0.126654, -0.023173, -0.048859, 0.069916, 0.092230, 0.012572, 0.054199, -0.144920, 0.016366, -0.036760, -0.003643, 0.054608, 0.002777, -0.031865, -0.099375, 0.200452, -0.160462, -0.129649, 0.134907, -0.205341, 0.057265, -0.027888, 0.147142, -0.059877, -0.058004, 0.026088, -0.054916, 0.028732, -0.227661, -0.303291, -0.120031, 0.280869, 0.033818, -0.085920, 0.013382, -0.034451, 0.161588, -0.138614, 0.204292, 0.209752, 0.027784, 0.089174, -0.161958, -0.053405, -0.165153, 0.081144, 0.102251, -0.314165, 0.116926, 0.124644, -0.193556, -0.030197, 0.177615, -0.122984, -0.147164, 0.128842, -0.072672, 0.210585, 0.075728, -0.252542, 0.035999, -0.017722, 0.128187, 0.057193, 0.053278, -0.073405, 0.037945, 0.040567, -0.041479, -0.109573, -0.100308, -0.055680, 0.010199, 0.066722, 0.099487, 0.284373, 0.060206, -0.071796, 0.037716, 0.048316, 0.349922, 0.029327, -0.188847, -0.040854, -0.271540, 0.144843, -0.124076, -0.013455, 0.198789, -0.149421, 0.081654, 0.063209, 0.031378, 0.070832, -0.048549, 0.038003, 0.097625, -0.213256, -0.115492, -0.016686, 0.064375, 0.160479, -0.208627, -0.040522, 0.028397, 0.038050, -0.172814, 0.026349, 0.161429, 0.206196, 0.064006, 0.037701, 0.003853, -0.072557, -0.095061, 0.117743, -0.119391]
-,        [0.037000, -0.157141, -0.015378, 0.038218, -0.020704, 0.134681, 0.008798, -0.116968, 0.128391, -0.093806, -0.044737, 0.046305, -0.045885, -0.054634, -0.043671, 0.178888, 0.033225, -0.346415, 0.029105, -0.029036, -0.014197, 0.024512, 0.309680, -0.095285, 0.181670, -0.004504, 0.286236, -0.013213, -0.077280, 0.043499, 0.070417, -0.124588, -0.060826, -0.281488, 0.231287, -0.007290, -0.008495, -0.034631, -0.008459, 0.132185, -0.145293, 0.022283, -0.079600, 0.019690, -0.089598, -0.051720, -0.164620, 0.012852, 0.081691, -0.004166, 0.218272, 0.036307, -0.016635, -0.165750, 0.159014, -0.081975, 0.170405, 0.006133, -0.058180, -0.019792, 0.058318, 0.058498, 0.208561, 0.046404, 0.222558, 0.042031, -0.171293, 0.154164, -0.169635, 0.044323, 0.221938, -0.000868, -0.023117, -0.014983, 0.056458, 0.273488, -0.072677, 0.187003, 0.353297, -0.023891, 0.087105, 0.052069, -0.180554, 0.208574, -0.247002, -0.080836, 0.023296, 0.266956, 0.076436, -0.109382, -0.074429, 0.078995, -0.258967, 0.058519, 0.071092, 0.218624, -0.143818, -0.049464, 0.259226, 0.078545, 0.178902, 0.159889, 0.024083, -0.052553, -0.079996, 0.068899, 0.207751, 0.149739, 0.032510, -0.016137, 0.150026, 0.160791, 0.203250, 0.078153, -0.007417, -0.014702, 0.169016, -0.051989, -0.124825, 0.091385, -0.078319, 0.111722, 0.237502, 0.245275, 0.058772, 0.024105, 0.102181, 0.022480]
-,        [0.088110, -0.020458, 0.063110, 0.112258, -0.108769, 0.125829, -0.058885, -0.015640, 0.089621, -0.009005, 0.101921, 0.017382, -0.231157, 0.159915, 0.019319, 0.055888, 0.066812, 0.327465, -0.160162, 0.184050, 0.220429, 0.115599, -0.053178, -0.044592, -0.214617, -0.002543, 0.093630, -0.279536, -0.085877, -0.035594, -0.048240, -0.054486, -0.027914, 0.077199, 0.098589, -0.112506, -0.032412, 0.123695, 0.347392, 0.159003, -0.124350, 0.161856, -0.088483, -0.012453, -0.006584, -0.282075, -0.189415, -0.127884, -0.056129, 0.012598, -0.084008, 0.097307, -0.131909, -0.142584, -0.201210, -0.173582, 0.053647, -0.191493, 0.041410, 0.143056, 0.087974, 0.054017, 0.051789, -0.136158, 0.018520, 0.069867, 0.042923, -0.161856, -0.212835, 0.060335, 0.222856, -0.014634, -0.008740, -0.273873, -0.283860, -0.048413, 0.075708, -0.005039, 0.055721, 0.147353, 0.056012, 0.012958, 0.220316, -0.144738, 0.076094, -0.166724, 0.116145, 0.028201, 0.131870, 0.230821, -0.102070, 0.040178, -0.045469, 0.174076, 0.273105, 0.011745, 0.128127, 0.062238, 0.071955, 0.004160, 0.022945, 0.182746, 0.006611, 0.052014, 0.138999, -0.069083, 0.082629, 0.066850, -0.058053, -0.114750, 0.343932, -0.083100, 0.163869, -0.088819, -0.046224, -0.109681, 0.057516, 0.006413, 0.028722, 0.077398, -0.234513, -0.177271, -0.025672, -0.026026, 0.141116, -0.249241, -0.050339, 0.112524]
-,        [0.205124, -0.071031, -0.121182, 0.106638, -0.001720, 0.274496, 0.273709, -0.124303, 0.283200, -0.110612, 0.234842, -0.136172, 0.153061, -0.055204, 0.217254, 0.230257, -0.037910, -0.201292, -0.042936, 0.183055, 0.202462, -0.064637, -0.304412, -0.018626, -0.074990, -0.112840, 0.112749, 0.202235, -0.081602, 0.101673, -0.126541, -0.018404, -0.023547, 0.238726, 0.116452, -0.025051, 0.084005, 0.025797, 0.126417, -0.076770, 0.155538, -0.074015, 0.012520, -0.004657, -0.095924, -0.001120, 0.232772, -0.155735, -0.013904, 0.018078, -0.118086, 0.008363, -0.128417, 0.127399, 0.227565, -0.037336, -0.205301, -0.037017, 0.080256, -0.014357, 0.099075, 0.106835, 0.315684, 0.102215, 0.099630, 0.181239, -0.043242, -0.234771, 0.121034, -0.182804, -0.023163, 0.037851, -0.043971, -0.154637, -0.330272, 0.146844, 0.107845, -0.052346, -0.031519, 0.131122, 0.047520, 0.004737, -0.108910, 0.158124, -0.023644, -0.230404, 0.116769, -0.180460, -0.007774, -0.000774, 0.053330, -0.106994, -0.012486, -0.059406, -0.086964, 0.044246, -0.025825, 0.081205, 0.076732, -0.083661, -0.218502, 0.176725, 0.028025, 0.131635, 0.050348, 0.196244, 0.274452, -0.024927, -0.033178, 0.028294, -0.062384, 0.253648, -0.081797, -0.020843, 0.016423, -0.042225, 0.030773, -0.014039, 0.115984, 0.011207, 0.101405, -0.141441, 0.095827, 0.004054, -0.016187, 0.284320, 0.051960, -0.247712]
-,        [0.112555, 0.066852, -0.096993, -0.260756, 0.035033, -0.126652, 0.184426, -0.071818, 0.023518, 0.030531, -0.046939, -0.134173, -0.138262, 0.125274, 0.074111, -0.032198, -0.010708, 0.078499, 0.038043, 0.097896, 0.003035, -0.014932, -0.054176, -0.102359, -0.213355, 0.156462, -0.164819, 0.043904, -0.179282, 0.124283, -0.114888, -0.043132, -0.103664, -0.092029, -0.063595, -0.144585, -0.115451, 0.185701, 0.122985, 0.059912, -0.134376, -0.024565, 0.029801, -0.184531, 0.119814, -0.124937, 0.023049, 0.059443, 0.051967, -0.029966, 0.121332, -0.077830, -0.013344, 0.188559, 0.199183, 0.342371, -0.103128, 0.008606, 0.208918, 0.299369, 0.108760, -0.090070, -0.044574, -0.017287, -0.067308, -0.255350, 0.104436, 0.098581, 0.075787, 0.016199, -0.097852, -0.033703, -0.114465, 0.160131, 0.025096, 0.070338, -0.259108, 0.063683, -0.061154, 0.122020, 0.119592, -0.015258, 0.051505, 0.194622, 0.172937, 0.066898, -0.083311, 0.093611, -0.049107, 0.058814, -0.190414, -0.013172, -0.040952, 0.168667, 0.104146, -0.006682, 0.039413, -0.158716, -0.162215, -0.100425, -0.220605, 0.097386, -0.070880, 0.135806, -0.024978, 0.356345, -0.037168, 0.020176, 0.099711, -0.017724, -0.093362, -0.039230, 0.244069, -0.154327, -0.078525, 0.089851, 0.069487, 0.014794, -0.160237, 0.189569, -0.013651, 0.034036, -0.004424, 0.194031, 0.113780, 0.198509, 0.316731, 0.093033]
-,        [0.028413, 0.105407, 0.072342, 0.071099, 0.047339, 0.012054, -0.038653, -0.239137, 0.023299, 0.141749, -0.044046, 0.123831, -0.106288, -0.016954, -0.050103, -0.216097, -0.112540, 0.017685, -0.154712, -0.183730, -0.293427, -0.029026, 0.070360, -0.031747, -0.012031, 0.050183, 0.032001, -0.037786, 0.104903, -0.100768, 0.061548, 0.065842, -0.055287, 0.277451, 0.039463, -0.131450, 0.031803, 0.165876, 0.104698, 0.077744, -0.127661, 0.032892, 0.130244, -0.069072, 0.375215, -0.055009, 0.086902, 0.076749, 0.179282, 0.036403, 0.019836, -0.078880, -0.018704, 0.097439, 0.111348, -0.145197, -0.033350, -0.019654, 0.034157, -0.098068, -0.061895, 0.216945, 0.134240, -0.116746, 0.094710, -0.049471, -0.066649, -0.181713, 0.252981, -0.076590, 0.157342, 0.201633, 0.039944, -0.115462, -0.120367, 0.031257, 0.300425, 0.110847, 0.097668, 0.164371, 0.076017, -0.060315, 0.105905, -0.123489, -0.068326, 0.126145, -0.015583, 0.012485, -0.076744, -0.164581, 0.043526, 0.054123, -0.109354, -0.053434, -0.186808, -0.001761, -0.014860, -0.189915, -0.089056, 0.030583, 0.039334, 0.010530, 0.164069, 0.114765, -0.222968, -0.094115, 0.170260, -0.259120, -0.039214, -0.025623, 0.184260, -0.179236, 0.089423, -0.057411, -0.068362, -0.049694, -0.110754, 0.225060, -0.208885, -0.148790, 0.259350, 0.218272, -0.048339, -0.029306, 0.041874, 0.088250, 0.060704, 0.052386]
-,        [-0.149626, 0.082740, -0.197344, 0.051103, 0.029773, 0.016650, -0.078761, 0.004603, 0.025981, -0.160880, 0.117479, -0.090668, -0.113994, 0.120047, 0.173813, 0.155211, 0.090629, -0.058014, 0.246694, 0.080046, -0.019402, -0.064119, -0.152831, 0.137614, -0.022700, 0.048823, -0.003426, 0.063362, 0.174345, -0.383273, -0.073954, -0.008653, -0.231675, -0.087383, 0.054884, 0.176820, 0.168470, 0.145072, 0.068021, 0.186304, -0.182267, -0.145124, 0.032422, 0.075216, 0.158117, 0.178963, -0.130846, 0.122454, 0.126678, -0.069761, 0.250311, -0.048802, -0.113023, -0.120545, -0.203203, 0.001765, 0.055358, -0.033834, 0.065173, -0.031987, 0.235832, -0.180597, 0.096630, 0.061998, 0.025575, -0.115414, -0.082513, 0.017672, 0.054723, -0.120656, 0.085693, -0.240521, 0.092110, 0.029453, -0.000442, 0.020130, -0.034553, 0.143329, 0.074287, -0.064564, 0.108719, -0.106088, 0.073831, -0.247888, 0.063941, -0.085190, -0.096581, 0.116289, -0.021470, 0.036077, 0.279557, 0.105714, 0.196841, -0.134613, -0.129900, -0.211438, 0.139618, -0.037237, 0.035044, 0.103483, 0.109156, -0.137919, -0.031836, 0.136738, 0.091684, 0.113708, 0.117764, 0.087633, 0.083555, -0.178256, -0.099233, -0.215904, -0.000696, -0.000609, 0.128044, 0.046487, 0.062628, -0.015055, -0.164770, -0.134596, -0.049684, -0.057994, -0.148906, 0.037365, -0.071097, 0.204598, -0.117798, -0.051754]
-,        [-0.141415, -0.031861, 0.039611, 0.065281, -0.075119, 0.122246, -0.073034, 0.003628, -0.016296, -0.172842, -0.035980, 0.000710, 0.037223, 0.145344, -0.035128, 0.151600, 0.087138, 0.046638, -0.111397, -0.016856, 0.037456, 0.093814, 0.153709, 0.219706, -0.174420, 0.085034, -0.157517, 0.310366, 0.086468, 0.032756, -0.143949, 0.026650, -0.120938, -0.175546, 0.003016, -0.288072, 0.168169, -0.131054, -0.069524, -0.145452, -0.077528, -0.064278, 0.262398, 0.011222, -0.084666, 0.229209, -0.044613, 0.027532, 0.187604, -0.046319, -0.259378, 0.008268, -0.128344, -0.009867, 0.045472, -0.099256, -0.054738, 0.102088, 0.251294, -0.135587, -0.188862, 0.116656, -0.080757, 0.076007, 0.108091, -0.062620, 0.139313, -0.100266, -0.087618, 0.307745, -0.023845, -0.184263, 0.274631, 0.032287, -0.090448, 0.037818, -0.032264, -0.073512, -0.023008, 0.024109, 0.020342, -0.051322, 0.070148, 0.089129, -0.038398, -0.120956, 0.084150, 0.192107, -0.403142, -0.156710, -0.041686, 0.065645, -0.074434, 0.013550, 0.059335, 0.186419, 0.024998, -0.219125, 0.021828, 0.106154, -0.029817, 0.006362, -0.358316, 0.067739, -0.197906, 0.078175, 0.138915, 0.044856, 0.019098, -0.114287, 0.156826, -0.114278, -0.011818, -0.003819, -0.117155, 0.173940, -0.148342, -0.021813, -0.040717, 0.026977, -0.114782, -0.149303, 0.025800, -0.244962, -0.024347, 0.012102, -0.061540, -0.022926]
-,        [-0.077902, -0.024528, 0.291808, 0.100541, -0.062878, 0.158391, 0.066397, 0.023868, -0.143489, 0.082104, -0.137442, -0.039799, 0.006389, 0.241706, 0.074253, 0.229247, -0.221459, -0.004006, -0.057359, -0.048559, -0.226259, -0.164845, -0.049652, -0.064770, 0.071408, -0.036105, 0.017877, 0.170341, 0.332954, -0.072079, -0.051768, 0.196060, 0.019221, 0.245878, -0.014313, -0.067700, -0.060423, -0.077228, 0.028973, -0.013754, -0.216064, 0.199638, -0.184670, 0.222138, -0.002028, 0.067703, -0.122283, 0.121817, 0.149391, -0.110497, -0.257210, -0.100460, 0.085946, -0.147151, -0.208511, 0.224937, -0.066169, 0.084115, 0.004017, 0.081876, 0.122707, -0.046094, -0.023405, 0.010500, -0.114416, 0.094586, 0.099848, -0.091380, 0.009568, 0.049643, -0.122506, -0.144859, 0.033462, -0.050174, -0.134813, 0.194133, -0.082762, 0.010661, 0.021522, -0.019048, 0.138455, 0.143754, 0.166454, 0.204492, -0.277886, -0.134041, 0.155200, 0.019040, 0.170672, 0.028822, 0.080355, -0.190879, 0.125219, 0.141560, 0.036675, 0.150557, -0.019215, 0.280769, -0.062382, 0.272487, -0.353469, -0.116905, 0.026519, -0.182472, -0.145084, -0.022526, 0.065892, -0.044446, -0.031461, 0.023158, 0.008443, -0.056019, -0.065663, -0.047145, 0.074356, 0.006932, 0.100894, 0.199744, -0.024479, -0.068623, -0.096078, 0.133692, -0.058755, -0.056367, -0.011962, 0.029062, 0.197998, 0.049835]
-,        [-0.064885, 0.046730, -0.049182, 0.033774, -0.191273, 0.082751, 0.096068, -0.005712, -0.153311, 0.095172, -0.066562, -0.038507, 0.177153, 0.061425, -0.045476, 0.175378, -0.288153, -0.106636, -0.075035, -0.007253, -0.110196, -0.091557, -0.021296, -0.115858, -0.112309, -0.087192, 0.016277, 0.043479, -0.194874, -0.101401, 0.105354, -0.053313, -0.138739, 0.088503, -0.149715, 0.097702, -0.194808, 0.168850, 0.005302, 0.039216, 0.128824, -0.041315, 0.061073, 0.134685, 0.157736, -0.013067, -0.017487, -0.070160, -0.051767, 0.002565, -0.295873, 0.088899, 0.017226, -0.183891, -0.184983, -0.192755, 0.079337, 0.254367, 0.147711, -0.028997, 0.045069, 0.035779, -0.098418, -0.213883, -0.091505, 0.104838, -0.103631, -0.005220, 0.141514, 0.108282, -0.037176, -0.232760, 0.063679, 0.114109, 0.203323, 0.007420, 0.258208, -0.012491, 0.099556, 0.131041, -0.063220, -0.160385, -0.174996, -0.040739, 0.314902, -0.234306, 0.081416, -0.048205, -0.122045, 0.041571, 0.023169, -0.007120, -0.155182, -0.029140, 0.073871, -0.120835, -0.098555, -0.215547, 0.038506, -0.108270, -0.001133, 0.002604, -0.050323, -0.308388, -0.036416, -0.075234, -0.069406, -0.074076, -0.048271, 0.104813, -0.282666, 0.071613, 0.108510, 0.024703, 0.032407, 0.069883, 0.099418, -0.006776, 0.021339, -0.040790, 0.049926, -0.043638, 0.159766, -0.070147, 0.283527, 0.128062, 0.021292, 0.016486]
-,        [-0.171412, -0.162304, 0.051220, 0.027226, -0.183831, -0.205289, -0.114726, 0.080441, -0.064231, -0.031394, 0.057913, 0.009325, -0.153824, -0.141860, 0.184795, 0.345864, 0.066213, -0.196230, -0.017699, -0.112268, -0.117773, 0.120656, 0.033891, 0.222218, -0.081795, -0.064370, 0.047046, 0.016738, 0.014438, -0.045611, -0.121337, 0.080815, -0.051263, -0.029432, -0.223877, 0.073031, -0.263402, 0.076554, -0.112169, -0.016994, 0.068893, -0.000413, -0.124911, 0.028152, 0.117449, 0.102337, 0.193598, 0.029627, 0.109711, -0.133124, -0.286169, 0.041522, -0.100200, 0.164469, 0.103323, 0.059565, 0.169475, -0.126823, -0.288478, 0.024733, -0.076872, 0.253109, -0.094647, 0.053929, 0.084563, -0.052757, -0.023525, -0.083890, 0.154517, -0.123613, -0.055000, 0.135170, 0.013003, -0.060822, 0.068039, -0.189306, -0.136634, 0.051280, 0.043786, 0.082037, -0.223988, -0.016810, -0.019172, 0.149349, 0.088608, -0.316528, -0.149581, -0.200580, 0.146040, -0.073498, -0.096583, 0.205565, 0.067880, -0.120056, 0.100986, -0.137311, 0.188206, -0.071613, -0.035894, 0.097466, 0.149877, 0.051660, 0.088631, 0.054269, 0.006604, 0.380688, -0.009553, -0.062556, 0.062514, -0.041288, 0.239442, -0.098351, -0.090327, -0.075806, -0.057333, -0.206118, 0.073209, 0.030099, 0.024822, -0.141971, -0.125849, 0.100897, 0.112138, 0.002136, -0.100119, -0.107210, 0.139077, -0.028054]
-,        [0.051146, 0.177163, -0.194519, -0.100521, 0.077679, -0.063517, 0.012546, -0.016321, -0.090198, -0.075144, -0.077906, 0.129258, -0.194905, 0.125259, -0.145588, 0.132043, -0.007512, -0.069792, 0.068303, 0.102290, 0.006354, -0.008098, -0.285934, 0.070862, 0.083065, 0.047156, 0.082708, -0.268410, -0.254949, 0.083744, 0.083221, -0.123504, 0.055340, 0.047698, -0.029151, 0.206232, -0.031600, 0.140308, -0.152244, -0.166146, -0.144390, -0.030224, 0.031314, 0.054964, 0.064693, 0.066060, -0.023970, -0.149442, -0.040249, 0.063006, -0.115499, 0.050660, -0.104687, -0.120742, 0.056343, -0.014874, 0.106357, 0.056808, -0.270071, 0.031146, -0.061213, -0.067500, -0.109233, 0.158996, -0.036997, -0.149870, 0.024744, -0.067465, -0.220152, 0.106826, 0.023382, -0.017385, 0.048707, -0.138560, -0.334652, 0.044776, 0.035370, -0.188671, 0.069680, 0.225707, -0.215533, 0.068512, 0.086696, 0.183735, 0.003603, -0.099637, 0.076910, -0.089007, -0.005758, -0.146375, 0.047166, 0.116793, -0.089620, -0.179386, 0.061329, 0.144920, -0.071021, -0.019358, 0.164326, 0.121862, -0.230404, -0.360501, 0.009835, 0.184377, -0.213868, -0.011907, -0.153560, 0.027213, -0.024865, 0.019306, -0.130989, -0.191003, 0.196847, 0.236268, 0.070639, -0.068549, -0.085793, 0.045292, -0.314081, -0.224336, 0.186432, 0.013916, -0.052761, 0.071798, -0.250830, -0.081423, 0.055530, 0.015164]
-,        [0.036015, 0.063899, -0.267500, 0.048209, -0.266862, 0.032732, 0.084434, 0.070183, 0.081277, 0.100001, 0.332316, -0.205535, 0.156224, -0.107628, -0.015236, 0.063927, -0.167934, -0.000952, -0.049614, 0.000577, -0.226453, -0.101785, 0.104330, -0.023210, -0.113308, 0.059586, 0.048107, 0.054763, -0.104226, 0.189637, 0.162902, 0.048003, -0.134540, -0.021573, 0.199302, 0.169411, 0.108702, -0.208082, 0.117901, -0.028807, -0.168607, 0.009914, -0.036444, 0.067440, 0.062688, -0.177234, -0.161313, -0.206566, 0.109947, -0.100932, -0.221811, 0.212618, 0.086835, 0.056617, 0.023802, 0.175450, 0.129049, 0.207963, 0.019155, -0.022682, -0.130003, -0.158073, -0.186487, -0.138198, -0.074090, -0.001306, -0.019061, -0.158747, -0.134075, -0.089290, -0.163781, 0.240308, 0.077069, -0.129824, 0.033491, 0.040582, -0.066475, -0.053844, -0.147004, 0.064858, 0.101790, 0.021910, -0.052335, -0.101259, -0.173081, 0.082190, -0.099480, 0.090565, -0.021772, -0.145311, -0.048969, 0.078176, 0.205474, 0.088763, -0.043617, 0.063107, 0.165476, 0.037466, 0.155321, 0.005294, 0.143304, 0.128249, -0.065793, 0.096403, 0.158270, 0.062568, -0.161638, -0.122654, 0.077514, 0.057564, 0.039819, 0.068051, 0.151913, 0.066095, 0.064016, -0.068481, 0.064569, -0.162886, -0.258794, 0.094965, 0.212339, 0.086053, -0.114935, 0.002957, -0.006629, -0.012086, -0.220729, -0.057847]
-    ],
-    "discard_head.bias": [0.023655, -0.031659, -0.089594, -0.147765, -0.084332, -0.040152, -0.063501, -0.015365, -0.060895, -0.061029, -0.028343, -0.042649, 0.099639, -0.013113, 0.008725, -0.051741, -0.006188, 0.008381, -0.101823, 0.052451, 0.150715, 0.010152, 0.044642, -0.002004, 0.073910, 0.046718, 0.059487, 0.113216, 0.065505, 0.066889, 0.111733, -0.009119, -0.064346, 0.081043, 0.197284, 0.049966, 0.050401, -0.052430, -0.078743, -0.071938, -0.118204, 0.090133, 0.041515, 0.074275, -0.074380, -0.031889, -0.072821, -0.032509, 0.085178, -0.106062, -0.051660, 0.062500, 0.000000],
-}
-
+# Observacio: carta de dalt (13 valors + 4 pals), ma i pila de descarts (52 + 52), cartes per jugador i escalars
+_HAND_OFF = 17
+_DISCARD_OFF = _HAND_OFF + 52
+
+# Els pesos d'AlphaMao, tots seguits en float32 i en aquest ordre
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "repster_alpha_mao.npy")
+WEIGHT_SHAPES = (
+    ("trunk.0.weight", (256, OBS_SIZE)),
+    ("trunk.0.bias", (256,)),
+    ("trunk.2.weight", (128, 256)),
+    ("trunk.2.bias", (128,)),
+    ("play_head.weight", (MAX_ACTIONS, 128)),
+    ("play_head.bias", (MAX_ACTIONS,)),
+    ("jump_head.weight", (MAX_ACTIONS, 128)),
+    ("jump_head.bias", (MAX_ACTIONS,)),
+    ("discard_head.weight", (MAX_ACTIONS, 128)),
+    ("discard_head.bias", (MAX_ACTIONS,)),
+)
+# Fitxers que no son codi pero canvien com juguen les estrategies (per a base/cache.py)
+DATA_FILES = (WEIGHTS_PATH,)
+_model: dict[str, np.ndarray] | None = None
+
+
+def _shared_model() -> dict[str, np.ndarray]:
+    """The AlphaMao weights, memory-mapped read-only once per process and shared by every instance."""
+    global _model
+    if _model is None:
+        flat = np.asarray(np.load(WEIGHTS_PATH, mmap_mode="r")) # Vista ndarray, segueix mapejada
+        model = {}
+        off = 0
+        for name, shape in WEIGHT_SHAPES:
+            size = int(np.prod(shape))
+            model[name] = flat[off:off + size].reshape(shape)
+            off += size
+        assert off == flat.size, f"{WEIGHTS_PATH} has {flat.size} weights, expected {off}"
+        _model = model
+    return _model
 
 def _card_type_id(card: BaseCard) -> int:
     return (card.value - 1) * 4 + SUIT_TO_ID[card.suit]
@@ -674,6 +176,15 @@ def _linear(x: np.ndarray, w: np.ndarray, b: np.ndarray) -> np.ndarray:
     return x @ w.T + b
 
 
+def _action_mask(type_mask: int, last_action: int) -> np.ndarray:
+    """The GameView bitmask of card types as an action mask, with last_action (draw / no jump) allowed."""
+    mask = np.zeros(MAX_ACTIONS, dtype=bool)
+    bits = np.unpackbits(np.frombuffer(type_mask.to_bytes(7, "little"), dtype=np.uint8), bitorder="little")
+    mask[:52] = bits[:52]
+    mask[last_action] = True
+    return mask
+
+
 def _find_card(cards: list[BaseCard], type_id: int) -> BaseCard | None:
     for card in cards:
         if _card_type_id(card) == type_id:
@@ -682,25 +193,48 @@ def _find_card(cards: list[BaseCard], type_id: int) -> BaseCard | None:
 
 
 class AlphaMao(Strategy):
+    uses_game_view = True
+
     def __init__(self, player, discard_pile, player_index, number_of_players,
                  build_deck, num_decks, num_cards_per_player):
         super().__init__(player, discard_pile, player_index, number_of_players,
                          build_deck, num_decks, num_cards_per_player)
-        self._w = {k: np.array(v, dtype=np.float32) for k, v in MODEL.items()}
+        self._w = _shared_model()
+        self._obs: np.ndarray | None = None
+        self._top_slots = (0, 13)
+
+    def _tracked_obs(self) -> np.ndarray | None:
+        """The observation whose hand and discard sections the decks keep up to date, or None if they can't."""
+        if self._obs is None:
+            if not (isinstance(self.player, CountedDeck) and isinstance(self.discarded_pile, CountedDeck)):
+                return None
+            obs = np.zeros(OBS_SIZE, dtype=np.float32)
+            hand = obs[_HAND_OFF:_HAND_OFF + 52]
+            discarded = obs[_DISCARD_OFF:_DISCARD_OFF + 52]
+            hand[:] = self.player.type_counts
+            discarded[:] = self.discarded_pile.type_counts
+            self.player.mirror_counts.append(hand)
+            self.discarded_pile.mirror_counts.append(discarded)
+            self._obs = obs
+        return self._obs
 
     def _encode(self, top_card: BaseCard, current_player: int,
                 direction: int, value_7: int) -> np.ndarray:
-        obs = np.zeros(OBS_SIZE, dtype=np.float32)
-        off = 0
-        obs[top_card.value - 1] = 1.0
-        obs[13 + SUIT_TO_ID[top_card.suit]] = 1.0
-        off = 17
-        for card in self.player.cards:
-            obs[off + _card_type_id(card)] += 1.0
-        off += 52
-        for card in self.discarded_pile.cards:
-            obs[off + _card_type_id(card)] += 1.0
-        off += 52
+        obs = self._tracked_obs()
+        if obs is None:
+            obs = np.zeros(OBS_SIZE, dtype=np.float32)
+            for card in self.player.cards:
+                obs[_HAND_OFF + _card_type_id(card)] += 1.0
+            for card in self.discarded_pile.cards:
+                obs[_DISCARD_OFF + _card_type_id(card)] += 1.0
+        # Nomes les parts escalars, les seccions de cartes ja estan al dia
+        value_slot, suit_slot = self._top_slots
+        obs[value_slot] = 0.0
+        obs[suit_slot] = 0.0
+        self._top_slots = (top_card.value - 1, 13 + SUIT_TO_ID[top_card.suit])
+        obs[self._top_slots[0]] = 1.0
+        obs[self._top_slots[1]] = 1.0
+        off = _DISCARD_OFF + 52
         n = self.number_of_players
         for i in range(n):
             rotated = (i - self.player_index) % n
@@ -726,26 +260,40 @@ class AlphaMao(Strategy):
                        value_7: int) -> BaseCard | bool:
         obs = self._encode(top_card, self.player_index, direction, value_7)
         logits = self._forward(obs, "play_head")
-        mask = np.zeros(MAX_ACTIONS, dtype=bool)
-        for card in self.player.cards:
-            if card.can_be_played(top_card):
-                mask[_card_type_id(card)] = True
-        mask[ACTION_DRAW] = True
+        if self.game_view is not None:
+            playable = self.game_view.playable()
+            mask = _action_mask(playable, ACTION_DRAW)
+        else:
+            playable = 0
+            mask = np.zeros(MAX_ACTIONS, dtype=bool)
+            for card in self.player.cards:
+                if card.can_be_played(top_card):
+                    mask[_card_type_id(card)] = True
+                    playable = 1
+            mask[ACTION_DRAW] = True
         action = self._best_action(logits, mask)
         if action == ACTION_DRAW:
-            return any(c.can_be_played(top_card) for c in self.player.cards)
+            return bool(playable)
         card = _find_card(self.player.cards, action)
         return card if card is not None else False
 
     def pick_jump_card(self, top_card: BaseCard, current_player: int,
                        direction: int, value_7: int) -> BaseCard | None:
-        obs = self._encode(top_card, current_player, direction, value_7)
-        logits = self._forward(obs, "jump_head")
-        mask = np.zeros(MAX_ACTIONS, dtype=bool)
-        for card in self.player.cards:
-            if card.can_be_jumped(top_card):
-                mask[_card_type_id(card)] = True
-        mask[ACTION_NO_JUMP] = True
+        if self.game_view is not None:
+            jumpable = self.game_view.jumpable()
+            if not jumpable:
+                return None # Sense cap carta per saltar nomes es pot passar
+            obs = self._encode(top_card, current_player, direction, value_7)
+            logits = self._forward(obs, "jump_head")
+            mask = _action_mask(jumpable, ACTION_NO_JUMP)
+        else:
+            obs = self._encode(top_card, current_player, direction, value_7)
+            logits = self._forward(obs, "jump_head")
+            mask = np.zeros(MAX_ACTIONS, dtype=bool)
+            for card in self.player.cards:
+                if card.can_be_jumped(top_card):
+                    mask[_card_type_id(card)] = True
+            mask[ACTION_NO_JUMP] = True
         action = self._best_action(logits, mask)
         if action == ACTION_NO_JUMP:
             return None
@@ -763,59 +311,257 @@ class AlphaMao(Strategy):
         return card if card is not None else self.player.cards[0]
 
 class DolfiStrategy(Strategy):
+    always_poll_jumps = True # pick_jump_card avanca _optimal_sequence
+    uses_game_view = True
     N_DETERMINIZATIONS = 16
     N_ROLLOUTS_PER_DET = 10
+    ROLLOUT_BUDGET = 160 # Rollouts per accio, com l'assignacio fixa, repartits per successive halving
+    HALVING_ROUNDS = 2 # Cada ronda paga tots els passos de _simulate_games, sigui quina sigui la seva mida
+    CONFIDENCE_Z = 2.0 # None per nomes fer successive halving
+    # Decisions recordades per instancia (0: sense cache). La clau inclou la ma i les cartes no vistes,
+    # que gairebe mai es repeteixen en una partida real, aixi que nomes val la pena en posicions repetides
+    DECISION_CACHE_SIZE = 0
+    DECISION_CACHE_REFINE = False # En un encert: False torna la mateixa accio, True hi afegeix rollouts
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._optimal_sequence: list[BaseCard] = []
-
-    def _unknown_cards(self, top_card):
-        unknown = list(self.cards_not_viewed().cards)
-        if top_card in unknown:
-            unknown.remove(top_card)
+        self._np_rng: np.random.Generator | None = None
+        # Particules: mons determinitzats (mans dels rivals i pila) que es mantenen entre decisions
+        self._particle_hands: np.ndarray | None = None
+        self._particle_decks: list[list[int]] = []
+        self._particle_unknown: np.ndarray | None = None
+        self._particle_sizes: list[int] = []
+        self._particle_seat: int | None = None
+        # Per instancia, perque una partida amb llavor no depengui del que s'ha jugat abans al proces
+        self._decision_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _unknown_counts(self, top_card) -> np.ndarray:
+        """Copies of every card type that this player has not seen, without the top card."""
+        unknown = np.array(self.unseen_counts(), dtype=np.int64)
+        top_id = _card_type_id(top_card)
+        if unknown[top_id]:
+            unknown[top_id] -= 1
         return unknown
 
-    def _determinize(self, unknown_cards):
+    def _sample_particle(self, unknown):
         """Build one determinized world: shuffle unknowns into opponent hands + leftover deck."""
-        shuffled = unknown_cards.copy()
-        shuffle(shuffled)
-
-        hands = {}
+        shuffled = list(np.repeat(np.arange(NUM_CARD_TYPES), unknown))
+        self.rng.shuffle(shuffled)
+        hand = np.zeros((self.number_of_players, NUM_CARD_TYPES), dtype=np.int16)
         idx = 0
         for p in range(self.number_of_players):
-            if p == self.player_index:
-                hands[p] = list(self.player.cards)
-            else:
+            if p != self.player_index:
                 size = min(self.num_cards_per_player[p], len(shuffled) - idx)
-                hands[p] = shuffled[idx:idx + size]
+                np.add.at(hand[p], shuffled[idx:idx + size], 1)
                 idx += size
-        return hands, shuffled[idx:]
-
-    def _copy_state(self, hands, det_deck):
-        return [list(hands[p]) for p in range(self.number_of_players)], list(det_deck)
-
-    def _pimc_evaluate(self, top_card, actions, run_fn):
-        """Run PIMC: for each action, average win-rate across determinizations. Returns best action."""
-        wins = defaultdict(int)
-        trials = defaultdict(int)
-        unknown = self._unknown_cards(top_card)
-
-        for _ in range(self.N_DETERMINIZATIONS):
-            hands, det_deck = self._determinize(unknown)
-            for action in actions:
-                key = _card_key(action)
-                for _ in range(self.N_ROLLOUTS_PER_DET):
-                    h, d = self._copy_state(hands, det_deck)
-                    wins[key] += int(run_fn(h, d, action))
-                    trials[key] += 1
+        return hand, shuffled[idx:]
+
+    def _insert_in_deck(self, deck, card_type):
+        deck.insert(self.rng.randint(0, len(deck)), card_type)
+
+    def _repair_particle(self, d, gone, back) -> bool:
+        """Make particle d agree with what has happened since the last sync. False if it can't.
+
+        gone are the copies of every card type that have been seen since then and back the
+        ones that are unknown again (reshuffled). A seen copy is taken from an opponent whose
+        hand shrank, else from the deck, else from any opponent. Then the opponent hands are
+        brought to their real sizes drawing from the end of the deck, or putting random cards
+        of the hand back into the deck.
+        """
+        hands, deck = self._particle_hands[d], self._particle_decks[d]
+        opponents = [p for p in range(self.number_of_players) if p != self.player_index]
+        shrank = [p for p in opponents if hands[p].sum() > self.num_cards_per_player[p]]
+        for card_type in np.flatnonzero(gone):
+            for _ in range(gone[card_type]):
+                holder = next((p for p in shrank if hands[p, card_type]), None)
+                if holder is None and card_type in deck:
+                    deck.remove(card_type)
+                    continue
+                if holder is None:
+                    holder = next((p for p in opponents if hands[p, card_type]), None)
+                if holder is None:
+                    return False
+                hands[holder, card_type] -= 1
+        for card_type in np.flatnonzero(back):
+            for _ in range(back[card_type]):
+                self._insert_in_deck(deck, int(card_type))
+        for p in opponents:
+            size = int(hands[p].sum())
+            while size > self.num_cards_per_player[p]:
+                card_type = self.rng.choices(range(NUM_CARD_TYPES), weights=hands[p])[0]
+                hands[p, card_type] -= 1
+                self._insert_in_deck(deck, card_type)
+                size -= 1
+            while size < self.num_cards_per_player[p]:
+                if not deck:
+                    return False
+                hands[p, deck.pop()] += 1
+                size += 1
+        return True
+
+    def _sync_particles(self, top_card):
+        """Update the particles to the current game, resampling only the ones that are not consistent with it."""
+        unknown = self._unknown_counts(top_card)
+        dets = self.N_DETERMINIZATIONS
+        change = unknown - self._particle_unknown if self._particle_seat == self.player_index else None
+        # Un canvi de seient o un canvi gran (partida nova, pausa) es torna a mostrejar sencer
+        if change is None or np.abs(change).sum() * 2 > max(unknown.sum(), 1):
+            particles = [self._sample_particle(unknown) for _ in range(dets)]
+            self._particle_hands = np.array([hand for hand, _ in particles])
+            self._particle_decks = [deck for _, deck in particles]
+        elif change.any() or self._particle_sizes != self.num_cards_per_player:
+            gone, back = np.maximum(-change, 0), np.maximum(change, 0)
+            for d in range(dets):
+                if not self._repair_particle(d, gone, back):
+                    self._particle_hands[d], self._particle_decks[d] = self._sample_particle(unknown)
+        self._particle_unknown = unknown
+        self._particle_sizes = list(self.num_cards_per_player)
+        self._particle_seat = self.player_index
+
+    def _rollout_rng(self) -> np.random.Generator:
+        # Es crea al primer us, despres que run_simulation hagi posat self.rng
+        if self._np_rng is None:
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(128))
+        return self._np_rng
+
+    def _determinized_worlds(self, top_card):
+        """The particles as count arrays: hands (players x 52), decks in draw order and deck lengths."""
+        self._sync_particles(top_card)
+        dets = self.N_DETERMINIZATIONS
+        det_hands = self._particle_hands.copy()
+        det_hands[:, self.player_index] = 0
+        for card in self.player.cards:
+            det_hands[:, self.player_index, _card_type_id(card)] += 1
+        det_len = np.array([len(deck) for deck in self._particle_decks], dtype=np.int64)
+        det_decks = np.zeros((dets, max(det_len.max(), 1)), dtype=np.int16)
+        for d, deck in enumerate(self._particle_decks):
+            det_decks[d, :len(deck)] = deck[::-1] # Es roba del final
+        return det_hands, det_decks, det_len
+
+    def _rollouts(self, worlds, top_card, direction, value_7, start_player, discard, action_ids, det):
+        """Simulate one rollout per (action id, determinization) pair with _simulate_games. Returns the wins."""
+        det_hands, det_decks, det_len = worlds
+        num_rollouts = len(action_ids)
+        hands = det_hands[det]
+        if discard:
+            hands[np.arange(num_rollouts), self.player_index, action_ids] -= 1
+            first = np.full(num_rollouts, FIRST_NONE)
+        else:
+            first = action_ids
+        return _simulate_games(
+            hands, det_decks[det], det_len[det],
+            np.full(num_rollouts, _card_type_id(top_card)),
+            np.full(num_rollouts, direction), np.full(num_rollouts, value_7),
+            np.full(num_rollouts, start_player), self.player_index, first, self._rollout_rng(),
+        )
 
-        def win_rate(action):
-            k = _card_key(action)
-            t = trials[k]
-            return wins[k] / t if t > 0 else 0.0
+    def _allocate_rollouts(self, top_card, action_ids, direction, value_7, start_player, discard):
+        """Estimate the actions by successive halving. Returns the wins and trials of every action and the survivors.
+
+        The budget is ROLLOUT_BUDGET rollouts per action (never more than N_ROLLOUTS_PER_DET
+        per determinization and action), so a decision costs what the fixed allocation did. It is
+        split evenly between HALVING_ROUNDS rounds, and every round shares its part between
+        the surviving actions, then drops the ones whose win-rate is CONFIDENCE_Z Hoeffding
+        half-widths below the leader and keeps the best half of the rest. It stops early when
+        one action is left.
+        """
+        dets = self.N_DETERMINIZATIONS
+        worlds = self._determinized_worlds(top_card)
+        budget = len(action_ids) * min(self.ROLLOUT_BUDGET, dets * self.N_ROLLOUTS_PER_DET)
+
+        wins = np.zeros(len(action_ids))
+        action_trials = np.zeros(len(action_ids))
+        trials = 0 # Totes les accions vives en porten els mateixos
+        alive = np.arange(len(action_ids))
+        used = 0
+        for round_number in range(self.HALVING_ROUNDS):
+            if len(alive) == 1:
+                break
+            per_action = (budget - used) // (self.HALVING_ROUNDS - round_number) // len(alive)
+            if per_action == 0:
+                break
+            # Mateixes determinitzacions per totes les accions, per comparar-les en els mateixos mons
+            det = np.tile((trials + np.arange(per_action)) % dets, len(alive))
+            won = self._rollouts(worlds, top_card, direction, value_7, start_player, discard,
+                                 np.repeat(action_ids[alive], per_action), det)
+            wins[alive] += won.reshape(len(alive), per_action).sum(axis=1)
+            action_trials[alive] += per_action
+            trials += per_action
+            used += per_action * len(alive)
+            win_rate = wins[alive] / trials
+            if self.CONFIDENCE_Z is not None:
+                half_width = self.CONFIDENCE_Z * np.sqrt(0.25 / trials)
+                alive = alive[win_rate >= win_rate.max() - 2 * half_width]
+                win_rate = wins[alive] / trials
+            if len(alive) > 2:
+                best_half = np.argsort(-win_rate, kind="stable")[:(len(alive) + 1) // 2]
+                alive = np.sort(alive[best_half])
+        return wins, action_trials, alive
+
+    def _decision_key(self, top_card, action_ids, direction, value_7, start_player, discard):
+        """Canonical information state of a decision, seen from this seat."""
+        n, my = self.number_of_players, self.player_index
+        hand = np.zeros(NUM_CARD_TYPES, dtype=np.int16)
+        for card in self.player.cards:
+            hand[_card_type_id(card)] += 1
+        return (
+            discard, hand.tobytes(), self._unknown_counts(top_card).tobytes(), _card_type_id(top_card),
+            direction, value_7, (start_player - my) % n,
+            tuple(self.num_cards_per_player[(my + i) % n] for i in range(1, n)),
+            tuple(sorted(action_ids.tolist())),
+        )
 
-        return max(actions, key=win_rate)
+    def _pimc_evaluate(self, top_card, actions, direction, value_7, start_player, discard=False):
+        """Run PIMC: estimate the win-rate of every action across determinizations. Returns best action.
+
+        An action is a card to play (None to draw) by this player, or with discard=True a card
+        removed from the hand before playing on from start_player.
+
+        With DECISION_CACHE_SIZE > 0 the results are kept in an LRU cache of that many decisions
+        keyed by the information state (hand, unseen cards, top card, direction, value_7, turn
+        and hand sizes). It is off by default: in real games that state almost never repeats.
+        On a hit the cached action is reused, or with DECISION_CACHE_REFINE the cached
+        rollouts are added to a new round of them.
+        """
+        if len(actions) == 1:
+            return actions[0]
+        action_ids = np.array([FIRST_DRAW if a is None else _card_type_id(a) for a in actions])
+        key = cached = None
+        if self.DECISION_CACHE_SIZE:
+            key = self._decision_key(top_card, action_ids, direction, value_7, start_player, discard)
+            cached = self._decision_cache.get(key)
+            if cached is None:
+                self.cache_misses += 1
+            else:
+                self.cache_hits += 1
+                self._decision_cache.move_to_end(key)
+                if not self.DECISION_CACHE_REFINE:
+                    return actions[action_ids.tolist().index(cached["best"])]
+
+        wins, trials, alive = self._allocate_rollouts(top_card, action_ids, direction, value_7, start_player, discard)
+        if cached is not None:
+            for i, action_id in enumerate(action_ids.tolist()):
+                wins[i] += cached["wins"][action_id]
+                trials[i] += cached["trials"][action_id]
+        win_rate = wins / np.maximum(trials, 1)
+        best = int(alive[np.argmax(win_rate[alive])])
+        if key is not None:
+            self._decision_cache[key] = {
+                "best": int(action_ids[best]),
+                "wins": dict(zip(action_ids.tolist(), wins.tolist())),
+                "trials": dict(zip(action_ids.tolist(), trials.tolist())),
+            }
+            if len(self._decision_cache) > self.DECISION_CACHE_SIZE:
+                self._decision_cache.popitem(last=False)
+        return actions[best]
+
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
 
     def _choose_best_card(self, top_card, direction, value_7):
         """PIMC: pick the action (play card or draw) with highest win rate."""
@@ -828,31 +574,73 @@ class DolfiStrategy(Strategy):
             return unique_playable[0], True
 
         actions = unique_playable + [None]
-        n, my = self.number_of_players, self.player_index
-
-        best = self._pimc_evaluate(
-            top_card, actions,
-            lambda h, d, a: _simulate_game(my, my, n, h, d, top_card, direction, value_7, first_card=a),
-        )
+        best = self._pimc_evaluate(top_card, actions, direction, value_7, self.player_index)
         return best, True
 
     def _find_maximal_jumping_path(self, top_card, cards_repeated):
-        best_path = []
-
-        def dfs(path, remaining):
-            nonlocal best_path
-            if len(path) > len(best_path):
-                best_path = path[:]
-            for card in list(remaining):
-                if card.can_be_played(path[-1]):
-                    remaining.remove(card)
-                    dfs(path + [card], remaining)
-                    remaining.append(card)
-
-        dfs([top_card], cards_repeated)
-        return best_path
+        """Longest chain top_card, c1, c2, ... where every card can be played on the previous one.
+
+        The cards are grouped by type and the longest chain from (last card type, copies
+        left of every type) is memoized, so the cost is the number of such states instead of
+        the number of orderings. A state stops being searched once a chain uses every copy
+        of the types still reachable from its last card, and a branch that can't beat the
+        best chain found is not searched. Ties go to the type that appears first in
+        cards_repeated (not to the first chain of the plain DFS over the list).
+        """
+        copies: dict[tuple, list[BaseCard]] = {}
+        for card in cards_repeated:
+            copies.setdefault(_card_key(card), []).append(card)
+        types = [group[0] for group in copies.values()]
+        # follows[i]: tipus que es poden tirar sobre el tipus i (l'ultim, i = len(types), es top_card)
+        follows = [[j for j, card in enumerate(types) if card.can_be_played(last)] for last in types + [top_card]]
+        follow_masks = [sum(1 << j for j in row) for row in follows]
+        memo: dict[tuple[int, tuple[int, ...]], tuple[int, int | None]] = {}
+
+        def reachable(last, left):
+            """Copies left of the types a chain after last can still get to: a bound of its length."""
+            available = sum(1 << j for j, count in enumerate(left) if count)
+            reached = 0
+            frontier = follow_masks[last] & available
+            while frontier:
+                reached |= frontier
+                step = 0
+                for j in mask_types(frontier):
+                    step |= follow_masks[j]
+                frontier = step & available & ~reached
+            return sum(left[j] for j in mask_types(reached))
+
+        def longest(last, left):
+            key = (last, left)
+            if key not in memo:
+                best = (0, None)
+                most = reachable(last, left)
+                for j in follows[last]:
+                    if left[j]:
+                        child = left[:j] + (left[j] - 1,) + left[j + 1:]
+                        if 1 + reachable(j, child) <= best[0]:
+                            continue # No pot millorar la millor cadena
+                        length = 1 + longest(j, child)[0]
+                        if length > best[0]:
+                            best = (length, j)
+                            if length == most: # Ja fa servir totes les que pot
+                                break
+                memo[key] = best
+            return memo[key]
+
+        left = tuple(len(group) for group in copies.values())
+        last = len(types)
+        path = [top_card]
+        while True:
+            j = longest(last, left)[1]
+            if j is None:
+                return path
+            path.append(copies[_card_key(types[j])][left[j] - 1])
+            left = left[:j] + (left[j] - 1,) + left[j + 1:]
+            last = j
 
     def pick_play_card(self, top_card: BaseCard, direction: int, value_7: int) -> BaseCard | bool:
+        if self.game_view is not None and not self.game_view.playable():
+            return False
         available = sorted(
             [c for c in self.player.cards if c.can_be_played(top_card)],
             key=lambda x: (x.value, x.suit),
@@ -861,15 +649,15 @@ class DolfiStrategy(Strategy):
         if not available:
             return False
 
-        # A very rare case: This could have things from another game
-        # With this we ensure that we have it all from the same game
+        # on_game_start empties it, but a card of it may have been played already
+        # (e.g. someone else jumped before we were polled), which breaks the sequence
         for i in self._optimal_sequence: 
-            if i not in self.player.cards:
+            if i not in self.player:
                 self._optimal_sequence.clear() 
                 break
 
         if not self._optimal_sequence:
-            repeated = [c for c in available if self.player.cards.count(c) > 1]
+            repeated = [c for c in available if self.player.count(c) > 1]
             path = self._find_maximal_jumping_path(top_card, repeated)
             self._optimal_sequence = path[1:]
 
@@ -885,11 +673,13 @@ class DolfiStrategy(Strategy):
 
     def pick_jump_card(self, top_card: BaseCard, current_player: int, direction: int, value_7: int) -> BaseCard | None:
         if self._optimal_sequence:
-            if self._optimal_sequence[0] in self.player.cards:
+            if self._optimal_sequence[0] in self.player:
                 return self._optimal_sequence.pop(0)
             else:
-                self._optimal_sequence.clear() # Rare case: This could have things from another game
+                self._optimal_sequence.clear() # We had only that copy and it's already played
 
+        if self.game_view is not None and not self.game_view.jumpable():
+            return None
         for card in self.player.cards:
             if not card.can_be_jumped(top_card):
                 continue
@@ -899,18 +689,39 @@ class DolfiStrategy(Strategy):
                     return card
         return None
 
-    def discard_card(self, top_card: BaseCard, current_player: int, direction: int, value_7: int) -> BaseCard:
+    def on_game_start(self, top_card: BaseCard, first_player: int) -> None:
+        self._optimal_sequence.clear()
+
+    def _plausible_discards(self):
         for i in self._optimal_sequence: 
-            if i not in self.player.cards:
+            if i not in self.player:
                 self._optimal_sequence.clear() 
                 break
-        plausible_cards = [c for c in self.player.cards if c not in self._optimal_sequence]
-        unique = _unique_cards(plausible_cards)
-
-        n, my = self.number_of_players, self.player_index
+        return [c for c in self.player.cards if c not in self._optimal_sequence]
 
-        def run_without(h, d, card):
-            h[my].remove(card)
-            return _simulate_game(current_player, my, n, h, d, top_card, direction, value_7)
-
-        return self._pimc_evaluate(top_card, unique, run_without)
+    def discard_card(self, top_card: BaseCard, current_player: int, direction: int, value_7: int) -> BaseCard:
+        unique = _unique_cards(self._plausible_discards())
+        return self._pimc_evaluate(top_card, unique, direction, value_7, current_player, discard=True)
+
+    def discard_cards(self, k: int, top_card: BaseCard, current_player: int, direction: int, value_7: int) -> list[BaseCard] | None:
+        """Rank the cards with a single PIMC evaluation (win-rate without each one) and drop the k best ones to lose.
+
+        The best ranked types lose one copy each first, then a second copy, and so on.
+        """
+        copies: dict[tuple, list[BaseCard]] = {}
+        for card in self._plausible_discards():
+            copies.setdefault(_card_key(card), []).append(card)
+        if not copies:
+            return None
+        groups = list(copies.values())
+        if len(groups) > 1:
+            action_ids = np.array([_card_type_id(group[0]) for group in groups])
+            wins, trials, alive = self._allocate_rollouts(top_card, action_ids, direction, value_7, current_player, True)
+            win_rate = wins / np.maximum(trials, 1)
+            # Primer les que han sobreviscut al successive halving, i despres per win-rate
+            eliminated = ~np.isin(np.arange(len(groups)), alive)
+            groups = [groups[j] for j in np.lexsort((-win_rate, eliminated))]
+        chosen = []
+        for copy in range(max(len(group) for group in groups)):
+            chosen += [group[copy] for group in groups if copy < len(group)]
+        return chosen[:k]
@@ -1,3 +1,5 @@
+import os
+
 from base.classes import NormalCard, FirstStrategy, RandomStrategy
 from base.sim import run_simulation
 
@@ -24,6 +26,8 @@ run_simulation(
     num_decks=2,
     build_deck=build_deck,
     strategies_to_call = [MyStrategy1] + [FirstStrategy] * (N-1),
+    persist=True,
+    workers=os.cpu_count() or 1, # Reparteix les iteracions entre tots els nuclis
 )
 
 # Not recommended, as you will always win (if your strategy isn't more random than this)
@@ -34,5 +38,6 @@ run_simulation(
     num_decks=1,
     build_deck=build_deck,
     strategies_to_call = [MyStrategy] + [RandomStrategy] * (N-1),
+    persist=True,
 )
 """
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from base.classes import FirstStrategy
+from base.sim import run_simulation
+from simulator_combined_strategies import build_deck
+from strategies import repster_strategies
+from strategies.repster_strategies import WEIGHT_SHAPES, WEIGHTS_PATH, AlphaMao, _shared_model
+
+
+def test_weights_are_memory_mapped_and_read_only():
+    model = _shared_model()
+    assert [(name, weights.shape) for name, weights in model.items()] == list(WEIGHT_SHAPES)
+    for weights in model.values():
+        assert weights.dtype == np.float32
+        assert isinstance(weights.base, np.memmap) or isinstance(weights.base.base, np.memmap)
+        with pytest.raises(ValueError):
+            weights[...] = 0
+    assert _shared_model() is model
+
+
+def test_every_instance_shares_the_weights():
+    seen = []
+
+    class SharingAlphaMao(AlphaMao):
+        def pick_play_card(self, top_card, direction, value_7):
+            seen.append(self._w)
+            return super().pick_play_card(top_card, direction, value_7)
+
+    run_simulation(n=3, iter_max=300, num_decks=2, build_deck=build_deck, strategies_to_call=[SharingAlphaMao, SharingAlphaMao, FirstStrategy], seed=1)
+    assert seen and all(weights is _shared_model() for weights in seen)
+
+
+def test_memory_mapped_weights_play_like_loaded_ones(monkeypatch):
+    kwargs = dict(n=3, iter_max=3000, num_decks=2, build_deck=build_deck, strategies_to_call=[AlphaMao, FirstStrategy, AlphaMao], random_first_player=True, seed=2)
+    mapped = run_simulation(**kwargs).to_dict()
+    flat = np.load(WEIGHTS_PATH) # Llegit sencer a memoria
+    loaded, off = {}, 0
+    for name, shape in WEIGHT_SHAPES:
+        size = int(np.prod(shape))
+        loaded[name] = flat[off:off + size].reshape(shape)
+        off += size
+    monkeypatch.setattr(repster_strategies, "_model", loaded)
+    in_memory = run_simulation(**kwargs).to_dict()
+    for result in (mapped, in_memory):
+        del result["temps"]
+    assert mapped == in_memory
@@ -0,0 +1,32 @@
+import math
+
+from base.batch import run_batch_simulation
+from base.classes import FirstStrategy
+from base.sim import run_simulation
+from simulator_combined_strategies import build_deck
+
+
+def _both(strategies, iter_max):
+    kwargs = dict(n=len(strategies), iter_max=iter_max, num_decks=2, build_deck=build_deck, strategies_to_call=strategies, random_first_player=True, seed=1)
+    return run_simulation(**kwargs), run_batch_simulation(**kwargs)
+
+
+def _close(a: float, b: float, se: float) -> bool:
+    return abs(a - b) <= 4 * se
+
+
+def test_batch_agrees_with_run_simulation():
+    # Mateixes regles, no mateixes partides: les estadistiques han de coincidir dins del soroll
+    sim, batch = _both([FirstStrategy, FirstStrategy, FirstStrategy], 100000)
+    for result in (sim, batch):
+        assert sum(result.maos) == result.num_games > 1000
+    se_turns = math.sqrt(sim.game_turns.variance / sim.num_games + batch.game_turns.variance / batch.num_games)
+    assert _close(sim.mean_turns_per_game, batch.mean_turns_per_game, se_turns)
+    for seat in range(3):
+        p_sim, p_batch = sim.maos[seat] / sim.num_games, batch.maos[seat] / batch.num_games
+        assert _close(p_sim, p_batch, math.sqrt(p_sim * (1 - p_sim) / sim.num_games + p_batch * (1 - p_batch) / batch.num_games))
+    sim_probs, batch_probs = sim.cards_prob.to_dict(), batch.cards_prob.to_dict()
+    for hand_size in (3, 5, 8):
+        (p_sim, n_sim), (p_batch, n_batch) = ((probs[hand_size][0] / probs[hand_size][1], probs[hand_size][1]) for probs in (sim_probs, batch_probs))
+        assert _close(p_sim, p_batch, math.sqrt(p_sim * (1 - p_sim) / n_sim + p_batch * (1 - p_batch) / n_batch))
+
@@ -0,0 +1,81 @@
+import importlib
+import shutil
+import sys
+
+import pytest
+
+import base.cache as cache
+from base.cache import ENGINE_FILES, ResultCache, strategy_fingerprint
+
+STRATEGY_SOURCE = """
+from base.classes import FirstStrategy
+
+DATA_FILES = [{data!r}]
+
+
+class CachedStrategy(FirstStrategy):
+    LEVEL = {level}
+"""
+
+
+@pytest.fixture
+def strategy_module(tmp_path, monkeypatch):
+    """A strategy module in tmp_path whose source and data file the test can change."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    data = tmp_path / "weights.bin"
+    data.write_bytes(b"0")
+    source = tmp_path / "cached_strategy.py"
+
+    def write(level: int = 1):
+        source.write_text(STRATEGY_SOURCE.format(data=str(data), level=level))
+        sys.modules.pop("cached_strategy", None)
+        return importlib.import_module("cached_strategy").CachedStrategy
+
+    write.data = data
+    yield write
+    sys.modules.pop("cached_strategy", None)
+
+
+def test_hit_in_any_order(tmp_path, strategy_module):
+    strategy = strategy_module()
+    other = importlib.import_module("base.classes").RandomStrategy
+    results = ResultCache(str(tmp_path / "cache"), 2)
+    assert results.get([strategy, other]) is None
+    results.put([strategy, other], [7, 3], 1, 1000)
+    assert results.get([other, strategy])["maos"] == [3, 7]
+    assert results.get([strategy, other])["total_iters"] == 1000
+
+
+def test_strategy_source_and_data_files_invalidate(tmp_path, strategy_module):
+    strategy = strategy_module(level=1)
+    before = strategy_fingerprint(strategy)
+    assert strategy_fingerprint(strategy_module(level=1)) == before
+    assert strategy_fingerprint(strategy_module(level=2)) != before
+    strategy = strategy_module(level=1)
+    strategy_module.data.write_bytes(b"1")
+    assert strategy_fingerprint(strategy) != before
+
+
+def test_decks_and_stopping_settings_are_part_of_the_key(tmp_path, strategy_module):
+    strategy = strategy_module()
+    directory = str(tmp_path / "cache")
+    ResultCache(directory, 2, {"alpha": 0.001}).put([strategy], [1], 0, 10)
+    assert ResultCache(directory, 2, {"alpha": 0.001}).get([strategy]) is not None
+    assert ResultCache(directory, 2, {"alpha": 0.01}).get([strategy]) is None
+    assert ResultCache(directory, 2).get([strategy]) is None
+    assert ResultCache(directory, 1, {"alpha": 0.001}).get([strategy]) is None
+
+
+@pytest.mark.parametrize("filename", ["sim.py", "sequential.py", "stats.py"])
+def test_engine_and_statistics_sources_invalidate(tmp_path, monkeypatch, strategy_module, filename):
+    assert filename in ENGINE_FILES
+    base_dir = tmp_path / "base"
+    shutil.copytree(cache._BASE_DIR, base_dir)
+    monkeypatch.setattr(cache, "_BASE_DIR", str(base_dir))
+    monkeypatch.setattr(cache, "_engine_version", None)
+    strategy = strategy_module()
+    before = strategy_fingerprint(strategy)
+    with open(base_dir / filename, "a") as f:
+        f.write("\n# canvi\n")
+    monkeypatch.setattr(cache, "_engine_version", None)
+    assert strategy_fingerprint(strategy) != before
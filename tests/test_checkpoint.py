@@ -0,0 +1,69 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import simulator_combined_strategies as tournament
+from base import checkpoint
+from base.checkpoint import CheckpointStore, atomic_write_json
+
+
+def test_failed_write_keeps_the_previous_checkpoint(monkeypatch):
+    store = CheckpointStore("store")
+    store.save(("A", "B"), {"maos": [1, 2]})
+
+    def dump_half(data, f):
+        f.write(json.dumps(data)[:5])
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(checkpoint.json, "dump", dump_half)
+        with pytest.raises(OSError):
+            store.save(("A", "B"), {"maos": [3, 4]})
+    assert os.listdir("store") == ["A_B.json"] # Cap fitxer temporal a mitges
+    assert store.load_all() == {("A", "B"): {"maos": [1, 2], "names": ["A", "B"]}}
+
+
+def test_store_round_trip():
+    store = CheckpointStore("store")
+    assert store.load_all() == {} and store.load_meta() is None
+    store.save(("A", "B", "C"), {"maos": [1, 2, 3], "done": True})
+    store.save(("A", "C"), {"maos": [5, 0], "done": False})
+    store.save_meta({"seed": 7})
+    open(os.path.join("store", ".tmp_leftover.json"), "w").close() # D'una escriptura que va petar
+    assert store.load_meta() == {"seed": 7}
+    assert store.load_all() == {
+        ("A", "B", "C"): {"maos": [1, 2, 3], "done": True, "names": ["A", "B", "C"]},
+        ("A", "C"): {"maos": [5, 0], "done": False, "names": ["A", "C"]},
+    }
+    store.clear()
+    assert store.load_all() == {} and store.load_meta() is None
+
+
+def test_atomic_write_replaces_the_whole_file():
+    atomic_write_json("state.json", {"a": list(range(1000))})
+    atomic_write_json("state.json", {"b": 1})
+    with open("state.json") as f:
+        assert json.load(f) == {"b": 1}
+
+
+def test_resumed_matchup_ends_like_an_uninterrupted_one(monkeypatch):
+    # Un checkpoint per cada SEQUENTIAL_CHECK_EVERY partides, i prou iteracions per tenir-ne uns quants
+    monkeypatch.setattr(tournament, "CHECKPOINT_EVERY_SECONDS", 0)
+    monkeypatch.setattr(tournament, "MAX_ITER_PER_MATCHUP", 20000)
+    monkeypatch.setattr(tournament, "SEQUENTIAL_TESTING", True)
+    saved = []
+    save = CheckpointStore.save
+    monkeypatch.setattr(CheckpointStore, "save", lambda self, names, state: (saved.append(json.loads(json.dumps(state))), save(self, names, state)))
+    names = ("FirstStrategy", "FirstStrategy", "FirstStrategy")
+
+    _, full, _ = tournament._run_matchup_worker(names, 0, 2, np.random.SeedSequence(5))
+    checkpoints = saved[:-1]
+    assert full["done"] and len(checkpoints) >= 3
+    assert [state["runs"] for state in checkpoints] == list(range(1, len(checkpoints) + 1))
+
+    middle = checkpoints[len(checkpoints) // 2]
+    _, resumed, _ = tournament._run_matchup_worker(names, 0, 2, np.random.SeedSequence(5), dict(middle))
+    assert resumed == full
+    assert CheckpointStore(tournament.CHECKPOINT_DIR).load_all()[names] == {**full, "names": list(names)}
@@ -0,0 +1,53 @@
+import random
+from array import array
+
+import pytest
+
+from base.classes import NUM_CARD_TYPES, SUITS, CountedDeck, Deck, NormalCard
+from simulator_combined_strategies import build_deck
+
+
+def _check(counted: CountedDeck, plain: Deck) -> None:
+    assert counted.cards == plain.cards # Mateix ordre que un Deck normal
+    for type_id in range(NUM_CARD_TYPES):
+        card = NormalCard(type_id // len(SUITS) + 1, SUITS[type_id % len(SUITS)])
+        assert counted.count(card) == plain.cards.count(card)
+        assert (card in counted) == (card in plain.cards)
+        assert (counted.type_mask >> type_id & 1) == (card in plain.cards)
+    for suit in SUITS:
+        assert counted.count_suit(suit) == sum(card.suit == suit for card in plain.cards)
+    for value in range(1, 14):
+        assert counted.count_value(value) == sum(card.value == value for card in plain.cards)
+
+
+def test_counts_follow_every_add_and_remove():
+    rng = random.Random(0)
+    source = Deck()
+    build_deck(source, 2)
+    counted, plain = CountedDeck(), Deck()
+    complement = array("q", [2] * NUM_CARD_TYPES)
+    mirror = [0] * NUM_CARD_TYPES
+    counted.complement_counts.append(complement)
+    counted.mirror_counts.append(mirror)
+    for _ in range(2000):
+        if counted.cards and rng.random() < 0.5:
+            if rng.random() < 0.3:
+                assert counted.remove_top_card() == plain.remove_top_card()
+            else:
+                card = rng.choice(counted.cards)
+                counted.remove_card(card)
+                plain.remove_card(card)
+        elif source.cards:
+            card = source.cards.pop(rng.randrange(len(source.cards)))
+            counted.add_card(card)
+            plain.add_card(card)
+        _check(counted, plain)
+        assert list(mirror) == counted.type_counts
+        assert [2 - count for count in counted.type_counts] == list(complement)
+
+
+def test_removing_a_missing_card_raises():
+    deck = CountedDeck()
+    deck.add_card(NormalCard(3, "hearts"))
+    with pytest.raises(ValueError):
+        deck.remove_card(NormalCard(3, "spades"))
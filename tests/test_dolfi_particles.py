@@ -0,0 +1,42 @@
+import numpy as np
+
+from base.classes import FirstStrategy
+from base.sim import run_simulation
+from simulator_combined_strategies import build_deck
+from strategies.repster_strategies import NUM_CARD_TYPES, DolfiStrategy
+
+
+class CheckedDolfi(DolfiStrategy):
+    """A cheap DolfiStrategy that checks its particles against the game after every sync."""
+    N_DETERMINIZATIONS = 4
+    N_ROLLOUTS_PER_DET = 2
+    ROLLOUT_BUDGET = 8
+    syncs = 0
+    changed = 0
+
+    def _sync_particles(self, top_card):
+        before = None if self._particle_hands is None else self._particle_hands.copy()
+        super()._sync_particles(top_card)
+        unknown = self._unknown_counts(top_card)
+        for d in range(self.N_DETERMINIZATIONS):
+            hands, deck = self._particle_hands[d], self._particle_decks[d]
+            assert not hands[self.player_index].any()
+            assert (hands >= 0).all()
+            for p in range(self.number_of_players):
+                if p != self.player_index:
+                    assert hands[p].sum() == min(self.num_cards_per_player[p], unknown.sum())
+            world = hands.sum(axis=0) + np.bincount(np.array(deck, dtype=np.int64), minlength=NUM_CARD_TYPES)
+            assert (world == unknown).all() # Cada copia no vista esta a una ma o a la pila, un sol cop
+        if before is not None and before.shape == self._particle_hands.shape:
+            CheckedDolfi.changed += int((before != self._particle_hands).any())
+        CheckedDolfi.syncs += 1
+
+
+def test_particles_stay_consistent_with_the_game():
+    CheckedDolfi.syncs = CheckedDolfi.changed = 0
+    result = run_simulation(
+        n=3, iter_max=3000, num_decks=2, build_deck=build_deck, strategies_to_call=[CheckedDolfi, FirstStrategy, FirstStrategy],
+        random_first_player=True, log_ignores_wrong_cards=True, seed=3,
+    )
+    assert result.num_games and not result.aborted
+    assert CheckedDolfi.syncs > 150 and CheckedDolfi.changed > 0
@@ -0,0 +1,56 @@
+import itertools
+import random
+import time
+
+from base.classes import SUITS, NormalCard
+from strategies.repster_strategies import DolfiStrategy
+
+find_path = DolfiStrategy._find_maximal_jumping_path
+
+
+def _brute_force_length(top_card, cards):
+    best = 0
+    for size in range(len(cards), 0, -1):
+        for chain in itertools.permutations(cards, size):
+            if all(card.can_be_played(last) for last, card in zip((top_card, *chain), chain)):
+                return size
+    return best
+
+
+def _is_chain(path, cards):
+    played = path[1:]
+    assert all(card.can_be_played(last) for last, card in zip(path, played))
+    left = list(cards)
+    for card in played:
+        left.remove(card)
+
+
+def test_path_is_a_maximal_chain():
+    rng = random.Random(0)
+    for _ in range(200):
+        top_card = NormalCard(rng.randint(1, 13), rng.choice(SUITS))
+        cards = []
+        while len(cards) < 6:
+            card = NormalCard(rng.randint(1, 5), rng.choice(SUITS))
+            cards += [card] * rng.randint(1, 2)
+        path = find_path(None, top_card, cards)
+        assert path[0] is top_card
+        _is_chain(path, cards)
+        assert len(path) - 1 == _brute_force_length(top_card, cards)
+
+
+def test_ties_go_to_the_first_type():
+    top_card = NormalCard(6, "diamonds")
+    cards = [NormalCard(6, "diamonds")] * 3 + [NormalCard(6, "spades")] * 3 + [NormalCard(8, "hearts")] * 3
+    assert [str(card) for card in find_path(None, top_card, cards)[1:]] == ["6 of diamonds"] * 3 + ["6 of spades"] * 3
+
+
+def test_large_hand_without_a_full_chain_is_fast():
+    # Parelles de cors i una parella de 5 de piques que nomes es pot tirar sobre el 5 de cors de dalt
+    values = [value for value in range(1, 14) if value != 5]
+    cards = [NormalCard(value, "hearts") for value in values for _ in range(2)] + [NormalCard(5, "spades")] * 2
+    start = time.perf_counter()
+    path = find_path(None, NormalCard(5, "hearts"), cards)
+    assert time.perf_counter() - start < 1.0
+    assert len(path) - 1 == 2 * len(values)
+    _is_chain(path, cards)
@@ -0,0 +1,47 @@
+import random
+
+from base.batch import run_batch_simulation
+from base.classes import FirstStrategy, RandomStrategy
+from base.sim import run_simulation
+from simulator_combined_strategies import build_deck
+
+
+class ModuleRandomStrategy(FirstStrategy):
+    """Plays a random playable card with the random module, like the strategies that predate Strategy.rng."""
+
+    def pick_play_card(self, top_card, direction, value_7):
+        playable = [card for card in self.player.cards if card.can_be_played(top_card)]
+        return random.choice(playable) if playable else False
+
+
+def _run(seed, workers=1, engine=run_simulation, strategies=(ModuleRandomStrategy, FirstStrategy, ModuleRandomStrategy)):
+    kwargs = dict(n=3, iter_max=6000, num_decks=2, build_deck=build_deck, strategies_to_call=list(strategies), random_first_player=True, random_position_players=True, seed=seed)
+    if workers > 1:
+        kwargs.update(workers=workers, shard_iters=2000)
+    return engine(**kwargs).to_dict()
+
+
+def _games(result: dict) -> tuple:
+    return result["maos"], result["partides"], result["pauses"], result["dict_cartes_prob"]
+
+
+def test_same_seed_replays_the_same_games():
+    assert _games(_run(11)) == _games(_run(11))
+    assert _games(_run(11)) != _games(_run(12))
+
+
+def test_same_seed_replays_the_same_shards():
+    assert _games(_run(11, workers=2)) == _games(_run(11, workers=2)) == _games(_run(11, workers=3))
+
+
+def test_same_seed_replays_the_same_batch():
+    strategies = (FirstStrategy, RandomStrategy, FirstStrategy)
+    assert _games(_run(11, engine=run_batch_simulation, strategies=strategies)) == _games(_run(11, engine=run_batch_simulation, strategies=strategies))
+
+
+def test_callers_random_state_is_restored():
+    random.seed(99)
+    expected = [random.random() for _ in range(3)]
+    random.seed(99)
+    _run(11)
+    assert [random.random() for _ in range(3)] == expected
@@ -0,0 +1,50 @@
+import pytest
+
+from base.schedule import MatchupScheduler
+
+TRUE_COSTS = {"Slow": 4e-4, "Mid": 1e-4, "Fast": 1e-6}
+ENGINE_COST = 2e-6
+
+
+def _seconds(matchup, iters):
+    return (sum(TRUE_COSTS[name] for name in matchup) + ENGINE_COST * len(matchup)) * iters
+
+
+def _scheduler(turn_costs=None, workers=2):
+    matchups = [("Fast", "Fast"), ("Mid", "Fast"), ("Slow", "Fast"), ("Slow", "Mid"), ("Mid", "Mid", "Fast"), ("Slow", "Slow", "Mid")]
+    return MatchupScheduler(matchups, {("Fast", "Fast")}, 1000, workers, turn_costs)
+
+
+def test_longest_job_first_from_the_probes():
+    scheduler = _scheduler(TRUE_COSTS)
+    order = []
+    while (matchup := scheduler.start()) is not None:
+        order.append(matchup)
+    assert order[:2] == [("Slow", "Slow", "Mid"), ("Slow", "Mid")]
+    assert order[-1] == ("Fast", "Fast") # Batch: nomes el cost del motor vectoritzat
+    assert scheduler.start() is None and not scheduler.pending
+
+
+@pytest.mark.parametrize("probe_error", [0.5, 2.0])
+def test_costs_are_learned_from_finished_matchups(probe_error):
+    # Les probes s'equivoquen en un factor 2; els resultats ho han de corregir
+    scheduler = _scheduler({name: cost * probe_error for name, cost in TRUE_COSTS.items()})
+    iters = {2: 5000, 3: 8000}
+    matchups = [m for m in scheduler.pending if m != ("Fast", "Fast")]
+    for _ in range(20):
+        for matchup in matchups:
+            scheduler.finish(matchup, iters[len(matchup)], _seconds(matchup, iters[len(matchup)]))
+    for matchup in matchups:
+        assert scheduler.estimate(matchup) == pytest.approx(_seconds(matchup, iters[len(matchup)]), rel=0.05)
+    assert scheduler.start() == ("Slow", "Slow", "Mid")
+
+
+def test_eta_is_bounded_by_the_longest_job_and_the_work_per_worker():
+    scheduler = _scheduler(TRUE_COSTS, workers=3)
+    estimates = [scheduler.estimate(m) for m in scheduler.pending]
+    assert scheduler.eta() == pytest.approx(max(sum(estimates) / 3, max(estimates)))
+    while scheduler.start() is not None:
+        pass
+    for matchup in list(scheduler.running):
+        scheduler.finish(matchup, 1000, 1.0)
+    assert scheduler.eta() == 0.0
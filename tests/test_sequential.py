@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+
+from base.batch import run_batch_simulation
+from base.classes import FirstStrategy, RandomStrategy
+from base.sequential import SequentialTest, mixture_p_value
+from simulator_combined_strategies import build_deck
+
+
+def test_picked_sets_are_bonferroni_corrected():
+    maos = [40, 95, 60, 120, 70]
+    p_values = SequentialTest(0.05).check(maos)
+    ranked = sorted(maos)
+    assert p_values["bond_all"] == min(1.0, mixture_p_value(ranked))
+    for k in (1, 2):
+        assert p_values[f"bond_without_{k}_worst"] == min(1.0, math.comb(5, 5 - k) * mixture_p_value(ranked[k:]))
+    assert p_values["binomial"] == min(1.0, math.comb(5, 2) * mixture_p_value(ranked[-2:]))
+
+
+def test_null_rejection_rate_stays_below_alpha_however_often_it_looks():
+    # Jugadors iguals: cap p-valor hauria de passar alpha en mes d'un alpha de les tirades, mirant cada 20 partides
+    alpha, num_players, trials, games, every = 0.1, 4, 400, 4000, 20
+    rng = np.random.default_rng(0)
+    rejected: dict[str, int] = {}
+    for _ in range(trials):
+        winners = rng.integers(num_players, size=games)
+        maos = np.zeros(num_players, dtype=np.int64)
+        ever = set()
+        test = SequentialTest(alpha)
+        for start in range(0, games, every):
+            maos += np.bincount(winners[start:start + every], minlength=num_players)
+            test(maos.tolist())
+            ever.update(label for label, p in test.p_values.items() if p <= alpha)
+        for label in ever:
+            rejected[label] = rejected.get(label, 0) + 1
+    assert set(rejected) <= {"bond_all", "bond_without_1_worst", "binomial"}
+    margin = 3 * math.sqrt(alpha * (1 - alpha) / trials)
+    for label, count in rejected.items():
+        assert count / trials <= alpha + margin, label
+
+
+def test_batch_stop_condition_abandons_the_running_games():
+    looks = []
+
+    def stop_after_two(maos):
+        looks.append(sum(maos))
+        return len(looks) == 2
+
+    result = run_batch_simulation(
+        n=3, iter_max=10**7, num_decks=2, build_deck=build_deck, strategies_to_call=[FirstStrategy, RandomStrategy, RandomStrategy],
+        batch_size=512, stop_condition=stop_after_two, stop_check_every=1000, seed=3,
+    )
+    assert len(looks) == 2
+    assert sum(result.maos) == result.num_games == looks[-1]
@@ -0,0 +1,85 @@
+from base.classes import BaseCard, CountedDeck, Deck, FirstStrategy, NormalCard, RandomStrategy
+from base.sim import run_simulation
+from simulator_combined_strategies import build_deck
+
+
+class WildCard(BaseCard):
+    """Card without type_id: a 1 can be played on anything, and anything on a 1."""
+
+    def can_be_played(self, other: BaseCard) -> bool:
+        return self.value == 1 or other.value == 1 or self.value == other.value or self.suit == other.suit
+
+    def can_be_jumped(self, other: BaseCard) -> bool:
+        return self.value == other.value and self.suit == other.suit
+
+
+def build_wild_deck(main_pile: Deck, num_decks: int) -> None:
+    for _ in range(num_decks):
+        for value in range(1, 14):
+            for suit in ("hearts", "diamonds", "clubs", "spades"):
+                main_pile.add_card(WildCard(value, suit))
+
+
+def build_mixed_deck(main_pile: Deck, num_decks: int) -> None:
+    build_deck(main_pile, num_decks)
+    main_pile.add_card(WildCard(1, "hearts"))
+
+
+class DeckSpy(FirstStrategy):
+    decks: list[type] = []
+
+    def pick_play_card(self, top_card, direction, value_7):
+        DeckSpy.decks.append(type(self.player))
+        return super().pick_play_card(top_card, direction, value_7)
+
+
+def _run(build, strategies, **kwargs):
+    return run_simulation(n=len(strategies), iter_max=3000, num_decks=2, build_deck=build, strategies_to_call=strategies, log_ignores_wrong_cards=True, seed=1, **kwargs)
+
+
+def test_cards_without_type_id_use_plain_decks():
+    DeckSpy.decks.clear()
+    for build in (build_wild_deck, build_mixed_deck):
+        result = _run(build, [DeckSpy, RandomStrategy, FirstStrategy])
+        assert sum(result.maos) == result.num_games > 0
+        assert not result.aborted
+    assert set(DeckSpy.decks) == {Deck}
+
+
+def test_normal_cards_use_counted_decks():
+    DeckSpy.decks.clear()
+    _run(build_deck, [DeckSpy, FirstStrategy])
+    assert set(DeckSpy.decks) == {CountedDeck}
+
+
+class JumpPollThief(FirstStrategy):
+    """Drops a card from its own hand the first time it is polled for a jump outside its turn."""
+    always_poll_jumps = True
+
+    calls_after_stealing: list[int] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stolen = False
+
+    def pick_play_card(self, top_card, direction, value_7):
+        if self.stolen:
+            JumpPollThief.calls_after_stealing[-1] += 1
+        return super().pick_play_card(top_card, direction, value_7)
+
+    def pick_jump_card(self, top_card, current_player, direction, value_7):
+        if self.stolen:
+            JumpPollThief.calls_after_stealing[-1] += 1
+        elif current_player != self.player_index and len(self.player) > 1:
+            self.player.remove_top_card()
+            self.stolen = True
+            JumpPollThief.calls_after_stealing.append(0)
+        return super().pick_jump_card(top_card, current_player, direction, value_7)
+
+
+def test_turn_check_catches_a_hand_changed_in_a_jump_poll():
+    JumpPollThief.calls_after_stealing.clear()
+    result = _run(build_deck, [FirstStrategy, FirstStrategy, JumpPollThief], pile_check="turn")
+    assert result.aborted
+    # S'atura al principi del torn seguent, abans de tornar a cridar el lladre
+    assert JumpPollThief.calls_after_stealing == [0]
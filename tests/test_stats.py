@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from base.classes import FirstStrategy, RandomStrategy
+from base.rng import seed_sequence
+from base.sim import run_simulation
+from base.stats import Distribution, SimulationResult
+from simulator_combined_strategies import build_deck
+
+
+def _distribution(samples, num_buckets=64, width=3):
+    dist = Distribution(num_buckets, width)
+    for x in samples:
+        dist.add(x)
+    return dist
+
+
+def test_welford_merge_matches_a_single_pass():
+    rng = random.Random(0)
+    samples = [rng.randrange(300) for _ in range(5000)]
+    single = _distribution(samples)
+    for cuts in ([0], [1], [2500], [1, 2, 4999], [100, 1000, 3000, 4000]):
+        merged = Distribution(64, 3)
+        for start, end in zip([0] + cuts, cuts + [len(samples)]):
+            merged.merge(_distribution(samples[start:end]))
+        assert (merged.count, merged.total, list(merged.buckets)) == (single.count, single.total, list(single.buckets))
+        assert merged.mean == pytest.approx(single.mean, rel=1e-12)
+        assert merged.variance == pytest.approx(single.variance, rel=1e-9)
+    mean = sum(samples) / len(samples)
+    assert single.variance == pytest.approx(sum((x - mean) ** 2 for x in samples) / (len(samples) - 1), rel=1e-9)
+
+
+def test_merge_rejects_different_buckets():
+    with pytest.raises(ValueError):
+        Distribution(64, 3).merge(Distribution(64, 2))
+
+
+def test_result_survives_a_json_round_trip():
+    result = run_simulation(n=3, iter_max=3000, num_decks=2, build_deck=build_deck, strategies_to_call=[FirstStrategy, RandomStrategy, RandomStrategy], seed=4)
+    loaded = SimulationResult.from_dict(result.to_dict(), 3)
+    assert loaded.to_dict() == result.to_dict()
+
+
+def test_shards_add_up_to_one_run():
+    # Els shards es fusionen en ordre, aixi que han de donar el mateix que fusionar-los a ma
+    kwargs = dict(n=3, num_decks=2, build_deck=build_deck, strategies_to_call=[FirstStrategy, RandomStrategy, RandomStrategy], seed=7)
+    sharded = run_simulation(iter_max=12000, workers=2, shard_iters=3000, **kwargs)
+    assert sum(sharded.maos) == sharded.num_games > 0
+    assert sharded.pauses.count == sharded.pauses.players[0].count
+    assert sum(sharded.game_turns.buckets) == sharded.num_games
+    merged = SimulationResult([0, 0, 0])
+    for iters, shard_seed in zip([3000] * 4, seed_sequence(7).spawn(4)):
+        merged.merge(run_simulation(iter_max=iters, **{**kwargs, "seed": shard_seed}))
+    assert merged.maos == sharded.maos
+    assert merged.game_turns.to_dict() == sharded.game_turns.to_dict()
@@ -0,0 +1,69 @@
+from base.classes import NUM_CARD_TYPES, FirstStrategy
+from base.sim import run_simulation
+from simulator_combined_strategies import build_deck
+
+
+def _mask(cards) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.type_id
+    return mask
+
+
+class ViewChecker(FirstStrategy):
+    """Checks its GameView against the arguments and its hand on every call."""
+    uses_game_view = True
+    checks = 0
+
+    def _check(self, top_card, current_player, direction, value_7):
+        view = self.game_view
+        assert (view.top_card, view.current_player, view.direction, view.value_7) == (top_card, current_player, direction, value_7)
+        assert view.hand_mask() == _mask(self.player.cards)
+        assert view.playable() == _mask(card for card in self.player.cards if card.can_be_played(top_card))
+        assert view.jumpable() == _mask(card for card in self.player.cards if card.can_be_jumped(top_card))
+        assert view.num_cards_per_player == tuple(self.num_cards_per_player)
+        discard_counts = view.discard_counts
+        assert isinstance(discard_counts, tuple) # Copia: no es pot tocar l'histograma de l'engine
+        assert view.discard_counts is not discard_counts
+        assert len(discard_counts) == NUM_CARD_TYPES and sum(discard_counts) >= 0
+        ViewChecker.checks += 1
+
+    def pick_play_card(self, top_card, direction, value_7):
+        self._check(top_card, self.player_index, direction, value_7)
+        return super().pick_play_card(top_card, direction, value_7)
+
+    def pick_jump_card(self, top_card, current_player, direction, value_7):
+        self._check(top_card, current_player, direction, value_7)
+        return super().pick_jump_card(top_card, current_player, direction, value_7)
+
+    def discard_card(self, top_card, current_player, direction, value_7):
+        self._check(top_card, current_player, direction, value_7)
+        return super().discard_card(top_card, current_player, direction, value_7)
+
+
+def test_every_strategy_sees_its_own_hand_and_the_public_state():
+    ViewChecker.checks = 0
+    result = run_simulation(
+        n=3, iter_max=20000, num_decks=2, build_deck=build_deck, strategies_to_call=[ViewChecker, ViewChecker, FirstStrategy],
+        random_first_player=True, random_position_players=True, intern_cards=True, seed=2,
+    )
+    assert result.num_games and ViewChecker.checks > 10000
+    assert not result.aborted
+
+
+def test_views_are_per_strategy_and_unused_without_opting_in():
+    seen = []
+
+    class Spy(ViewChecker):
+        def pick_play_card(self, top_card, direction, value_7):
+            seen.append(self.game_view)
+            return super().pick_play_card(top_card, direction, value_7)
+
+    class Plain(FirstStrategy):
+        def pick_play_card(self, top_card, direction, value_7):
+            assert self.game_view is None
+            return super().pick_play_card(top_card, direction, value_7)
+
+    run_simulation(n=3, iter_max=2000, num_decks=2, build_deck=build_deck, strategies_to_call=[Spy, Spy, Plain], seed=3)
+    views = {id(view) for view in seen}
+    assert len(views) == 2 # Una per estrategia, cap de compartida